@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Prism Code Samples - lexed preview snippets in several languages
+
+The TUI, Studio and theme_explorer previews draw from the sample files in
+samples/. Each file is lexed with the Pygments lexer for its extension
+(Pygments ships with Rich, so the TUIs already have it). The token types are
+folded into the handful of roles a Prism preview colors:
+
+    fg  comment  keyword  string  number  type  function  operator
+
+Pygments does not tell calls from other names, so a plain name directly
+followed by "(" is colored as a function, as the old scanners did.
+
+The result is cached per sample as lines of (text, role) runs, with
+neighboring runs of one role merged and whitespace folded into the run
+before it. Lexing happens once per process. Switching themes only maps roles
+to colors over the cached runs.
+
+Usage:
+    from code_samples import SAMPLES, sample_tokens
+    for runs in sample_tokens("python"):
+        for text, role in runs:
+            ...
+
+    python code_samples.py                  # list samples with line/run counts
+    python code_samples.py rust             # show a sample's runs by role
+"""
+
+import argparse
+from functools import lru_cache
+from pathlib import Path
+from typing import Tuple
+
+from pygments.lexers import get_lexer_for_filename
+from pygments.token import Token
+
+SAMPLES_DIR = Path(__file__).parent / "samples"
+
+# Sample name -> file in samples/ (the extension picks the lexer)
+SAMPLES = {
+    "python": "theme_engine.py",
+    "typescript": "fibonacci.ts",
+    "rust": "contrast.rs",
+    "go": "palette.go",
+    "shell": "install.sh",
+}
+
+ROLES = ("fg", "comment", "keyword", "string", "number", "type", "function", "operator")
+
+# Token type -> role; a token takes the role of its nearest listed ancestor
+TOKEN_ROLES = {
+    Token.Comment: "comment",
+    Token.Keyword: "keyword",
+    Token.Keyword.Type: "type",
+    Token.Keyword.Constant: "number",
+    Token.Name.Builtin: "type",
+    Token.Name.Builtin.Pseudo: "keyword",
+    Token.Name.Class: "type",
+    Token.Name.Constant: "number",
+    Token.Name.Decorator: "function",
+    Token.Name.Function: "function",
+    Token.Name.Attribute: "function",
+    Token.Name.Tag: "keyword",
+    Token.Literal.String: "string",
+    Token.Literal.Number: "number",
+    Token.Operator: "operator",
+    Token.Operator.Word: "keyword",
+}
+
+Runs = Tuple[Tuple[str, str], ...]
+
+def role_of(ttype) -> str:
+    while ttype is not Token:
+        if ttype in TOKEN_ROLES:
+            return TOKEN_ROLES[ttype]
+        ttype = ttype.parent
+    return "fg"
+
+@lru_cache(maxsize=None)
+def sample_tokens(name: str) -> Tuple[Runs, ...]:
+    """A sample as lines of (text, role) runs; lexed on first use, then cached."""
+    path = SAMPLES_DIR / SAMPLES[name]
+    lexer = get_lexer_for_filename(path.name, stripnl=False, tabsize=4)
+    tokens = list(lexer.get_tokens(path.read_text(encoding="utf-8")))
+    lines, runs = [], []
+    for k, (ttype, value) in enumerate(tokens):
+        role = role_of(ttype)
+        if role == "fg" and ttype in Token.Name and k + 1 < len(tokens) and tokens[k + 1][1].startswith("("):
+            role = "function"
+        for i, text in enumerate(value.split("\n")):
+            if i:
+                lines.append(tuple(runs))
+                runs = []
+            if not text:
+                continue
+            if runs and (runs[-1][1] == role or text.isspace()):
+                runs[-1] = (runs[-1][0] + text, runs[-1][1])
+            else:
+                runs.append((text, role))
+    if runs:
+        lines.append(tuple(runs))
+    return tuple(lines)
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect the lexed preview samples")
+    parser.add_argument("sample", nargs="?", choices=SAMPLES, help="Show this sample's runs")
+    args = parser.parse_args()
+
+    if not args.sample:
+        for name, filename in SAMPLES.items():
+            lines = sample_tokens(name)
+            print(f"{name:<12} {filename:<18} {len(lines):>3} lines {sum(map(len, lines)):>4} runs")
+        return 0
+    for runs in sample_tokens(args.sample):
+        print("  ".join(f"{role}:{text!r}" for text, role in runs))
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
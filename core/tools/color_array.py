@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Prism Color Arrays - NumPy versions of the verified_generator conversions
+
+The scalar functions in verified_generator work on one SRGB/OKLCH at a time.
+These take arrays whose last axis holds the three channels, so a population of
+palettes or a batch of base hues converts in one call. Coefficients and the
+clamp-then-round-to-8-bit behaviour match verified_generator exactly, in both
+directions. gamut_map() and contrast_ratio() are the batched counterparts of
+verified_generator.gamut_map and contrast_checker.contrast_ratio.
+
+Usage:
+    from color_array import hex_to_srgb, oklch_to_hex, srgb_to_oklch
+    oklch_to_hex(np.array([[0.72, 0.15, 211.0], [0.45, 0.12, 30.0]]))  # ['#..', '#..']
+    srgb_to_oklch(hex_to_srgb(["#0d1117", "#58a6ff"]))                 # (2, 3)
+"""
+
+from typing import List, Sequence
+
+import numpy as np
+
+# OKLab -> LMS' and LMS -> linear sRGB (same coefficients as verified_generator)
+OKLAB_TO_LMS = np.array([
+    [1.0, 0.3963377774, 0.2158037573],
+    [1.0, -0.1055613458, -0.0638541728],
+    [1.0, -0.0894841775, -1.2914855480],
+])
+LMS_TO_LINEAR = np.array([
+    [4.0767416621, -3.3077115913, 0.2309699292],
+    [-1.2684380046, 2.6097574011, -0.3413193965],
+    [-0.0041960863, -0.7034186147, 1.7076147010],
+])
+LINEAR_TO_LMS = np.array([
+    [0.4122214708, 0.5363325363, 0.0514459929],
+    [0.2119034982, 0.6806995451, 0.1073969566],
+    [0.0883024619, 0.2817188376, 0.6299787005],
+])
+LMS_TO_OKLAB = np.array([
+    [0.2104542553, 0.7936177850, -0.0040720468],
+    [1.9779984951, -2.4285922050, 0.4505937099],
+    [0.0259040371, 0.7827717662, -0.8086757660],
+])
+LUMA = np.array([0.2126, 0.7152, 0.0722])
+
+# ═══════════════════════════════════════════════════════════════════
+# OKLCH -> sRGB
+# ═══════════════════════════════════════════════════════════════════
+
+def oklch_to_oklab(lch: np.ndarray) -> np.ndarray:
+    """(..., 3) L, C, H(deg) -> (..., 3) L, a, b"""
+    h = np.radians(lch[..., 2])
+    return np.stack([lch[..., 0], lch[..., 1] * np.cos(h), lch[..., 1] * np.sin(h)], axis=-1)
+
+def oklab_to_linear(lab: np.ndarray) -> np.ndarray:
+    """(..., 3) OKLab -> (..., 3) linear sRGB, unclamped"""
+    return (lab @ OKLAB_TO_LMS.T) ** 3 @ LMS_TO_LINEAR.T
+
+def linear_to_srgb(linear: np.ndarray) -> np.ndarray:
+    """Gamma-encode, then clamp to [0, 1] (verified_generator.oklab_to_srgb order)."""
+    encoded = np.where(linear <= 0.0031308, linear * 12.92,
+                       1.055 * np.power(np.maximum(linear, 0.0031308), 1 / 2.4) - 0.055)
+    return np.clip(encoded, 0.0, 1.0)
+
+def oklch_to_srgb(lch: np.ndarray) -> np.ndarray:
+    return linear_to_srgb(oklab_to_linear(oklch_to_oklab(lch)))
+
+def srgb_to_hex(rgb: np.ndarray) -> List[str]:
+    """(..., 3) sRGB in [0, 1] -> flat list of '#rrggbb' (half-to-even, like round())."""
+    codes = np.rint(np.asarray(rgb).reshape(-1, 3) * 255).astype(np.int64)
+    return ["#%02x%02x%02x" % tuple(c) for c in codes]
+
+def oklch_to_hex(lch: np.ndarray) -> List[str]:
+    return srgb_to_hex(oklch_to_srgb(lch))
+
+def in_gamut(lch: np.ndarray, eps: float = 1e-6) -> np.ndarray:
+    """(..., 3) OKLCH -> (...) bool, True where no channel needs clamping."""
+    linear = oklab_to_linear(oklch_to_oklab(lch))
+    return np.all((linear >= -eps) & (linear <= 1 + eps), axis=-1)
+
+def gamut_map(lch: np.ndarray, steps: int = 24) -> np.ndarray:
+    """Reduce chroma at constant L and H until in sRGB (bisection, like verified_generator)."""
+    lch = np.array(lch, dtype=np.float64)
+    lch[..., 0] = np.clip(lch[..., 0], 0.0, 1.0)
+    inside = in_gamut(lch)
+    if inside.all():
+        return lch
+    lo = np.where(inside, lch[..., 1], 0.0)
+    hi = lch[..., 1].copy()
+    probe = lch.copy()
+    for _ in range(steps):
+        mid = (lo + hi) / 2
+        probe[..., 1] = mid
+        ok = in_gamut(probe)
+        lo = np.where(ok, mid, lo)
+        hi = np.where(ok, hi, mid)
+    lch[..., 1] = np.where(inside, lch[..., 1], lo)
+    return lch
+
+# ═══════════════════════════════════════════════════════════════════
+# sRGB -> OKLCH
+# ═══════════════════════════════════════════════════════════════════
+
+def hex_to_srgb(hexes: Sequence[str]) -> np.ndarray:
+    """'#rrggbb' strings (alpha suffix ignored) -> (N, 3) sRGB in [0, 1]."""
+    packed = np.array([int(h[1:7], 16) for h in hexes], dtype=np.int64)
+    return np.stack([(packed >> 16) & 0xFF, (packed >> 8) & 0xFF, packed & 0xFF], axis=-1) / 255.0
+
+def srgb_to_linear(rgb: np.ndarray) -> np.ndarray:
+    rgb = np.asarray(rgb, dtype=np.float64)
+    return np.where(rgb <= 0.04045, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+
+def linear_to_oklab(linear: np.ndarray) -> np.ndarray:
+    return np.cbrt(linear @ LINEAR_TO_LMS.T) @ LMS_TO_OKLAB.T
+
+def oklab_to_oklch(lab: np.ndarray) -> np.ndarray:
+    C = np.hypot(lab[..., 1], lab[..., 2])
+    H = np.degrees(np.arctan2(lab[..., 2], lab[..., 1])) % 360.0
+    return np.stack([lab[..., 0], C, H], axis=-1)
+
+def srgb_to_oklch(rgb: np.ndarray) -> np.ndarray:
+    return oklab_to_oklch(linear_to_oklab(srgb_to_linear(rgb)))
+
+# ═══════════════════════════════════════════════════════════════════
+# WCAG
+# ═══════════════════════════════════════════════════════════════════
+
+def relative_luminance(rgb: np.ndarray) -> np.ndarray:
+    """(..., 3) sRGB -> (...) WCAG relative luminance (contrast_checker arithmetic)."""
+    return srgb_to_linear(rgb) @ LUMA
+
+def contrast_ratio(fg: np.ndarray, bg: np.ndarray) -> np.ndarray:
+    """Batched WCAG contrast of (..., 3) sRGB pairs, always >= 1."""
+    l1, l2 = relative_luminance(fg), relative_luminance(bg)
+    return (np.maximum(l1, l2) + 0.05) / (np.minimum(l1, l2) + 0.05)
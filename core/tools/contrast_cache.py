@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Prism Contrast Cache
+
+Process-wide memoized WCAG contrast ratios keyed by packed 24-bit color pairs.
+Themes share most of their colors (ANSI values, backgrounds like #0d1117), so
+repeated audits across validate_themes, theme_explorer, prism_tui, prism_studio
+and scripts/validate_vscode_wcag are dominated by dictionary lookups.
+
+The cache can be persisted between runs. Set PRISM_CONTRAST_CACHE to a file
+path and every tool loads it on import and saves new entries on exit.
+
+Usage:
+    from contrast_cache import contrast, CACHE
+    ratio = contrast("#e6edf3", "#0d1117")
+    print(CACHE.stats())
+
+    python contrast_cache.py --stats ~/.cache/prism/contrast.bin
+"""
+
+import array
+import atexit
+import os
+import struct
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, Optional
+
+from contrast_checker import srgb_to_linear
+
+# sRGB channel byte -> linear light, computed with the Lean4-mirrored formula
+LINEAR_LUT = tuple(srgb_to_linear(i / 255) for i in range(256))
+
+CACHE_MAGIC = b"PRCC"
+CACHE_VERSION = 1
+CACHE_HEADER = struct.Struct("<4sII")  # magic, version, entry count
+
+def pack_hex(hex_color: str) -> int:
+    """Parse #rgb, #rrggbb or #rrggbbaa into a 24-bit integer (alpha dropped)."""
+    h = hex_color.lstrip('#')
+    if len(h) in (3, 4):
+        h = ''.join(c * 2 for c in h[:3])
+    elif len(h) in (6, 8):
+        h = h[:6]
+    else:
+        raise ValueError(f"Invalid hex color: {hex_color!r}")
+    return int(h, 16)
+
+def luminance_packed(rgb24: int) -> float:
+    """WCAG relative luminance of a packed color (same arithmetic as relative_luminance)."""
+    r = LINEAR_LUT[(rgb24 >> 16) & 0xFF]
+    g = LINEAR_LUT[(rgb24 >> 8) & 0xFF]
+    b = LINEAR_LUT[rgb24 & 0xFF]
+    return 0.2126 * r + 0.7152 * g + 0.0722 * b
+
+class ContrastCache:
+    """Memoized contrast ratios with hit/miss counters and optional disk backing.
+
+    Contrast is symmetric, so a pair is stored once under (min24 << 24) | max24.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path).expanduser() if path else None
+        self.ratios: Dict[int, float] = {}
+        self.luminance: Dict[int, float] = {}
+        self.hits = 0
+        self.misses = 0
+        self.loaded = 0
+        if self.path and self.path.exists():
+            self.load(self.path)
+
+    def contrast_packed(self, fg24: int, bg24: int) -> float:
+        key = (fg24 << 24) | bg24 if fg24 <= bg24 else (bg24 << 24) | fg24
+        ratio = self.ratios.get(key)
+        if ratio is not None:
+            self.hits += 1
+            return ratio
+        self.misses += 1
+        l1 = self.luminance_packed(fg24)
+        l2 = self.luminance_packed(bg24)
+        lighter, darker = max(l1, l2), min(l1, l2)
+        ratio = (lighter + 0.05) / (darker + 0.05)
+        self.ratios[key] = ratio
+        return ratio
+
+    def contrast(self, fg: str, bg: str) -> float:
+        return self.contrast_packed(pack_hex(fg), pack_hex(bg))
+
+    def luminance_packed(self, rgb24: int) -> float:
+        lum = self.luminance.get(rgb24)
+        if lum is None:
+            lum = self.luminance[rgb24] = luminance_packed(rgb24)
+        return lum
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "entries": len(self.ratios),
+            "loaded": self.loaded,
+        }
+
+    def clear(self):
+        self.ratios.clear()
+        self.luminance.clear()
+        self.hits = self.misses = self.loaded = 0
+
+    # ── Disk format: header, then uint64 packed keys, then float64 ratios ──
+
+    def load(self, path: Path) -> int:
+        """Merge entries from a cache file. Unreadable or foreign files are ignored."""
+        try:
+            data = Path(path).read_bytes()
+            magic, version, count = CACHE_HEADER.unpack_from(data)
+        except (OSError, struct.error):
+            return 0
+        if magic != CACHE_MAGIC or version != CACHE_VERSION:
+            return 0
+        offset = CACHE_HEADER.size
+        keys = array.array("Q")
+        ratios = array.array("d")
+        keys.frombytes(data[offset:offset + 8 * count])
+        ratios.frombytes(data[offset + 8 * count:offset + 16 * count])
+        if sys.byteorder != "little":
+            keys.byteswap()
+            ratios.byteswap()
+        if len(keys) != count or len(ratios) != count:
+            return 0
+        self.ratios.update(zip(keys, ratios))
+        self.loaded = len(self.ratios)
+        return count
+
+    def save(self, path: Optional[Path] = None) -> Optional[Path]:
+        """Write all entries atomically. No-op when nothing new was computed."""
+        path = Path(path).expanduser() if path else self.path
+        if path is None or (len(self.ratios) == self.loaded and path == self.path and path.exists()):
+            return None
+        keys = array.array("Q", self.ratios.keys())
+        ratios = array.array("d", self.ratios.values())
+        if sys.byteorder != "little":
+            keys.byteswap()
+            ratios.byteswap()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # A unique temp file per writer, so concurrent saves never interleave into one file
+        f = tempfile.NamedTemporaryFile("wb", dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False)
+        try:
+            with f:
+                f.write(CACHE_HEADER.pack(CACHE_MAGIC, CACHE_VERSION, len(keys)))
+                f.write(keys.tobytes())
+                f.write(ratios.tobytes())
+            os.replace(f.name, path)
+        except BaseException:
+            Path(f.name).unlink(missing_ok=True)
+            raise
+        self.loaded = len(self.ratios)
+        return path
+
+# Process-wide instance shared by every tool
+CACHE = ContrastCache(os.environ.get("PRISM_CONTRAST_CACHE") or None)
+if CACHE.path:
+    atexit.register(CACHE.save)
+
+def contrast(fg: str, bg: str) -> float:
+    """Memoized WCAG contrast ratio between two hex colors."""
+    return CACHE.contrast(fg, bg)
+
+def contrast_packed(fg24: int, bg24: int) -> float:
+    """Memoized WCAG contrast ratio between two packed 24-bit colors."""
+    return CACHE.contrast_packed(fg24, bg24)
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3 and sys.argv[1] == "--stats":
+        cache = ContrastCache(Path(sys.argv[2]))
+        print(f"{sys.argv[2]}: {cache.loaded} cached pairs")
+    else:
+        print("Usage: python contrast_cache.py --stats <cache-file>")
+        print("Enable persistence with PRISM_CONTRAST_CACHE=<cache-file>")
@@ -0,0 +1,1470 @@
+#!/usr/bin/env python3
+"""
+Prism Format Writers
+
+A single registry of output-format writers shared by sync_themes.py,
+generate_all_themes.py, generate_terminal_themes.py and prism_studio's
+ExportManager. Each writer is a template compiled once at import: the source
+is split into literal chunks around a fixed slot list, so rendering a theme is
+an array fill plus a join instead of rebuilding a large f-string.
+
+Writers are grouped by family because each entry point feeds a differently
+shaped color dict:
+
+    sync      sync_themes.extract_colors() + "slug"
+    multi     generate_all_themes.get_terminal_colors() + "name", "theme_type"
+    terminal  generate_terminal_themes.get_terminal_colors() + "name"
+    studio    prism_studio ThemeColors fields + "name", "author", "theme_type"
+
+Usage:
+    from format_writers import render
+    text = render("sync", "alacritty", {**colors, "slug": slug})
+
+    python format_writers.py --bench
+    python format_writers.py --bench -n 5000 --family sync
+"""
+
+import argparse
+import json
+import re
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from operator import itemgetter
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
+
+# ═══════════════════════════════════════════════════════════════════
+# Template Compilation
+# ═══════════════════════════════════════════════════════════════════
+
+SLOT_RE = re.compile(r"\$\{([A-Za-z_][\w.]*)\}")
+
+# Strings json.dumps would emit unchanged (printable ASCII minus quote/backslash)
+JSON_PLAIN_RE = re.compile(r'[ !#-\[\]-~]*')
+
+def json_escape(value: str) -> str:
+    """Escape a string for a JSON string body, matching json.dumps defaults."""
+    if JSON_PLAIN_RE.fullmatch(value):
+        return value
+    return json.dumps(value)[1:-1]
+
+class Template:
+    """Literal chunks interleaved with an ordered list of ${slot} names."""
+
+    __slots__ = ("slots", "_chunks", "_fetch", "_escape")
+
+    def __init__(self, source: str, escape: Optional[Callable[[str], str]] = None):
+        parts = SLOT_RE.split(source)
+        self.slots: Tuple[str, ...] = tuple(parts[1::2])
+        self._chunks = parts
+        self._escape = escape
+        if len(self.slots) > 1:
+            self._fetch = itemgetter(*self.slots)
+        elif self.slots:
+            only = self.slots[0]
+            self._fetch = lambda values: (values[only],)
+        else:
+            self._fetch = lambda values: ()
+
+    @classmethod
+    def from_json(cls, skeleton, indent: int = 2) -> "Template":
+        """Compile a JSON document whose string leaves may contain ${slot}s."""
+        return cls(json.dumps(skeleton, indent=indent), escape=json_escape)
+
+    def render(self, values: Mapping[str, str]) -> str:
+        chunks = self._chunks.copy()
+        filled = self._fetch(values)
+        chunks[1::2] = map(self._escape, filled) if self._escape else filled
+        return "".join(chunks)
+
+# ═══════════════════════════════════════════════════════════════════
+# Registry
+# ═══════════════════════════════════════════════════════════════════
+
+@dataclass(frozen=True)
+class Writer:
+    """A compiled template plus an optional hook that adds derived slots."""
+    family: str
+    name: str
+    template: Template
+    prepare: Optional[Callable[[Mapping[str, str]], Mapping[str, str]]] = None
+    binary: bool = False
+
+    def render(self, values: Mapping[str, str]):
+        if self.prepare:
+            values = self.prepare(values)
+        text = self.template.render(values)
+        return text.encode("utf-8") if self.binary else text
+
+WRITERS: Dict[Tuple[str, str], Writer] = {}
+
+def register(family: str, name: str, template: Template,
+             prepare: Optional[Callable] = None, binary: bool = False) -> Writer:
+    writer = Writer(family, name, template, prepare, binary)
+    WRITERS[(family, name)] = writer
+    return writer
+
+def get_writer(family: str, name: str) -> Writer:
+    try:
+        return WRITERS[(family, name)]
+    except KeyError:
+        known = ", ".join(formats(family)) or "none"
+        raise ValueError(f"Unknown {family} format {name!r} (available: {known})") from None
+
+def formats(family: str) -> List[str]:
+    return [name for fam, name in WRITERS if fam == family]
+
+def families() -> List[str]:
+    return list(dict.fromkeys(fam for fam, _ in WRITERS))
+
+def render(family: str, name: str, values: Mapping[str, str]):
+    return get_writer(family, name).render(values)
+
+# ═══════════════════════════════════════════════════════════════════
+# Shared Color Helpers
+# ═══════════════════════════════════════════════════════════════════
+
+def hex_to_rgb_int(hex_color: str) -> Tuple[int, int, int]:
+    h = hex_color.lstrip('#')
+    return tuple(int(h[i:i+2], 16) for i in (0, 2, 4))
+
+def hex_to_rgb_float(hex_color: str) -> Tuple[float, float, float]:
+    r, g, b = hex_to_rgb_int(hex_color)
+    return (r/255, g/255, b/255)
+
+def lighten_hex(hex_color: str, amount: float = 0.2) -> str:
+    r, g, b = hex_to_rgb_int(hex_color)
+    r = min(255, int(r + (255 - r) * amount))
+    g = min(255, int(g + (255 - g) * amount))
+    b = min(255, int(b + (255 - b) * amount))
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+# Channel byte -> float text as written by plistlib and the iTerm2 f-string (repr)
+REAL_LUT = tuple(repr(i / 255) for i in range(256))
+
+def rgb_reals(hex_color: str) -> Tuple[str, str, str]:
+    h = hex_color.lstrip('#')
+    return (REAL_LUT[int(h[0:2], 16)], REAL_LUT[int(h[2:4], 16)], REAL_LUT[int(h[4:6], 16)])
+
+@lru_cache(maxsize=4096)
+def jetbrains_hex(hex_color: str) -> str:
+    """#rrggbb -> RRGGBB as used in .icls files."""
+    return hex_color.lstrip('#').upper()
+
+def with_reals(keys) -> Callable[[Mapping[str, str]], Dict[str, str]]:
+    """Prepare hook adding <key>.r/.g/.b slots for each color key."""
+    keys = tuple(dict.fromkeys(keys))
+    def prepare(values):
+        out = dict(values)
+        for key in keys:
+            out[key + ".r"], out[key + ".g"], out[key + ".b"] = rgb_reals(values[key])
+        return out
+    return prepare
+
+def with_jetbrains(keys, extra: Optional[Callable] = None) -> Callable[[Mapping[str, str]], Dict[str, str]]:
+    """Prepare hook adding jb.<key> slots (uppercase, no '#')."""
+    keys = tuple(keys)
+    def prepare(values):
+        out = dict(values)
+        if extra:
+            out.update(extra(values))
+        for key in keys:
+            out["jb." + key] = jetbrains_hex(out[key])
+        return out
+    return prepare
+
+def derived(fn: Callable[[Mapping[str, str]], Dict[str, str]]) -> Callable[[Mapping[str, str]], Dict[str, str]]:
+    """Prepare hook merging the slots returned by fn into the values."""
+    def prepare(values):
+        out = dict(values)
+        out.update(fn(values))
+        return out
+    return prepare
+
+def plist_colors(entries: List[Tuple[str, str]]) -> str:
+    """Template source for an iTerm2 plist, laid out exactly like plistlib.dumps."""
+    lines = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        '<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">',
+        '<plist version="1.0">',
+        '<dict>',
+    ]
+    for label, key in sorted(entries):
+        lines += [
+            f"\t<key>{label}</key>",
+            "\t<dict>",
+            "\t\t<key>Alpha Component</key>",
+            "\t\t<real>1.0</real>",
+            "\t\t<key>Blue Component</key>",
+            "\t\t<real>${" + key + ".b}</real>",
+            "\t\t<key>Color Space</key>",
+            "\t\t<string>sRGB</string>",
+            "\t\t<key>Green Component</key>",
+            "\t\t<real>${" + key + ".g}</real>",
+            "\t\t<key>Red Component</key>",
+            "\t\t<real>${" + key + ".r}</real>",
+            "\t</dict>",
+        ]
+    lines += ["</dict>", "</plist>", ""]
+    return "\n".join(lines)
+
+ANSI_NAMES = ["Black", "Red", "Green", "Yellow", "Blue", "Magenta", "Cyan", "White"]
+
+def iterm_ansi(normal: List[str], bright: List[str]) -> List[Tuple[str, str]]:
+    """Ansi 0..15 Color labels paired with the family's color keys."""
+    return [(f"Ansi {i} Color", key) for i, key in enumerate(normal + bright)]
+
+# ═══════════════════════════════════════════════════════════════════
+# sync family (sync_themes.py, committed outputs under emacs/ and terminal/)
+# ═══════════════════════════════════════════════════════════════════
+
+SYNC_ANSI = ["ansi" + n for n in ANSI_NAMES]
+SYNC_BRIGHT = ["ansiBright" + n for n in ANSI_NAMES]
+SYNC_KEYS = ("name", "type", "bg", "fg", "hl", "accent", "comment", "keyword",
+             "string", "function", "variable", "constant", "tag", "attribute",
+             *SYNC_ANSI, *SYNC_BRIGHT, "slug")
+
+def _sync_emacs_faces(c):
+    keyword = c["keyword"] or c["accent"]
+    return {
+        "el.keyword": keyword,
+        "el.string": c["string"] or keyword,
+        "el.function": c["function"] or c["fg"],
+        "el.type": c["type"] or c["fg"],
+        "el.variable": c["variable"] or c["fg"],
+        "el.constant": c["constant"] or keyword,
+    }
+
+register("sync", "emacs", Template(''';;; ${slug}-theme.el --- Prism ${name} theme -*- lexical-binding: t; -*-
+;;; Commentary:
+;; Prism ${name} color theme - Auto-generated from vscode/themes
+;;; Code:
+
+(deftheme ${slug}
+  "Prism ${name} - A ${type} theme.")
+
+(let ((class '((class color) (min-colors 89)))
+      (bg "${bg}")
+      (fg "${fg}")
+      (hl "${hl}")
+      (comment "${comment}")
+      (keyword "${el.keyword}")
+      (string "${el.string}")
+      (func "${el.function}")
+      (type "${el.type}")
+      (variable "${el.variable}")
+      (constant "${el.constant}"))
+
+  (custom-theme-set-faces
+   '${slug}
+   `(default ((,class (:background ,bg :foreground ,fg))))
+   `(cursor ((,class (:background ,keyword))))
+   `(region ((,class (:background ,hl))))
+   `(highlight ((,class (:background ,hl))))
+   `(hl-line ((,class (:background ,hl))))
+   `(fringe ((,class (:background ,bg))))
+   `(line-number ((,class (:foreground ,comment))))
+   `(line-number-current-line ((,class (:foreground ,fg))))
+   `(font-lock-comment-face ((,class (:foreground ,comment :slant italic))))
+   `(font-lock-keyword-face ((,class (:foreground ,keyword))))
+   `(font-lock-string-face ((,class (:foreground ,string))))
+   `(font-lock-function-name-face ((,class (:foreground ,func))))
+   `(font-lock-variable-name-face ((,class (:foreground ,variable))))
+   `(font-lock-type-face ((,class (:foreground ,type))))
+   `(font-lock-constant-face ((,class (:foreground ,constant))))
+   `(font-lock-builtin-face ((,class (:foreground ,keyword))))
+   `(font-lock-preprocessor-face ((,class (:foreground ,keyword))))
+   `(mode-line ((,class (:background ,hl :foreground ,fg))))
+   `(mode-line-inactive ((,class (:background ,bg :foreground ,comment))))
+   ;; Markdown/Org headings
+   `(markdown-header-face-1 ((,class (:foreground ,keyword :weight bold))))
+   `(markdown-header-face-2 ((,class (:foreground ,string :weight bold))))
+   `(markdown-header-face-3 ((,class (:foreground ,func :weight bold))))
+   `(markdown-bold-face ((,class (:foreground ,keyword :weight bold))))
+   `(markdown-italic-face ((,class (:foreground ,string :slant italic))))
+   `(org-level-1 ((,class (:foreground ,keyword :weight bold))))
+   `(org-level-2 ((,class (:foreground ,string :weight bold))))
+   `(org-level-3 ((,class (:foreground ,func :weight bold))))))
+
+;;;###autoload
+(when load-file-name
+  (add-to-list 'custom-theme-load-path
+               (file-name-as-directory (file-name-directory load-file-name))))
+
+(provide-theme '${slug})
+;;; ${slug}-theme.el ends here
+'''), prepare=derived(_sync_emacs_faces))
+
+register("sync", "alacritty", Template('''# Prism ${name} - Alacritty
+[colors.primary]
+background = "${bg}"
+foreground = "${fg}"
+
+[colors.cursor]
+cursor = "${accent}"
+text = "${bg}"
+
+[colors.selection]
+background = "${hl}"
+text = "${fg}"
+
+[colors.normal]
+black = "${ansiBlack}"
+red = "${ansiRed}"
+green = "${ansiGreen}"
+yellow = "${ansiYellow}"
+blue = "${ansiBlue}"
+magenta = "${ansiMagenta}"
+cyan = "${ansiCyan}"
+white = "${ansiWhite}"
+
+[colors.bright]
+black = "${ansiBrightBlack}"
+red = "${ansiBrightRed}"
+green = "${ansiBrightGreen}"
+yellow = "${ansiBrightYellow}"
+blue = "${ansiBrightBlue}"
+magenta = "${ansiBrightMagenta}"
+cyan = "${ansiBrightCyan}"
+white = "${ansiBrightWhite}"
+'''))
+
+register("sync", "kitty", Template('''# Prism ${name} - Kitty
+foreground ${fg}
+background ${bg}
+cursor ${accent}
+selection_background ${hl}
+selection_foreground ${fg}
+
+color0 ${ansiBlack}
+color1 ${ansiRed}
+color2 ${ansiGreen}
+color3 ${ansiYellow}
+color4 ${ansiBlue}
+color5 ${ansiMagenta}
+color6 ${ansiCyan}
+color7 ${ansiWhite}
+
+color8 ${ansiBrightBlack}
+color9 ${ansiBrightRed}
+color10 ${ansiBrightGreen}
+color11 ${ansiBrightYellow}
+color12 ${ansiBrightBlue}
+color13 ${ansiBrightMagenta}
+color14 ${ansiBrightCyan}
+color15 ${ansiBrightWhite}
+'''))
+
+register("sync", "wezterm", Template('''-- Prism ${name} - WezTerm
+return {
+  foreground = "${fg}",
+  background = "${bg}",
+  cursor_bg = "${accent}",
+  cursor_fg = "${bg}",
+  selection_bg = "${hl}",
+  selection_fg = "${fg}",
+  ansi = {
+    "${ansiBlack}",
+    "${ansiRed}",
+    "${ansiGreen}",
+    "${ansiYellow}",
+    "${ansiBlue}",
+    "${ansiMagenta}",
+    "${ansiCyan}",
+    "${ansiWhite}",
+  },
+  brights = {
+    "${ansiBrightBlack}",
+    "${ansiBrightRed}",
+    "${ansiBrightGreen}",
+    "${ansiBrightYellow}",
+    "${ansiBrightBlue}",
+    "${ansiBrightMagenta}",
+    "${ansiBrightCyan}",
+    "${ansiBrightWhite}",
+  },
+}
+'''))
+
+register("sync", "windows-terminal", Template.from_json({
+    "name": "Prism ${name}",
+    "background": "${bg}",
+    "foreground": "${fg}",
+    "cursorColor": "${accent}",
+    "selectionBackground": "${hl}",
+    "black": "${ansiBlack}",
+    "red": "${ansiRed}",
+    "green": "${ansiGreen}",
+    "yellow": "${ansiYellow}",
+    "blue": "${ansiBlue}",
+    "purple": "${ansiMagenta}",
+    "cyan": "${ansiCyan}",
+    "white": "${ansiWhite}",
+    "brightBlack": "${ansiBrightBlack}",
+    "brightRed": "${ansiBrightRed}",
+    "brightGreen": "${ansiBrightGreen}",
+    "brightYellow": "${ansiBrightYellow}",
+    "brightBlue": "${ansiBrightBlue}",
+    "brightPurple": "${ansiBrightMagenta}",
+    "brightCyan": "${ansiBrightCyan}",
+    "brightWhite": "${ansiBrightWhite}",
+}))
+
+_SYNC_ITERM = [
+    ("Background Color", "bg"),
+    ("Foreground Color", "fg"),
+    ("Cursor Color", "accent"),
+    ("Selection Color", "hl"),
+] + iterm_ansi(SYNC_ANSI, SYNC_BRIGHT)
+
+register("sync", "iterm2", Template('''<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
+<plist version="1.0">
+<dict>
+''' + "\n".join(f'''    <key>{label}</key>
+    <dict>
+        <key>Color Space</key>
+        <string>sRGB</string>
+        <key>Red Component</key>
+        <real>${{{key}.r}}</real>
+        <key>Green Component</key>
+        <real>${{{key}.g}}</real>
+        <key>Blue Component</key>
+        <real>${{{key}.b}}</real>
+    </dict>''' for label, key in _SYNC_ITERM) + '''
+</dict>
+</plist>
+'''), prepare=with_reals(key for _, key in _SYNC_ITERM))
+
+register("sync", "helix", Template('''# Prism ${name} - Helix
+# Place in ~/.config/helix/themes/${slug}.toml
+
+"ui.background" = { bg = "${bg}" }
+"ui.text" = "${fg}"
+"ui.text.focus" = "${keyword}"
+"ui.cursor" = { bg = "${keyword}", fg = "${bg}" }
+"ui.cursor.match" = { bg = "${hl}" }
+"ui.selection" = { bg = "${hl}" }
+"ui.linenr" = "${comment}"
+"ui.linenr.selected" = "${fg}"
+"ui.cursorline.primary" = { bg = "${hl}" }
+"ui.statusline" = { fg = "${fg}", bg = "${bg}" }
+"ui.statusline.inactive" = { fg = "${comment}", bg = "${bg}" }
+"ui.popup" = { bg = "${bg}" }
+"ui.menu" = { bg = "${bg}" }
+"ui.menu.selected" = { bg = "${hl}" }
+"ui.help" = { fg = "${fg}", bg = "${bg}" }
+
+"comment" = { fg = "${comment}", modifiers = ["italic"] }
+"keyword" = { fg = "${keyword}", modifiers = ["bold"] }
+"keyword.control" = "${keyword}"
+"keyword.function" = "${keyword}"
+"keyword.return" = "${keyword}"
+"keyword.exception" = "${keyword}"
+"keyword.operator" = "${keyword}"
+
+"string" = "${string}"
+"string.special" = "${string}"
+
+"function" = "${function}"
+"function.builtin" = "${function}"
+"function.method" = "${function}"
+"function.macro" = "${function}"
+
+"constant" = "${constant}"
+"constant.numeric" = "${constant}"
+"constant.character" = "${string}"
+"constant.builtin" = "${constant}"
+
+"type" = "${type}"
+"type.builtin" = "${type}"
+
+"variable" = "${variable}"
+"variable.builtin" = "${keyword}"
+"variable.parameter" = "${variable}"
+
+"attribute" = "${attribute}"
+"namespace" = "${type}"
+
+"operator" = "${keyword}"
+"punctuation" = "${fg}"
+"punctuation.delimiter" = "${fg}"
+"punctuation.bracket" = "${fg}"
+
+"label" = "${keyword}"
+"tag" = "${tag}"
+
+"markup.heading" = { fg = "${keyword}", modifiers = ["bold"] }
+"markup.bold" = { modifiers = ["bold"] }
+"markup.italic" = { modifiers = ["italic"] }
+"markup.link.url" = "${keyword}"
+"markup.link.text" = "${string}"
+"markup.raw" = "${string}"
+
+"diff.plus" = "${ansiGreen}"
+"diff.minus" = "${ansiRed}"
+"diff.delta" = "${ansiYellow}"
+
+[palette]
+background = "${bg}"
+foreground = "${fg}"
+accent = "${accent}"
+'''))
+
+# "appearance" reads colors["type"], which extract_colors overwrites with the
+# entity.name.type color; the committed terminal/zed files carry that value.
+register("sync", "zed", Template.from_json({
+    "$schema": "https://zed.dev/schema/themes/v0.1.0.json",
+    "name": "Prism ${name}",
+    "author": "Prism Theme System",
+    "themes": [{
+        "name": "Prism ${name}",
+        "appearance": "${type}",
+        "style": {
+            "background": "${bg}",
+            "editor.background": "${bg}",
+            "editor.foreground": "${fg}",
+            "editor.gutter.background": "${bg}",
+            "editor.line_highlight.background": "${hl}",
+            "editor.active_line_number": "${fg}",
+            "editor.wrap_guide": "${comment}",
+            "terminal.background": "${bg}",
+            "terminal.foreground": "${fg}",
+            "terminal.ansi.black": "${ansiBlack}",
+            "terminal.ansi.red": "${ansiRed}",
+            "terminal.ansi.green": "${ansiGreen}",
+            "terminal.ansi.yellow": "${ansiYellow}",
+            "terminal.ansi.blue": "${ansiBlue}",
+            "terminal.ansi.magenta": "${ansiMagenta}",
+            "terminal.ansi.cyan": "${ansiCyan}",
+            "terminal.ansi.white": "${ansiWhite}",
+            "syntax": {
+                "comment": {"color": "${comment}", "font_style": "italic"},
+                "keyword": {"color": "${keyword}", "font_weight": 600},
+                "string": {"color": "${string}"},
+                "function": {"color": "${function}"},
+                "number": {"color": "${constant}"},
+                "type": {"color": "${type}"},
+                "variable": {"color": "${variable}"},
+                "constant": {"color": "${constant}"},
+                "attribute": {"color": "${attribute}"},
+                "property": {"color": "${variable}"},
+                "punctuation": {"color": "${fg}"},
+                "operator": {"color": "${keyword}"},
+            }
+        }
+    }]
+}))
+
+register("sync", "tmux", Template('''# Prism ${name} - tmux
+# Add to ~/.tmux.conf or source this file
+
+# Status bar
+set -g status-style "bg=${bg},fg=${fg}"
+set -g status-left-style "bg=${bg},fg=${keyword}"
+set -g status-right-style "bg=${bg},fg=${comment}"
+
+# Window status
+set -g window-status-style "bg=${bg},fg=${comment}"
+set -g window-status-current-style "bg=${hl},fg=${keyword}"
+
+# Pane borders
+set -g pane-border-style "fg=${comment}"
+set -g pane-active-border-style "fg=${keyword}"
+
+# Message styling
+set -g message-style "bg=${hl},fg=${fg}"
+set -g message-command-style "bg=${hl},fg=${fg}"
+
+# Mode styling
+set -g mode-style "bg=${hl},fg=${fg}"
+'''))
+
+register("sync", "starship", Template('''# Prism ${name} - Starship prompt colors
+# Add to ~/.config/starship.toml
+
+[palettes.prism_${slug}]
+background = "${bg}"
+foreground = "${fg}"
+accent = "${keyword}"
+muted = "${comment}"
+success = "${ansiGreen}"
+warning = "${ansiYellow}"
+error = "${ansiRed}"
+info = "${ansiBlue}"
+
+# Example usage:
+# palette = "prism_${slug}"
+# 
+# [character]
+# success_symbol = "[❯](accent)"
+# error_symbol = "[❯](error)"
+'''))
+
+# ═══════════════════════════════════════════════════════════════════
+# multi family (generate_all_themes.py)
+# ═══════════════════════════════════════════════════════════════════
+
+MULTI_ANSI = [n.lower() for n in ANSI_NAMES]
+MULTI_BRIGHT = ["bright_" + n for n in MULTI_ANSI]
+MULTI_KEYS = ("bg", "fg", "cursor", "selection_bg", "selection_fg", "muted", "accent",
+              "keyword", "string", "function", "comment", "number", "type",
+              *MULTI_ANSI, *MULTI_BRIGHT, "name", "theme_type")
+
+def _multi_surfaces(c):
+    dark = c["theme_type"] == "dark"
+    return {
+        "appearance": "dark" if dark else "light",
+        "parent": "Darcula" if dark else "Default",
+        "caret_row": lighten_hex(c["bg"], 0.05) if dark else lighten_hex(c["bg"], -0.05),
+        "cursorline": lighten_hex(c["bg"], 0.03) if dark else lighten_hex(c["bg"], -0.03),
+        "bg_lift": lighten_hex(c["bg"], 0.03),
+    }
+
+register("multi", "alacritty", Template('''# Prism Theme: ${name}
+# https://github.com/weylai/prism-themes
+
+[colors.primary]
+background = "${bg}"
+foreground = "${fg}"
+
+[colors.cursor]
+text = "${bg}"
+cursor = "${cursor}"
+
+[colors.selection]
+text = "${selection_fg}"
+background = "${selection_bg}"
+
+[colors.normal]
+black = "${black}"
+red = "${red}"
+green = "${green}"
+yellow = "${yellow}"
+blue = "${blue}"
+magenta = "${magenta}"
+cyan = "${cyan}"
+white = "${white}"
+
+[colors.bright]
+black = "${bright_black}"
+red = "${bright_red}"
+green = "${bright_green}"
+yellow = "${bright_yellow}"
+blue = "${bright_blue}"
+magenta = "${bright_magenta}"
+cyan = "${bright_cyan}"
+white = "${bright_white}"
+'''))
+
+register("multi", "kitty", Template('''# Prism Theme: ${name}
+foreground ${fg}
+background ${bg}
+cursor ${cursor}
+cursor_text_color ${bg}
+selection_foreground ${selection_fg}
+selection_background ${selection_bg}
+
+color0 ${black}
+color8 ${bright_black}
+color1 ${red}
+color9 ${bright_red}
+color2 ${green}
+color10 ${bright_green}
+color3 ${yellow}
+color11 ${bright_yellow}
+color4 ${blue}
+color12 ${bright_blue}
+color5 ${magenta}
+color13 ${bright_magenta}
+color6 ${cyan}
+color14 ${bright_cyan}
+color7 ${white}
+color15 ${bright_white}
+'''))
+
+register("multi", "wezterm", Template('''# Prism Theme: ${name}
+[colors]
+foreground = "${fg}"
+background = "${bg}"
+cursor_bg = "${cursor}"
+cursor_fg = "${bg}"
+cursor_border = "${cursor}"
+selection_fg = "${selection_fg}"
+selection_bg = "${selection_bg}"
+
+ansi = ["${black}", "${red}", "${green}", "${yellow}", "${blue}", "${magenta}", "${cyan}", "${white}"]
+brights = ["${bright_black}", "${bright_red}", "${bright_green}", "${bright_yellow}", "${bright_blue}", "${bright_magenta}", "${bright_cyan}", "${bright_white}"]
+
+[metadata]
+name = "Prism ${name}"
+'''))
+
+_MULTI_ITERM = iterm_ansi(MULTI_ANSI, MULTI_BRIGHT) + [
+    ("Background Color", "bg"),
+    ("Bold Color", "fg"),
+    ("Cursor Color", "cursor"),
+    ("Cursor Text Color", "bg"),
+    ("Foreground Color", "fg"),
+    ("Selected Text Color", "selection_fg"),
+    ("Selection Color", "selection_bg"),
+]
+
+register("multi", "iterm2", Template(plist_colors(_MULTI_ITERM)),
+         prepare=with_reals(key for _, key in _MULTI_ITERM), binary=True)
+
+register("multi", "windows-terminal", Template.from_json({
+    "name": "Prism ${name}",
+    "background": "${bg}",
+    "foreground": "${fg}",
+    "cursorColor": "${cursor}",
+    "selectionBackground": "${selection_bg}",
+    "black": "${black}",
+    "red": "${red}",
+    "green": "${green}",
+    "yellow": "${yellow}",
+    "blue": "${blue}",
+    "purple": "${magenta}",
+    "cyan": "${cyan}",
+    "white": "${white}",
+    "brightBlack": "${bright_black}",
+    "brightRed": "${bright_red}",
+    "brightGreen": "${bright_green}",
+    "brightYellow": "${bright_yellow}",
+    "brightBlue": "${bright_blue}",
+    "brightPurple": "${bright_magenta}",
+    "brightCyan": "${bright_cyan}",
+    "brightWhite": "${bright_white}"
+}))
+
+register("multi", "jetbrains", Template('''<?xml version="1.0" encoding="UTF-8"?>
+<scheme name="Prism ${name}" version="142" parent_scheme="${parent}">
+  <metaInfo>
+    <property name="created">Prism Theme Generator</property>
+    <property name="ideVersion">2024.1</property>
+    <property name="modified">Prism Theme Generator</property>
+  </metaInfo>
+  <colors>
+    <option name="CARET_COLOR" value="${jb.cursor}" />
+    <option name="CARET_ROW_COLOR" value="${jb.caret_row}" />
+    <option name="CONSOLE_BACKGROUND_KEY" value="${jb.bg}" />
+    <option name="GUTTER_BACKGROUND" value="${jb.bg}" />
+    <option name="LINE_NUMBERS_COLOR" value="${jb.muted}" />
+    <option name="SELECTION_BACKGROUND" value="${jb.selection_bg}" />
+    <option name="SELECTION_FOREGROUND" value="${jb.fg}" />
+  </colors>
+  <attributes>
+    <option name="DEFAULT_KEYWORD">
+      <value>
+        <option name="FOREGROUND" value="${jb.keyword}" />
+        <option name="FONT_TYPE" value="1" />
+      </value>
+    </option>
+    <option name="DEFAULT_STRING">
+      <value>
+        <option name="FOREGROUND" value="${jb.string}" />
+      </value>
+    </option>
+    <option name="DEFAULT_FUNCTION_DECLARATION">
+      <value>
+        <option name="FOREGROUND" value="${jb.function}" />
+      </value>
+    </option>
+    <option name="DEFAULT_FUNCTION_CALL">
+      <value>
+        <option name="FOREGROUND" value="${jb.function}" />
+      </value>
+    </option>
+    <option name="DEFAULT_LINE_COMMENT">
+      <value>
+        <option name="FOREGROUND" value="${jb.comment}" />
+        <option name="FONT_TYPE" value="2" />
+      </value>
+    </option>
+    <option name="DEFAULT_BLOCK_COMMENT">
+      <value>
+        <option name="FOREGROUND" value="${jb.comment}" />
+        <option name="FONT_TYPE" value="2" />
+      </value>
+    </option>
+    <option name="DEFAULT_DOC_COMMENT">
+      <value>
+        <option name="FOREGROUND" value="${jb.comment}" />
+        <option name="FONT_TYPE" value="2" />
+      </value>
+    </option>
+    <option name="DEFAULT_NUMBER">
+      <value>
+        <option name="FOREGROUND" value="${jb.number}" />
+      </value>
+    </option>
+    <option name="DEFAULT_CLASS_NAME">
+      <value>
+        <option name="FOREGROUND" value="${jb.type}" />
+      </value>
+    </option>
+    <option name="DEFAULT_INTERFACE_NAME">
+      <value>
+        <option name="FOREGROUND" value="${jb.type}" />
+        <option name="FONT_TYPE" value="2" />
+      </value>
+    </option>
+    <option name="DEFAULT_CONSTANT">
+      <value>
+        <option name="FOREGROUND" value="${jb.number}" />
+        <option name="FONT_TYPE" value="1" />
+      </value>
+    </option>
+    <option name="DEFAULT_IDENTIFIER">
+      <value>
+        <option name="FOREGROUND" value="${jb.fg}" />
+      </value>
+    </option>
+  </attributes>
+</scheme>
+'''), prepare=with_jetbrains(
+    ("cursor", "caret_row", "bg", "muted", "selection_bg", "fg",
+     "keyword", "string", "function", "comment", "number", "type"),
+    extra=_multi_surfaces))
+
+register("multi", "zed", Template.from_json({
+    "$schema": "https://zed.dev/schema/themes/v0.1.0.json",
+    "name": "Prism ${name}",
+    "author": "Prism Theme System",
+    "themes": [{
+        "name": "Prism ${name}",
+        "appearance": "${appearance}",
+        "style": {
+            "background": "${bg}",
+            "editor.background": "${bg}",
+            "editor.foreground": "${fg}",
+            "editor.gutter.background": "${bg}",
+            "editor.line_highlight.background": "${cursorline}",
+            "editor.active_line_number": "${accent}",
+            "editor.wrap_guide": "${muted}",
+            "terminal.background": "${bg}",
+            "terminal.foreground": "${fg}",
+            "terminal.ansi.black": "${black}",
+            "terminal.ansi.red": "${red}",
+            "terminal.ansi.green": "${green}",
+            "terminal.ansi.yellow": "${yellow}",
+            "terminal.ansi.blue": "${blue}",
+            "terminal.ansi.magenta": "${magenta}",
+            "terminal.ansi.cyan": "${cyan}",
+            "terminal.ansi.white": "${white}",
+            "syntax": {
+                "comment": {"color": "${comment}", "font_style": "italic"},
+                "keyword": {"color": "${keyword}", "font_weight": 600},
+                "string": {"color": "${string}"},
+                "function": {"color": "${function}"},
+                "number": {"color": "${number}"},
+                "type": {"color": "${type}"},
+                "variable": {"color": "${fg}"},
+                "constant": {"color": "${number}"},
+                "attribute": {"color": "${type}"},
+                "property": {"color": "${fg}"},
+                "punctuation": {"color": "${fg}"},
+                "operator": {"color": "${keyword}"},
+            }
+        }
+    }]
+}), prepare=derived(_multi_surfaces))
+
+register("multi", "helix", Template('''# Prism Theme: ${name}
+# Place in ~/.config/helix/themes/prism-${name}.toml
+
+"ui.background" = { bg = "${bg}" }
+"ui.text" = "${fg}"
+"ui.text.focus" = "${accent}"
+"ui.cursor" = { bg = "${cursor}", fg = "${bg}" }
+"ui.cursor.match" = { bg = "${selection_bg}" }
+"ui.selection" = { bg = "${selection_bg}" }
+"ui.linenr" = "${muted}"
+"ui.linenr.selected" = "${accent}"
+"ui.cursorline.primary" = { bg = "${cursorline}" }
+"ui.statusline" = { fg = "${fg}", bg = "${bg}" }
+"ui.statusline.inactive" = { fg = "${muted}", bg = "${bg}" }
+"ui.popup" = { bg = "${bg}" }
+"ui.menu" = { bg = "${bg}" }
+"ui.menu.selected" = { bg = "${selection_bg}" }
+"ui.help" = { fg = "${fg}", bg = "${bg}" }
+
+"comment" = { fg = "${comment}", modifiers = ["italic"] }
+"keyword" = { fg = "${keyword}", modifiers = ["bold"] }
+"keyword.control" = "${keyword}"
+"keyword.function" = "${keyword}"
+"keyword.return" = "${keyword}"
+"keyword.exception" = "${keyword}"
+"keyword.operator" = "${keyword}"
+
+"string" = "${string}"
+"string.special" = "${string}"
+
+"function" = "${function}"
+"function.builtin" = "${function}"
+"function.method" = "${function}"
+"function.macro" = "${function}"
+
+"constant" = "${number}"
+"constant.numeric" = "${number}"
+"constant.character" = "${string}"
+"constant.builtin" = "${number}"
+
+"type" = "${type}"
+"type.builtin" = "${type}"
+
+"variable" = "${fg}"
+"variable.builtin" = "${type}"
+"variable.parameter" = "${fg}"
+
+"attribute" = "${type}"
+"namespace" = "${type}"
+
+"operator" = "${keyword}"
+"punctuation" = "${fg}"
+"punctuation.delimiter" = "${fg}"
+"punctuation.bracket" = "${fg}"
+
+"label" = "${accent}"
+"tag" = "${keyword}"
+
+"markup.heading" = { fg = "${keyword}", modifiers = ["bold"] }
+"markup.bold" = { modifiers = ["bold"] }
+"markup.italic" = { modifiers = ["italic"] }
+"markup.link.url" = "${accent}"
+"markup.link.text" = "${string}"
+"markup.raw" = "${string}"
+
+"diff.plus" = "${green}"
+"diff.minus" = "${red}"
+"diff.delta" = "${yellow}"
+
+[palette]
+background = "${bg}"
+foreground = "${fg}"
+accent = "${accent}"
+'''), prepare=derived(_multi_surfaces))
+
+register("multi", "bat", Template.from_json({
+    "name": "Prism ${name}",
+    "variables": {
+        "bg": "${bg}",
+        "fg": "${fg}",
+    },
+    "globals": {
+        "background": "${bg}",
+        "foreground": "${fg}",
+        "caret": "${cursor}",
+        "selection": "${selection_bg}",
+        "line_highlight": "${bg_lift}",
+    },
+    "rules": [
+        {"scope": "comment", "foreground": "${comment}", "font_style": "italic"},
+        {"scope": "keyword", "foreground": "${keyword}"},
+        {"scope": "string", "foreground": "${string}"},
+        {"scope": "entity.name.function", "foreground": "${function}"},
+        {"scope": "constant.numeric", "foreground": "${number}"},
+        {"scope": "entity.name.type, support.type", "foreground": "${type}"},
+        {"scope": "variable", "foreground": "${fg}"},
+    ]
+}), prepare=derived(_multi_surfaces))
+
+register("multi", "starship", Template('''# Prism Theme: ${name}
+# Add to ~/.config/starship.toml
+
+# Suggested color palette based on ${name}
+# You can reference these in your starship config
+
+# Example usage:
+# [character]
+# success_symbol = "[❯](bold ${green})"
+# error_symbol = "[❯](bold ${red})"
+
+# [directory]
+# style = "bold ${accent}"
+
+# [git_branch]
+# style = "bold ${magenta}"
+
+# [git_status]
+# style = "${yellow}"
+
+# Color reference:
+# background: ${bg}
+# foreground: ${fg}
+# accent: ${accent}
+# keyword: ${keyword}
+# string: ${string}
+# function: ${function}
+# comment: ${comment}
+# number: ${number}
+# type: ${type}
+'''))
+
+register("multi", "tmux", Template('''# Prism Theme: ${name}
+# Add to ~/.tmux.conf
+
+# Status bar colors
+set -g status-style "bg=${bg},fg=${fg}"
+set -g status-left-style "bg=${accent},fg=${bg}"
+set -g status-right-style "bg=${bg},fg=${muted}"
+
+# Window status
+set -g window-status-style "bg=${bg},fg=${muted}"
+set -g window-status-current-style "bg=${selection_bg},fg=${accent},bold"
+set -g window-status-activity-style "bg=${bg},fg=${yellow}"
+
+# Pane borders
+set -g pane-border-style "fg=${muted}"
+set -g pane-active-border-style "fg=${accent}"
+
+# Message/command mode
+set -g message-style "bg=${selection_bg},fg=${fg}"
+set -g message-command-style "bg=${selection_bg},fg=${accent}"
+
+# Copy mode
+set -g mode-style "bg=${selection_bg},fg=${fg}"
+
+# Clock
+set -g clock-mode-colour "${accent}"
+'''))
+
+# ═══════════════════════════════════════════════════════════════════
+# terminal family (generate_terminal_themes.py)
+# ═══════════════════════════════════════════════════════════════════
+
+TERMINAL_ANSI = [n.lower() for n in ANSI_NAMES]
+TERMINAL_BRIGHT = ["bright" + n for n in ANSI_NAMES]
+TERMINAL_KEYS = ("bg", "fg", "cursor", "selection_bg", "selection_fg",
+                 *TERMINAL_ANSI, *TERMINAL_BRIGHT, "name")
+
+register("terminal", "alacritty", Template('''# Prism Theme: ${name}
+# https://github.com/weylai/prism-themes
+
+[colors.primary]
+background = "${bg}"
+foreground = "${fg}"
+
+[colors.cursor]
+text = "${bg}"
+cursor = "${cursor}"
+
+[colors.selection]
+text = "${selection_fg}"
+background = "${selection_bg}"
+
+[colors.normal]
+black = "${black}"
+red = "${red}"
+green = "${green}"
+yellow = "${yellow}"
+blue = "${blue}"
+magenta = "${magenta}"
+cyan = "${cyan}"
+white = "${white}"
+
+[colors.bright]
+black = "${brightBlack}"
+red = "${brightRed}"
+green = "${brightGreen}"
+yellow = "${brightYellow}"
+blue = "${brightBlue}"
+magenta = "${brightMagenta}"
+cyan = "${brightCyan}"
+white = "${brightWhite}"
+'''))
+
+register("terminal", "kitty", Template('''# Prism Theme: ${name}
+# https://github.com/weylai/prism-themes
+
+foreground ${fg}
+background ${bg}
+
+cursor ${cursor}
+cursor_text_color ${bg}
+
+selection_foreground ${selection_fg}
+selection_background ${selection_bg}
+
+# black
+color0 ${black}
+color8 ${brightBlack}
+
+# red
+color1 ${red}
+color9 ${brightRed}
+
+# green
+color2 ${green}
+color10 ${brightGreen}
+
+# yellow
+color3 ${yellow}
+color11 ${brightYellow}
+
+# blue
+color4 ${blue}
+color12 ${brightBlue}
+
+# magenta
+color5 ${magenta}
+color13 ${brightMagenta}
+
+# cyan
+color6 ${cyan}
+color14 ${brightCyan}
+
+# white
+color7 ${white}
+color15 ${brightWhite}
+'''))
+
+register("terminal", "wezterm", Template('''# Prism Theme: ${name}
+# https://github.com/weylai/prism-themes
+
+[colors]
+foreground = "${fg}"
+background = "${bg}"
+
+cursor_bg = "${cursor}"
+cursor_fg = "${bg}"
+cursor_border = "${cursor}"
+
+selection_fg = "${selection_fg}"
+selection_bg = "${selection_bg}"
+
+ansi = [
+    "${black}",
+    "${red}",
+    "${green}",
+    "${yellow}",
+    "${blue}",
+    "${magenta}",
+    "${cyan}",
+    "${white}"
+]
+
+brights = [
+    "${brightBlack}",
+    "${brightRed}",
+    "${brightGreen}",
+    "${brightYellow}",
+    "${brightBlue}",
+    "${brightMagenta}",
+    "${brightCyan}",
+    "${brightWhite}"
+]
+
+[metadata]
+name = "Prism ${name}"
+author = "Prism Themes"
+'''))
+
+_TERMINAL_ITERM = iterm_ansi(TERMINAL_ANSI, TERMINAL_BRIGHT) + [
+    ("Background Color", "bg"),
+    ("Bold Color", "fg"),
+    ("Cursor Color", "cursor"),
+    ("Cursor Text Color", "bg"),
+    ("Foreground Color", "fg"),
+    ("Selected Text Color", "selection_fg"),
+    ("Selection Color", "selection_bg"),
+]
+
+register("terminal", "iterm2", Template(plist_colors(_TERMINAL_ITERM)),
+         prepare=with_reals(key for _, key in _TERMINAL_ITERM), binary=True)
+
+# ═══════════════════════════════════════════════════════════════════
+# studio family (prism_studio.ExportManager, prism_cli export)
+# ═══════════════════════════════════════════════════════════════════
+
+STUDIO_COLOR_KEYS = ("background", "foreground", "muted", "accent",
+                     "keyword", "string", "function", "comment", "number", "type",
+                     "operator", "variable", "selection_bg", "cursor", "line_highlight",
+                     "black", "red", "green", "yellow", "blue", "magenta", "cyan", "white")
+STUDIO_KEYS = (*STUDIO_COLOR_KEYS, "name", "author", "theme_type")
+
+def _studio_appearance(c):
+    return {"appearance": "dark" if c["theme_type"] == "dark" else "light"}
+
+register("studio", "opencode", Template.from_json({
+    "name": "${name}",
+    "author": "${author}",
+    "type": "${theme_type}",
+    "colors": {
+        "background": "${background}",
+        "text": "${foreground}",
+        "textMuted": "${muted}",
+        "accent": "${accent}",
+        "syntax": {
+            "keyword": "${keyword}",
+            "string": "${string}",
+            "function": "${function}",
+            "comment": "${comment}",
+            "number": "${number}",
+            "type": "${type}",
+            "operator": "${operator}",
+            "variable": "${variable}",
+        },
+        "selection": {"background": "${selection_bg}"},
+        "cursor": "${cursor}",
+        "lineHighlight": "${line_highlight}",
+        "terminal": {
+            "black": "${black}",
+            "red": "${red}",
+            "green": "${green}",
+            "yellow": "${yellow}",
+            "blue": "${blue}",
+            "magenta": "${magenta}",
+            "cyan": "${cyan}",
+            "white": "${white}",
+        }
+    },
+    "_prism": {
+        "version": "1.0.0",
+        "generator": "prism-studio"
+    }
+}))
+
+register("studio", "vscode", Template.from_json({
+    "name": "Prism ${name}",
+    "type": "${theme_type}",
+    "colors": {
+        "editor.background": "${background}",
+        "editor.foreground": "${foreground}",
+        "editorCursor.foreground": "${cursor}",
+        "editor.selectionBackground": "${selection_bg}",
+        "editor.lineHighlightBackground": "${line_highlight}",
+        "activityBar.background": "${background}",
+        "sideBar.background": "${background}",
+        "statusBar.background": "${background}",
+        "titleBar.activeBackground": "${background}",
+    },
+    "tokenColors": [
+        {"scope": "comment", "settings": {"foreground": "${comment}", "fontStyle": "italic"}},
+        {"scope": "keyword", "settings": {"foreground": "${keyword}"}},
+        {"scope": "string", "settings": {"foreground": "${string}"}},
+        {"scope": "entity.name.function", "settings": {"foreground": "${function}"}},
+        {"scope": "constant.numeric", "settings": {"foreground": "${number}"}},
+        {"scope": "entity.name.type", "settings": {"foreground": "${type}"}},
+        {"scope": "variable", "settings": {"foreground": "${variable}"}},
+    ]
+}))
+
+register("studio", "alacritty", Template('''# Prism Theme: ${name}
+[colors.primary]
+background = "${background}"
+foreground = "${foreground}"
+
+[colors.cursor]
+text = "${background}"
+cursor = "${cursor}"
+
+[colors.selection]
+text = "${foreground}"
+background = "${selection_bg}"
+
+[colors.normal]
+black = "${black}"
+red = "${red}"
+green = "${green}"
+yellow = "${yellow}"
+blue = "${blue}"
+magenta = "${magenta}"
+cyan = "${cyan}"
+white = "${white}"
+'''))
+
+register("studio", "kitty", Template('''# Prism Theme: ${name}
+foreground ${foreground}
+background ${background}
+cursor ${cursor}
+selection_foreground ${foreground}
+selection_background ${selection_bg}
+
+color0 ${black}
+color1 ${red}
+color2 ${green}
+color3 ${yellow}
+color4 ${blue}
+color5 ${magenta}
+color6 ${cyan}
+color7 ${white}
+'''))
+
+register("studio", "windows-terminal", Template.from_json({
+    "name": "Prism ${name}",
+    "background": "${background}",
+    "foreground": "${foreground}",
+    "cursorColor": "${cursor}",
+    "selectionBackground": "${selection_bg}",
+    "black": "${black}",
+    "red": "${red}",
+    "green": "${green}",
+    "yellow": "${yellow}",
+    "blue": "${blue}",
+    "purple": "${magenta}",
+    "cyan": "${cyan}",
+    "white": "${white}",
+    "brightBlack": "${muted}",
+    "brightRed": "${red}",
+    "brightGreen": "${green}",
+    "brightYellow": "${yellow}",
+    "brightBlue": "${blue}",
+    "brightPurple": "${magenta}",
+    "brightCyan": "${cyan}",
+    "brightWhite": "${white}"
+}))
+
+register("studio", "jetbrains", Template('''<?xml version="1.0" encoding="UTF-8"?>
+<scheme name="Prism ${name}" version="142" parent_scheme="Darcula">
+  <colors>
+    <option name="CARET_COLOR" value="${jb.cursor}" />
+    <option name="CARET_ROW_COLOR" value="${jb.line_highlight}" />
+    <option name="CONSOLE_BACKGROUND_KEY" value="${jb.background}" />
+    <option name="GUTTER_BACKGROUND" value="${jb.background}" />
+    <option name="SELECTION_BACKGROUND" value="${jb.selection_bg}" />
+  </colors>
+  <attributes>
+    <option name="DEFAULT_KEYWORD">
+      <value><option name="FOREGROUND" value="${jb.keyword}" /></value>
+    </option>
+    <option name="DEFAULT_STRING">
+      <value><option name="FOREGROUND" value="${jb.string}" /></value>
+    </option>
+    <option name="DEFAULT_FUNCTION_DECLARATION">
+      <value><option name="FOREGROUND" value="${jb.function}" /></value>
+    </option>
+    <option name="DEFAULT_LINE_COMMENT">
+      <value><option name="FOREGROUND" value="${jb.comment}" /><option name="FONT_TYPE" value="2" /></value>
+    </option>
+    <option name="DEFAULT_NUMBER">
+      <value><option name="FOREGROUND" value="${jb.number}" /></value>
+    </option>
+    <option name="DEFAULT_CLASS_NAME">
+      <value><option name="FOREGROUND" value="${jb.type}" /></value>
+    </option>
+  </attributes>
+</scheme>
+'''), prepare=with_jetbrains(
+    ("cursor", "line_highlight", "background", "selection_bg",
+     "keyword", "string", "function", "comment", "number", "type")))
+
+register("studio", "wezterm", Template('''# Prism Theme: ${name}
+[colors]
+foreground = "${foreground}"
+background = "${background}"
+cursor_bg = "${cursor}"
+cursor_fg = "${background}"
+selection_fg = "${foreground}"
+selection_bg = "${selection_bg}"
+
+ansi = ["${black}", "${red}", "${green}", "${yellow}", "${blue}", "${magenta}", "${cyan}", "${white}"]
+brights = ["${muted}", "${red}", "${green}", "${yellow}", "${blue}", "${magenta}", "${cyan}", "${white}"]
+
+[metadata]
+name = "Prism ${name}"
+'''))
+
+register("studio", "zed", Template.from_json({
+    "$schema": "https://zed.dev/schema/themes/v0.1.0.json",
+    "name": "Prism ${name}",
+    "author": "${author}",
+    "themes": [{
+        "name": "Prism ${name}",
+        "appearance": "${appearance}",
+        "style": {
+            "background": "${background}",
+            "editor.background": "${background}",
+            "editor.foreground": "${foreground}",
+            "editor.line_highlight": "${line_highlight}",
+            "syntax": {
+                "comment": {"color": "${comment}", "font_style": "italic"},
+                "keyword": {"color": "${keyword}"},
+                "string": {"color": "${string}"},
+                "function": {"color": "${function}"},
+                "number": {"color": "${number}"},
+                "type": {"color": "${type}"},
+            }
+        }
+    }]
+}), prepare=derived(_studio_appearance))
+
+register("studio", "helix", Template('''# Prism Theme: ${name}
+# Place in ~/.config/helix/themes/
+
+"ui.background" = { bg = "${background}" }
+"ui.text" = "${foreground}"
+"ui.cursor" = { bg = "${cursor}", fg = "${background}" }
+"ui.selection" = { bg = "${selection_bg}" }
+"ui.linenr" = "${muted}"
+"ui.cursorline" = { bg = "${line_highlight}" }
+
+"comment" = { fg = "${comment}", modifiers = ["italic"] }
+"keyword" = "${keyword}"
+"string" = "${string}"
+"function" = "${function}"
+"constant.numeric" = "${number}"
+"type" = "${type}"
+"variable" = "${variable}"
+
+[palette]
+background = "${background}"
+foreground = "${foreground}"
+'''))
+
+# ═══════════════════════════════════════════════════════════════════
+# Benchmark
+# ═══════════════════════════════════════════════════════════════════
+
+FAMILY_KEYS = {
+    "sync": SYNC_KEYS,
+    "multi": MULTI_KEYS,
+    "terminal": TERMINAL_KEYS,
+    "studio": STUDIO_KEYS,
+}
+
+def sample_values(family: str, seed: int) -> Dict[str, str]:
+    """Deterministic synthetic input for a family (every key gets a color)."""
+    values = {}
+    for k, key in enumerate(FAMILY_KEYS[family]):
+        values[key] = f"#{(seed * 2654435761 + k * 40503) & 0xFFFFFF:06x}"
+    values.update(name=f"Bench {seed}", slug=f"bench_{seed}", author="Prism Bench",
+                  theme_type="dark" if seed % 2 == 0 else "light")
+    return values
+
+def bench(count: int = 2000, only: Optional[str] = None) -> List[Tuple[str, str, float]]:
+    """Render count synthetic themes through every writer; returns themes/sec."""
+    results = []
+    for family in families():
+        if only and family != only:
+            continue
+        samples = [sample_values(family, i) for i in range(count)]
+        for name in formats(family):
+            writer = get_writer(family, name)
+            start = time.perf_counter()
+            for values in samples:
+                writer.render(values)
+            elapsed = time.perf_counter() - start
+            results.append((family, name, count / elapsed if elapsed else float("inf")))
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="Prism format-writer registry")
+    parser.add_argument("--bench", action="store_true", help="Measure render throughput per format")
+    parser.add_argument("-n", "--count", type=int, default=2000, help="Themes per format (default: 2000)")
+    parser.add_argument("--family", choices=list(FAMILY_KEYS), help="Only benchmark one family")
+    args = parser.parse_args()
+
+    if not args.bench:
+        for family in families():
+            print(f"{family:<10} {', '.join(formats(family))}")
+        return 0
+
+    print(f"{'Family':<10} {'Format':<18} {'Themes/s':>12} {'µs/theme':>10}")
+    print("-" * 53)
+    for family, name, rate in bench(args.count, args.family):
+        print(f"{family:<10} {name:<18} {rate:>12,.0f} {1e6 / rate:>10.1f}")
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
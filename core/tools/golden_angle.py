@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Prism Golden Angle - hue distribution by the golden angle
+
+Python counterpart of core/lean4/PrismColor/GoldenAngle.lean (nthGoldenHue,
+generateGoldenPalette) and neovim/lua/prism/colors.lua (nth_golden_hue,
+generate_golden_hues). Successive hues are rotated by 2π/φ² radians
+(≈137.5078°), so any prefix of the sequence stays well spread around the
+wheel (three-distance theorem). As in the Lua and Lean versions the rotation
+is done in radians and converted back to degrees at the end.
+
+golden_hues() and golden_palette() are batched: many base hues x N colours
+in one NumPy call. verified_generator uses nth_golden_hue() for
+ThemeConfig(accents="golden"). scripts/test_golden_angle.py checks both
+against golden vectors from the Lua and Lean definitions.
+
+Usage:
+    from golden_angle import golden_hues, golden_palette
+    golden_hues([211, 30], 8)                 # (2, 8) degrees
+    golden_palette([211], 8, 0.72, 0.15)      # (1, 8, 3) OKLCH
+
+    python golden_angle.py --hue 211 --count 8 --lightness 0.72 --chroma 0.15
+"""
+
+import argparse
+import math
+from typing import List, Sequence, Union
+
+import numpy as np
+
+from color_array import oklch_to_hex
+
+PHI = (1 + math.sqrt(5)) / 2
+TAU = 2 * math.pi
+GOLDEN_ANGLE_RAD = TAU / (PHI * PHI)                    # ~2.399963229728653
+GOLDEN_ANGLE_DEG = GOLDEN_ANGLE_RAD * (180 / math.pi)   # ~137.5077640500378
+PERFECT_BLUE = 211
+
+# ═══════════════════════════════════════════════════════════════════
+# Scalar (matches colors.lua line for line)
+# ═══════════════════════════════════════════════════════════════════
+
+def nth_golden_hue(base_hue: float, n: int) -> float:
+    """The nth hue (0-indexed) rotated from base_hue, in degrees [0, 360)."""
+    result_rad = math.radians(base_hue) + n * GOLDEN_ANGLE_RAD
+    return (result_rad % TAU) * (180 / math.pi)
+
+def generate_golden_hues(base_hue: float, count: int) -> List[float]:
+    return [nth_golden_hue(base_hue, n) for n in range(count)]
+
+# ═══════════════════════════════════════════════════════════════════
+# Batched
+# ═══════════════════════════════════════════════════════════════════
+
+def golden_hues(base_hues: Union[float, Sequence[float], np.ndarray], count: int) -> np.ndarray:
+    """(B,) base hues -> (B, count) golden-angle hues in degrees [0, 360)."""
+    base = np.radians(np.atleast_1d(np.asarray(base_hues, dtype=np.float64)))
+    rad = base[:, None] + np.arange(count, dtype=np.float64)[None, :] * GOLDEN_ANGLE_RAD
+    return np.degrees(np.mod(rad, TAU))
+
+def golden_palette(base_hues, count: int, lightness: Union[float, np.ndarray],
+                   chroma: Union[float, np.ndarray]) -> np.ndarray:
+    """(B, count, 3) OKLCH palettes (generateGoldenPalette in the Lean spec).
+
+    lightness and chroma are scalars or broadcast against (B, count), so
+    per-slot ramps such as colors.lua's DARK_LIGHTNESS work too.
+    """
+    hues = golden_hues(base_hues, count)
+    L = np.broadcast_to(np.asarray(lightness, dtype=np.float64), hues.shape)
+    C = np.broadcast_to(np.asarray(chroma, dtype=np.float64), hues.shape)
+    return np.stack([L, C, hues], axis=-1)
+
+def min_hue_gap(hues: np.ndarray) -> np.ndarray:
+    """(..., N) hues -> (...) smallest circular distance between any two, in degrees."""
+    ordered = np.sort(hues, axis=-1)
+    gaps = np.diff(ordered, axis=-1, append=ordered[..., :1] + 360.0)
+    return gaps.min(axis=-1)
+
+def main():
+    parser = argparse.ArgumentParser(description="Golden-angle hue distribution")
+    parser.add_argument("--hue", type=float, nargs="+", default=[PERFECT_BLUE], help="Base hue(s) in degrees")
+    parser.add_argument("--count", type=int, default=8)
+    parser.add_argument("--lightness", type=float, default=0.72)
+    parser.add_argument("--chroma", type=float, default=0.15)
+    args = parser.parse_args()
+
+    palettes = golden_palette(args.hue, args.count, args.lightness, args.chroma)
+    hexes = oklch_to_hex(palettes)
+    for b, base in enumerate(args.hue):
+        print(f"base {base:g}° (min gap {min_hue_gap(palettes[b, :, 2]):.1f}°)")
+        for n in range(args.count):
+            print(f"  {n:2}  H={palettes[b, n, 2]:8.3f}  {hexes[b * args.count + n]}")
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,454 @@
+#!/usr/bin/env python3
+"""
+Prism Image Palette - seed a verified theme from a wallpaper or screenshot
+
+Reads PNG or binary PPM/PGM images, samples their pixels in constant memory,
+clusters the samples in OKLAB with k-means, and turns the clusters into a
+verified_generator.ThemeConfig:
+
+    hero   the cluster with the best mix of chroma and coverage (accents)
+    base   the dominant cluster (background/foreground tint)
+
+The image is never held in memory:
+
+    PPM    only the sampled rows are read (seek per row), columns are strided
+    PNG    IDAT is read in READ_BYTES pieces and inflated at most a band at
+           a time (however large a single IDAT chunk is), then unfiltered in
+           bands of rows; bands with Avg/Paeth rows are unfiltered along
+           anti-diagonals so every step is one vectorized operation over the
+           band's rows. A band that mixes filter kinds computes every kind it
+           uses at each step, so a mixed-filter image costs about 1.5-1.8x
+           an all-Paeth one (14 s vs 8 s for 48 megapixels on one core)
+
+Rows and columns are strided down to about STREAM_PIXELS, and the stream
+feeds a RESERVOIR-sized uniform sample (Algorithm R, vectorized per chunk).
+k-means then runs on the reservoir only, so a 50-megapixel image costs the
+same clustering time as a thumbnail.
+
+Usage:
+    python image_palette.py wallpaper.png --name "Wallpaper"          # writes prism-wallpaper.json
+    python image_palette.py photo.ppm --name "Photo" --monitor lcd -k 10 --accents optimized
+    python image_palette.py wallpaper.png --palette-only              # just print the clusters
+"""
+
+import argparse
+import json
+import math
+import struct
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from color_array import linear_to_oklab, linear_to_srgb, oklab_to_linear, oklab_to_oklch, srgb_to_hex, srgb_to_linear
+from verified_generator import ThemeConfig, generate_vscode_theme
+
+STREAM_PIXELS = 1 << 20    # rows/columns are strided down to about this many pixels
+RESERVOIR = 1 << 16        # uniform sample that k-means runs on
+CHUNK_BYTES = 1 << 22      # PPM rows read per chunk
+BAND_BYTES = 1 << 22       # inflated PNG bytes unfiltered per band
+READ_BYTES = 1 << 20       # compressed PNG bytes read at a time
+KMEANS_ITERATIONS = 30
+
+HERO_MIN_CHROMA = 0.04     # clusters below this are neutrals, never the hero
+HERO_CHROMA = 0.15         # accent chroma at hero_saturation 1 (generate_accent_colors)
+BASE_CHROMA = 0.10         # dominant-cluster chroma that maps to base_saturation 1
+LIGHT_MODE_L = 0.6         # --mode auto picks light above this mean OKLCH L
+
+# ═══════════════════════════════════════════════════════════════════
+# Sampling
+# ═══════════════════════════════════════════════════════════════════
+
+def stride(width: int, height: int) -> int:
+    """Row and column step that brings an image down to about STREAM_PIXELS."""
+    return max(1, math.ceil(math.sqrt(width * height / STREAM_PIXELS)))
+
+class Reservoir:
+    """Fixed-size uniform sample of a pixel stream (Algorithm R, one vectorized step per chunk)."""
+
+    def __init__(self, capacity: int = RESERVOIR, seed: int = 0):
+        self.capacity = capacity
+        self.samples = np.empty((capacity, 3), dtype=np.uint8)
+        self.seen = 0
+        self.rng = np.random.default_rng(seed)
+
+    def add(self, pixels: np.ndarray):
+        fill = min(len(pixels), max(0, self.capacity - self.seen))
+        self.samples[self.seen:self.seen + fill] = pixels[:fill]
+        rest = pixels[fill:]
+        if len(rest):
+            # Item i of the stream replaces a random slot with probability capacity / (i + 1);
+            # repeated slots keep the later item, as the sequential algorithm would
+            index = self.seen + fill + np.arange(len(rest))
+            slots = (self.rng.random(len(rest)) * (index + 1)).astype(np.int64)
+            keep = slots < self.capacity
+            self.samples[slots[keep]] = rest[keep]
+        self.seen += len(pixels)
+
+    def pixels(self) -> np.ndarray:
+        return self.samples[:min(self.seen, self.capacity)]
+
+# ═══════════════════════════════════════════════════════════════════
+# PPM / PGM (binary)
+# ═══════════════════════════════════════════════════════════════════
+
+def _ppm_header(f: BinaryIO) -> Tuple[bytes, int, int, int]:
+    tokens = []
+    while len(tokens) < 4:
+        line = f.readline()
+        if not line:
+            raise ValueError("truncated PPM header")
+        tokens += line.split(b"#", 1)[0].split()
+    magic, width, height, maxval = tokens[0], int(tokens[1]), int(tokens[2]), int(tokens[3])
+    if magic not in (b"P5", b"P6") or len(tokens) > 4 or not 0 < maxval < 65536:
+        raise ValueError("only binary PPM (P6) and PGM (P5) are supported")
+    return magic, width, height, maxval
+
+def ppm_pixels(f: BinaryIO) -> Iterator[np.ndarray]:
+    """(N, 3) uint8 chunks of the strided image."""
+    magic, width, height, maxval = _ppm_header(f)
+    channels = 3 if magic == b"P6" else 1
+    dtype = np.dtype(">u2") if maxval > 255 else np.dtype(np.uint8)
+    row_bytes = width * channels * dtype.itemsize
+    step = stride(width, height)
+    start = f.tell()
+    rows = range(0, height, step)
+    per_chunk = max(1, CHUNK_BYTES // row_bytes)
+    for i in range(0, len(rows), per_chunk):
+        block = rows[i:i + per_chunk]
+        if step == 1:
+            f.seek(start + block[0] * row_bytes)
+            data = f.read(len(block) * row_bytes)
+        else:
+            parts = []
+            for y in block:
+                f.seek(start + y * row_bytes)
+                parts.append(f.read(row_bytes))
+            data = b"".join(parts)
+        if len(data) < len(block) * row_bytes:
+            raise ValueError("truncated PPM data")
+        samples = np.frombuffer(data, dtype=dtype).reshape(len(block), width, channels)[:, ::step]
+        if maxval != 255:
+            samples = (samples.astype(np.uint32) * 255 + maxval // 2) // maxval
+        yield np.broadcast_to(samples, samples.shape[:2] + (3,)).reshape(-1, 3).astype(np.uint8)
+
+# ═══════════════════════════════════════════════════════════════════
+# PNG
+# ═══════════════════════════════════════════════════════════════════
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+PNG_CHANNELS = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}  # color type -> samples per pixel
+
+@dataclass
+class PngHeader:
+    width: int
+    height: int
+    depth: int
+    color: int
+
+    @property
+    def bpp(self) -> int:
+        """Filter unit: bytes per complete pixel, at least 1."""
+        return max(1, PNG_CHANNELS[self.color] * self.depth // 8)
+
+    @property
+    def row_bytes(self) -> int:
+        return (self.width * PNG_CHANNELS[self.color] * self.depth + 7) // 8
+
+def _png_chunks(f: BinaryIO) -> Iterator[Tuple[bytes, bytes]]:
+    """(kind, data) per chunk; IDAT data comes in pieces of at most READ_BYTES."""
+    while True:
+        head = f.read(8)
+        if len(head) < 8:
+            raise ValueError("truncated PNG (no IEND)")
+        length, kind = struct.unpack(">I4s", head)
+        if kind == b"IDAT":
+            while length:
+                data = f.read(min(length, READ_BYTES))
+                if not data:
+                    raise ValueError("truncated PNG chunk")
+                length -= len(data)
+                yield kind, data
+        else:
+            data = f.read(length)
+            if len(data) < length:
+                raise ValueError("truncated PNG chunk")
+            yield kind, data
+        f.read(4)  # CRC
+        if kind == b"IEND":
+            return
+
+def _paeth(a, b, c):
+    pa, pb, pc = np.abs(b - c), np.abs(a - c), np.abs(a + b - 2 * c)
+    return np.where((pa <= pb) & (pa <= pc), a, np.where(pb <= pc, b, c))
+
+def unfilter(band: np.ndarray, prev: np.ndarray, bpp: int) -> np.ndarray:
+    """Reconstruct (R, 1 + row_bytes) filtered scanlines given the row above the band."""
+    kinds, raw = band[:, 0], band[:, 1:]
+    if len(kinds) and kinds.max() > 4:
+        raise ValueError(f"bad PNG filter type {kinds.max()}")
+    rows, width = raw.shape[0], raw.shape[1] // bpp
+    if not np.isin(kinds, (3, 4)).any():
+        # None/Sub/Up: each row is one vectorized operation
+        out = np.empty_like(raw)
+        up = prev
+        for r, kind in enumerate(kinds.tolist()):
+            if kind == 0:
+                out[r] = raw[r]
+            elif kind == 1:
+                out[r] = raw[r].reshape(width, bpp).cumsum(axis=0, dtype=np.uint8).reshape(-1)
+            else:
+                out[r] = raw[r] + up
+            up = out[r]
+        return out
+
+    # Avg/Paeth depend on the pixel to the left, so walk anti-diagonals: at step j,
+    # row k handles pixel j - k - 1, and left, up and up-left were all finished at j-1 or j-2.
+    # Skewed storage T[j, k + 1] = out[k, j - k - 1] keeps every step a contiguous slice;
+    # T[:, 0] holds the row above the band.
+    steps = width + rows
+    skewed = np.zeros((steps + 1, rows, bpp), dtype=np.int16)
+    for k in range(rows):
+        skewed[k + 1:k + 1 + width, k] = raw[k].reshape(width, bpp)
+    T = np.zeros((steps + 1, rows + 1, bpp), dtype=np.int16)
+    T[:width, 0] = prev.reshape(width, bpp)
+    # Only the filter kinds present in the band are computed; a kind used by every row needs no mask
+    present = [(kind, None if (kinds == kind).all() else (kinds == kind).astype(np.int16)[:, None])
+               for kind in (1, 2, 3, 4) if (kinds == kind).any()]
+    for j in range(1, steps):
+        lo, hi = max(0, j - width), min(rows, j)
+        a, b, c = T[j - 1, lo + 1:hi + 1], T[j - 1, lo:hi], T[j - 2, lo:hi]
+        pred = 0
+        for kind, mask in present:
+            term = a if kind == 1 else b if kind == 2 else (a + b) >> 1 if kind == 3 else _paeth(a, b, c)
+            pred = pred + (term if mask is None else mask[lo:hi] * term)
+        np.bitwise_and(skewed[j, lo:hi] + pred, 0xFF, out=T[j, lo + 1:hi + 1])
+    out = np.empty((rows, width, bpp), dtype=np.uint8)
+    for k in range(rows):
+        out[k] = T[k + 1:k + 1 + width, k + 1]
+    return out.reshape(rows, width * bpp)
+
+def _png_rgb(rows: np.ndarray, header: PngHeader, palette: Optional[np.ndarray], step: int) -> np.ndarray:
+    """Unfiltered scanlines -> (N, 3) uint8 of the strided, opaque pixels."""
+    n = len(rows)
+    channels = PNG_CHANNELS[header.color]
+    if header.depth < 8:
+        bits = np.unpackbits(rows, axis=1)[:, :header.width * header.depth].reshape(n, header.width, header.depth)
+        samples = (bits @ (1 << np.arange(header.depth - 1, -1, -1))).astype(np.uint16)[:, ::step, None]
+    else:
+        samples = rows.reshape(n, header.width, channels, header.depth // 8)[:, ::step, :, 0]
+    if header.color == 3:
+        rgba = palette[samples[..., 0]]
+    elif header.color in (0, 4):
+        gray = samples[..., :1]
+        if header.depth < 8:
+            gray = gray * 255 // ((1 << header.depth) - 1)
+        alpha = samples[..., 1:] if header.color == 4 else np.full_like(gray, 255)
+        rgba = np.concatenate([gray, gray, gray, alpha], axis=-1)
+    else:
+        rgba = samples if header.color == 6 else np.concatenate([samples, np.full_like(samples[..., :1], 255)], axis=-1)
+    rgba = rgba.reshape(-1, 4)
+    return rgba[rgba[:, 3] >= 128, :3].astype(np.uint8)
+
+def png_pixels(f: BinaryIO) -> Iterator[np.ndarray]:
+    """(N, 3) uint8 chunks of the strided image, transparent pixels dropped."""
+    if f.read(8) != PNG_SIGNATURE:
+        raise ValueError("not a PNG file")
+    header, palette = None, None
+    inflater = zlib.decompressobj()
+    pending = bytearray()
+    prev, y, band_rows, step = None, 0, 0, 1
+
+    def drain(final: bool):
+        nonlocal pending, prev, y
+        line = header.row_bytes + 1
+        while len(pending) >= (line if final else band_rows * line) and y < header.height:
+            count = min(band_rows, len(pending) // line, header.height - y)
+            band = np.frombuffer(bytes(pending[:count * line]), dtype=np.uint8).reshape(count, line)
+            del pending[:count * line]
+            rows = unfilter(band, prev, header.bpp)
+            prev = rows[-1]
+            keep = np.arange(y, y + count) % step == 0
+            y += count
+            if keep.any():
+                yield _png_rgb(rows[keep], header, palette, step)
+
+    for kind, data in _png_chunks(f):
+        if kind == b"IHDR":
+            width, height, depth, color, _, _, interlace = struct.unpack(">IIBBBBB", data)
+            if color not in PNG_CHANNELS or depth not in (1, 2, 4, 8, 16) or (depth < 8 and color not in (0, 3)):
+                raise ValueError(f"unsupported PNG color type {color} / bit depth {depth}")
+            if interlace:
+                raise ValueError("interlaced PNGs are not supported; re-save without Adam7")
+            header = PngHeader(width, height, depth, color)
+            prev = np.zeros(header.row_bytes, dtype=np.uint8)
+            band_rows = max(1, BAND_BYTES // (header.row_bytes + 1))
+            step = stride(width, height)
+        elif kind == b"PLTE":
+            colors = np.frombuffer(data, dtype=np.uint8).reshape(-1, 3)
+            palette = np.concatenate([colors, np.full((len(colors), 1), 255, dtype=np.uint8)], axis=1)
+            palette = np.concatenate([palette, np.zeros((256 - len(palette), 4), dtype=np.uint8)])
+        elif kind == b"tRNS" and palette is not None:
+            alpha = np.frombuffer(data, dtype=np.uint8)
+            palette[:len(alpha), 3] = alpha
+        elif kind == b"IDAT":
+            if header is None or (header.color == 3 and palette is None):
+                raise ValueError("PNG IDAT before IHDR/PLTE")
+            # Inflate at most a band per call; the rest of the input waits in unconsumed_tail
+            while data:
+                pending += inflater.decompress(data, band_rows * (header.row_bytes + 1))
+                data = inflater.unconsumed_tail
+                yield from drain(final=False)
+    if header is None:
+        raise ValueError("PNG has no IHDR")
+    pending += inflater.flush()
+    yield from drain(final=True)
+    if y < header.height:
+        raise ValueError("truncated PNG image data")
+
+def image_pixels(path: Path) -> Iterator[np.ndarray]:
+    with open(path, "rb") as f:
+        magic = f.read(8)
+        f.seek(0)
+        if magic == PNG_SIGNATURE:
+            yield from png_pixels(f)
+        elif magic[:2] in (b"P5", b"P6"):
+            yield from ppm_pixels(f)
+        else:
+            raise ValueError(f"{path}: not a PNG or binary PPM/PGM image")
+
+def sample_image(path: Path, capacity: int = RESERVOIR, seed: int = 0) -> np.ndarray:
+    """Uniform (<= capacity, 3) uint8 sample of an image's opaque pixels."""
+    reservoir = Reservoir(capacity, seed)
+    for pixels in image_pixels(path):
+        reservoir.add(pixels)
+    if not reservoir.seen:
+        raise ValueError(f"{path}: no opaque pixels")
+    return reservoir.pixels()
+
+# ═══════════════════════════════════════════════════════════════════
+# Clustering
+# ═══════════════════════════════════════════════════════════════════
+
+def kmeans(points: np.ndarray, k: int, iterations: int = KMEANS_ITERATIONS, seed: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+    """Lloyd's k-means with k-means++ seeding -> (centers, cluster sizes)."""
+    rng = np.random.default_rng(seed)
+    centers = [points[rng.integers(len(points))]]
+    d2 = ((points - centers[0]) ** 2).sum(axis=1)
+    while len(centers) < k and d2.sum() > 0:
+        centers.append(points[rng.choice(len(points), p=d2 / d2.sum())])
+        d2 = np.minimum(d2, ((points - centers[-1]) ** 2).sum(axis=1))
+    centers = np.array(centers)
+    for _ in range(iterations):
+        labels = ((centers ** 2).sum(axis=1) - 2.0 * points @ centers.T).argmin(axis=1)
+        counts = np.bincount(labels, minlength=len(centers))
+        sums = np.stack([np.bincount(labels, weights=points[:, i], minlength=len(centers)) for i in range(3)], axis=1)
+        moved = np.where(counts[:, None] > 0, sums / np.maximum(counts, 1)[:, None], centers)
+        if np.abs(moved - centers).max() < 1e-5:
+            centers = moved
+            break
+        centers = moved
+    labels = ((centers ** 2).sum(axis=1) - 2.0 * points @ centers.T).argmin(axis=1)
+    return centers, np.bincount(labels, minlength=len(centers))
+
+@dataclass
+class Cluster:
+    hex: str
+    share: float
+    L: float
+    C: float
+    H: float
+
+def extract_palette(path: Path, k: int = 8, seed: int = 0) -> List[Cluster]:
+    """The image's k OKLAB clusters, largest first."""
+    pixels = sample_image(path, seed=seed)
+    lab = linear_to_oklab(srgb_to_linear(pixels / 255.0))
+    centers, counts = kmeans(lab, min(k, len(np.unique(pixels, axis=0))), seed=seed)
+    lch = oklab_to_oklch(centers)
+    hexes = srgb_to_hex(linear_to_srgb(oklab_to_linear(centers)))
+    clusters = [Cluster(h, n / len(lab), *row) for h, n, row in zip(hexes, counts.tolist(), lch.tolist()) if n]
+    return sorted(clusters, key=lambda c: -c.share)
+
+def pick_roles(clusters: List[Cluster]) -> Tuple[Cluster, Cluster]:
+    """(hero, base): the most vivid well-covered cluster, and the dominant one."""
+    base = clusters[0]
+    vivid = [c for c in clusters if c.C >= HERO_MIN_CHROMA]
+    hero = max(vivid, key=lambda c: c.C * math.sqrt(c.share)) if vivid else base
+    return hero, base
+
+def theme_config(clusters: List[Cluster], name: str, mode: str = "auto", monitor: str = "oled",
+                 accents: str = "harmony") -> ThemeConfig:
+    hero, base = pick_roles(clusters)
+    if mode == "auto":
+        mode = "light" if sum(c.L * c.share for c in clusters) > LIGHT_MODE_L else "dark"
+    return ThemeConfig(
+        hero_hue=round(hero.H, 1),
+        hero_saturation=round(min(1.0, hero.C / HERO_CHROMA), 3),
+        base_hue=round(base.H if base.C >= 0.01 else hero.H, 1),
+        base_saturation=round(min(1.0, base.C / BASE_CHROMA), 3),
+        mode=mode,
+        monitor=monitor,
+        name=name,
+        accents=accents,
+    )
+
+# ═══════════════════════════════════════════════════════════════════
+# CLI
+# ═══════════════════════════════════════════════════════════════════
+
+def main():
+    parser = argparse.ArgumentParser(description="Seed a Prism theme from an image (PNG, PPM/PGM)")
+    parser.add_argument("image", type=Path)
+    parser.add_argument("--name", help="Theme name (default: image file name)")
+    parser.add_argument("-k", type=int, default=8, help="Clusters (default: 8)")
+    parser.add_argument("--mode", choices=["auto", "dark", "light"], default="auto")
+    parser.add_argument("--monitor", choices=["oled", "lcd"], default="oled")
+    parser.add_argument("--accents", choices=["harmony", "golden", "optimized"], default="harmony")
+    parser.add_argument("--seed", type=int, default=0, help="Sampling and k-means seed")
+    parser.add_argument("--output", "-o", default=".", help="Output directory")
+    parser.add_argument("--palette-only", action="store_true", help="Print the clusters, write nothing")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    try:
+        clusters = extract_palette(args.image, args.k, args.seed)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+    elapsed = time.perf_counter() - start
+    hero, base = pick_roles(clusters)
+
+    print(f"\n{args.image}: {len(clusters)} clusters in {elapsed:.2f}s")
+    print(f"  {'color':<9} {'share':>6} {'L':>6} {'C':>6} {'H':>6}")
+    for c in clusters:
+        role = "  hero" if c is hero else ""
+        role += "  base" if c is base else ""
+        print(f"  {c.hex:<9} {c.share:>6.1%} {c.L:>6.3f} {c.C:>6.3f} {c.H:>6.1f}{role}")
+    if args.palette_only:
+        return 0
+
+    config = theme_config(clusters, args.name or args.image.stem.replace("_", " ").title(),
+                          args.mode, args.monitor, args.accents)
+    print(f"\nGenerating: Prism {config.name}")
+    print(f"  Hero hue: {config.hero_hue}° (saturation {config.hero_saturation})")
+    print(f"  Base hue: {config.base_hue}° (saturation {config.base_saturation})")
+    print(f"  Mode: {config.mode}")
+    print(f"  Monitor: {config.monitor}")
+    theme = generate_vscode_theme(config, verbose=False)
+
+    output_dir = Path(args.output)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    filepath = output_dir / f"prism-{config.name.lower().replace(' ', '_')}.json"
+    with open(filepath, "w") as f:
+        json.dump(theme, f, indent=2)
+    print(f"\n✓ Saved: {filepath}")
+    if theme["_prism_meta"]["wcag_verified"]:
+        print("✓ WCAG AA verified")
+    else:
+        print("⚠ Some colors may not meet WCAG AA")
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Prism Monitor Variants - OLED and LCD black-balance packs for existing themes
+
+verified_generator applies ThemeConfig.monitor black balance only to themes it
+generates. This derives OLED and LCD variants of every existing dark theme in
+vscode/themes:
+
+    oled   editor background at OKLCH L 0.00 (true black)
+    lcd    editor background lifted to at least OKLCH L 0.20 (#161616), so
+           LCD backlight bleed does not wash out near-black surfaces. A
+           background that is already lighter keeps its lightness: the LCD
+           variant never darkens a theme.
+
+The background ramp moves as a whole: every workbench color within RAMP_SPAN lightness of the
+editor background (surfaces, borders, ansiBlack, ...) keeps its WCAG contrast
+ratio to it, so the surface steps stay as distinguishable as in the source
+near L 0, where equal lightness offsets would collapse. Hue and chroma are
+kept. All themes and profiles go through one batched OKLCH pass. theme_repair
+then re-solves every failing foreground contrast pair, so each variant ships
+WCAG-clean. Light themes have no black balance and are skipped.
+
+Each variant (<slug>_<profile>) is rendered to every output format through
+preset_compiler.theme_outputs. Variants are cached by a hash of the source
+theme, the profile and the toolchain, so an unchanged theme costs nothing on
+the next build.
+
+Usage:
+    python monitor_variants.py                      # build/monitor, incremental
+    python monitor_variants.py --monitor oled --only acid_rain
+    python monitor_variants.py --bundle dist/prism-monitor-variants.tar.gz
+"""
+
+import argparse
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+import numpy as np
+
+from color_array import hex_to_srgb, oklch_to_srgb, relative_luminance, srgb_to_oklch
+from preset_compiler import TOOLCHAIN, is_fresh, load_cache, save_cache, theme_outputs
+from theme_bundle import bundle_kind, open_sink
+from theme_repair import repair_corpus
+from theme_transform import ColorTable, solve_lightness
+
+SCRIPT_DIR = Path(__file__).parent
+PRISM_ROOT = SCRIPT_DIR.parent.parent
+VSCODE_DIR = PRISM_ROOT / "vscode" / "themes"
+DEFAULT_OUTPUT = PRISM_ROOT / "build" / "monitor"
+
+# Editor background OKLCH L per profile, and the profiles that only ever raise it
+BLACK_LEVEL = {"oled": 0.0, "lcd": 0.20}
+LIFT_ONLY = {"lcd"}
+PROFILES = tuple(BLACK_LEVEL)
+PROFILE_NAMES = {"oled": "OLED", "lcd": "LCD"}
+RAMP_SPAN = 0.15  # workbench colors this close above the editor background are part of its ramp
+
+VARIANT_TOOLCHAIN = TOOLCHAIN + tuple(SCRIPT_DIR / name for name in (
+    "monitor_variants.py", "theme_repair.py", "theme_transform.py", "color_array.py",
+))
+
+# ═══════════════════════════════════════════════════════════════════
+# Variants
+# ═══════════════════════════════════════════════════════════════════
+
+def rebalance(themes: List[dict], black_levels: List[float],
+              lift_only: List[bool]) -> Tuple[ColorTable, np.ndarray]:
+    """Shift each dark theme's background ramp so its editor background sits at its black level.
+
+    Where lift_only is set, a background already above the level is left where it is.
+    """
+    table = ColorTable(themes)
+    lch = srgb_to_oklch(table.srgb)
+    Y = relative_luminance(table.srgb)
+    owner = np.array([t for t, _, _ in table.refs])
+    editor_bg = np.array([table.index[(t, "colors", "editor.background")] for t in range(len(themes))])
+    black = np.asarray(black_levels, dtype=np.float64)
+    moved = ~(np.asarray(lift_only, dtype=bool) & (lch[editor_bg, 0] >= black))
+    in_ramp = (np.array([section == "colors" for _, section, _ in table.refs])
+               & (lch[:, 0] <= lch[editor_bg, 0][owner] + RAMP_SPAN)
+               & moved[owner])
+    # The editor background goes to the black level; the rest of the ramp keeps its ratio to it
+    black_Y = relative_luminance(oklch_to_srgb(np.stack([black, np.zeros_like(black), np.zeros_like(black)], axis=-1)))
+    ratio = (Y + 0.05) / (Y[editor_bg][owner] + 0.05)
+    target = np.clip(ratio * (black_Y[owner] + 0.05) - 0.05, 0.0, 1.0)
+    ramp = np.flatnonzero(in_ramp)
+    srgb = table.srgb.copy()
+    if len(ramp):
+        srgb[ramp] = oklch_to_srgb(solve_lightness(lch[ramp], target[ramp]))
+    return table, srgb
+
+def build_variants(jobs: List[Tuple[str, str, dict]]) -> List[Tuple[str, dict, int, int]]:
+    """[(slug, profile, theme)] -> [(variant slug, theme, pairs repaired, pairs left)] in one batch."""
+    table, srgb = rebalance([theme for _, _, theme in jobs], [BLACK_LEVEL[profile] for _, profile, _ in jobs],
+                            [profile in LIFT_ONLY for _, profile, _ in jobs])
+    variants = table.with_srgb(srgb)
+    repaired, _, before, after = repair_corpus(variants)
+    results = []
+    for t, (slug, profile, _) in enumerate(jobs):
+        theme = repaired[t]
+        theme["name"] = f"{theme.get('name', slug)} ({PROFILE_NAMES[profile]})"
+        results.append((f"{slug}_{profile}", theme,
+                        sum(1 for f in before if f[0] == t) - sum(1 for f in after if f[0] == t),
+                        sum(1 for f in after if f[0] == t)))
+    return results
+
+def darkened(source: dict, variant: dict) -> bool:
+    """True if the variant's editor background is darker than the source's."""
+    Y = relative_luminance(hex_to_srgb([source["colors"]["editor.background"], variant["colors"]["editor.background"]]))
+    return bool(Y[1] < Y[0])
+
+def variant_hash(source_text: str, profile: str, toolchain: str) -> str:
+    return hashlib.sha256(f"{toolchain}\0{profile}\0{source_text}".encode("utf-8")).hexdigest()[:32]
+
+def toolchain_hash() -> str:
+    digest = hashlib.sha256()
+    for path in VARIANT_TOOLCHAIN:
+        digest.update(path.name.encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+# ═══════════════════════════════════════════════════════════════════
+# CLI
+# ═══════════════════════════════════════════════════════════════════
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Derive OLED/LCD black-balance variants of every dark theme")
+    parser.add_argument("--output", "-o", type=Path, default=DEFAULT_OUTPUT, help=f"Output root (default: {DEFAULT_OUTPUT})")
+    parser.add_argument("--bundle", metavar="PATH", help="Write every artifact into one .tar[.gz|.xz|.bz2] or .zip (no cache)")
+    parser.add_argument("--monitor", choices=PROFILES, action="append", help="Only these monitor profiles (default: all)")
+    parser.add_argument("--only", nargs="+", metavar="SLUG", help="Only these source themes")
+    parser.add_argument("--force", action="store_true", help="Ignore the cache and rebuild every variant")
+    args = parser.parse_args(argv)
+    if args.bundle:
+        try:
+            bundle_kind(args.bundle)
+        except ValueError as e:
+            parser.error(str(e))
+
+    start = time.perf_counter()
+    sources = {f.stem: f.read_text(encoding="utf-8") for f in sorted(VSCODE_DIR.glob("*.json"))}
+    if args.only:
+        unknown = sorted(set(args.only) - sources.keys())
+        if unknown:
+            parser.error(f"unknown theme(s): {', '.join(unknown)}")
+        sources = {slug: sources[slug] for slug in args.only}
+    themes = {slug: json.loads(text) for slug, text in sources.items()}
+    dark = [slug for slug, theme in themes.items()
+            if theme.get("type", "dark") == "dark" and "editor.background" in theme.get("colors", {})]
+    profiles = args.monitor or list(PROFILES)
+
+    toolchain = toolchain_hash()
+    digests = {(slug, p): variant_hash(sources[slug], p, toolchain) for slug in dark for p in profiles}
+    cache = {} if (args.force or args.bundle) else load_cache(args.output)
+    dirty = [(slug, p, themes[slug]) for slug, p in digests
+             if args.bundle or args.force or not is_fresh(args.output, cache.get(f"{slug}_{p}"), digests[(slug, p)])]
+
+    written, left, darker = 0, 0, 0
+    with open_sink(args.output, args.bundle) as sink:
+        for (slug, profile, source), (variant, theme, fixed, unresolved) in zip(dirty, build_variants(dirty) if dirty else []):
+            if profile in LIFT_ONLY and darkened(source, theme):
+                # An LCD variant must never be darker than its source; leave it unbuilt
+                print(f"  {variant}: background {source['colors']['editor.background']} -> "
+                      f"{theme['colors']['editor.background']} is darker than the source, skipped")
+                darker += 1
+                continue
+            files = theme_outputs(variant, theme)
+            for relpath, text in files.items():
+                sink.write(relpath, text)
+            written += len(files)
+            left += unresolved
+            cache[variant] = {"hash": digests[(slug, profile)], "files": sorted(files)}
+            note = f", {fixed} pairs re-solved" if fixed else ""
+            note += f", {unresolved} pairs unresolved" if unresolved else ""
+            print(f"  {variant}: built{note}")
+
+    if not args.bundle:
+        if not (args.only or args.monitor):
+            # Themes removed (or turned light) since the last build: drop their variants
+            current = {f"{slug}_{p}" for slug, p in digests}
+            for variant in sorted(set(cache) - current):
+                for relpath in cache.pop(variant).get("files", []):
+                    (args.output / relpath).unlink(missing_ok=True)
+                print(f"  {variant}: removed")
+        args.output.mkdir(parents=True, exist_ok=True)
+        save_cache(args.output, cache)
+
+    elapsed = time.perf_counter() - start
+    skipped = len(themes) - len(dark)
+    print(f"\n{len(dirty)} of {len(digests)} variants built ({len(dark)} dark themes x {len(profiles)} profiles, "
+          f"{skipped} light themes skipped), {written} files -> {args.bundle or args.output} in {elapsed:.2f}s")
+    if darker:
+        print(f"{darker} LCD variants darker than their source")
+    return 1 if left or darker else 0
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,432 @@
+#!/usr/bin/env python3
+"""
+Prism Neovim Highlight Compiler
+
+Derives the Base16 palette, syntax/ui roles, terminal colors and every
+highlight group that neovim/lua/prism/highlights.lua would set, once, at build
+time. sync_themes.py writes the result per preset to
+neovim/lua/prism/compiled/<slug>.lua so `:Prism <name>` only loops over
+nvim_set_hl instead of doing color math in Lua.
+
+The group definitions below mirror highlights.lua line for line; keep the two
+in sync. User-configurable pieces (styles, transparent) are applied by the
+plugin on top of the compiled table.
+
+Usage:
+    from nvim_highlights import compile_preset, to_lua
+    lua = to_lua(compile_preset(slug, colors, mode="dark"))
+
+    python nvim_highlights.py vscode/themes/arctic.json
+"""
+
+import json
+import math
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+from verified_generator import (
+    OKLCH, adjust_lightness_for_contrast, contrast_ratio, hex_to_srgb,
+    oklch_to_srgb, srgb_to_hex, srgb_to_oklch,
+)
+
+Spec = Dict[str, object]
+Groups = Dict[str, Spec]
+
+# Attribute order in the emitted tables (nvim_set_hl keys)
+ATTR_ORDER = ("fg", "bg", "sp", "bold", "italic", "underline", "undercurl", "link")
+
+TERMINAL_KEYS = (
+    "ansiBlack", "ansiRed", "ansiGreen", "ansiYellow",
+    "ansiBlue", "ansiMagenta", "ansiCyan", "ansiWhite",
+    "ansiBrightBlack", "ansiBrightRed", "ansiBrightGreen", "ansiBrightYellow",
+    "ansiBrightBlue", "ansiBrightMagenta", "ansiBrightCyan", "ansiBrightWhite",
+)
+
+# ═══════════════════════════════════════════════════════════════════
+# Color helpers
+# ═══════════════════════════════════════════════════════════════════
+
+def blend(fg: str, bg: str, alpha: float) -> str:
+    """Same integer arithmetic as blend() in highlights.lua."""
+    fr, fg_, fb = int(fg[1:3], 16), int(fg[3:5], 16), int(fg[5:7], 16)
+    br, bg_, bb = int(bg[1:3], 16), int(bg[3:5], 16), int(bg[5:7], 16)
+    r = math.floor(fr * alpha + br * (1 - alpha))
+    g = math.floor(fg_ * alpha + bg_ * (1 - alpha))
+    b = math.floor(fb * alpha + bb * (1 - alpha))
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+def shift_lightness(hex_color: str, delta: float) -> str:
+    """Move a color along OKLCH lightness, keeping its hue and chroma."""
+    lch = srgb_to_oklch(hex_to_srgb(hex_color))
+    return srgb_to_hex(oklch_to_srgb(OKLCH(min(1.0, max(0.0, lch.L + delta)), lch.C, lch.H)))
+
+def mix_oklch(a: str, b: str, t: float) -> str:
+    """Interpolate lightness and chroma in OKLCH, keeping the hue of a."""
+    la = srgb_to_oklch(hex_to_srgb(a))
+    lb = srgb_to_oklch(hex_to_srgb(b))
+    return srgb_to_hex(oklch_to_srgb(OKLCH(la.L + (lb.L - la.L) * t, la.C + (lb.C - la.C) * t, la.H)))
+
+def ensure_contrast(hex_color: str, bg: str, target: float, lighter: bool) -> str:
+    """Nudge lightness until the color reaches target contrast against bg."""
+    bg_rgb = hex_to_srgb(bg)
+    if contrast_ratio(hex_to_srgb(hex_color), bg_rgb) >= target:
+        return hex_color
+    adjusted = adjust_lightness_for_contrast(srgb_to_oklch(hex_to_srgb(hex_color)), bg_rgb, target, lighter)
+    return srgb_to_hex(oklch_to_srgb(adjusted)) if adjusted else hex_color
+
+# ═══════════════════════════════════════════════════════════════════
+# Preset derivation
+# ═══════════════════════════════════════════════════════════════════
+
+def derive_palette(colors: dict, mode: str = "dark") -> Dict[str, str]:
+    """Base16 palette from sync_themes.extract_colors output.
+
+    Authored theme colors are used as-is; only the surface and foreground
+    ramps (base01-02, base04, base06-07) are derived in OKLCH.
+    """
+    dark = mode != "light"
+    step = 1 if dark else -1
+    bg, fg = colors["bg"].lower(), colors["fg"].lower()
+    hl = colors.get("hl", "").lower()
+    base01 = hl if hl and hl != bg else shift_lightness(bg, 0.04 * step)
+    base04 = ensure_contrast(mix_oklch(colors["comment"], fg, 0.5), base01, 3.0, lighter=dark)
+    return {
+        "base00": bg,
+        "base01": base01,
+        "base02": shift_lightness(bg, 0.09 * step),
+        "base03": colors["comment"],
+        "base04": base04,
+        "base05": fg,
+        "base06": shift_lightness(fg, 0.05 * step),
+        "base07": shift_lightness(fg, 0.10 * step),
+        "base08": colors["ansiRed"],
+        "base09": colors["constant"],
+        "base0A": colors["accent"],
+        "base0B": colors["string"],
+        "base0C": colors["ansiCyan"],
+        "base0D": colors["function"],
+        "base0E": colors["keyword"],
+        "base0F": colors["ansiBrightBlack"],
+    }
+
+def make_preset(name: str, mode: str, palette: Dict[str, str], colors: dict) -> dict:
+    """Python twin of make_preset() in presets.lua, filled with the theme's token colors."""
+    p = palette
+    return {
+        "name": name,
+        "mode": mode,
+        "palette": p,
+        "syntax": {
+            "comment": colors["comment"],
+            "string": colors["string"],
+            "number": colors["constant"],
+            "keyword": colors["keyword"],
+            "func": colors["function"],
+            "type": colors["type"],
+            "variable": colors["variable"],
+            "property": colors["variable"],
+            "operator": p["base04"],
+            "punctuation": p["base04"],
+            "tag": colors["tag"],
+            "attribute": colors["attribute"],
+        },
+        "ui": {
+            "bg": p["base00"],
+            "fg": p["base05"],
+            "accent": p["base0A"],
+            "error": p["base08"],
+            "warning": p["base09"],
+            "success": p["base0B"],
+            "info": p["base0D"],
+        },
+        "terminal": [colors[k] for k in TERMINAL_KEYS],
+    }
+
+# ═══════════════════════════════════════════════════════════════════
+# Highlight groups (mirrors highlights.lua)
+# ═══════════════════════════════════════════════════════════════════
+
+def editor_groups(preset: dict) -> Groups:
+    """Editor and syntax groups. Styled groups carry no style; the plugin adds config.styles."""
+    p, s = preset["palette"], preset["syntax"]
+    return {
+        "Normal": {"fg": p["base05"], "bg": p["base00"]},
+        "NormalFloat": {"fg": p["base05"], "bg": p["base01"]},
+        "NormalNC": {"fg": p["base05"], "bg": p["base00"]},
+        "Cursor": {"fg": p["base00"], "bg": p["base0A"]},
+        "CursorLine": {"bg": blend(p["base05"], p["base00"], 0.05)},
+        "CursorColumn": {"link": "CursorLine"},
+        "ColorColumn": {"bg": blend(p["base05"], p["base00"], 0.03)},
+        "LineNr": {"fg": p["base03"]},
+        "CursorLineNr": {"fg": p["base05"], "bold": True},
+        "SignColumn": {"fg": p["base03"], "bg": p["base00"]},
+        "VertSplit": {"fg": p["base02"]},
+        "WinSeparator": {"fg": p["base02"]},
+        "Folded": {"fg": p["base03"], "bg": p["base01"]},
+        "FoldColumn": {"fg": p["base03"]},
+        "NonText": {"fg": p["base03"]},
+        "SpecialKey": {"fg": p["base03"]},
+        "Whitespace": {"fg": blend(p["base03"], p["base00"], 0.5)},
+        "MatchParen": {"fg": p["base0A"], "bold": True},
+
+        "Visual": {"bg": blend(p["base0A"], p["base00"], 0.3)},
+        "VisualNOS": {"link": "Visual"},
+        "Search": {"fg": p["base00"], "bg": p["base0A"]},
+        "IncSearch": {"fg": p["base00"], "bg": p["base09"]},
+        "CurSearch": {"link": "IncSearch"},
+        "Substitute": {"fg": p["base00"], "bg": p["base08"]},
+
+        "Pmenu": {"fg": p["base05"], "bg": p["base01"]},
+        "PmenuSel": {"fg": p["base05"], "bg": blend(p["base0A"], p["base00"], 0.2)},
+        "PmenuSbar": {"bg": p["base02"]},
+        "PmenuThumb": {"bg": p["base04"]},
+
+        "ErrorMsg": {"fg": p["base08"]},
+        "WarningMsg": {"fg": p["base09"]},
+        "ModeMsg": {"fg": p["base05"], "bold": True},
+        "MoreMsg": {"fg": p["base0D"]},
+        "Question": {"fg": p["base0D"]},
+
+        "TabLine": {"fg": p["base04"], "bg": p["base01"]},
+        "TabLineFill": {"bg": p["base00"]},
+        "TabLineSel": {"fg": p["base05"], "bg": p["base00"], "bold": True},
+        "StatusLine": {"fg": p["base05"], "bg": p["base01"]},
+        "StatusLineNC": {"fg": p["base04"], "bg": p["base01"]},
+
+        "DiffAdd": {"bg": blend(p["base0B"], p["base00"], 0.15)},
+        "DiffChange": {"bg": blend(p["base09"], p["base00"], 0.15)},
+        "DiffDelete": {"fg": p["base08"], "bg": blend(p["base08"], p["base00"], 0.15)},
+        "DiffText": {"bg": blend(p["base09"], p["base00"], 0.3)},
+
+        "SpellBad": {"undercurl": True, "sp": p["base08"]},
+        "SpellCap": {"undercurl": True, "sp": p["base09"]},
+        "SpellLocal": {"undercurl": True, "sp": p["base0D"]},
+        "SpellRare": {"undercurl": True, "sp": p["base0E"]},
+
+        "Comment": {"fg": s["comment"]},
+        "Constant": {"fg": p["base09"]},
+        "String": {"fg": s["string"]},
+        "Character": {"fg": s["string"]},
+        "Number": {"fg": s["number"]},
+        "Boolean": {"fg": s["number"]},
+        "Float": {"fg": s["number"]},
+
+        "Identifier": {"fg": s["variable"]},
+        "Function": {"fg": s["func"]},
+
+        "Statement": {"fg": s["keyword"]},
+        "Conditional": {"fg": s["keyword"]},
+        "Repeat": {"fg": s["keyword"]},
+        "Label": {"fg": s["keyword"]},
+        "Operator": {"fg": s["operator"]},
+        "Keyword": {"fg": s["keyword"]},
+        "Exception": {"fg": s["keyword"]},
+
+        "PreProc": {"fg": s["keyword"]},
+        "Include": {"fg": s["keyword"]},
+        "Define": {"fg": s["keyword"]},
+        "Macro": {"fg": s["keyword"]},
+        "PreCondit": {"fg": s["keyword"]},
+
+        "Type": {"fg": s["type"]},
+        "StorageClass": {"fg": s["keyword"]},
+        "Structure": {"fg": s["type"]},
+        "Typedef": {"fg": s["type"]},
+
+        "Special": {"fg": p["base0C"]},
+        "SpecialChar": {"fg": p["base0C"]},
+        "Tag": {"fg": s["tag"]},
+        "Delimiter": {"fg": s["punctuation"]},
+        "SpecialComment": {"fg": s["comment"], "italic": True},
+        "Debug": {"fg": p["base09"]},
+
+        "Underlined": {"underline": True},
+        "Ignore": {"fg": p["base03"]},
+        "Error": {"fg": p["base08"]},
+        "Todo": {"fg": p["base00"], "bg": p["base0A"], "bold": True},
+    }
+
+def integration_groups(preset: dict) -> Dict[str, Groups]:
+    """Groups per config.integrations key."""
+    p, s, u = preset["palette"], preset["syntax"], preset["ui"]
+    bg = p["base00"]
+    return {
+        "treesitter": {
+            "@variable": {"fg": s["variable"]},
+            "@variable.builtin": {"fg": p["base0E"]},
+            "@variable.parameter": {"fg": s["variable"], "italic": True},
+            "@variable.member": {"fg": s["property"]},
+            "@constant": {"fg": p["base09"]},
+            "@constant.builtin": {"fg": p["base09"]},
+            "@module": {"fg": p["base05"]},
+            "@label": {"fg": s["keyword"]},
+            "@type": {"fg": s["type"]},
+            "@type.builtin": {"fg": s["type"]},
+            "@attribute": {"fg": s["attribute"]},
+            "@property": {"fg": s["property"]},
+            "@function": {"fg": s["func"]},
+            "@function.builtin": {"fg": s["func"]},
+            "@function.call": {"fg": s["func"]},
+            "@function.method": {"fg": s["func"]},
+            "@constructor": {"fg": s["type"]},
+            "@operator": {"fg": s["operator"]},
+            "@keyword": {"fg": s["keyword"]},
+            "@keyword.conditional": {"fg": s["keyword"]},
+            "@keyword.function": {"fg": s["keyword"]},
+            "@keyword.operator": {"fg": s["keyword"]},
+            "@keyword.return": {"fg": s["keyword"]},
+            "@punctuation.bracket": {"fg": s["punctuation"]},
+            "@punctuation.delimiter": {"fg": s["punctuation"]},
+            "@punctuation.special": {"fg": p["base0C"]},
+            "@string": {"fg": s["string"]},
+            "@string.escape": {"fg": p["base0C"]},
+            "@string.regexp": {"fg": p["base0C"]},
+            "@character": {"fg": s["string"]},
+            "@boolean": {"fg": s["number"]},
+            "@number": {"fg": s["number"]},
+            "@comment": {"fg": s["comment"], "italic": True},
+            "@comment.todo": {"fg": bg, "bg": p["base0A"], "bold": True},
+            "@comment.error": {"fg": p["base08"], "bold": True},
+            "@comment.warning": {"fg": p["base09"], "bold": True},
+            "@comment.note": {"fg": p["base0D"], "bold": True},
+            "@markup.heading": {"fg": s["keyword"], "bold": True},
+            "@markup.italic": {"italic": True},
+            "@markup.strong": {"bold": True},
+            "@markup.raw": {"fg": s["string"]},
+            "@markup.link": {"fg": p["base0D"], "underline": True},
+            "@tag": {"fg": s["tag"]},
+            "@tag.attribute": {"fg": s["attribute"]},
+            "@tag.delimiter": {"fg": s["punctuation"]},
+        },
+        "native_lsp": {
+            "DiagnosticError": {"fg": u["error"]},
+            "DiagnosticWarn": {"fg": u["warning"]},
+            "DiagnosticInfo": {"fg": u["info"]},
+            "DiagnosticHint": {"fg": u["accent"]},
+            "DiagnosticUnderlineError": {"undercurl": True, "sp": u["error"]},
+            "DiagnosticUnderlineWarn": {"undercurl": True, "sp": u["warning"]},
+            "DiagnosticUnderlineInfo": {"undercurl": True, "sp": u["info"]},
+            "DiagnosticUnderlineHint": {"undercurl": True, "sp": u["accent"]},
+            "DiagnosticVirtualTextError": {"fg": u["error"], "bg": blend(u["error"], bg, 0.1)},
+            "DiagnosticVirtualTextWarn": {"fg": u["warning"], "bg": blend(u["warning"], bg, 0.1)},
+            "DiagnosticVirtualTextInfo": {"fg": u["info"], "bg": blend(u["info"], bg, 0.1)},
+            "DiagnosticVirtualTextHint": {"fg": u["accent"], "bg": blend(u["accent"], bg, 0.1)},
+            "LspReferenceText": {"bg": blend(p["base05"], bg, 0.1)},
+            "LspReferenceRead": {"bg": blend(p["base05"], bg, 0.1)},
+            "LspReferenceWrite": {"bg": blend(p["base05"], bg, 0.15)},
+            "LspSignatureActiveParameter": {"fg": u["accent"], "bold": True},
+        },
+        "gitsigns": {
+            "GitSignsAdd": {"fg": u["success"]},
+            "GitSignsChange": {"fg": u["warning"]},
+            "GitSignsDelete": {"fg": u["error"]},
+        },
+        "telescope": {
+            "TelescopeNormal": {"fg": p["base05"], "bg": bg},
+            "TelescopeBorder": {"fg": p["base02"], "bg": bg},
+            "TelescopePromptTitle": {"fg": bg, "bg": u["accent"], "bold": True},
+            "TelescopePreviewTitle": {"fg": bg, "bg": u["success"], "bold": True},
+            "TelescopeResultsTitle": {"fg": bg, "bg": u["info"], "bold": True},
+            "TelescopeSelection": {"bg": blend(u["accent"], bg, 0.2)},
+            "TelescopeMatching": {"fg": u["accent"], "bold": True},
+        },
+        "cmp": {
+            "CmpItemAbbrMatch": {"fg": u["accent"], "bold": True},
+            "CmpItemKindVariable": {"fg": s["variable"]},
+            "CmpItemKindFunction": {"fg": s["func"]},
+            "CmpItemKindKeyword": {"fg": s["keyword"]},
+            "CmpItemKindClass": {"fg": s["type"]},
+        },
+        "indent_blankline": {
+            "IblIndent": {"fg": p["base02"]},
+            "IblScope": {"fg": p["base03"]},
+        },
+        "lazy": {
+            "LazyH1": {"fg": bg, "bg": u["accent"], "bold": True},
+            "LazyButton": {"fg": p["base05"], "bg": p["base02"]},
+            "LazyButtonActive": {"fg": bg, "bg": u["accent"]},
+        },
+        "notify": {
+            "NotifyERRORBorder": {"fg": u["error"]},
+            "NotifyWARNBorder": {"fg": u["warning"]},
+            "NotifyINFOBorder": {"fg": u["info"]},
+            "NotifyDEBUGBorder": {"fg": p["base03"]},
+            "NotifyTRACEBorder": {"fg": p["base0E"]},
+        },
+    }
+
+def compile_preset(slug: str, colors: dict, mode: str = "dark") -> dict:
+    """Everything the plugin needs to apply a preset without further color math."""
+    mode = "light" if mode == "light" else "dark"
+    preset = make_preset(colors["name"], mode, derive_palette(colors, mode), colors)
+    preset["slug"] = slug
+    preset["groups"] = editor_groups(preset)
+    preset["integrations"] = integration_groups(preset)
+    return preset
+
+# ═══════════════════════════════════════════════════════════════════
+# Lua emission
+# ═══════════════════════════════════════════════════════════════════
+
+def _lua_key(key: str) -> str:
+    return key if key.isidentifier() else f'["{key}"]'
+
+def _lua_value(value) -> str:
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    return f'"{value}"'
+
+def _lua_spec(spec: Spec) -> str:
+    return "{ " + ", ".join(f"{k} = {_lua_value(spec[k])}" for k in ATTR_ORDER if k in spec) + " }"
+
+def _lua_groups(groups: Groups, indent: str) -> List[str]:
+    return [f"{indent}{_lua_key(name)} = {_lua_spec(spec)}," for name, spec in groups.items()]
+
+def to_lua(compiled: dict) -> str:
+    """Render a compiled preset as a Lua module returning one flat table."""
+    lines = [
+        f"-- PRISM compiled highlights: {compiled['name']}",
+        f"-- Auto-generated by sync_themes.py from vscode/themes/{compiled['slug']}.json - DO NOT EDIT",
+        "",
+        "return {",
+        f'  name = "{compiled["name"]}",',
+        f'  mode = "{compiled["mode"]}",',
+        "  palette = {",
+    ]
+    lines += [f'    {k} = "{v}",' for k, v in compiled["palette"].items()]
+    lines.append("  },")
+    lines.append("  terminal = {")
+    terminal = compiled["terminal"]
+    for i in range(0, len(terminal), 4):
+        lines.append("    " + " ".join(f'"{c}",' for c in terminal[i:i + 4]))
+    lines.append("  },")
+    lines.append("  groups = {")
+    lines += _lua_groups(compiled["groups"], "    ")
+    lines.append("  },")
+    lines.append("  integrations = {")
+    for name, groups in compiled["integrations"].items():
+        lines.append(f"    {name} = {{")
+        lines += _lua_groups(groups, "      ")
+        lines.append("    },")
+    lines.append("  },")
+    lines.append("}")
+    lines.append("")
+    return "\n".join(lines)
+
+def main():
+    if len(sys.argv) != 2:
+        print("Usage: python nvim_highlights.py <vscode-theme.json>")
+        return 1
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+    from sync_themes import extract_colors
+
+    path = Path(sys.argv[1])
+    data = json.loads(path.read_text(encoding="utf-8"))
+    print(to_lua(compile_preset(path.stem, extract_colors(data), data.get("type", "dark"))), end="")
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
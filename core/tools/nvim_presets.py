@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Prism Neovim Preset Modules
+
+Lays out Neovim presets as one Lua module per preset plus a small index:
+
+    neovim/lua/prism/presets/init.lua      names list + lazy loader
+    neovim/lua/prism/presets/<name>.lua    one preset table each
+
+`require("prism.presets")` only loads the index; `presets[name]` requires the
+matching module on first access, so startup parses one preset instead of 64.
+Both sync_themes.py and scripts/generate_neovim_presets.py emit this layout
+and run verify_modules() before reporting success.
+
+Usage:
+    from nvim_presets import preset_modules, verify_modules
+    files = preset_modules({slug: lua_table_source, ...}, "-- Auto-generated ... - DO NOT EDIT")
+    problems = verify_modules(files, on_disk=repo_root / PRESETS_DIR)
+
+    python nvim_presets.py neovim/lua/prism/presets
+"""
+
+import re
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+PRESETS_DIR = Path("neovim") / "lua" / "prism" / "presets"
+INDEX_FILE = "init.lua"
+GENERATED_MARK = "-- Auto-generated"
+
+# Keys the index defines itself; a preset with one of these names would be shadowed
+RESERVED = frozenset({"names", "make_preset", "generate"})
+
+NAME_RE = re.compile(r"^[a-z0-9_]+$")
+INDEX_NAME_RE = re.compile(r'^  "([^"]+)",$', re.M)
+
+INDEX_TEMPLATE = '''-- PRISM Theme Presets for Neovim
+{header}
+--
+-- Index only: each preset lives in prism.presets.<name> and is required on
+-- first access (presets[name]), so loading the plugin parses one preset.
+
+local M = {{}}
+
+-- Every preset name, sorted (used by :PrismList and :Prism completion)
+M.names = {{
+{names}
+}}
+
+--- Build the full preset structure from a Base16 palette
+function M.make_preset(name, mode, palette)
+  return {{
+    name = name,
+    mode = mode,
+    palette = palette,
+    syntax = {{
+      comment = palette.base03,
+      string = palette.base0B,
+      number = palette.base09,
+      keyword = palette.base0E,
+      func = palette.base0D,
+      type = palette.base0A,
+      variable = palette.base05,
+      property = palette.base05,
+      operator = palette.base04,
+      punctuation = palette.base04,
+      tag = palette.base08,
+      attribute = palette.base09,
+    }},
+    ui = {{
+      bg = palette.base00,
+      fg = palette.base05,
+      accent = palette.base0A,
+      error = palette.base08,
+      warning = palette.base09,
+      success = palette.base0B,
+      info = palette.base0D,
+    }},
+  }}
+end
+
+--- Generate a custom preset dynamically
+--- @param name string Preset name
+--- @param config table Configuration for colors.generate_palette
+--- @return table Preset structure
+function M.generate(name, config)
+  local colors = require("prism.colors")
+  return M.make_preset(name, config.theme or "dark", colors.generate_palette(config))
+end
+
+return setmetatable(M, {{
+  __index = function(t, name)
+    if type(name) ~= "string" then
+      return nil
+    end
+    local ok, preset = pcall(require, "prism.presets." .. name)
+    if ok then
+      rawset(t, name, preset)
+      return preset
+    end
+  end,
+}})
+'''
+
+MODULE_TEMPLATE = '''-- PRISM preset: {name}
+{header}
+
+return {body}
+'''
+
+# ═══════════════════════════════════════════════════════════════════
+# Emission
+# ═══════════════════════════════════════════════════════════════════
+
+def lua_index(names: Iterable[str], header: str) -> str:
+    """The index module: sorted names plus the lazy loader."""
+    listing = "\n".join(f'  "{name}",' for name in sorted(names))
+    return INDEX_TEMPLATE.format(header=header, names=listing)
+
+def preset_modules(bodies: Dict[str, str], header: str) -> Dict[str, str]:
+    """Map of filename -> Lua source for the index and every preset.
+
+    bodies maps preset name to a Lua expression (usually a table constructor).
+    header is a comment line such as "-- Auto-generated from vscode/themes - DO NOT EDIT".
+    """
+    files = {INDEX_FILE: lua_index(bodies, header)}
+    for name in sorted(bodies):
+        files[f"{name}.lua"] = MODULE_TEMPLATE.format(name=name, header=header, body=bodies[name])
+    return files
+
+# ═══════════════════════════════════════════════════════════════════
+# Verification
+# ═══════════════════════════════════════════════════════════════════
+
+def index_names(index_source: str) -> List[str]:
+    return INDEX_NAME_RE.findall(index_source)
+
+def verify_modules(files: Dict[str, str], on_disk: Optional[Path] = None) -> List[str]:
+    """Check that the index and the preset modules agree. Returns a list of problems.
+
+    With on_disk, generated modules already in that directory that the index
+    no longer lists are reported too (they would still load by name).
+    """
+    problems = []
+    index = files.get(INDEX_FILE)
+    if index is None:
+        return [f"missing {INDEX_FILE}"]
+
+    names = index_names(index)
+    modules = {f[:-4] for f in files if f.endswith(".lua") and f != INDEX_FILE}
+    if names != sorted(set(names)):
+        problems.append("index names are not sorted and unique")
+    for name in sorted(set(names) - modules):
+        problems.append(f"index lists '{name}' but {name}.lua was not generated")
+    for name in sorted(modules - set(names)):
+        problems.append(f"{name}.lua is not listed in the index")
+    for name in sorted(modules):
+        if not NAME_RE.match(name) or name in RESERVED:
+            problems.append(f"'{name}' is not a valid preset module name")
+        if "\nreturn " not in files[f"{name}.lua"]:
+            problems.append(f"{name}.lua does not return a table")
+
+    if on_disk is not None and on_disk.is_dir():
+        for path in sorted(on_disk.glob("*.lua")):
+            if path.name in files:
+                continue
+            head = path.read_text(encoding="utf-8", errors="replace")[:512]
+            if GENERATED_MARK in head:
+                problems.append(f"stale generated module {path} (not in the index); delete it")
+    return problems
+
+def verify_directory(directory: Path) -> List[str]:
+    """Verify an emitted presets directory as written on disk."""
+    files = {p.name: p.read_text(encoding="utf-8") for p in Path(directory).glob("*.lua")}
+    return verify_modules(files)
+
+if __name__ == "__main__":
+    target = Path(sys.argv[1]) if len(sys.argv) > 1 else PRESETS_DIR
+    issues = verify_directory(target)
+    for issue in issues:
+        print(f"  ✗ {issue}")
+    if not issues:
+        print(f"✓ {target}: index and {len(list(target.glob('*.lua'))) - 1} preset modules are consistent")
+    exit(1 if issues else 0)
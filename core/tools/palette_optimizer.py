@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Prism Palette Optimizer - constrained accent placement for verified_generator
+
+verified_generator places base08-base0F at fixed harmony offsets and then
+repairs contrast one colour at a time. This module searches lightness, chroma
+and hue of all eight accents jointly:
+
+    maximize   min pairwise ΔE_OK between the accents (syntax roles)
+    subject to contrast >= min_contrast against base00, base01 and base02
+               every accent inside the sRGB gamut
+               base0A/base0F on the hero hue, every other hue within
+               hue_window of its harmony slot and never past the midpoint to
+               a neighbouring slot, chroma within 0.5x-1.5x of the harmony
+               chroma (roles keep their meaning and hue order)
+
+The search is differential evolution (current-to-best/1/bin) with the whole
+population evaluated as NumPy arrays; constraint handling is feasibility-first
+(any feasible palette beats any infeasible one). The harmony palette seeds the
+population, so the result is never worse than the fixed offsets.
+
+Usage:
+    from palette_optimizer import optimize_accents, optimize_collection
+    result = optimize_accents(config, ramp)      # OptimizeResult
+    results = optimize_collection(configs)       # one process per core
+
+    python palette_optimizer.py --hue 211 --mode dark
+    python palette_optimizer.py --sweep 36       # 36 hues x dark/light in parallel
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from color_array import LUMA, oklab_to_linear, oklch_to_oklab
+from verified_generator import (
+    HARMONY, OKLCH, SRGB, ThemeConfig, contrast_ratio, generate_accent_colors,
+    generate_background_ramp, oklch_to_srgb, relative_luminance, srgb_to_hex, srgb_to_oklab, srgb_to_oklch,
+)
+
+POPULATION = 64
+GENERATIONS = 300
+PATIENCE = 40           # generations without improvement before stopping
+MUTATION = 0.6          # F
+CROSSOVER = 0.9         # CR
+MIN_CONTRAST = 3.0      # WCAG AA-large, as verified_generator requires of accents
+CONTRAST_MARGIN = 0.05  # headroom so 8-bit rounding cannot drop below the minimum
+HUE_WINDOW = 30.0
+HUE_SEPARATION = 2.0    # degrees kept between the windows of neighbouring harmony slots
+
+ACCENT_LIGHTNESS = {"dark": (0.55, 0.92), "light": (0.30, 0.62)}
+
+# ═══════════════════════════════════════════════════════════════════
+# Vectorized colour math
+# ═══════════════════════════════════════════════════════════════════
+
+def min_pairwise_distance(points: np.ndarray) -> np.ndarray:
+    """(P, N, 3) -> (P,) smallest Euclidean distance between any two of the N points"""
+    diff = points[:, :, None, :] - points[:, None, :, :]
+    dist = np.sqrt(np.einsum("pijk,pijk->pij", diff, diff))
+    iu, ju = np.triu_indices(points.shape[1], 1)
+    return dist[:, iu, ju].min(axis=1)
+
+# ═══════════════════════════════════════════════════════════════════
+# Problem
+# ═══════════════════════════════════════════════════════════════════
+
+@dataclass
+class OptimizeResult:
+    accents: Tuple[SRGB, ...]   # base08-base0F
+    oklch: Tuple[OKLCH, ...]
+    min_delta_e: float          # after 8-bit quantization
+    baseline_delta_e: float     # harmony palette, same measure
+    min_contrast: float         # worst accent vs base00-base02
+    feasible: bool
+    generations: int
+    seconds: float
+
+    def hex(self) -> List[str]:
+        return [srgb_to_hex(c) for c in self.accents]
+
+def slot_windows(hue_window: float = HUE_WINDOW) -> List[Tuple[float, float]]:
+    """(below, above) hue freedom per harmony slot.
+
+    Each side is capped at half the gap to the neighbouring slot (less
+    HUE_SEPARATION / 2), so e.g. base09 (+15) can never cross base0A (0) or
+    base08 (+30). The hero slot (base0A, and base0F which only desaturates it)
+    stays on the hero hue.
+    """
+    offsets = sorted({offset for offset, _ in HARMONY})
+    windows = []
+    for offset, _ in HARMONY:
+        if offset == 0:
+            windows.append((0.0, 0.0))
+            continue
+        i = offsets.index(offset)
+        below = (offset - offsets[i - 1]) % 360
+        above = (offsets[(i + 1) % len(offsets)] - offset) % 360
+        windows.append((min(hue_window, (below - HUE_SEPARATION) / 2),
+                        min(hue_window, (above - HUE_SEPARATION) / 2)))
+    return windows
+
+def search_bounds(config: ThemeConfig, hue_window: float = HUE_WINDOW) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(lo, hi, harmony) arrays of shape (8, 3) in L, C, H(deg, unwrapped)."""
+    l_lo, l_hi = ACCENT_LIGHTNESS[config.mode]
+    harmony_l = 0.72 if config.mode == "dark" else 0.45
+    lo, hi, start = [], [], []
+    for (offset, sat_mult), (below, above) in zip(HARMONY, slot_windows(hue_window)):
+        chroma = config.hero_saturation * sat_mult * 0.15
+        hue = config.hero_hue + offset
+        lo.append((l_lo, 0.5 * chroma, hue - below))
+        hi.append((l_hi, 1.5 * chroma, hue + above))
+        start.append((harmony_l, chroma, hue))
+    return np.array(lo), np.array(hi), np.array(start)
+
+def hue_order_kept(config: ThemeConfig, oklch: Sequence[OKLCH]) -> bool:
+    """True if the accents sit around the hero hue in the same order as their harmony slots."""
+    placed = [((c.H - config.hero_hue - offset + 180) % 360 - 180) + offset
+              for c, (offset, _) in zip(oklch, HARMONY)]
+    pairs = [(offset, hue) for (offset, _), hue in zip(HARMONY, placed)]
+    return all(h1 < h2 for o1, h1 in pairs for o2, h2 in pairs if o1 < o2)
+
+class AccentProblem:
+    """Vectorized objective and constraint violation for a population of palettes."""
+
+    def __init__(self, config: ThemeConfig, ramp: Sequence[SRGB], min_contrast: float = MIN_CONTRAST):
+        self.bg_luminance = np.array([relative_luminance(c) for c in ramp])
+        self.target = min_contrast + CONTRAST_MARGIN
+
+    def evaluate(self, pop: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """pop (P, 8, 3) -> (min ΔE_OK, total violation), each (P,)"""
+        lab = oklch_to_oklab(pop)
+        linear = oklab_to_linear(lab)
+        gamut = (np.clip(-linear, 0, None) + np.clip(linear - 1, 0, None)).sum(axis=(1, 2))
+
+        y = np.clip(linear, 0, 1) @ LUMA                         # (P, 8)
+        yb = self.bg_luminance[None, None, :]                    # (1, 1, B)
+        hi = np.maximum(y[..., None], yb)
+        lo = np.minimum(y[..., None], yb)
+        ratio = (hi + 0.05) / (lo + 0.05)
+        shortfall = np.clip(self.target - ratio, 0, None).sum(axis=(1, 2))
+
+        return min_pairwise_distance(lab), 10.0 * gamut + shortfall
+
+def score(objective: np.ndarray, violation: np.ndarray) -> np.ndarray:
+    """Feasibility-first ranking: feasible palettes by ΔE, infeasible ones by violation."""
+    return np.where(violation > 0, -1.0 - violation, objective)
+
+# ═══════════════════════════════════════════════════════════════════
+# Search
+# ═══════════════════════════════════════════════════════════════════
+
+def quantized_delta_e(colors: Sequence[SRGB]) -> float:
+    """Min pairwise ΔE_OK of 8-bit colours, measured like the emitted theme."""
+    lab = np.array([srgb_to_oklab(c) for c in colors])
+    return float(min_pairwise_distance(lab[None])[0])
+
+def optimize_accents(config: ThemeConfig, ramp: Optional[Sequence[SRGB]] = None, seed: int = 0,
+                     population: int = POPULATION, generations: int = GENERATIONS,
+                     min_contrast: float = MIN_CONTRAST, hue_window: float = HUE_WINDOW) -> OptimizeResult:
+    """Jointly place base08-base0F; falls back to the harmony palette if no feasible one is found."""
+    start_time = time.perf_counter()
+    if ramp is None:
+        ramp = generate_background_ramp(config)[:3]
+    harmony = generate_accent_colors(replace(config, accents="harmony"), ramp[0])
+    problem = AccentProblem(config, ramp, min_contrast)
+    lo, hi, start = search_bounds(config, hue_window)
+    span = hi - lo
+
+    rng = np.random.default_rng(seed)
+    pop = lo + rng.random((population, *lo.shape)) * span
+    pop[0] = np.clip(start, lo, hi)
+    fitness = score(*problem.evaluate(pop))
+    best = int(fitness.argmax())
+    stale, generation = 0, 0
+    rows = np.arange(population)
+
+    for generation in range(1, generations + 1):
+        r1 = rng.integers(0, population, population)
+        r2 = (r1 + rng.integers(1, population, population)) % population
+        mutant = pop + MUTATION * (pop[best] - pop) + MUTATION * (pop[r1] - pop[r2])
+        cross = rng.random(pop.shape) < CROSSOVER
+        cross.reshape(population, -1)[rows, rng.integers(0, cross[0].size, population)] = True
+        trial = np.clip(np.where(cross, mutant, pop), lo, hi)
+
+        trial_fitness = score(*problem.evaluate(trial))
+        improved = trial_fitness >= fitness
+        pop[improved] = trial[improved]
+        fitness[improved] = trial_fitness[improved]
+
+        previous = fitness[best]
+        best = int(fitness.argmax())
+        stale = stale + 1 if fitness[best] <= previous + 1e-9 else 0
+        if stale >= PATIENCE:
+            break
+
+    oklch = tuple(OKLCH(float(L), float(C), float(H) % 360) for L, C, H in pop[best])
+    accents = tuple(oklch_to_srgb(c) for c in oklch)
+    worst = min(contrast_ratio(c, bg) for c in accents for bg in ramp)
+    feasible = bool(fitness[best] >= 0) and worst >= min_contrast and hue_order_kept(config, oklch)
+    if not feasible:
+        accents = harmony
+        oklch = tuple(srgb_to_oklch(c) for c in accents)
+        worst = min(contrast_ratio(c, bg) for c in accents for bg in ramp)
+
+    return OptimizeResult(
+        accents=accents,
+        oklch=oklch,
+        min_delta_e=quantized_delta_e(accents),
+        baseline_delta_e=quantized_delta_e(harmony),
+        min_contrast=worst,
+        feasible=feasible,
+        generations=generation,
+        seconds=time.perf_counter() - start_time,
+    )
+
+def _optimize_one(args) -> OptimizeResult:
+    config, kwargs = args
+    return optimize_accents(config, **kwargs)
+
+def optimize_collection(configs: Sequence[ThemeConfig], workers: Optional[int] = None, **kwargs) -> List[OptimizeResult]:
+    """optimize_accents for many themes, one worker process per core (workers=1 runs inline)."""
+    jobs = [(config, kwargs) for config in configs]
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(jobs) <= 1:
+        return [_optimize_one(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+        return list(pool.map(_optimize_one, jobs, chunksize=max(1, len(jobs) // (workers * 4))))
+
+def make_config(hue: float, mode: str, monitor: str = "oled", saturation: float = 1.0) -> ThemeConfig:
+    return ThemeConfig(hero_hue=hue, hero_saturation=saturation, base_hue=hue, base_saturation=0.1,
+                       mode=mode, monitor=monitor, name=f"Opt {hue:g} {mode}", accents="optimized")
+
+def main():
+    parser = argparse.ArgumentParser(description="Optimize verified_generator accents for ΔE_OK separation under WCAG limits")
+    parser.add_argument("--hue", type=float, default=211.0, help="Hero hue (0-360)")
+    parser.add_argument("--saturation", type=float, default=1.0, help="Hero saturation (0-1)")
+    parser.add_argument("--mode", choices=["dark", "light"], default="dark")
+    parser.add_argument("--monitor", choices=["oled", "lcd"], default="oled")
+    parser.add_argument("--sweep", type=int, default=0, metavar="N", help="Optimize N evenly spaced hues in both modes")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes for --sweep (default: all cores)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.sweep:
+        configs = [make_config(360.0 * i / args.sweep, mode, args.monitor, args.saturation)
+                   for i in range(args.sweep) for mode in ("dark", "light")]
+        start = time.perf_counter()
+        results = optimize_collection(configs, args.workers, seed=args.seed)
+        elapsed = time.perf_counter() - start
+        print(f"{'hue':>7} {'mode':<6} {'harmony ΔE':>11} {'optimized ΔE':>13} {'min CR':>7} {'ms':>7}")
+        for config, r in zip(configs, results):
+            flag = "" if r.feasible else "  (infeasible, kept harmony)"
+            print(f"{config.hero_hue:7.1f} {config.mode:<6} {r.baseline_delta_e:11.4f} "
+                  f"{r.min_delta_e:13.4f} {r.min_contrast:7.2f} {r.seconds * 1000:7.1f}{flag}")
+        gains = [r.min_delta_e / r.baseline_delta_e for r in results if r.baseline_delta_e > 0]
+        print(f"\n{len(results)} palettes in {elapsed:.2f}s; median ΔE gain x{float(np.median(gains)):.2f}")
+        return 0
+
+    config = make_config(args.hue, args.mode, args.monitor, args.saturation)
+    r = optimize_accents(config, seed=args.seed)
+    names = ["base08", "base09", "base0A", "base0B", "base0C", "base0D", "base0E", "base0F"]
+    for name, color, lch in zip(names, r.hex(), r.oklch):
+        print(f"  {name}  {color}  L={lch.L:.3f} C={lch.C:.3f} H={lch.H:6.1f}")
+    print(f"\n  min ΔE_OK {r.baseline_delta_e:.4f} (harmony) -> {r.min_delta_e:.4f}")
+    print(f"  worst contrast vs base00-base02: {r.min_contrast:.2f}:1")
+    print(f"  {r.generations} generations in {r.seconds * 1000:.1f} ms{'' if r.feasible else ' (infeasible; harmony kept)'}")
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
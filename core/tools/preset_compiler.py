@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+Prism Preset Compiler - core/themes/*presets.json -> complete themes
+
+The preset files describe themes declaratively (base/hero colour in OKLCH
+terms, mode, monitor, optionally an authored palette). This compiler resolves
+each preset through verified_generator, with gamut mapping instead of
+channel clamping, and overlays any authored colours. It then emits the VS Code
+theme plus every sync format and the precompiled Neovim table, in the same
+layout as the repo tree:
+
+    <out>/vscode/<slug>.json
+    <out>/emacs/themes/<slug>-theme.el, <out>/terminal/<fmt>/<slug>.*
+    <out>/neovim/lua/prism/compiled/<slug>.lua
+
+Each preset is keyed by a content hash of its JSON plus the toolchain
+sources, recorded in <out>/.prism-preset-cache.json. Only presets whose hash
+changed are rebuilt, in parallel worker processes, so editing one preset is a
+sub-second rebuild.
+
+Usage:
+    python preset_compiler.py                  # build/presets, incremental
+    python preset_compiler.py --force --jobs 8
+    python preset_compiler.py --only nero_marquina ocean_depths
+    python preset_compiler.py --bundle dist/presets.tar.gz
+    python preset_compiler.py --list
+    python preset_compiler.py --metrics build/metrics.jsonl
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import prism_metrics
+import prism_trace
+from format_writers import render
+from nvim_highlights import compile_preset, to_lua
+from prism_trace import span
+from theme_bundle import bundle_kind, open_sink
+from verified_generator import ThemeConfig, generate_palette, generate_vscode_theme, hex_to_srgb
+
+SCRIPT_DIR = Path(__file__).parent
+PRISM_ROOT = SCRIPT_DIR.parent.parent
+sys.path.insert(0, str(PRISM_ROOT))  # sync_themes (OUTPUTS, extract_colors) lives at the repo root
+
+from sync_themes import NVIM_COMPILED_DIR, OUTPUTS, extract_colors  # noqa: E402
+
+PRESETS_DIR = PRISM_ROOT / "core" / "themes"
+PRESET_FILES = ("presets.json", "luxury-presets.json", "luxe-presets.json")  # earlier files win name clashes
+DEFAULT_OUTPUT = PRISM_ROOT / "build" / "presets"
+CACHE_FILE = ".prism-preset-cache.json"
+
+# Sources whose changes invalidate every cached preset
+TOOLCHAIN = (
+    SCRIPT_DIR / "preset_compiler.py",
+    SCRIPT_DIR / "verified_generator.py",
+    SCRIPT_DIR / "format_writers.py",
+    SCRIPT_DIR / "nvim_highlights.py",
+    PRISM_ROOT / "sync_themes.py",
+)
+
+BASE16 = [f"base0{i:X}" for i in range(16)]
+
+# Luxe-style palette keys -> Base16 slot
+LUXE_SLOTS = {
+    "background": "base00",
+    "surface": "base01",
+    "surfaceHover": "base02",
+    "textMuted": "base03",
+    "textSecondary": "base04",
+    "textPrimary": "base05",
+    "accent": "base0A",
+}
+
+# ═══════════════════════════════════════════════════════════════════
+# Loading
+# ═══════════════════════════════════════════════════════════════════
+
+def is_preset(value) -> bool:
+    return isinstance(value, dict) and "heroColor" in value and "baseColor" in value
+
+def load_presets(files: Tuple[str, ...] = PRESET_FILES, presets_dir: Path = PRESETS_DIR) -> Tuple[Dict[str, dict], List[str]]:
+    """{slug: {"source": file, "preset": {...}}} for every preset, plus clash warnings."""
+    presets, warnings = {}, []
+    for filename in files:
+        data = json.loads((presets_dir / filename).read_text(encoding="utf-8"))
+        for category, entries in data.items():
+            if not isinstance(entries, dict):
+                continue
+            for slug, preset in entries.items():
+                if not is_preset(preset):
+                    continue
+                if slug in presets:
+                    warnings.append(f"{filename}:{category}.{slug} shadowed by {presets[slug]['source']}")
+                    continue
+                presets[slug] = {"source": filename, "preset": preset}
+    return presets, warnings
+
+def preset_config(slug: str, preset: dict) -> ThemeConfig:
+    base, hero = preset["baseColor"], preset["heroColor"]
+    return ThemeConfig(
+        hero_hue=float(hero["hue"]),
+        hero_saturation=float(hero["saturation"]),
+        base_hue=float(base["hue"]),
+        base_saturation=float(base["saturation"]),
+        mode=preset.get("mode", "dark"),
+        monitor=str(preset.get("monitorType", "OLED")).lower(),
+        name=preset.get("name", slug),
+        gamut_map=True,
+    )
+
+def authored_slots(preset: dict) -> Dict[str, str]:
+    """Base16 slot -> authored hex from the preset's palette (Base16 or luxe keys)."""
+    palette = preset.get("palette") or {}
+    slots = {}
+    for key, value in palette.items():
+        slot = key if key in BASE16 else LUXE_SLOTS.get(key)
+        if slot and isinstance(value, str) and len(value) == 7 and value.startswith("#"):
+            slots[slot] = value.lower()
+    return slots
+
+# ═══════════════════════════════════════════════════════════════════
+# Compilation (runs in worker processes)
+# ═══════════════════════════════════════════════════════════════════
+
+def toolchain_hash() -> str:
+    digest = hashlib.sha256()
+    for path in TOOLCHAIN:
+        digest.update(path.name.encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+def preset_hash(entry: dict, toolchain: str) -> str:
+    canonical = json.dumps(entry["preset"], sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(f"{toolchain}\0{canonical}".encode("utf-8")).hexdigest()[:32]
+
+def output_paths(slug: str) -> List[str]:
+    paths = [f"vscode/{slug}.json"]
+    paths += [(out_dir / filename.format(slug=slug)).as_posix() for _, out_dir, filename in OUTPUTS]
+    paths.append((NVIM_COMPILED_DIR / f"{slug}.lua").as_posix())
+    return paths
+
+def build_theme(slug: str, entry: dict) -> dict:
+    """The VS Code theme for one preset."""
+    preset = entry["preset"]
+    config = preset_config(slug, preset)
+    palette = list(generate_palette(config))
+    overrides = authored_slots(preset)
+    for slot, value in overrides.items():
+        palette[BASE16.index(slot)] = hex_to_srgb(value)
+    theme = generate_vscode_theme(config, verbose=False, palette=tuple(palette))
+    theme["_prism_meta"].update(
+        preset=slug,
+        preset_source=entry["source"],
+        category=preset.get("category"),
+        authored_slots=sorted(overrides),
+    )
+    return theme
+
+def build_outputs(job: Tuple[str, dict]) -> Tuple[str, Dict[str, str]]:
+    """(slug, {relpath: text}) for every artifact of one preset."""
+    slug, entry = job
+    return slug, theme_outputs(slug, build_theme(slug, entry))
+
+def theme_outputs(slug: str, theme: dict) -> Dict[str, str]:
+    """{relpath: text} for one VS Code theme: itself, every sync format and the compiled Neovim table."""
+    colors = extract_colors(theme)
+    files = {f"vscode/{slug}.json": json.dumps(theme, indent=2)}
+    values = {**colors, "slug": slug}
+    for fmt, out_dir, filename in OUTPUTS:
+        files[(out_dir / filename.format(slug=slug)).as_posix()] = render("sync", fmt, values)
+    compiled = compile_preset(slug, colors, theme.get("type", "dark"))
+    files[(NVIM_COMPILED_DIR / f"{slug}.lua").as_posix()] = to_lua(compiled)
+    return files
+
+def run_jobs(jobs: List[Tuple[str, dict]], workers: int):
+    """Yield build_outputs results; small batches stay in-process (pool start-up costs more)."""
+    if workers <= 1 or len(jobs) < 4:
+        for job in jobs:
+            yield build_outputs(job)
+        return
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+        yield from pool.map(build_outputs, jobs)
+
+# ═══════════════════════════════════════════════════════════════════
+# Cache
+# ═══════════════════════════════════════════════════════════════════
+
+def load_cache(output: Path) -> dict:
+    try:
+        cache = json.loads((output / CACHE_FILE).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return cache.get("presets", {}) if isinstance(cache, dict) else {}
+
+def save_cache(output: Path, entries: dict):
+    text = json.dumps({"version": 1, "presets": entries}, indent=2, sort_keys=True)
+    (output / CACHE_FILE).write_text(text + "\n", encoding="utf-8")
+
+def is_fresh(output: Path, cached: Optional[dict], digest: str) -> bool:
+    return bool(cached) and cached.get("hash") == digest and all((output / p).exists() for p in cached.get("files", []))
+
+# ═══════════════════════════════════════════════════════════════════
+# CLI
+# ═══════════════════════════════════════════════════════════════════
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compile core/themes preset files into complete themes")
+    parser.add_argument("--output", "-o", type=Path, default=DEFAULT_OUTPUT, help=f"Output root (default: {DEFAULT_OUTPUT})")
+    parser.add_argument("--bundle", metavar="PATH", help="Write every artifact into one .tar[.gz|.xz|.bz2] or .zip (no cache)")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1, help="Worker processes")
+    parser.add_argument("--force", action="store_true", help="Ignore the cache and rebuild every preset")
+    parser.add_argument("--only", nargs="+", metavar="SLUG", help="Build only these presets")
+    parser.add_argument("--list", action="store_true", help="List presets and exit")
+    prism_trace.add_arguments(parser)
+    prism_metrics.add_arguments(parser)
+    args = parser.parse_args(argv)
+    if args.bundle:
+        try:
+            bundle_kind(args.bundle)
+        except ValueError as e:
+            parser.error(str(e))
+
+    prism_trace.start(args, "preset_compiler")
+    prism_metrics.start(args, "preset_compiler")
+    start = time.perf_counter()
+    with span("load"):
+        presets, warnings = load_presets()
+    for warning in warnings:
+        print(f"  ⚠ {warning}", file=sys.stderr)
+
+    if args.list:
+        for slug, entry in sorted(presets.items()):
+            preset = entry["preset"]
+            authored = len(authored_slots(preset))
+            print(f"  {slug:<24} {preset.get('mode', 'dark'):<5} {entry['source']:<20} "
+                  f"{preset.get('category', '')}{f'  ({authored} authored)' if authored else ''}")
+        return 0
+
+    if args.only:
+        unknown = sorted(set(args.only) - presets.keys())
+        if unknown:
+            parser.error(f"unknown preset(s): {', '.join(unknown)}")
+        presets = {slug: presets[slug] for slug in args.only}
+
+    toolchain = toolchain_hash()
+    digests = {slug: preset_hash(entry, toolchain) for slug, entry in presets.items()}
+    cache = {} if (args.force or args.bundle) else load_cache(args.output)
+    dirty = [(slug, presets[slug]) for slug in sorted(presets)
+             if args.bundle or args.force or not is_fresh(args.output, cache.get(slug), digests[slug])]
+
+    written = 0
+    with open_sink(args.output, args.bundle) as sink:
+        for slug, files in run_jobs(dirty, args.jobs):
+            for relpath, text in files.items():
+                with span("write"):
+                    sink.write(relpath, text)
+            written += len(files)
+            cache[slug] = {"hash": digests[slug], "files": sorted(files)}
+            print(f"  {slug}: compiled")
+
+    if not args.bundle:
+        if not args.only:
+            # Presets removed from the source files: drop their outputs
+            for slug in sorted(set(cache) - presets.keys()):
+                for relpath in cache.pop(slug).get("files", []):
+                    (args.output / relpath).unlink(missing_ok=True)
+                prism_metrics.count("presets_removed")
+                print(f"  {slug}: removed")
+        args.output.mkdir(parents=True, exist_ok=True)
+        save_cache(args.output, cache)
+
+    prism_metrics.count("presets", len(presets))
+    prism_metrics.count("presets_compiled", len(dirty))
+    prism_metrics.count("cache_hits", len(presets) - len(dirty))
+    prism_metrics.count_sink(sink)
+    elapsed = time.perf_counter() - start
+    target = args.bundle or args.output
+    print(f"\n{len(dirty)} of {len(presets)} presets compiled, {written} files -> {target} in {elapsed:.2f}s")
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
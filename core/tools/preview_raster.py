@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Prism Preview Raster - bitmap text and flat shapes on NumPy canvases, saved as PNG
+
+Just enough of a rasterizer to draw editor previews without a browser, GPU
+or Pillow: solid and translucent rectangles plus monospaced text from a
+built-in 5x9 ASCII bitmap font.
+
+The font is stored as ASCII art (FONT_5X9) and compiled once per scale into
+a glyph atlas: a (128, height, advance) boolean array. A string is drawn by
+gathering its glyphs from the atlas into one strip and assigning the color
+through the strip mask, so a whole run costs a handful of NumPy calls
+whatever its length. Italic runs are sheared one pixel row band at a time.
+
+Usage:
+    from preview_raster import Canvas
+    canvas = Canvas(640, 120, "#0d1117")
+    canvas.text(16, 16, "return fib(n)", "#ff7eb6")
+    Path("preview.png").write_bytes(canvas.png())
+
+    python preview_raster.py --font build/font.png      # dump the glyph atlas
+"""
+
+import argparse
+import struct
+import zlib
+from functools import lru_cache
+from pathlib import Path
+from typing import Tuple
+
+import numpy as np
+
+# ═══════════════════════════════════════════════════════════════════
+# Font
+# ═══════════════════════════════════════════════════════════════════
+
+GLYPH_W, GLYPH_H = 5, 9   # cap height 7 (rows 0-6), descenders in rows 7-8
+BASELINE = 7
+
+# One glyph per line: the character, then its rows top to bottom ('#' = ink).
+# Missing trailing rows are blank; characters not listed draw as '?'.
+FONT_5X9 = r"""
+! ..#.. ..#.. ..#.. ..#.. ..#.. ..... ..#..
+" .#.#. .#.#.
+# .#.#. .#.#. ##### .#.#. ##### .#.#. .#.#.
+$ ..#.. .#### #.#.. .###. ..#.# ####. ..#..
+% ##... ##..# ...#. ..#.. .#... #..## ...##
+& .##.. #..#. #.#.. .#... #.#.# #..#. .##.#
+' ..#.. ..#.. .#...
+( ...#. ..#.. .#... .#... .#... ..#.. ...#.
+) .#... ..#.. ...#. ...#. ...#. ..#.. .#...
+* ..... ..#.. #.#.# .###. #.#.# ..#.. .....
++ ..... ..#.. ..#.. ##### ..#.. ..#.. .....
+, ..... ..... ..... ..... ..... .##.. ..#.. .#...
+- ..... ..... ..... ##### ..... ..... .....
+. ..... ..... ..... ..... ..... .##.. .##..
+/ ..... ....# ...#. ..#.. .#... #.... .....
+0 .###. #...# #..## #.#.# ##..# #...# .###.
+1 ..#.. .##.. ..#.. ..#.. ..#.. ..#.. .###.
+2 .###. #...# ....# ...#. ..#.. .#... #####
+3 ##### ...#. ..#.. ...#. ....# #...# .###.
+4 ...#. ..##. .#.#. #..#. ##### ...#. ...#.
+5 ##### #.... ####. ....# ....# #...# .###.
+6 ..##. .#... #.... ####. #...# #...# .###.
+7 ##### ....# ...#. ..#.. .#... .#... .#...
+8 .###. #...# #...# .###. #...# #...# .###.
+9 .###. #...# #...# .#### ....# ...#. .##..
+: ..... .##.. .##.. ..... .##.. .##.. .....
+; ..... .##.. .##.. ..... .##.. .##.. .#...
+< ...#. ..#.. .#... #.... .#... ..#.. ...#.
+= ..... ..... ##### ..... ##### ..... .....
+> .#... ..#.. ...#. ....# ...#. ..#.. .#...
+? .###. #...# ....# ...#. ..#.. ..... ..#..
+@ .###. #...# ....# .##.# #.#.# #.#.# .###.
+A .###. #...# #...# ##### #...# #...# #...#
+B ####. #...# #...# ####. #...# #...# ####.
+C .###. #...# #.... #.... #.... #...# .###.
+D ###.. #..#. #...# #...# #...# #..#. ###..
+E ##### #.... #.... ####. #.... #.... #####
+F ##### #.... #.... ####. #.... #.... #....
+G .###. #...# #.... #.### #...# #...# .####
+H #...# #...# #...# ##### #...# #...# #...#
+I .###. ..#.. ..#.. ..#.. ..#.. ..#.. .###.
+J ..### ...#. ...#. ...#. ...#. #..#. .##..
+K #...# #..#. #.#.. ##... #.#.. #..#. #...#
+L #.... #.... #.... #.... #.... #.... #####
+M #...# ##.## #.#.# #.#.# #...# #...# #...#
+N #...# #...# ##..# #.#.# #..## #...# #...#
+O .###. #...# #...# #...# #...# #...# .###.
+P ####. #...# #...# ####. #.... #.... #....
+Q .###. #...# #...# #...# #.#.# #..#. .##.#
+R ####. #...# #...# ####. #.#.. #..#. #...#
+S .#### #.... #.... .###. ....# ....# ####.
+T ##### ..#.. ..#.. ..#.. ..#.. ..#.. ..#..
+U #...# #...# #...# #...# #...# #...# .###.
+V #...# #...# #...# #...# #...# .#.#. ..#..
+W #...# #...# #...# #.#.# #.#.# #.#.# .#.#.
+X #...# #...# .#.#. ..#.. .#.#. #...# #...#
+Y #...# #...# .#.#. ..#.. ..#.. ..#.. ..#..
+Z ##### ....# ...#. ..#.. .#... #.... #####
+[ .###. .#... .#... .#... .#... .#... .###.
+\ ..... #.... .#... ..#.. ...#. ....# .....
+] .###. ...#. ...#. ...#. ...#. ...#. .###.
+^ ..#.. .#.#. #...#
+_ ..... ..... ..... ..... ..... ..... ..... #####
+` .#... ..#..
+a ..... ..... .###. ....# .#### #...# .####
+b #.... #.... #.##. ##..# #...# #...# ####.
+c ..... ..... .###. #.... #.... #...# .###.
+d ....# ....# .##.# #..## #...# #...# .####
+e ..... ..... .###. #...# ##### #.... .###.
+f ..##. .#..# .#... ###.. .#... .#... .#...
+g ..... ..... .#### #...# #...# #...# .#### ....# .###.
+h #.... #.... #.##. ##..# #...# #...# #...#
+i ..#.. ..... .##.. ..#.. ..#.. ..#.. .###.
+j ...#. ..... ..##. ...#. ...#. ...#. ...#. #..#. .##..
+k #.... #.... #..#. #.#.. ##... #.#.. #..#.
+l .##.. ..#.. ..#.. ..#.. ..#.. ..#.. .###.
+m ..... ..... ##.#. #.#.# #.#.# #...# #...#
+n ..... ..... #.##. ##..# #...# #...# #...#
+o ..... ..... .###. #...# #...# #...# .###.
+p ..... ..... ####. #...# #...# #...# ####. #.... #....
+q ..... ..... .#### #...# #...# #...# .#### ....# ....#
+r ..... ..... #.##. ##..# #.... #.... #....
+s ..... ..... .###. #.... .###. ....# ####.
+t .#... .#... ###.. .#... .#... .#..# ..##.
+u ..... ..... #...# #...# #...# #..## .##.#
+v ..... ..... #...# #...# #...# .#.#. ..#..
+w ..... ..... #...# #...# #.#.# #.#.# .#.#.
+x ..... ..... #...# .#.#. ..#.. .#.#. #...#
+y ..... ..... #...# #...# #...# #...# .#### ....# .###.
+z ..... ..... ##### ...#. ..#.. .#... #####
+{ ...## ..#.. ..#.. ##... ..#.. ..#.. ...##
+| ..#.. ..#.. ..#.. ..#.. ..#.. ..#.. ..#..
+} ##... ..#.. ..#.. ...## ..#.. ..#.. ##...
+~ ..... ..... .#... #.#.# ...#. ..... .....
+"""
+
+def _glyph_bitmaps() -> np.ndarray:
+    """(128, GLYPH_H, GLYPH_W) bool from FONT_5X9; unlisted codes get '?', space stays blank."""
+    glyphs = {}
+    for line in FONT_5X9.strip("\n").split("\n"):
+        rows = line[2:].split()
+        bitmap = np.zeros((GLYPH_H, GLYPH_W), dtype=bool)
+        bitmap[:len(rows)] = [[c == "#" for c in row] for row in rows]
+        glyphs[line[0]] = bitmap
+    table = np.repeat(glyphs["?"][None], 128, axis=0)
+    table[ord(" ")] = False
+    for char, bitmap in glyphs.items():
+        table[ord(char)] = bitmap
+    return table
+
+@lru_cache(maxsize=None)
+def atlas(scale: int = 2) -> np.ndarray:
+    """(128, cell height, cell advance) glyph masks at an integer scale, one blank column between glyphs."""
+    glyphs = _glyph_bitmaps().repeat(scale, axis=1).repeat(scale, axis=2)
+    return np.pad(glyphs, ((0, 0), (0, 0), (0, scale)))
+
+def cell_size(scale: int = 2) -> Tuple[int, int]:
+    """(advance, height) of one character cell."""
+    return (GLYPH_W + 1) * scale, GLYPH_H * scale
+
+# ═══════════════════════════════════════════════════════════════════
+# Canvas
+# ═══════════════════════════════════════════════════════════════════
+
+def parse_color(hex_color: str) -> Tuple[np.ndarray, float]:
+    """'#rgb', '#rrggbb' or '#rrggbbaa' -> (uint8 RGB, alpha in [0, 1])."""
+    h = hex_color.lstrip("#")
+    if len(h) == 3:
+        h = "".join(c * 2 for c in h)
+    rgb = np.array([int(h[i:i + 2], 16) for i in (0, 2, 4)], dtype=np.uint8)
+    return rgb, int(h[6:8], 16) / 255 if len(h) == 8 else 1.0
+
+class Canvas:
+    """An RGB image with clipped rectangle fills and bitmap text."""
+
+    def __init__(self, width: int, height: int, background: str = "#000000", scale: int = 2):
+        self.pixels = np.empty((height, width, 3), dtype=np.uint8)
+        self.pixels[:] = parse_color(background)[0]
+        self.scale = scale
+        self.atlas = atlas(scale)
+
+    @property
+    def width(self) -> int:
+        return self.pixels.shape[1]
+
+    @property
+    def height(self) -> int:
+        return self.pixels.shape[0]
+
+    def _clip(self, x: int, y: int, w: int, h: int):
+        x0, y0 = max(0, x), max(0, y)
+        x1, y1 = min(self.width, x + w), min(self.height, y + h)
+        return (x0, y0, x1, y1) if x0 < x1 and y0 < y1 else None
+
+    def fill(self, x: int, y: int, w: int, h: int, color: str):
+        """Fill a rectangle; colors with an alpha byte blend over what is there."""
+        box = self._clip(x, y, w, h)
+        if box is None:
+            return
+        x0, y0, x1, y1 = box
+        rgb, alpha = parse_color(color)
+        region = self.pixels[y0:y1, x0:x1]
+        if alpha >= 1.0:
+            region[:] = rgb
+        else:
+            region[:] = np.rint(region * (1.0 - alpha) + rgb * alpha).astype(np.uint8)
+
+    def text(self, x: int, y: int, text: str, color: str, italic: bool = False) -> int:
+        """Draw a run with its cell's top-left at (x, y); returns the x after the run."""
+        if not text:
+            return x
+        codes = np.frombuffer(text.encode("ascii", "replace"), dtype=np.uint8) & 0x7F
+        glyphs = self.atlas[codes]
+        n, height, advance = glyphs.shape
+        strip = glyphs.transpose(1, 0, 2).reshape(height, n * advance)
+        if italic:
+            # Shear: rows above the baseline move right by up to two pixels per scale unit
+            sheared = np.zeros_like(strip)
+            for row in range(height):
+                shift = max(0, (BASELINE * self.scale - 1 - row) // (3 * self.scale))
+                sheared[row, shift:] = strip[row, :strip.shape[1] - shift]
+            strip = sheared
+        end = x + n * advance
+        box = self._clip(x, y, n * advance, height)
+        if box is not None:
+            x0, y0, x1, y1 = box
+            mask = strip[y0 - y:y1 - y, x0 - x:x1 - x]
+            rgb, alpha = parse_color(color)
+            region = self.pixels[y0:y1, x0:x1]
+            if alpha >= 1.0:
+                region[mask] = rgb
+            else:
+                region[mask] = np.rint(region[mask] * (1.0 - alpha) + rgb * alpha).astype(np.uint8)
+        return end
+
+    def png(self) -> bytes:
+        return encode_png(self.pixels)
+
+# ═══════════════════════════════════════════════════════════════════
+# PNG
+# ═══════════════════════════════════════════════════════════════════
+
+def _png_chunk(kind: bytes, data: bytes) -> bytes:
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+def encode_png(pixels: np.ndarray, level: int = 6) -> bytes:
+    """(H, W, 3) uint8 -> 8-bit RGB PNG bytes. Every row uses the Up filter, which
+    flattens the solid panels and repeated text rows these previews are made of."""
+    height, width, _ = pixels.shape
+    rows = pixels.reshape(height, width * 3)
+    up = np.empty((height, width * 3 + 1), dtype=np.uint8)
+    up[:, 0] = 2
+    up[0, 1:] = rows[0]
+    up[1:, 1:] = rows[1:] - rows[:-1]  # uint8 arithmetic wraps, as the filter is defined
+    return b"".join([
+        b"\x89PNG\r\n\x1a\n",
+        _png_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)),
+        _png_chunk(b"IDAT", zlib.compress(up.tobytes(), level)),
+        _png_chunk(b"IEND", b""),
+    ])
+
+def main():
+    parser = argparse.ArgumentParser(description="Dump the built-in bitmap font atlas")
+    parser.add_argument("--font", type=Path, required=True, metavar="PNG", help="Where to write the atlas image")
+    parser.add_argument("--scale", type=int, default=2)
+    args = parser.parse_args()
+
+    advance, height = cell_size(args.scale)
+    per_row = 16
+    canvas = Canvas(per_row * advance + 16, 6 * (height + 4) + 16, "#101014", args.scale)
+    for i, code in enumerate(range(32, 128)):
+        row, col = divmod(i, per_row)
+        canvas.text(8 + col * advance, 8 + row * (height + 4), chr(code) if code < 127 else " ", "#e4e4e8")
+    args.font.parent.mkdir(parents=True, exist_ok=True)
+    args.font.write_bytes(canvas.png())
+    print(f"{args.font}: {canvas.width}x{canvas.height}")
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
@@ -9,6 +9,15 @@ Usage:
     prism info <theme>
     prism export <theme> --format vscode
     prism search <query>
+    prism audit <theme>
+    prism list --json                  # machine-readable (also info/search/audit)
+    prism --trace build/cli.trace.json info fleek   # --trace/--profile work with any command
+
+With `python prism_daemon.py start` running, export and --json commands are
+answered by the daemon before typer/rich are imported; every other command
+reads its theme data through the daemon too. Without a daemon everything runs
+in-process (PRISM_NO_DAEMON=1 forces that). PRISM_THEMES_DIR points every
+command at another themes directory; unset, the daemon uses its own default.
 
 Requirements: pip install rich typer
 
@@ -23,6 +32,94 @@ from pathlib import Path
 from typing import List, Optional
 from enum import Enum
 
+import prism_trace
+from prism_daemon import (
+    DaemonUnavailable, QueryError, query as theme_query, request, user_themes_dir,
+)
+from prism_trace import span
+
+# ═══════════════════════════════════════════════════════════════════
+# Fast Path (no typer/rich)
+# ═══════════════════════════════════════════════════════════════════
+
+def fast_path(argv: List[str]) -> Optional[int]:
+    """Handle export and --json commands without importing typer/rich.
+
+    --json commands are always answered here (daemon or in-process); export
+    only when the daemon is running. Returns None to fall through to typer.
+    """
+    if not argv or argv[0] not in ("export", "list", "info", "search", "audit"):
+        return None
+    command, rest = argv[0], argv[1:]
+    as_json = "--json" in rest
+    if command != "export" and not as_json:
+        return None
+    rest = [a for a in rest if a != "--json"]
+    
+    options, positional = {}, []
+    aliases = {"-f": "--format", "-o": "--output", "-c": "--category"}
+    i = 0
+    while i < len(rest):
+        arg = rest[i]
+        if arg.startswith("-"):
+            key, _, value = arg.partition("=")
+            key = aliases.get(key, key)
+            if key not in ("--format", "--output", "--category"):
+                return None
+            if not value:
+                if i + 1 >= len(rest):
+                    return None
+                i += 1
+                value = rest[i]
+            options[key] = value
+        else:
+            positional.append(arg)
+        i += 1
+    
+    try:
+        if command == "export":
+            if len(positional) != 1:
+                return None
+            content = request("export", themes_dir=user_themes_dir(), name=positional[0],
+                              format=options.get("--format", "opencode"))
+            if "--output" in options:
+                Path(options["--output"]).write_text(content)
+                print(f"Exported to {options['--output']}")
+            else:
+                print(content)
+            return 0
+        if command == "list":
+            if positional:
+                return None
+            result = theme_query("list", category=options.get("--category"))
+        else:
+            if len(positional) != 1 or options:
+                return None
+            key = "query" if command == "search" else "name"
+            result = theme_query(command, **{key: positional[0]})
+    except DaemonUnavailable:
+        return None
+    except QueryError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    print(json.dumps(result, indent=2))
+    return 0
+
+def run_fast_path():
+    """Exit with fast_path's status when it answered; called before typer/rich are imported."""
+    sys.argv[1:] = prism_trace.start_from_argv(sys.argv[1:], "prism_cli")
+    with span("fast_path"):
+        code = fast_path(sys.argv[1:])
+    if code is not None:
+        sys.exit(code)
+
+if __name__ == "__main__":
+    run_fast_path()
+
+# ═══════════════════════════════════════════════════════════════════
+# Typer App (imported only when the fast path did not answer)
+# ═══════════════════════════════════════════════════════════════════
+
 try:
     import typer
     from rich.console import Console
@@ -55,7 +152,6 @@ console = Console()
 
 SCRIPT_DIR = Path(__file__).parent
 PRISM_ROOT = SCRIPT_DIR.parent.parent
-THEMES_DIR = PRISM_ROOT / "prism-code" / "themes"
 
 # Platform directories
 PLATFORMS = {
@@ -85,45 +181,29 @@ INSTALL_TARGETS = {
     "emacs": Path.home() / ".emacs.d" / "prism-themes",
 }
 
-# Theme categories
-CATEGORIES = {
-    "flagship": ["fleek", "fleek-light"],
-    "luxury": ["nero-marquina", "midnight-sapphire", "obsidian-rose-gold", 
-               "champagne-noir", "emerald-velvet", "diamond-dust"],
-    "glass": ["aurora-glass", "zen-garden", "tide-pool", "porcelain-moon", "soft-charcoal"],
-    "harmonious": ["ocean-depths", "forest-canopy", "lavender-dusk", 
-                   "slate-and-gold", "ember-hearth", "constellation-map"],
-    "wild": ["neon-nexus", "blood-moon", "vaporwave-sunset", "acid-rain",
-             "ultraviolet", "holographic", "cyber-noir", "synthwave-84"],
-    "classic": ["catppuccin-mocha", "dracula-pro", "gruvbox-material", "nord-aurora",
-                "one-dark-pro", "ayu-mirage", "rose-pine", "night-owl", "cobalt2",
-                "palenight", "vesper", "tokyo-night-bento", "moonlight-ii"]
-}
-
 # ═══════════════════════════════════════════════════════════════════
 # Helper Functions
 # ═══════════════════════════════════════════════════════════════════
 
 def get_all_themes() -> List[str]:
     """Get list of all available themes"""
-    if THEMES_DIR.exists():
-        return sorted([f.stem for f in THEMES_DIR.glob("*.json")])
-    return []
+    return theme_query("names")
 
 def get_theme_info(name: str) -> Optional[dict]:
     """Load theme JSON data"""
-    theme_file = THEMES_DIR / f"{name}.json"
-    if theme_file.exists():
-        with open(theme_file) as f:
-            return json.load(f)
-    return None
-
-def get_category(theme_name: str) -> str:
-    """Get the category for a theme"""
-    for cat, themes in CATEGORIES.items():
-        if theme_name in themes:
-            return cat
-    return "unknown"
+    return theme_query("theme", name=name)
+
+def ask(op: str, **args):
+    """Query the theme index (daemon or in-process); report rejected requests and exit"""
+    try:
+        with span("load", op):
+            return theme_query(op, **args)
+    except QueryError as e:
+        console.print(f"[red]{e}[/red]")
+        raise typer.Exit(1)
+
+def print_json(result):
+    print(json.dumps(result, indent=2))
 
 def hex_to_ansi(hex_color: str) -> str:
     """Convert hex to ANSI escape code for true color"""
@@ -142,17 +222,14 @@ def render_swatch(hex_color: str, width: int = 4) -> Text:
 @app.command()
 def list(
     category: Optional[str] = typer.Option(None, "--category", "-c", help="Filter by category"),
-    verbose: bool = typer.Option(False, "--verbose", "-v", help="Show detailed info")
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="Show detailed info"),
+    json_output: bool = typer.Option(False, "--json", help="Print JSON instead of a table")
 ):
     """List all available themes"""
-    themes = get_all_themes()
-    
-    if category:
-        if category not in CATEGORIES:
-            console.print(f"[red]Unknown category: {category}[/red]")
-            console.print(f"Available: {', '.join(CATEGORIES.keys())}")
-            raise typer.Exit(1)
-        themes = [t for t in themes if t in CATEGORIES[category]]
+    rows = ask("list", category=category)
+    if json_output:
+        print_json(rows)
+        return
     
     table = Table(title="Prism Themes", border_style="cyan")
     table.add_column("Theme", style="bold")
@@ -162,17 +239,12 @@ def list(
         table.add_column("Background")
         table.add_column("Accent")
     
-    for name in themes:
-        info = get_theme_info(name)
-        cat = get_category(name)
-        theme_type = info.get("type", "dark") if info else "dark"
+    for entry in rows:
+        row = [entry["name"], entry["category"], entry["type"]]
         
-        row = [name, cat, theme_type]
-        
-        if verbose and info:
-            colors = info.get("colors", {})
-            bg = colors.get("background", "#1a1a1a")
-            accent = colors.get("accent", "#00a0e4")
+        if verbose:
+            bg = entry["background"]
+            accent = entry["accent"]
             row.extend([
                 Text(f"{bg} ", style=f"on {bg}") + render_swatch(bg),
                 Text(f"{accent} ") + render_swatch(accent)
@@ -181,23 +253,23 @@ def list(
         table.add_row(*row)
     
     console.print(table)
-    console.print(f"\n[dim]Total: {len(themes)} themes[/dim]")
+    console.print(f"\n[dim]Total: {len(rows)} themes[/dim]")
 
 @app.command()
-def info(theme: str):
+def info(
+    theme: str,
+    json_output: bool = typer.Option(False, "--json", help="Print JSON instead of tables")
+):
     """Show detailed information about a theme"""
-    data = get_theme_info(theme)
-    if not data:
-        console.print(f"[red]Theme not found: {theme}[/red]")
-        raise typer.Exit(1)
-    
-    colors = data.get("colors", {})
-    syntax = colors.get("syntax", {})
+    details = ask("info", name=theme)
+    if json_output:
+        print_json(details)
+        return
     
     console.print(Panel(
-        f"[bold]{data.get('name', theme)}[/bold]\n"
-        f"Type: {data.get('type', 'dark')}\n"
-        f"Category: {get_category(theme)}",
+        f"[bold]{details['title']}[/bold]\n"
+        f"Type: {details['type']}\n"
+        f"Category: {details['category']}",
         title="Theme Info",
         border_style="cyan"
     ))
@@ -208,23 +280,36 @@ def info(theme: str):
     table.add_column("Hex")
     table.add_column("Swatch")
     
-    palette = [
-        ("Background", colors.get("background", "#1a1a1a")),
-        ("Foreground", colors.get("text", "#e0e0e0")),
-        ("Accent", colors.get("accent", "#00a0e4")),
-        ("Keyword", syntax.get("keyword", "#ff79c6")),
-        ("String", syntax.get("string", "#f1fa8c")),
-        ("Function", syntax.get("function", "#50fa7b")),
-        ("Comment", syntax.get("comment", "#6272a4")),
-        ("Number", syntax.get("number", "#bd93f9")),
-        ("Type", syntax.get("type", "#8be9fd")),
-    ]
-    
-    for role, color in palette:
+    for role, color in details["palette"]:
         table.add_row(role, color, render_swatch(color, 8))
     
     console.print(table)
 
+@app.command()
+def audit(
+    theme: str,
+    json_output: bool = typer.Option(False, "--json", help="Print JSON instead of a table")
+):
+    """Check WCAG contrast of a theme's text and syntax colors"""
+    results = ask("audit", name=theme)
+    if json_output:
+        print_json(results)
+        return
+    
+    styles = {"AAA": "green", "AA": "green", "AA Large": "yellow", "Fail": "red"}
+    table = Table(title=f"WCAG Audit: {theme}", border_style="cyan")
+    table.add_column("Role")
+    table.add_column("Color")
+    table.add_column("Ratio", justify="right")
+    table.add_column("Rating")
+    for r in results:
+        table.add_row(r["role"], Text(f"{r['fg']} ") + render_swatch(r["fg"]),
+                      f"{r['ratio']:.2f}:1", Text(r["rating"], style=styles[r["rating"]]))
+    console.print(table)
+    failing = sum(r["rating"] == "Fail" for r in results)
+    if failing:
+        console.print(f"[red]{failing} pair(s) below 3:1[/red]")
+
 @app.command()
 def preview(theme: str):
     """Preview a theme with sample code"""
@@ -347,28 +432,20 @@ def install(
         console.print("[yellow]No themes were installed[/yellow]")
 
 @app.command()
-def search(query: str):
+def search(
+    query: str,
+    json_output: bool = typer.Option(False, "--json", help="Print JSON instead of a list")
+):
     """Search for themes by name or description"""
-    themes = get_all_themes()
-    query_lower = query.lower()
-    
-    matches = []
-    for name in themes:
-        if query_lower in name.lower():
-            matches.append(name)
-            continue
-        
-        info = get_theme_info(name)
-        if info:
-            desc = info.get("description", "").lower()
-            if query_lower in desc:
-                matches.append(name)
+    matches = ask("search", query=query)
+    if json_output:
+        print_json(matches)
+        return
     
     if matches:
         console.print(f"[green]Found {len(matches)} theme(s):[/green]")
         for m in matches:
-            cat = get_category(m)
-            console.print(f"  • [bold]{m}[/bold] [{cat}]")
+            console.print(f"  • [bold]{m['name']}[/bold] [{m['category']}]")
     else:
         console.print(f"[yellow]No themes found matching '{query}'[/yellow]")
 
@@ -380,50 +457,7 @@ def export(
     output: Optional[Path] = typer.Option(None, "--output", "-o", help="Output file path")
 ):
     """Export a theme to a specific format"""
-    data = get_theme_info(theme)
-    if not data:
-        console.print(f"[red]Theme not found: {theme}[/red]")
-        raise typer.Exit(1)
-    
-    # Import the studio module for export functions
-    from prism_studio import Theme, ThemeColors, ExportManager
-    
-    colors = data.get("colors", {})
-    syntax = colors.get("syntax", {})
-    
-    tc = ThemeColors(
-        background=colors.get("background", "#1a1a1a"),
-        foreground=colors.get("text", "#e0e0e0"),
-        muted=colors.get("textMuted", "#808080"),
-        accent=colors.get("accent", "#00a0e4"),
-        keyword=syntax.get("keyword", "#ff79c6"),
-        string=syntax.get("string", "#f1fa8c"),
-        function=syntax.get("function", "#50fa7b"),
-        comment=syntax.get("comment", "#6272a4"),
-        number=syntax.get("number", "#bd93f9"),
-        type=syntax.get("type", "#8be9fd"),
-    )
-    
-    t = Theme(name=theme, type=data.get("type", "dark"), colors=tc)
-    
-    exporters = {
-        "opencode": ExportManager.to_opencode,
-        "vscode": ExportManager.to_vscode,
-        "alacritty": ExportManager.to_alacritty,
-        "kitty": ExportManager.to_kitty,
-        "wezterm": ExportManager.to_wezterm,
-        "windows-terminal": ExportManager.to_windows_terminal,
-        "jetbrains": ExportManager.to_jetbrains,
-        "zed": ExportManager.to_zed,
-        "helix": ExportManager.to_helix,
-    }
-    
-    if format not in exporters:
-        console.print(f"[red]Unknown format: {format}[/red]")
-        console.print(f"Available: {', '.join(exporters.keys())}")
-        raise typer.Exit(1)
-    
-    content = exporters[format](t)
+    content = ask("export", name=theme, format=format)
     
     if output:
         output.write_text(content)
@@ -0,0 +1,420 @@
+#!/usr/bin/env python3
+"""
+Prism Daemon - keeps the theme index hot for prism_cli
+
+A long-lived asyncio server on a Unix socket. It holds the parsed themes,
+the process-wide contrast cache and the compiled format writers in memory and
+answers list / info / search / export / audit requests, so editor integrations
+and shell prompts that call `prism` repeatedly skip the import, glob and JSON
+parsing on every call.
+
+prism_cli uses the daemon when it is running and falls back to the same
+ThemeIndex in-process when it is not. Set PRISM_NO_DAEMON=1 to bypass it, and
+PRISM_THEMES_DIR to query another themes directory than the daemon's default.
+
+Protocol: one JSON object per line in each direction ("themes_dir" is optional).
+    -> {"op": "info", "themes_dir": "/path/to/themes", "args": {"name": "fleek"}}
+    <- {"ok": true, "result": {...}}  or  {"ok": false, "error": "Theme not found: fleek"}
+
+Usage:
+    python prism_daemon.py start [--socket PATH] [--themes-dir DIR]
+    python prism_daemon.py status
+    python prism_daemon.py stop
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import signal
+import socket
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from contrast_cache import CACHE, contrast
+
+SCRIPT_DIR = Path(__file__).parent
+PRISM_ROOT = SCRIPT_DIR.parent.parent
+THEMES_DIR = PRISM_ROOT / "prism-code" / "themes"
+
+CLIENT_TIMEOUT = 2.0
+
+# Theme categories
+CATEGORIES = {
+    "flagship": ["fleek", "fleek-light"],
+    "luxury": ["nero-marquina", "midnight-sapphire", "obsidian-rose-gold",
+               "champagne-noir", "emerald-velvet", "diamond-dust"],
+    "glass": ["aurora-glass", "zen-garden", "tide-pool", "porcelain-moon", "soft-charcoal"],
+    "harmonious": ["ocean-depths", "forest-canopy", "lavender-dusk",
+                   "slate-and-gold", "ember-hearth", "constellation-map"],
+    "wild": ["neon-nexus", "blood-moon", "vaporwave-sunset", "acid-rain",
+             "ultraviolet", "holographic", "cyber-noir", "synthwave-84"],
+    "classic": ["catppuccin-mocha", "dracula-pro", "gruvbox-material", "nord-aurora",
+                "one-dark-pro", "ayu-mirage", "rose-pine", "night-owl", "cobalt2",
+                "palenight", "vesper", "tokyo-night-bento", "moonlight-ii"]
+}
+
+EXPORT_FORMATS = ("opencode", "vscode", "alacritty", "kitty", "wezterm", "windows-terminal", "jetbrains", "zed", "helix")
+
+def get_category(theme_name: str) -> str:
+    """Get the category for a theme"""
+    for cat, themes in CATEGORIES.items():
+        if theme_name in themes:
+            return cat
+    return "unknown"
+
+def default_socket_path() -> Path:
+    """$PRISM_DAEMON_SOCKET, else $XDG_RUNTIME_DIR/prism.sock, else /tmp/prism-<uid>.sock"""
+    env = os.environ.get("PRISM_DAEMON_SOCKET")
+    if env:
+        return Path(env)
+    runtime = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime:
+        return Path(runtime) / "prism.sock"
+    return Path(f"/tmp/prism-{os.getuid()}.sock")
+
+class QueryError(ValueError):
+    """A request the index cannot answer (unknown theme, category or format)."""
+
+def wcag_rating(ratio: float) -> str:
+    if ratio >= 7.0:
+        return "AAA"
+    if ratio >= 4.5:
+        return "AA"
+    if ratio >= 3.0:
+        return "AA Large"
+    return "Fail"
+
+# ═══════════════════════════════════════════════════════════════════
+# Theme Index (shared by the daemon and the in-process fallback)
+# ═══════════════════════════════════════════════════════════════════
+
+class ThemeIndex:
+    """Parsed OpenCode-format themes in one directory, refreshed by mtime."""
+
+    def __init__(self, themes_dir: Path):
+        self.themes_dir = Path(themes_dir)
+        self.themes: Dict[str, dict] = {}
+        self._stamps: Dict[str, Tuple[int, int]] = {}
+
+    def refresh(self) -> int:
+        """Re-parse added or modified files and drop deleted ones. Returns files parsed."""
+        if not self.themes_dir.is_dir():
+            self.themes.clear()
+            self._stamps.clear()
+            return 0
+        seen = {}
+        parsed = 0
+        with os.scandir(self.themes_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".json") or not entry.is_file():
+                    continue
+                st = entry.stat()
+                stamp = (st.st_mtime_ns, st.st_size)
+                name = entry.name[:-5]
+                seen[name] = stamp
+                if self._stamps.get(name) != stamp:
+                    try:
+                        with open(entry.path, encoding="utf-8") as f:
+                            self.themes[name] = json.load(f)
+                    except (OSError, ValueError):
+                        self.themes.pop(name, None)
+                    parsed += 1
+        for name in self._stamps.keys() - seen.keys():
+            self.themes.pop(name, None)
+        self._stamps = seen
+        return parsed
+
+    def _get(self, name: str) -> dict:
+        data = self.themes.get(name)
+        if data is None:
+            raise QueryError(f"Theme not found: {name}")
+        return data
+
+    # ── Operations (each returns JSON-serializable data) ──
+
+    def names(self) -> List[str]:
+        return sorted(self.themes)
+
+    def theme(self, name: str) -> Optional[dict]:
+        return self.themes.get(name)
+
+    def list(self, category: Optional[str] = None) -> List[dict]:
+        if category and category not in CATEGORIES:
+            raise QueryError(f"Unknown category: {category} (available: {', '.join(CATEGORIES)})")
+        rows = []
+        for name in self.names():
+            if category and name not in CATEGORIES[category]:
+                continue
+            data = self.themes[name]
+            colors = data.get("colors", {})
+            rows.append({
+                "name": name,
+                "category": get_category(name),
+                "type": data.get("type", "dark"),
+                "background": colors.get("background", "#1a1a1a"),
+                "accent": colors.get("accent", "#00a0e4"),
+            })
+        return rows
+
+    def info(self, name: str) -> dict:
+        data = self._get(name)
+        colors = data.get("colors", {})
+        syntax = colors.get("syntax", {})
+        return {
+            "name": name,
+            "title": data.get("name", name),
+            "type": data.get("type", "dark"),
+            "category": get_category(name),
+            "palette": [
+                ["Background", colors.get("background", "#1a1a1a")],
+                ["Foreground", colors.get("text", "#e0e0e0")],
+                ["Accent", colors.get("accent", "#00a0e4")],
+                ["Keyword", syntax.get("keyword", "#ff79c6")],
+                ["String", syntax.get("string", "#f1fa8c")],
+                ["Function", syntax.get("function", "#50fa7b")],
+                ["Comment", syntax.get("comment", "#6272a4")],
+                ["Number", syntax.get("number", "#bd93f9")],
+                ["Type", syntax.get("type", "#8be9fd")],
+            ],
+        }
+
+    def search(self, query: str) -> List[dict]:
+        query_lower = query.lower()
+        matches = []
+        for name in self.names():
+            desc = self.themes[name].get("description", "").lower()
+            if query_lower in name.lower() or query_lower in desc:
+                matches.append({"name": name, "category": get_category(name)})
+        return matches
+
+    def export(self, name: str, format: str = "opencode") -> str:
+        data = self._get(name)
+        if format not in EXPORT_FORMATS:
+            raise QueryError(f"Unknown format: {format} (available: {', '.join(EXPORT_FORMATS)})")
+
+        # Same construction as the original prism_cli export
+        from prism_studio import Theme, ThemeColors, ExportManager
+
+        colors = data.get("colors", {})
+        syntax = colors.get("syntax", {})
+        tc = ThemeColors(
+            background=colors.get("background", "#1a1a1a"),
+            foreground=colors.get("text", "#e0e0e0"),
+            muted=colors.get("textMuted", "#808080"),
+            accent=colors.get("accent", "#00a0e4"),
+            keyword=syntax.get("keyword", "#ff79c6"),
+            string=syntax.get("string", "#f1fa8c"),
+            function=syntax.get("function", "#50fa7b"),
+            comment=syntax.get("comment", "#6272a4"),
+            number=syntax.get("number", "#bd93f9"),
+            type=syntax.get("type", "#8be9fd"),
+        )
+        return ExportManager.export(Theme(name=name, type=data.get("type", "dark"), colors=tc), format)
+
+    def audit(self, name: str) -> List[dict]:
+        """WCAG contrast of the text and syntax colors against the background."""
+        info = self.info(name)
+        data = self.themes[name]
+        bg = info["palette"][0][1]
+        pairs = [(role, color) for role, color in info["palette"][1:]]
+        muted = data.get("colors", {}).get("textMuted")
+        if muted:
+            pairs.insert(1, ("Muted", muted))
+        results = []
+        for role, color in pairs:
+            ratio = contrast(color, bg)
+            results.append({"role": role, "fg": color, "bg": bg, "ratio": round(ratio, 2), "rating": wcag_rating(ratio)})
+        return results
+
+OPERATIONS = ("names", "theme", "list", "info", "search", "export", "audit")
+
+# ═══════════════════════════════════════════════════════════════════
+# Server
+# ═══════════════════════════════════════════════════════════════════
+
+class PrismDaemon:
+    """Dispatches requests to one warm ThemeIndex per themes directory."""
+
+    def __init__(self, socket_path: Path, themes_dir: Path = THEMES_DIR):
+        self.socket_path = Path(socket_path)
+        self.default_dir = Path(themes_dir)
+        self.indexes: Dict[str, ThemeIndex] = {}
+        self.started = time.time()
+        self.requests = 0
+        self.clients: Dict[asyncio.Task, asyncio.StreamWriter] = {}
+        self._stop: Optional[asyncio.Event] = None
+
+    def index(self, themes_dir: Optional[str]) -> ThemeIndex:
+        key = str(Path(themes_dir).resolve()) if themes_dir else str(self.default_dir.resolve())
+        index = self.indexes.get(key)
+        if index is None:
+            index = self.indexes[key] = ThemeIndex(Path(key))
+        index.refresh()
+        return index
+
+    def status(self) -> dict:
+        return {
+            "pid": os.getpid(),
+            "socket": str(self.socket_path),
+            "uptime": round(time.time() - self.started, 1),
+            "requests": self.requests,
+            "indexes": {k: len(v.themes) for k, v in self.indexes.items()},
+            "contrast_cache": CACHE.stats(),
+        }
+
+    def dispatch(self, request: dict):
+        op = request.get("op")
+        if op == "ping":
+            return self.status()
+        if op == "shutdown":
+            self._stop.set()
+            return {"stopping": True}
+        if op not in OPERATIONS:
+            raise QueryError(f"Unknown operation: {op}")
+        index = self.index(request.get("themes_dir"))
+        return getattr(index, op)(**request.get("args", {}))
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        task = asyncio.current_task()
+        self.clients[task] = writer
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                self.requests += 1
+                try:
+                    response = {"ok": True, "result": self.dispatch(json.loads(line))}
+                except QueryError as e:
+                    response = {"ok": False, "error": str(e)}
+                except Exception as e:  # keep serving; report to the client
+                    response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+                writer.write(json.dumps(response).encode("utf-8") + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            del self.clients[task]
+            writer.close()
+
+    async def serve(self):
+        self._stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, self._stop.set)
+        old_umask = os.umask(0o077)
+        try:
+            server = await asyncio.start_unix_server(self.handle, path=str(self.socket_path))
+        finally:
+            os.umask(old_umask)
+        self.index(None)  # warm the default directory before the first request
+        print(f"prism daemon listening on {self.socket_path} (pid {os.getpid()})", flush=True)
+        async with server:
+            await self._stop.wait()
+            # Closing a client's transport ends its pending readline, so every handler returns on its own
+            handlers = list(self.clients)
+            for writer in self.clients.values():
+                writer.close()
+            await asyncio.gather(*handlers, return_exceptions=True)
+        self.socket_path.unlink(missing_ok=True)
+
+# ═══════════════════════════════════════════════════════════════════
+# Client
+# ═══════════════════════════════════════════════════════════════════
+
+class DaemonUnavailable(OSError):
+    """No daemon is listening on the socket."""
+
+def request(op: str, socket_path: Optional[Path] = None, themes_dir: Optional[Path] = None, **args):
+    """Send one request to the daemon and return its result.
+
+    Raises DaemonUnavailable when nothing is listening (or PRISM_NO_DAEMON=1),
+    and QueryError for requests the daemon rejected.
+    """
+    if os.environ.get("PRISM_NO_DAEMON") == "1":
+        raise DaemonUnavailable("disabled by PRISM_NO_DAEMON")
+    path = Path(socket_path) if socket_path else default_socket_path()
+    payload = {"op": op, "args": args}
+    if themes_dir is not None:
+        payload["themes_dir"] = str(themes_dir)
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(CLIENT_TIMEOUT)
+            sock.connect(str(path))
+            sock.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+            chunks = []
+            while not chunks or not chunks[-1].endswith(b"\n"):
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+    except (OSError, AttributeError) as e:  # missing/stale socket, refused, timed out, reset
+        raise DaemonUnavailable(str(e)) from e
+    if not chunks:
+        raise DaemonUnavailable("daemon closed the connection")
+    response = json.loads(b"".join(chunks))
+    if not response.get("ok"):
+        raise QueryError(response.get("error", "unknown daemon error"))
+    return response["result"]
+
+def user_themes_dir() -> Optional[Path]:
+    """$PRISM_THEMES_DIR, or None to leave the choice to the daemon (THEMES_DIR in-process)"""
+    env = os.environ.get("PRISM_THEMES_DIR")
+    return Path(env) if env else None
+
+_local_indexes: Dict[str, ThemeIndex] = {}
+
+def query(op: str, themes_dir: Optional[Path] = None, socket_path: Optional[Path] = None, **args):
+    """Answer from the daemon when it is running, otherwise from an in-process ThemeIndex.
+
+    themes_dir defaults to user_themes_dir(); when that is unset too, the daemon
+    answers from the directory it was started with.
+    """
+    themes_dir = themes_dir or user_themes_dir()
+    try:
+        return request(op, socket_path, themes_dir, **args)
+    except DaemonUnavailable:
+        pass
+    key = str(themes_dir or THEMES_DIR)
+    index = _local_indexes.get(key)
+    if index is None:
+        index = _local_indexes[key] = ThemeIndex(Path(key))
+    index.refresh()
+    return getattr(index, op)(**args)
+
+def main():
+    parser = argparse.ArgumentParser(description="Prism daemon: keeps themes, contrast cache and writers hot for prism_cli")
+    sub = parser.add_subparsers(dest="command", required=True)
+    start = sub.add_parser("start", help="Run the daemon in the foreground")
+    start.add_argument("--themes-dir", type=Path, default=THEMES_DIR, help="Default themes directory")
+    sub.add_parser("status", help="Show daemon status")
+    sub.add_parser("stop", help="Stop a running daemon")
+    parser.add_argument("--socket", type=Path, default=None, help=f"Socket path (default: {default_socket_path()})")
+    args = parser.parse_args()
+    socket_path = args.socket or default_socket_path()
+
+    if args.command == "start":
+        try:
+            status = request("ping", socket_path)
+            print(f"prism daemon already running (pid {status['pid']}) on {socket_path}")
+            return 1
+        except DaemonUnavailable:
+            socket_path.unlink(missing_ok=True)  # stale socket from a killed daemon
+        asyncio.run(PrismDaemon(socket_path, args.themes_dir).serve())
+        return 0
+
+    try:
+        result = request("ping" if args.command == "status" else "shutdown", socket_path)
+    except DaemonUnavailable:
+        print(f"prism daemon is not running ({socket_path})")
+        return 1
+    if args.command == "status":
+        print(json.dumps(result, indent=2))
+    else:
+        print("prism daemon stopped")
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
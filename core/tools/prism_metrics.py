@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Prism Metrics - machine-readable run metrics for the generators
+
+Each generator counts what it did (themes, files and bytes written, files
+skipped, cache hits, ...) with count() and observe(). When metrics are on,
+one JSON Lines record per metric is emitted at exit, together with per-stage
+duration histograms taken from the prism_trace spans:
+
+    {"run": "3f9c…", "tool": "sync_themes", "kind": "run", "started": "2026-…", "duration_ms": 391.2, ...}
+    {"run": "3f9c…", "tool": "sync_themes", "kind": "counter", "name": "bytes_written", "value": 2391045}
+    {"run": "3f9c…", "tool": "sync_themes", "kind": "histogram", "name": "stage.render:kitty", "unit": "ms",
+     "count": 64, "sum": 0.77, "min": 0.01, "p50": 0.012, "p95": 0.018, "p99": 0.03, "max": 0.034}
+
+Metrics are off unless a CLI gets --metrics PATH (--metrics - for stdout), or
+PRISM_METRICS=PATH is set (so CI can collect every run without changing
+commands). Files are appended to, so one file accumulates a history of runs.
+On stdout the tool's own output moves to stderr, so stdout is pure JSON Lines.
+While off, count() and observe() return immediately.
+
+Usage:
+    python sync_themes.py --metrics - > run.jsonl          # JSON Lines on stdout
+    PRISM_METRICS=build/metrics.jsonl python sync_themes.py
+    python core/tools/prism_metrics.py build/metrics.jsonl  # table of the recorded runs
+"""
+
+import argparse
+import atexit
+import datetime
+import json
+import os
+import platform
+import sys
+import uuid
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Dict, List, Optional
+
+import prism_trace
+from prism_trace import percentile
+
+ENV_VAR = "PRISM_METRICS"
+STDOUT = "-"
+
+_metrics = None  # the active Metrics; None while metrics are off
+
+class Metrics:
+    """Counters and histograms for one run, emitted as JSON Lines."""
+
+    def __init__(self, tool: str, destination: str = STDOUT):
+        self.tool = tool
+        self.destination = destination
+        self.run = uuid.uuid4().hex[:12]
+        self.started = datetime.datetime.now(datetime.timezone.utc)
+        self.origin = perf_counter_ns()
+        self.counters: Dict[str, float] = {}
+        self.histograms: Dict[str, List[float]] = {}
+        self.tracer = prism_trace.ensure(tool)
+        self.stdout = sys.stdout
+
+    def count(self, name: str, value: float = 1):
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def observe(self, name: str, value: float):
+        self.histograms.setdefault(name, []).append(value)
+
+    def stage_histograms(self) -> Dict[str, List[float]]:
+        """Span durations in ms, keyed "stage.<span>"."""
+        tracer = prism_trace.current() or self.tracer
+        return {f"stage.{name}": [ns / 1e6 for ns in values] for name, values in tracer.durations().items()}
+
+    def records(self) -> List[dict]:
+        base = {"run": self.run, "tool": self.tool}
+        records = [{
+            **base, "kind": "run",
+            "started": self.started.isoformat(timespec="seconds"),
+            "duration_ms": round((perf_counter_ns() - self.origin) / 1e6, 3),
+            "argv": sys.argv[1:],
+            "python": platform.python_version(),
+            "host": platform.node(),
+        }]
+        for name, value in sorted(self.counters.items()):
+            records.append({**base, "kind": "counter", "name": name, "value": value})
+        for name, values in sorted({**self.histograms, **self.stage_histograms()}.items()):
+            ordered = sorted(values)
+            records.append({
+                **base, "kind": "histogram", "name": name,
+                **({"unit": "ms"} if name.startswith("stage.") else {}),
+                "count": len(ordered), "sum": round(sum(ordered), 6), "min": ordered[0],
+                "p50": percentile(ordered, 0.5), "p95": percentile(ordered, 0.95),
+                "p99": percentile(ordered, 0.99), "max": ordered[-1],
+            })
+        return records
+
+    def emit(self):
+        lines = "".join(json.dumps(record, separators=(",", ":")) + "\n" for record in self.records())
+        if self.destination == STDOUT:
+            self.stdout.write(lines)
+            self.stdout.flush()
+            return
+        path = Path(self.destination)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(lines)
+
+# ═══════════════════════════════════════════════════════════════════
+# Recording (no-ops while metrics are off)
+# ═══════════════════════════════════════════════════════════════════
+
+def count(name: str, value: float = 1):
+    if _metrics is not None:
+        _metrics.count(name, value)
+
+def observe(name: str, value: float):
+    if _metrics is not None:
+        _metrics.observe(name, value)
+
+def count_sink(sink):
+    """files_written/bytes_written from a theme_bundle sink, plus its link stats."""
+    if _metrics is None:
+        return
+    _metrics.count("files_written", sink.files)
+    _metrics.count("bytes_written", sink.bytes)
+    for kind, n in getattr(sink, "links", {}).items():
+        _metrics.count("files_skipped" if kind == "unchanged" else f"links.{kind}", n)
+
+# ═══════════════════════════════════════════════════════════════════
+# Enabling from a CLI
+# ═══════════════════════════════════════════════════════════════════
+
+def add_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--metrics", metavar="PATH",
+                        help=f"Append run metrics as JSON Lines to PATH, or '{STDOUT}' for stdout (also ${ENV_VAR})")
+
+def finish() -> Optional[Metrics]:
+    """Emit and stop collecting. Safe to call twice."""
+    global _metrics
+    metrics, _metrics = _metrics, None
+    if metrics is not None:
+        metrics.emit()
+        if metrics.destination == STDOUT:
+            sys.stdout = metrics.stdout
+    return metrics
+
+def start(args: argparse.Namespace, tool: str) -> Optional[Metrics]:
+    """Turn metrics on from --metrics or $PRISM_METRICS; records are emitted at exit.
+
+    Call after prism_trace.start() so stage durations come from the same tracer.
+    With stdout as the destination, sys.stdout is pointed at stderr until the
+    records are emitted.
+    """
+    global _metrics
+    destination = getattr(args, "metrics", None) or os.environ.get(ENV_VAR)
+    if not destination:
+        return None
+    finish()
+    _metrics = Metrics(tool, destination)
+    if destination == STDOUT:
+        sys.stdout = sys.stderr
+    atexit.register(finish)
+    return _metrics
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarize a metrics JSON Lines file")
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--tool", help="Only runs of this tool")
+    args = parser.parse_args()
+
+    runs = {}
+    for line in args.path.read_text(encoding="utf-8").splitlines():
+        record = json.loads(line)
+        if args.tool and record["tool"] != args.tool:
+            continue
+        run = runs.setdefault(record["run"], {"counters": {}})
+        if record["kind"] == "run":
+            run.update(record)
+        elif record["kind"] == "counter":
+            run["counters"][record["name"]] = record["value"]
+    print(f"  {'started':<26} {'tool':<20} {'ms':>9} {'files':>7} {'bytes':>11} {'skipped':>8}")
+    for run in runs.values():
+        counters = run["counters"]
+        print(f"  {run.get('started', '?'):<26} {run.get('tool', '?'):<20} {run.get('duration_ms', 0):>9.1f} "
+              f"{counters.get('files_written', 0):>7} {counters.get('bytes_written', 0):>11,} "
+              f"{counters.get('files_skipped', 0):>8}")
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
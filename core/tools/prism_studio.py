@@ -16,7 +16,6 @@ Usage:
     python prism_studio.py --themes-dir /path/to/themes
 """
 
-import json
 import math
 import os
 import sys
@@ -44,6 +43,11 @@ from textual.reactive import reactive
 from textual.message import Message
 from textual.widget import Widget
 
+from code_samples import ROLES, SAMPLES, sample_tokens
+from contrast_cache import contrast
+from format_writers import render
+from studio_colors import ThemeColors, generate_creator_colors, oklch_to_srgb, rgb_to_hex
+
 # ═══════════════════════════════════════════════════════════════════
 # Color Science Core (Lean4-verified implementations)
 # ═══════════════════════════════════════════════════════════════════
@@ -54,12 +58,6 @@ def srgb_to_linear(c: float) -> float:
         return c / 12.92
     return ((c + 0.055) / 1.055) ** 2.4
 
-def linear_to_srgb(c: float) -> float:
-    """sRGB gamma compression - verified in Lean4"""
-    if c <= 0.0031308:
-        return 12.92 * c
-    return 1.055 * (c ** (1/2.4)) - 0.055
-
 def relative_luminance(r: float, g: float, b: float) -> float:
     """WCAG relative luminance"""
     return 0.2126 * srgb_to_linear(r) + 0.7152 * srgb_to_linear(g) + 0.0722 * srgb_to_linear(b)
@@ -81,11 +79,6 @@ def hex_to_rgb(hex_color: str) -> Tuple[float, float, float]:
     except ValueError:
         return (0.5, 0.5, 0.5)
 
-def rgb_to_hex(r: float, g: float, b: float) -> str:
-    """RGB floats to hex"""
-    r, g, b = max(0, min(1, r)), max(0, min(1, g)), max(0, min(1, b))
-    return f"#{int(r*255):02x}{int(g*255):02x}{int(b*255):02x}"
-
 def wcag_rating(ratio: float) -> Tuple[str, str]:
     """Get WCAG level and color"""
     if ratio >= 7.0:
@@ -101,39 +94,6 @@ def wcag_rating(ratio: float) -> Tuple[str, str]:
 # OKLCH Color Space
 # ═══════════════════════════════════════════════════════════════════
 
-def oklch_to_oklab(l: float, c: float, h: float) -> Tuple[float, float, float]:
-    """OKLCH to OKLAB"""
-    h_rad = h * (math.pi / 180)
-    return (l, c * math.cos(h_rad), c * math.sin(h_rad))
-
-def oklab_to_linear_srgb(l: float, a: float, b: float) -> Tuple[float, float, float]:
-    """OKLAB to linear sRGB"""
-    l_ = l + 0.3963377774 * a + 0.2158037573 * b
-    m_ = l - 0.1055613458 * a - 0.0638541728 * b
-    s_ = l - 0.0894841775 * a - 1.2914855480 * b
-    
-    l_cubed = l_ ** 3
-    m_cubed = m_ ** 3
-    s_cubed = s_ ** 3
-    
-    r = 4.0767416621 * l_cubed - 3.3077115913 * m_cubed + 0.2309699292 * s_cubed
-    g = -1.2684380046 * l_cubed + 2.6097574011 * m_cubed - 0.3413193965 * s_cubed
-    b = -0.0041960863 * l_cubed - 0.7034186147 * m_cubed + 1.7076147010 * s_cubed
-    
-    return (r, g, b)
-
-def oklch_to_srgb(l: float, c: float, h: float) -> Tuple[float, float, float]:
-    """OKLCH to sRGB with gamut clipping"""
-    ok_l, ok_a, ok_b = oklch_to_oklab(l, c, h)
-    lin_r, lin_g, lin_b = oklab_to_linear_srgb(ok_l, ok_a, ok_b)
-    
-    # Gamut clip
-    lin_r = max(0, min(1, lin_r))
-    lin_g = max(0, min(1, lin_g))
-    lin_b = max(0, min(1, lin_b))
-    
-    return (linear_to_srgb(lin_r), linear_to_srgb(lin_g), linear_to_srgb(lin_b))
-
 def srgb_to_oklch(r: float, g: float, b: float) -> Tuple[float, float, float]:
     """sRGB to OKLCH"""
     # sRGB to linear
@@ -223,39 +183,6 @@ def simulate_hex_colorblind(hex_color: str, cb_type: ColorBlindness) -> str:
 # Theme Data Structures
 # ═══════════════════════════════════════════════════════════════════
 
-@dataclass
-class ThemeColors:
-    """Core theme colors"""
-    background: str = "#1a1a1a"
-    foreground: str = "#e0e0e0"
-    muted: str = "#808080"
-    accent: str = "#00a0e4"
-    
-    # Syntax colors
-    keyword: str = "#ff79c6"
-    string: str = "#f1fa8c"
-    function: str = "#50fa7b"
-    comment: str = "#6272a4"
-    number: str = "#bd93f9"
-    type: str = "#8be9fd"
-    operator: str = "#ff79c6"
-    variable: str = "#f8f8f2"
-    
-    # UI colors
-    selection_bg: str = "#44475a"
-    cursor: str = "#f8f8f2"
-    line_highlight: str = "#282a36"
-    
-    # ANSI terminal colors
-    black: str = "#0a0a0a"
-    red: str = "#ff5555"
-    green: str = "#50fa7b"
-    yellow: str = "#f1fa8c"
-    blue: str = "#6272a4"
-    magenta: str = "#ff79c6"
-    cyan: str = "#8be9fd"
-    white: str = "#f8f8f2"
-
 @dataclass
 class Theme:
     """Full theme definition"""
@@ -304,43 +231,6 @@ class Theme:
             }
         }
 
-# ═══════════════════════════════════════════════════════════════════
-# Sample Code for Preview
-# ═══════════════════════════════════════════════════════════════════
-
-SAMPLE_CODE = '''def fibonacci(n: int) -> int:
-    """Calculate the nth Fibonacci number."""
-    if n <= 1:
-        return n
-    # Recursive case with memoization
-    return fibonacci(n - 1) + fibonacci(n - 2)
-
-class ThemeEngine:
-    """OKLCH-based color theme generator."""
-    
-    BASE_HUE = 220.0
-    MAX_CHROMA = 0.15
-    
-    def __init__(self, name: str = "prism"):
-        self.name = name
-        self.palette: dict[str, str] = {}
-        self._initialized = False
-    
-    async def generate(self, hue: float) -> dict:
-        """Generate a complete theme palette."""
-        colors = await self._compute_palette(hue)
-        return {"name": self.name, "colors": colors}
-    
-    def validate_contrast(self, fg: str, bg: str) -> bool:
-        ratio = calculate_contrast(fg, bg)
-        return ratio >= 4.5  # WCAG AA
-
-# Usage example
-engine = ThemeEngine("midnight")
-theme = await engine.generate(hue=265)
-print(f"Generated: {theme['name']}")
-'''
-
 # ═══════════════════════════════════════════════════════════════════
 # Color Wheel Widget
 # ═══════════════════════════════════════════════════════════════════
@@ -419,6 +309,7 @@ class SyntaxPreview(Static):
         super().__init__(**kwargs)
         self.theme_colors = ThemeColors()
         self.colorblind_mode = ColorBlindness.NONE
+        self.sample = next(iter(SAMPLES))
     
     def set_colors(self, colors: ThemeColors):
         self.theme_colors = colors
@@ -432,86 +323,30 @@ class SyntaxPreview(Static):
         """Apply colorblind simulation to a color"""
         return simulate_hex_colorblind(hex_color, self.colorblind_mode)
     
+    def next_sample(self):
+        names = list(SAMPLES)
+        self.sample = names[(names.index(self.sample) + 1) % len(names)]
+        self.refresh()
+    
     def render(self):
         c = self.theme_colors
         cb = self._apply_colorblind
         
-        text = Text()
-        
-        # Keywords and builtins
-        keywords = {'def', 'class', 'return', 'if', 'else', 'for', 'while', 'import',
-                   'from', 'async', 'await', 'with', 'as', 'try', 'except', 'raise'}
-        builtins = {'int', 'str', 'float', 'bool', 'dict', 'list', 'print', 'True', 'False', 'None'}
+        # One style per role; the sample's runs are lexed once and only re-colored here
+        styles = {role: Style(color=cb(getattr(c, role, c.foreground))) for role in ROLES}
+        styles["fg"] = Style(color=cb(c.foreground))
+        styles["keyword"] = Style(color=cb(c.keyword), bold=True)
+        styles["comment"] = Style(color=cb(c.comment), italic=True)
         
-        lines = SAMPLE_CODE.split('\n')
-        for line in lines:
-            i = 0
-            while i < len(line):
-                # Comments
-                if line[i] == '#':
-                    text.append(line[i:], style=Style(color=cb(c.comment), italic=True))
-                    break
-                
-                # Strings
-                if line[i] in '"\'':
-                    quote = line[i]
-                    if line[i:i+3] in ('"""', "'''"):
-                        end = line.find(line[i:i+3], i+3)
-                        end = len(line) if end == -1 else end + 3
-                        text.append(line[i:end], style=Style(color=cb(c.string)))
-                        i = end
-                        continue
-                    else:
-                        end = line.find(quote, i+1)
-                        end = len(line) if end == -1 else end + 1
-                        text.append(line[i:end], style=Style(color=cb(c.string)))
-                        i = end
-                        continue
-                
-                # Numbers
-                if line[i].isdigit():
-                    j = i
-                    while j < len(line) and (line[j].isdigit() or line[j] == '.'):
-                        j += 1
-                    text.append(line[i:j], style=Style(color=cb(c.number)))
-                    i = j
-                    continue
-                
-                # Identifiers
-                if line[i].isalpha() or line[i] == '_':
-                    j = i
-                    while j < len(line) and (line[j].isalnum() or line[j] == '_'):
-                        j += 1
-                    word = line[i:j]
-                    
-                    if word in keywords:
-                        text.append(word, style=Style(color=cb(c.keyword), bold=True))
-                    elif word in builtins:
-                        text.append(word, style=Style(color=cb(c.type)))
-                    elif j < len(line) and line[j] == '(':
-                        text.append(word, style=Style(color=cb(c.function)))
-                    elif word.isupper():
-                        text.append(word, style=Style(color=cb(c.number)))
-                    else:
-                        text.append(word, style=Style(color=cb(c.foreground)))
-                    i = j
-                    continue
-                
-                # Operators
-                if line[i] in '=+-*/<>!&|:':
-                    text.append(line[i], style=Style(color=cb(c.operator)))
-                    i += 1
-                    continue
-                
-                # Default
-                text.append(line[i], style=Style(color=cb(c.foreground)))
-                i += 1
-            
+        text = Text()
+        for runs in sample_tokens(self.sample):
+            for run, role in runs:
+                text.append(run, style=styles[role])
             text.append("\n")
         
         return Panel(
             text,
-            title="Preview",
+            title=f"Preview [dim]{self.sample}[/dim]",
             border_style=Style(color=cb(c.accent)),
             style=Style(bgcolor=cb(c.background))
         )
@@ -533,8 +368,6 @@ class ContrastAuditor(Static):
     
     def render(self):
         c = self.theme_colors
-        bg_rgb = hex_to_rgb(c.background)
-        bg_lum = relative_luminance(*bg_rgb)
         
         table = Table(title="WCAG Contrast Audit", border_style="cyan", expand=True)
         table.add_column("Element", style="bold")
@@ -556,9 +389,7 @@ class ContrastAuditor(Static):
         ]
         
         for name, color in checks:
-            fg_rgb = hex_to_rgb(color)
-            fg_lum = relative_luminance(*fg_rgb)
-            ratio = contrast_ratio(fg_lum, bg_lum)
+            ratio = contrast(color, c.background)
             
             aa = "✓" if ratio >= 4.5 else "✗"
             aaa = "✓" if ratio >= 7.0 else "✗"
@@ -667,74 +498,7 @@ class ThemeCreator(Static):
             return
         
         self.is_dark = self.bg_lightness < 0.5
-        
-        h = self.base_hue
-        c = self.base_chroma
-        
-        # Generate harmonious colors
-        colors = ThemeColors()
-        
-        # Background and foreground
-        bg_r, bg_g, bg_b = oklch_to_srgb(self.bg_lightness, c * 0.3, h)
-        fg_r, fg_g, fg_b = oklch_to_srgb(self.fg_lightness, c * 0.1, h)
-        
-        colors.background = rgb_to_hex(bg_r, bg_g, bg_b)
-        colors.foreground = rgb_to_hex(fg_r, fg_g, fg_b)
-        
-        # Muted text (between bg and fg lightness)
-        muted_l = (self.bg_lightness + self.fg_lightness) / 2
-        muted_r, muted_g, muted_b = oklch_to_srgb(muted_l, c * 0.2, h)
-        colors.muted = rgb_to_hex(muted_r, muted_g, muted_b)
-        
-        # Accent (complement with higher chroma)
-        acc_r, acc_g, acc_b = oklch_to_srgb(0.7, c * 1.5, h)
-        colors.accent = rgb_to_hex(acc_r, acc_g, acc_b)
-        
-        # Syntax colors (triadic + analogous harmony)
-        syntax_l = 0.75 if self.is_dark else 0.45
-        
-        kw_r, kw_g, kw_b = oklch_to_srgb(syntax_l, c * 1.3, (h + 300) % 360)  # Keyword - pink/purple
-        colors.keyword = rgb_to_hex(kw_r, kw_g, kw_b)
-        
-        str_r, str_g, str_b = oklch_to_srgb(syntax_l + 0.05, c * 1.2, (h + 60) % 360)  # String - yellow/green
-        colors.string = rgb_to_hex(str_r, str_g, str_b)
-        
-        fn_r, fn_g, fn_b = oklch_to_srgb(syntax_l, c * 1.4, (h + 120) % 360)  # Function - green/cyan
-        colors.function = rgb_to_hex(fn_r, fn_g, fn_b)
-        
-        cmt_l = muted_l + (0.1 if self.is_dark else -0.1)
-        cmt_r, cmt_g, cmt_b = oklch_to_srgb(cmt_l, c * 0.5, h)  # Comment - muted base
-        colors.comment = rgb_to_hex(cmt_r, cmt_g, cmt_b)
-        
-        num_r, num_g, num_b = oklch_to_srgb(syntax_l, c * 1.2, (h + 240) % 360)  # Number - purple/blue
-        colors.number = rgb_to_hex(num_r, num_g, num_b)
-        
-        typ_r, typ_g, typ_b = oklch_to_srgb(syntax_l + 0.05, c * 1.1, (h + 180) % 360)  # Type - cyan
-        colors.type = rgb_to_hex(typ_r, typ_g, typ_b)
-        
-        colors.operator = colors.keyword
-        colors.variable = colors.foreground
-        
-        # UI colors
-        sel_l = self.bg_lightness + (0.1 if self.is_dark else -0.1)
-        sel_r, sel_g, sel_b = oklch_to_srgb(sel_l, c * 0.4, h)
-        colors.selection_bg = rgb_to_hex(sel_r, sel_g, sel_b)
-        
-        colors.cursor = colors.accent
-        
-        line_l = self.bg_lightness + (0.03 if self.is_dark else -0.03)
-        line_r, line_g, line_b = oklch_to_srgb(line_l, c * 0.2, h)
-        colors.line_highlight = rgb_to_hex(line_r, line_g, line_b)
-        
-        # Terminal ANSI colors
-        colors.black = colors.background
-        colors.red = rgb_to_hex(*oklch_to_srgb(0.65, 0.2, 25))
-        colors.green = rgb_to_hex(*oklch_to_srgb(0.7, 0.18, 145))
-        colors.yellow = rgb_to_hex(*oklch_to_srgb(0.8, 0.15, 85))
-        colors.blue = rgb_to_hex(*oklch_to_srgb(0.6, 0.15, 250))
-        colors.magenta = rgb_to_hex(*oklch_to_srgb(0.65, 0.2, 320))
-        colors.cyan = rgb_to_hex(*oklch_to_srgb(0.75, 0.12, 195))
-        colors.white = colors.foreground
+        colors = generate_creator_colors(self.base_hue, self.base_chroma, self.bg_lightness, self.fg_lightness)
         
         self.post_message(self.ColorChanged(colors))
 
@@ -743,234 +507,61 @@ class ThemeCreator(Static):
 # ═══════════════════════════════════════════════════════════════════
 
 class ExportManager:
-    """Generate theme files for various platforms"""
+    """Generate theme files for various platforms (format_writers "studio" family)"""
+    
+    @staticmethod
+    def values(theme: Theme) -> dict:
+        """Writer slots: ThemeColors fields plus name, author and theme_type"""
+        return {**vars(theme.colors), "name": theme.name, "author": theme.author, "theme_type": theme.type}
+    
+    @staticmethod
+    def export(theme: Theme, fmt: str) -> str:
+        return render("studio", fmt, ExportManager.values(theme))
     
     @staticmethod
     def to_opencode(theme: Theme) -> str:
         """Generate OpenCode JSON theme"""
-        return json.dumps(theme.to_dict(), indent=2)
+        return ExportManager.export(theme, "opencode")
     
     @staticmethod
     def to_vscode(theme: Theme) -> str:
         """Generate VS Code JSON theme"""
-        c = theme.colors
-        return json.dumps({
-            "name": f"Prism {theme.name}",
-            "type": theme.type,
-            "colors": {
-                "editor.background": c.background,
-                "editor.foreground": c.foreground,
-                "editorCursor.foreground": c.cursor,
-                "editor.selectionBackground": c.selection_bg,
-                "editor.lineHighlightBackground": c.line_highlight,
-                "activityBar.background": c.background,
-                "sideBar.background": c.background,
-                "statusBar.background": c.background,
-                "titleBar.activeBackground": c.background,
-            },
-            "tokenColors": [
-                {"scope": "comment", "settings": {"foreground": c.comment, "fontStyle": "italic"}},
-                {"scope": "keyword", "settings": {"foreground": c.keyword}},
-                {"scope": "string", "settings": {"foreground": c.string}},
-                {"scope": "entity.name.function", "settings": {"foreground": c.function}},
-                {"scope": "constant.numeric", "settings": {"foreground": c.number}},
-                {"scope": "entity.name.type", "settings": {"foreground": c.type}},
-                {"scope": "variable", "settings": {"foreground": c.variable}},
-            ]
-        }, indent=2)
+        return ExportManager.export(theme, "vscode")
     
     @staticmethod
     def to_alacritty(theme: Theme) -> str:
         """Generate Alacritty TOML theme"""
-        c = theme.colors
-        return f'''# Prism Theme: {theme.name}
-[colors.primary]
-background = "{c.background}"
-foreground = "{c.foreground}"
-
-[colors.cursor]
-text = "{c.background}"
-cursor = "{c.cursor}"
-
-[colors.selection]
-text = "{c.foreground}"
-background = "{c.selection_bg}"
-
-[colors.normal]
-black = "{c.black}"
-red = "{c.red}"
-green = "{c.green}"
-yellow = "{c.yellow}"
-blue = "{c.blue}"
-magenta = "{c.magenta}"
-cyan = "{c.cyan}"
-white = "{c.white}"
-'''
+        return ExportManager.export(theme, "alacritty")
     
     @staticmethod
     def to_kitty(theme: Theme) -> str:
         """Generate Kitty conf theme"""
-        c = theme.colors
-        return f'''# Prism Theme: {theme.name}
-foreground {c.foreground}
-background {c.background}
-cursor {c.cursor}
-selection_foreground {c.foreground}
-selection_background {c.selection_bg}
-
-color0 {c.black}
-color1 {c.red}
-color2 {c.green}
-color3 {c.yellow}
-color4 {c.blue}
-color5 {c.magenta}
-color6 {c.cyan}
-color7 {c.white}
-'''
+        return ExportManager.export(theme, "kitty")
     
     @staticmethod
     def to_windows_terminal(theme: Theme) -> str:
         """Generate Windows Terminal JSON theme"""
-        c = theme.colors
-        return json.dumps({
-            "name": f"Prism {theme.name}",
-            "background": c.background,
-            "foreground": c.foreground,
-            "cursorColor": c.cursor,
-            "selectionBackground": c.selection_bg,
-            "black": c.black,
-            "red": c.red,
-            "green": c.green,
-            "yellow": c.yellow,
-            "blue": c.blue,
-            "purple": c.magenta,
-            "cyan": c.cyan,
-            "white": c.white,
-            "brightBlack": c.muted,
-            "brightRed": c.red,
-            "brightGreen": c.green,
-            "brightYellow": c.yellow,
-            "brightBlue": c.blue,
-            "brightPurple": c.magenta,
-            "brightCyan": c.cyan,
-            "brightWhite": c.white
-        }, indent=2)
+        return ExportManager.export(theme, "windows-terminal")
     
     @staticmethod
     def to_jetbrains(theme: Theme) -> str:
         """Generate JetBrains .icls XML theme"""
-        c = theme.colors
-        
-        def hex_to_jetbrains(hex_color: str) -> str:
-            """Convert #rrggbb to JetBrains RRGGBB format"""
-            return hex_color.lstrip('#').upper()
-        
-        return f'''<?xml version="1.0" encoding="UTF-8"?>
-<scheme name="Prism {theme.name}" version="142" parent_scheme="Darcula">
-  <colors>
-    <option name="CARET_COLOR" value="{hex_to_jetbrains(c.cursor)}" />
-    <option name="CARET_ROW_COLOR" value="{hex_to_jetbrains(c.line_highlight)}" />
-    <option name="CONSOLE_BACKGROUND_KEY" value="{hex_to_jetbrains(c.background)}" />
-    <option name="GUTTER_BACKGROUND" value="{hex_to_jetbrains(c.background)}" />
-    <option name="SELECTION_BACKGROUND" value="{hex_to_jetbrains(c.selection_bg)}" />
-  </colors>
-  <attributes>
-    <option name="DEFAULT_KEYWORD">
-      <value><option name="FOREGROUND" value="{hex_to_jetbrains(c.keyword)}" /></value>
-    </option>
-    <option name="DEFAULT_STRING">
-      <value><option name="FOREGROUND" value="{hex_to_jetbrains(c.string)}" /></value>
-    </option>
-    <option name="DEFAULT_FUNCTION_DECLARATION">
-      <value><option name="FOREGROUND" value="{hex_to_jetbrains(c.function)}" /></value>
-    </option>
-    <option name="DEFAULT_LINE_COMMENT">
-      <value><option name="FOREGROUND" value="{hex_to_jetbrains(c.comment)}" /><option name="FONT_TYPE" value="2" /></value>
-    </option>
-    <option name="DEFAULT_NUMBER">
-      <value><option name="FOREGROUND" value="{hex_to_jetbrains(c.number)}" /></value>
-    </option>
-    <option name="DEFAULT_CLASS_NAME">
-      <value><option name="FOREGROUND" value="{hex_to_jetbrains(c.type)}" /></value>
-    </option>
-  </attributes>
-</scheme>
-'''
+        return ExportManager.export(theme, "jetbrains")
     
     @staticmethod
     def to_wezterm(theme: Theme) -> str:
         """Generate WezTerm TOML theme"""
-        c = theme.colors
-        return f'''# Prism Theme: {theme.name}
-[colors]
-foreground = "{c.foreground}"
-background = "{c.background}"
-cursor_bg = "{c.cursor}"
-cursor_fg = "{c.background}"
-selection_fg = "{c.foreground}"
-selection_bg = "{c.selection_bg}"
-
-ansi = ["{c.black}", "{c.red}", "{c.green}", "{c.yellow}", "{c.blue}", "{c.magenta}", "{c.cyan}", "{c.white}"]
-brights = ["{c.muted}", "{c.red}", "{c.green}", "{c.yellow}", "{c.blue}", "{c.magenta}", "{c.cyan}", "{c.white}"]
-
-[metadata]
-name = "Prism {theme.name}"
-'''
+        return ExportManager.export(theme, "wezterm")
     
     @staticmethod
     def to_zed(theme: Theme) -> str:
         """Generate Zed JSON theme"""
-        c = theme.colors
-        return json.dumps({
-            "$schema": "https://zed.dev/schema/themes/v0.1.0.json",
-            "name": f"Prism {theme.name}",
-            "author": theme.author,
-            "themes": [{
-                "name": f"Prism {theme.name}",
-                "appearance": "dark" if theme.type == "dark" else "light",
-                "style": {
-                    "background": c.background,
-                    "editor.background": c.background,
-                    "editor.foreground": c.foreground,
-                    "editor.line_highlight": c.line_highlight,
-                    "syntax": {
-                        "comment": {"color": c.comment, "font_style": "italic"},
-                        "keyword": {"color": c.keyword},
-                        "string": {"color": c.string},
-                        "function": {"color": c.function},
-                        "number": {"color": c.number},
-                        "type": {"color": c.type},
-                    }
-                }
-            }]
-        }, indent=2)
+        return ExportManager.export(theme, "zed")
     
     @staticmethod
     def to_helix(theme: Theme) -> str:
         """Generate Helix TOML theme"""
-        c = theme.colors
-        return f'''# Prism Theme: {theme.name}
-# Place in ~/.config/helix/themes/
-
-"ui.background" = {{ bg = "{c.background}" }}
-"ui.text" = "{c.foreground}"
-"ui.cursor" = {{ bg = "{c.cursor}", fg = "{c.background}" }}
-"ui.selection" = {{ bg = "{c.selection_bg}" }}
-"ui.linenr" = "{c.muted}"
-"ui.cursorline" = {{ bg = "{c.line_highlight}" }}
-
-"comment" = {{ fg = "{c.comment}", modifiers = ["italic"] }}
-"keyword" = "{c.keyword}"
-"string" = "{c.string}"
-"function" = "{c.function}"
-"constant.numeric" = "{c.number}"
-"type" = "{c.type}"
-"variable" = "{c.variable}"
-
-[palette]
-background = "{c.background}"
-foreground = "{c.foreground}"
-'''
+        return ExportManager.export(theme, "helix")
 
 # ═══════════════════════════════════════════════════════════════════
 # Main Application
@@ -1065,6 +656,7 @@ class PrismStudio(App):
         Binding("g", "generate", "Generate"),
         Binding("r", "randomize", "Random"),
         Binding("e", "export", "Export"),
+        Binding("s", "next_sample", "Sample"),
         Binding("1", "tab_create", "Create"),
         Binding("2", "tab_preview", "Preview"),
         Binding("3", "tab_export", "Export"),
@@ -1221,6 +813,9 @@ class PrismStudio(App):
         creator = self.query_one("#creator", ThemeCreator)
         creator._randomize()
     
+    def action_next_sample(self):
+        self.query_one("#preview", SyntaxPreview).next_sample()
+    
     def action_tab_create(self):
         self.query_one(TabbedContent).active = "tab-create"
     
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Prism Trace - named spans, cProfile dumps and Chrome traces for the generators
+
+The generators wrap their stages (load, extract, color, render, write) in
+spans:
+
+    from prism_trace import span
+    with span("render", fmt):
+        text = writer.render(values)
+
+Tracing stays off unless a CLI turns it on with --trace or --profile (see
+add_arguments/start). While it is off, span() returns one shared no-op
+context manager, so an instrumented loop pays only a global lookup and a call.
+
+    --trace PATH     Chrome trace-event JSON (open in ui.perfetto.dev or chrome://tracing)
+    --profile PATH   cProfile stats (python -m pstats PATH, snakeviz, ...)
+
+Either flag also prints a per-span summary to stderr at exit: count, total,
+mean, p50, p95, max, and the share of wall time. Spans with a detail
+("render:kitty") are summarized separately from each other.
+
+Usage:
+    python sync_themes.py --trace build/sync.trace.json
+    python core/tools/generate_all_themes.py --profile build/all.prof
+    python core/tools/prism_trace.py build/sync.trace.json      # summary of a saved trace
+"""
+
+import argparse
+import atexit
+import cProfile
+import json
+import math
+import os
+import sys
+import threading
+from functools import wraps
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Dict, List, Optional
+
+_tracer = None  # the active Tracer; None while tracing is off
+
+# ═══════════════════════════════════════════════════════════════════
+# Spans
+# ═══════════════════════════════════════════════════════════════════
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+NULL_SPAN = _NullSpan()
+
+class _Span:
+    __slots__ = ("tracer", "name", "cat", "args", "start")
+
+    def __init__(self, tracer, name, cat, args):
+        self.tracer = tracer
+        self.name = name
+        self.cat = cat
+        self.args = args
+
+    def __enter__(self):
+        self.start = perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.tracer.record(self.name, self.cat, self.start, perf_counter_ns(), self.args)
+        return False
+
+def span(name: str, detail: Optional[str] = None, **args):
+    """Time a stage. detail splits the summary ("render:kitty"); args only go into the trace."""
+    if _tracer is None:
+        return NULL_SPAN
+    return _Span(_tracer, name if detail is None else f"{name}:{detail}", name, args)
+
+def traced(name: str):
+    """Decorator form of span() for whole functions."""
+    def decorate(fn):
+        @wraps(fn)
+        def wrapper(*a, **kw):
+            if _tracer is None:
+                return fn(*a, **kw)
+            with _Span(_tracer, name, name, {}):
+                return fn(*a, **kw)
+        return wrapper
+    return decorate
+
+def enabled() -> bool:
+    return _tracer is not None
+
+def current() -> Optional["Tracer"]:
+    return _tracer
+
+# ═══════════════════════════════════════════════════════════════════
+# Tracer
+# ═══════════════════════════════════════════════════════════════════
+
+class Tracer:
+    """Collects span events, and cProfile stats when given a profile path."""
+
+    def __init__(self, trace: Optional[Path] = None, profile: Optional[Path] = None, label: str = ""):
+        self.trace_path = Path(trace) if trace else None
+        self.profile_path = Path(profile) if profile else None
+        self.label = label or Path(sys.argv[0]).name
+        self.events = []   # (name, cat, start_ns, end_ns, tid, args)
+        self.origin = perf_counter_ns()
+        self.end = None
+        self.profiler = cProfile.Profile() if profile else None
+        if self.profiler:
+            self.profiler.enable()
+
+    def record(self, name, cat, start, end, args):
+        self.events.append((name, cat, start, end, threading.get_ident(), args))
+
+    def stop(self):
+        if self.end is None:
+            self.end = perf_counter_ns()
+            if self.profiler:
+                self.profiler.disable()
+
+    @property
+    def wall_ns(self) -> int:
+        return (self.end or perf_counter_ns()) - self.origin
+
+    def chrome_trace(self) -> dict:
+        """Trace-event format: one complete ("X") event per span, microsecond timestamps."""
+        pid = os.getpid()
+        events = [{"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": self.label}}]
+        for name, cat, start, end, tid, args in self.events:
+            event = {"name": name, "cat": cat, "ph": "X", "pid": pid, "tid": tid,
+                     "ts": (start - self.origin) / 1000, "dur": (end - start) / 1000}
+            if args:
+                event["args"] = args
+            events.append(event)
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def durations(self) -> Dict[str, List[int]]:
+        spans = {}
+        for name, _, start, end, _, _ in self.events:
+            spans.setdefault(name, []).append(end - start)
+        return spans
+
+    def write(self):
+        self.stop()
+        if self.trace_path:
+            self.trace_path.parent.mkdir(parents=True, exist_ok=True)
+            self.trace_path.write_text(json.dumps(self.chrome_trace()), encoding="utf-8")
+        if self.profiler:
+            self.profile_path.parent.mkdir(parents=True, exist_ok=True)
+            self.profiler.dump_stats(str(self.profile_path))
+
+# ═══════════════════════════════════════════════════════════════════
+# Summary
+# ═══════════════════════════════════════════════════════════════════
+
+def percentile(ordered: List[int], q: float) -> int:
+    """Nearest-rank percentile of an ascending list."""
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(q * len(ordered)) - 1))]
+
+def summary(durations: Dict[str, List[int]], wall_ns: int, title: str = "") -> str:
+    """Span table, largest total first. Nested spans overlap, so shares can add up past 100%."""
+    ms = lambda ns: f"{ns / 1e6:9.3f}"
+    lines = [f"{title or 'Spans'}: wall {wall_ns / 1e6:.1f} ms",
+             f"  {'span':<28} {'count':>6} {'total ms':>9} {'mean':>9} {'p50':>9} {'p95':>9} {'max':>9} {'share':>6}"]
+    rows = sorted(durations.items(), key=lambda item: -sum(item[1]))
+    for name, values in rows:
+        ordered = sorted(values)
+        total = sum(ordered)
+        share = 100 * total / wall_ns if wall_ns else 0.0
+        lines.append(f"  {name:<28} {len(ordered):>6} {ms(total)} {ms(total / len(ordered))} "
+                     f"{ms(percentile(ordered, 0.5))} {ms(percentile(ordered, 0.95))} {ms(ordered[-1])} {share:5.1f}%")
+    return "\n".join(lines)
+
+# ═══════════════════════════════════════════════════════════════════
+# Enabling from a CLI
+# ═══════════════════════════════════════════════════════════════════
+
+def add_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--profile", type=Path, metavar="PATH", help="Write cProfile stats to PATH (prints a span summary)")
+    parser.add_argument("--trace", type=Path, metavar="PATH",
+                        help="Write a Chrome trace-event JSON to PATH for Perfetto (prints a span summary)")
+
+def enable(trace: Optional[Path] = None, profile: Optional[Path] = None, label: str = "") -> Tracer:
+    global _tracer
+    if _tracer is not None:
+        finish()
+    _tracer = Tracer(trace, profile, label)
+    return _tracer
+
+def finish(out=None) -> Optional[Tracer]:
+    """Stop tracing, write the trace/profile files and print the summary. Safe to call twice."""
+    global _tracer
+    tracer, _tracer = _tracer, None
+    if tracer is None:
+        return None
+    tracer.write()
+    if not (tracer.trace_path or tracer.profile_path):
+        return tracer
+    out = out or sys.stderr
+    print(f"\n{summary(tracer.durations(), tracer.wall_ns, tracer.label)}", file=out)
+    for kind, path in (("trace", tracer.trace_path), ("profile", tracer.profile_path)):
+        if path:
+            print(f"  {kind} -> {path}", file=out)
+    return tracer
+
+def ensure(label: str = "") -> Tracer:
+    """The active tracer, or a new one that only collects spans (no files, no summary).
+
+    prism_metrics uses this to read per-stage durations without --trace/--profile.
+    """
+    return _tracer or enable(label=label)
+
+def start(args: argparse.Namespace, label: str = "") -> Optional[Tracer]:
+    """Enable tracing if --trace/--profile were given; results are written at exit."""
+    if not (getattr(args, "trace", None) or getattr(args, "profile", None)):
+        return None
+    tracer = enable(args.trace, args.profile, label)
+    atexit.register(finish)
+    return tracer
+
+def start_from_argv(argv: List[str], label: str = "") -> List[str]:
+    """start() for CLIs that parse their own arguments: strips --trace/--profile from argv."""
+    parser = argparse.ArgumentParser(add_help=False)
+    add_arguments(parser)
+    args, rest = parser.parse_known_args(argv)
+    start(args, label)
+    return rest
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarize a Chrome trace written with --trace")
+    parser.add_argument("trace", type=Path)
+    args = parser.parse_args()
+
+    events = json.loads(args.trace.read_text(encoding="utf-8"))["traceEvents"]
+    spans = [e for e in events if e.get("ph") == "X"]
+    durations = {}
+    for e in spans:
+        durations.setdefault(e["name"], []).append(int(e["dur"] * 1000))
+    wall = max((e["ts"] + e["dur"] for e in spans), default=0) - min((e["ts"] for e in spans), default=0)
+    print(summary(durations, int(wall * 1000), str(args.trace)))
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
@@ -19,7 +19,6 @@ import sys
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
-from rich.console import Console
 from rich.style import Style
 from rich.syntax import Syntax
 from rich.text import Text
@@ -35,6 +34,9 @@ from textual.widgets import (
 from textual.binding import Binding
 from textual.reactive import reactive
 
+from code_samples import ROLES, SAMPLES, sample_tokens
+from contrast_cache import contrast
+
 # ═══════════════════════════════════════════════════════════════════
 # Color Science (mirrors Lean4 verified implementations)
 # ═══════════════════════════════════════════════════════════════════
@@ -109,34 +111,6 @@ def oklch_to_srgb(l: float, c: float, h: float) -> Tuple[float, float, float]:
 # Theme Loading
 # ═══════════════════════════════════════════════════════════════════
 
-SAMPLE_CODE = '''def fibonacci(n: int) -> int:
-    """Calculate the nth Fibonacci number."""
-    if n <= 1:
-        return n
-    # Recursive case
-    return fibonacci(n - 1) + fibonacci(n - 2)
-
-class ThemeEngine:
-    """OKLCH-based color theme generator."""
-    
-    def __init__(self, base_hue: float = 220.0):
-        self.base_hue = base_hue
-        self.palette = {}
-    
-    async def generate(self) -> dict:
-        colors = await self._compute_palette()
-        return {"name": "prism", "colors": colors}
-    
-    def _validate_contrast(self, fg: str, bg: str) -> bool:
-        ratio = contrast_ratio(fg, bg)
-        return ratio >= 4.5  # WCAG AA
-
-# Usage
-engine = ThemeEngine(base_hue=145)
-theme = await engine.generate()
-print(f"Generated: {theme['name']}")
-'''
-
 def load_themes(themes_dir: Path) -> Dict[str, dict]:
     """Load all themes from directory"""
     themes = {}
@@ -201,11 +175,7 @@ class ContrastBadge(Static):
         self.bg = bg
     
     def render(self):
-        fg_rgb = hex_to_rgb(self.fg)
-        bg_rgb = hex_to_rgb(self.bg)
-        fg_lum = relative_luminance(*fg_rgb)
-        bg_lum = relative_luminance(*bg_rgb)
-        ratio = contrast_ratio(fg_lum, bg_lum)
+        ratio = contrast(self.fg, self.bg)
         rating, color = wcag_rating(ratio)
         
         text = Text()
@@ -217,6 +187,7 @@ class ThemePreview(Static):
     """Live syntax-highlighted code preview"""
     
     theme_name = reactive("")
+    sample = reactive(next(iter(SAMPLES)))
     
     def __init__(self, themes: Dict[str, dict], **kwargs):
         super().__init__(**kwargs)
@@ -228,100 +199,37 @@ class ThemePreview(Static):
             self._current_colors = get_theme_colors(self.themes[theme_name])
             self.refresh()
     
+    def watch_sample(self, sample: str):
+        self.refresh()
+    
     def render(self):
         if not self._current_colors:
             return Text("Select a theme to preview", style="dim italic")
         
         colors = self._current_colors
-        console = Console(force_terminal=True, color_system="truecolor")
+        # One style per role; the sample's runs are lexed once and only re-colored here
+        styles = {role: Style(color=colors.get(role, colors["fg"])) for role in ROLES}
+        styles["keyword"] = Style(color=colors["keyword"], bold=True)
+        styles["comment"] = Style(color=colors["comment"], italic=True)
         
-        # Build custom syntax theme
         text = Text()
         
         # Header
         text.append("─" * 60 + "\n", style=Style(color=colors["muted"]))
         
-        # Simulate syntax highlighting
-        lines = SAMPLE_CODE.split('\n')
-        for line in lines:
-            self._highlight_line(text, line, colors)
+        for runs in sample_tokens(self.sample):
+            for run, role in runs:
+                text.append(run, style=styles[role])
             text.append("\n")
         
         text.append("─" * 60, style=Style(color=colors["muted"]))
         
         return Panel(
             text,
-            title=f"[bold]{self.theme_name}[/bold]",
+            title=f"[bold]{self.theme_name}[/bold] [dim]{self.sample}[/dim]",
             border_style=Style(color=colors["accent"]),
             style=Style(bgcolor=colors["bg"])
         )
-    
-    def _highlight_line(self, text: Text, line: str, colors: dict):
-        """Simple syntax highlighting"""
-        keywords = {'def', 'class', 'return', 'if', 'else', 'for', 'while', 'import', 
-                   'from', 'async', 'await', 'with', 'as', 'try', 'except', 'raise'}
-        builtins = {'int', 'str', 'float', 'bool', 'dict', 'list', 'print', 'True', 'False', 'None'}
-        
-        i = 0
-        while i < len(line):
-            # Comments
-            if line[i] == '#':
-                text.append(line[i:], style=Style(color=colors["comment"], italic=True))
-                return
-            
-            # Strings
-            if line[i] in '"\'':
-                quote = line[i]
-                # Check for triple quotes
-                if line[i:i+3] in ('"""', "'''"):
-                    end = line.find(line[i:i+3], i+3)
-                    if end == -1:
-                        end = len(line)
-                    else:
-                        end += 3
-                    text.append(line[i:end], style=Style(color=colors["string"]))
-                    i = end
-                    continue
-                else:
-                    end = line.find(quote, i+1)
-                    if end == -1:
-                        end = len(line)
-                    else:
-                        end += 1
-                    text.append(line[i:end], style=Style(color=colors["string"]))
-                    i = end
-                    continue
-            
-            # Numbers
-            if line[i].isdigit():
-                j = i
-                while j < len(line) and (line[j].isdigit() or line[j] == '.'):
-                    j += 1
-                text.append(line[i:j], style=Style(color=colors["number"]))
-                i = j
-                continue
-            
-            # Identifiers
-            if line[i].isalpha() or line[i] == '_':
-                j = i
-                while j < len(line) and (line[j].isalnum() or line[j] == '_'):
-                    j += 1
-                word = line[i:j]
-                
-                if word in keywords:
-                    text.append(word, style=Style(color=colors["keyword"], bold=True))
-                elif word in builtins:
-                    text.append(word, style=Style(color=colors["type"]))
-                elif j < len(line) and line[j] == '(':
-                    text.append(word, style=Style(color=colors["function"]))
-                else:
-                    text.append(word, style=Style(color=colors["fg"]))
-                i = j
-                continue
-            
-            # Operators and punctuation
-            text.append(line[i], style=Style(color=colors["fg"]))
-            i += 1
 
 class PalettePanel(Static):
     """Display full color palette for a theme"""
@@ -348,16 +256,11 @@ class PalettePanel(Static):
         table.add_column("Swatch")
         table.add_column("Contrast vs BG")
         
-        bg_rgb = hex_to_rgb(colors["bg"])
-        bg_lum = relative_luminance(*bg_rgb)
-        
         for role, color in colors.items():
             if role == "bg":
                 continue
             
-            fg_rgb = hex_to_rgb(color)
-            fg_lum = relative_luminance(*fg_rgb)
-            ratio = contrast_ratio(fg_lum, bg_lum)
+            ratio = contrast(color, colors["bg"])
             rating, rating_color = wcag_rating(ratio)
             
             swatch = Text("████", style=Style(color=color))
@@ -466,6 +369,7 @@ class PrismStudio(App):
         Binding("enter", "select", "Select", show=False),
         Binding("e", "export", "Export"),
         Binding("a", "audit", "Audit All"),
+        Binding("s", "next_sample", "Sample"),
         Binding("/", "search", "Search"),
     ]
     
@@ -574,12 +478,7 @@ class PrismStudio(App):
         
         for name, theme in self.themes.items():
             colors = get_theme_colors(theme)
-            bg_rgb = hex_to_rgb(colors["bg"])
-            fg_rgb = hex_to_rgb(colors["fg"])
-            
-            bg_lum = relative_luminance(*bg_rgb)
-            fg_lum = relative_luminance(*fg_rgb)
-            ratio = contrast_ratio(fg_lum, bg_lum)
+            ratio = contrast(colors["fg"], colors["bg"])
             rating, color = wcag_rating(ratio)
             
             # Count issues
@@ -587,9 +486,7 @@ class PrismStudio(App):
             for role in ["muted", "comment"]:
                 c = colors.get(role)
                 if c:
-                    c_rgb = hex_to_rgb(c)
-                    c_lum = relative_luminance(*c_rgb)
-                    c_ratio = contrast_ratio(c_lum, bg_lum)
+                    c_ratio = contrast(c, colors["bg"])
                     if c_ratio < 3.0:
                         issues.append(role)
             
@@ -609,6 +506,12 @@ class PrismStudio(App):
         self.query_one(TabbedContent).active = "tab-audit"
         self.run_audit()
     
+    def action_next_sample(self):
+        """Cycle the preview through the code samples"""
+        preview = self.query_one("#preview", ThemePreview)
+        names = list(SAMPLES)
+        preview.sample = names[(names.index(preview.sample) + 1) % len(names)]
+    
     def action_export(self):
         """Export current theme"""
         if self.selected_theme:
@@ -0,0 +1,20 @@
+/// WCAG 2.1 contrast between two sRGB colors.
+#[derive(Debug, Clone, Copy)]
+pub struct Rgb(pub f64, pub f64, pub f64);
+
+impl Rgb {
+    fn luminance(self) -> f64 {
+        let lin = |c: f64| if c <= 0.04045 {
+            c / 12.92
+        } else {
+            ((c + 0.055) / 1.055).powf(2.4)
+        };
+        let Rgb(r, g, b) = self;
+        0.2126 * lin(r) + 0.7152 * lin(g) + 0.0722 * lin(b)
+    }
+}
+
+pub fn contrast(fg: Rgb, bg: Rgb) -> f64 {
+    let (a, b) = (fg.luminance(), bg.luminance());
+    (a.max(b) + 0.05) / (a.min(b) + 0.05) // always >= 1
+}
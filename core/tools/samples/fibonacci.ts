@@ -0,0 +1,17 @@
+// Fibonacci with memoization
+function fibonacci(n: number): number {
+  const memo: Map<number, number> = new Map();
+
+  function fib(n: number): number {
+    if (n <= 1) return n;
+    if (memo.has(n)) return memo.get(n)!;
+
+    const result = fib(n - 1) + fib(n - 2);
+    memo.set(n, result);
+    return result;
+  }
+
+  return fib(n);
+}
+
+console.log(fibonacci(42)); // 267914296
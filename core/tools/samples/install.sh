@@ -0,0 +1,16 @@
+#!/usr/bin/env bash
+# Install a Prism theme for every terminal found
+set -euo pipefail
+
+THEME="${1:-nord_aurora}"
+CONFIG="${XDG_CONFIG_HOME:-$HOME/.config}"
+
+for app in alacritty kitty wezterm; do
+  if command -v "$app" >/dev/null 2>&1; then
+    mkdir -p "$CONFIG/$app/themes"
+    cp "terminal/$app/$THEME".* "$CONFIG/$app/themes/"
+    echo "installed $THEME for $app"
+  fi
+done
+
+exit 0
@@ -0,0 +1,27 @@
+package palette
+
+import (
+	"fmt"
+	"math"
+)
+
+// Accent hues are spread by the golden angle.
+const GoldenAngle = 137.50776405
+
+type Color struct {
+	L, C, H float64
+}
+
+func Accents(base Color, n int) []Color {
+	out := make([]Color, 0, n)
+	for i := 0; i < n; i++ {
+		h := math.Mod(base.H+GoldenAngle*float64(i), 360)
+		out = append(out, Color{base.L, base.C, h})
+	}
+	return out
+}
+
+func (c Color) String() string {
+	return fmt.Sprintf("oklch(%.2f %.3f %.1f)",
+		c.L, c.C, c.H)
+}
@@ -0,0 +1,35 @@
+import asyncio
+
+from prism.color import calculate_contrast
+
+def fibonacci(n: int) -> int:
+    """Calculate the nth Fibonacci number."""
+    if n <= 1:
+        return n
+    # Recursive case with memoization
+    return fibonacci(n - 1) + fibonacci(n - 2)
+
+class ThemeEngine:
+    """OKLCH-based color theme generator."""
+
+    BASE_HUE = 220.0
+    MAX_CHROMA = 0.15
+
+    def __init__(self, name: str = "prism"):
+        self.name = name
+        self.palette: dict[str, str] = {}
+        self._initialized = False
+
+    async def generate(self, hue: float) -> dict:
+        """Generate a complete theme palette."""
+        colors = await self._compute_palette(hue)
+        return {"name": self.name, "colors": colors}
+
+    def validate_contrast(self, fg: str, bg: str) -> bool:
+        ratio = calculate_contrast(fg, bg)
+        return ratio >= 4.5  # WCAG AA
+
+# Usage example
+engine = ThemeEngine("midnight")
+theme = asyncio.run(engine.generate(hue=265))
+print(f"Generated: {theme['name']}")
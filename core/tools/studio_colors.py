@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Prism Studio Colors - ThemeCreator's color rules without the TUI
+
+The OKLCH conversions, the ThemeColors slots and the harmony rules behind
+prism_studio's ThemeCreator, kept free of textual and rich so headless callers
+(theme_service's studio generator) can use them without the TUI installed.
+
+Usage:
+    from studio_colors import generate_creator_colors
+    colors = generate_creator_colors(hue=211, chroma=0.12, bg_lightness=0.15, fg_lightness=0.9)
+    print(colors.background, colors.keyword)
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Tuple
+
+# ═══════════════════════════════════════════════════════════════════
+# OKLCH to sRGB
+# ═══════════════════════════════════════════════════════════════════
+
+def linear_to_srgb(c: float) -> float:
+    """sRGB gamma compression - verified in Lean4"""
+    if c <= 0.0031308:
+        return 12.92 * c
+    return 1.055 * (c ** (1/2.4)) - 0.055
+
+def rgb_to_hex(r: float, g: float, b: float) -> str:
+    """RGB floats to hex"""
+    r, g, b = max(0, min(1, r)), max(0, min(1, g)), max(0, min(1, b))
+    return f"#{int(r*255):02x}{int(g*255):02x}{int(b*255):02x}"
+
+def oklch_to_oklab(l: float, c: float, h: float) -> Tuple[float, float, float]:
+    """OKLCH to OKLAB"""
+    h_rad = h * (math.pi / 180)
+    return (l, c * math.cos(h_rad), c * math.sin(h_rad))
+
+def oklab_to_linear_srgb(l: float, a: float, b: float) -> Tuple[float, float, float]:
+    """OKLAB to linear sRGB"""
+    l_ = l + 0.3963377774 * a + 0.2158037573 * b
+    m_ = l - 0.1055613458 * a - 0.0638541728 * b
+    s_ = l - 0.0894841775 * a - 1.2914855480 * b
+    
+    l_cubed = l_ ** 3
+    m_cubed = m_ ** 3
+    s_cubed = s_ ** 3
+    
+    r = 4.0767416621 * l_cubed - 3.3077115913 * m_cubed + 0.2309699292 * s_cubed
+    g = -1.2684380046 * l_cubed + 2.6097574011 * m_cubed - 0.3413193965 * s_cubed
+    b = -0.0041960863 * l_cubed - 0.7034186147 * m_cubed + 1.7076147010 * s_cubed
+    
+    return (r, g, b)
+
+def oklch_to_srgb(l: float, c: float, h: float) -> Tuple[float, float, float]:
+    """OKLCH to sRGB with gamut clipping"""
+    ok_l, ok_a, ok_b = oklch_to_oklab(l, c, h)
+    lin_r, lin_g, lin_b = oklab_to_linear_srgb(ok_l, ok_a, ok_b)
+    
+    # Gamut clip
+    lin_r = max(0, min(1, lin_r))
+    lin_g = max(0, min(1, lin_g))
+    lin_b = max(0, min(1, lin_b))
+    
+    return (linear_to_srgb(lin_r), linear_to_srgb(lin_g), linear_to_srgb(lin_b))
+
+# ═══════════════════════════════════════════════════════════════════
+# Creator Rules
+# ═══════════════════════════════════════════════════════════════════
+
+@dataclass
+class ThemeColors:
+    """Core theme colors"""
+    background: str = "#1a1a1a"
+    foreground: str = "#e0e0e0"
+    muted: str = "#808080"
+    accent: str = "#00a0e4"
+    
+    # Syntax colors
+    keyword: str = "#ff79c6"
+    string: str = "#f1fa8c"
+    function: str = "#50fa7b"
+    comment: str = "#6272a4"
+    number: str = "#bd93f9"
+    type: str = "#8be9fd"
+    operator: str = "#ff79c6"
+    variable: str = "#f8f8f2"
+    
+    # UI colors
+    selection_bg: str = "#44475a"
+    cursor: str = "#f8f8f2"
+    line_highlight: str = "#282a36"
+    
+    # ANSI terminal colors
+    black: str = "#0a0a0a"
+    red: str = "#ff5555"
+    green: str = "#50fa7b"
+    yellow: str = "#f1fa8c"
+    blue: str = "#6272a4"
+    magenta: str = "#ff79c6"
+    cyan: str = "#8be9fd"
+    white: str = "#f8f8f2"
+
+def generate_creator_colors(hue: float, chroma: float, bg_lightness: float, fg_lightness: float) -> ThemeColors:
+    """ThemeCreator's harmony rules as a pure function"""
+    is_dark = bg_lightness < 0.5
+    h = hue
+    c = chroma
+    
+    # Generate harmonious colors
+    colors = ThemeColors()
+    
+    # Background and foreground
+    bg_r, bg_g, bg_b = oklch_to_srgb(bg_lightness, c * 0.3, h)
+    fg_r, fg_g, fg_b = oklch_to_srgb(fg_lightness, c * 0.1, h)
+    
+    colors.background = rgb_to_hex(bg_r, bg_g, bg_b)
+    colors.foreground = rgb_to_hex(fg_r, fg_g, fg_b)
+    
+    # Muted text (between bg and fg lightness)
+    muted_l = (bg_lightness + fg_lightness) / 2
+    muted_r, muted_g, muted_b = oklch_to_srgb(muted_l, c * 0.2, h)
+    colors.muted = rgb_to_hex(muted_r, muted_g, muted_b)
+    
+    # Accent (complement with higher chroma)
+    acc_r, acc_g, acc_b = oklch_to_srgb(0.7, c * 1.5, h)
+    colors.accent = rgb_to_hex(acc_r, acc_g, acc_b)
+    
+    # Syntax colors (triadic + analogous harmony)
+    syntax_l = 0.75 if is_dark else 0.45
+    
+    kw_r, kw_g, kw_b = oklch_to_srgb(syntax_l, c * 1.3, (h + 300) % 360)  # Keyword - pink/purple
+    colors.keyword = rgb_to_hex(kw_r, kw_g, kw_b)
+    
+    str_r, str_g, str_b = oklch_to_srgb(syntax_l + 0.05, c * 1.2, (h + 60) % 360)  # String - yellow/green
+    colors.string = rgb_to_hex(str_r, str_g, str_b)
+    
+    fn_r, fn_g, fn_b = oklch_to_srgb(syntax_l, c * 1.4, (h + 120) % 360)  # Function - green/cyan
+    colors.function = rgb_to_hex(fn_r, fn_g, fn_b)
+    
+    cmt_l = muted_l + (0.1 if is_dark else -0.1)
+    cmt_r, cmt_g, cmt_b = oklch_to_srgb(cmt_l, c * 0.5, h)  # Comment - muted base
+    colors.comment = rgb_to_hex(cmt_r, cmt_g, cmt_b)
+    
+    num_r, num_g, num_b = oklch_to_srgb(syntax_l, c * 1.2, (h + 240) % 360)  # Number - purple/blue
+    colors.number = rgb_to_hex(num_r, num_g, num_b)
+    
+    typ_r, typ_g, typ_b = oklch_to_srgb(syntax_l + 0.05, c * 1.1, (h + 180) % 360)  # Type - cyan
+    colors.type = rgb_to_hex(typ_r, typ_g, typ_b)
+    
+    colors.operator = colors.keyword
+    colors.variable = colors.foreground
+    
+    # UI colors
+    sel_l = bg_lightness + (0.1 if is_dark else -0.1)
+    sel_r, sel_g, sel_b = oklch_to_srgb(sel_l, c * 0.4, h)
+    colors.selection_bg = rgb_to_hex(sel_r, sel_g, sel_b)
+    
+    colors.cursor = colors.accent
+    
+    line_l = bg_lightness + (0.03 if is_dark else -0.03)
+    line_r, line_g, line_b = oklch_to_srgb(line_l, c * 0.2, h)
+    colors.line_highlight = rgb_to_hex(line_r, line_g, line_b)
+    
+    # Terminal ANSI colors
+    colors.black = colors.background
+    colors.red = rgb_to_hex(*oklch_to_srgb(0.65, 0.2, 25))
+    colors.green = rgb_to_hex(*oklch_to_srgb(0.7, 0.18, 145))
+    colors.yellow = rgb_to_hex(*oklch_to_srgb(0.8, 0.15, 85))
+    colors.blue = rgb_to_hex(*oklch_to_srgb(0.6, 0.15, 250))
+    colors.magenta = rgb_to_hex(*oklch_to_srgb(0.65, 0.2, 320))
+    colors.cyan = rgb_to_hex(*oklch_to_srgb(0.75, 0.12, 195))
+    colors.white = colors.foreground
+    
+    return colors
@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+"""
+Prism Theme Bundles
+
+Output sinks for the generators. sync_themes.py and generate_all_themes.py
+write hundreds of small files; with --bundle they stream every artifact into
+one tar or zip instead, so CI uploads and release packaging move a single file.
+
+Entries use the same relative paths the generator would write, with fixed
+timestamps and modes so identical themes produce byte-identical bundles.
+
+Artifacts that are byte-identical at several paths (the Cursor, OpenCode and
+Core theme copies) go through write_many(). The directory sink stores the
+bytes once in a content-addressed blob directory and materializes each path
+as a reflink or hardlink to the blob (a plain copy when neither works, or
+when no blob directory is given). Bundles store the copies as tar hardlinks.
+verify_copies() re-checks every group afterwards.
+
+Usage:
+    from theme_bundle import open_sink
+    with open_sink(root, bundle="dist/prism-themes.tar.gz") as sink:
+        sink.write("terminal/kitty/arctic.conf", text)
+        sink.write_many(["cursor/themes/arctic.json", "opencode/themes/arctic.json"], text)
+
+    python theme_bundle.py list dist/prism-themes.tar.gz
+    python theme_bundle.py extract dist/prism-themes.tar.gz -C . --match 'terminal/*'
+"""
+
+import argparse
+import fnmatch
+import gzip
+import hashlib
+import io
+import os
+import shutil
+import sys
+import tarfile
+import zipfile
+from collections import Counter
+from pathlib import Path, PurePosixPath
+from typing import Iterable, List, Optional, Tuple, Union
+
+# Archive suffix -> tarfile mode; ".zip" is handled separately
+TAR_MODES = {
+    ".tar": "w",
+    ".tar.gz": "w:gz",
+    ".tgz": "w:gz",
+    ".tar.bz2": "w:bz2",
+    ".tar.xz": "w:xz",
+}
+
+# Reproducible entries: zip cannot store dates before 1980
+ZIP_EPOCH = (1980, 1, 1, 0, 0, 0)
+TAR_MTIME = 315532800  # 1980-01-01T00:00:00Z, matches the zip entries
+FILE_MODE = 0o644
+
+FICLONE = 0x40049409  # linux/fs.h: share extents with another file (btrfs, XFS, ...)
+LINK_METHODS = ("reflink", "hardlink", "copy")
+
+def bundle_kind(path: Union[str, Path]) -> str:
+    """Return 'zip' or the tarfile write mode for a bundle path."""
+    name = str(path).lower()
+    if name.endswith(".zip"):
+        return "zip"
+    for suffix, mode in TAR_MODES.items():
+        if name.endswith(suffix):
+            return mode
+    raise ValueError(f"Unsupported bundle type: {path} (use .zip, .tar, .tar.gz, .tgz, .tar.bz2 or .tar.xz)")
+
+def _encode(data: Union[str, bytes]) -> bytes:
+    return data.encode("utf-8") if isinstance(data, str) else data
+
+def _reflink(src: Path, dst: Path):
+    import fcntl  # POSIX only; ImportError is handled like an unsupported filesystem
+    with open(src, "rb") as s, open(dst, "wb") as d:
+        try:
+            fcntl.ioctl(d.fileno(), FICLONE, s.fileno())
+        except OSError:
+            d.close()
+            dst.unlink(missing_ok=True)
+            raise
+
+def _link(method: str, src: Path, dst: Path):
+    if method == "reflink":
+        _reflink(src, dst)
+    elif method == "hardlink":
+        os.link(src, dst)
+    else:
+        shutil.copyfile(src, dst)
+
+# ═══════════════════════════════════════════════════════════════════
+# Sinks
+# ═══════════════════════════════════════════════════════════════════
+
+class DirectorySink:
+    """Writes each artifact as a file under root (the generators' default).
+
+    With blob_dir, write_many() stores shared content once under
+    blob_dir/<sha256[:2]>/<sha256> and links every path to it.
+    """
+
+    def __init__(self, root: Path, blob_dir: Optional[Path] = None):
+        self.root = Path(root)
+        self.target = self.root
+        self.blob_dir = Path(blob_dir) if blob_dir else None
+        self.files = 0
+        self.bytes = 0
+        self.links: Counter = Counter()    # materialization method -> paths
+        self.groups: List[Tuple[str, List[Path]]] = []
+        self.blobs_used = set()
+        self._methods = list(LINK_METHODS)
+        self._dirs = set()
+
+    def _mkdir(self, path: Path):
+        parent = path.parent
+        if parent not in self._dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            self._dirs.add(parent)
+
+    def write(self, relpath: Union[str, Path], data: Union[str, bytes]):
+        path = self.root / relpath
+        self._mkdir(path)
+        try:
+            if os.lstat(path).st_nlink > 1:
+                path.unlink()  # linked by an earlier write_many(); do not write through to the others
+        except FileNotFoundError:
+            pass
+        if isinstance(data, str):
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(data)
+        else:
+            path.write_bytes(data)
+        self.files += 1
+        self.bytes += len(data)
+
+    def blob(self, payload: bytes) -> Tuple[str, Path]:
+        """(digest, path) of the blob holding payload, (re)creating it if missing or edited in place."""
+        digest = hashlib.sha256(payload).hexdigest()
+        path = self.blob_dir / digest[:2] / digest
+        try:
+            intact = path.read_bytes() == payload
+        except FileNotFoundError:
+            intact = False
+        if not intact:  # a fresh inode, so links to an edited blob fall out of samefile() below
+            self._mkdir(path)
+            tmp = path.with_name(f".{digest}.tmp")
+            tmp.write_bytes(payload)
+            tmp.replace(path)
+        self.blobs_used.add(path)
+        return digest, path
+
+    def write_many(self, relpaths: Iterable[Union[str, Path]], data: Union[str, bytes]):
+        """Write identical content to several paths, encoding and hashing it once."""
+        payload = _encode(data)
+        paths = [self.root / rel for rel in relpaths]
+        if self.blob_dir is None:
+            for rel in relpaths:
+                self.write(rel, payload)
+            self.groups.append((hashlib.sha256(payload).hexdigest(), paths))
+            return
+        digest, blob = self.blob(payload)
+        for path in paths:
+            self._mkdir(path)
+            if path.exists() and os.path.samefile(blob, path):
+                self.links["unchanged"] += 1
+                continue
+            tmp = path.with_name(f".{path.name}.prism-tmp")
+            tmp.unlink(missing_ok=True)
+            for method in list(self._methods):
+                try:
+                    _link(method, blob, tmp)
+                except (OSError, ImportError):
+                    self._methods.remove(method)  # unsupported here; do not retry for later paths
+                    continue
+                self.links[method] += 1
+                break
+            tmp.replace(path)
+            self.files += 1
+            self.bytes += len(payload)
+        self.groups.append((digest, paths))
+
+    def verify_copies(self) -> List[str]:
+        """Confirm every write_many() path still hashes to its group's digest (each inode read once)."""
+        problems, seen = [], {}
+        for digest, paths in self.groups:
+            for path in paths:
+                try:
+                    st = os.stat(path)
+                    inode = (st.st_dev, st.st_ino)
+                    if inode not in seen:
+                        seen[inode] = hashlib.sha256(path.read_bytes()).hexdigest()
+                except OSError as e:
+                    problems.append(f"{path}: {e}")
+                    continue
+                if seen[inode] != digest:
+                    problems.append(f"{path}: content differs from its copies")
+        return problems
+
+    def prune_blobs(self) -> int:
+        """Delete blobs this sink did not use (after a full run). Returns the count."""
+        if self.blob_dir is None or not self.blob_dir.is_dir():
+            return 0
+        removed = 0
+        for path in self.blob_dir.glob("*/*"):
+            if path not in self.blobs_used:
+                path.unlink()
+                removed += 1
+        return removed
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class BundleSink:
+    """Streams artifacts into a single tar or zip archive."""
+
+    def __init__(self, path: Path):
+        self.target = Path(path)
+        self.kind = bundle_kind(self.target)
+        self.files = 0
+        self.bytes = 0
+        self.target.parent.mkdir(parents=True, exist_ok=True)
+        self._streams = []
+        if self.kind == "zip":
+            self._archive = zipfile.ZipFile(self.target, "w", zipfile.ZIP_DEFLATED)
+        elif self.kind == "w:gz":
+            # tarfile's own gzip layer stamps the current time and file name into the header
+            raw = open(self.target, "wb")
+            gz = gzip.GzipFile(filename="", mode="wb", fileobj=raw, mtime=0)
+            self._streams = [gz, raw]
+            self._archive = tarfile.open(fileobj=gz, mode="w", format=tarfile.PAX_FORMAT)
+        else:
+            self._archive = tarfile.open(self.target, self.kind, format=tarfile.PAX_FORMAT)
+
+    def write(self, relpath: Union[str, Path], data: Union[str, bytes]):
+        name = Path(relpath).as_posix()
+        payload = _encode(data)
+        if self.kind == "zip":
+            info = zipfile.ZipInfo(name, date_time=ZIP_EPOCH)
+            info.external_attr = FILE_MODE << 16
+            info.compress_type = zipfile.ZIP_DEFLATED
+            self._archive.writestr(info, payload)
+        else:
+            info = tarfile.TarInfo(name)
+            info.size = len(payload)
+            info.mtime = TAR_MTIME
+            info.mode = FILE_MODE
+            self._archive.addfile(info, io.BytesIO(payload))
+        self.files += 1
+        self.bytes += len(payload)
+
+    def write_many(self, relpaths: Iterable[Union[str, Path]], data: Union[str, bytes]):
+        """First path as a regular entry, the rest as tar hardlinks to it (copies in a zip)."""
+        payload = _encode(data)
+        names = [Path(rel).as_posix() for rel in relpaths]
+        if not names:
+            return
+        self.write(names[0], payload)
+        for name in names[1:]:
+            if self.kind == "zip":
+                self.write(name, payload)
+                continue
+            info = tarfile.TarInfo(name)
+            info.type = tarfile.LNKTYPE
+            info.linkname = names[0]
+            info.mtime = TAR_MTIME
+            info.mode = FILE_MODE
+            self._archive.addfile(info)
+            self.files += 1
+
+    def verify_copies(self) -> List[str]:
+        return []  # hardlink entries cannot diverge from their target
+
+    def close(self):
+        self._archive.close()
+        for stream in self._streams:
+            stream.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def open_sink(root: Path, bundle: Optional[Union[str, Path]] = None, blob_dir: Optional[Path] = None):
+    """DirectorySink(root, blob_dir), or a BundleSink when a bundle path is given."""
+    return BundleSink(Path(bundle)) if bundle else DirectorySink(root, blob_dir)
+
+# ═══════════════════════════════════════════════════════════════════
+# Reading / Extraction
+# ═══════════════════════════════════════════════════════════════════
+
+def _safe_name(name: str) -> str:
+    """Reject absolute paths and parent traversal in archive members."""
+    path = PurePosixPath(name)
+    if path.is_absolute() or ".." in path.parts or not path.parts:
+        raise ValueError(f"Unsafe bundle entry: {name!r}")
+    return path.as_posix()
+
+def list_bundle(bundle: Union[str, Path]) -> List[str]:
+    bundle = Path(bundle)
+    if bundle_kind(bundle) == "zip":
+        with zipfile.ZipFile(bundle) as zf:
+            return [n for n in zf.namelist() if not n.endswith("/")]
+    with tarfile.open(bundle, "r:*") as tf:
+        return [m.name for m in tf.getmembers() if m.isfile() or m.islnk()]
+
+def extract_bundle(bundle: Union[str, Path], dest: Union[str, Path], pattern: Optional[str] = None) -> int:
+    """Extract regular files (optionally matching a glob) into dest. Returns the count."""
+    bundle, dest = Path(bundle), Path(dest)
+    sink = DirectorySink(dest)
+    if bundle_kind(bundle) == "zip":
+        with zipfile.ZipFile(bundle) as zf:
+            for name in zf.namelist():
+                if name.endswith("/") or (pattern and not fnmatch.fnmatch(name, pattern)):
+                    continue
+                sink.write(_safe_name(name), zf.read(name))
+    else:
+        with tarfile.open(bundle, "r:*") as tf:
+            for member in tf:
+                if not (member.isfile() or member.islnk()) or (pattern and not fnmatch.fnmatch(member.name, pattern)):
+                    continue
+                sink.write(_safe_name(member.name), tf.extractfile(member).read())
+    return sink.files
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect or extract Prism theme bundles")
+    sub = parser.add_subparsers(dest="command", required=True)
+    ls = sub.add_parser("list", help="List files in a bundle")
+    ls.add_argument("bundle")
+    ex = sub.add_parser("extract", help="Extract a bundle")
+    ex.add_argument("bundle")
+    ex.add_argument("-C", "--directory", default=".", help="Destination directory (default: .)")
+    for p in (ls, ex):
+        p.add_argument("--match", help="Only entries matching this glob, e.g. 'terminal/kitty/*'")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.bundle):
+        print(f"Error: bundle not found: {args.bundle}", file=sys.stderr)
+        return 1
+
+    if args.command == "list":
+        names = list_bundle(args.bundle)
+        if args.match:
+            names = fnmatch.filter(names, args.match)
+        for name in names:
+            print(name)
+        print(f"{len(names)} files", file=sys.stderr)
+        return 0
+
+    count = extract_bundle(args.bundle, args.directory, args.match)
+    print(f"Extracted {count} files to {args.directory}")
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
@@ -15,18 +15,36 @@ Features:
 Usage:
     python theme_explorer.py
     python theme_explorer.py --theme fleek.json
-    python theme_explorer.py --compare fleek.json nord-aurora.json
+
+Batch mode (non-interactive, parallel):
+    python theme_explorer.py audit "vscode/themes/*.json"
+    python theme_explorer.py preview "vscode/themes/*.json" --output reports/
+    python theme_explorer.py preview vscode/themes/nord_aurora.json --sample rust
+    python theme_explorer.py compare "vscode/themes/*.json" --against vscode/themes/github.json
+
+--output writes <stem>.<command>.txt per theme; themes whose file names collide
+go under their parent directories (a/fleek.audit.txt, b/fleek.audit.txt).
 """
 
 import sys
 import os
+import re
 import json
 import math
+import argparse
+import contextlib
+import glob
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Any
 from dataclasses import dataclass
 from enum import Enum
 
+from code_samples import SAMPLES, sample_tokens
+from contrast_cache import contrast
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # Color Science (mirrors Lean4 proofs in prism-color-core/lean4/)
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -115,16 +133,30 @@ def ansi_bg(r: int, g: int, b: int) -> str:
 def ansi_reset() -> str:
     return "\x1b[0m"
 
-def color_block(hex_color: str, width: int = 4) -> str:
+@lru_cache(maxsize=None)
+def fg_escape(hex_color: str) -> str:
+    """Memoized foreground escape for a hex color (themes reuse a dozen colors)."""
     r, g, b = hex_to_rgb(hex_color)
-    return f"{ansi_bg(int(r*255), int(g*255), int(b*255))}{' ' * width}{ansi_reset()}"
+    return ansi_fg(int(r*255), int(g*255), int(b*255))
+
+@lru_cache(maxsize=None)
+def bg_escape(hex_color: str) -> str:
+    """Memoized background escape for a hex color."""
+    r, g, b = hex_to_rgb(hex_color)
+    return ansi_bg(int(r*255), int(g*255), int(b*255))
+
+ANSI_ESCAPE_RE = re.compile(r"\x1b\[[0-9;]*m")
+
+def strip_ansi(text: str) -> str:
+    return ANSI_ESCAPE_RE.sub("", text)
+
+def color_block(hex_color: str, width: int = 4) -> str:
+    return f"{bg_escape(hex_color)}{' ' * width}{ansi_reset()}"
 
 def colored_text(text: str, fg_hex: str, bg_hex: Optional[str] = None) -> str:
-    r, g, b = hex_to_rgb(fg_hex)
-    result = ansi_fg(int(r*255), int(g*255), int(b*255))
+    result = fg_escape(fg_hex)
     if bg_hex:
-        rb, gb, bb = hex_to_rgb(bg_hex)
-        result += ansi_bg(int(rb*255), int(gb*255), int(bb*255))
+        result += bg_escape(bg_hex)
     return result + text + ansi_reset()
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -142,9 +174,11 @@ class Theme:
     
     @classmethod
     def from_file(cls, path: Path) -> 'Theme':
-        with open(path) as f:
+        with open(path, encoding='utf-8') as f:
             data = json.load(f)
         colors = data.get('colors', {})
+        if 'editor.background' in colors:
+            return cls.from_vscode(data, path)
         return cls(
             name=data.get('name', path.stem),
             background=colors.get('background', '#000000'),
@@ -153,88 +187,81 @@ class Theme:
             colors=colors,
             syntax=colors.get('syntax', {}),
         )
+    
+    @classmethod
+    def from_vscode(cls, data: dict, path: Path) -> 'Theme':
+        """Map a VS Code theme (vscode/themes/*.json) onto the explorer's roles."""
+        colors = data.get('colors', {})
+        scopes = {}
+        for token in data.get('tokenColors', []):
+            scope = token.get('scope', [])
+            for s in ([scope] if isinstance(scope, str) else scope):
+                fg = token.get('settings', {}).get('foreground')
+                if fg and s not in scopes:
+                    scopes[s] = fg
+        syntax = {
+            role: scopes[scope]
+            for role, scope in (
+                ('comment', 'comment'),
+                ('keyword', 'keyword'),
+                ('function', 'entity.name.function'),
+                ('string', 'string'),
+                ('number', 'constant.numeric'),
+                ('type', 'entity.name.type'),
+            )
+            if scope in scopes
+        }
+        return cls(
+            name=data.get('name', path.stem),
+            background=colors['editor.background'],
+            foreground=colors.get('editor.foreground', '#ffffff'),
+            accent=colors.get('editorCursor.foreground', '#00ff00'),
+            colors=colors,
+            syntax=syntax,
+        )
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # Code Sample Rendering
 # ═══════════════════════════════════════════════════════════════════════════════
 
-SAMPLE_CODE = '''
-// Fibonacci with memoization
-function fibonacci(n: number): number {
-  const memo: Map<number, number> = new Map();
-  
-  function fib(n: number): number {
-    if (n <= 1) return n;
-    if (memo.has(n)) return memo.get(n)!;
-    
-    const result = fib(n - 1) + fib(n - 2);
-    memo.set(n, result);
-    return result;
-  }
-  
-  return fib(n);
-}
-
-console.log(fibonacci(42)); // 267914296
-'''.strip()
-
-def render_code_sample(theme: Theme) -> List[str]:
-    """Render code with syntax highlighting using theme colors."""
+DEFAULT_SAMPLE = 'typescript'
+
+def render_code_sample(theme: Theme, sample: str = DEFAULT_SAMPLE) -> List[str]:
+    """Render a code sample (see code_samples.SAMPLES) with the theme's syntax colors."""
     lines = []
     bg = theme.background
-    fg = theme.foreground
     
     # Map token types to colors
     syntax = theme.syntax
-    comment = syntax.get('comment', syntax.get('base03', '#666666'))
-    keyword = syntax.get('keyword', syntax.get('base0E', '#ff00ff'))
-    function = syntax.get('function', syntax.get('base0D', '#0000ff'))
-    string = syntax.get('string', syntax.get('base0B', '#00ff00'))
-    number = syntax.get('number', syntax.get('base09', '#ff8800'))
-    type_color = syntax.get('type', syntax.get('base0A', '#ffff00'))
+    role_colors = {
+        'fg': theme.foreground,
+        'comment': syntax.get('comment', syntax.get('base03', '#666666')),
+        'keyword': syntax.get('keyword', syntax.get('base0E', '#ff00ff')),
+        'function': syntax.get('function', syntax.get('base0D', '#0000ff')),
+        'string': syntax.get('string', syntax.get('base0B', '#00ff00')),
+        'number': syntax.get('number', syntax.get('base09', '#ff8800')),
+        'type': syntax.get('type', syntax.get('base0A', '#ffff00')),
+        'operator': theme.foreground,
+    }
+    # One escape per role, looked up per run instead of rebuilt per character
+    role_escapes = {role: fg_escape(color) + bg_escape(bg) for role, color in role_colors.items()}
+    reset = ansi_reset()
+    line_start = bg_escape(bg)
     
-    for line in SAMPLE_CODE.split('\n'):
-        rendered = ""
-        # Simple tokenization (not a real parser, just for demo)
-        i = 0
-        while i < len(line):
-            if line[i:i+2] == '//':
-                rendered += colored_text(line[i:], comment, bg)
-                break
-            elif line[i] == '"' or line[i] == "'":
-                quote = line[i]
-                end = line.find(quote, i + 1)
-                if end == -1: end = len(line) - 1
-                rendered += colored_text(line[i:end+1], string, bg)
-                i = end + 1
-            elif line[i:].startswith(('function', 'const', 'return', 'if', 'let', 'var')):
-                for kw in ['function', 'const', 'return', 'if', 'let', 'var']:
-                    if line[i:].startswith(kw) and (i + len(kw) >= len(line) or not line[i + len(kw)].isalnum()):
-                        rendered += colored_text(kw, keyword, bg)
-                        i += len(kw)
-                        break
-                else:
-                    rendered += colored_text(line[i], fg, bg)
-                    i += 1
-            elif line[i:].startswith(('number', 'Map', 'string')):
-                for t in ['number', 'Map', 'string']:
-                    if line[i:].startswith(t):
-                        rendered += colored_text(t, type_color, bg)
-                        i += len(t)
-                        break
-            elif line[i].isdigit():
-                j = i
-                while j < len(line) and (line[j].isdigit() or line[j] == '.'):
-                    j += 1
-                rendered += colored_text(line[i:j], number, bg)
-                i = j
-            else:
-                rendered += colored_text(line[i], fg, bg)
-                i += 1
+    for runs in sample_tokens(sample):
+        width = 0
+        parts = [line_start]
+        for text, role in runs:
+            parts.append(role_escapes[role])
+            parts.append(text)
+            parts.append(reset)
+            width += len(text)
         
         # Pad line with background
-        rb, gb, bb = hex_to_rgb(bg)
-        lines.append(f"{ansi_bg(int(rb*255), int(gb*255), int(bb*255))}{rendered}{' ' * (60 - len(line))}{ansi_reset()}")
+        parts.append(line_start)
+        parts.append(' ' * (60 - width))
+        parts.append(reset)
+        lines.append(''.join(parts))
     
     return lines
 
@@ -253,6 +280,19 @@ def wcag_rating(ratio: float) -> Tuple[str, str]:
     else:
         return ("FAIL", "\x1b[31m")  # Red
 
+def audit_checks(theme: Theme) -> List[Tuple[str, str, float]]:
+    """(role, hex, contrast vs background) for every audited color."""
+    checks = [
+        ("Foreground", theme.foreground),
+        ("Accent", theme.accent),
+    ]
+    
+    for name, color in theme.syntax.items():
+        if isinstance(color, str) and color.startswith('#'):
+            checks.append((f"syntax.{name}", color))
+    
+    return [(name, hex_color, contrast(hex_color, theme.background)) for name, hex_color in checks]
+
 def audit_theme(theme: Theme) -> List[str]:
     """Generate accessibility audit report."""
     lines = []
@@ -267,20 +307,8 @@ def audit_theme(theme: Theme) -> List[str]:
     lines.append(f"{'Color':<20} {'Hex':<10} {'Ratio':>8} {'WCAG':>6}")
     lines.append(f"{'-' * 20} {'-' * 10} {'-' * 8} {'-' * 6}")
     
-    checks = [
-        ("Foreground", theme.foreground),
-        ("Accent", theme.accent),
-    ]
-    
-    for name, color in theme.syntax.items():
-        if isinstance(color, str) and color.startswith('#'):
-            checks.append((f"syntax.{name}", color))
-    
     all_pass = True
-    for name, hex_color in checks:
-        rgb = hex_to_rgb(hex_color)
-        lum = relative_luminance(*rgb)
-        ratio = contrast_ratio(lum, bg_lum)
+    for name, hex_color, ratio in audit_checks(theme):
         rating, color_code = wcag_rating(ratio)
         
         if ratio < 3.0:
@@ -301,12 +329,12 @@ def audit_theme(theme: Theme) -> List[str]:
 # Theme Comparison
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def compare_themes(theme1: Theme, theme2: Theme) -> List[str]:
+def compare_themes(theme1: Theme, theme2: Theme, sample: str = DEFAULT_SAMPLE) -> List[str]:
     """Side-by-side theme comparison."""
     lines = []
     
-    code1 = render_code_sample(theme1)
-    code2 = render_code_sample(theme2)
+    code1 = render_code_sample(theme1, sample)
+    code2 = render_code_sample(theme2, sample)
     
     lines.append(f"{'═' * 130}")
     lines.append(f"{theme1.name:^64} │ {theme2.name:^64}")
@@ -324,6 +352,151 @@ def compare_themes(theme1: Theme, theme2: Theme) -> List[str]:
     
     return lines
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# Batch Mode
+# ═══════════════════════════════════════════════════════════════════════════════
+
+BATCH_COMMANDS = ('audit', 'preview', 'compare')
+
+def expand_theme_globs(patterns: List[str]) -> List[Path]:
+    """Expand shell-style globs (and plain paths) into a sorted, de-duplicated list."""
+    paths = []
+    seen = set()
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=True)) or [pattern]
+        for match in matches:
+            path = Path(match)
+            if path.is_dir():
+                candidates = sorted(path.glob("*.json"))
+            else:
+                candidates = [path]
+            for candidate in candidates:
+                if candidate not in seen and candidate.exists():
+                    seen.add(candidate)
+                    paths.append(candidate)
+    return paths
+
+def batch_render(command: str, path: Path, against: Optional[Path] = None,
+                 sample: str = DEFAULT_SAMPLE) -> Tuple[str, bool]:
+    """Render one batch report. Returns (report text, passed)."""
+    theme = Theme.from_file(path)
+    passed = True
+    if command == 'audit':
+        lines = audit_theme(theme)
+        passed = all(ratio >= 3.0 for _, _, ratio in audit_checks(theme))
+    elif command == 'preview':
+        lines = [f"{theme.name} ({path.name})"] + render_code_sample(theme, sample)
+    elif command == 'compare':
+        lines = compare_themes(Theme.from_file(against), theme, sample)
+    else:
+        raise ValueError(f"Unknown batch command: {command}")
+    return '\n'.join(lines), passed
+
+def report_names(paths: List[Path]) -> List[str]:
+    """Report file name per theme: the stem, or where stems collide the fewest
+    trailing directories that tell the files apart (a/fleek, b/fleek)."""
+    parts = [p.resolve().with_suffix("").parts for p in paths]
+    depth = [1] * len(paths)
+    while True:
+        names = ["/".join(p[-d:]) for p, d in zip(parts, depth)]
+        counts = Counter(names)
+        clashing = [i for i, name in enumerate(names) if counts[name] > 1]
+        if not clashing or all(depth[i] >= len(parts[i]) for i in clashing):
+            return names
+        for i in clashing:
+            depth[i] += 1
+
+def _batch_job(job: Tuple[str, Path, Optional[Path], str]) -> Tuple[Path, str, bool, Optional[str]]:
+    command, path, against, sample = job
+    try:
+        text, passed = batch_render(command, path, against, sample)
+        return path, text, passed, None
+    except Exception as e:
+        return path, "", False, str(e)
+
+def run_batch(
+    command: str,
+    paths: List[Path],
+    against: Optional[Path] = None,
+    jobs: Optional[int] = None,
+    output_dir: Optional[Path] = None,
+    plain: bool = False,
+    sample: str = DEFAULT_SAMPLE,
+) -> int:
+    """Render reports for many themes in parallel; write to stdout or one file per theme."""
+    if command == 'compare':
+        if against is None:
+            if len(paths) < 2:
+                print("compare needs --against or at least two themes", file=sys.stderr)
+                return 2
+            against, paths = paths[0], paths[1:]
+        paths = [p for p in paths if p != against]
+    
+    work = [(command, path, against, sample) for path in paths]
+    if command != 'audit':
+        sample_tokens(sample)  # lex before forking so every worker inherits the cached runs
+    jobs = jobs or os.cpu_count() or 1
+    parallel = jobs > 1 and len(work) > 1
+    names = dict(zip(paths, report_names(paths)))
+    
+    if output_dir:
+        output_dir.mkdir(parents=True, exist_ok=True)
+    
+    failed = 0
+    errors = 0
+    with (ProcessPoolExecutor(max_workers=jobs) if parallel else contextlib.nullcontext()) as executor:
+        if parallel:
+            results = executor.map(_batch_job, work, chunksize=max(1, len(work) // (jobs * 4)))
+        else:
+            results = map(_batch_job, work)
+        for path, text, passed, error in results:
+            if error:
+                errors += 1
+                print(f"Error: {path}: {error}", file=sys.stderr)
+                continue
+            if not passed:
+                failed += 1
+            if plain:
+                text = strip_ansi(text)
+            if output_dir:
+                report = output_dir / f"{names[path]}.{command}.txt"
+                report.parent.mkdir(parents=True, exist_ok=True)
+                report.write_text(text + '\n', encoding='utf-8')
+            else:
+                print(text)
+                print()
+    
+    summary = f"{command}: {len(work)} theme(s)"
+    if command == 'audit':
+        summary += f", {failed} failing"
+    if errors:
+        summary += f", {errors} error(s)"
+    if output_dir:
+        summary += f" -> {output_dir}"
+    print(summary, file=sys.stderr)
+    return 1 if failed or errors else 0
+
+def batch_main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(
+        prog="theme_explorer.py",
+        description="Prism Theme Explorer - batch audit/preview/compare",
+    )
+    parser.add_argument("command", choices=BATCH_COMMANDS)
+    parser.add_argument("themes", nargs="+", help="Theme files, directories or globs")
+    parser.add_argument("--against", type=Path, help="Reference theme for compare (default: first match)")
+    parser.add_argument("--jobs", "-j", type=int, default=None, help="Worker processes (default: all cores)")
+    parser.add_argument("--output", "-o", type=Path, help="Write one report per theme into this directory")
+    parser.add_argument("--plain", action="store_true", help="Strip ANSI escapes from reports")
+    parser.add_argument("--sample", choices=SAMPLES, default=DEFAULT_SAMPLE,
+                        help=f"Code sample for preview/compare (default: {DEFAULT_SAMPLE})")
+    args = parser.parse_args(argv)
+    
+    paths = expand_theme_globs(args.themes)
+    if not paths:
+        print("No theme files matched", file=sys.stderr)
+        return 2
+    return run_batch(args.command, paths, args.against, args.jobs, args.output, args.plain, args.sample)
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # Interactive Mode
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -336,7 +509,8 @@ def print_header():
 ╠══════════════════════════════════════════════════════════════════════════════╣
 ║  Commands:                                                                   ║
 ║    load <file>           Load a theme JSON file                              ║
-║    preview               Show code preview with current theme                ║
+║    preview [sample]      Show code preview with current theme                ║
+║                          (python, typescript, rust, go, shell)               ║
 ║    audit                 Run WCAG accessibility audit                        ║
 ║    compare <file>        Compare current theme with another                  ║
 ║    simulate <mode>       Color blindness simulation                          ║
@@ -379,8 +553,11 @@ def interactive_mode(initial_theme: Optional[Path] = None):
                     print(f"File not found: {path}")
             
             elif cmd == 'preview':
-                if theme:
-                    for line in render_code_sample(theme):
+                sample = parts[1].lower() if len(parts) >= 2 else DEFAULT_SAMPLE
+                if sample not in SAMPLES:
+                    print(f"Unknown sample: {sample} ({', '.join(SAMPLES)})")
+                elif theme:
+                    for line in render_code_sample(theme, sample):
                         print(line)
                 else:
                     print("No theme loaded. Use 'load <file>' first.")
@@ -429,11 +606,7 @@ def interactive_mode(initial_theme: Optional[Path] = None):
             
             elif cmd == 'contrast' and len(parts) >= 3:
                 c1, c2 = parts[1], parts[2]
-                rgb1 = hex_to_rgb(c1)
-                rgb2 = hex_to_rgb(c2)
-                l1 = relative_luminance(*rgb1)
-                l2 = relative_luminance(*rgb2)
-                ratio = contrast_ratio(l1, l2)
+                ratio = contrast(c1, c2)
                 rating, _ = wcag_rating(ratio)
                 print(f"\n  {color_block(c1)} {c1}  vs  {color_block(c2)} {c2}")
                 print(f"  Contrast: {ratio:.2f}:1 ({rating})")
@@ -452,6 +625,9 @@ def interactive_mode(initial_theme: Optional[Path] = None):
 # ═══════════════════════════════════════════════════════════════════════════════
 
 if __name__ == "__main__":
+    if len(sys.argv) >= 2 and sys.argv[1] in BATCH_COMMANDS:
+        sys.exit(batch_main(sys.argv[1:]))
+    
     initial = None
     
     if len(sys.argv) >= 3 and sys.argv[1] == '--theme':
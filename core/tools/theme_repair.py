@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Prism Theme Repair - minimal OKLCH lightness fixes for failing WCAG pairs
+
+validate_themes and scripts/validate_vscode_wcag only report contrast
+failures. This finds every failing pair of theme_transform.WCAG_PAIRS and
+moves the foreground just far enough in OKLCH lightness to pass, keeping its
+hue and chroma (chroma only drops where the new lightness cannot hold it in
+sRGB). Backgrounds never move.
+
+Pairs that share a color are resolved jointly. A repaired color is one hex
+value of one theme, and every foreground that uses it moves together, so the
+palette stays coherent. Its new luminance has to satisfy all of its pairs at
+once. Each pair allows Y <= (Yb + 0.05) / r - 0.05 or Y >= r (Yb + 0.05) - 0.05,
+and the closest feasible point above and below the current color are both
+solved. The one with the smaller lightness change wins. Only text colors move
+(token foregrounds and *Foreground keys); backgrounds, borders and other uses
+of the same hex keep the old value.
+
+The whole corpus is solved as one batch of arrays; --jobs shards very large
+corpora across processes. Patched themes and a diff report (text on stdout,
+JSON in the output directory) are written; themes whose file names collide
+are told apart by their parent directories (a/fleek.json, b/fleek.json).
+--check only reports and exits 1 when something needs repair, for pre-commit
+hooks.
+
+Usage:
+    python theme_repair.py ../../vscode/themes                    # build/repaired/
+    python theme_repair.py ../../vscode/themes --in-place
+    python theme_repair.py ../../vscode/themes/acid_rain.json --check
+"""
+
+import argparse
+import json
+import os
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from color_array import oklch_to_srgb, relative_luminance, srgb_to_hex, srgb_to_oklch
+from theme_transform import WCAG_PAIRS, ColorTable, audit, pair_contrast, solve_lightness, theme_files
+
+SCRIPT_DIR = Path(__file__).parent
+PRISM_ROOT = SCRIPT_DIR.parent.parent
+DEFAULT_OUTPUT = PRISM_ROOT / "build" / "repaired"
+REPORT_FILE = "repair-report.json"
+
+MARGIN = 0.02       # aim this far above each threshold so 8-bit rounding cannot undo a fix
+ROUNDS = 3          # re-solve pairs that rounding still left failing, with a doubled margin
+SHARD_THEMES = 256  # themes per worker process with --jobs
+
+PAIR_FOREGROUNDS = {fg for fg, _, _ in WCAG_PAIRS}
+
+# ═══════════════════════════════════════════════════════════════════
+# Solver
+# ═══════════════════════════════════════════════════════════════════
+
+def feasible(y: np.ndarray, dark_max: np.ndarray, light_min: np.ndarray) -> np.ndarray:
+    """(V, M) candidate luminances against (V, K) constraints -> (V, M) all satisfied."""
+    y = y[:, :, None]
+    return np.all((y <= dark_max[:, None, :]) | (y >= light_min[:, None, :]), axis=-1)
+
+def solve(srgb: np.ndarray, bg_lum: np.ndarray, ratio: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """New sRGB for V colors, each constrained against K backgrounds (padded with ratio 0).
+
+    Returns (srgb, solved); unsolved colors are returned unchanged.
+    """
+    Y = relative_luminance(srgb)
+    active = ratio > 0
+    dark_max = np.where(active, (bg_lum + 0.05) / np.maximum(ratio, 1e-9) - 0.05, 1.0)
+    light_min = np.where(active, ratio * (bg_lum + 0.05) - 0.05, 0.0)
+
+    # The nearest feasible luminance is the color itself or a constraint boundary
+    candidates = np.concatenate([Y[:, None], dark_max, light_min], axis=1)
+    ok = feasible(candidates, dark_max, light_min) & (candidates >= 0) & (candidates <= 1)
+    up = np.where(ok & (candidates >= Y[:, None]), candidates, np.inf).min(axis=1)
+    down = np.where(ok & (candidates <= Y[:, None]), candidates, -np.inf).max(axis=1)
+
+    lch = srgb_to_oklch(srgb)
+    both = np.concatenate([lch, lch])
+    targets = np.concatenate([np.where(np.isfinite(up), up, 1.0), np.where(np.isfinite(down), down, 0.0)])
+    moved = solve_lightness(both, targets)
+    v = len(srgb)
+    dl_up = np.where(np.isfinite(up), np.abs(moved[:v, 0] - lch[:, 0]), np.inf)
+    dl_down = np.where(np.isfinite(down), np.abs(moved[v:, 0] - lch[:, 0]), np.inf)
+    best = np.where((dl_up <= dl_down)[:, None], moved[:v], moved[v:])
+    solved = np.isfinite(np.minimum(dl_up, dl_down))
+    return np.where(solved[:, None], oklch_to_srgb(best), srgb), solved
+
+# ═══════════════════════════════════════════════════════════════════
+# Repair
+# ═══════════════════════════════════════════════════════════════════
+
+def repair_corpus(themes: List[dict]) -> Tuple[List[dict], List[dict], List[tuple], List[tuple]]:
+    """(patched themes, changes, failures before, failures left) for a list of themes."""
+    table = ColorTable(themes)
+    fg, bg, minimum, labels = table.pairs()
+    srgb = table.srgb.copy()
+    alpha = table.alpha()
+    codes = srgb_to_hex(srgb)
+    movable = {ref for ref, (_, section, key) in enumerate(table.refs)
+               if section == "tokenColors" or key in PAIR_FOREGROUNDS or key.endswith(("oreground", "Foreground"))}
+    movable -= set(bg.tolist())
+    before = audit(table)
+    changes: Dict[Tuple[int, str, int], dict] = {}
+    split = set()  # (theme, hex) whose joint constraints conflict: each use is solved on its own
+
+    margin = MARGIN
+    for _ in range(ROUNDS + 1):
+        ratios = pair_contrast(srgb, alpha, fg, bg)
+        failing = ratios < minimum
+        if not failing.any():
+            break
+        # One variable per (theme, hex) of a failing foreground; all its foreground refs move together
+        variables = sorted({(labels[i][0], codes[fg[i]], int(fg[i]) if (labels[i][0], codes[fg[i]]) in split else -1)
+                            for i in np.flatnonzero(failing)})
+        slot = {var: n for n, var in enumerate(variables)}
+        members = [[] for _ in variables]
+        for ref, (t, _, _) in enumerate(table.refs):
+            if ref not in movable:
+                continue
+            n = slot.get((t, codes[ref], -1), slot.get((t, codes[ref], ref)))
+            if n is not None:
+                members[n].append(ref)
+        constraints = [[] for _ in variables]
+        member_of = {ref: n for n, refs in enumerate(members) for ref in refs}
+        for i in range(len(fg)):
+            n = member_of.get(int(fg[i]))
+            if n is not None:
+                constraints[n].append((int(bg[i]), minimum[i] + margin))
+
+        K = max(len(c) for c in constraints)
+        bg_lum = np.zeros((len(variables), K))
+        ratio = np.zeros((len(variables), K))
+        bg_luminance = relative_luminance(srgb)
+        for n, pairs in enumerate(constraints):
+            for k, (b, r) in enumerate(pairs):
+                bg_lum[n, k], ratio[n, k] = bg_luminance[b], r
+        current = np.array([srgb[refs[0]] for refs in members])
+        fixed, solved = solve(current, bg_lum, ratio)
+        fixed = np.rint(fixed * 255) / 255
+
+        for n, (t, old, single) in enumerate(variables):
+            if not solved[n]:
+                if single < 0:
+                    split.add((t, old))
+                continue
+            new = srgb_to_hex(fixed[n])[0]
+            for ref in members[n]:
+                srgb[ref] = fixed[n]
+                codes[ref] = new
+            earlier = next((c for c in changes.values()
+                            if c["theme"] == t and c["new"] == old and set(members[n]) <= c["refs"]), None)
+            if earlier:  # a later round refining an earlier fix
+                earlier["new"] = new
+            else:
+                changes[(t, old, single)] = {"theme": t, "old": old, "new": new, "refs": set(members[n]),
+                                             "keys": [table_key(table.refs[ref]) for ref in members[n]]}
+        if solved.all():
+            margin *= 2
+
+    patched = table.with_srgb(srgb)
+    after = audit(table, srgb)
+    for change in changes.values():
+        del change["refs"]
+        old, new = srgb_to_oklch(np.array([hex_to_unit(change["old"]), hex_to_unit(change["new"])]))
+        change["delta_L"] = round(float(new[0] - old[0]), 4)
+        change["delta_C"] = round(float(new[1] - old[1]), 4)
+    return patched, list(changes.values()), before, after
+
+def table_key(ref: tuple) -> str:
+    _, section, key = ref
+    return key if section == "colors" else f"tokenColors[{key}]"
+
+def hex_to_unit(value: str) -> Tuple[float, float, float]:
+    return tuple(int(value[i:i + 2], 16) / 255 for i in (1, 3, 5))
+
+def repair_shard(job: Tuple[List[str], List[dict]]) -> Tuple[List[str], list, list, list, list]:
+    names, themes = job
+    return (names, *repair_corpus(themes))
+
+def run_shards(names: List[str], themes: List[dict], jobs: int):
+    """Yield repair_shard results; one in-process batch unless the corpus is large."""
+    shards = [(names[i:i + SHARD_THEMES], themes[i:i + SHARD_THEMES]) for i in range(0, len(themes), SHARD_THEMES)]
+    if jobs <= 1 or len(shards) < 2:
+        yield from map(repair_shard, shards)
+        return
+    with ProcessPoolExecutor(max_workers=min(jobs, len(shards))) as pool:
+        yield from pool.map(repair_shard, shards)
+
+# ═══════════════════════════════════════════════════════════════════
+# CLI
+# ═══════════════════════════════════════════════════════════════════
+
+def repair_inputs(paths: List[Path]) -> List[Path]:
+    """Theme files under paths, each once, without a previous run's report."""
+    files = {f.resolve(): f for f in theme_files(paths) if f.name != REPORT_FILE}
+    return list(files.values())
+
+def theme_labels(files: List[Path]) -> List[str]:
+    """Report key and output name per file: the stem, or where stems collide the
+    fewest trailing directories that tell the files apart (a/fleek, b/fleek)."""
+    parts = [f.resolve().with_suffix("").parts for f in files]
+    depth = [1] * len(files)
+    while True:
+        labels = ["/".join(p[-d:]) for p, d in zip(parts, depth)]
+        counts = Counter(labels)
+        clashing = [i for i, label in enumerate(labels) if counts[label] > 1]
+        if not clashing:
+            return labels
+        for i in clashing:
+            depth[i] += 1
+
+def main():
+    parser = argparse.ArgumentParser(description="Repair failing WCAG contrast pairs with minimal OKLCH lightness changes")
+    parser.add_argument("paths", type=Path, nargs="+", help="Theme .json files or directories of them")
+    parser.add_argument("--output", "-o", type=Path, default=DEFAULT_OUTPUT, help=f"Output directory (default: {DEFAULT_OUTPUT})")
+    parser.add_argument("--in-place", action="store_true", help="Overwrite the input themes")
+    parser.add_argument("--check", action="store_true", help="Report only; exit 1 if any theme needs repair")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1, help="Worker processes for large corpora")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    files = repair_inputs(args.paths)
+    themes = [json.loads(f.read_text(encoding="utf-8")) for f in files]
+    labels = theme_labels(files)
+    by_label = dict(zip(labels, files))
+
+    report, repaired, fixed_pairs, left_pairs, before_total = {}, 0, 0, [], 0
+    for names, patched, changes, before, after in run_shards(labels, themes, args.jobs):
+        before_total += len(before)
+        left_pairs += [(names[t], fg, bg, ratio, minimum) for t, fg, bg, ratio, minimum in after]
+        fixed_pairs += len(before) - len(after)
+        touched = sorted({c["theme"] for c in changes})
+        for t in touched:
+            name = names[t]
+            theme_changes = [{k: v for k, v in c.items() if k != "theme"} for c in changes if c["theme"] == t]
+            report[name] = {
+                "changes": theme_changes,
+                "failing": [f"{fg} on {bg} {ratio:.2f}:1 (min {minimum})"
+                          for tt, fg, bg, ratio, minimum in before if tt == t],
+            }
+            print(f"{name}:")
+            for c in theme_changes:
+                keys = ", ".join(c["keys"][:3]) + (f" +{len(c['keys']) - 3}" if len(c["keys"]) > 3 else "")
+                print(f"  {c['old']} -> {c['new']}  ΔL {c['delta_L']:+.3f}  ΔC {c['delta_C']:+.3f}  [{keys}]")
+            if args.check:
+                continue
+            target = by_label[name] if args.in_place else args.output / f"{name}.json"
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_text(json.dumps(patched[t], indent=2) + "\n", encoding="utf-8")
+            repaired += 1
+
+    for name, fg, bg, ratio, minimum in left_pairs:
+        print(f"  ✗ {name}: {fg} on {bg} {ratio:.2f}:1 < {minimum}:1 (no lightness reaches it)")
+    if report and not args.check:
+        args.output.mkdir(parents=True, exist_ok=True)  # never next to the themes: sync globs *.json there
+        (args.output / REPORT_FILE).write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    elapsed = time.perf_counter() - start
+    verb = "need repair" if args.check else "repaired"
+    print(f"\n{len(report)} of {len(files)} themes {verb}: {fixed_pairs} of {before_total} failing pairs fixed, "
+          f"{len(left_pairs)} left ({elapsed:.2f}s)")
+    if args.check:
+        return 1 if before_total else 0
+    return 1 if left_pairs else 0
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,405 @@
+#!/usr/bin/env python3
+"""
+Prism Theme Service - on-demand theme generation over local HTTP
+
+A small asyncio HTTP/1.1 server (loopback TCP or a Unix socket) that
+generates a theme from (hue, saturation, mode, monitor) and renders it in any
+registered output format. Nothing leaves the machine: the server refuses to
+bind anything but a loopback address and only uses the local generators.
+
+    GET /theme?hue=211&saturation=0.9&mode=dark&monitor=oled&format=kitty
+    GET /formats        generators and the formats each one renders
+    GET /metrics        cache and latency counters (JSON)
+    GET /health
+
+Generators:
+    verified  verified_generator (WCAG-checked Base16 ramps); formats are
+              "vscode", "neovim" (precompiled highlights) and the sync family
+    studio    prism_studio's ThemeCreator rules (studio_colors); formats are the
+              studio family
+
+Results are kept in a bounded LRU keyed by the normalized parameters, so
+hue=211 and hue=571.0 share one entry. Concurrent requests for a key that is
+still being generated wait on the same job instead of generating it again.
+
+Usage:
+    python theme_service.py [--port 8765] [--unix PATH] [--cache-size 512]
+    curl 'http://127.0.0.1:8765/theme?hue=30&mode=light&format=alacritty'
+"""
+
+import argparse
+import asyncio
+import ipaddress
+import json
+import os
+import signal
+import sys
+import time
+from collections import OrderedDict, deque
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+from format_writers import formats, render
+from nvim_highlights import compile_preset, to_lua
+from studio_colors import generate_creator_colors
+from verified_generator import ThemeConfig, generate_vscode_theme
+
+SCRIPT_DIR = Path(__file__).parent
+PRISM_ROOT = SCRIPT_DIR.parent.parent
+sys.path.insert(0, str(PRISM_ROOT))  # sync_themes.extract_colors lives at the repo root
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+CACHE_SIZE = 512
+LATENCY_WINDOW = 2048
+MAX_REQUEST_LINE = 8192
+
+GENERATORS = ("verified", "studio")
+MODES = ("dark", "light")
+MONITORS = ("oled", "lcd")
+
+class ServiceError(ValueError):
+    """A request the service cannot satisfy (reported as HTTP 400/404)."""
+
+    def __init__(self, message: str, status: int = 400):
+        super().__init__(message)
+        self.status = status
+
+# ═══════════════════════════════════════════════════════════════════
+# Parameters
+# ═══════════════════════════════════════════════════════════════════
+
+def generator_formats(generator: str) -> List[str]:
+    if generator == "verified":
+        return ["vscode", "neovim", *formats("sync")]
+    return formats("studio")
+
+def _number(query: Dict[str, str], key: str, default: float) -> float:
+    raw = query.get(key)
+    if raw is None or raw == "":
+        return default
+    try:
+        value = float(raw)
+    except ValueError:
+        raise ServiceError(f"{key} must be a number, got {raw!r}")
+    if value != value or value in (float("inf"), float("-inf")):
+        raise ServiceError(f"{key} must be finite")
+    return value
+
+def normalize(query: Dict[str, str]) -> Tuple:
+    """Canonical cache key: (generator, hue, saturation, mode, monitor, name, format).
+
+    Hue wraps to [0, 360) and is rounded to 0.01 deg, saturation is clamped to
+    [0, 1] and rounded to 0.001 - finer steps are below one 8-bit sRGB code.
+    """
+    generator = query.get("generator", "verified").lower()
+    if generator not in GENERATORS:
+        raise ServiceError(f"Unknown generator: {generator} (expected one of {', '.join(GENERATORS)})")
+    mode = query.get("mode", "dark").lower()
+    if mode not in MODES:
+        raise ServiceError(f"mode must be dark or light, got {mode!r}")
+    monitor = query.get("monitor", "oled").lower()
+    if monitor not in MONITORS:
+        raise ServiceError(f"monitor must be oled or lcd, got {monitor!r}")
+    fmt = query.get("format", "vscode" if generator == "verified" else "opencode").lower()
+    if fmt not in generator_formats(generator):
+        raise ServiceError(f"Unknown format for {generator}: {fmt}", status=404)
+
+    hue = round(_number(query, "hue", 211.0) % 360.0, 2) % 360.0
+    saturation = round(min(1.0, max(0.0, _number(query, "saturation", 0.9))), 3)
+    name = (query.get("name") or f"Prism {hue:g} {mode}").strip()[:64]
+    return (generator, hue, saturation, mode, monitor, name, fmt)
+
+def slugify(name: str) -> str:
+    slug = "".join(ch if ch.isalnum() else "_" for ch in name.lower()).strip("_")
+    return slug or "prism"
+
+# ═══════════════════════════════════════════════════════════════════
+# Generation (runs in a worker thread)
+# ═══════════════════════════════════════════════════════════════════
+
+def verified_theme(hue: float, saturation: float, mode: str, monitor: str, name: str) -> dict:
+    config = ThemeConfig(
+        hero_hue=hue, hero_saturation=saturation,
+        base_hue=hue, base_saturation=0.1,
+        mode=mode, monitor=monitor, name=name,
+    )
+    return generate_vscode_theme(config, verbose=False)
+
+def studio_values(hue: float, saturation: float, mode: str, monitor: str, name: str) -> dict:
+    """ThemeCreator slots from the service parameters.
+
+    saturation scales ThemeCreator's chroma range (0.2 at 1.0); monitor picks
+    the background lightness (near-black for OLED, the slider default for LCD).
+    """
+    if mode == "dark":
+        bg_l, fg_l = (0.10 if monitor == "oled" else 0.15), 0.90
+    else:
+        bg_l, fg_l = (0.97 if monitor == "oled" else 0.95), 0.25
+    colors = generate_creator_colors(hue, saturation * 0.2, bg_l, fg_l)
+    return {**vars(colors), "name": name, "author": "Prism", "theme_type": mode}
+
+def generate(key: Tuple) -> Tuple[str, bytes]:
+    """Render one normalized request; returns (content type, body)."""
+    from sync_themes import extract_colors
+
+    generator, hue, saturation, mode, monitor, name, fmt = key
+    if generator == "studio":
+        text = render("studio", fmt, studio_values(hue, saturation, mode, monitor, name))
+        return content_type(text), text.encode("utf-8")
+
+    theme = verified_theme(hue, saturation, mode, monitor, name)
+    if fmt == "vscode":
+        return "application/json", json.dumps(theme, indent=2).encode("utf-8")
+    slug = slugify(name)
+    colors = extract_colors(theme)
+    if fmt == "neovim":
+        return "text/x-lua", to_lua(compile_preset(slug, colors, mode)).encode("utf-8")
+    text = render("sync", fmt, {**colors, "slug": slug})
+    return content_type(text), text.encode("utf-8")
+
+def content_type(text: str) -> str:
+    stripped = text.lstrip()
+    if stripped.startswith(("{", "[")):
+        return "application/json"
+    if stripped.startswith("<?xml"):
+        return "application/xml"
+    return "text/plain"
+
+# ═══════════════════════════════════════════════════════════════════
+# Cache and metrics
+# ═══════════════════════════════════════════════════════════════════
+
+class LRUCache:
+    """Bounded mapping that evicts the least recently used entry."""
+
+    def __init__(self, maxsize: int = CACHE_SIZE):
+        self.maxsize = maxsize
+        self.data: "OrderedDict[Tuple, Tuple[str, bytes]]" = OrderedDict()
+        self.evictions = 0
+
+    def get(self, key):
+        value = self.data.get(key)
+        if value is not None:
+            self.data.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        self.data[key] = value
+        self.data.move_to_end(key)
+        while len(self.data) > self.maxsize:
+            self.data.popitem(last=False)
+            self.evictions += 1
+
+    def __len__(self):
+        return len(self.data)
+
+def percentile(samples: List[float], q: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+class Metrics:
+    """Request counters plus a sliding window of latencies per outcome."""
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self.started = time.time()
+        self.counts = {"hit": 0, "miss": 0, "coalesced": 0, "error": 0}
+        self.latency = {outcome: deque(maxlen=window) for outcome in self.counts}
+
+    def record(self, outcome: str, seconds: float):
+        self.counts[outcome] += 1
+        self.latency[outcome].append(seconds * 1000.0)
+
+    def snapshot(self) -> dict:
+        latency = {}
+        for outcome, window in self.latency.items():
+            samples = list(window)
+            latency[outcome] = {
+                "p50_ms": round(percentile(samples, 0.50), 3),
+                "p95_ms": round(percentile(samples, 0.95), 3),
+                "p99_ms": round(percentile(samples, 0.99), 3),
+                "max_ms": round(max(samples, default=0.0), 3),
+            }
+        served = self.counts["hit"] + self.counts["miss"] + self.counts["coalesced"]
+        return {
+            "uptime": round(time.time() - self.started, 1),
+            "requests": served + self.counts["error"],
+            **self.counts,
+            "hit_rate": round((self.counts["hit"] + self.counts["coalesced"]) / served, 4) if served else 0.0,
+            "latency": latency,
+        }
+
+# ═══════════════════════════════════════════════════════════════════
+# Server
+# ═══════════════════════════════════════════════════════════════════
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 500: "Internal Server Error",
+           503: "Service Unavailable"}
+
+class ThemeService:
+    """Cached, coalescing front end to the generators."""
+
+    def __init__(self, cache_size: int = CACHE_SIZE):
+        self.cache = LRUCache(cache_size)
+        self.metrics = Metrics()
+        self.inflight: Dict[Tuple, asyncio.Future] = {}
+        self._stop: Optional[asyncio.Event] = None
+
+    async def theme(self, query: Dict[str, str]) -> Tuple[str, bytes, str]:
+        """(content type, body, outcome) for one /theme request."""
+        key = normalize(query)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return (*cached, "hit")
+        pending = self.inflight.get(key)
+        if pending is not None:
+            return (*await asyncio.shield(pending), "coalesced")
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.inflight[key] = future
+        try:
+            result = await loop.run_in_executor(None, generate, key)
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # mark retrieved when nobody else was waiting
+            raise
+        else:
+            self.cache.put(key, result)
+            future.set_result(result)
+        finally:
+            del self.inflight[key]
+            if not future.done():  # cancelled: answer the coalesced waiters instead of leaving them hanging
+                future.set_exception(ServiceError("theme generation was cancelled", status=503))
+                future.exception()
+        return (*result, "miss")
+
+    def stats(self) -> dict:
+        return {
+            **self.metrics.snapshot(),
+            "cache": {"size": len(self.cache), "maxsize": self.cache.maxsize,
+                      "evictions": self.cache.evictions, "inflight": len(self.inflight)},
+        }
+
+    async def route(self, method: str, target: str) -> Tuple[int, str, bytes]:
+        url = urlsplit(target)
+        if method not in ("GET", "HEAD"):
+            raise ServiceError(f"{method} not supported", status=405)
+        if url.path == "/theme":
+            start = time.perf_counter()
+            try:
+                ctype, body, outcome = await self.theme(dict(parse_qsl(url.query)))
+            except Exception:
+                self.metrics.record("error", time.perf_counter() - start)
+                raise
+            self.metrics.record(outcome, time.perf_counter() - start)
+            return 200, ctype, body
+        if url.path == "/formats":
+            listing = {g: generator_formats(g) for g in GENERATORS}
+            return 200, "application/json", json.dumps(listing, indent=2).encode("utf-8")
+        if url.path == "/metrics":
+            return 200, "application/json", json.dumps(self.stats(), indent=2).encode("utf-8")
+        if url.path == "/health":
+            return 200, "text/plain", b"ok\n"
+        raise ServiceError(f"No such endpoint: {url.path}", status=404)
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """HTTP/1.1 with keep-alive; requests on one connection are answered in order."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                parts = request_line.decode("latin-1").split()
+                keep_alive = headers.get("connection", "").lower() != "close"
+                if len(parts) != 3 or len(request_line) > MAX_REQUEST_LINE:
+                    status, ctype, body = 400, "text/plain", b"malformed request line\n"
+                    keep_alive = False
+                else:
+                    method, target, version = parts
+                    keep_alive = keep_alive and version == "HTTP/1.1"
+                    try:
+                        status, ctype, body = await self.route(method, target)
+                    except ServiceError as e:
+                        status, ctype, body = e.status, "text/plain", f"{e}\n".encode("utf-8")
+                    except Exception as e:  # keep serving; report to the client
+                        status, ctype, body = 500, "text/plain", f"{type(e).__name__}: {e}\n".encode("utf-8")
+                    if method == "HEAD":
+                        body = b""
+                head = (
+                    f"HTTP/1.1 {status} {REASONS.get(status, 'Error')}\r\n"
+                    f"Content-Type: {ctype}; charset=utf-8\r\n"
+                    f"Content-Length: {len(body)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+                )
+                writer.write(head.encode("latin-1") + body)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, unix: Optional[Path] = None):
+        self._stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, self._stop.set)
+        if unix is not None:
+            old_umask = os.umask(0o077)
+            try:
+                server = await asyncio.start_unix_server(self.handle, path=str(unix))
+            finally:
+                os.umask(old_umask)
+            where = f"unix:{unix}"
+        else:
+            server = await asyncio.start_server(self.handle, host=host, port=port)
+            where = "http://" + ("[%s]:%d" % (host, port) if ":" in host else f"{host}:{port}")
+        # Import the generators now so the first request does not pay for it
+        await loop.run_in_executor(None, generate, normalize({"format": "kitty"}))
+        print(f"prism theme service listening on {where} (pid {os.getpid()})", flush=True)
+        async with server:
+            await self._stop.wait()
+        if unix is not None:
+            unix.unlink(missing_ok=True)
+
+def is_loopback(host: str) -> bool:
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+def main():
+    parser = argparse.ArgumentParser(description="Local on-demand theme generation service")
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"Loopback address to bind (default: {DEFAULT_HOST})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"TCP port (default: {DEFAULT_PORT})")
+    parser.add_argument("--unix", type=Path, default=None, help="Serve on a Unix socket instead of TCP")
+    parser.add_argument("--cache-size", type=int, default=CACHE_SIZE, help=f"LRU entries (default: {CACHE_SIZE})")
+    args = parser.parse_args()
+    if args.unix is None and not is_loopback(args.host):
+        parser.error(f"--host must be a loopback address, got {args.host}")
+    if args.cache_size < 1:
+        parser.error("--cache-size must be at least 1")
+    if args.unix is not None and args.unix.exists():
+        if not args.unix.is_socket():
+            parser.error(f"--unix {args.unix} exists and is not a socket")
+        args.unix.unlink()
+
+    asyncio.run(ThemeService(args.cache_size).serve(args.host, args.port, args.unix))
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
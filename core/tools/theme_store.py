@@ -0,0 +1,525 @@
+#!/usr/bin/env python3
+"""
+Prism Theme Store - palette-indexed compact storage for the theme corpus
+
+A VS Code theme repeats a dozen distinct colours across ~90 workbench keys
+and ~30 token rules. The store keeps each colour once per theme and refers
+to it by index:
+
+    header      magic, version, theme count, dictionary offset/length
+    dictionary  JSON, shared by every theme: workbench keys, token scopes,
+                fontStyles and the table of contents (slug -> offset)
+    records     one per theme, 8-byte aligned:
+                  RecordHeader   counts and flags (16 bytes)
+                  palette        u32 RGBA per unique colour + u8 form each
+                  slots          u16 palette index per dictionary key
+                                 (NONE = key absent)
+                  order          u16 key ids, only if the theme's key order
+                                 differs from the dictionary's
+                  tokens         (u16 scope, u16 foreground, u16 fontStyle)
+                  extras         small JSON: name, type, top-level key order
+                                 and anything that does not fit the arrays
+
+Conversion is lossless: theme(slug) == json.load(original), key order
+included. Values that do not fit the compact form (unusual colour strings,
+extra token fields) are kept verbatim in extras.
+
+ThemeStore mmaps the file and only parses the dictionary; a theme is decoded
+on first access, and palette()/color() read straight from the mapping.
+
+sync_themes and generate_gallery read the corpus through current_store(),
+which returns the store only while it holds exactly the themes of the JSON
+directory and is newer than every one of them; otherwise they parse the JSON
+as before, so a stale store is never used.
+
+Usage:
+    from theme_store import ThemeStore, write_store
+    write_store("build/themes.prismstore", {"arctic": theme_dict, ...})
+    with ThemeStore("build/themes.prismstore") as store:
+        store.names(); store.theme("arctic"); store.color("arctic", "editor.background")
+    store = current_store("vscode/themes")   # None when missing or stale
+
+    python theme_store.py pack vscode/themes -o build/themes.prismstore
+    python theme_store.py verify build/themes.prismstore vscode/themes
+    python theme_store.py unpack build/themes.prismstore -C /tmp/themes
+    python theme_store.py bench vscode/themes
+"""
+
+import argparse
+import json
+import mmap
+import re
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+MAGIC = b"PRSMSTR1"
+VERSION = 1
+FILE_HEADER = struct.Struct("<8sIIII")     # magic, version, themes, dictionary offset, dictionary length
+RECORD_HEADER = struct.Struct("<HHHHII")   # palette, tokens, order, flags, extras length, slots
+NONE = 0xFFFF
+
+DEFAULT_STORE = Path(__file__).parent.parent.parent / "build" / "themes.prismstore"
+THEME_ORDER = ["name", "type", "colors", "tokenColors"]
+
+# Record flags
+RAW_COLORS = 0x1   # "colors" kept verbatim in extras
+RAW_TOKENS = 0x2   # "tokenColors" kept verbatim in extras
+
+# Palette entry forms: how the RGBA value is spelled in the JSON
+FORM_RGB = 0        # #rrggbb
+FORM_RGBA = 1       # #rrggbbaa
+FORM_RGB_UPPER = 2  # #RRGGBB
+FORM_RGBA_UPPER = 3 # #RRGGBBAA
+FORM_VERBATIM = 255 # value is an index into extras["strings"]
+
+HEX_RE = re.compile(r"#(?:[0-9a-f]{6}|[0-9a-f]{8}|[0-9A-F]{6}|[0-9A-F]{8})")
+
+class StoreError(ValueError):
+    """The file is not a Prism theme store, or is from another version."""
+
+# ═══════════════════════════════════════════════════════════════════
+# Encoding
+# ═══════════════════════════════════════════════════════════════════
+
+def encode_color(value: str, strings: List[str]) -> Tuple[int, int]:
+    """(rgba, form) for one colour string."""
+    if HEX_RE.fullmatch(value):
+        digits = value[1:]
+        upper = digits != digits.lower()
+        if len(digits) == 6:
+            return int(digits + "ff", 16), FORM_RGB_UPPER if upper else FORM_RGB
+        return int(digits, 16), FORM_RGBA_UPPER if upper else FORM_RGBA
+    strings.append(value)
+    return len(strings) - 1, FORM_VERBATIM
+
+def decode_color(rgba: int, form: int, strings: List[str]) -> str:
+    if form == FORM_VERBATIM:
+        return strings[rgba]
+    text = f"{rgba >> 8:06x}" if form in (FORM_RGB, FORM_RGB_UPPER) else f"{rgba:08x}"
+    return "#" + (text.upper() if form in (FORM_RGB_UPPER, FORM_RGBA_UPPER) else text)
+
+class Dictionary:
+    """Interning tables shared by every record in a store."""
+
+    def __init__(self):
+        self.keys: List[str] = []
+        self.scopes: List[str] = []   # JSON text of each distinct scope value
+        self.styles: List[str] = []
+        self._ids: Dict[Tuple[str, str], int] = {}
+
+    def intern(self, table: str, value: str) -> int:
+        ident = self._ids.get((table, value))
+        if ident is None:
+            values = getattr(self, table)
+            ident = self._ids[(table, value)] = len(values)
+            values.append(value)
+            if ident >= NONE:
+                raise ValueError(f"more than {NONE} distinct {table} in one store")
+        return ident
+
+def compact_token(token) -> bool:
+    """True if a tokenColors rule fits (scope, foreground, fontStyle) exactly."""
+    if not isinstance(token, dict) or list(token) != ["scope", "settings"]:
+        return False
+    settings = token["settings"]
+    if not isinstance(settings, dict) or list(settings) not in (["foreground"], ["fontStyle"], ["foreground", "fontStyle"], []):
+        return False
+    return all(isinstance(v, str) for v in settings.values())
+
+def encode_theme(theme: dict, dictionary: Dictionary) -> bytes:
+    """One record: header, palette, slots, order, tokens, extras (8-byte aligned)."""
+    palette: Dict[str, int] = {}
+    rgba: List[int] = []
+    forms: List[int] = []
+    strings: List[str] = []
+    extras: dict = {}
+    flags = 0
+
+    def color_index(value: str) -> int:
+        index = palette.get(value)
+        if index is None:
+            value_rgba, form = encode_color(value, strings)
+            index = palette[value] = len(rgba)
+            rgba.append(value_rgba)
+            forms.append(form)
+        return index
+
+    top = list(theme)
+    if top != THEME_ORDER:
+        extras["top"] = top
+    for key in top:
+        if key not in ("colors", "tokenColors"):
+            extras.setdefault("values", {})[key] = theme[key]
+
+    colors = theme.get("colors", {})
+    key_ids: List[int] = []
+    slots: Dict[int, int] = {}
+    if isinstance(colors, dict) and all(isinstance(v, str) for v in colors.values()):
+        for key, value in colors.items():
+            ident = dictionary.intern("keys", key)
+            key_ids.append(ident)
+            slots[ident] = color_index(value)
+    else:
+        flags |= RAW_COLORS
+        extras["colors"] = colors
+
+    tokens: List[Tuple[int, int, int]] = []
+    rules = theme.get("tokenColors", [])
+    if isinstance(rules, list):
+        for i, token in enumerate(rules):
+            if compact_token(token):
+                settings = token["settings"]
+                tokens.append((
+                    dictionary.intern("scopes", json.dumps(token["scope"], ensure_ascii=False)),
+                    color_index(settings["foreground"]) if "foreground" in settings else NONE,
+                    dictionary.intern("styles", settings["fontStyle"]) if "fontStyle" in settings else NONE,
+                ))
+            else:
+                tokens.append((NONE, NONE, NONE))
+                extras.setdefault("tokens", {})[str(i)] = token
+    else:
+        flags |= RAW_TOKENS
+        extras["tokenColors"] = rules
+
+    if strings:
+        extras["strings"] = strings
+    # Slots cover every key known so far; later keys read as absent (index past the end)
+    slot_array = [slots.get(i, NONE) for i in range(len(dictionary.keys))] if not flags & RAW_COLORS else []
+    order = [] if key_ids == sorted(key_ids) else key_ids
+    extras_blob = json.dumps(extras, ensure_ascii=False, separators=(",", ":")).encode("utf-8") if extras else b""
+
+    out = bytearray(RECORD_HEADER.pack(len(rgba), len(tokens), len(order), flags, len(extras_blob), len(slot_array)))
+    out += struct.pack(f"<{len(rgba)}I", *rgba)
+    out += bytes(forms) + b"\0" * (len(forms) & 1)
+    out += struct.pack(f"<{len(slot_array)}H", *slot_array)
+    out += struct.pack(f"<{len(order)}H", *order)
+    out += struct.pack(f"<{3 * len(tokens)}H", *(v for t in tokens for v in t))
+    out += extras_blob
+    out += b"\0" * (-len(out) % 8)
+    return bytes(out)
+
+def build_store(themes: Dict[str, dict]) -> bytes:
+    """Serialize {slug: VS Code theme} into store bytes."""
+    dictionary = Dictionary()
+    records = [(slug, encode_theme(themes[slug], dictionary)) for slug in sorted(themes)]
+    toc, offset = [], FILE_HEADER.size
+    for slug, record in records:
+        toc.append([slug, offset, len(record)])
+        offset += len(record)
+    blob = json.dumps({
+        "keys": dictionary.keys,
+        "scopes": dictionary.scopes,
+        "styles": dictionary.styles,
+        "themes": toc,
+    }, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    header = FILE_HEADER.pack(MAGIC, VERSION, len(records), offset, len(blob))
+    return header + b"".join(record for _, record in records) + blob
+
+def write_store(path: Union[str, Path], themes: Dict[str, dict]) -> int:
+    """Write a store file; returns its size in bytes."""
+    data = build_store(themes)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    tmp.replace(path)
+    return len(data)
+
+# ═══════════════════════════════════════════════════════════════════
+# Reading
+# ═══════════════════════════════════════════════════════════════════
+
+class Record:
+    """Array views into one theme record (no JSON parsed until needed)."""
+
+    def __init__(self, buf: memoryview, offset: int):
+        n_palette, n_tokens, n_order, self.flags, extras_len, n_slots = RECORD_HEADER.unpack_from(buf, offset)
+        pos = offset + RECORD_HEADER.size
+        self.rgba = buf[pos:pos + 4 * n_palette].cast("I")
+        pos += 4 * n_palette
+        self.forms = buf[pos:pos + n_palette]
+        pos += n_palette + (n_palette & 1)
+        self.slots = buf[pos:pos + 2 * n_slots].cast("H")
+        pos += 2 * n_slots
+        self.order = buf[pos:pos + 2 * n_order].cast("H")
+        pos += 2 * n_order
+        self.tokens = buf[pos:pos + 6 * n_tokens].cast("H")
+        pos += 6 * n_tokens
+        self._extras = buf[pos:pos + extras_len]
+        self._parsed: Optional[dict] = None
+        self._palette: Optional[List[str]] = None
+
+    @property
+    def extras(self) -> dict:
+        if self._parsed is None:
+            self._parsed = json.loads(bytes(self._extras)) if len(self._extras) else {}
+        return self._parsed
+
+    @property
+    def palette(self) -> List[str]:
+        """Every palette entry as its JSON string, decoded once."""
+        if self._palette is None:
+            strings = self.extras.get("strings", [])
+            self._palette = [decode_color(v, f, strings) for v, f in zip(self.rgba, self.forms)]
+        return self._palette
+
+    def color(self, index: int) -> str:
+        return decode_color(self.rgba[index], self.forms[index], self.extras.get("strings", []))
+
+class ThemeStore:
+    """Read-only, memory-mapped view of a store file."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._buf = memoryview(self._map)
+        magic, version, count, dict_offset, dict_len = FILE_HEADER.unpack_from(self._buf, 0)
+        if magic != MAGIC:
+            self.close()
+            raise StoreError(f"{self.path} is not a Prism theme store")
+        if version != VERSION:
+            self.close()
+            raise StoreError(f"{self.path} is store version {version}, expected {VERSION}")
+        dictionary = json.loads(bytes(self._buf[dict_offset:dict_offset + dict_len]))
+        self.keys: List[str] = dictionary["keys"]
+        self.key_ids = {key: i for i, key in enumerate(self.keys)}
+        self.scopes: List[str] = dictionary["scopes"]
+        self._scope_values = [json.loads(scope) for scope in self.scopes]
+        self.styles: List[str] = dictionary["styles"]
+        self.toc: Dict[str, Tuple[int, int]] = {slug: (off, length) for slug, off, length in dictionary["themes"]}
+        self._records: Dict[str, Record] = {}
+
+    def names(self) -> List[str]:
+        return list(self.toc)
+
+    def __len__(self):
+        return len(self.toc)
+
+    def __contains__(self, slug):
+        return slug in self.toc
+
+    def record(self, slug: str) -> Record:
+        record = self._records.get(slug)
+        if record is None:
+            if slug not in self.toc:
+                raise KeyError(slug)
+            record = self._records[slug] = Record(self._buf, self.toc[slug][0])
+        return record
+
+    def palette(self, slug: str) -> List[str]:
+        """The theme's distinct colours, in first-use order."""
+        return list(self.record(slug).palette)
+
+    def color(self, slug: str, key: str) -> Optional[str]:
+        """One workbench colour without decoding the rest of the theme."""
+        record = self.record(slug)
+        if record.flags & RAW_COLORS:
+            return record.extras["colors"].get(key)
+        ident = self.key_ids.get(key)
+        if ident is None or ident >= len(record.slots) or record.slots[ident] == NONE:
+            return None
+        return record.color(record.slots[ident])
+
+    def colors(self, slug: str) -> dict:
+        record = self.record(slug)
+        if record.flags & RAW_COLORS:
+            return record.extras["colors"]
+        palette, slots, keys = record.palette, record.slots, self.keys
+        if len(record.order):
+            return {keys[i]: palette[slots[i]] for i in record.order}
+        return {keys[i]: palette[p] for i, p in enumerate(slots) if p != NONE}
+
+    def token_colors(self, slug: str) -> list:
+        record = self.record(slug)
+        if record.flags & RAW_TOKENS:
+            return record.extras["tokenColors"]
+        raw = record.extras.get("tokens", {})
+        palette, tokens = record.palette, record.tokens.tolist()
+        rules = []
+        for i in range(0, len(tokens), 3):
+            scope, fg, style = tokens[i:i + 3]
+            if scope == NONE:
+                rules.append(raw[str(i // 3)])
+                continue
+            settings = {}
+            if fg != NONE:
+                settings["foreground"] = palette[fg]
+            if style != NONE:
+                settings["fontStyle"] = self.styles[style]
+            value = self._scope_values[scope]
+            rules.append({"scope": list(value) if isinstance(value, list) else value, "settings": settings})
+        return rules
+
+    def theme(self, slug: str) -> dict:
+        """The full VS Code theme, identical to the JSON it was packed from."""
+        record = self.record(slug)
+        extras = record.extras
+        values = extras.get("values", {})
+        theme = {}
+        for key in extras.get("top", THEME_ORDER):
+            if key == "colors":
+                theme[key] = self.colors(slug)
+            elif key == "tokenColors":
+                theme[key] = self.token_colors(slug)
+            else:
+                theme[key] = values[key]
+        return theme
+
+    def themes(self) -> Iterator[Tuple[str, dict]]:
+        for slug in self.toc:
+            yield slug, self.theme(slug)
+
+    def close(self):
+        self._records.clear()
+        if getattr(self, "_buf", None) is not None:
+            self._buf.release()
+            self._buf = None
+        if getattr(self, "_map", None) is not None:
+            try:
+                self._map.close()
+            except BufferError:
+                pass  # a Record view is still alive somewhere; the map closes with it
+            self._map = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def current_store(directory: Union[str, Path], store_path: Union[str, Path] = DEFAULT_STORE) -> Optional[ThemeStore]:
+    """The store at store_path if it holds exactly directory's *.json themes and is
+    newer than all of them, else None (missing, unreadable or stale)."""
+    store_path = Path(store_path)
+    try:
+        built = store_path.stat().st_mtime
+    except OSError:
+        return None
+    sources = sorted(Path(directory).glob("*.json"))
+    if any(p.stat().st_mtime >= built for p in sources):
+        return None
+    try:
+        store = ThemeStore(store_path)
+    except (OSError, ValueError):
+        return None
+    if sorted(store.names()) != [p.stem for p in sources]:
+        store.close()
+        return None
+    return store
+
+# ═══════════════════════════════════════════════════════════════════
+# CLI
+# ═══════════════════════════════════════════════════════════════════
+
+def load_json_dir(directory: Path) -> Dict[str, dict]:
+    return {p.stem: json.loads(p.read_text(encoding="utf-8")) for p in sorted(Path(directory).glob("*.json"))}
+
+def verify(store_path: Path, directory: Path) -> List[str]:
+    """Compare every theme in the store with its JSON source (values and key order)."""
+    problems = []
+    sources = load_json_dir(directory)
+    with ThemeStore(store_path) as store:
+        for slug in sorted(set(sources) - set(store.names())):
+            problems.append(f"{slug}: missing from the store")
+        for slug in store.names():
+            if slug not in sources:
+                problems.append(f"{slug}: not in {directory}")
+                continue
+            decoded = store.theme(slug)
+            if json.dumps(decoded) != json.dumps(sources[slug]):
+                problems.append(f"{slug}: decoded theme differs from the JSON")
+    return problems
+
+def bench(directory: Path, repeat: int = 5) -> None:
+    import tracemalloc
+
+    files = sorted(Path(directory).glob("*.json"))
+    json_bytes = sum(p.stat().st_size for p in files)
+    store_path = DEFAULT_STORE.with_name("bench.prismstore")
+    size = write_store(store_path, load_json_dir(directory))
+
+    def measure(fn):
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - start)
+        tracemalloc.start()
+        keep = fn()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        del keep
+        return best, peak
+
+    def open_store():
+        store = ThemeStore(store_path)
+        return store, [store.color(s, "editor.background") for s in store.names()]
+
+    def store_full():
+        with ThemeStore(store_path) as store:
+            return [t for _, t in store.themes()]
+
+    rows = [
+        ("json.load every file", measure(lambda: load_json_dir(directory))),
+        ("store: open + 1 key per theme", measure(open_store)),
+        ("store: decode every theme", measure(store_full)),
+    ]
+    print(f"{len(files)} themes: JSON {json_bytes:,} bytes, store {size:,} bytes ({size / json_bytes:.1%})")
+    for label, (seconds, peak) in rows:
+        print(f"  {label:<32} {seconds * 1000:8.2f} ms   peak {peak / 1024:8.1f} KiB")
+    store_path.unlink(missing_ok=True)
+
+def main():
+    parser = argparse.ArgumentParser(description="Palette-indexed compact store for VS Code theme JSON")
+    sub = parser.add_subparsers(dest="command", required=True)
+    pack = sub.add_parser("pack", help="Pack a directory of theme JSON")
+    pack.add_argument("directory", type=Path)
+    pack.add_argument("-o", "--output", type=Path, default=DEFAULT_STORE)
+    unpack = sub.add_parser("unpack", help="Write every theme back out as JSON")
+    unpack.add_argument("store", type=Path)
+    unpack.add_argument("-C", "--directory", type=Path, default=Path("."))
+    check = sub.add_parser("verify", help="Check a store decodes to its JSON sources exactly")
+    check.add_argument("store", type=Path)
+    check.add_argument("directory", type=Path)
+    info = sub.add_parser("info", help="Show store contents")
+    info.add_argument("store", type=Path)
+    timing = sub.add_parser("bench", help="Compare loading JSON with loading the store")
+    timing.add_argument("directory", type=Path)
+    args = parser.parse_args()
+
+    if args.command == "pack":
+        themes = load_json_dir(args.directory)
+        size = write_store(args.output, themes)
+        source = sum(p.stat().st_size for p in args.directory.glob("*.json"))
+        print(f"✓ {len(themes)} themes -> {args.output} ({size:,} bytes, {size / max(source, 1):.1%} of the JSON)")
+        return 0
+    if args.command == "unpack":
+        args.directory.mkdir(parents=True, exist_ok=True)
+        with ThemeStore(args.store) as store:
+            for slug, theme in store.themes():
+                (args.directory / f"{slug}.json").write_text(json.dumps(theme, indent=2), encoding="utf-8")
+            print(f"✓ {len(store)} themes -> {args.directory}")
+        return 0
+    if args.command == "verify":
+        problems = verify(args.store, args.directory)
+        for problem in problems:
+            print(f"  ✗ {problem}")
+        if not problems:
+            print(f"✓ {args.store} matches {args.directory}")
+        return 1 if problems else 0
+    if args.command == "info":
+        with ThemeStore(args.store) as store:
+            print(f"{len(store)} themes, {len(store.keys)} keys, {len(store.scopes)} scopes, {len(store.styles)} styles")
+            for slug in store.names():
+                print(f"  {slug:<28} {len(store.record(slug).rgba):3} colours  {store.toc[slug][1]:6} bytes")
+        return 0
+    bench(args.directory)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
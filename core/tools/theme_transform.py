@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+"""
+Prism Theme Transform - OKLCH operations applied to whole themes at once
+
+Derives variants from existing VS Code themes. Every hex color of every input
+theme (workbench colors and token foregrounds) is gathered into one array.
+The unique colors go through a chain of OKLCH transforms in a single NumPy
+pass, are gamut mapped (chroma reduction, not channel clipping) and written
+back, with any alpha suffix kept:
+
+    hue:DEG               rotate hue
+    chroma:FACTOR         scale chroma
+    lightness:LO:HI[:G]   remap lightness, L' = LO + (HI - LO) * L^G
+    invert                light <-> dark; keeps every WCAG contrast ratio
+
+invert maps relative luminance through Y' = 0.0525 / (Y + 0.05) - 0.05. This
+is an involution on [0, 1] under which (Y1 + 0.05) / (Y2 + 0.05) becomes its
+reciprocal, so every pair keeps its contrast ratio. Each color then gets the
+OKLCH lightness that reaches Y' at its own hue and chroma.
+
+Afterwards, the WCAG_PAIRS of every result are re-checked in one batched
+contrast call. On inversion, a pair its source passed that gamut mapping or
+8-bit rounding pushed just under its minimum has the foreground re-solved to
+the minimum plus CONTRAST_MARGIN, so inverting never adds a failure.
+
+Usage:
+    python theme_transform.py ../../vscode/themes -t invert                # build/variants/<slug>-light.json
+    python theme_transform.py ../../vscode/themes/acid_rain.json -t hue:40 -t chroma:0.8 --suffix cool
+    python theme_transform.py ../../vscode/themes -t lightness:0.05:0.97 --check
+"""
+
+import argparse
+import copy
+import json
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+from color_array import contrast_ratio, gamut_map, hex_to_srgb, oklch_to_srgb, relative_luminance, srgb_to_oklch
+
+SCRIPT_DIR = Path(__file__).parent
+PRISM_ROOT = SCRIPT_DIR.parent.parent
+DEFAULT_OUTPUT = PRISM_ROOT / "build" / "variants"
+
+HEX_RE = re.compile(r"#[0-9a-fA-F]{6}(?:[0-9a-fA-F]{2})?")
+
+# (foreground key, background key, minimum ratio); "token" is every tokenColors foreground
+WCAG_PAIRS = (
+    ("editor.foreground", "editor.background", 4.5),
+    ("foreground", "editor.background", 4.5),
+    ("textLink.foreground", "editor.background", 4.5),
+    ("editorLineNumber.foreground", "editor.background", 3.0),
+    ("sideBar.foreground", "sideBar.background", 4.5),
+    ("activityBar.foreground", "activityBar.background", 3.0),
+    ("activityBarBadge.foreground", "activityBarBadge.background", 4.5),
+    ("titleBar.activeForeground", "titleBar.activeBackground", 4.5),
+    ("statusBar.foreground", "statusBar.background", 4.5),
+    ("statusBar.debuggingForeground", "statusBar.debuggingBackground", 4.5),
+    ("tab.activeForeground", "tab.activeBackground", 4.5),
+    ("tab.inactiveForeground", "tab.inactiveBackground", 3.0),
+    ("panelTitle.activeForeground", "panel.background", 4.5),
+    ("terminal.foreground", "terminal.background", 4.5),
+    ("button.foreground", "button.background", 4.5),
+    ("input.foreground", "input.background", 4.5),
+    ("input.placeholderForeground", "input.background", 3.0),
+    *((f"terminal.ansi{bright}{hue}", "terminal.background", 3.0)
+      for bright in ("", "Bright") for hue in ("Red", "Green", "Yellow", "Blue", "Magenta", "Cyan")),
+)
+TOKEN_BG = "editor.background"
+TOKEN_MIN = 4.5
+COMMENT_MIN = 3.0  # comments are deliberately de-emphasized (large-text threshold)
+CONTRAST_MARGIN = 0.05  # headroom so 8-bit rounding cannot drop a repaired pair below the minimum
+REPAIR_ROUNDS = 4
+
+# ═══════════════════════════════════════════════════════════════════
+# Transforms (pointwise on (..., 3) OKLCH arrays)
+# ═══════════════════════════════════════════════════════════════════
+
+class Transform:
+    inverts = False  # flips the theme between light and dark
+
+    def __call__(self, lch: np.ndarray) -> np.ndarray:
+        raise NotImplementedError
+
+    def __rshift__(self, other: "Transform") -> "Chain":
+        return Chain(self.steps() + other.steps())
+
+    def steps(self) -> Tuple["Transform", ...]:
+        return (self,)
+
+@dataclass(frozen=True)
+class HueRotate(Transform):
+    degrees: float
+
+    def __call__(self, lch):
+        out = lch.copy()
+        out[..., 2] = (out[..., 2] + self.degrees) % 360.0
+        return out
+
+@dataclass(frozen=True)
+class ChromaScale(Transform):
+    factor: float
+
+    def __call__(self, lch):
+        out = lch.copy()
+        out[..., 1] *= self.factor
+        return out
+
+@dataclass(frozen=True)
+class LightnessRemap(Transform):
+    lo: float = 0.0
+    hi: float = 1.0
+    gamma: float = 1.0
+
+    def __call__(self, lch):
+        out = lch.copy()
+        out[..., 0] = self.lo + (self.hi - self.lo) * np.clip(lch[..., 0], 0.0, 1.0) ** self.gamma
+        return out
+
+@dataclass(frozen=True)
+class Invert(Transform):
+    """Contrast-preserving light <-> dark inversion at constant hue and chroma."""
+    steps_l: int = 30
+    inverts = True
+
+    def __call__(self, lch):
+        target = invert_luminance(relative_luminance(oklch_to_srgb(gamut_map(lch))))
+        return solve_lightness(lch, target, self.steps_l)
+
+@dataclass(frozen=True)
+class Chain(Transform):
+    transforms: Tuple[Transform, ...]
+
+    def __call__(self, lch):
+        for transform in self.transforms:
+            lch = transform(lch)
+        return lch
+
+    def steps(self):
+        return self.transforms
+
+    @property
+    def inverts(self) -> bool:
+        return sum(t.inverts for t in self.transforms) % 2 == 1
+
+def solve_lightness(lch: np.ndarray, target: np.ndarray, steps: int = 30) -> np.ndarray:
+    """OKLCH colors moved to the lightness whose gamut-mapped color has luminance target.
+
+    Hue is kept; chroma is kept unless the new lightness cannot hold it in sRGB.
+    """
+    lo, hi = np.zeros(lch.shape[:-1]), np.ones(lch.shape[:-1])
+    probe = np.array(lch, dtype=np.float64)
+    for _ in range(steps):
+        probe[..., 0] = (lo + hi) / 2
+        too_dark = relative_luminance(oklch_to_srgb(gamut_map(probe, steps=16))) < target
+        lo = np.where(too_dark, probe[..., 0], lo)
+        hi = np.where(too_dark, hi, probe[..., 0])
+    probe[..., 0] = (lo + hi) / 2
+    return gamut_map(probe)
+
+def invert_luminance(Y: np.ndarray) -> np.ndarray:
+    """The contrast-preserving involution 0 <-> 1 on WCAG relative luminance."""
+    return 0.0525 / (Y + 0.05) - 0.05
+
+def parse_transform(spec: str) -> Transform:
+    """'hue:30', 'chroma:0.8', 'lightness:0.05:0.95[:gamma]' or 'invert'."""
+    name, *params = spec.split(":")
+    try:
+        values = [float(p) for p in params]
+    except ValueError:
+        raise ValueError(f"bad number in transform {spec!r}")
+    if name == "hue" and len(values) == 1:
+        return HueRotate(values[0])
+    if name == "chroma" and len(values) == 1:
+        return ChromaScale(values[0])
+    if name == "lightness" and len(values) in (2, 3):
+        return LightnessRemap(*values)
+    if name == "invert" and not values:
+        return Invert()
+    raise ValueError(f"unknown transform {spec!r} (hue:DEG, chroma:F, lightness:LO:HI[:G], invert)")
+
+def parse_chain(specs: Sequence[str]) -> Chain:
+    return Chain(tuple(step for spec in specs for step in parse_transform(spec).steps()))
+
+# ═══════════════════════════════════════════════════════════════════
+# Themes as color arrays
+# ═══════════════════════════════════════════════════════════════════
+
+class ColorTable:
+    """Every hex color of a list of themes, flattened into one (N, 3) sRGB array."""
+
+    def __init__(self, themes: List[dict]):
+        self.themes = themes
+        self.refs = []       # (theme index, "colors" | "tokenColors", key or rule index)
+        self.suffixes = []   # alpha suffix ("" or "aa"), preserved on write
+        hexes = []
+        for t, theme in enumerate(themes):
+            for key, value in theme.get("colors", {}).items():
+                if isinstance(value, str) and HEX_RE.fullmatch(value):
+                    self.refs.append((t, "colors", key))
+                    hexes.append(value)
+            for i, rule in enumerate(theme.get("tokenColors", [])):
+                value = rule.get("settings", {}).get("foreground")
+                if isinstance(value, str) and HEX_RE.fullmatch(value):
+                    self.refs.append((t, "tokenColors", i))
+                    hexes.append(value)
+        self.suffixes = [h[7:] for h in hexes]
+        self.srgb = hex_to_srgb(hexes) if hexes else np.zeros((0, 3))
+        self.index = {ref: i for i, ref in enumerate(self.refs)}
+
+    def transform(self, transform: Transform) -> np.ndarray:
+        """Apply transform to every color (each distinct 8-bit color computed once)."""
+        if not len(self.srgb):
+            return self.srgb
+        codes = np.rint(self.srgb * 255).astype(np.int64)
+        packed = (codes[:, 0] << 16) | (codes[:, 1] << 8) | codes[:, 2]
+        unique, first, inverse = np.unique(packed, return_index=True, return_inverse=True)
+        lch = transform(srgb_to_oklch(self.srgb[first]))
+        return oklch_to_srgb(gamut_map(lch))[inverse]
+
+    def with_srgb(self, srgb: np.ndarray) -> List[dict]:
+        """Copies of the themes with every collected color replaced by srgb (8-bit rounded)."""
+        themes = [copy.deepcopy(theme) for theme in self.themes]
+        codes = np.rint(np.clip(srgb, 0.0, 1.0) * 255).astype(np.int64)
+        for (t, section, key), (r, g, b), suffix in zip(self.refs, codes.tolist(), self.suffixes):
+            value = f"#{r:02x}{g:02x}{b:02x}{suffix}"
+            if section == "colors":
+                themes[t]["colors"][key] = value
+            else:
+                themes[t]["tokenColors"][key]["settings"]["foreground"] = value
+        return themes
+
+    def pairs(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, list]:
+        """fg index, bg index, minimum ratio and label of every WCAG pair present."""
+        fg, bg, minimum, labels = [], [], [], []
+        for t, theme in enumerate(self.themes):
+            for fg_key, bg_key, ratio in WCAG_PAIRS:
+                f, b = self.index.get((t, "colors", fg_key)), self.index.get((t, "colors", bg_key))
+                if f is not None and b is not None:
+                    fg.append(f), bg.append(b), minimum.append(ratio), labels.append((t, fg_key, bg_key))
+            b = self.index.get((t, "colors", TOKEN_BG))
+            if b is None:
+                continue
+            for i, rule in enumerate(theme.get("tokenColors", [])):
+                f = self.index.get((t, "tokenColors", i))
+                if f is None:
+                    continue
+                scope = rule.get("scope", "")
+                scope = ", ".join(scope) if isinstance(scope, list) else scope
+                fg.append(f), bg.append(b), labels.append((t, f"token:{scope}", TOKEN_BG))
+                minimum.append(COMMENT_MIN if "comment" in scope else TOKEN_MIN)
+        return np.array(fg, dtype=np.int64), np.array(bg, dtype=np.int64), np.array(minimum), labels
+
+    def alpha(self) -> np.ndarray:
+        return np.array([int(s, 16) / 255 if s else 1.0 for s in self.suffixes])
+
+def pair_contrast(srgb: np.ndarray, alpha: np.ndarray, fg: np.ndarray, bg: np.ndarray) -> np.ndarray:
+    """Batched contrast of every pair; translucent foregrounds are composited over their background."""
+    a = alpha[fg][:, None]
+    return contrast_ratio(a * srgb[fg] + (1 - a) * srgb[bg], srgb[bg])
+
+def audit(table: ColorTable, srgb: np.ndarray = None) -> List[Tuple[int, str, str, float, float]]:
+    """(theme index, fg, bg, ratio, minimum) for every failing pair, colors rounded to 8 bits first."""
+    srgb = table.srgb if srgb is None else np.rint(np.clip(srgb, 0.0, 1.0) * 255) / 255
+    fg, bg, minimum, labels = table.pairs()
+    if not len(fg):
+        return []
+    ratios = pair_contrast(srgb, table.alpha(), fg, bg)
+    return [(t, f, b, float(ratios[i]), float(minimum[i]))
+            for i, (t, f, b) in enumerate(labels) if ratios[i] < minimum[i]]
+
+def repair_contrast(table: ColorTable, srgb: np.ndarray) -> np.ndarray:
+    """srgb with the foreground of every pair that passed before but fails now re-solved.
+
+    The foreground keeps its side of the background (lighter or darker) and
+    moves to the luminance giving minimum + CONTRAST_MARGIN; the margin
+    doubles each round for the few (translucent) colors still short after 8-bit
+    rounding.
+    """
+    fg, bg, minimum, _ = table.pairs()
+    if not len(fg):
+        return srgb
+    alpha = table.alpha()
+    passed = pair_contrast(table.srgb, alpha, fg, bg) >= minimum
+    srgb = np.array(srgb)
+    margin = CONTRAST_MARGIN
+    for _ in range(REPAIR_ROUNDS):
+        ratios = pair_contrast(np.rint(np.clip(srgb, 0.0, 1.0) * 255) / 255, alpha, fg, bg)
+        short = passed & (ratios < minimum)
+        if not short.any():
+            break
+        f, b, need = fg[short], bg[short], minimum[short] + margin
+        y_fg, y_bg = relative_luminance(srgb[f]), relative_luminance(srgb[b])
+        target = np.where(y_fg >= y_bg, need * (y_bg + 0.05) - 0.05, (y_bg + 0.05) / need - 0.05)
+        srgb[f] = oklch_to_srgb(solve_lightness(srgb_to_oklch(srgb[f]), np.clip(target, 0.0, 1.0)))
+        margin *= 2
+    return srgb
+
+def transform_themes(themes: List[dict], transform: Transform, suffix: str = "") -> Tuple[List[dict], ColorTable, np.ndarray]:
+    """Transformed copies of themes (renamed, type flipped on inversion), the table and new colors."""
+    table = ColorTable(themes)
+    srgb = table.transform(transform)
+    if transform.inverts:
+        srgb = repair_contrast(table, srgb)
+    variants = table.with_srgb(srgb)
+    for variant in variants:
+        if transform.inverts:
+            variant["type"] = "light" if variant.get("type", "dark") == "dark" else "dark"
+        label = suffix or (variant.get("type", "dark") if transform.inverts else "variant")
+        variant["name"] = f"{variant.get('name', 'Prism')} ({label})"
+    return variants, table, srgb
+
+# ═══════════════════════════════════════════════════════════════════
+# CLI
+# ═══════════════════════════════════════════════════════════════════
+
+def theme_files(paths: Sequence[Path]) -> List[Path]:
+    files = []
+    for path in paths:
+        files += sorted(path.glob("*.json")) if path.is_dir() else [path]
+    return files
+
+def main():
+    parser = argparse.ArgumentParser(description="Derive theme variants with batched OKLCH transforms")
+    parser.add_argument("paths", type=Path, nargs="+", help="Theme .json files or directories of them")
+    parser.add_argument("-t", "--transform", action="append", required=True, metavar="SPEC",
+                        help="hue:DEG, chroma:F, lightness:LO:HI[:G] or invert; repeat to chain (applied in order)")
+    parser.add_argument("--suffix", help="Variant name/file suffix (default: light/dark for invert, else 'variant')")
+    parser.add_argument("--output", "-o", type=Path, default=DEFAULT_OUTPUT, help=f"Output directory (default: {DEFAULT_OUTPUT})")
+    parser.add_argument("--check", action="store_true", help="Report only, write nothing")
+    parser.add_argument("--strict", action="store_true", help="Exit 1 if a variant fails a WCAG pair its source passed")
+    args = parser.parse_args()
+
+    try:
+        transform = parse_chain(args.transform)
+    except ValueError as e:
+        parser.error(str(e))
+    files = theme_files(args.paths)
+    themes = [json.loads(f.read_text(encoding="utf-8")) for f in files]
+    variants, table, srgb = transform_themes(themes, transform, args.suffix)
+
+    before = {(t, f, b) for t, f, b, _, _ in audit(table)}
+    after = audit(table, srgb)
+    regressions = [fail for fail in after if fail[:3] not in before]
+    fg, bg, _, _ = table.pairs()
+    if transform.inverts and len(fg):
+        drift = np.abs(pair_contrast(np.rint(np.clip(srgb, 0, 1) * 255) / 255, table.alpha(), fg, bg)
+                       - pair_contrast(table.srgb, table.alpha(), fg, bg))
+        print(f"Contrast drift under inversion: median {np.median(drift):.3f}, max {drift.max():.3f}")
+
+    if not args.check:
+        args.output.mkdir(parents=True, exist_ok=True)
+    for path, variant in zip(files, variants):
+        label = args.suffix or (variant["type"] if transform.inverts else "variant")
+        out = args.output / f"{path.stem}-{label}.json"
+        if not args.check:
+            out.write_text(json.dumps(variant, indent=2) + "\n", encoding="utf-8")
+    for t, f, b, ratio, minimum in regressions:
+        print(f"  ✗ {files[t].stem}: {f} on {b} {ratio:.2f}:1 < {minimum}:1")
+    print(f"{len(variants)} variants ({' >> '.join(args.transform)}), {len(table.refs)} colors; "
+          f"WCAG failures {len(before)} -> {len(after)} ({len(regressions)} new)"
+          + ("" if args.check else f" -> {args.output}"))
+    return 1 if args.strict and regressions else 0
+
+if __name__ == "__main__":
+    exit(main())
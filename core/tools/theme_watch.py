@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Prism Theme Watcher
+
+Directory watching for the generators' --watch modes. On Linux it uses
+inotify through ctypes (no extra dependency); elsewhere, or when inotify is
+unavailable, it falls back to polling mtimes. Bursts of events (editors that
+write a temp file and rename it, "save all") are coalesced by debounce().
+
+Usage:
+    from theme_watch import open_watcher, debounce
+    with open_watcher(Path("vscode/themes"), "*.json") as watcher:
+        while True:
+            changed = debounce(watcher, quiet=0.05)   # {"arctic.json", ...}
+
+    python theme_watch.py vscode/themes --poll
+"""
+
+import ctypes
+import ctypes.util
+import fnmatch
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Optional, Set, Tuple
+
+# inotify(7) event bits
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = os.O_CLOEXEC
+
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_MOVED_FROM | IN_CREATE | IN_DELETE
+EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+POLL_INTERVAL = 0.25
+
+# ═══════════════════════════════════════════════════════════════════
+# Watchers
+# ═══════════════════════════════════════════════════════════════════
+
+class PollingWatcher:
+    """Portable fallback: rescans the directory and compares (mtime, size)."""
+
+    kind = "polling"
+
+    def __init__(self, directory: Path, pattern: str = "*", interval: float = POLL_INTERVAL):
+        self.directory = Path(directory)
+        self.pattern = pattern
+        self.interval = interval
+        self._state = self._scan()
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        state = {}
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if fnmatch.fnmatch(entry.name, self.pattern) and entry.is_file():
+                    st = entry.stat()
+                    state[entry.name] = (st.st_mtime_ns, st.st_size)
+        return state
+
+    def wait(self, timeout: Optional[float] = None) -> Set[str]:
+        """Block up to timeout seconds (None = until something changes); return changed names."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            current = self._scan()
+            changed = {name for name in current.keys() | self._state.keys()
+                       if current.get(name) != self._state.get(name)}
+            self._state = current
+            if changed:
+                return changed
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return set()
+                time.sleep(min(self.interval, remaining))
+            else:
+                time.sleep(self.interval)
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class InotifyWatcher:
+    """Linux inotify watch on one directory, read through ctypes."""
+
+    kind = "inotify"
+
+    def __init__(self, directory: Path, pattern: str = "*"):
+        self.directory = Path(directory)
+        self.pattern = pattern
+        libc_name = ctypes.util.find_library("c")
+        if not sys.platform.startswith("linux") or not libc_name:
+            raise OSError("inotify is only available on Linux")
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        wd = libc.inotify_add_watch(self.fd, os.fsencode(str(self.directory)), WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(err, f"inotify_add_watch failed for {self.directory}")
+
+    def _read(self) -> Set[str]:
+        changed = set()
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return changed
+            offset = 0
+            while offset < len(data):
+                _, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+                offset += EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b"\0").decode("utf-8", "replace")
+                offset += length
+                if mask & IN_Q_OVERFLOW:
+                    # Kernel dropped events: report every matching file
+                    changed.update(p.name for p in self.directory.glob(self.pattern))
+                elif name and fnmatch.fnmatch(name, self.pattern):
+                    changed.add(name)
+
+    def wait(self, timeout: Optional[float] = None) -> Set[str]:
+        """Block up to timeout seconds (None = until something changes); return changed names."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            ready, _, _ = select.select([self.fd], [], [], remaining)
+            if not ready:
+                return set()
+            changed = self._read()
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def open_watcher(directory: Path, pattern: str = "*", poll: bool = False):
+    """InotifyWatcher where supported, otherwise (or with poll=True) PollingWatcher."""
+    if not poll:
+        try:
+            return InotifyWatcher(directory, pattern)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(directory, pattern)
+
+def debounce(watcher, quiet: float = 0.05, timeout: Optional[float] = None) -> Set[str]:
+    """Wait for a change, then keep collecting until quiet seconds pass with no events."""
+    changed = watcher.wait(timeout)
+    while changed:
+        more = watcher.wait(quiet)
+        if not more:
+            break
+        changed |= more
+    return changed
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Print debounced change batches for a directory")
+    parser.add_argument("directory")
+    parser.add_argument("--pattern", default="*.json")
+    parser.add_argument("--poll", action="store_true", help="Force the polling watcher")
+    args = parser.parse_args()
+
+    with open_watcher(Path(args.directory), args.pattern, poll=args.poll) as watcher:
+        print(f"Watching {args.directory} ({watcher.kind}); Ctrl+C to stop")
+        try:
+            while True:
+                print(" ".join(sorted(debounce(watcher))))
+        except KeyboardInterrupt:
+            pass
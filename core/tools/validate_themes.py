@@ -8,18 +8,24 @@ Used for CI/CD and quality assurance.
 Usage:
     python validate_themes.py themes/
     python validate_themes.py fleek.json
+    python validate_themes.py themes/ --profile build/validate.prof
 """
 
+import argparse
 import json
 import sys
 import os
 from pathlib import Path
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any
 
 # Import from contrast_checker
 from contrast_checker import (
-    hex_to_rgb, relative_luminance, contrast_ratio, wcag_rating
+    hex_to_rgb, relative_luminance, wcag_rating
 )
+from contrast_cache import CACHE, contrast
+import prism_metrics
+import prism_trace
+from prism_trace import span
 
 class ValidationError:
     def __init__(self, theme: str, check: str, message: str, severity: str = "error"):
@@ -44,11 +50,7 @@ def validate_hex_color(color: str) -> bool:
 
 def validate_contrast(fg: str, bg: str, min_ratio: float, label: str) -> Tuple[float, bool]:
     """Check contrast ratio between two colors"""
-    fg_rgb = hex_to_rgb(fg)
-    bg_rgb = hex_to_rgb(bg)
-    fg_lum = relative_luminance(*fg_rgb)
-    bg_lum = relative_luminance(*bg_rgb)
-    ratio = contrast_ratio(fg_lum, bg_lum)
+    ratio = contrast(fg, bg)
     return ratio, ratio >= min_ratio
 
 def validate_lightness(color: str, min_l: float, max_l: float) -> Tuple[float, bool]:
@@ -63,7 +65,7 @@ def validate_theme(theme_path: Path) -> List[ValidationError]:
     theme_name = theme_path.stem
     
     try:
-        with open(theme_path) as f:
+        with span("load"), open(theme_path) as f:
             theme = json.load(f)
     except json.JSONDecodeError as e:
         errors.append(ValidationError(theme_name, "parse", f"Invalid JSON: {e}", "error"))
@@ -92,6 +94,15 @@ def validate_theme(theme_path: Path) -> List[ValidationError]:
     if not bg or not fg:
         return errors
     
+    with span("color"):
+        errors += _validate_colors(theme_name, theme, colors, bg, fg, muted, accent)
+    return errors
+
+def _validate_colors(theme_name: str, theme: dict, colors: dict, bg: str, fg: str,
+                     muted: Optional[str], accent: Optional[str]) -> List[ValidationError]:
+    """Hex format, WCAG contrast and OLED checks for a theme with bg and fg"""
+    errors = []
+    
     # Validate hex format
     for key, value in colors.items():
         if isinstance(value, str) and value.startswith('#'):
@@ -165,13 +176,16 @@ def validate_directory(dir_path: Path) -> Dict[str, List[ValidationError]]:
     
     return results
 
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: python validate_themes.py <path>")
-        print("       path can be a .json file or directory")
-        sys.exit(1)
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validate Prism themes for WCAG compliance and color science")
+    parser.add_argument("path", type=Path, help="A .json theme file or a directory of them")
+    prism_trace.add_arguments(parser)
+    prism_metrics.add_arguments(parser)
+    args = parser.parse_args(argv)
+    prism_trace.start(args, "validate_themes")
+    prism_metrics.start(args, "validate_themes")
     
-    path = Path(sys.argv[1])
+    path = args.path
     
     print("""
 ╔══════════════════════════════════════════════════════════════╗
@@ -212,6 +226,12 @@ def main():
     print(f"Issues:    {len(results)} themes with issues")
     print(f"  Errors:   {error_count}")
     print(f"  Warnings: {warning_count}")
+    stats = CACHE.stats()
+    for name, value in (("themes", total_themes), ("themes_with_issues", len(results)), ("errors", error_count),
+                        ("warnings", warning_count), ("contrast_cache_hits", stats["hits"]),
+                        ("contrast_cache_misses", stats["misses"])):
+        prism_metrics.count(name, value)
+    print(f"Contrast cache: {stats['hits']} hits / {stats['misses']} misses")
     print(f"{'═' * 60}\n")
     
     # Exit code
@@ -111,6 +111,40 @@ def srgb_to_oklch(rgb: SRGB) -> OKLCH:
     H = math.degrees(math.atan2(b, a)) % 360
     return OKLCH(L, C, H)
 
+def oklch_in_gamut(oklch: OKLCH, eps: float = 1e-6) -> bool:
+    """True if OKLCH maps into sRGB without clamping any channel"""
+    h_rad = math.radians(oklch.H)
+    a = oklch.C * math.cos(h_rad)
+    b = oklch.C * math.sin(h_rad)
+    l_ = oklch.L + 0.3963377774 * a + 0.2158037573 * b
+    m_ = oklch.L - 0.1055613458 * a - 0.0638541728 * b
+    s_ = oklch.L - 0.0894841775 * a - 1.2914855480 * b
+    l, m, s = l_ ** 3, m_ ** 3, s_ ** 3
+    rgb = (
+        +4.0767416621 * l - 3.3077115913 * m + 0.2309699292 * s,
+        -1.2684380046 * l + 2.6097574011 * m - 0.3413193965 * s,
+        -0.0041960863 * l - 0.7034186147 * m + 1.7076147010 * s,
+    )
+    return all(-eps <= c <= 1 + eps for c in rgb)
+
+def gamut_map(oklch: OKLCH) -> OKLCH:
+    """
+    Bring an out-of-gamut color into sRGB by reducing chroma at constant
+    lightness and hue (binary search), instead of clamping each channel,
+    which shifts hue.
+    """
+    L = max(0.0, min(1.0, oklch.L))
+    if oklch_in_gamut(OKLCH(L, oklch.C, oklch.H)):
+        return OKLCH(L, oklch.C, oklch.H)
+    lo, hi = 0.0, oklch.C
+    for _ in range(24):
+        mid = (lo + hi) / 2
+        if oklch_in_gamut(OKLCH(L, mid, oklch.H)):
+            lo = mid
+        else:
+            hi = mid
+    return OKLCH(L, lo, oklch.H)
+
 def srgb_to_hex(rgb: SRGB) -> str:
     """Convert sRGB to hex string"""
     r = int(round(rgb.r * 255))
@@ -221,6 +255,18 @@ class ThemeConfig:
     mode: str              # "dark" or "light"
     monitor: str           # "oled" or "lcd"
     name: str
+    accents: str = "harmony"  # "harmony" (fixed offsets), "golden" or "optimized" (palette_optimizer)
+    gamut_map: bool = False   # reduce chroma for out-of-gamut colors instead of clamping channels
+
+# Dark-mode base00 lightness per monitor type (OKLCH L) for generated themes
+BLACK_BALANCE = {
+    "oled": 0.0,   # True black for OLED
+    "lcd": 0.08,   # Lifted black for LCD
+}
+
+def resolve_srgb(config: ThemeConfig, oklch: OKLCH) -> SRGB:
+    """OKLCH -> sRGB for a palette slot, gamut-mapped when the config asks for it"""
+    return oklch_to_srgb(gamut_map(oklch) if config.gamut_map else oklch)
 
 def generate_background_ramp(config: ThemeConfig) -> Tuple[SRGB, SRGB, SRGB, SRGB]:
     """
@@ -229,10 +275,7 @@ def generate_background_ramp(config: ThemeConfig) -> Tuple[SRGB, SRGB, SRGB, SRG
     """
     # Black balance based on monitor type
     if config.mode == "dark":
-        if config.monitor == "oled":
-            start_L = 0.0  # True black for OLED
-        else:
-            start_L = 0.08  # Lifted black for LCD
+        start_L = BLACK_BALANCE["oled" if config.monitor == "oled" else "lcd"]
         steps = [0.0, 0.03, 0.06, 0.12]
     else:
         start_L = 0.97
@@ -247,7 +290,7 @@ def generate_background_ramp(config: ThemeConfig) -> Tuple[SRGB, SRGB, SRGB, SRG
             C=bg_chroma,
             H=config.base_hue
         )
-        colors.append(oklch_to_srgb(oklch))
+        colors.append(resolve_srgb(config, oklch))
     
     return tuple(colors)
 
@@ -266,7 +309,7 @@ def generate_foreground_ramp(config: ThemeConfig, bg: SRGB) -> Tuple[SRGB, SRGB,
     colors = []
     for target_L in target_Ls:
         oklch = OKLCH(L=target_L, C=fg_chroma, H=config.base_hue)
-        rgb = oklch_to_srgb(oklch)
+        rgb = resolve_srgb(config, oklch)
         
         # Verify contrast, adjust if needed
         cr = contrast_ratio(rgb, bg)
@@ -275,18 +318,44 @@ def generate_foreground_ramp(config: ThemeConfig, bg: SRGB) -> Tuple[SRGB, SRGB,
                 oklch, bg, 4.5, make_lighter=(config.mode == "dark")
             )
             if adjusted:
-                rgb = oklch_to_srgb(adjusted)
+                rgb = resolve_srgb(config, adjusted)
         
         colors.append(rgb)
     
     return tuple(colors)
 
-def generate_accent_colors(config: ThemeConfig, bg: SRGB) -> Tuple[SRGB, ...]:
+# Hue offsets for color harmony (hue offset, saturation multiplier)
+HARMONY = [
+    (30, 1.0),    # base08 - Error (warm)
+    (15, 0.95),   # base09 - Warning
+    (0, 1.0),     # base0A - Hero
+    (-60, 0.9),   # base0B - Success (cool/green)
+    (-90, 0.85),  # base0C - Info (cyan)
+    (120, 0.9),   # base0D - Link (triadic)
+    (45, 0.95),   # base0E - Special
+    (0, 0.5),     # base0F - Deprecated (desaturated)
+]
+
+def generate_accent_colors(config: ThemeConfig, bg: SRGB,
+                           ramp: Optional[Tuple[SRGB, ...]] = None) -> Tuple[SRGB, ...]:
     """
     Generate base08-base0F (accent colors).
     Distributed using color harmony rules around hero hue.
+    With config.accents == "golden" the hues follow the golden-angle sequence
+    from the hero hue instead (GoldenAngle.lean / colors.lua nth_golden_hue).
+    With config.accents == "optimized" the hues, lightness and chroma are
+    searched jointly by palette_optimizer against every background in ramp.
     """
-    h = config.hero_hue
+    if config.accents == "optimized":
+        from palette_optimizer import optimize_accents  # needs NumPy
+        return optimize_accents(config, ramp or (bg,)).accents
+    
+    if config.accents == "golden":
+        from golden_angle import generate_golden_hues  # needs NumPy
+        hues = generate_golden_hues(config.hero_hue, len(HARMONY))
+    else:
+        hues = [(config.hero_hue + offset) % 360 for offset, _ in HARMONY]
+    
     s = config.hero_saturation
     
     # Accent lightness (must contrast with background)
@@ -295,26 +364,14 @@ def generate_accent_colors(config: ThemeConfig, bg: SRGB) -> Tuple[SRGB, ...]:
     else:
         accent_L = 0.45
     
-    # Hue offsets for color harmony
-    harmony = [
-        (30, 1.0),    # base08 - Error (warm)
-        (15, 0.95),   # base09 - Warning
-        (0, 1.0),     # base0A - Hero
-        (-60, 0.9),   # base0B - Success (cool/green)
-        (-90, 0.85),  # base0C - Info (cyan)
-        (120, 0.9),   # base0D - Link (triadic)
-        (45, 0.95),   # base0E - Special
-        (0, 0.5),     # base0F - Deprecated (desaturated)
-    ]
-    
     colors = []
-    for hue_offset, sat_mult in harmony:
+    for hue, (_, sat_mult) in zip(hues, HARMONY):
         oklch = OKLCH(
             L=accent_L,
             C=s * sat_mult * 0.15,  # Scale to OKLCH chroma range
-            H=(h + hue_offset) % 360
+            H=hue
         )
-        rgb = oklch_to_srgb(oklch)
+        rgb = resolve_srgb(config, oklch)
         
         # Verify contrast with background
         cr = contrast_ratio(rgb, bg)
@@ -323,7 +380,7 @@ def generate_accent_colors(config: ThemeConfig, bg: SRGB) -> Tuple[SRGB, ...]:
                 oklch, bg, 3.0, make_lighter=(config.mode == "dark")
             )
             if adjusted:
-                rgb = oklch_to_srgb(adjusted)
+                rgb = resolve_srgb(config, adjusted)
         
         colors.append(rgb)
     
@@ -333,19 +390,27 @@ def generate_accent_colors(config: ThemeConfig, bg: SRGB) -> Tuple[SRGB, ...]:
 # VSCODE THEME GENERATION
 # ============================================================================
 
-def generate_vscode_theme(config: ThemeConfig) -> dict:
+def generate_palette(config: ThemeConfig) -> Tuple[SRGB, ...]:
     """
-    Generate a complete VSCode theme with WCAG-verified colors.
+    Generate the full Base16 palette, base00-base0F.
     """
-    # Generate palette
     bg_ramp = generate_background_ramp(config)
     base00, base01, base02, base03 = bg_ramp
-    
     fg_ramp = generate_foreground_ramp(config, base00)
-    base04, base05, base06, base07 = fg_ramp
-    
-    accents = generate_accent_colors(config, base00)
-    base08, base09, base0A, base0B, base0C, base0D, base0E, base0F = accents
+    accents = generate_accent_colors(config, base00, ramp=(base00, base01, base02))
+    return (*bg_ramp, *fg_ramp, *accents)
+
+def generate_vscode_theme(config: ThemeConfig, verbose: bool = True,
+                          palette: Optional[Tuple[SRGB, ...]] = None) -> dict:
+    """
+    Generate a complete VSCode theme with WCAG-verified colors.
+    verbose=False skips the contrast report (used by theme_service).
+    palette overrides the generated Base16 palette (used by preset_compiler).
+    """
+    if palette is None:
+        palette = generate_palette(config)
+    (base00, base01, base02, base03, base04, base05, base06, base07,
+     base08, base09, base0A, base0B, base0C, base0D, base0E, base0F) = palette
     
     # Convert to hex
     bg = srgb_to_hex(base00)
@@ -371,9 +436,10 @@ def generate_vscode_theme(config: ThemeConfig) -> dict:
     cr_comment = contrast_ratio(base03, base00)
     cr_accent = contrast_ratio(base0A, base00)
     
-    print(f"  Text contrast (base05/base00):    {cr_text:.2f}:1 {'✓ AA' if wcag_aa(cr_text) else '✗'}")
-    print(f"  Comment contrast (base03/base00): {cr_comment:.2f}:1 {'✓ AA-large' if wcag_aa_large(cr_comment) else '✗'}")
-    print(f"  Accent contrast (base0A/base00):  {cr_accent:.2f}:1 {'✓ AA-large' if wcag_aa_large(cr_accent) else '✗'}")
+    if verbose:
+        print(f"  Text contrast (base05/base00):    {cr_text:.2f}:1 {'✓ AA' if wcag_aa(cr_text) else '✗'}")
+        print(f"  Comment contrast (base03/base00): {cr_comment:.2f}:1 {'✓ AA-large' if wcag_aa_large(cr_comment) else '✗'}")
+        print(f"  Accent contrast (base0A/base00):  {cr_accent:.2f}:1 {'✓ AA-large' if wcag_aa_large(cr_accent) else '✗'}")
     
     return {
         "name": f"Prism {config.name}",
@@ -453,6 +519,7 @@ def generate_vscode_theme(config: ThemeConfig) -> dict:
             "generator": "prism-verified-generator",
             "oklch_hero_hue": config.hero_hue,
             "oklch_hero_saturation": config.hero_saturation,
+            **({"accent_strategy": config.accents} if config.accents != "harmony" else {}),  # default output unchanged
             "contrast_text": round(cr_text, 2),
             "contrast_comment": round(cr_comment, 2),
             "contrast_accent": round(cr_accent, 2),
@@ -486,6 +553,8 @@ Examples:
     parser.add_argument("--monitor", choices=["oled", "lcd"], default="oled")
     parser.add_argument("--name", required=True, help="Theme name")
     parser.add_argument("--output", "-o", default=".", help="Output directory")
+    parser.add_argument("--accents", choices=["harmony", "golden", "optimized"], default="harmony",
+                        help="Accent placement: fixed harmony offsets, golden-angle hues or the constrained optimizer")
     
     args = parser.parse_args()
     
@@ -496,7 +565,8 @@ Examples:
         base_saturation=0.1,  # Low saturation for backgrounds
         mode=args.mode,
         monitor=args.monitor,
-        name=args.name
+        name=args.name,
+        accents=args.accents,
     )
     
     print(f"\nGenerating: Prism {config.name}")
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Prism xterm Quantizer - 256-color and 16-color fallbacks for truecolor themes
+
+Every terminal output assumes 24-bit color. tmux over SSH, the Linux console
+and older terminals only have the xterm-256 or 16-color palettes. This module
+maps each color to its perceptually nearest palette entry (Euclidean distance
+in OKLAB):
+
+    256   indices 16-255: the 6x6x6 cube and the 24-step gray ramp. 0-15 are
+          skipped because every terminal (and most user configs) redefine them.
+    16    the ANSI colors 0-15, matched against the xterm defaults and written
+          as names, so the user's terminal palette decides the final shade.
+          The defaults are far more saturated than theme colors, so at this
+          depth extra chroma in the palette entry counts for only
+          CHROMA_WEIGHT of its distance (missing chroma counts in full, so a
+          pastel does not fall to a gray), and hue and lightness pick the entry.
+
+The palette is converted to OKLAB once at import. Lookups are memoized by
+24-bit value per depth, and each call resolves all of its unseen colors with
+one vectorized argmin. A theme has ~30 distinct colors and the corpus shares
+most of them, so a full sync pays a few numpy calls in total. That is cheaper
+than building a 16 MB 24-bit table or a k-d tree over 256 points.
+
+palette_indices() can keep pairs apart: a color that would land on the same
+entry as the color it is drawn over takes its next-nearest entry instead.
+
+spell() writes an index the way each format expects it (tmux colour123,
+Starship/Helix "123", or the format's ANSI color names).
+
+Usage:
+    from xterm_quantize import palette_indices, quantize_values
+    values_256 = quantize_values(values, palette_indices(values, 256), "tmux")
+
+    python xterm_quantize.py "#ff7eb6" "#0d1117"         # nearest entries at both depths
+    python xterm_quantize.py --bench
+"""
+
+import argparse
+import re
+import time
+from typing import Dict, List, Mapping, Sequence
+
+import numpy as np
+
+from color_array import hex_to_srgb, linear_to_oklab, srgb_to_hex, srgb_to_linear
+
+# ═══════════════════════════════════════════════════════════════════
+# Palette
+# ═══════════════════════════════════════════════════════════════════
+
+# xterm's default ANSI colors (what 0-15 look like when nobody redefines them)
+ANSI_16 = (
+    "#000000", "#cd0000", "#00cd00", "#cdcd00", "#0000ee", "#cd00cd", "#00cdcd", "#e5e5e5",
+    "#7f7f7f", "#ff0000", "#00ff00", "#ffff00", "#5c5cff", "#ff00ff", "#00ffff", "#ffffff",
+)
+CUBE_LEVELS = (0, 95, 135, 175, 215, 255)
+
+def xterm_palette() -> np.ndarray:
+    """(256, 3) sRGB in [0, 1]: ANSI defaults, the 6x6x6 cube (16-231), the gray ramp (232-255)."""
+    levels = np.array(CUBE_LEVELS, dtype=np.float64)
+    cube = np.stack(np.meshgrid(levels, levels, levels, indexing="ij"), axis=-1).reshape(216, 3)
+    grays = np.repeat((8 + 10 * np.arange(24, dtype=np.float64))[:, None], 3, axis=1)
+    return np.concatenate([hex_to_srgb(ANSI_16) * 255, cube, grays]) / 255.0
+
+PALETTE = xterm_palette()
+PALETTE_OKLAB = linear_to_oklab(srgb_to_linear(PALETTE))
+PALETTE_HEX = srgb_to_hex(PALETTE)
+PALETTE_CHROMA = np.hypot(PALETTE_OKLAB[:, 1], PALETTE_OKLAB[:, 2])
+PALETTE_NORM = (PALETTE_OKLAB ** 2).sum(axis=-1)
+
+# Candidate indices, and the weight of chroma differences, per depth
+DEPTHS = {256: np.arange(16, 256), 16: np.arange(16)}
+CHROMA_WEIGHT = {256: 1.0, 16: 0.25}
+
+# ═══════════════════════════════════════════════════════════════════
+# Nearest Entry
+# ═══════════════════════════════════════════════════════════════════
+
+_memo: Dict[int, Dict[int, int]] = {depth: {} for depth in DEPTHS}  # depth -> {0xrrggbb: index}
+
+def _distances(packed: Sequence[int], depth: int) -> np.ndarray:
+    """(len(packed), candidates) ranking distances of 0xrrggbb colors to the depth's candidates."""
+    candidates = DEPTHS[depth]
+    rgb = (np.array(packed, dtype=np.int64)[:, None] >> np.array([16, 8, 0])) & 0xFF
+    lab = linear_to_oklab(srgb_to_linear(rgb / 255.0))
+    # |lab - p|^2 without the per-row |lab|^2, which cannot change the ranking
+    dist = PALETTE_NORM[candidates] - 2.0 * lab @ PALETTE_OKLAB[candidates].T
+    if CHROMA_WEIGHT[depth] != 1.0:
+        # dE^2 = dL^2 + dC^2 + dH^2; keep only part of dC^2 where the entry is more saturated
+        extra = np.maximum(PALETTE_CHROMA[None, candidates] - np.hypot(lab[:, 1], lab[:, 2])[:, None], 0.0)
+        dist -= (1.0 - CHROMA_WEIGHT[depth]) * extra ** 2
+    return dist
+
+def nearest(hexes: Sequence[str], depth: int = 256) -> List[int]:
+    """Palette index of each '#rrggbb[aa]' color (alpha ignored) at the given depth."""
+    memo = _memo[depth]
+    packed = [int(h[1:7], 16) for h in hexes]
+    missing = list(dict.fromkeys(p for p in packed if p not in memo))
+    if missing:
+        memo.update(zip(missing, DEPTHS[depth][_distances(missing, depth).argmin(axis=1)].tolist()))
+    return [memo[p] for p in packed]
+
+def ranked(hex_color: str, depth: int = 256) -> List[int]:
+    """Every candidate palette index for one color, nearest first."""
+    return DEPTHS[depth][np.argsort(_distances([int(hex_color[1:7], 16)], depth)[0], kind="stable")].tolist()
+
+def delta_e(hex_color: str, index: int) -> float:
+    """OKLAB distance between a color and a palette entry."""
+    lab = linear_to_oklab(srgb_to_linear(hex_to_srgb([hex_color])))[0]
+    return float(np.linalg.norm(lab - PALETTE_OKLAB[index]))
+
+# ═══════════════════════════════════════════════════════════════════
+# Format Spelling
+# ═══════════════════════════════════════════════════════════════════
+
+# ANSI 0-15 as each format names them
+ANSI_NAMES = {
+    "tmux": ("black", "red", "green", "yellow", "blue", "magenta", "cyan", "white",
+             "brightblack", "brightred", "brightgreen", "brightyellow",
+             "brightblue", "brightmagenta", "brightcyan", "brightwhite"),
+    "starship": ("black", "red", "green", "yellow", "blue", "purple", "cyan", "white",
+                 "bright-black", "bright-red", "bright-green", "bright-yellow",
+                 "bright-blue", "bright-purple", "bright-cyan", "bright-white"),
+    # Helix calls ANSI 7 light-gray and ANSI 8 gray
+    "helix": ("black", "red", "green", "yellow", "blue", "magenta", "cyan", "light-gray",
+              "gray", "light-red", "light-green", "light-yellow",
+              "light-blue", "light-magenta", "light-cyan", "white"),
+}
+INDEXED = {"tmux": "colour{}", "starship": "{}", "helix": "{}"}
+
+def spell(fmt: str, index: int) -> str:
+    """A palette index as the format writes it: ANSI names for 0-15, indexed colors above."""
+    return ANSI_NAMES[fmt][index] if index < 16 else INDEXED[fmt].format(index)
+
+HEX_RE = re.compile(r"#[0-9a-fA-F]{6}(?:[0-9a-fA-F]{2})?")
+
+def palette_indices(values: Mapping[str, str], depth: int,
+                    distinct: Mapping[str, Sequence[str]] = {}) -> Dict[str, int]:
+    """{key: palette index} for every hex color in a writer's value dict.
+
+    distinct maps a key to the keys it is drawn over (fg -> bg, a surface -> the
+    background). Where the nearest entry equals one of theirs, the key takes its
+    next-nearest entry instead, so text and selections stay visible. Keys are
+    settled in the mapping's order.
+    """
+    keys = [key for key, value in values.items() if isinstance(value, str) and HEX_RE.fullmatch(value)]
+    indices = dict(zip(keys, nearest([values[key] for key in keys], depth)))
+    for key, partners in distinct.items():
+        if key not in indices:
+            continue
+        avoid = {indices[p] for p in partners if p in indices}
+        if indices[key] in avoid:
+            indices[key] = next(i for i in ranked(values[key], depth) if i not in avoid)
+    return indices
+
+def quantize_values(values: Mapping[str, str], indices: Mapping[str, int], fmt: str) -> Dict[str, str]:
+    """Copy of a writer's value dict with the colors in indices replaced by their palette spelling."""
+    return {**values, **{key: spell(fmt, index) for key, index in indices.items()}}
+
+# ═══════════════════════════════════════════════════════════════════
+# CLI
+# ═══════════════════════════════════════════════════════════════════
+
+def bench(count: int) -> float:
+    """Seconds to quantize `count` random colors at 256 colors with a cold memo."""
+    rng = np.random.default_rng(0)
+    hexes = [f"#{v:06x}" for v in rng.integers(0, 1 << 24, count).tolist()]
+    _memo[256].clear()
+    start = time.perf_counter()
+    nearest(hexes, 256)
+    return time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description="Nearest xterm-256 / 16-color entries (OKLAB)")
+    parser.add_argument("colors", nargs="*", metavar="HEX", help="Colors as #rrggbb")
+    parser.add_argument("--bench", action="store_true", help="Time a batch of random colors")
+    parser.add_argument("-n", type=int, default=100_000, help="Colors for --bench (default: 100000)")
+    args = parser.parse_args()
+
+    if args.bench:
+        elapsed = bench(args.n)
+        print(f"{args.n} colors in {elapsed * 1000:.1f} ms ({elapsed / args.n * 1e6:.2f} us/color)")
+        return 0
+    for color in args.colors:
+        if not HEX_RE.fullmatch(color):
+            parser.error(f"not a hex color: {color}")
+        row = [f"{color:<9}"]
+        for depth in DEPTHS:
+            index = nearest([color], depth)[0]
+            row.append(f"{depth:>3}: {index:>3} {PALETTE_HEX[index]} dE {delta_e(color, index):.3f}")
+        print("   ".join(row))
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
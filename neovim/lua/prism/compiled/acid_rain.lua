@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Acid Rain
+-- Auto-generated by sync_themes.py from vscode/themes/acid_rain.json - DO NOT EDIT
+
+return {
+  name = "Acid Rain",
+  mode = "dark",
+  palette = {
+    base00 = "#0d1117",
+    base01 = "#161b22",
+    base02 = "#21262c",
+    base03 = "#6e7681",
+    base04 = "#6990c7",
+    base05 = "#bc8cff",
+    base06 = "#cc9cff",
+    base07 = "#dcacff",
+    base08 = "#4a8dd8",
+    base09 = "#8b949e",
+    base0A = "#58a6ff",
+    base0B = "#7ee787",
+    base0C = "#79b7ff",
+    base0D = "#58a6ff",
+    base0E = "#ff7eb6",
+    base0F = "#7ee787",
+  },
+  terminal = {
+    "#0d1117", "#4a8dd8", "#68aeff", "#97eb9f",
+    "#58a6ff", "#427cbf", "#79b7ff", "#bc8cff",
+    "#7ee787", "#58a6ff", "#79b7ff", "#bc8cff",
+    "#71b3ff", "#4f95e5", "#8ac0ff", "#c297ff",
+  },
+  groups = {
+    Normal = { fg = "#bc8cff", bg = "#0d1117" },
+    NormalFloat = { fg = "#bc8cff", bg = "#161b22" },
+    NormalNC = { fg = "#bc8cff", bg = "#0d1117" },
+    Cursor = { fg = "#0d1117", bg = "#58a6ff" },
+    CursorLine = { bg = "#151722" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#12141d" },
+    LineNr = { fg = "#6e7681" },
+    CursorLineNr = { fg = "#bc8cff", bold = true },
+    SignColumn = { fg = "#6e7681", bg = "#0d1117" },
+    VertSplit = { fg = "#21262c" },
+    WinSeparator = { fg = "#21262c" },
+    Folded = { fg = "#6e7681", bg = "#161b22" },
+    FoldColumn = { fg = "#6e7681" },
+    NonText = { fg = "#6e7681" },
+    SpecialKey = { fg = "#6e7681" },
+    Whitespace = { fg = "#3d434c" },
+    MatchParen = { fg = "#58a6ff", bold = true },
+    Visual = { bg = "#233d5c" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#0d1117", bg = "#58a6ff" },
+    IncSearch = { fg = "#0d1117", bg = "#8b949e" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#0d1117", bg = "#4a8dd8" },
+    Pmenu = { fg = "#bc8cff", bg = "#161b22" },
+    PmenuSel = { fg = "#bc8cff", bg = "#1c2e45" },
+    PmenuSbar = { bg = "#21262c" },
+    PmenuThumb = { bg = "#6990c7" },
+    ErrorMsg = { fg = "#4a8dd8" },
+    WarningMsg = { fg = "#8b949e" },
+    ModeMsg = { fg = "#bc8cff", bold = true },
+    MoreMsg = { fg = "#58a6ff" },
+    Question = { fg = "#58a6ff" },
+    TabLine = { fg = "#6990c7", bg = "#161b22" },
+    TabLineFill = { bg = "#0d1117" },
+    TabLineSel = { fg = "#bc8cff", bg = "#0d1117", bold = true },
+    StatusLine = { fg = "#bc8cff", bg = "#161b22" },
+    StatusLineNC = { fg = "#6990c7", bg = "#161b22" },
+    DiffAdd = { bg = "#1d3127" },
+    DiffChange = { bg = "#1f242b" },
+    DiffDelete = { fg = "#4a8dd8", bg = "#162333" },
+    DiffText = { bg = "#32383f" },
+    SpellBad = { sp = "#4a8dd8", undercurl = true },
+    SpellCap = { sp = "#8b949e", undercurl = true },
+    SpellLocal = { sp = "#58a6ff", undercurl = true },
+    SpellRare = { sp = "#ff7eb6", undercurl = true },
+    Comment = { fg = "#6e7681" },
+    Constant = { fg = "#8b949e" },
+    String = { fg = "#7ee787" },
+    Character = { fg = "#7ee787" },
+    Number = { fg = "#8b949e" },
+    Boolean = { fg = "#8b949e" },
+    Float = { fg = "#8b949e" },
+    Identifier = { fg = "#c9d1d9" },
+    Function = { fg = "#58a6ff" },
+    Statement = { fg = "#ff7eb6" },
+    Conditional = { fg = "#ff7eb6" },
+    Repeat = { fg = "#ff7eb6" },
+    Label = { fg = "#ff7eb6" },
+    Operator = { fg = "#6990c7" },
+    Keyword = { fg = "#ff7eb6" },
+    Exception = { fg = "#ff7eb6" },
+    PreProc = { fg = "#ff7eb6" },
+    Include = { fg = "#ff7eb6" },
+    Define = { fg = "#ff7eb6" },
+    Macro = { fg = "#ff7eb6" },
+    PreCondit = { fg = "#ff7eb6" },
+    Type = { fg = "#ffc0d8" },
+    StorageClass = { fg = "#ff7eb6" },
+    Structure = { fg = "#ffc0d8" },
+    Typedef = { fg = "#ffc0d8" },
+    Special = { fg = "#79b7ff" },
+    SpecialChar = { fg = "#79b7ff" },
+    Tag = { fg = "#7ee787" },
+    Delimiter = { fg = "#6990c7" },
+    SpecialComment = { fg = "#6e7681", italic = true },
+    Debug = { fg = "#8b949e" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#6e7681" },
+    Error = { fg = "#4a8dd8" },
+    Todo = { fg = "#0d1117", bg = "#58a6ff", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#c9d1d9" },
+      ["@variable.builtin"] = { fg = "#ff7eb6" },
+      ["@variable.parameter"] = { fg = "#c9d1d9", italic = true },
+      ["@variable.member"] = { fg = "#c9d1d9" },
+      ["@constant"] = { fg = "#8b949e" },
+      ["@constant.builtin"] = { fg = "#8b949e" },
+      ["@module"] = { fg = "#bc8cff" },
+      ["@label"] = { fg = "#ff7eb6" },
+      ["@type"] = { fg = "#ffc0d8" },
+      ["@type.builtin"] = { fg = "#ffc0d8" },
+      ["@attribute"] = { fg = "#bc8cff" },
+      ["@property"] = { fg = "#c9d1d9" },
+      ["@function"] = { fg = "#58a6ff" },
+      ["@function.builtin"] = { fg = "#58a6ff" },
+      ["@function.call"] = { fg = "#58a6ff" },
+      ["@function.method"] = { fg = "#58a6ff" },
+      ["@constructor"] = { fg = "#ffc0d8" },
+      ["@operator"] = { fg = "#6990c7" },
+      ["@keyword"] = { fg = "#ff7eb6" },
+      ["@keyword.conditional"] = { fg = "#ff7eb6" },
+      ["@keyword.function"] = { fg = "#ff7eb6" },
+      ["@keyword.operator"] = { fg = "#ff7eb6" },
+      ["@keyword.return"] = { fg = "#ff7eb6" },
+      ["@punctuation.bracket"] = { fg = "#6990c7" },
+      ["@punctuation.delimiter"] = { fg = "#6990c7" },
+      ["@punctuation.special"] = { fg = "#79b7ff" },
+      ["@string"] = { fg = "#7ee787" },
+      ["@string.escape"] = { fg = "#79b7ff" },
+      ["@string.regexp"] = { fg = "#79b7ff" },
+      ["@character"] = { fg = "#7ee787" },
+      ["@boolean"] = { fg = "#8b949e" },
+      ["@number"] = { fg = "#8b949e" },
+      ["@comment"] = { fg = "#6e7681", italic = true },
+      ["@comment.todo"] = { fg = "#0d1117", bg = "#58a6ff", bold = true },
+      ["@comment.error"] = { fg = "#4a8dd8", bold = true },
+      ["@comment.warning"] = { fg = "#8b949e", bold = true },
+      ["@comment.note"] = { fg = "#58a6ff", bold = true },
+      ["@markup.heading"] = { fg = "#ff7eb6", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#7ee787" },
+      ["@markup.link"] = { fg = "#58a6ff", underline = true },
+      ["@tag"] = { fg = "#7ee787" },
+      ["@tag.attribute"] = { fg = "#bc8cff" },
+      ["@tag.delimiter"] = { fg = "#6990c7" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#4a8dd8" },
+      DiagnosticWarn = { fg = "#8b949e" },
+      DiagnosticInfo = { fg = "#58a6ff" },
+      DiagnosticHint = { fg = "#58a6ff" },
+      DiagnosticUnderlineError = { sp = "#4a8dd8", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#8b949e", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#58a6ff", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#58a6ff", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#4a8dd8", bg = "#131d2a" },
+      DiagnosticVirtualTextWarn = { fg = "#8b949e", bg = "#191e24" },
+      DiagnosticVirtualTextInfo = { fg = "#58a6ff", bg = "#141f2e" },
+      DiagnosticVirtualTextHint = { fg = "#58a6ff", bg = "#141f2e" },
+      LspReferenceText = { bg = "#1e1d2e" },
+      LspReferenceRead = { bg = "#1e1d2e" },
+      LspReferenceWrite = { bg = "#272339" },
+      LspSignatureActiveParameter = { fg = "#58a6ff", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#7ee787" },
+      GitSignsChange = { fg = "#8b949e" },
+      GitSignsDelete = { fg = "#4a8dd8" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#bc8cff", bg = "#0d1117" },
+      TelescopeBorder = { fg = "#21262c", bg = "#0d1117" },
+      TelescopePromptTitle = { fg = "#0d1117", bg = "#58a6ff", bold = true },
+      TelescopePreviewTitle = { fg = "#0d1117", bg = "#7ee787", bold = true },
+      TelescopeResultsTitle = { fg = "#0d1117", bg = "#58a6ff", bold = true },
+      TelescopeSelection = { bg = "#1c2e45" },
+      TelescopeMatching = { fg = "#58a6ff", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#58a6ff", bold = true },
+      CmpItemKindVariable = { fg = "#c9d1d9" },
+      CmpItemKindFunction = { fg = "#58a6ff" },
+      CmpItemKindKeyword = { fg = "#ff7eb6" },
+      CmpItemKindClass = { fg = "#ffc0d8" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#21262c" },
+      IblScope = { fg = "#6e7681" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#0d1117", bg = "#58a6ff", bold = true },
+      LazyButton = { fg = "#bc8cff", bg = "#21262c" },
+      LazyButtonActive = { fg = "#0d1117", bg = "#58a6ff" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#4a8dd8" },
+      NotifyWARNBorder = { fg = "#8b949e" },
+      NotifyINFOBorder = { fg = "#58a6ff" },
+      NotifyDEBUGBorder = { fg = "#6e7681" },
+      NotifyTRACEBorder = { fg = "#ff7eb6" },
+    },
+  },
+}
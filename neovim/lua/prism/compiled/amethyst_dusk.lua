@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Amethyst Dusk
+-- Auto-generated by sync_themes.py from vscode/themes/amethyst_dusk.json - DO NOT EDIT
+
+return {
+  name = "Amethyst Dusk",
+  mode = "dark",
+  palette = {
+    base00 = "#282a36",
+    base01 = "#323442",
+    base02 = "#3f414e",
+    base03 = "#6272a4",
+    base04 = "#96adf5",
+    base05 = "#f1fa8c",
+    base06 = "#ffff9b",
+    base07 = "#ffff9b",
+    base08 = "#a07cd3",
+    base09 = "#ffb86c",
+    base0A = "#bd93f9",
+    base0B = "#f1fa8c",
+    base0C = "#caa8fa",
+    base0D = "#50fa7b",
+    base0E = "#ff79c6",
+    base0F = "#ff79c6",
+  },
+  terminal = {
+    "#282a36", "#a07cd3", "#c39df9", "#ff93d1",
+    "#bd93f9", "#8d6eba", "#caa8fa", "#f1fa8c",
+    "#ff79c6", "#bd93f9", "#caa8fa", "#f1fa8c",
+    "#c6a3f9", "#aa84e0", "#d0b3fa", "#f2fa97",
+  },
+  groups = {
+    Normal = { fg = "#f1fa8c", bg = "#282a36" },
+    NormalFloat = { fg = "#f1fa8c", bg = "#323442" },
+    NormalNC = { fg = "#f1fa8c", bg = "#282a36" },
+    Cursor = { fg = "#282a36", bg = "#bd93f9" },
+    CursorLine = { bg = "#32343a" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#2e3038" },
+    LineNr = { fg = "#6272a4" },
+    CursorLineNr = { fg = "#f1fa8c", bold = true },
+    SignColumn = { fg = "#6272a4", bg = "#282a36" },
+    VertSplit = { fg = "#3f414e" },
+    WinSeparator = { fg = "#3f414e" },
+    Folded = { fg = "#6272a4", bg = "#323442" },
+    FoldColumn = { fg = "#6272a4" },
+    NonText = { fg = "#6272a4" },
+    SpecialKey = { fg = "#6272a4" },
+    Whitespace = { fg = "#454e6d" },
+    MatchParen = { fg = "#bd93f9", bold = true },
+    Visual = { bg = "#544970" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#282a36", bg = "#bd93f9" },
+    IncSearch = { fg = "#282a36", bg = "#ffb86c" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#282a36", bg = "#a07cd3" },
+    Pmenu = { fg = "#f1fa8c", bg = "#323442" },
+    PmenuSel = { fg = "#f1fa8c", bg = "#453f5d" },
+    PmenuSbar = { bg = "#3f414e" },
+    PmenuThumb = { bg = "#96adf5" },
+    ErrorMsg = { fg = "#a07cd3" },
+    WarningMsg = { fg = "#ffb86c" },
+    ModeMsg = { fg = "#f1fa8c", bold = true },
+    MoreMsg = { fg = "#50fa7b" },
+    Question = { fg = "#50fa7b" },
+    TabLine = { fg = "#96adf5", bg = "#323442" },
+    TabLineFill = { bg = "#282a36" },
+    TabLineSel = { fg = "#f1fa8c", bg = "#282a36", bold = true },
+    StatusLine = { fg = "#f1fa8c", bg = "#323442" },
+    StatusLineNC = { fg = "#96adf5", bg = "#323442" },
+    DiffAdd = { bg = "#464942" },
+    DiffChange = { bg = "#483f3e" },
+    DiffDelete = { fg = "#a07cd3", bg = "#3a364d" },
+    DiffText = { bg = "#685446" },
+    SpellBad = { sp = "#a07cd3", undercurl = true },
+    SpellCap = { sp = "#ffb86c", undercurl = true },
+    SpellLocal = { sp = "#50fa7b", undercurl = true },
+    SpellRare = { sp = "#ff79c6", undercurl = true },
+    Comment = { fg = "#6272a4" },
+    Constant = { fg = "#ffb86c" },
+    String = { fg = "#f1fa8c" },
+    Character = { fg = "#f1fa8c" },
+    Number = { fg = "#ffb86c" },
+    Boolean = { fg = "#ffb86c" },
+    Float = { fg = "#ffb86c" },
+    Identifier = { fg = "#f8f8f2" },
+    Function = { fg = "#50fa7b" },
+    Statement = { fg = "#ff79c6" },
+    Conditional = { fg = "#ff79c6" },
+    Repeat = { fg = "#ff79c6" },
+    Label = { fg = "#ff79c6" },
+    Operator = { fg = "#96adf5" },
+    Keyword = { fg = "#ff79c6" },
+    Exception = { fg = "#ff79c6" },
+    PreProc = { fg = "#ff79c6" },
+    Include = { fg = "#ff79c6" },
+    Define = { fg = "#ff79c6" },
+    Macro = { fg = "#ff79c6" },
+    PreCondit = { fg = "#ff79c6" },
+    Type = { fg = "#8be9fd" },
+    StorageClass = { fg = "#ff79c6" },
+    Structure = { fg = "#8be9fd" },
+    Typedef = { fg = "#8be9fd" },
+    Special = { fg = "#caa8fa" },
+    SpecialChar = { fg = "#caa8fa" },
+    Tag = { fg = "#8be9fd" },
+    Delimiter = { fg = "#96adf5" },
+    SpecialComment = { fg = "#6272a4", italic = true },
+    Debug = { fg = "#ffb86c" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#6272a4" },
+    Error = { fg = "#a07cd3" },
+    Todo = { fg = "#282a36", bg = "#bd93f9", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#f8f8f2" },
+      ["@variable.builtin"] = { fg = "#ff79c6" },
+      ["@variable.parameter"] = { fg = "#f8f8f2", italic = true },
+      ["@variable.member"] = { fg = "#f8f8f2" },
+      ["@constant"] = { fg = "#ffb86c" },
+      ["@constant.builtin"] = { fg = "#ffb86c" },
+      ["@module"] = { fg = "#f1fa8c" },
+      ["@label"] = { fg = "#ff79c6" },
+      ["@type"] = { fg = "#8be9fd" },
+      ["@type.builtin"] = { fg = "#8be9fd" },
+      ["@attribute"] = { fg = "#50fa7b" },
+      ["@property"] = { fg = "#f8f8f2" },
+      ["@function"] = { fg = "#50fa7b" },
+      ["@function.builtin"] = { fg = "#50fa7b" },
+      ["@function.call"] = { fg = "#50fa7b" },
+      ["@function.method"] = { fg = "#50fa7b" },
+      ["@constructor"] = { fg = "#8be9fd" },
+      ["@operator"] = { fg = "#96adf5" },
+      ["@keyword"] = { fg = "#ff79c6" },
+      ["@keyword.conditional"] = { fg = "#ff79c6" },
+      ["@keyword.function"] = { fg = "#ff79c6" },
+      ["@keyword.operator"] = { fg = "#ff79c6" },
+      ["@keyword.return"] = { fg = "#ff79c6" },
+      ["@punctuation.bracket"] = { fg = "#96adf5" },
+      ["@punctuation.delimiter"] = { fg = "#96adf5" },
+      ["@punctuation.special"] = { fg = "#caa8fa" },
+      ["@string"] = { fg = "#f1fa8c" },
+      ["@string.escape"] = { fg = "#caa8fa" },
+      ["@string.regexp"] = { fg = "#caa8fa" },
+      ["@character"] = { fg = "#f1fa8c" },
+      ["@boolean"] = { fg = "#ffb86c" },
+      ["@number"] = { fg = "#ffb86c" },
+      ["@comment"] = { fg = "#6272a4", italic = true },
+      ["@comment.todo"] = { fg = "#282a36", bg = "#bd93f9", bold = true },
+      ["@comment.error"] = { fg = "#a07cd3", bold = true },
+      ["@comment.warning"] = { fg = "#ffb86c", bold = true },
+      ["@comment.note"] = { fg = "#50fa7b", bold = true },
+      ["@markup.heading"] = { fg = "#ff79c6", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#f1fa8c" },
+      ["@markup.link"] = { fg = "#50fa7b", underline = true },
+      ["@tag"] = { fg = "#8be9fd" },
+      ["@tag.attribute"] = { fg = "#50fa7b" },
+      ["@tag.delimiter"] = { fg = "#96adf5" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#a07cd3" },
+      DiagnosticWarn = { fg = "#ffb86c" },
+      DiagnosticInfo = { fg = "#50fa7b" },
+      DiagnosticHint = { fg = "#bd93f9" },
+      DiagnosticUnderlineError = { sp = "#a07cd3", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#ffb86c", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#50fa7b", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#bd93f9", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#a07cd3", bg = "#343245" },
+      DiagnosticVirtualTextWarn = { fg = "#ffb86c", bg = "#3d383b" },
+      DiagnosticVirtualTextInfo = { fg = "#50fa7b", bg = "#2c3e3c" },
+      DiagnosticVirtualTextHint = { fg = "#bd93f9", bg = "#363449" },
+      LspReferenceText = { bg = "#3c3e3e" },
+      LspReferenceRead = { bg = "#3c3e3e" },
+      LspReferenceWrite = { bg = "#464942" },
+      LspSignatureActiveParameter = { fg = "#bd93f9", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#f1fa8c" },
+      GitSignsChange = { fg = "#ffb86c" },
+      GitSignsDelete = { fg = "#a07cd3" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#f1fa8c", bg = "#282a36" },
+      TelescopeBorder = { fg = "#3f414e", bg = "#282a36" },
+      TelescopePromptTitle = { fg = "#282a36", bg = "#bd93f9", bold = true },
+      TelescopePreviewTitle = { fg = "#282a36", bg = "#f1fa8c", bold = true },
+      TelescopeResultsTitle = { fg = "#282a36", bg = "#50fa7b", bold = true },
+      TelescopeSelection = { bg = "#453f5d" },
+      TelescopeMatching = { fg = "#bd93f9", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#bd93f9", bold = true },
+      CmpItemKindVariable = { fg = "#f8f8f2" },
+      CmpItemKindFunction = { fg = "#50fa7b" },
+      CmpItemKindKeyword = { fg = "#ff79c6" },
+      CmpItemKindClass = { fg = "#8be9fd" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#3f414e" },
+      IblScope = { fg = "#6272a4" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#282a36", bg = "#bd93f9", bold = true },
+      LazyButton = { fg = "#f1fa8c", bg = "#3f414e" },
+      LazyButtonActive = { fg = "#282a36", bg = "#bd93f9" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#a07cd3" },
+      NotifyWARNBorder = { fg = "#ffb86c" },
+      NotifyINFOBorder = { fg = "#50fa7b" },
+      NotifyDEBUGBorder = { fg = "#6272a4" },
+      NotifyTRACEBorder = { fg = "#ff79c6" },
+    },
+  },
+}
@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Arctic
+-- Auto-generated by sync_themes.py from vscode/themes/arctic.json - DO NOT EDIT
+
+return {
+  name = "Arctic",
+  mode = "dark",
+  palette = {
+    base00 = "#0a090c",
+    base01 = "#151316",
+    base02 = "#1e1d20",
+    base03 = "#4a6670",
+    base04 = "#98a8ae",
+    base05 = "#f0edee",
+    base06 = "#fffeff",
+    base07 = "#fffeff",
+    base08 = "#25565d",
+    base09 = "#56848b",
+    base0A = "#2C666E",
+    base0B = "#6b9399",
+    base0C = "#56848b",
+    base0D = "#608c92",
+    base0E = "#2C666E",
+    base0F = "#07393C",
+  },
+  terminal = {
+    "#0A090C", "#25565d", "#41757c", "#386063",
+    "#2C666E", "#214c52", "#56848b", "#F0EDEE",
+    "#07393C", "#2C666E", "#56848b", "#F0EDEE",
+    "#4b7c83", "#275b63", "#6b9399", "#f1eeef",
+  },
+  groups = {
+    Normal = { fg = "#f0edee", bg = "#0a090c" },
+    NormalFloat = { fg = "#f0edee", bg = "#151316" },
+    NormalNC = { fg = "#f0edee", bg = "#0a090c" },
+    Cursor = { fg = "#0a090c", bg = "#2C666E" },
+    CursorLine = { bg = "#151417" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#100f12" },
+    LineNr = { fg = "#4a6670" },
+    CursorLineNr = { fg = "#f0edee", bold = true },
+    SignColumn = { fg = "#4a6670", bg = "#0a090c" },
+    VertSplit = { fg = "#1e1d20" },
+    WinSeparator = { fg = "#1e1d20" },
+    Folded = { fg = "#4a6670", bg = "#151316" },
+    FoldColumn = { fg = "#4a6670" },
+    NonText = { fg = "#4a6670" },
+    SpecialKey = { fg = "#4a6670" },
+    Whitespace = { fg = "#2a373e" },
+    MatchParen = { fg = "#2C666E", bold = true },
+    Visual = { bg = "#142429" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#0a090c", bg = "#2C666E" },
+    IncSearch = { fg = "#0a090c", bg = "#56848b" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#0a090c", bg = "#25565d" },
+    Pmenu = { fg = "#f0edee", bg = "#151316" },
+    PmenuSel = { fg = "#f0edee", bg = "#101b1f" },
+    PmenuSbar = { bg = "#1e1d20" },
+    PmenuThumb = { bg = "#98a8ae" },
+    ErrorMsg = { fg = "#25565d" },
+    WarningMsg = { fg = "#56848b" },
+    ModeMsg = { fg = "#f0edee", bold = true },
+    MoreMsg = { fg = "#608c92" },
+    Question = { fg = "#608c92" },
+    TabLine = { fg = "#98a8ae", bg = "#151316" },
+    TabLineFill = { bg = "#0a090c" },
+    TabLineSel = { fg = "#f0edee", bg = "#0a090c", bold = true },
+    StatusLine = { fg = "#f0edee", bg = "#151316" },
+    StatusLineNC = { fg = "#98a8ae", bg = "#151316" },
+    DiffAdd = { bg = "#181d21" },
+    DiffChange = { bg = "#151b1f" },
+    DiffDelete = { fg = "#25565d", bg = "#0e1418" },
+    DiffText = { bg = "#202d32" },
+    SpellBad = { sp = "#25565d", undercurl = true },
+    SpellCap = { sp = "#56848b", undercurl = true },
+    SpellLocal = { sp = "#608c92", undercurl = true },
+    SpellRare = { sp = "#2C666E", undercurl = true },
+    Comment = { fg = "#4a6670" },
+    Constant = { fg = "#56848b" },
+    String = { fg = "#6b9399" },
+    Character = { fg = "#6b9399" },
+    Number = { fg = "#56848b" },
+    Boolean = { fg = "#56848b" },
+    Float = { fg = "#56848b" },
+    Identifier = { fg = "#F0EDEE" },
+    Function = { fg = "#608c92" },
+    Statement = { fg = "#2C666E" },
+    Conditional = { fg = "#2C666E" },
+    Repeat = { fg = "#2C666E" },
+    Label = { fg = "#2C666E" },
+    Operator = { fg = "#98a8ae" },
+    Keyword = { fg = "#2C666E" },
+    Exception = { fg = "#2C666E" },
+    PreProc = { fg = "#2C666E" },
+    Include = { fg = "#2C666E" },
+    Define = { fg = "#2C666E" },
+    Macro = { fg = "#2C666E" },
+    PreCondit = { fg = "#2C666E" },
+    Type = { fg = "#F0EDEE" },
+    StorageClass = { fg = "#2C666E" },
+    Structure = { fg = "#F0EDEE" },
+    Typedef = { fg = "#F0EDEE" },
+    Special = { fg = "#56848b" },
+    SpecialChar = { fg = "#56848b" },
+    Tag = { fg = "#2C666E" },
+    Delimiter = { fg = "#98a8ae" },
+    SpecialComment = { fg = "#4a6670", italic = true },
+    Debug = { fg = "#56848b" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#4a6670" },
+    Error = { fg = "#25565d" },
+    Todo = { fg = "#0a090c", bg = "#2C666E", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#F0EDEE" },
+      ["@variable.builtin"] = { fg = "#2C666E" },
+      ["@variable.parameter"] = { fg = "#F0EDEE", italic = true },
+      ["@variable.member"] = { fg = "#F0EDEE" },
+      ["@constant"] = { fg = "#56848b" },
+      ["@constant.builtin"] = { fg = "#56848b" },
+      ["@module"] = { fg = "#f0edee" },
+      ["@label"] = { fg = "#2C666E" },
+      ["@type"] = { fg = "#F0EDEE" },
+      ["@type.builtin"] = { fg = "#F0EDEE" },
+      ["@attribute"] = { fg = "#8eb4ba" },
+      ["@property"] = { fg = "#F0EDEE" },
+      ["@function"] = { fg = "#608c92" },
+      ["@function.builtin"] = { fg = "#608c92" },
+      ["@function.call"] = { fg = "#608c92" },
+      ["@function.method"] = { fg = "#608c92" },
+      ["@constructor"] = { fg = "#F0EDEE" },
+      ["@operator"] = { fg = "#98a8ae" },
+      ["@keyword"] = { fg = "#2C666E" },
+      ["@keyword.conditional"] = { fg = "#2C666E" },
+      ["@keyword.function"] = { fg = "#2C666E" },
+      ["@keyword.operator"] = { fg = "#2C666E" },
+      ["@keyword.return"] = { fg = "#2C666E" },
+      ["@punctuation.bracket"] = { fg = "#98a8ae" },
+      ["@punctuation.delimiter"] = { fg = "#98a8ae" },
+      ["@punctuation.special"] = { fg = "#56848b" },
+      ["@string"] = { fg = "#6b9399" },
+      ["@string.escape"] = { fg = "#56848b" },
+      ["@string.regexp"] = { fg = "#56848b" },
+      ["@character"] = { fg = "#6b9399" },
+      ["@boolean"] = { fg = "#56848b" },
+      ["@number"] = { fg = "#56848b" },
+      ["@comment"] = { fg = "#4a6670", italic = true },
+      ["@comment.todo"] = { fg = "#0a090c", bg = "#2C666E", bold = true },
+      ["@comment.error"] = { fg = "#25565d", bold = true },
+      ["@comment.warning"] = { fg = "#56848b", bold = true },
+      ["@comment.note"] = { fg = "#608c92", bold = true },
+      ["@markup.heading"] = { fg = "#2C666E", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#6b9399" },
+      ["@markup.link"] = { fg = "#608c92", underline = true },
+      ["@tag"] = { fg = "#2C666E" },
+      ["@tag.attribute"] = { fg = "#8eb4ba" },
+      ["@tag.delimiter"] = { fg = "#98a8ae" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#25565d" },
+      DiagnosticWarn = { fg = "#56848b" },
+      DiagnosticInfo = { fg = "#608c92" },
+      DiagnosticHint = { fg = "#2C666E" },
+      DiagnosticUnderlineError = { sp = "#25565d", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#56848b", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#608c92", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#2C666E", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#25565d", bg = "#0c1014" },
+      DiagnosticVirtualTextWarn = { fg = "#56848b", bg = "#111518" },
+      DiagnosticVirtualTextInfo = { fg = "#608c92", bg = "#121619" },
+      DiagnosticVirtualTextHint = { fg = "#2C666E", bg = "#0d1215" },
+      LspReferenceText = { bg = "#211f22" },
+      LspReferenceRead = { bg = "#211f22" },
+      LspReferenceWrite = { bg = "#2c2b2d" },
+      LspSignatureActiveParameter = { fg = "#2C666E", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#6b9399" },
+      GitSignsChange = { fg = "#56848b" },
+      GitSignsDelete = { fg = "#25565d" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#f0edee", bg = "#0a090c" },
+      TelescopeBorder = { fg = "#1e1d20", bg = "#0a090c" },
+      TelescopePromptTitle = { fg = "#0a090c", bg = "#2C666E", bold = true },
+      TelescopePreviewTitle = { fg = "#0a090c", bg = "#6b9399", bold = true },
+      TelescopeResultsTitle = { fg = "#0a090c", bg = "#608c92", bold = true },
+      TelescopeSelection = { bg = "#101b1f" },
+      TelescopeMatching = { fg = "#2C666E", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#2C666E", bold = true },
+      CmpItemKindVariable = { fg = "#F0EDEE" },
+      CmpItemKindFunction = { fg = "#608c92" },
+      CmpItemKindKeyword = { fg = "#2C666E" },
+      CmpItemKindClass = { fg = "#F0EDEE" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#1e1d20" },
+      IblScope = { fg = "#4a6670" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#0a090c", bg = "#2C666E", bold = true },
+      LazyButton = { fg = "#f0edee", bg = "#1e1d20" },
+      LazyButtonActive = { fg = "#0a090c", bg = "#2C666E" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#25565d" },
+      NotifyWARNBorder = { fg = "#56848b" },
+      NotifyINFOBorder = { fg = "#608c92" },
+      NotifyDEBUGBorder = { fg = "#4a6670" },
+      NotifyTRACEBorder = { fg = "#2C666E" },
+    },
+  },
+}
@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Aurora Glass
+-- Auto-generated by sync_themes.py from vscode/themes/aurora_glass.json - DO NOT EDIT
+
+return {
+  name = "Aurora Glass",
+  mode = "dark",
+  palette = {
+    base00 = "#0a0815",
+    base01 = "#12101f",
+    base02 = "#1e1c2b",
+    base03 = "#5a5570",
+    base04 = "#a19eb2",
+    base05 = "#e8f0f8",
+    base06 = "#f8ffff",
+    base07 = "#f8ffff",
+    base08 = "#8d76d4",
+    base09 = "#b8a2fb",
+    base0A = "#a78bfa",
+    base0B = "#c1adfb",
+    base0C = "#b8a2fb",
+    base0D = "#bda8fb",
+    base0E = "#a78bfa",
+    base0F = "#5a5570",
+  },
+  terminal = {
+    "#0a0815", "#8d76d4", "#af96fa", "#7b778c",
+    "#a78bfa", "#7d68bb", "#b8a2fb", "#e8f0f8",
+    "#5a5570", "#a78bfa", "#b8a2fb", "#e8f0f8",
+    "#b49cfa", "#967de1", "#c1adfb", "#eaf1f8",
+  },
+  groups = {
+    Normal = { fg = "#e8f0f8", bg = "#0a0815" },
+    NormalFloat = { fg = "#e8f0f8", bg = "#12101f" },
+    NormalNC = { fg = "#e8f0f8", bg = "#0a0815" },
+    Cursor = { fg = "#0a0815", bg = "#a78bfa" },
+    CursorLine = { bg = "#151320" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#100e1b" },
+    LineNr = { fg = "#5a5570" },
+    CursorLineNr = { fg = "#e8f0f8", bold = true },
+    SignColumn = { fg = "#5a5570", bg = "#0a0815" },
+    VertSplit = { fg = "#1e1c2b" },
+    WinSeparator = { fg = "#1e1c2b" },
+    Folded = { fg = "#5a5570", bg = "#12101f" },
+    FoldColumn = { fg = "#5a5570" },
+    NonText = { fg = "#5a5570" },
+    SpecialKey = { fg = "#5a5570" },
+    Whitespace = { fg = "#322e42" },
+    MatchParen = { fg = "#a78bfa", bold = true },
+    Visual = { bg = "#392f59" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#0a0815", bg = "#a78bfa" },
+    IncSearch = { fg = "#0a0815", bg = "#b8a2fb" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#0a0815", bg = "#8d76d4" },
+    Pmenu = { fg = "#e8f0f8", bg = "#12101f" },
+    PmenuSel = { fg = "#e8f0f8", bg = "#292242" },
+    PmenuSbar = { bg = "#1e1c2b" },
+    PmenuThumb = { bg = "#a19eb2" },
+    ErrorMsg = { fg = "#8d76d4" },
+    WarningMsg = { fg = "#b8a2fb" },
+    ModeMsg = { fg = "#e8f0f8", bold = true },
+    MoreMsg = { fg = "#bda8fb" },
+    Question = { fg = "#bda8fb" },
+    TabLine = { fg = "#a19eb2", bg = "#12101f" },
+    TabLineFill = { bg = "#0a0815" },
+    TabLineSel = { fg = "#e8f0f8", bg = "#0a0815", bold = true },
+    StatusLine = { fg = "#e8f0f8", bg = "#12101f" },
+    StatusLineNC = { fg = "#a19eb2", bg = "#12101f" },
+    DiffAdd = { bg = "#252037" },
+    DiffChange = { bg = "#241f37" },
+    DiffDelete = { fg = "#8d76d4", bg = "#1d1831" },
+    DiffText = { bg = "#3e365a" },
+    SpellBad = { sp = "#8d76d4", undercurl = true },
+    SpellCap = { sp = "#b8a2fb", undercurl = true },
+    SpellLocal = { sp = "#bda8fb", undercurl = true },
+    SpellRare = { sp = "#a78bfa", undercurl = true },
+    Comment = { fg = "#5a5570" },
+    Constant = { fg = "#b8a2fb" },
+    String = { fg = "#c1adfb" },
+    Character = { fg = "#c1adfb" },
+    Number = { fg = "#b8a2fb" },
+    Boolean = { fg = "#b8a2fb" },
+    Float = { fg = "#b8a2fb" },
+    Identifier = { fg = "#e8f0f8" },
+    Function = { fg = "#bda8fb" },
+    Statement = { fg = "#a78bfa" },
+    Conditional = { fg = "#a78bfa" },
+    Repeat = { fg = "#a78bfa" },
+    Label = { fg = "#a78bfa" },
+    Operator = { fg = "#a19eb2" },
+    Keyword = { fg = "#a78bfa" },
+    Exception = { fg = "#a78bfa" },
+    PreProc = { fg = "#a78bfa" },
+    Include = { fg = "#a78bfa" },
+    Define = { fg = "#a78bfa" },
+    Macro = { fg = "#a78bfa" },
+    PreCondit = { fg = "#a78bfa" },
+    Type = { fg = "#e8f0f8" },
+    StorageClass = { fg = "#a78bfa" },
+    Structure = { fg = "#e8f0f8" },
+    Typedef = { fg = "#e8f0f8" },
+    Special = { fg = "#b8a2fb" },
+    SpecialChar = { fg = "#b8a2fb" },
+    Tag = { fg = "#e0b0ff" },
+    Delimiter = { fg = "#a19eb2" },
+    SpecialComment = { fg = "#5a5570", italic = true },
+    Debug = { fg = "#b8a2fb" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#5a5570" },
+    Error = { fg = "#8d76d4" },
+    Todo = { fg = "#0a0815", bg = "#a78bfa", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#e8f0f8" },
+      ["@variable.builtin"] = { fg = "#a78bfa" },
+      ["@variable.parameter"] = { fg = "#e8f0f8", italic = true },
+      ["@variable.member"] = { fg = "#e8f0f8" },
+      ["@constant"] = { fg = "#b8a2fb" },
+      ["@constant.builtin"] = { fg = "#b8a2fb" },
+      ["@module"] = { fg = "#e8f0f8" },
+      ["@label"] = { fg = "#a78bfa" },
+      ["@type"] = { fg = "#e8f0f8" },
+      ["@type.builtin"] = { fg = "#e8f0f8" },
+      ["@attribute"] = { fg = "#89b4fa" },
+      ["@property"] = { fg = "#e8f0f8" },
+      ["@function"] = { fg = "#bda8fb" },
+      ["@function.builtin"] = { fg = "#bda8fb" },
+      ["@function.call"] = { fg = "#bda8fb" },
+      ["@function.method"] = { fg = "#bda8fb" },
+      ["@constructor"] = { fg = "#e8f0f8" },
+      ["@operator"] = { fg = "#a19eb2" },
+      ["@keyword"] = { fg = "#a78bfa" },
+      ["@keyword.conditional"] = { fg = "#a78bfa" },
+      ["@keyword.function"] = { fg = "#a78bfa" },
+      ["@keyword.operator"] = { fg = "#a78bfa" },
+      ["@keyword.return"] = { fg = "#a78bfa" },
+      ["@punctuation.bracket"] = { fg = "#a19eb2" },
+      ["@punctuation.delimiter"] = { fg = "#a19eb2" },
+      ["@punctuation.special"] = { fg = "#b8a2fb" },
+      ["@string"] = { fg = "#c1adfb" },
+      ["@string.escape"] = { fg = "#b8a2fb" },
+      ["@string.regexp"] = { fg = "#b8a2fb" },
+      ["@character"] = { fg = "#c1adfb" },
+      ["@boolean"] = { fg = "#b8a2fb" },
+      ["@number"] = { fg = "#b8a2fb" },
+      ["@comment"] = { fg = "#5a5570", italic = true },
+      ["@comment.todo"] = { fg = "#0a0815", bg = "#a78bfa", bold = true },
+      ["@comment.error"] = { fg = "#8d76d4", bold = true },
+      ["@comment.warning"] = { fg = "#b8a2fb", bold = true },
+      ["@comment.note"] = { fg = "#bda8fb", bold = true },
+      ["@markup.heading"] = { fg = "#a78bfa", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#c1adfb" },
+      ["@markup.link"] = { fg = "#bda8fb", underline = true },
+      ["@tag"] = { fg = "#e0b0ff" },
+      ["@tag.attribute"] = { fg = "#89b4fa" },
+      ["@tag.delimiter"] = { fg = "#a19eb2" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#8d76d4" },
+      DiagnosticWarn = { fg = "#b8a2fb" },
+      DiagnosticInfo = { fg = "#bda8fb" },
+      DiagnosticHint = { fg = "#a78bfa" },
+      DiagnosticUnderlineError = { sp = "#8d76d4", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#b8a2fb", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#bda8fb", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#a78bfa", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#8d76d4", bg = "#171328" },
+      DiagnosticVirtualTextWarn = { fg = "#b8a2fb", bg = "#1b172c" },
+      DiagnosticVirtualTextInfo = { fg = "#bda8fb", bg = "#1b182c" },
+      DiagnosticVirtualTextHint = { fg = "#a78bfa", bg = "#19152b" },
+      LspReferenceText = { bg = "#201f2b" },
+      LspReferenceRead = { bg = "#201f2b" },
+      LspReferenceWrite = { bg = "#2b2a37" },
+      LspSignatureActiveParameter = { fg = "#a78bfa", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#c1adfb" },
+      GitSignsChange = { fg = "#b8a2fb" },
+      GitSignsDelete = { fg = "#8d76d4" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#e8f0f8", bg = "#0a0815" },
+      TelescopeBorder = { fg = "#1e1c2b", bg = "#0a0815" },
+      TelescopePromptTitle = { fg = "#0a0815", bg = "#a78bfa", bold = true },
+      TelescopePreviewTitle = { fg = "#0a0815", bg = "#c1adfb", bold = true },
+      TelescopeResultsTitle = { fg = "#0a0815", bg = "#bda8fb", bold = true },
+      TelescopeSelection = { bg = "#292242" },
+      TelescopeMatching = { fg = "#a78bfa", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#a78bfa", bold = true },
+      CmpItemKindVariable = { fg = "#e8f0f8" },
+      CmpItemKindFunction = { fg = "#bda8fb" },
+      CmpItemKindKeyword = { fg = "#a78bfa" },
+      CmpItemKindClass = { fg = "#e8f0f8" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#1e1c2b" },
+      IblScope = { fg = "#5a5570" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#0a0815", bg = "#a78bfa", bold = true },
+      LazyButton = { fg = "#e8f0f8", bg = "#1e1c2b" },
+      LazyButtonActive = { fg = "#0a0815", bg = "#a78bfa" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#8d76d4" },
+      NotifyWARNBorder = { fg = "#b8a2fb" },
+      NotifyINFOBorder = { fg = "#bda8fb" },
+      NotifyDEBUGBorder = { fg = "#5a5570" },
+      NotifyTRACEBorder = { fg = "#a78bfa" },
+    },
+  },
+}
@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Ayu Mirage
+-- Auto-generated by sync_themes.py from vscode/themes/ayu_mirage.json - DO NOT EDIT
+
+return {
+  name = "Ayu Mirage",
+  mode = "dark",
+  palette = {
+    base00 = "#1f2430",
+    base01 = "#242936",
+    base02 = "#353b48",
+    base03 = "#5c6773",
+    base04 = "#8f97a1",
+    base05 = "#cccac2",
+    base06 = "#dcdad2",
+    base07 = "#edebe2",
+    base08 = "#d8ad56",
+    base09 = "#dfbfff",
+    base0A = "#ffcc66",
+    base0B = "#d5ff80",
+    base0C = "#ffd684",
+    base0D = "#ffd580",
+    base0E = "#ffa759",
+    base0F = "#5c6773",
+  },
+  terminal = {
+    "#1f2430", "#d8ad56", "#ffd175", "#7c858f",
+    "#ffcc66", "#bf994c", "#ffd684", "#cccac2",
+    "#5c6773", "#ffcc66", "#ffd684", "#cccac2",
+    "#ffd37c", "#e5b75b", "#ffdb93", "#d1cfc8",
+  },
+  groups = {
+    Normal = { fg = "#cccac2", bg = "#1f2430" },
+    NormalFloat = { fg = "#cccac2", bg = "#242936" },
+    NormalNC = { fg = "#cccac2", bg = "#1f2430" },
+    Cursor = { fg = "#1f2430", bg = "#ffcc66" },
+    CursorLine = { bg = "#272c37" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#242834" },
+    LineNr = { fg = "#5c6773" },
+    CursorLineNr = { fg = "#cccac2", bold = true },
+    SignColumn = { fg = "#5c6773", bg = "#1f2430" },
+    VertSplit = { fg = "#353b48" },
+    WinSeparator = { fg = "#353b48" },
+    Folded = { fg = "#5c6773", bg = "#242936" },
+    FoldColumn = { fg = "#5c6773" },
+    NonText = { fg = "#5c6773" },
+    SpecialKey = { fg = "#5c6773" },
+    Whitespace = { fg = "#3d4551" },
+    MatchParen = { fg = "#ffcc66", bold = true },
+    Visual = { bg = "#625640" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#1f2430", bg = "#ffcc66" },
+    IncSearch = { fg = "#1f2430", bg = "#dfbfff" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#1f2430", bg = "#d8ad56" },
+    Pmenu = { fg = "#cccac2", bg = "#242936" },
+    PmenuSel = { fg = "#cccac2", bg = "#4b453a" },
+    PmenuSbar = { bg = "#353b48" },
+    PmenuThumb = { bg = "#8f97a1" },
+    ErrorMsg = { fg = "#d8ad56" },
+    WarningMsg = { fg = "#dfbfff" },
+    ModeMsg = { fg = "#cccac2", bold = true },
+    MoreMsg = { fg = "#ffd580" },
+    Question = { fg = "#ffd580" },
+    TabLine = { fg = "#8f97a1", bg = "#242936" },
+    TabLineFill = { bg = "#1f2430" },
+    TabLineSel = { fg = "#cccac2", bg = "#1f2430", bold = true },
+    StatusLine = { fg = "#cccac2", bg = "#242936" },
+    StatusLineNC = { fg = "#8f97a1", bg = "#242936" },
+    DiffAdd = { bg = "#3a443c" },
+    DiffChange = { bg = "#3b3b4f" },
+    DiffDelete = { fg = "#d8ad56", bg = "#3a3835" },
+    DiffText = { bg = "#58526e" },
+    SpellBad = { sp = "#d8ad56", undercurl = true },
+    SpellCap = { sp = "#dfbfff", undercurl = true },
+    SpellLocal = { sp = "#ffd580", undercurl = true },
+    SpellRare = { sp = "#ffa759", undercurl = true },
+    Comment = { fg = "#5c6773" },
+    Constant = { fg = "#dfbfff" },
+    String = { fg = "#d5ff80" },
+    Character = { fg = "#d5ff80" },
+    Number = { fg = "#dfbfff" },
+    Boolean = { fg = "#dfbfff" },
+    Float = { fg = "#dfbfff" },
+    Identifier = { fg = "#cccac2" },
+    Function = { fg = "#ffd580" },
+    Statement = { fg = "#ffa759" },
+    Conditional = { fg = "#ffa759" },
+    Repeat = { fg = "#ffa759" },
+    Label = { fg = "#ffa759" },
+    Operator = { fg = "#8f97a1" },
+    Keyword = { fg = "#ffa759" },
+    Exception = { fg = "#ffa759" },
+    PreProc = { fg = "#ffa759" },
+    Include = { fg = "#ffa759" },
+    Define = { fg = "#ffa759" },
+    Macro = { fg = "#ffa759" },
+    PreCondit = { fg = "#ffa759" },
+    Type = { fg = "#73d0ff" },
+    StorageClass = { fg = "#ffa759" },
+    Structure = { fg = "#73d0ff" },
+    Typedef = { fg = "#73d0ff" },
+    Special = { fg = "#ffd684" },
+    SpecialChar = { fg = "#ffd684" },
+    Tag = { fg = "#5ccfe6" },
+    Delimiter = { fg = "#8f97a1" },
+    SpecialComment = { fg = "#5c6773", italic = true },
+    Debug = { fg = "#dfbfff" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#5c6773" },
+    Error = { fg = "#d8ad56" },
+    Todo = { fg = "#1f2430", bg = "#ffcc66", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#cccac2" },
+      ["@variable.builtin"] = { fg = "#ffa759" },
+      ["@variable.parameter"] = { fg = "#cccac2", italic = true },
+      ["@variable.member"] = { fg = "#cccac2" },
+      ["@constant"] = { fg = "#dfbfff" },
+      ["@constant.builtin"] = { fg = "#dfbfff" },
+      ["@module"] = { fg = "#cccac2" },
+      ["@label"] = { fg = "#ffa759" },
+      ["@type"] = { fg = "#73d0ff" },
+      ["@type.builtin"] = { fg = "#73d0ff" },
+      ["@attribute"] = { fg = "#d4bfff" },
+      ["@property"] = { fg = "#cccac2" },
+      ["@function"] = { fg = "#ffd580" },
+      ["@function.builtin"] = { fg = "#ffd580" },
+      ["@function.call"] = { fg = "#ffd580" },
+      ["@function.method"] = { fg = "#ffd580" },
+      ["@constructor"] = { fg = "#73d0ff" },
+      ["@operator"] = { fg = "#8f97a1" },
+      ["@keyword"] = { fg = "#ffa759" },
+      ["@keyword.conditional"] = { fg = "#ffa759" },
+      ["@keyword.function"] = { fg = "#ffa759" },
+      ["@keyword.operator"] = { fg = "#ffa759" },
+      ["@keyword.return"] = { fg = "#ffa759" },
+      ["@punctuation.bracket"] = { fg = "#8f97a1" },
+      ["@punctuation.delimiter"] = { fg = "#8f97a1" },
+      ["@punctuation.special"] = { fg = "#ffd684" },
+      ["@string"] = { fg = "#d5ff80" },
+      ["@string.escape"] = { fg = "#ffd684" },
+      ["@string.regexp"] = { fg = "#ffd684" },
+      ["@character"] = { fg = "#d5ff80" },
+      ["@boolean"] = { fg = "#dfbfff" },
+      ["@number"] = { fg = "#dfbfff" },
+      ["@comment"] = { fg = "#5c6773", italic = true },
+      ["@comment.todo"] = { fg = "#1f2430", bg = "#ffcc66", bold = true },
+      ["@comment.error"] = { fg = "#d8ad56", bold = true },
+      ["@comment.warning"] = { fg = "#dfbfff", bold = true },
+      ["@comment.note"] = { fg = "#ffd580", bold = true },
+      ["@markup.heading"] = { fg = "#ffa759", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#d5ff80" },
+      ["@markup.link"] = { fg = "#ffd580", underline = true },
+      ["@tag"] = { fg = "#5ccfe6" },
+      ["@tag.attribute"] = { fg = "#d4bfff" },
+      ["@tag.delimiter"] = { fg = "#8f97a1" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#d8ad56" },
+      DiagnosticWarn = { fg = "#dfbfff" },
+      DiagnosticInfo = { fg = "#ffd580" },
+      DiagnosticHint = { fg = "#ffcc66" },
+      DiagnosticUnderlineError = { sp = "#d8ad56", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#dfbfff", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#ffd580", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#ffcc66", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#d8ad56", bg = "#313133" },
+      DiagnosticVirtualTextWarn = { fg = "#dfbfff", bg = "#323344" },
+      DiagnosticVirtualTextInfo = { fg = "#ffd580", bg = "#353538" },
+      DiagnosticVirtualTextHint = { fg = "#ffcc66", bg = "#353435" },
+      LspReferenceText = { bg = "#30343e" },
+      LspReferenceRead = { bg = "#30343e" },
+      LspReferenceWrite = { bg = "#383c45" },
+      LspSignatureActiveParameter = { fg = "#ffcc66", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#d5ff80" },
+      GitSignsChange = { fg = "#dfbfff" },
+      GitSignsDelete = { fg = "#d8ad56" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#cccac2", bg = "#1f2430" },
+      TelescopeBorder = { fg = "#353b48", bg = "#1f2430" },
+      TelescopePromptTitle = { fg = "#1f2430", bg = "#ffcc66", bold = true },
+      TelescopePreviewTitle = { fg = "#1f2430", bg = "#d5ff80", bold = true },
+      TelescopeResultsTitle = { fg = "#1f2430", bg = "#ffd580", bold = true },
+      TelescopeSelection = { bg = "#4b453a" },
+      TelescopeMatching = { fg = "#ffcc66", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#ffcc66", bold = true },
+      CmpItemKindVariable = { fg = "#cccac2" },
+      CmpItemKindFunction = { fg = "#ffd580" },
+      CmpItemKindKeyword = { fg = "#ffa759" },
+      CmpItemKindClass = { fg = "#73d0ff" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#353b48" },
+      IblScope = { fg = "#5c6773" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#1f2430", bg = "#ffcc66", bold = true },
+      LazyButton = { fg = "#cccac2", bg = "#353b48" },
+      LazyButtonActive = { fg = "#1f2430", bg = "#ffcc66" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#d8ad56" },
+      NotifyWARNBorder = { fg = "#dfbfff" },
+      NotifyINFOBorder = { fg = "#ffd580" },
+      NotifyDEBUGBorder = { fg = "#5c6773" },
+      NotifyTRACEBorder = { fg = "#ffa759" },
+    },
+  },
+}
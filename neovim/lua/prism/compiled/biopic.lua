@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Biopic
+-- Auto-generated by sync_themes.py from vscode/themes/biopic.json - DO NOT EDIT
+
+return {
+  name = "Biopic",
+  mode = "light",
+  palette = {
+    base00 = "#faf8f5",
+    base01 = "#f0ece5",
+    base02 = "#dcdad7",
+    base03 = "#8a8378",
+    base04 = "#5d584f",
+    base05 = "#33302a",
+    base06 = "#27241e",
+    base07 = "#1b1813",
+    base08 = "#0759b9",
+    base09 = "#218bff",
+    base0A = "#0969da",
+    base0B = "#1f6feb",
+    base0C = "#2d7fdf",
+    base0D = "#0550a0",
+    base0E = "#0969da",
+    base0F = "#8a8378",
+  },
+  terminal = {
+    "#33302a", "#0759b9", "#2178dd", "#8a8378",
+    "#0969da", "#064ea3", "#2d7fdf", "#faf8f5",
+    "#8a8378", "#0969da", "#2d7fdf", "#958f85",
+    "#2178dd", "#085ec4", "#468ee3", "#faf8f5",
+  },
+  groups = {
+    Normal = { fg = "#33302a", bg = "#faf8f5" },
+    NormalFloat = { fg = "#33302a", bg = "#f0ece5" },
+    NormalNC = { fg = "#33302a", bg = "#faf8f5" },
+    Cursor = { fg = "#faf8f5", bg = "#0969da" },
+    CursorLine = { bg = "#f0eeea" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#f4f2ee" },
+    LineNr = { fg = "#8a8378" },
+    CursorLineNr = { fg = "#33302a", bold = true },
+    SignColumn = { fg = "#8a8378", bg = "#faf8f5" },
+    VertSplit = { fg = "#dcdad7" },
+    WinSeparator = { fg = "#dcdad7" },
+    Folded = { fg = "#8a8378", bg = "#f0ece5" },
+    FoldColumn = { fg = "#8a8378" },
+    NonText = { fg = "#8a8378" },
+    SpecialKey = { fg = "#8a8378" },
+    Whitespace = { fg = "#c2bdb6" },
+    MatchParen = { fg = "#0969da", bold = true },
+    Visual = { bg = "#b1cdec" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#faf8f5", bg = "#0969da" },
+    IncSearch = { fg = "#faf8f5", bg = "#218bff" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#faf8f5", bg = "#0759b9" },
+    Pmenu = { fg = "#33302a", bg = "#f0ece5" },
+    PmenuSel = { fg = "#33302a", bg = "#c9dbef" },
+    PmenuSbar = { bg = "#dcdad7" },
+    PmenuThumb = { bg = "#5d584f" },
+    ErrorMsg = { fg = "#0759b9" },
+    WarningMsg = { fg = "#218bff" },
+    ModeMsg = { fg = "#33302a", bold = true },
+    MoreMsg = { fg = "#0550a0" },
+    Question = { fg = "#0550a0" },
+    TabLine = { fg = "#5d584f", bg = "#f0ece5" },
+    TabLineFill = { bg = "#faf8f5" },
+    TabLineSel = { fg = "#33302a", bg = "#faf8f5", bold = true },
+    StatusLine = { fg = "#33302a", bg = "#f0ece5" },
+    StatusLineNC = { fg = "#5d584f", bg = "#f0ece5" },
+    DiffAdd = { bg = "#d9e3f3" },
+    DiffChange = { bg = "#d9e7f6" },
+    DiffDelete = { fg = "#0759b9", bg = "#d5e0ec" },
+    DiffText = { bg = "#b8d7f8" },
+    SpellBad = { sp = "#0759b9", undercurl = true },
+    SpellCap = { sp = "#218bff", undercurl = true },
+    SpellLocal = { sp = "#0550a0", undercurl = true },
+    SpellRare = { sp = "#0969da", undercurl = true },
+    Comment = { fg = "#8a8378" },
+    Constant = { fg = "#218bff" },
+    String = { fg = "#1f6feb" },
+    Character = { fg = "#1f6feb" },
+    Number = { fg = "#218bff" },
+    Boolean = { fg = "#218bff" },
+    Float = { fg = "#218bff" },
+    Identifier = { fg = "#33302a" },
+    Function = { fg = "#0550a0" },
+    Statement = { fg = "#0969da" },
+    Conditional = { fg = "#0969da" },
+    Repeat = { fg = "#0969da" },
+    Label = { fg = "#0969da" },
+    Operator = { fg = "#5d584f" },
+    Keyword = { fg = "#0969da" },
+    Exception = { fg = "#0969da" },
+    PreProc = { fg = "#0969da" },
+    Include = { fg = "#0969da" },
+    Define = { fg = "#0969da" },
+    Macro = { fg = "#0969da" },
+    PreCondit = { fg = "#0969da" },
+    Type = { fg = "#033d73" },
+    StorageClass = { fg = "#0969da" },
+    Structure = { fg = "#033d73" },
+    Typedef = { fg = "#033d73" },
+    Special = { fg = "#2d7fdf" },
+    SpecialChar = { fg = "#2d7fdf" },
+    Tag = { fg = "#0969da" },
+    Delimiter = { fg = "#5d584f" },
+    SpecialComment = { fg = "#8a8378", italic = true },
+    Debug = { fg = "#218bff" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#8a8378" },
+    Error = { fg = "#0759b9" },
+    Todo = { fg = "#faf8f5", bg = "#0969da", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#33302a" },
+      ["@variable.builtin"] = { fg = "#0969da" },
+      ["@variable.parameter"] = { fg = "#33302a", italic = true },
+      ["@variable.member"] = { fg = "#33302a" },
+      ["@constant"] = { fg = "#218bff" },
+      ["@constant.builtin"] = { fg = "#218bff" },
+      ["@module"] = { fg = "#33302a" },
+      ["@label"] = { fg = "#0969da" },
+      ["@type"] = { fg = "#033d73" },
+      ["@type.builtin"] = { fg = "#033d73" },
+      ["@attribute"] = { fg = "#58a6ff" },
+      ["@property"] = { fg = "#33302a" },
+      ["@function"] = { fg = "#0550a0" },
+      ["@function.builtin"] = { fg = "#0550a0" },
+      ["@function.call"] = { fg = "#0550a0" },
+      ["@function.method"] = { fg = "#0550a0" },
+      ["@constructor"] = { fg = "#033d73" },
+      ["@operator"] = { fg = "#5d584f" },
+      ["@keyword"] = { fg = "#0969da" },
+      ["@keyword.conditional"] = { fg = "#0969da" },
+      ["@keyword.function"] = { fg = "#0969da" },
+      ["@keyword.operator"] = { fg = "#0969da" },
+      ["@keyword.return"] = { fg = "#0969da" },
+      ["@punctuation.bracket"] = { fg = "#5d584f" },
+      ["@punctuation.delimiter"] = { fg = "#5d584f" },
+      ["@punctuation.special"] = { fg = "#2d7fdf" },
+      ["@string"] = { fg = "#1f6feb" },
+      ["@string.escape"] = { fg = "#2d7fdf" },
+      ["@string.regexp"] = { fg = "#2d7fdf" },
+      ["@character"] = { fg = "#1f6feb" },
+      ["@boolean"] = { fg = "#218bff" },
+      ["@number"] = { fg = "#218bff" },
+      ["@comment"] = { fg = "#8a8378", italic = true },
+      ["@comment.todo"] = { fg = "#faf8f5", bg = "#0969da", bold = true },
+      ["@comment.error"] = { fg = "#0759b9", bold = true },
+      ["@comment.warning"] = { fg = "#218bff", bold = true },
+      ["@comment.note"] = { fg = "#0550a0", bold = true },
+      ["@markup.heading"] = { fg = "#0969da", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#1f6feb" },
+      ["@markup.link"] = { fg = "#0550a0", underline = true },
+      ["@tag"] = { fg = "#0969da" },
+      ["@tag.attribute"] = { fg = "#58a6ff" },
+      ["@tag.delimiter"] = { fg = "#5d584f" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#0759b9" },
+      DiagnosticWarn = { fg = "#218bff" },
+      DiagnosticInfo = { fg = "#0550a0" },
+      DiagnosticHint = { fg = "#0969da" },
+      DiagnosticUnderlineError = { sp = "#0759b9", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#218bff", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#0550a0", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#0969da", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#0759b9", bg = "#e1e8ef" },
+      DiagnosticVirtualTextWarn = { fg = "#218bff", bg = "#e4edf6" },
+      DiagnosticVirtualTextInfo = { fg = "#0550a0", bg = "#e1e7ec" },
+      DiagnosticVirtualTextHint = { fg = "#0969da", bg = "#e1e9f2" },
+      LspReferenceText = { bg = "#e6e4e0" },
+      LspReferenceRead = { bg = "#e6e4e0" },
+      LspReferenceWrite = { bg = "#dcd9d6" },
+      LspSignatureActiveParameter = { fg = "#0969da", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#1f6feb" },
+      GitSignsChange = { fg = "#218bff" },
+      GitSignsDelete = { fg = "#0759b9" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#33302a", bg = "#faf8f5" },
+      TelescopeBorder = { fg = "#dcdad7", bg = "#faf8f5" },
+      TelescopePromptTitle = { fg = "#faf8f5", bg = "#0969da", bold = true },
+      TelescopePreviewTitle = { fg = "#faf8f5", bg = "#1f6feb", bold = true },
+      TelescopeResultsTitle = { fg = "#faf8f5", bg = "#0550a0", bold = true },
+      TelescopeSelection = { bg = "#c9dbef" },
+      TelescopeMatching = { fg = "#0969da", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#0969da", bold = true },
+      CmpItemKindVariable = { fg = "#33302a" },
+      CmpItemKindFunction = { fg = "#0550a0" },
+      CmpItemKindKeyword = { fg = "#0969da" },
+      CmpItemKindClass = { fg = "#033d73" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#dcdad7" },
+      IblScope = { fg = "#8a8378" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#faf8f5", bg = "#0969da", bold = true },
+      LazyButton = { fg = "#33302a", bg = "#dcdad7" },
+      LazyButtonActive = { fg = "#faf8f5", bg = "#0969da" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#0759b9" },
+      NotifyWARNBorder = { fg = "#218bff" },
+      NotifyINFOBorder = { fg = "#0550a0" },
+      NotifyDEBUGBorder = { fg = "#8a8378" },
+      NotifyTRACEBorder = { fg = "#0969da" },
+    },
+  },
+}
@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Blood Moon
+-- Auto-generated by sync_themes.py from vscode/themes/blood_moon.json - DO NOT EDIT
+
+return {
+  name = "Blood Moon",
+  mode = "dark",
+  palette = {
+    base00 = "#090909",
+    base01 = "#121212",
+    base02 = "#1d1d1d",
+    base03 = "#6b5a5a",
+    base04 = "#aea4a4",
+    base05 = "#f5f5f5",
+    base06 = "#ffffff",
+    base07 = "#ffffff",
+    base08 = "#b6161a",
+    base09 = "#ffb8a0",
+    base0A = "#d71b1f",
+    base0B = "#ff9e9e",
+    base0C = "#df484b",
+    base0D = "#ffcccc",
+    base0E = "#d71b1f",
+    base0F = "#b0a8a6",
+  },
+  terminal = {
+    "#090909", "#b6161a", "#db3135", "#bfb9b7",
+    "#d71b1f", "#a11417", "#df484b", "#f5f5f5",
+    "#b0a8a6", "#d71b1f", "#df484b", "#f5f5f5",
+    "#dd3d40", "#c1181b", "#e35f62", "#f6f6f6",
+  },
+  groups = {
+    Normal = { fg = "#f5f5f5", bg = "#090909" },
+    NormalFloat = { fg = "#f5f5f5", bg = "#121212" },
+    NormalNC = { fg = "#f5f5f5", bg = "#090909" },
+    Cursor = { fg = "#090909", bg = "#d71b1f" },
+    CursorLine = { bg = "#141414" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#101010" },
+    LineNr = { fg = "#6b5a5a" },
+    CursorLineNr = { fg = "#f5f5f5", bold = true },
+    SignColumn = { fg = "#6b5a5a", bg = "#090909" },
+    VertSplit = { fg = "#1d1d1d" },
+    WinSeparator = { fg = "#1d1d1d" },
+    Folded = { fg = "#6b5a5a", bg = "#121212" },
+    FoldColumn = { fg = "#6b5a5a" },
+    NonText = { fg = "#6b5a5a" },
+    SpecialKey = { fg = "#6b5a5a" },
+    Whitespace = { fg = "#3a3131" },
+    MatchParen = { fg = "#d71b1f", bold = true },
+    Visual = { bg = "#460e0f" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#090909", bg = "#d71b1f" },
+    IncSearch = { fg = "#090909", bg = "#ffb8a0" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#090909", bg = "#b6161a" },
+    Pmenu = { fg = "#f5f5f5", bg = "#121212" },
+    PmenuSel = { fg = "#f5f5f5", bg = "#320c0d" },
+    PmenuSbar = { bg = "#1d1d1d" },
+    PmenuThumb = { bg = "#aea4a4" },
+    ErrorMsg = { fg = "#b6161a" },
+    WarningMsg = { fg = "#ffb8a0" },
+    ModeMsg = { fg = "#f5f5f5", bold = true },
+    MoreMsg = { fg = "#ffcccc" },
+    Question = { fg = "#ffcccc" },
+    TabLine = { fg = "#aea4a4", bg = "#121212" },
+    TabLineFill = { bg = "#090909" },
+    TabLineSel = { fg = "#f5f5f5", bg = "#090909", bold = true },
+    StatusLine = { fg = "#f5f5f5", bg = "#121212" },
+    StatusLineNC = { fg = "#aea4a4", bg = "#121212" },
+    DiffAdd = { bg = "#2d1f1f" },
+    DiffChange = { bg = "#2d231f" },
+    DiffDelete = { fg = "#b6161a", bg = "#220a0b" },
+    DiffText = { bg = "#523d36" },
+    SpellBad = { sp = "#b6161a", undercurl = true },
+    SpellCap = { sp = "#ffb8a0", undercurl = true },
+    SpellLocal = { sp = "#ffcccc", undercurl = true },
+    SpellRare = { sp = "#d71b1f", undercurl = true },
+    Comment = { fg = "#6b5a5a" },
+    Constant = { fg = "#ffb8a0" },
+    String = { fg = "#ff9e9e" },
+    Character = { fg = "#ff9e9e" },
+    Number = { fg = "#ffb8a0" },
+    Boolean = { fg = "#ffb8a0" },
+    Float = { fg = "#ffb8a0" },
+    Identifier = { fg = "#e0d0d0" },
+    Function = { fg = "#ffcccc" },
+    Statement = { fg = "#d71b1f" },
+    Conditional = { fg = "#d71b1f" },
+    Repeat = { fg = "#d71b1f" },
+    Label = { fg = "#d71b1f" },
+    Operator = { fg = "#aea4a4" },
+    Keyword = { fg = "#d71b1f" },
+    Exception = { fg = "#d71b1f" },
+    PreProc = { fg = "#d71b1f" },
+    Include = { fg = "#d71b1f" },
+    Define = { fg = "#d71b1f" },
+    Macro = { fg = "#d71b1f" },
+    PreCondit = { fg = "#d71b1f" },
+    Type = { fg = "#ff7070" },
+    StorageClass = { fg = "#d71b1f" },
+    Structure = { fg = "#ff7070" },
+    Typedef = { fg = "#ff7070" },
+    Special = { fg = "#df484b" },
+    SpecialChar = { fg = "#df484b" },
+    Tag = { fg = "#ff5555" },
+    Delimiter = { fg = "#aea4a4" },
+    SpecialComment = { fg = "#6b5a5a", italic = true },
+    Debug = { fg = "#ffb8a0" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#6b5a5a" },
+    Error = { fg = "#b6161a" },
+    Todo = { fg = "#090909", bg = "#d71b1f", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#e0d0d0" },
+      ["@variable.builtin"] = { fg = "#d71b1f" },
+      ["@variable.parameter"] = { fg = "#e0d0d0", italic = true },
+      ["@variable.member"] = { fg = "#e0d0d0" },
+      ["@constant"] = { fg = "#ffb8a0" },
+      ["@constant.builtin"] = { fg = "#ffb8a0" },
+      ["@module"] = { fg = "#f5f5f5" },
+      ["@label"] = { fg = "#d71b1f" },
+      ["@type"] = { fg = "#ff7070" },
+      ["@type.builtin"] = { fg = "#ff7070" },
+      ["@attribute"] = { fg = "#ffa0a0" },
+      ["@property"] = { fg = "#e0d0d0" },
+      ["@function"] = { fg = "#ffcccc" },
+      ["@function.builtin"] = { fg = "#ffcccc" },
+      ["@function.call"] = { fg = "#ffcccc" },
+      ["@function.method"] = { fg = "#ffcccc" },
+      ["@constructor"] = { fg = "#ff7070" },
+      ["@operator"] = { fg = "#aea4a4" },
+      ["@keyword"] = { fg = "#d71b1f" },
+      ["@keyword.conditional"] = { fg = "#d71b1f" },
+      ["@keyword.function"] = { fg = "#d71b1f" },
+      ["@keyword.operator"] = { fg = "#d71b1f" },
+      ["@keyword.return"] = { fg = "#d71b1f" },
+      ["@punctuation.bracket"] = { fg = "#aea4a4" },
+      ["@punctuation.delimiter"] = { fg = "#aea4a4" },
+      ["@punctuation.special"] = { fg = "#df484b" },
+      ["@string"] = { fg = "#ff9e9e" },
+      ["@string.escape"] = { fg = "#df484b" },
+      ["@string.regexp"] = { fg = "#df484b" },
+      ["@character"] = { fg = "#ff9e9e" },
+      ["@boolean"] = { fg = "#ffb8a0" },
+      ["@number"] = { fg = "#ffb8a0" },
+      ["@comment"] = { fg = "#6b5a5a", italic = true },
+      ["@comment.todo"] = { fg = "#090909", bg = "#d71b1f", bold = true },
+      ["@comment.error"] = { fg = "#b6161a", bold = true },
+      ["@comment.warning"] = { fg = "#ffb8a0", bold = true },
+      ["@comment.note"] = { fg = "#ffcccc", bold = true },
+      ["@markup.heading"] = { fg = "#d71b1f", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#ff9e9e" },
+      ["@markup.link"] = { fg = "#ffcccc", underline = true },
+      ["@tag"] = { fg = "#ff5555" },
+      ["@tag.attribute"] = { fg = "#ffa0a0" },
+      ["@tag.delimiter"] = { fg = "#aea4a4" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#b6161a" },
+      DiagnosticWarn = { fg = "#ffb8a0" },
+      DiagnosticInfo = { fg = "#ffcccc" },
+      DiagnosticHint = { fg = "#d71b1f" },
+      DiagnosticUnderlineError = { sp = "#b6161a", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#ffb8a0", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#ffcccc", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#d71b1f", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#b6161a", bg = "#1a0a0a" },
+      DiagnosticVirtualTextWarn = { fg = "#ffb8a0", bg = "#211a18" },
+      DiagnosticVirtualTextInfo = { fg = "#ffcccc", bg = "#211c1c" },
+      DiagnosticVirtualTextHint = { fg = "#d71b1f", bg = "#1d0a0b" },
+      LspReferenceText = { bg = "#202020" },
+      LspReferenceRead = { bg = "#202020" },
+      LspReferenceWrite = { bg = "#2c2c2c" },
+      LspSignatureActiveParameter = { fg = "#d71b1f", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#ff9e9e" },
+      GitSignsChange = { fg = "#ffb8a0" },
+      GitSignsDelete = { fg = "#b6161a" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#f5f5f5", bg = "#090909" },
+      TelescopeBorder = { fg = "#1d1d1d", bg = "#090909" },
+      TelescopePromptTitle = { fg = "#090909", bg = "#d71b1f", bold = true },
+      TelescopePreviewTitle = { fg = "#090909", bg = "#ff9e9e", bold = true },
+      TelescopeResultsTitle = { fg = "#090909", bg = "#ffcccc", bold = true },
+      TelescopeSelection = { bg = "#320c0d" },
+      TelescopeMatching = { fg = "#d71b1f", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#d71b1f", bold = true },
+      CmpItemKindVariable = { fg = "#e0d0d0" },
+      CmpItemKindFunction = { fg = "#ffcccc" },
+      CmpItemKindKeyword = { fg = "#d71b1f" },
+      CmpItemKindClass = { fg = "#ff7070" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#1d1d1d" },
+      IblScope = { fg = "#6b5a5a" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#090909", bg = "#d71b1f", bold = true },
+      LazyButton = { fg = "#f5f5f5", bg = "#1d1d1d" },
+      LazyButtonActive = { fg = "#090909", bg = "#d71b1f" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#b6161a" },
+      NotifyWARNBorder = { fg = "#ffb8a0" },
+      NotifyINFOBorder = { fg = "#ffcccc" },
+      NotifyDEBUGBorder = { fg = "#6b5a5a" },
+      NotifyTRACEBorder = { fg = "#d71b1f" },
+    },
+  },
+}
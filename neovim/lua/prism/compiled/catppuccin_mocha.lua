@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Catppuccin Mocha
+-- Auto-generated by sync_themes.py from vscode/themes/catppuccin_mocha.json - DO NOT EDIT
+
+return {
+  name = "Catppuccin Mocha",
+  mode = "dark",
+  palette = {
+    base00 = "#1e1e2e",
+    base01 = "#28283d",
+    base02 = "#343445",
+    base03 = "#6c6c7e",
+    base04 = "#9493bf",
+    base05 = "#fab387",
+    base06 = "#ffc397",
+    base07 = "#ffd3a6",
+    base08 = "#ce768e",
+    base09 = "#fab387",
+    base0A = "#f38ba8",
+    base0B = "#a6e3a1",
+    base0C = "#f5a2b9",
+    base0D = "#89b4fa",
+    base0E = "#cba6f7",
+    base0F = "#cba6f7",
+  },
+  terminal = {
+    "#1e1e2e", "#ce768e", "#f496b0", "#d5b7f8",
+    "#f38ba8", "#b6687e", "#f5a2b9", "#fab387",
+    "#cba6f7", "#f38ba8", "#f5a2b9", "#fab387",
+    "#f49cb5", "#da7d97", "#f6adc2", "#faba93",
+  },
+  groups = {
+    Normal = { fg = "#fab387", bg = "#1e1e2e" },
+    NormalFloat = { fg = "#fab387", bg = "#28283d" },
+    NormalNC = { fg = "#fab387", bg = "#1e1e2e" },
+    Cursor = { fg = "#1e1e2e", bg = "#f38ba8" },
+    CursorLine = { bg = "#292532" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#242230" },
+    LineNr = { fg = "#6c6c7e" },
+    CursorLineNr = { fg = "#fab387", bold = true },
+    SignColumn = { fg = "#6c6c7e", bg = "#1e1e2e" },
+    VertSplit = { fg = "#343445" },
+    WinSeparator = { fg = "#343445" },
+    Folded = { fg = "#6c6c7e", bg = "#28283d" },
+    FoldColumn = { fg = "#6c6c7e" },
+    NonText = { fg = "#6c6c7e" },
+    SpecialKey = { fg = "#6c6c7e" },
+    Whitespace = { fg = "#454556" },
+    MatchParen = { fg = "#f38ba8", bold = true },
+    Visual = { bg = "#5d3e52" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#1e1e2e", bg = "#f38ba8" },
+    IncSearch = { fg = "#1e1e2e", bg = "#fab387" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#1e1e2e", bg = "#ce768e" },
+    Pmenu = { fg = "#fab387", bg = "#28283d" },
+    PmenuSel = { fg = "#fab387", bg = "#483346" },
+    PmenuSbar = { bg = "#343445" },
+    PmenuThumb = { bg = "#9493bf" },
+    ErrorMsg = { fg = "#ce768e" },
+    WarningMsg = { fg = "#fab387" },
+    ModeMsg = { fg = "#fab387", bold = true },
+    MoreMsg = { fg = "#89b4fa" },
+    Question = { fg = "#89b4fa" },
+    TabLine = { fg = "#9493bf", bg = "#28283d" },
+    TabLineFill = { bg = "#1e1e2e" },
+    TabLineSel = { fg = "#fab387", bg = "#1e1e2e", bold = true },
+    StatusLine = { fg = "#fab387", bg = "#28283d" },
+    StatusLineNC = { fg = "#9493bf", bg = "#28283d" },
+    DiffAdd = { bg = "#323b3f" },
+    DiffChange = { bg = "#3f343b" },
+    DiffDelete = { fg = "#ce768e", bg = "#382b3c" },
+    DiffText = { bg = "#604a48" },
+    SpellBad = { sp = "#ce768e", undercurl = true },
+    SpellCap = { sp = "#fab387", undercurl = true },
+    SpellLocal = { sp = "#89b4fa", undercurl = true },
+    SpellRare = { sp = "#cba6f7", undercurl = true },
+    Comment = { fg = "#6c6c7e" },
+    Constant = { fg = "#fab387" },
+    String = { fg = "#a6e3a1" },
+    Character = { fg = "#a6e3a1" },
+    Number = { fg = "#fab387" },
+    Boolean = { fg = "#fab387" },
+    Float = { fg = "#fab387" },
+    Identifier = { fg = "#cdd6f4" },
+    Function = { fg = "#89b4fa" },
+    Statement = { fg = "#cba6f7" },
+    Conditional = { fg = "#cba6f7" },
+    Repeat = { fg = "#cba6f7" },
+    Label = { fg = "#cba6f7" },
+    Operator = { fg = "#9493bf" },
+    Keyword = { fg = "#cba6f7" },
+    Exception = { fg = "#cba6f7" },
+    PreProc = { fg = "#cba6f7" },
+    Include = { fg = "#cba6f7" },
+    Define = { fg = "#cba6f7" },
+    Macro = { fg = "#cba6f7" },
+    PreCondit = { fg = "#cba6f7" },
+    Type = { fg = "#f9e2af" },
+    StorageClass = { fg = "#cba6f7" },
+    Structure = { fg = "#f9e2af" },
+    Typedef = { fg = "#f9e2af" },
+    Special = { fg = "#f5a2b9" },
+    SpecialChar = { fg = "#f5a2b9" },
+    Tag = { fg = "#f38ba8" },
+    Delimiter = { fg = "#9493bf" },
+    SpecialComment = { fg = "#6c6c7e", italic = true },
+    Debug = { fg = "#fab387" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#6c6c7e" },
+    Error = { fg = "#ce768e" },
+    Todo = { fg = "#1e1e2e", bg = "#f38ba8", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#cdd6f4" },
+      ["@variable.builtin"] = { fg = "#cba6f7" },
+      ["@variable.parameter"] = { fg = "#cdd6f4", italic = true },
+      ["@variable.member"] = { fg = "#cdd6f4" },
+      ["@constant"] = { fg = "#fab387" },
+      ["@constant.builtin"] = { fg = "#fab387" },
+      ["@module"] = { fg = "#fab387" },
+      ["@label"] = { fg = "#cba6f7" },
+      ["@type"] = { fg = "#f9e2af" },
+      ["@type.builtin"] = { fg = "#f9e2af" },
+      ["@attribute"] = { fg = "#94e2d5" },
+      ["@property"] = { fg = "#cdd6f4" },
+      ["@function"] = { fg = "#89b4fa" },
+      ["@function.builtin"] = { fg = "#89b4fa" },
+      ["@function.call"] = { fg = "#89b4fa" },
+      ["@function.method"] = { fg = "#89b4fa" },
+      ["@constructor"] = { fg = "#f9e2af" },
+      ["@operator"] = { fg = "#9493bf" },
+      ["@keyword"] = { fg = "#cba6f7" },
+      ["@keyword.conditional"] = { fg = "#cba6f7" },
+      ["@keyword.function"] = { fg = "#cba6f7" },
+      ["@keyword.operator"] = { fg = "#cba6f7" },
+      ["@keyword.return"] = { fg = "#cba6f7" },
+      ["@punctuation.bracket"] = { fg = "#9493bf" },
+      ["@punctuation.delimiter"] = { fg = "#9493bf" },
+      ["@punctuation.special"] = { fg = "#f5a2b9" },
+      ["@string"] = { fg = "#a6e3a1" },
+      ["@string.escape"] = { fg = "#f5a2b9" },
+      ["@string.regexp"] = { fg = "#f5a2b9" },
+      ["@character"] = { fg = "#a6e3a1" },
+      ["@boolean"] = { fg = "#fab387" },
+      ["@number"] = { fg = "#fab387" },
+      ["@comment"] = { fg = "#6c6c7e", italic = true },
+      ["@comment.todo"] = { fg = "#1e1e2e", bg = "#f38ba8", bold = true },
+      ["@comment.error"] = { fg = "#ce768e", bold = true },
+      ["@comment.warning"] = { fg = "#fab387", bold = true },
+      ["@comment.note"] = { fg = "#89b4fa", bold = true },
+      ["@markup.heading"] = { fg = "#cba6f7", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#a6e3a1" },
+      ["@markup.link"] = { fg = "#89b4fa", underline = true },
+      ["@tag"] = { fg = "#f38ba8" },
+      ["@tag.attribute"] = { fg = "#94e2d5" },
+      ["@tag.delimiter"] = { fg = "#9493bf" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#ce768e" },
+      DiagnosticWarn = { fg = "#fab387" },
+      DiagnosticInfo = { fg = "#89b4fa" },
+      DiagnosticHint = { fg = "#f38ba8" },
+      DiagnosticUnderlineError = { sp = "#ce768e", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#fab387", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#89b4fa", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#f38ba8", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#ce768e", bg = "#2f2637" },
+      DiagnosticVirtualTextWarn = { fg = "#fab387", bg = "#342c36" },
+      DiagnosticVirtualTextInfo = { fg = "#89b4fa", bg = "#282d42" },
+      DiagnosticVirtualTextHint = { fg = "#f38ba8", bg = "#33283a" },
+      LspReferenceText = { bg = "#342c36" },
+      LspReferenceRead = { bg = "#342c36" },
+      LspReferenceWrite = { bg = "#3f343b" },
+      LspSignatureActiveParameter = { fg = "#f38ba8", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#a6e3a1" },
+      GitSignsChange = { fg = "#fab387" },
+      GitSignsDelete = { fg = "#ce768e" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#fab387", bg = "#1e1e2e" },
+      TelescopeBorder = { fg = "#343445", bg = "#1e1e2e" },
+      TelescopePromptTitle = { fg = "#1e1e2e", bg = "#f38ba8", bold = true },
+      TelescopePreviewTitle = { fg = "#1e1e2e", bg = "#a6e3a1", bold = true },
+      TelescopeResultsTitle = { fg = "#1e1e2e", bg = "#89b4fa", bold = true },
+      TelescopeSelection = { bg = "#483346" },
+      TelescopeMatching = { fg = "#f38ba8", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#f38ba8", bold = true },
+      CmpItemKindVariable = { fg = "#cdd6f4" },
+      CmpItemKindFunction = { fg = "#89b4fa" },
+      CmpItemKindKeyword = { fg = "#cba6f7" },
+      CmpItemKindClass = { fg = "#f9e2af" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#343445" },
+      IblScope = { fg = "#6c6c7e" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#1e1e2e", bg = "#f38ba8", bold = true },
+      LazyButton = { fg = "#fab387", bg = "#343445" },
+      LazyButtonActive = { fg = "#1e1e2e", bg = "#f38ba8" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#ce768e" },
+      NotifyWARNBorder = { fg = "#fab387" },
+      NotifyINFOBorder = { fg = "#89b4fa" },
+      NotifyDEBUGBorder = { fg = "#6c6c7e" },
+      NotifyTRACEBorder = { fg = "#cba6f7" },
+    },
+  },
+}
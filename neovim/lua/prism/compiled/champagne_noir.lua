@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Champagne Noir
+-- Auto-generated by sync_themes.py from vscode/themes/champagne_noir.json - DO NOT EDIT
+
+return {
+  name = "Champagne Noir",
+  mode = "dark",
+  palette = {
+    base00 = "#0a0a08",
+    base01 = "#121210",
+    base02 = "#1e1e1c",
+    base03 = "#6b6560",
+    base04 = "#ada59e",
+    base05 = "#f0ece0",
+    base06 = "#fffdf1",
+    base07 = "#fffff3",
+    base08 = "#d1c4af",
+    base09 = "#b89860",
+    base0A = "#f7e7ce",
+    base0B = "#d4c4a8",
+    base0C = "#f8ebd7",
+    base0D = "#e8d8b8",
+    base0E = "#ffffff",
+    base0F = "#5a5a55",
+  },
+  terminal = {
+    "#0a0a08", "#d1c4af", "#f7e9d2", "#7b7b77",
+    "#f7e7ce", "#b9ad9a", "#f8ebd7", "#f0ece0",
+    "#5a5a55", "#f7e7ce", "#f8ebd7", "#f0ece0",
+    "#f8ead5", "#decfb9", "#f9eedc", "#f1ede3",
+  },
+  groups = {
+    Normal = { fg = "#f0ece0", bg = "#0a0a08" },
+    NormalFloat = { fg = "#f0ece0", bg = "#121210" },
+    NormalNC = { fg = "#f0ece0", bg = "#0a0a08" },
+    Cursor = { fg = "#0a0a08", bg = "#f7e7ce" },
+    CursorLine = { bg = "#151512" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#10100e" },
+    LineNr = { fg = "#6b6560" },
+    CursorLineNr = { fg = "#f0ece0", bold = true },
+    SignColumn = { fg = "#6b6560", bg = "#0a0a08" },
+    VertSplit = { fg = "#1e1e1c" },
+    WinSeparator = { fg = "#1e1e1c" },
+    Folded = { fg = "#6b6560", bg = "#121210" },
+    FoldColumn = { fg = "#6b6560" },
+    NonText = { fg = "#6b6560" },
+    SpecialKey = { fg = "#6b6560" },
+    Whitespace = { fg = "#3a3734" },
+    MatchParen = { fg = "#f7e7ce", bold = true },
+    Visual = { bg = "#514c43" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#0a0a08", bg = "#f7e7ce" },
+    IncSearch = { fg = "#0a0a08", bg = "#b89860" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#0a0a08", bg = "#d1c4af" },
+    Pmenu = { fg = "#f0ece0", bg = "#121210" },
+    PmenuSel = { fg = "#f0ece0", bg = "#39362f" },
+    PmenuSbar = { bg = "#1e1e1c" },
+    PmenuThumb = { bg = "#ada59e" },
+    ErrorMsg = { fg = "#d1c4af" },
+    WarningMsg = { fg = "#b89860" },
+    ModeMsg = { fg = "#f0ece0", bold = true },
+    MoreMsg = { fg = "#e8d8b8" },
+    Question = { fg = "#e8d8b8" },
+    TabLine = { fg = "#ada59e", bg = "#121210" },
+    TabLineFill = { bg = "#0a0a08" },
+    TabLineSel = { fg = "#f0ece0", bg = "#0a0a08", bold = true },
+    StatusLine = { fg = "#f0ece0", bg = "#121210" },
+    StatusLineNC = { fg = "#ada59e", bg = "#121210" },
+    DiffAdd = { bg = "#282520" },
+    DiffChange = { bg = "#241f15" },
+    DiffDelete = { fg = "#d1c4af", bg = "#272521" },
+    DiffText = { bg = "#3e3422" },
+    SpellBad = { sp = "#d1c4af", undercurl = true },
+    SpellCap = { sp = "#b89860", undercurl = true },
+    SpellLocal = { sp = "#e8d8b8", undercurl = true },
+    SpellRare = { sp = "#ffffff", undercurl = true },
+    Comment = { fg = "#6b6560" },
+    Constant = { fg = "#b89860" },
+    String = { fg = "#d4c4a8" },
+    Character = { fg = "#d4c4a8" },
+    Number = { fg = "#b89860" },
+    Boolean = { fg = "#b89860" },
+    Float = { fg = "#b89860" },
+    Identifier = { fg = "#f0e8e0" },
+    Function = { fg = "#e8d8b8" },
+    Statement = { fg = "#ffffff" },
+    Conditional = { fg = "#ffffff" },
+    Repeat = { fg = "#ffffff" },
+    Label = { fg = "#ffffff" },
+    Operator = { fg = "#ada59e" },
+    Keyword = { fg = "#ffffff" },
+    Exception = { fg = "#ffffff" },
+    PreProc = { fg = "#ffffff" },
+    Include = { fg = "#ffffff" },
+    Define = { fg = "#ffffff" },
+    Macro = { fg = "#ffffff" },
+    PreCondit = { fg = "#ffffff" },
+    Type = { fg = "#a8a090" },
+    StorageClass = { fg = "#ffffff" },
+    Structure = { fg = "#a8a090" },
+    Typedef = { fg = "#a8a090" },
+    Special = { fg = "#f8ebd7" },
+    SpecialChar = { fg = "#f8ebd7" },
+    Tag = { fg = "#f7e7ce" },
+    Delimiter = { fg = "#ada59e" },
+    SpecialComment = { fg = "#6b6560", italic = true },
+    Debug = { fg = "#b89860" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#6b6560" },
+    Error = { fg = "#d1c4af" },
+    Todo = { fg = "#0a0a08", bg = "#f7e7ce", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#f0e8e0" },
+      ["@variable.builtin"] = { fg = "#ffffff" },
+      ["@variable.parameter"] = { fg = "#f0e8e0", italic = true },
+      ["@variable.member"] = { fg = "#f0e8e0" },
+      ["@constant"] = { fg = "#b89860" },
+      ["@constant.builtin"] = { fg = "#b89860" },
+      ["@module"] = { fg = "#f0ece0" },
+      ["@label"] = { fg = "#ffffff" },
+      ["@type"] = { fg = "#a8a090" },
+      ["@type.builtin"] = { fg = "#a8a090" },
+      ["@attribute"] = { fg = "#c0a880" },
+      ["@property"] = { fg = "#f0e8e0" },
+      ["@function"] = { fg = "#e8d8b8" },
+      ["@function.builtin"] = { fg = "#e8d8b8" },
+      ["@function.call"] = { fg = "#e8d8b8" },
+      ["@function.method"] = { fg = "#e8d8b8" },
+      ["@constructor"] = { fg = "#a8a090" },
+      ["@operator"] = { fg = "#ada59e" },
+      ["@keyword"] = { fg = "#ffffff" },
+      ["@keyword.conditional"] = { fg = "#ffffff" },
+      ["@keyword.function"] = { fg = "#ffffff" },
+      ["@keyword.operator"] = { fg = "#ffffff" },
+      ["@keyword.return"] = { fg = "#ffffff" },
+      ["@punctuation.bracket"] = { fg = "#ada59e" },
+      ["@punctuation.delimiter"] = { fg = "#ada59e" },
+      ["@punctuation.special"] = { fg = "#f8ebd7" },
+      ["@string"] = { fg = "#d4c4a8" },
+      ["@string.escape"] = { fg = "#f8ebd7" },
+      ["@string.regexp"] = { fg = "#f8ebd7" },
+      ["@character"] = { fg = "#d4c4a8" },
+      ["@boolean"] = { fg = "#b89860" },
+      ["@number"] = { fg = "#b89860" },
+      ["@comment"] = { fg = "#6b6560", italic = true },
+      ["@comment.todo"] = { fg = "#0a0a08", bg = "#f7e7ce", bold = true },
+      ["@comment.error"] = { fg = "#d1c4af", bold = true },
+      ["@comment.warning"] = { fg = "#b89860", bold = true },
+      ["@comment.note"] = { fg = "#e8d8b8", bold = true },
+      ["@markup.heading"] = { fg = "#ffffff", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#d4c4a8" },
+      ["@markup.link"] = { fg = "#e8d8b8", underline = true },
+      ["@tag"] = { fg = "#f7e7ce" },
+      ["@tag.attribute"] = { fg = "#c0a880" },
+      ["@tag.delimiter"] = { fg = "#ada59e" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#d1c4af" },
+      DiagnosticWarn = { fg = "#b89860" },
+      DiagnosticInfo = { fg = "#e8d8b8" },
+      DiagnosticHint = { fg = "#f7e7ce" },
+      DiagnosticUnderlineError = { sp = "#d1c4af", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#b89860", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#e8d8b8", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#f7e7ce", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#d1c4af", bg = "#1d1c18" },
+      DiagnosticVirtualTextWarn = { fg = "#b89860", bg = "#1b1810" },
+      DiagnosticVirtualTextInfo = { fg = "#e8d8b8", bg = "#201e19" },
+      DiagnosticVirtualTextHint = { fg = "#f7e7ce", bg = "#21201b" },
+      LspReferenceText = { bg = "#21201d" },
+      LspReferenceRead = { bg = "#21201d" },
+      LspReferenceWrite = { bg = "#2c2b28" },
+      LspSignatureActiveParameter = { fg = "#f7e7ce", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#d4c4a8" },
+      GitSignsChange = { fg = "#b89860" },
+      GitSignsDelete = { fg = "#d1c4af" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#f0ece0", bg = "#0a0a08" },
+      TelescopeBorder = { fg = "#1e1e1c", bg = "#0a0a08" },
+      TelescopePromptTitle = { fg = "#0a0a08", bg = "#f7e7ce", bold = true },
+      TelescopePreviewTitle = { fg = "#0a0a08", bg = "#d4c4a8", bold = true },
+      TelescopeResultsTitle = { fg = "#0a0a08", bg = "#e8d8b8", bold = true },
+      TelescopeSelection = { bg = "#39362f" },
+      TelescopeMatching = { fg = "#f7e7ce", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#f7e7ce", bold = true },
+      CmpItemKindVariable = { fg = "#f0e8e0" },
+      CmpItemKindFunction = { fg = "#e8d8b8" },
+      CmpItemKindKeyword = { fg = "#ffffff" },
+      CmpItemKindClass = { fg = "#a8a090" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#1e1e1c" },
+      IblScope = { fg = "#6b6560" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#0a0a08", bg = "#f7e7ce", bold = true },
+      LazyButton = { fg = "#f0ece0", bg = "#1e1e1c" },
+      LazyButtonActive = { fg = "#0a0a08", bg = "#f7e7ce" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#d1c4af" },
+      NotifyWARNBorder = { fg = "#b89860" },
+      NotifyINFOBorder = { fg = "#e8d8b8" },
+      NotifyDEBUGBorder = { fg = "#6b6560" },
+      NotifyTRACEBorder = { fg = "#ffffff" },
+    },
+  },
+}
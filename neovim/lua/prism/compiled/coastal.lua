@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Coastal
+-- Auto-generated by sync_themes.py from vscode/themes/coastal.json - DO NOT EDIT
+
+return {
+  name = "Coastal",
+  mode = "dark",
+  palette = {
+    base00 = "#001219",
+    base01 = "#051e26",
+    base02 = "#11272f",
+    base03 = "#8aa8a8",
+    base04 = "#97c7c7",
+    base05 = "#e9d8a6",
+    base06 = "#fae8b6",
+    base07 = "#fff9c6",
+    base08 = "#087c7f",
+    base09 = "#CA6702",
+    base0A = "#0A9396",
+    base0B = "#E9D8A6",
+    base0C = "#3ba8ab",
+    base0D = "#EE9B00",
+    base0E = "#0A9396",
+    base0F = "#005F73",
+  },
+  terminal = {
+    "#001219", "#087c7f", "#229da0", "#337f8f",
+    "#0A9396", "#076e70", "#3ba8ab", "#E9D8A6",
+    "#005F73", "#0A9396", "#3ba8ab", "#E9D8A6",
+    "#2ea3a5", "#098487", "#53b3b5", "#ebdbae",
+  },
+  groups = {
+    Normal = { fg = "#e9d8a6", bg = "#001219" },
+    NormalFloat = { fg = "#e9d8a6", bg = "#051e26" },
+    NormalNC = { fg = "#e9d8a6", bg = "#001219" },
+    Cursor = { fg = "#001219", bg = "#0A9396" },
+    CursorLine = { bg = "#0b1b20" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#06171d" },
+    LineNr = { fg = "#8aa8a8" },
+    CursorLineNr = { fg = "#e9d8a6", bold = true },
+    SignColumn = { fg = "#8aa8a8", bg = "#001219" },
+    VertSplit = { fg = "#11272f" },
+    WinSeparator = { fg = "#11272f" },
+    Folded = { fg = "#8aa8a8", bg = "#051e26" },
+    FoldColumn = { fg = "#8aa8a8" },
+    NonText = { fg = "#8aa8a8" },
+    SpecialKey = { fg = "#8aa8a8" },
+    Whitespace = { fg = "#455d60" },
+    MatchParen = { fg = "#0A9396", bold = true },
+    Visual = { bg = "#03383e" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#001219", bg = "#0A9396" },
+    IncSearch = { fg = "#001219", bg = "#CA6702" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#001219", bg = "#087c7f" },
+    Pmenu = { fg = "#e9d8a6", bg = "#051e26" },
+    PmenuSel = { fg = "#e9d8a6", bg = "#022b32" },
+    PmenuSbar = { bg = "#11272f" },
+    PmenuThumb = { bg = "#97c7c7" },
+    ErrorMsg = { fg = "#087c7f" },
+    WarningMsg = { fg = "#CA6702" },
+    ModeMsg = { fg = "#e9d8a6", bold = true },
+    MoreMsg = { fg = "#EE9B00" },
+    Question = { fg = "#EE9B00" },
+    TabLine = { fg = "#97c7c7", bg = "#051e26" },
+    TabLineFill = { bg = "#001219" },
+    TabLineSel = { fg = "#e9d8a6", bg = "#001219", bold = true },
+    StatusLine = { fg = "#e9d8a6", bg = "#051e26" },
+    StatusLineNC = { fg = "#97c7c7", bg = "#051e26" },
+    DiffAdd = { bg = "#222f2e" },
+    DiffChange = { bg = "#1e1e15" },
+    DiffDelete = { fg = "#087c7f", bg = "#012128" },
+    DiffText = { bg = "#3c2b12" },
+    SpellBad = { sp = "#087c7f", undercurl = true },
+    SpellCap = { sp = "#CA6702", undercurl = true },
+    SpellLocal = { sp = "#EE9B00", undercurl = true },
+    SpellRare = { sp = "#0A9396", undercurl = true },
+    Comment = { fg = "#8aa8a8" },
+    Constant = { fg = "#CA6702" },
+    String = { fg = "#E9D8A6" },
+    Character = { fg = "#E9D8A6" },
+    Number = { fg = "#CA6702" },
+    Boolean = { fg = "#CA6702" },
+    Float = { fg = "#CA6702" },
+    Identifier = { fg = "#e0e8e8" },
+    Function = { fg = "#EE9B00" },
+    Statement = { fg = "#0A9396" },
+    Conditional = { fg = "#0A9396" },
+    Repeat = { fg = "#0A9396" },
+    Label = { fg = "#0A9396" },
+    Operator = { fg = "#97c7c7" },
+    Keyword = { fg = "#0A9396" },
+    Exception = { fg = "#0A9396" },
+    PreProc = { fg = "#0A9396" },
+    Include = { fg = "#0A9396" },
+    Define = { fg = "#0A9396" },
+    Macro = { fg = "#0A9396" },
+    PreCondit = { fg = "#0A9396" },
+    Type = { fg = "#E9D8A6" },
+    StorageClass = { fg = "#0A9396" },
+    Structure = { fg = "#E9D8A6" },
+    Typedef = { fg = "#E9D8A6" },
+    Special = { fg = "#3ba8ab" },
+    SpecialChar = { fg = "#3ba8ab" },
+    Tag = { fg = "#94D2BD" },
+    Delimiter = { fg = "#97c7c7" },
+    SpecialComment = { fg = "#8aa8a8", italic = true },
+    Debug = { fg = "#CA6702" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#8aa8a8" },
+    Error = { fg = "#087c7f" },
+    Todo = { fg = "#001219", bg = "#0A9396", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#e0e8e8" },
+      ["@variable.builtin"] = { fg = "#0A9396" },
+      ["@variable.parameter"] = { fg = "#e0e8e8", italic = true },
+      ["@variable.member"] = { fg = "#e0e8e8" },
+      ["@constant"] = { fg = "#CA6702" },
+      ["@constant.builtin"] = { fg = "#CA6702" },
+      ["@module"] = { fg = "#e9d8a6" },
+      ["@label"] = { fg = "#0A9396" },
+      ["@type"] = { fg = "#E9D8A6" },
+      ["@type.builtin"] = { fg = "#E9D8A6" },
+      ["@attribute"] = { fg = "#EE9B00" },
+      ["@property"] = { fg = "#e0e8e8" },
+      ["@function"] = { fg = "#EE9B00" },
+      ["@function.builtin"] = { fg = "#EE9B00" },
+      ["@function.call"] = { fg = "#EE9B00" },
+      ["@function.method"] = { fg = "#EE9B00" },
+      ["@constructor"] = { fg = "#E9D8A6" },
+      ["@operator"] = { fg = "#97c7c7" },
+      ["@keyword"] = { fg = "#0A9396" },
+      ["@keyword.conditional"] = { fg = "#0A9396" },
+      ["@keyword.function"] = { fg = "#0A9396" },
+      ["@keyword.operator"] = { fg = "#0A9396" },
+      ["@keyword.return"] = { fg = "#0A9396" },
+      ["@punctuation.bracket"] = { fg = "#97c7c7" },
+      ["@punctuation.delimiter"] = { fg = "#97c7c7" },
+      ["@punctuation.special"] = { fg = "#3ba8ab" },
+      ["@string"] = { fg = "#E9D8A6" },
+      ["@string.escape"] = { fg = "#3ba8ab" },
+      ["@string.regexp"] = { fg = "#3ba8ab" },
+      ["@character"] = { fg = "#E9D8A6" },
+      ["@boolean"] = { fg = "#CA6702" },
+      ["@number"] = { fg = "#CA6702" },
+      ["@comment"] = { fg = "#8aa8a8", italic = true },
+      ["@comment.todo"] = { fg = "#001219", bg = "#0A9396", bold = true },
+      ["@comment.error"] = { fg = "#087c7f", bold = true },
+      ["@comment.warning"] = { fg = "#CA6702", bold = true },
+      ["@comment.note"] = { fg = "#EE9B00", bold = true },
+      ["@markup.heading"] = { fg = "#0A9396", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#E9D8A6" },
+      ["@markup.link"] = { fg = "#EE9B00", underline = true },
+      ["@tag"] = { fg = "#94D2BD" },
+      ["@tag.attribute"] = { fg = "#EE9B00" },
+      ["@tag.delimiter"] = { fg = "#97c7c7" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#087c7f" },
+      DiagnosticWarn = { fg = "#CA6702" },
+      DiagnosticInfo = { fg = "#EE9B00" },
+      DiagnosticHint = { fg = "#0A9396" },
+      DiagnosticUnderlineError = { sp = "#087c7f", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#CA6702", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#EE9B00", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#0A9396", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#087c7f", bg = "#001c23" },
+      DiagnosticVirtualTextWarn = { fg = "#CA6702", bg = "#141a16" },
+      DiagnosticVirtualTextInfo = { fg = "#EE9B00", bg = "#171f16" },
+      DiagnosticVirtualTextHint = { fg = "#0A9396", bg = "#011e25" },
+      LspReferenceText = { bg = "#172527" },
+      LspReferenceRead = { bg = "#172527" },
+      LspReferenceWrite = { bg = "#222f2e" },
+      LspSignatureActiveParameter = { fg = "#0A9396", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#E9D8A6" },
+      GitSignsChange = { fg = "#CA6702" },
+      GitSignsDelete = { fg = "#087c7f" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#e9d8a6", bg = "#001219" },
+      TelescopeBorder = { fg = "#11272f", bg = "#001219" },
+      TelescopePromptTitle = { fg = "#001219", bg = "#0A9396", bold = true },
+      TelescopePreviewTitle = { fg = "#001219", bg = "#E9D8A6", bold = true },
+      TelescopeResultsTitle = { fg = "#001219", bg = "#EE9B00", bold = true },
+      TelescopeSelection = { bg = "#022b32" },
+      TelescopeMatching = { fg = "#0A9396", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#0A9396", bold = true },
+      CmpItemKindVariable = { fg = "#e0e8e8" },
+      CmpItemKindFunction = { fg = "#EE9B00" },
+      CmpItemKindKeyword = { fg = "#0A9396" },
+      CmpItemKindClass = { fg = "#E9D8A6" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#11272f" },
+      IblScope = { fg = "#8aa8a8" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#001219", bg = "#0A9396", bold = true },
+      LazyButton = { fg = "#e9d8a6", bg = "#11272f" },
+      LazyButtonActive = { fg = "#001219", bg = "#0A9396" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#087c7f" },
+      NotifyWARNBorder = { fg = "#CA6702" },
+      NotifyINFOBorder = { fg = "#EE9B00" },
+      NotifyDEBUGBorder = { fg = "#8aa8a8" },
+      NotifyTRACEBorder = { fg = "#0A9396" },
+    },
+  },
+}
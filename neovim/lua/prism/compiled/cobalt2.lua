@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Cobalt2
+-- Auto-generated by sync_themes.py from vscode/themes/cobalt2.json - DO NOT EDIT
+
+return {
+  name = "Cobalt2",
+  mode = "dark",
+  palette = {
+    base00 = "#193549",
+    base01 = "#1f4462",
+    base02 = "#314d62",
+    base03 = "#6888b8",
+    base04 = "#85b4fc",
+    base05 = "#80ffbb",
+    base06 = "#91ffcb",
+    base07 = "#a0ffd8",
+    base08 = "#d88500",
+    base09 = "#ff80e1",
+    base0A = "#ff9d00",
+    base0B = "#3ad900",
+    base0C = "#ffb033",
+    base0D = "#ffc600",
+    base0E = "#ff9d00",
+    base0F = "#ffc600",
+  },
+  terminal = {
+    "#193549", "#d88500", "#ffa619", "#ffd133",
+    "#ff9d00", "#bf7500", "#ffb033", "#80ffbb",
+    "#ffc600", "#ff9d00", "#ffb033", "#80ffbb",
+    "#ffab26", "#e58d00", "#ffba4c", "#8cffc1",
+  },
+  groups = {
+    Normal = { fg = "#80ffbb", bg = "#193549" },
+    NormalFloat = { fg = "#80ffbb", bg = "#1f4462" },
+    NormalNC = { fg = "#80ffbb", bg = "#193549" },
+    Cursor = { fg = "#193549", bg = "#ff9d00" },
+    CursorLine = { bg = "#1e3f4e" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#1c3b4c" },
+    LineNr = { fg = "#6888b8" },
+    CursorLineNr = { fg = "#80ffbb", bold = true },
+    SignColumn = { fg = "#6888b8", bg = "#193549" },
+    VertSplit = { fg = "#314d62" },
+    WinSeparator = { fg = "#314d62" },
+    Folded = { fg = "#6888b8", bg = "#1f4462" },
+    FoldColumn = { fg = "#6888b8" },
+    NonText = { fg = "#6888b8" },
+    SpecialKey = { fg = "#6888b8" },
+    Whitespace = { fg = "#405e80" },
+    MatchParen = { fg = "#ff9d00", bold = true },
+    Visual = { bg = "#5e5433" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#193549", bg = "#ff9d00" },
+    IncSearch = { fg = "#193549", bg = "#ff80e1" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#193549", bg = "#d88500" },
+    Pmenu = { fg = "#80ffbb", bg = "#1f4462" },
+    PmenuSel = { fg = "#80ffbb", bg = "#47493a" },
+    PmenuSbar = { bg = "#314d62" },
+    PmenuThumb = { bg = "#85b4fc" },
+    ErrorMsg = { fg = "#d88500" },
+    WarningMsg = { fg = "#ff80e1" },
+    ModeMsg = { fg = "#80ffbb", bold = true },
+    MoreMsg = { fg = "#ffc600" },
+    Question = { fg = "#ffc600" },
+    TabLine = { fg = "#85b4fc", bg = "#1f4462" },
+    TabLineFill = { bg = "#193549" },
+    TabLineSel = { fg = "#80ffbb", bg = "#193549", bold = true },
+    StatusLine = { fg = "#80ffbb", bg = "#1f4462" },
+    StatusLineNC = { fg = "#85b4fc", bg = "#1f4462" },
+    DiffAdd = { bg = "#1d4d3e" },
+    DiffChange = { bg = "#3b405f" },
+    DiffDelete = { fg = "#d88500", bg = "#35413e" },
+    DiffText = { bg = "#5e4b76" },
+    SpellBad = { sp = "#d88500", undercurl = true },
+    SpellCap = { sp = "#ff80e1", undercurl = true },
+    SpellLocal = { sp = "#ffc600", undercurl = true },
+    SpellRare = { sp = "#ff9d00", undercurl = true },
+    Comment = { fg = "#6888b8" },
+    Constant = { fg = "#ff80e1" },
+    String = { fg = "#3ad900" },
+    Character = { fg = "#3ad900" },
+    Number = { fg = "#ff80e1" },
+    Boolean = { fg = "#ff80e1" },
+    Float = { fg = "#ff80e1" },
+    Identifier = { fg = "#0088ff" },
+    Function = { fg = "#ffc600" },
+    Statement = { fg = "#ff9d00" },
+    Conditional = { fg = "#ff9d00" },
+    Repeat = { fg = "#ff9d00" },
+    Label = { fg = "#ff9d00" },
+    Operator = { fg = "#85b4fc" },
+    Keyword = { fg = "#ff9d00" },
+    Exception = { fg = "#ff9d00" },
+    PreProc = { fg = "#ff9d00" },
+    Include = { fg = "#ff9d00" },
+    Define = { fg = "#ff9d00" },
+    Macro = { fg = "#ff9d00" },
+    PreCondit = { fg = "#ff9d00" },
+    Type = { fg = "#80ffbb" },
+    StorageClass = { fg = "#ff9d00" },
+    Structure = { fg = "#80ffbb" },
+    Typedef = { fg = "#80ffbb" },
+    Special = { fg = "#ffb033" },
+    SpecialChar = { fg = "#ffb033" },
+    Tag = { fg = "#0088ff" },
+    Delimiter = { fg = "#85b4fc" },
+    SpecialComment = { fg = "#6888b8", italic = true },
+    Debug = { fg = "#ff80e1" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#6888b8" },
+    Error = { fg = "#d88500" },
+    Todo = { fg = "#193549", bg = "#ff9d00", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#0088ff" },
+      ["@variable.builtin"] = { fg = "#ff9d00" },
+      ["@variable.parameter"] = { fg = "#0088ff", italic = true },
+      ["@variable.member"] = { fg = "#0088ff" },
+      ["@constant"] = { fg = "#ff80e1" },
+      ["@constant.builtin"] = { fg = "#ff80e1" },
+      ["@module"] = { fg = "#80ffbb" },
+      ["@label"] = { fg = "#ff9d00" },
+      ["@type"] = { fg = "#80ffbb" },
+      ["@type.builtin"] = { fg = "#80ffbb" },
+      ["@attribute"] = { fg = "#9effff" },
+      ["@property"] = { fg = "#0088ff" },
+      ["@function"] = { fg = "#ffc600" },
+      ["@function.builtin"] = { fg = "#ffc600" },
+      ["@function.call"] = { fg = "#ffc600" },
+      ["@function.method"] = { fg = "#ffc600" },
+      ["@constructor"] = { fg = "#80ffbb" },
+      ["@operator"] = { fg = "#85b4fc" },
+      ["@keyword"] = { fg = "#ff9d00" },
+      ["@keyword.conditional"] = { fg = "#ff9d00" },
+      ["@keyword.function"] = { fg = "#ff9d00" },
+      ["@keyword.operator"] = { fg = "#ff9d00" },
+      ["@keyword.return"] = { fg = "#ff9d00" },
+      ["@punctuation.bracket"] = { fg = "#85b4fc" },
+      ["@punctuation.delimiter"] = { fg = "#85b4fc" },
+      ["@punctuation.special"] = { fg = "#ffb033" },
+      ["@string"] = { fg = "#3ad900" },
+      ["@string.escape"] = { fg = "#ffb033" },
+      ["@string.regexp"] = { fg = "#ffb033" },
+      ["@character"] = { fg = "#3ad900" },
+      ["@boolean"] = { fg = "#ff80e1" },
+      ["@number"] = { fg = "#ff80e1" },
+      ["@comment"] = { fg = "#6888b8", italic = true },
+      ["@comment.todo"] = { fg = "#193549", bg = "#ff9d00", bold = true },
+      ["@comment.error"] = { fg = "#d88500", bold = true },
+      ["@comment.warning"] = { fg = "#ff80e1", bold = true },
+      ["@comment.note"] = { fg = "#ffc600", bold = true },
+      ["@markup.heading"] = { fg = "#ff9d00", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#3ad900" },
+      ["@markup.link"] = { fg = "#ffc600", underline = true },
+      ["@tag"] = { fg = "#0088ff" },
+      ["@tag.attribute"] = { fg = "#9effff" },
+      ["@tag.delimiter"] = { fg = "#85b4fc" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#d88500" },
+      DiagnosticWarn = { fg = "#ff80e1" },
+      DiagnosticInfo = { fg = "#ffc600" },
+      DiagnosticHint = { fg = "#ff9d00" },
+      DiagnosticUnderlineError = { sp = "#d88500", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#ff80e1", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#ffc600", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#ff9d00", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#d88500", bg = "#2c3d41" },
+      DiagnosticVirtualTextWarn = { fg = "#ff80e1", bg = "#303c58" },
+      DiagnosticVirtualTextInfo = { fg = "#ffc600", bg = "#304341" },
+      DiagnosticVirtualTextHint = { fg = "#ff9d00", bg = "#303f41" },
+      LspReferenceText = { bg = "#234954" },
+      LspReferenceRead = { bg = "#234954" },
+      LspReferenceWrite = { bg = "#28535a" },
+      LspSignatureActiveParameter = { fg = "#ff9d00", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#3ad900" },
+      GitSignsChange = { fg = "#ff80e1" },
+      GitSignsDelete = { fg = "#d88500" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#80ffbb", bg = "#193549" },
+      TelescopeBorder = { fg = "#314d62", bg = "#193549" },
+      TelescopePromptTitle = { fg = "#193549", bg = "#ff9d00", bold = true },
+      TelescopePreviewTitle = { fg = "#193549", bg = "#3ad900", bold = true },
+      TelescopeResultsTitle = { fg = "#193549", bg = "#ffc600", bold = true },
+      TelescopeSelection = { bg = "#47493a" },
+      TelescopeMatching = { fg = "#ff9d00", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#ff9d00", bold = true },
+      CmpItemKindVariable = { fg = "#0088ff" },
+      CmpItemKindFunction = { fg = "#ffc600" },
+      CmpItemKindKeyword = { fg = "#ff9d00" },
+      CmpItemKindClass = { fg = "#80ffbb" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#314d62" },
+      IblScope = { fg = "#6888b8" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#193549", bg = "#ff9d00", bold = true },
+      LazyButton = { fg = "#80ffbb", bg = "#314d62" },
+      LazyButtonActive = { fg = "#193549", bg = "#ff9d00" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#d88500" },
+      NotifyWARNBorder = { fg = "#ff80e1" },
+      NotifyINFOBorder = { fg = "#ffc600" },
+      NotifyDEBUGBorder = { fg = "#6888b8" },
+      NotifyTRACEBorder = { fg = "#ff9d00" },
+    },
+  },
+}
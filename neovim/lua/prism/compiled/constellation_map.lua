@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Constellation Map
+-- Auto-generated by sync_themes.py from vscode/themes/constellation_map.json - DO NOT EDIT
+
+return {
+  name = "Constellation Map",
+  mode = "dark",
+  palette = {
+    base00 = "#050608",
+    base01 = "#0a0c10",
+    base02 = "#17191c",
+    base03 = "#485060",
+    base04 = "#949cac",
+    base05 = "#e8f0ff",
+    base06 = "#f7ffff",
+    base07 = "#f7ffff",
+    base08 = "#d8b600",
+    base09 = "#b48ead",
+    base0A = "#ffd700",
+    base0B = "#88c0d0",
+    base0C = "#ffdf33",
+    base0D = "#88c0d0",
+    base0E = "#ffd700",
+    base0F = "#485060",
+  },
+  terminal = {
+    "#050608", "#d8b600", "#ffdb19", "#6c737f",
+    "#ffd700", "#bfa100", "#ffdf33", "#e8f0ff",
+    "#485060", "#ffd700", "#ffdf33", "#e8f0ff",
+    "#ffdd26", "#e5c100", "#ffe34c", "#eaf1ff",
+  },
+  groups = {
+    Normal = { fg = "#e8f0ff", bg = "#050608" },
+    NormalFloat = { fg = "#e8f0ff", bg = "#0a0c10" },
+    NormalNC = { fg = "#e8f0ff", bg = "#050608" },
+    Cursor = { fg = "#050608", bg = "#ffd700" },
+    CursorLine = { bg = "#101114" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#0b0d0f" },
+    LineNr = { fg = "#485060" },
+    CursorLineNr = { fg = "#e8f0ff", bold = true },
+    SignColumn = { fg = "#485060", bg = "#050608" },
+    VertSplit = { fg = "#17191c" },
+    WinSeparator = { fg = "#17191c" },
+    Folded = { fg = "#485060", bg = "#0a0c10" },
+    FoldColumn = { fg = "#485060" },
+    NonText = { fg = "#485060" },
+    SpecialKey = { fg = "#485060" },
+    Whitespace = { fg = "#262b34" },
+    MatchParen = { fg = "#ffd700", bold = true },
+    Visual = { bg = "#504405" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#050608", bg = "#ffd700" },
+    IncSearch = { fg = "#050608", bg = "#b48ead" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#050608", bg = "#d8b600" },
+    Pmenu = { fg = "#e8f0ff", bg = "#0a0c10" },
+    PmenuSel = { fg = "#e8f0ff", bg = "#372f06" },
+    PmenuSbar = { bg = "#17191c" },
+    PmenuThumb = { bg = "#949cac" },
+    ErrorMsg = { fg = "#d8b600" },
+    WarningMsg = { fg = "#b48ead" },
+    ModeMsg = { fg = "#e8f0ff", bold = true },
+    MoreMsg = { fg = "#88c0d0" },
+    Question = { fg = "#88c0d0" },
+    TabLine = { fg = "#949cac", bg = "#0a0c10" },
+    TabLineFill = { bg = "#050608" },
+    TabLineSel = { fg = "#e8f0ff", bg = "#050608", bold = true },
+    StatusLine = { fg = "#e8f0ff", bg = "#0a0c10" },
+    StatusLineNC = { fg = "#949cac", bg = "#0a0c10" },
+    DiffAdd = { bg = "#182126" },
+    DiffChange = { bg = "#1f1a20" },
+    DiffDelete = { fg = "#d8b600", bg = "#242006" },
+    DiffText = { bg = "#392e39" },
+    SpellBad = { sp = "#d8b600", undercurl = true },
+    SpellCap = { sp = "#b48ead", undercurl = true },
+    SpellLocal = { sp = "#88c0d0", undercurl = true },
+    SpellRare = { sp = "#ffd700", undercurl = true },
+    Comment = { fg = "#485060" },
+    Constant = { fg = "#b48ead" },
+    String = { fg = "#88c0d0" },
+    Character = { fg = "#88c0d0" },
+    Number = { fg = "#b48ead" },
+    Boolean = { fg = "#b48ead" },
+    Float = { fg = "#b48ead" },
+    Identifier = { fg = "#e8f0ff" },
+    Function = { fg = "#88c0d0" },
+    Statement = { fg = "#ffd700" },
+    Conditional = { fg = "#ffd700" },
+    Repeat = { fg = "#ffd700" },
+    Label = { fg = "#ffd700" },
+    Operator = { fg = "#949cac" },
+    Keyword = { fg = "#ffd700" },
+    Exception = { fg = "#ffd700" },
+    PreProc = { fg = "#ffd700" },
+    Include = { fg = "#ffd700" },
+    Define = { fg = "#ffd700" },
+    Macro = { fg = "#ffd700" },
+    PreCondit = { fg = "#ffd700" },
+    Type = { fg = "#b48ead" },
+    StorageClass = { fg = "#ffd700" },
+    Structure = { fg = "#b48ead" },
+    Typedef = { fg = "#b48ead" },
+    Special = { fg = "#ffdf33" },
+    SpecialChar = { fg = "#ffdf33" },
+    Tag = { fg = "#81a1c1" },
+    Delimiter = { fg = "#949cac" },
+    SpecialComment = { fg = "#485060", italic = true },
+    Debug = { fg = "#b48ead" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#485060" },
+    Error = { fg = "#d8b600" },
+    Todo = { fg = "#050608", bg = "#ffd700", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#e8f0ff" },
+      ["@variable.builtin"] = { fg = "#ffd700" },
+      ["@variable.parameter"] = { fg = "#e8f0ff", italic = true },
+      ["@variable.member"] = { fg = "#e8f0ff" },
+      ["@constant"] = { fg = "#b48ead" },
+      ["@constant.builtin"] = { fg = "#b48ead" },
+      ["@module"] = { fg = "#e8f0ff" },
+      ["@label"] = { fg = "#ffd700" },
+      ["@type"] = { fg = "#b48ead" },
+      ["@type.builtin"] = { fg = "#b48ead" },
+      ["@attribute"] = { fg = "#a3be8c" },
+      ["@property"] = { fg = "#e8f0ff" },
+      ["@function"] = { fg = "#88c0d0" },
+      ["@function.builtin"] = { fg = "#88c0d0" },
+      ["@function.call"] = { fg = "#88c0d0" },
+      ["@function.method"] = { fg = "#88c0d0" },
+      ["@constructor"] = { fg = "#b48ead" },
+      ["@operator"] = { fg = "#949cac" },
+      ["@keyword"] = { fg = "#ffd700" },
+      ["@keyword.conditional"] = { fg = "#ffd700" },
+      ["@keyword.function"] = { fg = "#ffd700" },
+      ["@keyword.operator"] = { fg = "#ffd700" },
+      ["@keyword.return"] = { fg = "#ffd700" },
+      ["@punctuation.bracket"] = { fg = "#949cac" },
+      ["@punctuation.delimiter"] = { fg = "#949cac" },
+      ["@punctuation.special"] = { fg = "#ffdf33" },
+      ["@string"] = { fg = "#88c0d0" },
+      ["@string.escape"] = { fg = "#ffdf33" },
+      ["@string.regexp"] = { fg = "#ffdf33" },
+      ["@character"] = { fg = "#88c0d0" },
+      ["@boolean"] = { fg = "#b48ead" },
+      ["@number"] = { fg = "#b48ead" },
+      ["@comment"] = { fg = "#485060", italic = true },
+      ["@comment.todo"] = { fg = "#050608", bg = "#ffd700", bold = true },
+      ["@comment.error"] = { fg = "#d8b600", bold = true },
+      ["@comment.warning"] = { fg = "#b48ead", bold = true },
+      ["@comment.note"] = { fg = "#88c0d0", bold = true },
+      ["@markup.heading"] = { fg = "#ffd700", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#88c0d0" },
+      ["@markup.link"] = { fg = "#88c0d0", underline = true },
+      ["@tag"] = { fg = "#81a1c1" },
+      ["@tag.attribute"] = { fg = "#a3be8c" },
+      ["@tag.delimiter"] = { fg = "#949cac" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#d8b600" },
+      DiagnosticWarn = { fg = "#b48ead" },
+      DiagnosticInfo = { fg = "#88c0d0" },
+      DiagnosticHint = { fg = "#ffd700" },
+      DiagnosticUnderlineError = { sp = "#d8b600", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#b48ead", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#88c0d0", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#ffd700", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#d8b600", bg = "#1a1707" },
+      DiagnosticVirtualTextWarn = { fg = "#b48ead", bg = "#161318" },
+      DiagnosticVirtualTextInfo = { fg = "#88c0d0", bg = "#12181c" },
+      DiagnosticVirtualTextHint = { fg = "#ffd700", bg = "#1e1a07" },
+      LspReferenceText = { bg = "#1b1d20" },
+      LspReferenceRead = { bg = "#1b1d20" },
+      LspReferenceWrite = { bg = "#27292d" },
+      LspSignatureActiveParameter = { fg = "#ffd700", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#88c0d0" },
+      GitSignsChange = { fg = "#b48ead" },
+      GitSignsDelete = { fg = "#d8b600" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#e8f0ff", bg = "#050608" },
+      TelescopeBorder = { fg = "#17191c", bg = "#050608" },
+      TelescopePromptTitle = { fg = "#050608", bg = "#ffd700", bold = true },
+      TelescopePreviewTitle = { fg = "#050608", bg = "#88c0d0", bold = true },
+      TelescopeResultsTitle = { fg = "#050608", bg = "#88c0d0", bold = true },
+      TelescopeSelection = { bg = "#372f06" },
+      TelescopeMatching = { fg = "#ffd700", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#ffd700", bold = true },
+      CmpItemKindVariable = { fg = "#e8f0ff" },
+      CmpItemKindFunction = { fg = "#88c0d0" },
+      CmpItemKindKeyword = { fg = "#ffd700" },
+      CmpItemKindClass = { fg = "#b48ead" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#17191c" },
+      IblScope = { fg = "#485060" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#050608", bg = "#ffd700", bold = true },
+      LazyButton = { fg = "#e8f0ff", bg = "#17191c" },
+      LazyButtonActive = { fg = "#050608", bg = "#ffd700" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#d8b600" },
+      NotifyWARNBorder = { fg = "#b48ead" },
+      NotifyINFOBorder = { fg = "#88c0d0" },
+      NotifyDEBUGBorder = { fg = "#485060" },
+      NotifyTRACEBorder = { fg = "#ffd700" },
+    },
+  },
+}
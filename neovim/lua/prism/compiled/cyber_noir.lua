@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Cyber Noir
+-- Auto-generated by sync_themes.py from vscode/themes/cyber_noir.json - DO NOT EDIT
+
+return {
+  name = "Cyber Noir",
+  mode = "dark",
+  palette = {
+    base00 = "#0a0a0f",
+    base01 = "#101018",
+    base02 = "#1e1e24",
+    base03 = "#506868",
+    base04 = "#6f8b8b",
+    base05 = "#a0a8c0",
+    base06 = "#b0b8d0",
+    base07 = "#bfc8e0",
+    base08 = "#00d8cc",
+    base09 = "#ffd700",
+    base0A = "#00fff0",
+    base0B = "#ff6b9d",
+    base0C = "#33fff3",
+    base0D = "#b0fffc",
+    base0E = "#00fff0",
+    base0F = "#505868",
+  },
+  terminal = {
+    "#0a0a0f", "#00d8cc", "#19fff1", "#737986",
+    "#00fff0", "#00bfb4", "#33fff3", "#a0a8c0",
+    "#505868", "#00fff0", "#33fff3", "#a0a8c0",
+    "#26fff2", "#00e5d8", "#4cfff4", "#a9b0c6",
+  },
+  groups = {
+    Normal = { fg = "#a0a8c0", bg = "#0a0a0f" },
+    NormalFloat = { fg = "#a0a8c0", bg = "#101018" },
+    NormalNC = { fg = "#a0a8c0", bg = "#0a0a0f" },
+    Cursor = { fg = "#0a0a0f", bg = "#00fff0" },
+    CursorLine = { bg = "#111117" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#0e0e14" },
+    LineNr = { fg = "#506868" },
+    CursorLineNr = { fg = "#a0a8c0", bold = true },
+    SignColumn = { fg = "#506868", bg = "#0a0a0f" },
+    VertSplit = { fg = "#1e1e24" },
+    WinSeparator = { fg = "#1e1e24" },
+    Folded = { fg = "#506868", bg = "#101018" },
+    FoldColumn = { fg = "#506868" },
+    NonText = { fg = "#506868" },
+    SpecialKey = { fg = "#506868" },
+    Whitespace = { fg = "#2d393b" },
+    MatchParen = { fg = "#00fff0", bold = true },
+    Visual = { bg = "#075352" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#0a0a0f", bg = "#00fff0" },
+    IncSearch = { fg = "#0a0a0f", bg = "#ffd700" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#0a0a0f", bg = "#00d8cc" },
+    Pmenu = { fg = "#a0a8c0", bg = "#101018" },
+    PmenuSel = { fg = "#a0a8c0", bg = "#083b3c" },
+    PmenuSbar = { bg = "#1e1e24" },
+    PmenuThumb = { bg = "#6f8b8b" },
+    ErrorMsg = { fg = "#00d8cc" },
+    WarningMsg = { fg = "#ffd700" },
+    ModeMsg = { fg = "#a0a8c0", bold = true },
+    MoreMsg = { fg = "#b0fffc" },
+    Question = { fg = "#b0fffc" },
+    TabLine = { fg = "#6f8b8b", bg = "#101018" },
+    TabLineFill = { bg = "#0a0a0f" },
+    TabLineSel = { fg = "#a0a8c0", bg = "#0a0a0f", bold = true },
+    StatusLine = { fg = "#a0a8c0", bg = "#101018" },
+    StatusLineNC = { fg = "#6f8b8b", bg = "#101018" },
+    DiffAdd = { bg = "#2e1824" },
+    DiffChange = { bg = "#2e280c" },
+    DiffDelete = { fg = "#00d8cc", bg = "#08282b" },
+    DiffText = { bg = "#53470a" },
+    SpellBad = { sp = "#00d8cc", undercurl = true },
+    SpellCap = { sp = "#ffd700", undercurl = true },
+    SpellLocal = { sp = "#b0fffc", undercurl = true },
+    SpellRare = { sp = "#00fff0", undercurl = true },
+    Comment = { fg = "#506868" },
+    Constant = { fg = "#ffd700" },
+    String = { fg = "#ff6b9d" },
+    Character = { fg = "#ff6b9d" },
+    Number = { fg = "#ffd700" },
+    Boolean = { fg = "#ffd700" },
+    Float = { fg = "#ffd700" },
+    Identifier = { fg = "#d0f0f0" },
+    Function = { fg = "#b0fffc" },
+    Statement = { fg = "#00fff0" },
+    Conditional = { fg = "#00fff0" },
+    Repeat = { fg = "#00fff0" },
+    Label = { fg = "#00fff0" },
+    Operator = { fg = "#6f8b8b" },
+    Keyword = { fg = "#00fff0" },
+    Exception = { fg = "#00fff0" },
+    PreProc = { fg = "#00fff0" },
+    Include = { fg = "#00fff0" },
+    Define = { fg = "#00fff0" },
+    Macro = { fg = "#00fff0" },
+    PreCondit = { fg = "#00fff0" },
+    Type = { fg = "#ffd700" },
+    StorageClass = { fg = "#00fff0" },
+    Structure = { fg = "#ffd700" },
+    Typedef = { fg = "#ffd700" },
+    Special = { fg = "#33fff3" },
+    SpecialChar = { fg = "#33fff3" },
+    Tag = { fg = "#ff6b9d" },
+    Delimiter = { fg = "#6f8b8b" },
+    SpecialComment = { fg = "#506868", italic = true },
+    Debug = { fg = "#ffd700" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#506868" },
+    Error = { fg = "#00d8cc" },
+    Todo = { fg = "#0a0a0f", bg = "#00fff0", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#d0f0f0" },
+      ["@variable.builtin"] = { fg = "#00fff0" },
+      ["@variable.parameter"] = { fg = "#d0f0f0", italic = true },
+      ["@variable.member"] = { fg = "#d0f0f0" },
+      ["@constant"] = { fg = "#ffd700" },
+      ["@constant.builtin"] = { fg = "#ffd700" },
+      ["@module"] = { fg = "#a0a8c0" },
+      ["@label"] = { fg = "#00fff0" },
+      ["@type"] = { fg = "#ffd700" },
+      ["@type.builtin"] = { fg = "#ffd700" },
+      ["@attribute"] = { fg = "#00fff0" },
+      ["@property"] = { fg = "#d0f0f0" },
+      ["@function"] = { fg = "#b0fffc" },
+      ["@function.builtin"] = { fg = "#b0fffc" },
+      ["@function.call"] = { fg = "#b0fffc" },
+      ["@function.method"] = { fg = "#b0fffc" },
+      ["@constructor"] = { fg = "#ffd700" },
+      ["@operator"] = { fg = "#6f8b8b" },
+      ["@keyword"] = { fg = "#00fff0" },
+      ["@keyword.conditional"] = { fg = "#00fff0" },
+      ["@keyword.function"] = { fg = "#00fff0" },
+      ["@keyword.operator"] = { fg = "#00fff0" },
+      ["@keyword.return"] = { fg = "#00fff0" },
+      ["@punctuation.bracket"] = { fg = "#6f8b8b" },
+      ["@punctuation.delimiter"] = { fg = "#6f8b8b" },
+      ["@punctuation.special"] = { fg = "#33fff3" },
+      ["@string"] = { fg = "#ff6b9d" },
+      ["@string.escape"] = { fg = "#33fff3" },
+      ["@string.regexp"] = { fg = "#33fff3" },
+      ["@character"] = { fg = "#ff6b9d" },
+      ["@boolean"] = { fg = "#ffd700" },
+      ["@number"] = { fg = "#ffd700" },
+      ["@comment"] = { fg = "#506868", italic = true },
+      ["@comment.todo"] = { fg = "#0a0a0f", bg = "#00fff0", bold = true },
+      ["@comment.error"] = { fg = "#00d8cc", bold = true },
+      ["@comment.warning"] = { fg = "#ffd700", bold = true },
+      ["@comment.note"] = { fg = "#b0fffc", bold = true },
+      ["@markup.heading"] = { fg = "#00fff0", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#ff6b9d" },
+      ["@markup.link"] = { fg = "#b0fffc", underline = true },
+      ["@tag"] = { fg = "#ff6b9d" },
+      ["@tag.attribute"] = { fg = "#00fff0" },
+      ["@tag.delimiter"] = { fg = "#6f8b8b" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#00d8cc" },
+      DiagnosticWarn = { fg = "#ffd700" },
+      DiagnosticInfo = { fg = "#b0fffc" },
+      DiagnosticHint = { fg = "#00fff0" },
+      DiagnosticUnderlineError = { sp = "#00d8cc", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#ffd700", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#b0fffc", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#00fff0", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#00d8cc", bg = "#091e21" },
+      DiagnosticVirtualTextWarn = { fg = "#ffd700", bg = "#221e0d" },
+      DiagnosticVirtualTextInfo = { fg = "#b0fffc", bg = "#1a2226" },
+      DiagnosticVirtualTextHint = { fg = "#00fff0", bg = "#092225" },
+      LspReferenceText = { bg = "#191920" },
+      LspReferenceRead = { bg = "#191920" },
+      LspReferenceWrite = { bg = "#202129" },
+      LspSignatureActiveParameter = { fg = "#00fff0", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#ff6b9d" },
+      GitSignsChange = { fg = "#ffd700" },
+      GitSignsDelete = { fg = "#00d8cc" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#a0a8c0", bg = "#0a0a0f" },
+      TelescopeBorder = { fg = "#1e1e24", bg = "#0a0a0f" },
+      TelescopePromptTitle = { fg = "#0a0a0f", bg = "#00fff0", bold = true },
+      TelescopePreviewTitle = { fg = "#0a0a0f", bg = "#ff6b9d", bold = true },
+      TelescopeResultsTitle = { fg = "#0a0a0f", bg = "#b0fffc", bold = true },
+      TelescopeSelection = { bg = "#083b3c" },
+      TelescopeMatching = { fg = "#00fff0", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#00fff0", bold = true },
+      CmpItemKindVariable = { fg = "#d0f0f0" },
+      CmpItemKindFunction = { fg = "#b0fffc" },
+      CmpItemKindKeyword = { fg = "#00fff0" },
+      CmpItemKindClass = { fg = "#ffd700" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#1e1e24" },
+      IblScope = { fg = "#506868" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#0a0a0f", bg = "#00fff0", bold = true },
+      LazyButton = { fg = "#a0a8c0", bg = "#1e1e24" },
+      LazyButtonActive = { fg = "#0a0a0f", bg = "#00fff0" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#00d8cc" },
+      NotifyWARNBorder = { fg = "#ffd700" },
+      NotifyINFOBorder = { fg = "#b0fffc" },
+      NotifyDEBUGBorder = { fg = "#506868" },
+      NotifyTRACEBorder = { fg = "#00fff0" },
+    },
+  },
+}
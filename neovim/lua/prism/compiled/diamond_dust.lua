@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Diamond Dust
+-- Auto-generated by sync_themes.py from vscode/themes/diamond_dust.json - DO NOT EDIT
+
+return {
+  name = "Diamond Dust",
+  mode = "dark",
+  palette = {
+    base00 = "#08090d",
+    base01 = "#0f1118",
+    base02 = "#1c1d21",
+    base03 = "#505560",
+    base04 = "#999fac",
+    base05 = "#e8f0ff",
+    base06 = "#f7ffff",
+    base07 = "#f7ffff",
+    base08 = "#2fa0d2",
+    base09 = "#e0b0ff",
+    base0A = "#38bdf8",
+    base0B = "#a5f3fc",
+    base0C = "#5fcaf9",
+    base0D = "#7dd3fc",
+    base0E = "#38bdf8",
+    base0F = "#505560",
+  },
+  terminal = {
+    "#08090d", "#2fa0d2", "#4bc3f8", "#73777f",
+    "#38bdf8", "#2a8dba", "#5fcaf9", "#e8f0ff",
+    "#505560", "#38bdf8", "#5fcaf9", "#e8f0ff",
+    "#55c6f9", "#32aadf", "#73d0fa", "#eaf1ff",
+  },
+  groups = {
+    Normal = { fg = "#e8f0ff", bg = "#08090d" },
+    NormalFloat = { fg = "#e8f0ff", bg = "#0f1118" },
+    NormalNC = { fg = "#e8f0ff", bg = "#08090d" },
+    Cursor = { fg = "#08090d", bg = "#38bdf8" },
+    CursorLine = { bg = "#131419" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#0e0f14" },
+    LineNr = { fg = "#505560" },
+    CursorLineNr = { fg = "#e8f0ff", bold = true },
+    SignColumn = { fg = "#505560", bg = "#08090d" },
+    VertSplit = { fg = "#1c1d21" },
+    WinSeparator = { fg = "#1c1d21" },
+    Folded = { fg = "#505560", bg = "#0f1118" },
+    FoldColumn = { fg = "#505560" },
+    NonText = { fg = "#505560" },
+    SpecialKey = { fg = "#505560" },
+    Whitespace = { fg = "#2c2f36" },
+    MatchParen = { fg = "#38bdf8", bold = true },
+    Visual = { bg = "#163e53" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#08090d", bg = "#38bdf8" },
+    IncSearch = { fg = "#08090d", bg = "#e0b0ff" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#08090d", bg = "#2fa0d2" },
+    Pmenu = { fg = "#e8f0ff", bg = "#0f1118" },
+    PmenuSel = { fg = "#e8f0ff", bg = "#112d3c" },
+    PmenuSbar = { bg = "#1c1d21" },
+    PmenuThumb = { bg = "#999fac" },
+    ErrorMsg = { fg = "#2fa0d2" },
+    WarningMsg = { fg = "#e0b0ff" },
+    ModeMsg = { fg = "#e8f0ff", bold = true },
+    MoreMsg = { fg = "#7dd3fc" },
+    Question = { fg = "#7dd3fc" },
+    TabLine = { fg = "#999fac", bg = "#0f1118" },
+    TabLineFill = { bg = "#08090d" },
+    TabLineSel = { fg = "#e8f0ff", bg = "#08090d", bold = true },
+    StatusLine = { fg = "#e8f0ff", bg = "#0f1118" },
+    StatusLineNC = { fg = "#999fac", bg = "#0f1118" },
+    DiffAdd = { bg = "#1f2c30" },
+    DiffChange = { bg = "#282231" },
+    DiffDelete = { fg = "#2fa0d2", bg = "#0d1f2a" },
+    DiffText = { bg = "#483b55" },
+    SpellBad = { sp = "#2fa0d2", undercurl = true },
+    SpellCap = { sp = "#e0b0ff", undercurl = true },
+    SpellLocal = { sp = "#7dd3fc", undercurl = true },
+    SpellRare = { sp = "#38bdf8", undercurl = true },
+    Comment = { fg = "#505560" },
+    Constant = { fg = "#e0b0ff" },
+    String = { fg = "#a5f3fc" },
+    Character = { fg = "#a5f3fc" },
+    Number = { fg = "#e0b0ff" },
+    Boolean = { fg = "#e0b0ff" },
+    Float = { fg = "#e0b0ff" },
+    Identifier = { fg = "#e8f0ff" },
+    Function = { fg = "#7dd3fc" },
+    Statement = { fg = "#38bdf8" },
+    Conditional = { fg = "#38bdf8" },
+    Repeat = { fg = "#38bdf8" },
+    Label = { fg = "#38bdf8" },
+    Operator = { fg = "#999fac" },
+    Keyword = { fg = "#38bdf8" },
+    Exception = { fg = "#38bdf8" },
+    PreProc = { fg = "#38bdf8" },
+    Include = { fg = "#38bdf8" },
+    Define = { fg = "#38bdf8" },
+    Macro = { fg = "#38bdf8" },
+    PreCondit = { fg = "#38bdf8" },
+    Type = { fg = "#e0b0ff" },
+    StorageClass = { fg = "#38bdf8" },
+    Structure = { fg = "#e0b0ff" },
+    Typedef = { fg = "#e0b0ff" },
+    Special = { fg = "#5fcaf9" },
+    SpecialChar = { fg = "#5fcaf9" },
+    Tag = { fg = "#22d3ee" },
+    Delimiter = { fg = "#999fac" },
+    SpecialComment = { fg = "#505560", italic = true },
+    Debug = { fg = "#e0b0ff" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#505560" },
+    Error = { fg = "#2fa0d2" },
+    Todo = { fg = "#08090d", bg = "#38bdf8", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#e8f0ff" },
+      ["@variable.builtin"] = { fg = "#38bdf8" },
+      ["@variable.parameter"] = { fg = "#e8f0ff", italic = true },
+      ["@variable.member"] = { fg = "#e8f0ff" },
+      ["@constant"] = { fg = "#e0b0ff" },
+      ["@constant.builtin"] = { fg = "#e0b0ff" },
+      ["@module"] = { fg = "#e8f0ff" },
+      ["@label"] = { fg = "#38bdf8" },
+      ["@type"] = { fg = "#e0b0ff" },
+      ["@type.builtin"] = { fg = "#e0b0ff" },
+      ["@attribute"] = { fg = "#a78bfa" },
+      ["@property"] = { fg = "#e8f0ff" },
+      ["@function"] = { fg = "#7dd3fc" },
+      ["@function.builtin"] = { fg = "#7dd3fc" },
+      ["@function.call"] = { fg = "#7dd3fc" },
+      ["@function.method"] = { fg = "#7dd3fc" },
+      ["@constructor"] = { fg = "#e0b0ff" },
+      ["@operator"] = { fg = "#999fac" },
+      ["@keyword"] = { fg = "#38bdf8" },
+      ["@keyword.conditional"] = { fg = "#38bdf8" },
+      ["@keyword.function"] = { fg = "#38bdf8" },
+      ["@keyword.operator"] = { fg = "#38bdf8" },
+      ["@keyword.return"] = { fg = "#38bdf8" },
+      ["@punctuation.bracket"] = { fg = "#999fac" },
+      ["@punctuation.delimiter"] = { fg = "#999fac" },
+      ["@punctuation.special"] = { fg = "#5fcaf9" },
+      ["@string"] = { fg = "#a5f3fc" },
+      ["@string.escape"] = { fg = "#5fcaf9" },
+      ["@string.regexp"] = { fg = "#5fcaf9" },
+      ["@character"] = { fg = "#a5f3fc" },
+      ["@boolean"] = { fg = "#e0b0ff" },
+      ["@number"] = { fg = "#e0b0ff" },
+      ["@comment"] = { fg = "#505560", italic = true },
+      ["@comment.todo"] = { fg = "#08090d", bg = "#38bdf8", bold = true },
+      ["@comment.error"] = { fg = "#2fa0d2", bold = true },
+      ["@comment.warning"] = { fg = "#e0b0ff", bold = true },
+      ["@comment.note"] = { fg = "#7dd3fc", bold = true },
+      ["@markup.heading"] = { fg = "#38bdf8", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#a5f3fc" },
+      ["@markup.link"] = { fg = "#7dd3fc", underline = true },
+      ["@tag"] = { fg = "#22d3ee" },
+      ["@tag.attribute"] = { fg = "#a78bfa" },
+      ["@tag.delimiter"] = { fg = "#999fac" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#2fa0d2" },
+      DiagnosticWarn = { fg = "#e0b0ff" },
+      DiagnosticInfo = { fg = "#7dd3fc" },
+      DiagnosticHint = { fg = "#38bdf8" },
+      DiagnosticUnderlineError = { sp = "#2fa0d2", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#e0b0ff", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#7dd3fc", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#38bdf8", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#2fa0d2", bg = "#0b1820" },
+      DiagnosticVirtualTextWarn = { fg = "#e0b0ff", bg = "#1d1925" },
+      DiagnosticVirtualTextInfo = { fg = "#7dd3fc", bg = "#131d24" },
+      DiagnosticVirtualTextHint = { fg = "#38bdf8", bg = "#0c1b24" },
+      LspReferenceText = { bg = "#1e2025" },
+      LspReferenceRead = { bg = "#1e2025" },
+      LspReferenceWrite = { bg = "#292b31" },
+      LspSignatureActiveParameter = { fg = "#38bdf8", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#a5f3fc" },
+      GitSignsChange = { fg = "#e0b0ff" },
+      GitSignsDelete = { fg = "#2fa0d2" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#e8f0ff", bg = "#08090d" },
+      TelescopeBorder = { fg = "#1c1d21", bg = "#08090d" },
+      TelescopePromptTitle = { fg = "#08090d", bg = "#38bdf8", bold = true },
+      TelescopePreviewTitle = { fg = "#08090d", bg = "#a5f3fc", bold = true },
+      TelescopeResultsTitle = { fg = "#08090d", bg = "#7dd3fc", bold = true },
+      TelescopeSelection = { bg = "#112d3c" },
+      TelescopeMatching = { fg = "#38bdf8", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#38bdf8", bold = true },
+      CmpItemKindVariable = { fg = "#e8f0ff" },
+      CmpItemKindFunction = { fg = "#7dd3fc" },
+      CmpItemKindKeyword = { fg = "#38bdf8" },
+      CmpItemKindClass = { fg = "#e0b0ff" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#1c1d21" },
+      IblScope = { fg = "#505560" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#08090d", bg = "#38bdf8", bold = true },
+      LazyButton = { fg = "#e8f0ff", bg = "#1c1d21" },
+      LazyButtonActive = { fg = "#08090d", bg = "#38bdf8" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#2fa0d2" },
+      NotifyWARNBorder = { fg = "#e0b0ff" },
+      NotifyINFOBorder = { fg = "#7dd3fc" },
+      NotifyDEBUGBorder = { fg = "#505560" },
+      NotifyTRACEBorder = { fg = "#38bdf8" },
+    },
+  },
+}
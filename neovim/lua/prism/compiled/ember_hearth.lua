@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Ember Hearth
+-- Auto-generated by sync_themes.py from vscode/themes/ember_hearth.json - DO NOT EDIT
+
+return {
+  name = "Ember Hearth",
+  mode = "dark",
+  palette = {
+    base00 = "#1a1210",
+    base01 = "#141010",
+    base02 = "#302725",
+    base03 = "#886858",
+    base04 = "#c2a89b",
+    base05 = "#f8f0e0",
+    base06 = "#fffeee",
+    base07 = "#fffeee",
+    base08 = "#d8b833",
+    base09 = "#ff6050",
+    base0A = "#ffd93d",
+    base0B = "#ffd93d",
+    base0C = "#ffe063",
+    base0D = "#ffc878",
+    base0E = "#ff8060",
+    base0F = "#5a4a40",
+  },
+  terminal = {
+    "#0c0908", "#d8b833", "#ffdc50", "#7b6e66",
+    "#ffd93d", "#bfa22d", "#ffe063", "#f8f0e0",
+    "#5a4a40", "#ffd93d", "#ffe063", "#f8f0e0",
+    "#ffde5a", "#e5c336", "#ffe477", "#f8f1e3",
+  },
+  groups = {
+    Normal = { fg = "#f8f0e0", bg = "#1a1210" },
+    NormalFloat = { fg = "#f8f0e0", bg = "#141010" },
+    NormalNC = { fg = "#f8f0e0", bg = "#1a1210" },
+    Cursor = { fg = "#1a1210", bg = "#ffd93d" },
+    CursorLine = { bg = "#251d1a" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#201816" },
+    LineNr = { fg = "#886858" },
+    CursorLineNr = { fg = "#f8f0e0", bold = true },
+    SignColumn = { fg = "#886858", bg = "#1a1210" },
+    VertSplit = { fg = "#302725" },
+    WinSeparator = { fg = "#302725" },
+    Folded = { fg = "#886858", bg = "#141010" },
+    FoldColumn = { fg = "#886858" },
+    NonText = { fg = "#886858" },
+    SpecialKey = { fg = "#886858" },
+    Whitespace = { fg = "#513d34" },
+    MatchParen = { fg = "#ffd93d", bold = true },
+    Visual = { bg = "#5e4d1d" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#1a1210", bg = "#ffd93d" },
+    IncSearch = { fg = "#1a1210", bg = "#ff6050" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#1a1210", bg = "#d8b833" },
+    Pmenu = { fg = "#f8f0e0", bg = "#141010" },
+    PmenuSel = { fg = "#f8f0e0", bg = "#473919" },
+    PmenuSbar = { bg = "#302725" },
+    PmenuThumb = { bg = "#c2a89b" },
+    ErrorMsg = { fg = "#d8b833" },
+    WarningMsg = { fg = "#ff6050" },
+    ModeMsg = { fg = "#f8f0e0", bold = true },
+    MoreMsg = { fg = "#ffc878" },
+    Question = { fg = "#ffc878" },
+    TabLine = { fg = "#c2a89b", bg = "#141010" },
+    TabLineFill = { bg = "#1a1210" },
+    TabLineSel = { fg = "#f8f0e0", bg = "#1a1210", bold = true },
+    StatusLine = { fg = "#f8f0e0", bg = "#141010" },
+    StatusLineNC = { fg = "#c2a89b", bg = "#141010" },
+    DiffAdd = { bg = "#3c2f16" },
+    DiffChange = { bg = "#3c1d19" },
+    DiffDelete = { fg = "#d8b833", bg = "#362a15" },
+    DiffText = { bg = "#5e2923" },
+    SpellBad = { sp = "#d8b833", undercurl = true },
+    SpellCap = { sp = "#ff6050", undercurl = true },
+    SpellLocal = { sp = "#ffc878", undercurl = true },
+    SpellRare = { sp = "#ff8060", undercurl = true },
+    Comment = { fg = "#886858" },
+    Constant = { fg = "#ff6050" },
+    String = { fg = "#ffd93d" },
+    Character = { fg = "#ffd93d" },
+    Number = { fg = "#ff6050" },
+    Boolean = { fg = "#ff6050" },
+    Float = { fg = "#ff6050" },
+    Identifier = { fg = "#f0e0d8" },
+    Function = { fg = "#ffc878" },
+    Statement = { fg = "#ff8060" },
+    Conditional = { fg = "#ff8060" },
+    Repeat = { fg = "#ff8060" },
+    Label = { fg = "#ff8060" },
+    Operator = { fg = "#c2a89b" },
+    Keyword = { fg = "#ff8060" },
+    Exception = { fg = "#ff8060" },
+    PreProc = { fg = "#ff8060" },
+    Include = { fg = "#ff8060" },
+    Define = { fg = "#ff8060" },
+    Macro = { fg = "#ff8060" },
+    PreCondit = { fg = "#ff8060" },
+    Type = { fg = "#ffd0b0" },
+    StorageClass = { fg = "#ff8060" },
+    Structure = { fg = "#ffd0b0" },
+    Typedef = { fg = "#ffd0b0" },
+    Special = { fg = "#ffe063" },
+    SpecialChar = { fg = "#ffe063" },
+    Tag = { fg = "#ff9070" },
+    Delimiter = { fg = "#c2a89b" },
+    SpecialComment = { fg = "#886858", italic = true },
+    Debug = { fg = "#ff6050" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#886858" },
+    Error = { fg = "#d8b833" },
+    Todo = { fg = "#1a1210", bg = "#ffd93d", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#f0e0d8" },
+      ["@variable.builtin"] = { fg = "#ff8060" },
+      ["@variable.parameter"] = { fg = "#f0e0d8", italic = true },
+      ["@variable.member"] = { fg = "#f0e0d8" },
+      ["@constant"] = { fg = "#ff6050" },
+      ["@constant.builtin"] = { fg = "#ff6050" },
+      ["@module"] = { fg = "#f8f0e0" },
+      ["@label"] = { fg = "#ff8060" },
+      ["@type"] = { fg = "#ffd0b0" },
+      ["@type.builtin"] = { fg = "#ffd0b0" },
+      ["@attribute"] = { fg = "#ffd93d" },
+      ["@property"] = { fg = "#f0e0d8" },
+      ["@function"] = { fg = "#ffc878" },
+      ["@function.builtin"] = { fg = "#ffc878" },
+      ["@function.call"] = { fg = "#ffc878" },
+      ["@function.method"] = { fg = "#ffc878" },
+      ["@constructor"] = { fg = "#ffd0b0" },
+      ["@operator"] = { fg = "#c2a89b" },
+      ["@keyword"] = { fg = "#ff8060" },
+      ["@keyword.conditional"] = { fg = "#ff8060" },
+      ["@keyword.function"] = { fg = "#ff8060" },
+      ["@keyword.operator"] = { fg = "#ff8060" },
+      ["@keyword.return"] = { fg = "#ff8060" },
+      ["@punctuation.bracket"] = { fg = "#c2a89b" },
+      ["@punctuation.delimiter"] = { fg = "#c2a89b" },
+      ["@punctuation.special"] = { fg = "#ffe063" },
+      ["@string"] = { fg = "#ffd93d" },
+      ["@string.escape"] = { fg = "#ffe063" },
+      ["@string.regexp"] = { fg = "#ffe063" },
+      ["@character"] = { fg = "#ffd93d" },
+      ["@boolean"] = { fg = "#ff6050" },
+      ["@number"] = { fg = "#ff6050" },
+      ["@comment"] = { fg = "#886858", italic = true },
+      ["@comment.todo"] = { fg = "#1a1210", bg = "#ffd93d", bold = true },
+      ["@comment.error"] = { fg = "#d8b833", bold = true },
+      ["@comment.warning"] = { fg = "#ff6050", bold = true },
+      ["@comment.note"] = { fg = "#ffc878", bold = true },
+      ["@markup.heading"] = { fg = "#ff8060", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#ffd93d" },
+      ["@markup.link"] = { fg = "#ffc878", underline = true },
+      ["@tag"] = { fg = "#ff9070" },
+      ["@tag.attribute"] = { fg = "#ffd93d" },
+      ["@tag.delimiter"] = { fg = "#c2a89b" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#d8b833" },
+      DiagnosticWarn = { fg = "#ff6050" },
+      DiagnosticInfo = { fg = "#ffc878" },
+      DiagnosticHint = { fg = "#ffd93d" },
+      DiagnosticUnderlineError = { sp = "#d8b833", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#ff6050", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#ffc878", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#ffd93d", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#d8b833", bg = "#2d2213" },
+      DiagnosticVirtualTextWarn = { fg = "#ff6050", bg = "#301916" },
+      DiagnosticVirtualTextInfo = { fg = "#ffc878", bg = "#30241a" },
+      DiagnosticVirtualTextHint = { fg = "#ffd93d", bg = "#302514" },
+      LspReferenceText = { bg = "#302824" },
+      LspReferenceRead = { bg = "#302824" },
+      LspReferenceWrite = { bg = "#3b332f" },
+      LspSignatureActiveParameter = { fg = "#ffd93d", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#ffd93d" },
+      GitSignsChange = { fg = "#ff6050" },
+      GitSignsDelete = { fg = "#d8b833" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#f8f0e0", bg = "#1a1210" },
+      TelescopeBorder = { fg = "#302725", bg = "#1a1210" },
+      TelescopePromptTitle = { fg = "#1a1210", bg = "#ffd93d", bold = true },
+      TelescopePreviewTitle = { fg = "#1a1210", bg = "#ffd93d", bold = true },
+      TelescopeResultsTitle = { fg = "#1a1210", bg = "#ffc878", bold = true },
+      TelescopeSelection = { bg = "#473919" },
+      TelescopeMatching = { fg = "#ffd93d", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#ffd93d", bold = true },
+      CmpItemKindVariable = { fg = "#f0e0d8" },
+      CmpItemKindFunction = { fg = "#ffc878" },
+      CmpItemKindKeyword = { fg = "#ff8060" },
+      CmpItemKindClass = { fg = "#ffd0b0" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#302725" },
+      IblScope = { fg = "#886858" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#1a1210", bg = "#ffd93d", bold = true },
+      LazyButton = { fg = "#f8f0e0", bg = "#302725" },
+      LazyButtonActive = { fg = "#1a1210", bg = "#ffd93d" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#d8b833" },
+      NotifyWARNBorder = { fg = "#ff6050" },
+      NotifyINFOBorder = { fg = "#ffc878" },
+      NotifyDEBUGBorder = { fg = "#886858" },
+      NotifyTRACEBorder = { fg = "#ff8060" },
+    },
+  },
+}
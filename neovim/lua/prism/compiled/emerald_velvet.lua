@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Emerald Velvet
+-- Auto-generated by sync_themes.py from vscode/themes/emerald_velvet.json - DO NOT EDIT
+
+return {
+  name = "Emerald Velvet",
+  mode = "dark",
+  palette = {
+    base00 = "#0a0f0a",
+    base01 = "#081008",
+    base02 = "#1e241e",
+    base03 = "#606050",
+    base04 = "#9d9d8c",
+    base05 = "#d8e0d0",
+    base06 = "#e8f1e0",
+    base07 = "#f9fff1",
+    base08 = "#b4942e",
+    base09 = "#e8d878",
+    base0A = "#d4af37",
+    base0B = "#8bc88b",
+    base0C = "#dcbf5f",
+    base0D = "#c8d888",
+    base0E = "#d4af37",
+    base0F = "#485848",
+  },
+  terminal = {
+    "#040806", "#b4942e", "#d8b74b", "#6c796c",
+    "#d4af37", "#9f8329", "#dcbf5f", "#e0f0e0",
+    "#485848", "#d4af37", "#dcbf5f", "#e0f0e0",
+    "#dabb55", "#be9d31", "#e0c773", "#e3f1e3",
+  },
+  groups = {
+    Normal = { fg = "#d8e0d0", bg = "#0a0f0a" },
+    NormalFloat = { fg = "#d8e0d0", bg = "#081008" },
+    NormalNC = { fg = "#d8e0d0", bg = "#0a0f0a" },
+    Cursor = { fg = "#0a0f0a", bg = "#d4af37" },
+    CursorLine = { bg = "#141913" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#10150f" },
+    LineNr = { fg = "#606050" },
+    CursorLineNr = { fg = "#d8e0d0", bold = true },
+    SignColumn = { fg = "#606050", bg = "#0a0f0a" },
+    VertSplit = { fg = "#1e241e" },
+    WinSeparator = { fg = "#1e241e" },
+    Folded = { fg = "#606050", bg = "#081008" },
+    FoldColumn = { fg = "#606050" },
+    NonText = { fg = "#606050" },
+    SpecialKey = { fg = "#606050" },
+    Whitespace = { fg = "#35372d" },
+    MatchParen = { fg = "#d4af37", bold = true },
+    Visual = { bg = "#463f17" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#0a0f0a", bg = "#d4af37" },
+    IncSearch = { fg = "#0a0f0a", bg = "#e8d878" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#0a0f0a", bg = "#b4942e" },
+    Pmenu = { fg = "#d8e0d0", bg = "#081008" },
+    PmenuSel = { fg = "#d8e0d0", bg = "#322f13" },
+    PmenuSbar = { bg = "#1e241e" },
+    PmenuThumb = { bg = "#9d9d8c" },
+    ErrorMsg = { fg = "#b4942e" },
+    WarningMsg = { fg = "#e8d878" },
+    ModeMsg = { fg = "#d8e0d0", bold = true },
+    MoreMsg = { fg = "#c8d888" },
+    Question = { fg = "#c8d888" },
+    TabLine = { fg = "#9d9d8c", bg = "#081008" },
+    TabLineFill = { bg = "#0a0f0a" },
+    TabLineSel = { fg = "#d8e0d0", bg = "#0a0f0a", bold = true },
+    StatusLine = { fg = "#d8e0d0", bg = "#081008" },
+    StatusLineNC = { fg = "#9d9d8c", bg = "#081008" },
+    DiffAdd = { bg = "#1d2a1d" },
+    DiffChange = { bg = "#2b2d1a" },
+    DiffDelete = { fg = "#b4942e", bg = "#23220f" },
+    DiffText = { bg = "#4c4b2b" },
+    SpellBad = { sp = "#b4942e", undercurl = true },
+    SpellCap = { sp = "#e8d878", undercurl = true },
+    SpellLocal = { sp = "#c8d888", undercurl = true },
+    SpellRare = { sp = "#d4af37", undercurl = true },
+    Comment = { fg = "#606050" },
+    Constant = { fg = "#e8d878" },
+    String = { fg = "#8bc88b" },
+    Character = { fg = "#8bc88b" },
+    Number = { fg = "#e8d878" },
+    Boolean = { fg = "#e8d878" },
+    Float = { fg = "#e8d878" },
+    Identifier = { fg = "#d8e0d0" },
+    Function = { fg = "#c8d888" },
+    Statement = { fg = "#d4af37" },
+    Conditional = { fg = "#d4af37" },
+    Repeat = { fg = "#d4af37" },
+    Label = { fg = "#d4af37" },
+    Operator = { fg = "#9d9d8c" },
+    Keyword = { fg = "#d4af37" },
+    Exception = { fg = "#d4af37" },
+    PreProc = { fg = "#d4af37" },
+    Include = { fg = "#d4af37" },
+    Define = { fg = "#d4af37" },
+    Macro = { fg = "#d4af37" },
+    PreCondit = { fg = "#d4af37" },
+    Type = { fg = "#c8d888" },
+    StorageClass = { fg = "#d4af37" },
+    Structure = { fg = "#c8d888" },
+    Typedef = { fg = "#c8d888" },
+    Special = { fg = "#dcbf5f" },
+    SpecialChar = { fg = "#dcbf5f" },
+    Tag = { fg = "#78b878" },
+    Delimiter = { fg = "#9d9d8c" },
+    SpecialComment = { fg = "#606050", italic = true },
+    Debug = { fg = "#e8d878" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#606050" },
+    Error = { fg = "#b4942e" },
+    Todo = { fg = "#0a0f0a", bg = "#d4af37", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#d8e0d0" },
+      ["@variable.builtin"] = { fg = "#d4af37" },
+      ["@variable.parameter"] = { fg = "#d8e0d0", italic = true },
+      ["@variable.member"] = { fg = "#d8e0d0" },
+      ["@constant"] = { fg = "#e8d878" },
+      ["@constant.builtin"] = { fg = "#e8d878" },
+      ["@module"] = { fg = "#d8e0d0" },
+      ["@label"] = { fg = "#d4af37" },
+      ["@type"] = { fg = "#c8d888" },
+      ["@type.builtin"] = { fg = "#c8d888" },
+      ["@attribute"] = { fg = "#a8c8a8" },
+      ["@property"] = { fg = "#d8e0d0" },
+      ["@function"] = { fg = "#c8d888" },
+      ["@function.builtin"] = { fg = "#c8d888" },
+      ["@function.call"] = { fg = "#c8d888" },
+      ["@function.method"] = { fg = "#c8d888" },
+      ["@constructor"] = { fg = "#c8d888" },
+      ["@operator"] = { fg = "#9d9d8c" },
+      ["@keyword"] = { fg = "#d4af37" },
+      ["@keyword.conditional"] = { fg = "#d4af37" },
+      ["@keyword.function"] = { fg = "#d4af37" },
+      ["@keyword.operator"] = { fg = "#d4af37" },
+      ["@keyword.return"] = { fg = "#d4af37" },
+      ["@punctuation.bracket"] = { fg = "#9d9d8c" },
+      ["@punctuation.delimiter"] = { fg = "#9d9d8c" },
+      ["@punctuation.special"] = { fg = "#dcbf5f" },
+      ["@string"] = { fg = "#8bc88b" },
+      ["@string.escape"] = { fg = "#dcbf5f" },
+      ["@string.regexp"] = { fg = "#dcbf5f" },
+      ["@character"] = { fg = "#8bc88b" },
+      ["@boolean"] = { fg = "#e8d878" },
+      ["@number"] = { fg = "#e8d878" },
+      ["@comment"] = { fg = "#606050", italic = true },
+      ["@comment.todo"] = { fg = "#0a0f0a", bg = "#d4af37", bold = true },
+      ["@comment.error"] = { fg = "#b4942e", bold = true },
+      ["@comment.warning"] = { fg = "#e8d878", bold = true },
+      ["@comment.note"] = { fg = "#c8d888", bold = true },
+      ["@markup.heading"] = { fg = "#d4af37", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#8bc88b" },
+      ["@markup.link"] = { fg = "#c8d888", underline = true },
+      ["@tag"] = { fg = "#78b878" },
+      ["@tag.attribute"] = { fg = "#a8c8a8" },
+      ["@tag.delimiter"] = { fg = "#9d9d8c" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#b4942e" },
+      DiagnosticWarn = { fg = "#e8d878" },
+      DiagnosticInfo = { fg = "#c8d888" },
+      DiagnosticHint = { fg = "#d4af37" },
+      DiagnosticUnderlineError = { sp = "#b4942e", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#e8d878", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#c8d888", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#d4af37", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#b4942e", bg = "#1b1c0d" },
+      DiagnosticVirtualTextWarn = { fg = "#e8d878", bg = "#202315" },
+      DiagnosticVirtualTextInfo = { fg = "#c8d888", bg = "#1d2316" },
+      DiagnosticVirtualTextHint = { fg = "#d4af37", bg = "#1e1f0e" },
+      LspReferenceText = { bg = "#1e231d" },
+      LspReferenceRead = { bg = "#1e231d" },
+      LspReferenceWrite = { bg = "#282e27" },
+      LspSignatureActiveParameter = { fg = "#d4af37", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#8bc88b" },
+      GitSignsChange = { fg = "#e8d878" },
+      GitSignsDelete = { fg = "#b4942e" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#d8e0d0", bg = "#0a0f0a" },
+      TelescopeBorder = { fg = "#1e241e", bg = "#0a0f0a" },
+      TelescopePromptTitle = { fg = "#0a0f0a", bg = "#d4af37", bold = true },
+      TelescopePreviewTitle = { fg = "#0a0f0a", bg = "#8bc88b", bold = true },
+      TelescopeResultsTitle = { fg = "#0a0f0a", bg = "#c8d888", bold = true },
+      TelescopeSelection = { bg = "#322f13" },
+      TelescopeMatching = { fg = "#d4af37", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#d4af37", bold = true },
+      CmpItemKindVariable = { fg = "#d8e0d0" },
+      CmpItemKindFunction = { fg = "#c8d888" },
+      CmpItemKindKeyword = { fg = "#d4af37" },
+      CmpItemKindClass = { fg = "#c8d888" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#1e241e" },
+      IblScope = { fg = "#606050" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#0a0f0a", bg = "#d4af37", bold = true },
+      LazyButton = { fg = "#d8e0d0", bg = "#1e241e" },
+      LazyButtonActive = { fg = "#0a0f0a", bg = "#d4af37" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#b4942e" },
+      NotifyWARNBorder = { fg = "#e8d878" },
+      NotifyINFOBorder = { fg = "#c8d888" },
+      NotifyDEBUGBorder = { fg = "#606050" },
+      NotifyTRACEBorder = { fg = "#d4af37" },
+    },
+  },
+}
@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Faded Glory
+-- Auto-generated by sync_themes.py from vscode/themes/faded_glory.json - DO NOT EDIT
+
+return {
+  name = "Faded Glory",
+  mode = "light",
+  palette = {
+    base00 = "#fdf0d5",
+    base01 = "#f0e3c6",
+    base02 = "#dfd2b8",
+    base03 = "#669BBC",
+    base04 = "#336380",
+    base05 = "#003049",
+    base06 = "#00233b",
+    base07 = "#00172e",
+    base08 = "#a40f1a",
+    base09 = "#780000",
+    base0A = "#C1121F",
+    base0B = "#669BBC",
+    base0C = "#ca3540",
+    base0D = "#003049",
+    base0E = "#C1121F",
+    base0F = "#669BBC",
+  },
+  terminal = {
+    "#003049", "#a40f1a", "#c72935", "#669BBC",
+    "#C1121F", "#900d17", "#ca3540", "#FDF0D5",
+    "#669BBC", "#C1121F", "#ca3540", "#75a5c2",
+    "#c72935", "#ad101b", "#d04d57", "#fdf0d7",
+  },
+  groups = {
+    Normal = { fg = "#003049", bg = "#fdf0d5" },
+    NormalFloat = { fg = "#003049", bg = "#f0e3c6" },
+    NormalNC = { fg = "#003049", bg = "#fdf0d5" },
+    Cursor = { fg = "#fdf0d5", bg = "#C1121F" },
+    CursorLine = { bg = "#f0e6ce" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#f5ead0" },
+    LineNr = { fg = "#669BBC" },
+    CursorLineNr = { fg = "#003049", bold = true },
+    SignColumn = { fg = "#669BBC", bg = "#fdf0d5" },
+    VertSplit = { fg = "#dfd2b8" },
+    WinSeparator = { fg = "#dfd2b8" },
+    Folded = { fg = "#669BBC", bg = "#f0e3c6" },
+    FoldColumn = { fg = "#669BBC" },
+    NonText = { fg = "#669BBC" },
+    SpecialKey = { fg = "#669BBC" },
+    Whitespace = { fg = "#b1c5c8" },
+    MatchParen = { fg = "#C1121F", bold = true },
+    Visual = { bg = "#ebad9e" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#fdf0d5", bg = "#C1121F" },
+    IncSearch = { fg = "#fdf0d5", bg = "#780000" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#fdf0d5", bg = "#a40f1a" },
+    Pmenu = { fg = "#003049", bg = "#f0e3c6" },
+    PmenuSel = { fg = "#003049", bg = "#f1c3b0" },
+    PmenuSbar = { bg = "#dfd2b8" },
+    PmenuThumb = { bg = "#336380" },
+    ErrorMsg = { fg = "#a40f1a" },
+    WarningMsg = { fg = "#780000" },
+    ModeMsg = { fg = "#003049", bold = true },
+    MoreMsg = { fg = "#003049" },
+    Question = { fg = "#003049" },
+    TabLine = { fg = "#336380", bg = "#f0e3c6" },
+    TabLineFill = { bg = "#fdf0d5" },
+    TabLineSel = { fg = "#003049", bg = "#fdf0d5", bold = true },
+    StatusLine = { fg = "#003049", bg = "#f0e3c6" },
+    StatusLineNC = { fg = "#336380", bg = "#f0e3c6" },
+    DiffAdd = { bg = "#e6e3d1" },
+    DiffChange = { bg = "#e9ccb5" },
+    DiffDelete = { fg = "#a40f1a", bg = "#efceb8" },
+    DiffText = { bg = "#d5a895" },
+    SpellBad = { sp = "#a40f1a", undercurl = true },
+    SpellCap = { sp = "#780000", undercurl = true },
+    SpellLocal = { sp = "#003049", undercurl = true },
+    SpellRare = { sp = "#C1121F", undercurl = true },
+    Comment = { fg = "#669BBC" },
+    Constant = { fg = "#780000" },
+    String = { fg = "#669BBC" },
+    Character = { fg = "#669BBC" },
+    Number = { fg = "#780000" },
+    Boolean = { fg = "#780000" },
+    Float = { fg = "#780000" },
+    Identifier = { fg = "#003049" },
+    Function = { fg = "#003049" },
+    Statement = { fg = "#C1121F" },
+    Conditional = { fg = "#C1121F" },
+    Repeat = { fg = "#C1121F" },
+    Label = { fg = "#C1121F" },
+    Operator = { fg = "#336380" },
+    Keyword = { fg = "#C1121F" },
+    Exception = { fg = "#C1121F" },
+    PreProc = { fg = "#C1121F" },
+    Include = { fg = "#C1121F" },
+    Define = { fg = "#C1121F" },
+    Macro = { fg = "#C1121F" },
+    PreCondit = { fg = "#C1121F" },
+    Type = { fg = "#C1121F" },
+    StorageClass = { fg = "#C1121F" },
+    Structure = { fg = "#C1121F" },
+    Typedef = { fg = "#C1121F" },
+    Special = { fg = "#ca3540" },
+    SpecialChar = { fg = "#ca3540" },
+    Tag = { fg = "#003049" },
+    Delimiter = { fg = "#336380" },
+    SpecialComment = { fg = "#669BBC", italic = true },
+    Debug = { fg = "#780000" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#669BBC" },
+    Error = { fg = "#a40f1a" },
+    Todo = { fg = "#fdf0d5", bg = "#C1121F", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#003049" },
+      ["@variable.builtin"] = { fg = "#C1121F" },
+      ["@variable.parameter"] = { fg = "#003049", italic = true },
+      ["@variable.member"] = { fg = "#003049" },
+      ["@constant"] = { fg = "#780000" },
+      ["@constant.builtin"] = { fg = "#780000" },
+      ["@module"] = { fg = "#003049" },
+      ["@label"] = { fg = "#C1121F" },
+      ["@type"] = { fg = "#C1121F" },
+      ["@type.builtin"] = { fg = "#C1121F" },
+      ["@attribute"] = { fg = "#C1121F" },
+      ["@property"] = { fg = "#003049" },
+      ["@function"] = { fg = "#003049" },
+      ["@function.builtin"] = { fg = "#003049" },
+      ["@function.call"] = { fg = "#003049" },
+      ["@function.method"] = { fg = "#003049" },
+      ["@constructor"] = { fg = "#C1121F" },
+      ["@operator"] = { fg = "#336380" },
+      ["@keyword"] = { fg = "#C1121F" },
+      ["@keyword.conditional"] = { fg = "#C1121F" },
+      ["@keyword.function"] = { fg = "#C1121F" },
+      ["@keyword.operator"] = { fg = "#C1121F" },
+      ["@keyword.return"] = { fg = "#C1121F" },
+      ["@punctuation.bracket"] = { fg = "#336380" },
+      ["@punctuation.delimiter"] = { fg = "#336380" },
+      ["@punctuation.special"] = { fg = "#ca3540" },
+      ["@string"] = { fg = "#669BBC" },
+      ["@string.escape"] = { fg = "#ca3540" },
+      ["@string.regexp"] = { fg = "#ca3540" },
+      ["@character"] = { fg = "#669BBC" },
+      ["@boolean"] = { fg = "#780000" },
+      ["@number"] = { fg = "#780000" },
+      ["@comment"] = { fg = "#669BBC", italic = true },
+      ["@comment.todo"] = { fg = "#fdf0d5", bg = "#C1121F", bold = true },
+      ["@comment.error"] = { fg = "#a40f1a", bold = true },
+      ["@comment.warning"] = { fg = "#780000", bold = true },
+      ["@comment.note"] = { fg = "#003049", bold = true },
+      ["@markup.heading"] = { fg = "#C1121F", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#669BBC" },
+      ["@markup.link"] = { fg = "#003049", underline = true },
+      ["@tag"] = { fg = "#003049" },
+      ["@tag.attribute"] = { fg = "#C1121F" },
+      ["@tag.delimiter"] = { fg = "#336380" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#a40f1a" },
+      DiagnosticWarn = { fg = "#780000" },
+      DiagnosticInfo = { fg = "#003049" },
+      DiagnosticHint = { fg = "#C1121F" },
+      DiagnosticUnderlineError = { sp = "#a40f1a", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#780000", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#003049", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#C1121F", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#a40f1a", bg = "#f4d9c2" },
+      DiagnosticVirtualTextWarn = { fg = "#780000", bg = "#efd8bf" },
+      DiagnosticVirtualTextInfo = { fg = "#003049", bg = "#e3dcc7" },
+      DiagnosticVirtualTextHint = { fg = "#C1121F", bg = "#f7d9c2" },
+      LspReferenceText = { bg = "#e3dcc7" },
+      LspReferenceRead = { bg = "#e3dcc7" },
+      LspReferenceWrite = { bg = "#d7d3bf" },
+      LspSignatureActiveParameter = { fg = "#C1121F", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#669BBC" },
+      GitSignsChange = { fg = "#780000" },
+      GitSignsDelete = { fg = "#a40f1a" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#003049", bg = "#fdf0d5" },
+      TelescopeBorder = { fg = "#dfd2b8", bg = "#fdf0d5" },
+      TelescopePromptTitle = { fg = "#fdf0d5", bg = "#C1121F", bold = true },
+      TelescopePreviewTitle = { fg = "#fdf0d5", bg = "#669BBC", bold = true },
+      TelescopeResultsTitle = { fg = "#fdf0d5", bg = "#003049", bold = true },
+      TelescopeSelection = { bg = "#f1c3b0" },
+      TelescopeMatching = { fg = "#C1121F", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#C1121F", bold = true },
+      CmpItemKindVariable = { fg = "#003049" },
+      CmpItemKindFunction = { fg = "#003049" },
+      CmpItemKindKeyword = { fg = "#C1121F" },
+      CmpItemKindClass = { fg = "#C1121F" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#dfd2b8" },
+      IblScope = { fg = "#669BBC" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#fdf0d5", bg = "#C1121F", bold = true },
+      LazyButton = { fg = "#003049", bg = "#dfd2b8" },
+      LazyButtonActive = { fg = "#fdf0d5", bg = "#C1121F" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#a40f1a" },
+      NotifyWARNBorder = { fg = "#780000" },
+      NotifyINFOBorder = { fg = "#003049" },
+      NotifyDEBUGBorder = { fg = "#669BBC" },
+      NotifyTRACEBorder = { fg = "#C1121F" },
+    },
+  },
+}
@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Fleek Gold
+-- Auto-generated by sync_themes.py from vscode/themes/fleek_gold.json - DO NOT EDIT
+
+return {
+  name = "Fleek Gold",
+  mode = "dark",
+  palette = {
+    base00 = "#161616",
+    base01 = "#1e1e1e",
+    base02 = "#2b2b2b",
+    base03 = "#9a886c",
+    base04 = "#cbc2b3",
+    base05 = "#fefefe",
+    base06 = "#ffffff",
+    base07 = "#ffffff",
+    base08 = "#ac9e87",
+    base09 = "#a08860",
+    base0A = "#cbba9f",
+    base0B = "#e8d4b0",
+    base0C = "#d5c7b2",
+    base0D = "#f0e0c8",
+    base0E = "#cbba9f",
+    base0F = "#9a886c",
+  },
+  terminal = {
+    "#161616", "#ac9e87", "#d0c0a8", "#ae9f89",
+    "#cbba9f", "#988b77", "#d5c7b2", "#fefefe",
+    "#9a886c", "#cbba9f", "#d5c7b2", "#fefefe",
+    "#d2c4ad", "#b6a78f", "#dacebb", "#fefefe",
+  },
+  groups = {
+    Normal = { fg = "#fefefe", bg = "#161616" },
+    NormalFloat = { fg = "#fefefe", bg = "#1e1e1e" },
+    NormalNC = { fg = "#fefefe", bg = "#161616" },
+    Cursor = { fg = "#161616", bg = "#cbba9f" },
+    CursorLine = { bg = "#212121" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#1c1c1c" },
+    LineNr = { fg = "#9a886c" },
+    CursorLineNr = { fg = "#fefefe", bold = true },
+    SignColumn = { fg = "#9a886c", bg = "#161616" },
+    VertSplit = { fg = "#2b2b2b" },
+    WinSeparator = { fg = "#2b2b2b" },
+    Folded = { fg = "#9a886c", bg = "#1e1e1e" },
+    FoldColumn = { fg = "#9a886c" },
+    NonText = { fg = "#9a886c" },
+    SpecialKey = { fg = "#9a886c" },
+    Whitespace = { fg = "#584f41" },
+    MatchParen = { fg = "#cbba9f", bold = true },
+    Visual = { bg = "#4c473f" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#161616", bg = "#cbba9f" },
+    IncSearch = { fg = "#161616", bg = "#a08860" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#161616", bg = "#ac9e87" },
+    Pmenu = { fg = "#fefefe", bg = "#1e1e1e" },
+    PmenuSel = { fg = "#fefefe", bg = "#3a3631" },
+    PmenuSbar = { bg = "#2b2b2b" },
+    PmenuThumb = { bg = "#cbc2b3" },
+    ErrorMsg = { fg = "#ac9e87" },
+    WarningMsg = { fg = "#a08860" },
+    ModeMsg = { fg = "#fefefe", bold = true },
+    MoreMsg = { fg = "#f0e0c8" },
+    Question = { fg = "#f0e0c8" },
+    TabLine = { fg = "#cbc2b3", bg = "#1e1e1e" },
+    TabLineFill = { bg = "#161616" },
+    TabLineSel = { fg = "#fefefe", bg = "#161616", bold = true },
+    StatusLine = { fg = "#fefefe", bg = "#1e1e1e" },
+    StatusLineNC = { fg = "#cbc2b3", bg = "#1e1e1e" },
+    DiffAdd = { bg = "#35322d" },
+    DiffChange = { bg = "#2a2721" },
+    DiffDelete = { fg = "#ac9e87", bg = "#2c2a26" },
+    DiffText = { bg = "#3f382c" },
+    SpellBad = { sp = "#ac9e87", undercurl = true },
+    SpellCap = { sp = "#a08860", undercurl = true },
+    SpellLocal = { sp = "#f0e0c8", undercurl = true },
+    SpellRare = { sp = "#cbba9f", undercurl = true },
+    Comment = { fg = "#9a886c" },
+    Constant = { fg = "#a08860" },
+    String = { fg = "#e8d4b0" },
+    Character = { fg = "#e8d4b0" },
+    Number = { fg = "#a08860" },
+    Boolean = { fg = "#a08860" },
+    Float = { fg = "#a08860" },
+    Identifier = { fg = "#fefefe" },
+    Function = { fg = "#f0e0c8" },
+    Statement = { fg = "#cbba9f" },
+    Conditional = { fg = "#cbba9f" },
+    Repeat = { fg = "#cbba9f" },
+    Label = { fg = "#cbba9f" },
+    Operator = { fg = "#cbc2b3" },
+    Keyword = { fg = "#cbba9f" },
+    Exception = { fg = "#cbba9f" },
+    PreProc = { fg = "#cbba9f" },
+    Include = { fg = "#cbba9f" },
+    Define = { fg = "#cbba9f" },
+    Macro = { fg = "#cbba9f" },
+    PreCondit = { fg = "#cbba9f" },
+    Type = { fg = "#cbba9f" },
+    StorageClass = { fg = "#cbba9f" },
+    Structure = { fg = "#cbba9f" },
+    Typedef = { fg = "#cbba9f" },
+    Special = { fg = "#d5c7b2" },
+    SpecialChar = { fg = "#d5c7b2" },
+    Tag = { fg = "#e8d0a0" },
+    Delimiter = { fg = "#cbc2b3" },
+    SpecialComment = { fg = "#9a886c", italic = true },
+    Debug = { fg = "#a08860" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#9a886c" },
+    Error = { fg = "#ac9e87" },
+    Todo = { fg = "#161616", bg = "#cbba9f", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#fefefe" },
+      ["@variable.builtin"] = { fg = "#cbba9f" },
+      ["@variable.parameter"] = { fg = "#fefefe", italic = true },
+      ["@variable.member"] = { fg = "#fefefe" },
+      ["@constant"] = { fg = "#a08860" },
+      ["@constant.builtin"] = { fg = "#a08860" },
+      ["@module"] = { fg = "#fefefe" },
+      ["@label"] = { fg = "#cbba9f" },
+      ["@type"] = { fg = "#cbba9f" },
+      ["@type.builtin"] = { fg = "#cbba9f" },
+      ["@attribute"] = { fg = "#b09870" },
+      ["@property"] = { fg = "#fefefe" },
+      ["@function"] = { fg = "#f0e0c8" },
+      ["@function.builtin"] = { fg = "#f0e0c8" },
+      ["@function.call"] = { fg = "#f0e0c8" },
+      ["@function.method"] = { fg = "#f0e0c8" },
+      ["@constructor"] = { fg = "#cbba9f" },
+      ["@operator"] = { fg = "#cbc2b3" },
+      ["@keyword"] = { fg = "#cbba9f" },
+      ["@keyword.conditional"] = { fg = "#cbba9f" },
+      ["@keyword.function"] = { fg = "#cbba9f" },
+      ["@keyword.operator"] = { fg = "#cbba9f" },
+      ["@keyword.return"] = { fg = "#cbba9f" },
+      ["@punctuation.bracket"] = { fg = "#cbc2b3" },
+      ["@punctuation.delimiter"] = { fg = "#cbc2b3" },
+      ["@punctuation.special"] = { fg = "#d5c7b2" },
+      ["@string"] = { fg = "#e8d4b0" },
+      ["@string.escape"] = { fg = "#d5c7b2" },
+      ["@string.regexp"] = { fg = "#d5c7b2" },
+      ["@character"] = { fg = "#e8d4b0" },
+      ["@boolean"] = { fg = "#a08860" },
+      ["@number"] = { fg = "#a08860" },
+      ["@comment"] = { fg = "#9a886c", italic = true },
+      ["@comment.todo"] = { fg = "#161616", bg = "#cbba9f", bold = true },
+      ["@comment.error"] = { fg = "#ac9e87", bold = true },
+      ["@comment.warning"] = { fg = "#a08860", bold = true },
+      ["@comment.note"] = { fg = "#f0e0c8", bold = true },
+      ["@markup.heading"] = { fg = "#cbba9f", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#e8d4b0" },
+      ["@markup.link"] = { fg = "#f0e0c8", underline = true },
+      ["@tag"] = { fg = "#e8d0a0" },
+      ["@tag.attribute"] = { fg = "#b09870" },
+      ["@tag.delimiter"] = { fg = "#cbc2b3" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#ac9e87" },
+      DiagnosticWarn = { fg = "#a08860" },
+      DiagnosticInfo = { fg = "#f0e0c8" },
+      DiagnosticHint = { fg = "#cbba9f" },
+      DiagnosticUnderlineError = { sp = "#ac9e87", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#a08860", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#f0e0c8", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#cbba9f", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#ac9e87", bg = "#252321" },
+      DiagnosticVirtualTextWarn = { fg = "#a08860", bg = "#23211d" },
+      DiagnosticVirtualTextInfo = { fg = "#f0e0c8", bg = "#2b2a27" },
+      DiagnosticVirtualTextHint = { fg = "#cbba9f", bg = "#282623" },
+      LspReferenceText = { bg = "#2d2d2d" },
+      LspReferenceRead = { bg = "#2d2d2d" },
+      LspReferenceWrite = { bg = "#383838" },
+      LspSignatureActiveParameter = { fg = "#cbba9f", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#e8d4b0" },
+      GitSignsChange = { fg = "#a08860" },
+      GitSignsDelete = { fg = "#ac9e87" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#fefefe", bg = "#161616" },
+      TelescopeBorder = { fg = "#2b2b2b", bg = "#161616" },
+      TelescopePromptTitle = { fg = "#161616", bg = "#cbba9f", bold = true },
+      TelescopePreviewTitle = { fg = "#161616", bg = "#e8d4b0", bold = true },
+      TelescopeResultsTitle = { fg = "#161616", bg = "#f0e0c8", bold = true },
+      TelescopeSelection = { bg = "#3a3631" },
+      TelescopeMatching = { fg = "#cbba9f", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#cbba9f", bold = true },
+      CmpItemKindVariable = { fg = "#fefefe" },
+      CmpItemKindFunction = { fg = "#f0e0c8" },
+      CmpItemKindKeyword = { fg = "#cbba9f" },
+      CmpItemKindClass = { fg = "#cbba9f" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#2b2b2b" },
+      IblScope = { fg = "#9a886c" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#161616", bg = "#cbba9f", bold = true },
+      LazyButton = { fg = "#fefefe", bg = "#2b2b2b" },
+      LazyButtonActive = { fg = "#161616", bg = "#cbba9f" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#ac9e87" },
+      NotifyWARNBorder = { fg = "#a08860" },
+      NotifyINFOBorder = { fg = "#f0e0c8" },
+      NotifyDEBUGBorder = { fg = "#9a886c" },
+      NotifyTRACEBorder = { fg = "#cbba9f" },
+    },
+  },
+}
@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Fleek Gradient
+-- Auto-generated by sync_themes.py from vscode/themes/fleek_gradient.json - DO NOT EDIT
+
+return {
+  name = "Fleek Gradient",
+  mode = "dark",
+  palette = {
+    base00 = "#0b0b0b",
+    base01 = "#151515",
+    base02 = "#1f1f1f",
+    base03 = "#0090ff",
+    base04 = "#97caff",
+    base05 = "#ffffff",
+    base06 = "#ffffff",
+    base07 = "#ffffff",
+    base08 = "#d8c322",
+    base09 = "#ffe629",
+    base0A = "#ffe629",
+    base0B = "#7ee787",
+    base0C = "#ffeb53",
+    base0D = "#30a46c",
+    base0E = "#ff6600",
+    base0F = "#0090ff",
+  },
+  terminal = {
+    "#0b0b0b", "#d8c322", "#ffe83e", "#33a6ff",
+    "#ffe629", "#bfac1e", "#ffeb53", "#30a46c",
+    "#0090ff", "#ffe629", "#ffeb53", "#30a46c",
+    "#ffe949", "#e5cf24", "#ffed69", "#44ad7a",
+  },
+  groups = {
+    Normal = { fg = "#ffffff", bg = "#0b0b0b" },
+    NormalFloat = { fg = "#ffffff", bg = "#151515" },
+    NormalNC = { fg = "#ffffff", bg = "#0b0b0b" },
+    Cursor = { fg = "#0b0b0b", bg = "#ffe629" },
+    CursorLine = { bg = "#171717" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#121212" },
+    LineNr = { fg = "#0090ff" },
+    CursorLineNr = { fg = "#ffffff", bold = true },
+    SignColumn = { fg = "#0090ff", bg = "#0b0b0b" },
+    VertSplit = { fg = "#1f1f1f" },
+    WinSeparator = { fg = "#1f1f1f" },
+    Folded = { fg = "#0090ff", bg = "#151515" },
+    FoldColumn = { fg = "#0090ff" },
+    NonText = { fg = "#0090ff" },
+    SpecialKey = { fg = "#0090ff" },
+    Whitespace = { fg = "#054d85" },
+    MatchParen = { fg = "#ffe629", bold = true },
+    Visual = { bg = "#544c14" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#0b0b0b", bg = "#ffe629" },
+    IncSearch = { fg = "#0b0b0b", bg = "#ffe629" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#0b0b0b", bg = "#d8c322" },
+    Pmenu = { fg = "#ffffff", bg = "#151515" },
+    PmenuSel = { fg = "#ffffff", bg = "#3b3611" },
+    PmenuSbar = { bg = "#1f1f1f" },
+    PmenuThumb = { bg = "#97caff" },
+    ErrorMsg = { fg = "#d8c322" },
+    WarningMsg = { fg = "#ffe629" },
+    ModeMsg = { fg = "#ffffff", bold = true },
+    MoreMsg = { fg = "#30a46c" },
+    Question = { fg = "#30a46c" },
+    TabLine = { fg = "#97caff", bg = "#151515" },
+    TabLineFill = { bg = "#0b0b0b" },
+    TabLineSel = { fg = "#ffffff", bg = "#0b0b0b", bold = true },
+    StatusLine = { fg = "#ffffff", bg = "#151515" },
+    StatusLineNC = { fg = "#97caff", bg = "#151515" },
+    DiffAdd = { bg = "#1c2c1d" },
+    DiffChange = { bg = "#2f2b0f" },
+    DiffDelete = { fg = "#d8c322", bg = "#29260e" },
+    DiffText = { bg = "#544c14" },
+    SpellBad = { sp = "#d8c322", undercurl = true },
+    SpellCap = { sp = "#ffe629", undercurl = true },
+    SpellLocal = { sp = "#30a46c", undercurl = true },
+    SpellRare = { sp = "#ff6600", undercurl = true },
+    Comment = { fg = "#0090ff" },
+    Constant = { fg = "#ffe629" },
+    String = { fg = "#7ee787" },
+    Character = { fg = "#7ee787" },
+    Number = { fg = "#ffe629" },
+    Boolean = { fg = "#ffe629" },
+    Float = { fg = "#ffe629" },
+    Identifier = { fg = "#ffffff" },
+    Function = { fg = "#30a46c" },
+    Statement = { fg = "#ff6600" },
+    Conditional = { fg = "#ff6600" },
+    Repeat = { fg = "#ff6600" },
+    Label = { fg = "#ff6600" },
+    Operator = { fg = "#97caff" },
+    Keyword = { fg = "#ff6600" },
+    Exception = { fg = "#ff6600" },
+    PreProc = { fg = "#ff6600" },
+    Include = { fg = "#ff6600" },
+    Define = { fg = "#ff6600" },
+    Macro = { fg = "#ff6600" },
+    PreCondit = { fg = "#ff6600" },
+    Type = { fg = "#ffe629" },
+    StorageClass = { fg = "#ff6600" },
+    Structure = { fg = "#ffe629" },
+    Typedef = { fg = "#ffe629" },
+    Special = { fg = "#ffeb53" },
+    SpecialChar = { fg = "#ffeb53" },
+    Tag = { fg = "#0090ff" },
+    Delimiter = { fg = "#97caff" },
+    SpecialComment = { fg = "#0090ff", italic = true },
+    Debug = { fg = "#ffe629" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#0090ff" },
+    Error = { fg = "#d8c322" },
+    Todo = { fg = "#0b0b0b", bg = "#ffe629", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#ffffff" },
+      ["@variable.builtin"] = { fg = "#ff6600" },
+      ["@variable.parameter"] = { fg = "#ffffff", italic = true },
+      ["@variable.member"] = { fg = "#ffffff" },
+      ["@constant"] = { fg = "#ffe629" },
+      ["@constant.builtin"] = { fg = "#ffe629" },
+      ["@module"] = { fg = "#ffffff" },
+      ["@label"] = { fg = "#ff6600" },
+      ["@type"] = { fg = "#ffe629" },
+      ["@type.builtin"] = { fg = "#ffe629" },
+      ["@attribute"] = { fg = "#7ee787" },
+      ["@property"] = { fg = "#ffffff" },
+      ["@function"] = { fg = "#30a46c" },
+      ["@function.builtin"] = { fg = "#30a46c" },
+      ["@function.call"] = { fg = "#30a46c" },
+      ["@function.method"] = { fg = "#30a46c" },
+      ["@constructor"] = { fg = "#ffe629" },
+      ["@operator"] = { fg = "#97caff" },
+      ["@keyword"] = { fg = "#ff6600" },
+      ["@keyword.conditional"] = { fg = "#ff6600" },
+      ["@keyword.function"] = { fg = "#ff6600" },
+      ["@keyword.operator"] = { fg = "#ff6600" },
+      ["@keyword.return"] = { fg = "#ff6600" },
+      ["@punctuation.bracket"] = { fg = "#97caff" },
+      ["@punctuation.delimiter"] = { fg = "#97caff" },
+      ["@punctuation.special"] = { fg = "#ffeb53" },
+      ["@string"] = { fg = "#7ee787" },
+      ["@string.escape"] = { fg = "#ffeb53" },
+      ["@string.regexp"] = { fg = "#ffeb53" },
+      ["@character"] = { fg = "#7ee787" },
+      ["@boolean"] = { fg = "#ffe629" },
+      ["@number"] = { fg = "#ffe629" },
+      ["@comment"] = { fg = "#0090ff", italic = true },
+      ["@comment.todo"] = { fg = "#0b0b0b", bg = "#ffe629", bold = true },
+      ["@comment.error"] = { fg = "#d8c322", bold = true },
+      ["@comment.warning"] = { fg = "#ffe629", bold = true },
+      ["@comment.note"] = { fg = "#30a46c", bold = true },
+      ["@markup.heading"] = { fg = "#ff6600", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#7ee787" },
+      ["@markup.link"] = { fg = "#30a46c", underline = true },
+      ["@tag"] = { fg = "#0090ff" },
+      ["@tag.attribute"] = { fg = "#7ee787" },
+      ["@tag.delimiter"] = { fg = "#97caff" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#d8c322" },
+      DiagnosticWarn = { fg = "#ffe629" },
+      DiagnosticInfo = { fg = "#30a46c" },
+      DiagnosticHint = { fg = "#ffe629" },
+      DiagnosticUnderlineError = { sp = "#d8c322", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#ffe629", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#30a46c", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#ffe629", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#d8c322", bg = "#1f1d0d" },
+      DiagnosticVirtualTextWarn = { fg = "#ffe629", bg = "#23200e" },
+      DiagnosticVirtualTextInfo = { fg = "#30a46c", bg = "#0e1a14" },
+      DiagnosticVirtualTextHint = { fg = "#ffe629", bg = "#23200e" },
+      LspReferenceText = { bg = "#232323" },
+      LspReferenceRead = { bg = "#232323" },
+      LspReferenceWrite = { bg = "#2f2f2f" },
+      LspSignatureActiveParameter = { fg = "#ffe629", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#7ee787" },
+      GitSignsChange = { fg = "#ffe629" },
+      GitSignsDelete = { fg = "#d8c322" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#ffffff", bg = "#0b0b0b" },
+      TelescopeBorder = { fg = "#1f1f1f", bg = "#0b0b0b" },
+      TelescopePromptTitle = { fg = "#0b0b0b", bg = "#ffe629", bold = true },
+      TelescopePreviewTitle = { fg = "#0b0b0b", bg = "#7ee787", bold = true },
+      TelescopeResultsTitle = { fg = "#0b0b0b", bg = "#30a46c", bold = true },
+      TelescopeSelection = { bg = "#3b3611" },
+      TelescopeMatching = { fg = "#ffe629", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#ffe629", bold = true },
+      CmpItemKindVariable = { fg = "#ffffff" },
+      CmpItemKindFunction = { fg = "#30a46c" },
+      CmpItemKindKeyword = { fg = "#ff6600" },
+      CmpItemKindClass = { fg = "#ffe629" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#1f1f1f" },
+      IblScope = { fg = "#0090ff" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#0b0b0b", bg = "#ffe629", bold = true },
+      LazyButton = { fg = "#ffffff", bg = "#1f1f1f" },
+      LazyButtonActive = { fg = "#0b0b0b", bg = "#ffe629" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#d8c322" },
+      NotifyWARNBorder = { fg = "#ffe629" },
+      NotifyINFOBorder = { fg = "#30a46c" },
+      NotifyDEBUGBorder = { fg = "#0090ff" },
+      NotifyTRACEBorder = { fg = "#ff6600" },
+    },
+  },
+}
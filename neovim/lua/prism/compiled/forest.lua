@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Forest
+-- Auto-generated by sync_themes.py from vscode/themes/forest.json - DO NOT EDIT
+
+return {
+  name = "Forest",
+  mode = "dark",
+  palette = {
+    base00 = "#050a08",
+    base01 = "#152910",
+    base02 = "#171e1c",
+    base03 = "#1E483C",
+    base04 = "#6c9587",
+    base05 = "#c8e8d0",
+    base06 = "#d8f9e0",
+    base07 = "#e8fff0",
+    base08 = "#538c21",
+    base09 = "#6baa50",
+    base0A = "#62A527",
+    base0B = "#ACD322",
+    base0C = "#81b752",
+    base0D = "#c8e8b0",
+    base0E = "#62A527",
+    base0F = "#1E483C",
+  },
+  terminal = {
+    "#0D1F0A", "#538c21", "#71ae3c", "#4b6c63",
+    "#62A527", "#497b1d", "#81b752", "#ACD322",
+    "#1E483C", "#62A527", "#81b752", "#ACD322",
+    "#79b247", "#589423", "#91c067", "#b4d738",
+  },
+  groups = {
+    Normal = { fg = "#c8e8d0", bg = "#050a08" },
+    NormalFloat = { fg = "#c8e8d0", bg = "#152910" },
+    NormalNC = { fg = "#c8e8d0", bg = "#050a08" },
+    Cursor = { fg = "#050a08", bg = "#62A527" },
+    CursorLine = { bg = "#0e1512" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#0a100e" },
+    LineNr = { fg = "#1E483C" },
+    CursorLineNr = { fg = "#c8e8d0", bold = true },
+    SignColumn = { fg = "#1E483C", bg = "#050a08" },
+    VertSplit = { fg = "#171e1c" },
+    WinSeparator = { fg = "#171e1c" },
+    Folded = { fg = "#1E483C", bg = "#152910" },
+    FoldColumn = { fg = "#1E483C" },
+    NonText = { fg = "#1E483C" },
+    SpecialKey = { fg = "#1E483C" },
+    Whitespace = { fg = "#112922" },
+    MatchParen = { fg = "#62A527", bold = true },
+    Visual = { bg = "#203811" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#050a08", bg = "#62A527" },
+    IncSearch = { fg = "#050a08", bg = "#6baa50" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#050a08", bg = "#538c21" },
+    Pmenu = { fg = "#c8e8d0", bg = "#152910" },
+    PmenuSel = { fg = "#c8e8d0", bg = "#17290e" },
+    PmenuSbar = { bg = "#171e1c" },
+    PmenuThumb = { bg = "#6c9587" },
+    ErrorMsg = { fg = "#538c21" },
+    WarningMsg = { fg = "#6baa50" },
+    ModeMsg = { fg = "#c8e8d0", bold = true },
+    MoreMsg = { fg = "#c8e8b0" },
+    Question = { fg = "#c8e8b0" },
+    TabLine = { fg = "#6c9587", bg = "#152910" },
+    TabLineFill = { bg = "#050a08" },
+    TabLineSel = { fg = "#c8e8d0", bg = "#050a08", bold = true },
+    StatusLine = { fg = "#c8e8d0", bg = "#152910" },
+    StatusLineNC = { fg = "#6c9587", bg = "#152910" },
+    DiffAdd = { bg = "#1e280b" },
+    DiffChange = { bg = "#142212" },
+    DiffDelete = { fg = "#538c21", bg = "#101d0b" },
+    DiffText = { bg = "#233a1d" },
+    SpellBad = { sp = "#538c21", undercurl = true },
+    SpellCap = { sp = "#6baa50", undercurl = true },
+    SpellLocal = { sp = "#c8e8b0", undercurl = true },
+    SpellRare = { sp = "#62A527", undercurl = true },
+    Comment = { fg = "#1E483C" },
+    Constant = { fg = "#6baa50" },
+    String = { fg = "#ACD322" },
+    Character = { fg = "#ACD322" },
+    Number = { fg = "#6baa50" },
+    Boolean = { fg = "#6baa50" },
+    Float = { fg = "#6baa50" },
+    Identifier = { fg = "#c8e8d0" },
+    Function = { fg = "#c8e8b0" },
+    Statement = { fg = "#62A527" },
+    Conditional = { fg = "#62A527" },
+    Repeat = { fg = "#62A527" },
+    Label = { fg = "#62A527" },
+    Operator = { fg = "#6c9587" },
+    Keyword = { fg = "#62A527" },
+    Exception = { fg = "#62A527" },
+    PreProc = { fg = "#62A527" },
+    Include = { fg = "#62A527" },
+    Define = { fg = "#62A527" },
+    Macro = { fg = "#62A527" },
+    PreCondit = { fg = "#62A527" },
+    Type = { fg = "#62A527" },
+    StorageClass = { fg = "#62A527" },
+    Structure = { fg = "#62A527" },
+    Typedef = { fg = "#62A527" },
+    Special = { fg = "#81b752" },
+    SpecialChar = { fg = "#81b752" },
+    Tag = { fg = "#ACD322" },
+    Delimiter = { fg = "#6c9587" },
+    SpecialComment = { fg = "#1E483C", italic = true },
+    Debug = { fg = "#6baa50" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#1E483C" },
+    Error = { fg = "#538c21" },
+    Todo = { fg = "#050a08", bg = "#62A527", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#c8e8d0" },
+      ["@variable.builtin"] = { fg = "#62A527" },
+      ["@variable.parameter"] = { fg = "#c8e8d0", italic = true },
+      ["@variable.member"] = { fg = "#c8e8d0" },
+      ["@constant"] = { fg = "#6baa50" },
+      ["@constant.builtin"] = { fg = "#6baa50" },
+      ["@module"] = { fg = "#c8e8d0" },
+      ["@label"] = { fg = "#62A527" },
+      ["@type"] = { fg = "#62A527" },
+      ["@type.builtin"] = { fg = "#62A527" },
+      ["@attribute"] = { fg = "#6baa50" },
+      ["@property"] = { fg = "#c8e8d0" },
+      ["@function"] = { fg = "#c8e8b0" },
+      ["@function.builtin"] = { fg = "#c8e8b0" },
+      ["@function.call"] = { fg = "#c8e8b0" },
+      ["@function.method"] = { fg = "#c8e8b0" },
+      ["@constructor"] = { fg = "#62A527" },
+      ["@operator"] = { fg = "#6c9587" },
+      ["@keyword"] = { fg = "#62A527" },
+      ["@keyword.conditional"] = { fg = "#62A527" },
+      ["@keyword.function"] = { fg = "#62A527" },
+      ["@keyword.operator"] = { fg = "#62A527" },
+      ["@keyword.return"] = { fg = "#62A527" },
+      ["@punctuation.bracket"] = { fg = "#6c9587" },
+      ["@punctuation.delimiter"] = { fg = "#6c9587" },
+      ["@punctuation.special"] = { fg = "#81b752" },
+      ["@string"] = { fg = "#ACD322" },
+      ["@string.escape"] = { fg = "#81b752" },
+      ["@string.regexp"] = { fg = "#81b752" },
+      ["@character"] = { fg = "#ACD322" },
+      ["@boolean"] = { fg = "#6baa50" },
+      ["@number"] = { fg = "#6baa50" },
+      ["@comment"] = { fg = "#1E483C", italic = true },
+      ["@comment.todo"] = { fg = "#050a08", bg = "#62A527", bold = true },
+      ["@comment.error"] = { fg = "#538c21", bold = true },
+      ["@comment.warning"] = { fg = "#6baa50", bold = true },
+      ["@comment.note"] = { fg = "#c8e8b0", bold = true },
+      ["@markup.heading"] = { fg = "#62A527", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#ACD322" },
+      ["@markup.link"] = { fg = "#c8e8b0", underline = true },
+      ["@tag"] = { fg = "#ACD322" },
+      ["@tag.attribute"] = { fg = "#6baa50" },
+      ["@tag.delimiter"] = { fg = "#6c9587" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#538c21" },
+      DiagnosticWarn = { fg = "#6baa50" },
+      DiagnosticInfo = { fg = "#c8e8b0" },
+      DiagnosticHint = { fg = "#62A527" },
+      DiagnosticUnderlineError = { sp = "#538c21", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#6baa50", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#c8e8b0", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#62A527", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#538c21", bg = "#0c170a" },
+      DiagnosticVirtualTextWarn = { fg = "#6baa50", bg = "#0f1a0f" },
+      DiagnosticVirtualTextInfo = { fg = "#c8e8b0", bg = "#182018" },
+      DiagnosticVirtualTextHint = { fg = "#62A527", bg = "#0e190b" },
+      LspReferenceText = { bg = "#18201c" },
+      LspReferenceRead = { bg = "#18201c" },
+      LspReferenceWrite = { bg = "#222b26" },
+      LspSignatureActiveParameter = { fg = "#62A527", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#ACD322" },
+      GitSignsChange = { fg = "#6baa50" },
+      GitSignsDelete = { fg = "#538c21" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#c8e8d0", bg = "#050a08" },
+      TelescopeBorder = { fg = "#171e1c", bg = "#050a08" },
+      TelescopePromptTitle = { fg = "#050a08", bg = "#62A527", bold = true },
+      TelescopePreviewTitle = { fg = "#050a08", bg = "#ACD322", bold = true },
+      TelescopeResultsTitle = { fg = "#050a08", bg = "#c8e8b0", bold = true },
+      TelescopeSelection = { bg = "#17290e" },
+      TelescopeMatching = { fg = "#62A527", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#62A527", bold = true },
+      CmpItemKindVariable = { fg = "#c8e8d0" },
+      CmpItemKindFunction = { fg = "#c8e8b0" },
+      CmpItemKindKeyword = { fg = "#62A527" },
+      CmpItemKindClass = { fg = "#62A527" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#171e1c" },
+      IblScope = { fg = "#1E483C" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#050a08", bg = "#62A527", bold = true },
+      LazyButton = { fg = "#c8e8d0", bg = "#171e1c" },
+      LazyButtonActive = { fg = "#050a08", bg = "#62A527" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#538c21" },
+      NotifyWARNBorder = { fg = "#6baa50" },
+      NotifyINFOBorder = { fg = "#c8e8b0" },
+      NotifyDEBUGBorder = { fg = "#1E483C" },
+      NotifyTRACEBorder = { fg = "#62A527" },
+    },
+  },
+}
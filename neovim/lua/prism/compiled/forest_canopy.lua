@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Forest Canopy
+-- Auto-generated by sync_themes.py from vscode/themes/forest_canopy.json - DO NOT EDIT
+
+return {
+  name = "Forest Canopy",
+  mode = "dark",
+  palette = {
+    base00 = "#0a100a",
+    base01 = "#101810",
+    base02 = "#1e251e",
+    base03 = "#508050",
+    base04 = "#8fb38e",
+    base05 = "#d0e8d0",
+    base06 = "#e0f9e0",
+    base07 = "#efffef",
+    base08 = "#7ab75f",
+    base09 = "#a6df8c",
+    base0A = "#90d870",
+    base0B = "#b1e39a",
+    base0C = "#a6df8c",
+    base0D = "#abe193",
+    base0E = "#90d870",
+    base0F = "#508050",
+  },
+  terminal = {
+    "#0a100a", "#7ab75f", "#9bdb7e", "#739973",
+    "#90d870", "#6ca254", "#a6df8c", "#d0e8d0",
+    "#508050", "#90d870", "#a6df8c", "#d0e8d0",
+    "#a0dd85", "#81c264", "#b1e39a", "#d4ead4",
+  },
+  groups = {
+    Normal = { fg = "#d0e8d0", bg = "#0a100a" },
+    NormalFloat = { fg = "#d0e8d0", bg = "#101810" },
+    NormalNC = { fg = "#d0e8d0", bg = "#0a100a" },
+    Cursor = { fg = "#0a100a", bg = "#90d870" },
+    CursorLine = { bg = "#131a13" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#0f160f" },
+    LineNr = { fg = "#508050" },
+    CursorLineNr = { fg = "#d0e8d0", bold = true },
+    SignColumn = { fg = "#508050", bg = "#0a100a" },
+    VertSplit = { fg = "#1e251e" },
+    WinSeparator = { fg = "#1e251e" },
+    Folded = { fg = "#508050", bg = "#101810" },
+    FoldColumn = { fg = "#508050" },
+    NonText = { fg = "#508050" },
+    SpecialKey = { fg = "#508050" },
+    Whitespace = { fg = "#2d482d" },
+    MatchParen = { fg = "#90d870", bold = true },
+    Visual = { bg = "#324c28" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#0a100a", bg = "#90d870" },
+    IncSearch = { fg = "#0a100a", bg = "#a6df8c" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#0a100a", bg = "#7ab75f" },
+    Pmenu = { fg = "#d0e8d0", bg = "#101810" },
+    PmenuSel = { fg = "#d0e8d0", bg = "#24381e" },
+    PmenuSbar = { bg = "#1e251e" },
+    PmenuThumb = { bg = "#8fb38e" },
+    ErrorMsg = { fg = "#7ab75f" },
+    WarningMsg = { fg = "#a6df8c" },
+    ModeMsg = { fg = "#d0e8d0", bold = true },
+    MoreMsg = { fg = "#abe193" },
+    Question = { fg = "#abe193" },
+    TabLine = { fg = "#8fb38e", bg = "#101810" },
+    TabLineFill = { bg = "#0a100a" },
+    TabLineSel = { fg = "#d0e8d0", bg = "#0a100a", bold = true },
+    StatusLine = { fg = "#d0e8d0", bg = "#101810" },
+    StatusLineNC = { fg = "#8fb38e", bg = "#101810" },
+    DiffAdd = { bg = "#232f1f" },
+    DiffChange = { bg = "#212f1d" },
+    DiffDelete = { fg = "#7ab75f", bg = "#1a2916" },
+    DiffText = { bg = "#384e31" },
+    SpellBad = { sp = "#7ab75f", undercurl = true },
+    SpellCap = { sp = "#a6df8c", undercurl = true },
+    SpellLocal = { sp = "#abe193", undercurl = true },
+    SpellRare = { sp = "#90d870", undercurl = true },
+    Comment = { fg = "#508050" },
+    Constant = { fg = "#a6df8c" },
+    String = { fg = "#b1e39a" },
+    Character = { fg = "#b1e39a" },
+    Number = { fg = "#a6df8c" },
+    Boolean = { fg = "#a6df8c" },
+    Float = { fg = "#a6df8c" },
+    Identifier = { fg = "#d0e8d0" },
+    Function = { fg = "#abe193" },
+    Statement = { fg = "#90d870" },
+    Conditional = { fg = "#90d870" },
+    Repeat = { fg = "#90d870" },
+    Label = { fg = "#90d870" },
+    Operator = { fg = "#8fb38e" },
+    Keyword = { fg = "#90d870" },
+    Exception = { fg = "#90d870" },
+    PreProc = { fg = "#90d870" },
+    Include = { fg = "#90d870" },
+    Define = { fg = "#90d870" },
+    Macro = { fg = "#90d870" },
+    PreCondit = { fg = "#90d870" },
+    Type = { fg = "#d0e8d0" },
+    StorageClass = { fg = "#90d870" },
+    Structure = { fg = "#d0e8d0" },
+    Typedef = { fg = "#d0e8d0" },
+    Special = { fg = "#a6df8c" },
+    SpecialChar = { fg = "#a6df8c" },
+    Tag = { fg = "#b1e39a" },
+    Delimiter = { fg = "#8fb38e" },
+    SpecialComment = { fg = "#508050", italic = true },
+    Debug = { fg = "#a6df8c" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#508050" },
+    Error = { fg = "#7ab75f" },
+    Todo = { fg = "#0a100a", bg = "#90d870", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#d0e8d0" },
+      ["@variable.builtin"] = { fg = "#90d870" },
+      ["@variable.parameter"] = { fg = "#d0e8d0", italic = true },
+      ["@variable.member"] = { fg = "#d0e8d0" },
+      ["@constant"] = { fg = "#a6df8c" },
+      ["@constant.builtin"] = { fg = "#a6df8c" },
+      ["@module"] = { fg = "#d0e8d0" },
+      ["@label"] = { fg = "#90d870" },
+      ["@type"] = { fg = "#d0e8d0" },
+      ["@type.builtin"] = { fg = "#d0e8d0" },
+      ["@attribute"] = { fg = "#d2e9d2" },
+      ["@property"] = { fg = "#d0e8d0" },
+      ["@function"] = { fg = "#abe193" },
+      ["@function.builtin"] = { fg = "#abe193" },
+      ["@function.call"] = { fg = "#abe193" },
+      ["@function.method"] = { fg = "#abe193" },
+      ["@constructor"] = { fg = "#d0e8d0" },
+      ["@operator"] = { fg = "#8fb38e" },
+      ["@keyword"] = { fg = "#90d870" },
+      ["@keyword.conditional"] = { fg = "#90d870" },
+      ["@keyword.function"] = { fg = "#90d870" },
+      ["@keyword.operator"] = { fg = "#90d870" },
+      ["@keyword.return"] = { fg = "#90d870" },
+      ["@punctuation.bracket"] = { fg = "#8fb38e" },
+      ["@punctuation.delimiter"] = { fg = "#8fb38e" },
+      ["@punctuation.special"] = { fg = "#a6df8c" },
+      ["@string"] = { fg = "#b1e39a" },
+      ["@string.escape"] = { fg = "#a6df8c" },
+      ["@string.regexp"] = { fg = "#a6df8c" },
+      ["@character"] = { fg = "#b1e39a" },
+      ["@boolean"] = { fg = "#a6df8c" },
+      ["@number"] = { fg = "#a6df8c" },
+      ["@comment"] = { fg = "#508050", italic = true },
+      ["@comment.todo"] = { fg = "#0a100a", bg = "#90d870", bold = true },
+      ["@comment.error"] = { fg = "#7ab75f", bold = true },
+      ["@comment.warning"] = { fg = "#a6df8c", bold = true },
+      ["@comment.note"] = { fg = "#abe193", bold = true },
+      ["@markup.heading"] = { fg = "#90d870", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#b1e39a" },
+      ["@markup.link"] = { fg = "#abe193", underline = true },
+      ["@tag"] = { fg = "#b1e39a" },
+      ["@tag.attribute"] = { fg = "#d2e9d2" },
+      ["@tag.delimiter"] = { fg = "#8fb38e" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#7ab75f" },
+      DiagnosticWarn = { fg = "#a6df8c" },
+      DiagnosticInfo = { fg = "#abe193" },
+      DiagnosticHint = { fg = "#90d870" },
+      DiagnosticUnderlineError = { sp = "#7ab75f", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#a6df8c", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#abe193", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#90d870", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#7ab75f", bg = "#152012" },
+      DiagnosticVirtualTextWarn = { fg = "#a6df8c", bg = "#192417" },
+      DiagnosticVirtualTextInfo = { fg = "#abe193", bg = "#1a2417" },
+      DiagnosticVirtualTextHint = { fg = "#90d870", bg = "#172414" },
+      LspReferenceText = { bg = "#1d251d" },
+      LspReferenceRead = { bg = "#1d251d" },
+      LspReferenceWrite = { bg = "#273027" },
+      LspSignatureActiveParameter = { fg = "#90d870", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#b1e39a" },
+      GitSignsChange = { fg = "#a6df8c" },
+      GitSignsDelete = { fg = "#7ab75f" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#d0e8d0", bg = "#0a100a" },
+      TelescopeBorder = { fg = "#1e251e", bg = "#0a100a" },
+      TelescopePromptTitle = { fg = "#0a100a", bg = "#90d870", bold = true },
+      TelescopePreviewTitle = { fg = "#0a100a", bg = "#b1e39a", bold = true },
+      TelescopeResultsTitle = { fg = "#0a100a", bg = "#abe193", bold = true },
+      TelescopeSelection = { bg = "#24381e" },
+      TelescopeMatching = { fg = "#90d870", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#90d870", bold = true },
+      CmpItemKindVariable = { fg = "#d0e8d0" },
+      CmpItemKindFunction = { fg = "#abe193" },
+      CmpItemKindKeyword = { fg = "#90d870" },
+      CmpItemKindClass = { fg = "#d0e8d0" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#1e251e" },
+      IblScope = { fg = "#508050" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#0a100a", bg = "#90d870", bold = true },
+      LazyButton = { fg = "#d0e8d0", bg = "#1e251e" },
+      LazyButtonActive = { fg = "#0a100a", bg = "#90d870" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#7ab75f" },
+      NotifyWARNBorder = { fg = "#a6df8c" },
+      NotifyINFOBorder = { fg = "#abe193" },
+      NotifyDEBUGBorder = { fg = "#508050" },
+      NotifyTRACEBorder = { fg = "#90d870" },
+    },
+  },
+}
@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Ghost
+-- Auto-generated by sync_themes.py from vscode/themes/ghost.json - DO NOT EDIT
+
+return {
+  name = "Ghost",
+  mode = "light",
+  palette = {
+    base00 = "#e8ecf0",
+    base01 = "#dce2e9",
+    base02 = "#cbcfd2",
+    base03 = "#7a8a9c",
+    base04 = "#586676",
+    base05 = "#384452",
+    base06 = "#2b3744",
+    base07 = "#1f2a37",
+    base08 = "#366ca6",
+    base09 = "#70a0d0",
+    base0A = "#4080c4",
+    base0B = "#4080c4",
+    base0C = "#5c93cc",
+    base0D = "#305888",
+    base0E = "#2060a0",
+    base0F = "#7a8a9c",
+  },
+  terminal = {
+    "#384452", "#366ca6", "#538cc9", "#7a8a9c",
+    "#4080c4", "#306093", "#5c93cc", "#e8ecf0",
+    "#7a8a9c", "#4080c4", "#5c93cc", "#8795a5",
+    "#538cc9", "#3973b0", "#6f9fd2", "#e9ecf0",
+  },
+  groups = {
+    Normal = { fg = "#384452", bg = "#e8ecf0" },
+    NormalFloat = { fg = "#384452", bg = "#dce2e9" },
+    NormalNC = { fg = "#384452", bg = "#e8ecf0" },
+    Cursor = { fg = "#e8ecf0", bg = "#4080c4" },
+    CursorLine = { bg = "#dfe3e8" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#e2e6eb" },
+    LineNr = { fg = "#7a8a9c" },
+    CursorLineNr = { fg = "#384452", bold = true },
+    SignColumn = { fg = "#7a8a9c", bg = "#e8ecf0" },
+    VertSplit = { fg = "#cbcfd2" },
+    WinSeparator = { fg = "#cbcfd2" },
+    Folded = { fg = "#7a8a9c", bg = "#dce2e9" },
+    FoldColumn = { fg = "#7a8a9c" },
+    NonText = { fg = "#7a8a9c" },
+    SpecialKey = { fg = "#7a8a9c" },
+    Whitespace = { fg = "#b1bbc6" },
+    MatchParen = { fg = "#4080c4", bold = true },
+    Visual = { bg = "#b5cbe2" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#e8ecf0", bg = "#4080c4" },
+    IncSearch = { fg = "#e8ecf0", bg = "#70a0d0" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#e8ecf0", bg = "#366ca6" },
+    Pmenu = { fg = "#384452", bg = "#dce2e9" },
+    PmenuSel = { fg = "#384452", bg = "#c6d6e7" },
+    PmenuSbar = { bg = "#cbcfd2" },
+    PmenuThumb = { bg = "#586676" },
+    ErrorMsg = { fg = "#366ca6" },
+    WarningMsg = { fg = "#70a0d0" },
+    ModeMsg = { fg = "#384452", bold = true },
+    MoreMsg = { fg = "#305888" },
+    Question = { fg = "#305888" },
+    TabLine = { fg = "#586676", bg = "#dce2e9" },
+    TabLineFill = { bg = "#e8ecf0" },
+    TabLineSel = { fg = "#384452", bg = "#e8ecf0", bold = true },
+    StatusLine = { fg = "#384452", bg = "#dce2e9" },
+    StatusLineNC = { fg = "#586676", bg = "#dce2e9" },
+    DiffAdd = { bg = "#cedbe9" },
+    DiffChange = { bg = "#d6e0eb" },
+    DiffDelete = { fg = "#366ca6", bg = "#cdd8e4" },
+    DiffText = { bg = "#c3d5e6" },
+    SpellBad = { sp = "#366ca6", undercurl = true },
+    SpellCap = { sp = "#70a0d0", undercurl = true },
+    SpellLocal = { sp = "#305888", undercurl = true },
+    SpellRare = { sp = "#2060a0", undercurl = true },
+    Comment = { fg = "#7a8a9c" },
+    Constant = { fg = "#70a0d0" },
+    String = { fg = "#4080c4" },
+    Character = { fg = "#4080c4" },
+    Number = { fg = "#70a0d0" },
+    Boolean = { fg = "#70a0d0" },
+    Float = { fg = "#70a0d0" },
+    Identifier = { fg = "#384452" },
+    Function = { fg = "#305888" },
+    Statement = { fg = "#2060a0" },
+    Conditional = { fg = "#2060a0" },
+    Repeat = { fg = "#2060a0" },
+    Label = { fg = "#2060a0" },
+    Operator = { fg = "#586676" },
+    Keyword = { fg = "#2060a0" },
+    Exception = { fg = "#2060a0" },
+    PreProc = { fg = "#2060a0" },
+    Include = { fg = "#2060a0" },
+    Define = { fg = "#2060a0" },
+    Macro = { fg = "#2060a0" },
+    PreCondit = { fg = "#2060a0" },
+    Type = { fg = "#2060a0" },
+    StorageClass = { fg = "#2060a0" },
+    Structure = { fg = "#2060a0" },
+    Typedef = { fg = "#2060a0" },
+    Special = { fg = "#5c93cc" },
+    SpecialChar = { fg = "#5c93cc" },
+    Tag = { fg = "#4080c4" },
+    Delimiter = { fg = "#586676" },
+    SpecialComment = { fg = "#7a8a9c", italic = true },
+    Debug = { fg = "#70a0d0" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#7a8a9c" },
+    Error = { fg = "#366ca6" },
+    Todo = { fg = "#e8ecf0", bg = "#4080c4", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#384452" },
+      ["@variable.builtin"] = { fg = "#2060a0" },
+      ["@variable.parameter"] = { fg = "#384452", italic = true },
+      ["@variable.member"] = { fg = "#384452" },
+      ["@constant"] = { fg = "#70a0d0" },
+      ["@constant.builtin"] = { fg = "#70a0d0" },
+      ["@module"] = { fg = "#384452" },
+      ["@label"] = { fg = "#2060a0" },
+      ["@type"] = { fg = "#2060a0" },
+      ["@type.builtin"] = { fg = "#2060a0" },
+      ["@attribute"] = { fg = "#70a0d0" },
+      ["@property"] = { fg = "#384452" },
+      ["@function"] = { fg = "#305888" },
+      ["@function.builtin"] = { fg = "#305888" },
+      ["@function.call"] = { fg = "#305888" },
+      ["@function.method"] = { fg = "#305888" },
+      ["@constructor"] = { fg = "#2060a0" },
+      ["@operator"] = { fg = "#586676" },
+      ["@keyword"] = { fg = "#2060a0" },
+      ["@keyword.conditional"] = { fg = "#2060a0" },
+      ["@keyword.function"] = { fg = "#2060a0" },
+      ["@keyword.operator"] = { fg = "#2060a0" },
+      ["@keyword.return"] = { fg = "#2060a0" },
+      ["@punctuation.bracket"] = { fg = "#586676" },
+      ["@punctuation.delimiter"] = { fg = "#586676" },
+      ["@punctuation.special"] = { fg = "#5c93cc" },
+      ["@string"] = { fg = "#4080c4" },
+      ["@string.escape"] = { fg = "#5c93cc" },
+      ["@string.regexp"] = { fg = "#5c93cc" },
+      ["@character"] = { fg = "#4080c4" },
+      ["@boolean"] = { fg = "#70a0d0" },
+      ["@number"] = { fg = "#70a0d0" },
+      ["@comment"] = { fg = "#7a8a9c", italic = true },
+      ["@comment.todo"] = { fg = "#e8ecf0", bg = "#4080c4", bold = true },
+      ["@comment.error"] = { fg = "#366ca6", bold = true },
+      ["@comment.warning"] = { fg = "#70a0d0", bold = true },
+      ["@comment.note"] = { fg = "#305888", bold = true },
+      ["@markup.heading"] = { fg = "#2060a0", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#4080c4" },
+      ["@markup.link"] = { fg = "#305888", underline = true },
+      ["@tag"] = { fg = "#4080c4" },
+      ["@tag.attribute"] = { fg = "#70a0d0" },
+      ["@tag.delimiter"] = { fg = "#586676" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#366ca6" },
+      DiagnosticWarn = { fg = "#70a0d0" },
+      DiagnosticInfo = { fg = "#305888" },
+      DiagnosticHint = { fg = "#4080c4" },
+      DiagnosticUnderlineError = { sp = "#366ca6", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#70a0d0", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#305888", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#4080c4", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#366ca6", bg = "#d6dfe8" },
+      DiagnosticVirtualTextWarn = { fg = "#70a0d0", bg = "#dce4ec" },
+      DiagnosticVirtualTextInfo = { fg = "#305888", bg = "#d5dde5" },
+      DiagnosticVirtualTextHint = { fg = "#4080c4", bg = "#d7e1eb" },
+      LspReferenceText = { bg = "#d6dbe0" },
+      LspReferenceRead = { bg = "#d6dbe0" },
+      LspReferenceWrite = { bg = "#cdd2d8" },
+      LspSignatureActiveParameter = { fg = "#4080c4", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#4080c4" },
+      GitSignsChange = { fg = "#70a0d0" },
+      GitSignsDelete = { fg = "#366ca6" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#384452", bg = "#e8ecf0" },
+      TelescopeBorder = { fg = "#cbcfd2", bg = "#e8ecf0" },
+      TelescopePromptTitle = { fg = "#e8ecf0", bg = "#4080c4", bold = true },
+      TelescopePreviewTitle = { fg = "#e8ecf0", bg = "#4080c4", bold = true },
+      TelescopeResultsTitle = { fg = "#e8ecf0", bg = "#305888", bold = true },
+      TelescopeSelection = { bg = "#c6d6e7" },
+      TelescopeMatching = { fg = "#4080c4", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#4080c4", bold = true },
+      CmpItemKindVariable = { fg = "#384452" },
+      CmpItemKindFunction = { fg = "#305888" },
+      CmpItemKindKeyword = { fg = "#2060a0" },
+      CmpItemKindClass = { fg = "#2060a0" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#cbcfd2" },
+      IblScope = { fg = "#7a8a9c" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#e8ecf0", bg = "#4080c4", bold = true },
+      LazyButton = { fg = "#384452", bg = "#cbcfd2" },
+      LazyButtonActive = { fg = "#e8ecf0", bg = "#4080c4" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#366ca6" },
+      NotifyWARNBorder = { fg = "#70a0d0" },
+      NotifyINFOBorder = { fg = "#305888" },
+      NotifyDEBUGBorder = { fg = "#7a8a9c" },
+      NotifyTRACEBorder = { fg = "#2060a0" },
+    },
+  },
+}
@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Github
+-- Auto-generated by sync_themes.py from vscode/themes/github.json - DO NOT EDIT
+
+return {
+  name = "Github",
+  mode = "dark",
+  palette = {
+    base00 = "#22272e",
+    base01 = "#2d333b",
+    base02 = "#383e45",
+    base03 = "#545d68",
+    base04 = "#949ca5",
+    base05 = "#d8e0e7",
+    base06 = "#e8f1f8",
+    base07 = "#f8ffff",
+    base08 = "#4793d8",
+    base09 = "#76beff",
+    base0A = "#54aeff",
+    base0B = "#87c6ff",
+    base0C = "#76beff",
+    base0D = "#7ec2ff",
+    base0E = "#54aeff",
+    base0F = "#545d68",
+  },
+  terminal = {
+    "#22272e", "#4793d8", "#65b6ff", "#767d86",
+    "#54aeff", "#3f82bf", "#76beff", "#d8e0e7",
+    "#545d68", "#54aeff", "#76beff", "#d8e0e7",
+    "#6dbaff", "#4b9ce5", "#87c6ff", "#dbe3e9",
+  },
+  groups = {
+    Normal = { fg = "#d8e0e7", bg = "#22272e" },
+    NormalFloat = { fg = "#d8e0e7", bg = "#2d333b" },
+    NormalNC = { fg = "#d8e0e7", bg = "#22272e" },
+    Cursor = { fg = "#22272e", bg = "#54aeff" },
+    CursorLine = { bg = "#2b3037" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#272c33" },
+    LineNr = { fg = "#545d68" },
+    CursorLineNr = { fg = "#d8e0e7", bold = true },
+    SignColumn = { fg = "#545d68", bg = "#22272e" },
+    VertSplit = { fg = "#383e45" },
+    WinSeparator = { fg = "#383e45" },
+    Folded = { fg = "#545d68", bg = "#2d333b" },
+    FoldColumn = { fg = "#545d68" },
+    NonText = { fg = "#545d68" },
+    SpecialKey = { fg = "#545d68" },
+    Whitespace = { fg = "#3b424b" },
+    MatchParen = { fg = "#54aeff", bold = true },
+    Visual = { bg = "#314f6c" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#22272e", bg = "#54aeff" },
+    IncSearch = { fg = "#22272e", bg = "#76beff" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#22272e", bg = "#4793d8" },
+    Pmenu = { fg = "#d8e0e7", bg = "#2d333b" },
+    PmenuSel = { fg = "#d8e0e7", bg = "#2c4257" },
+    PmenuSbar = { bg = "#383e45" },
+    PmenuThumb = { bg = "#949ca5" },
+    ErrorMsg = { fg = "#4793d8" },
+    WarningMsg = { fg = "#76beff" },
+    ModeMsg = { fg = "#d8e0e7", bold = true },
+    MoreMsg = { fg = "#7ec2ff" },
+    Question = { fg = "#7ec2ff" },
+    TabLine = { fg = "#949ca5", bg = "#2d333b" },
+    TabLineFill = { bg = "#22272e" },
+    TabLineSel = { fg = "#d8e0e7", bg = "#22272e", bold = true },
+    StatusLine = { fg = "#d8e0e7", bg = "#2d333b" },
+    StatusLineNC = { fg = "#949ca5", bg = "#2d333b" },
+    DiffAdd = { bg = "#313e4d" },
+    DiffChange = { bg = "#2e3d4d" },
+    DiffDelete = { fg = "#4793d8", bg = "#273747" },
+    DiffText = { bg = "#3b546c" },
+    SpellBad = { sp = "#4793d8", undercurl = true },
+    SpellCap = { sp = "#76beff", undercurl = true },
+    SpellLocal = { sp = "#7ec2ff", undercurl = true },
+    SpellRare = { sp = "#54aeff", undercurl = true },
+    Comment = { fg = "#545d68" },
+    Constant = { fg = "#76beff" },
+    String = { fg = "#87c6ff" },
+    Character = { fg = "#87c6ff" },
+    Number = { fg = "#76beff" },
+    Boolean = { fg = "#76beff" },
+    Float = { fg = "#76beff" },
+    Identifier = { fg = "#d8e0e7" },
+    Function = { fg = "#7ec2ff" },
+    Statement = { fg = "#54aeff" },
+    Conditional = { fg = "#54aeff" },
+    Repeat = { fg = "#54aeff" },
+    Label = { fg = "#54aeff" },
+    Operator = { fg = "#949ca5" },
+    Keyword = { fg = "#54aeff" },
+    Exception = { fg = "#54aeff" },
+    PreProc = { fg = "#54aeff" },
+    Include = { fg = "#54aeff" },
+    Define = { fg = "#54aeff" },
+    Macro = { fg = "#54aeff" },
+    PreCondit = { fg = "#54aeff" },
+    Type = { fg = "#d8e0e7" },
+    StorageClass = { fg = "#54aeff" },
+    Structure = { fg = "#d8e0e7" },
+    Typedef = { fg = "#d8e0e7" },
+    Special = { fg = "#76beff" },
+    SpecialChar = { fg = "#76beff" },
+    Tag = { fg = "#87c6ff" },
+    Delimiter = { fg = "#949ca5" },
+    SpecialComment = { fg = "#545d68", italic = true },
+    Debug = { fg = "#76beff" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#545d68" },
+    Error = { fg = "#4793d8" },
+    Todo = { fg = "#22272e", bg = "#54aeff", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#d8e0e7" },
+      ["@variable.builtin"] = { fg = "#54aeff" },
+      ["@variable.parameter"] = { fg = "#d8e0e7", italic = true },
+      ["@variable.member"] = { fg = "#d8e0e7" },
+      ["@constant"] = { fg = "#76beff" },
+      ["@constant.builtin"] = { fg = "#76beff" },
+      ["@module"] = { fg = "#d8e0e7" },
+      ["@label"] = { fg = "#54aeff" },
+      ["@type"] = { fg = "#d8e0e7" },
+      ["@type.builtin"] = { fg = "#d8e0e7" },
+      ["@attribute"] = { fg = "#d9e1e8" },
+      ["@property"] = { fg = "#d8e0e7" },
+      ["@function"] = { fg = "#7ec2ff" },
+      ["@function.builtin"] = { fg = "#7ec2ff" },
+      ["@function.call"] = { fg = "#7ec2ff" },
+      ["@function.method"] = { fg = "#7ec2ff" },
+      ["@constructor"] = { fg = "#d8e0e7" },
+      ["@operator"] = { fg = "#949ca5" },
+      ["@keyword"] = { fg = "#54aeff" },
+      ["@keyword.conditional"] = { fg = "#54aeff" },
+      ["@keyword.function"] = { fg = "#54aeff" },
+      ["@keyword.operator"] = { fg = "#54aeff" },
+      ["@keyword.return"] = { fg = "#54aeff" },
+      ["@punctuation.bracket"] = { fg = "#949ca5" },
+      ["@punctuation.delimiter"] = { fg = "#949ca5" },
+      ["@punctuation.special"] = { fg = "#76beff" },
+      ["@string"] = { fg = "#87c6ff" },
+      ["@string.escape"] = { fg = "#76beff" },
+      ["@string.regexp"] = { fg = "#76beff" },
+      ["@character"] = { fg = "#87c6ff" },
+      ["@boolean"] = { fg = "#76beff" },
+      ["@number"] = { fg = "#76beff" },
+      ["@comment"] = { fg = "#545d68", italic = true },
+      ["@comment.todo"] = { fg = "#22272e", bg = "#54aeff", bold = true },
+      ["@comment.error"] = { fg = "#4793d8", bold = true },
+      ["@comment.warning"] = { fg = "#76beff", bold = true },
+      ["@comment.note"] = { fg = "#7ec2ff", bold = true },
+      ["@markup.heading"] = { fg = "#54aeff", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#87c6ff" },
+      ["@markup.link"] = { fg = "#7ec2ff", underline = true },
+      ["@tag"] = { fg = "#87c6ff" },
+      ["@tag.attribute"] = { fg = "#d9e1e8" },
+      ["@tag.delimiter"] = { fg = "#949ca5" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#4793d8" },
+      DiagnosticWarn = { fg = "#76beff" },
+      DiagnosticInfo = { fg = "#7ec2ff" },
+      DiagnosticHint = { fg = "#54aeff" },
+      DiagnosticUnderlineError = { sp = "#4793d8", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#76beff", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#7ec2ff", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#54aeff", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#4793d8", bg = "#25313f" },
+      DiagnosticVirtualTextWarn = { fg = "#76beff", bg = "#2a3642" },
+      DiagnosticVirtualTextInfo = { fg = "#7ec2ff", bg = "#2b3642" },
+      DiagnosticVirtualTextHint = { fg = "#54aeff", bg = "#273442" },
+      LspReferenceText = { bg = "#343940" },
+      LspReferenceRead = { bg = "#343940" },
+      LspReferenceWrite = { bg = "#3d4249" },
+      LspSignatureActiveParameter = { fg = "#54aeff", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#87c6ff" },
+      GitSignsChange = { fg = "#76beff" },
+      GitSignsDelete = { fg = "#4793d8" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#d8e0e7", bg = "#22272e" },
+      TelescopeBorder = { fg = "#383e45", bg = "#22272e" },
+      TelescopePromptTitle = { fg = "#22272e", bg = "#54aeff", bold = true },
+      TelescopePreviewTitle = { fg = "#22272e", bg = "#87c6ff", bold = true },
+      TelescopeResultsTitle = { fg = "#22272e", bg = "#7ec2ff", bold = true },
+      TelescopeSelection = { bg = "#2c4257" },
+      TelescopeMatching = { fg = "#54aeff", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#54aeff", bold = true },
+      CmpItemKindVariable = { fg = "#d8e0e7" },
+      CmpItemKindFunction = { fg = "#7ec2ff" },
+      CmpItemKindKeyword = { fg = "#54aeff" },
+      CmpItemKindClass = { fg = "#d8e0e7" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#383e45" },
+      IblScope = { fg = "#545d68" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#22272e", bg = "#54aeff", bold = true },
+      LazyButton = { fg = "#d8e0e7", bg = "#383e45" },
+      LazyButtonActive = { fg = "#22272e", bg = "#54aeff" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#4793d8" },
+      NotifyWARNBorder = { fg = "#76beff" },
+      NotifyINFOBorder = { fg = "#7ec2ff" },
+      NotifyDEBUGBorder = { fg = "#545d68" },
+      NotifyTRACEBorder = { fg = "#54aeff" },
+    },
+  },
+}
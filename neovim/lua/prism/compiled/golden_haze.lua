@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Golden Haze
+-- Auto-generated by sync_themes.py from vscode/themes/golden_haze.json - DO NOT EDIT
+
+return {
+  name = "Golden Haze",
+  mode = "light",
+  palette = {
+    base00 = "#e8eaee",
+    base01 = "#dbdde1",
+    base02 = "#cbcdd0",
+    base03 = "#585048",
+    base04 = "#3a352f",
+    base05 = "#1a1c20",
+    base06 = "#0f1114",
+    base07 = "#05070a",
+    base08 = "#ab7503",
+    base09 = "#906000",
+    base0A = "#ca8a04",
+    base0B = "#888070",
+    base0C = "#d4a136",
+    base0D = "#e8b840",
+    base0E = "#ca8a04",
+    base0F = "#707478",
+  },
+  terminal = {
+    "#1a1c20", "#ab7503", "#cf951d", "#707478",
+    "#ca8a04", "#976703", "#d4a136", "#e8eaee",
+    "#707478", "#ca8a04", "#d4a136", "#7e8185",
+    "#d19b29", "#b57c03", "#d9ad4f", "#e9ebee",
+  },
+  groups = {
+    Normal = { fg = "#1a1c20", bg = "#e8eaee" },
+    NormalFloat = { fg = "#1a1c20", bg = "#dbdde1" },
+    NormalNC = { fg = "#1a1c20", bg = "#e8eaee" },
+    Cursor = { fg = "#e8eaee", bg = "#ca8a04" },
+    CursorLine = { bg = "#dddfe3" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#e1e3e7" },
+    LineNr = { fg = "#585048" },
+    CursorLineNr = { fg = "#1a1c20", bold = true },
+    SignColumn = { fg = "#585048", bg = "#e8eaee" },
+    VertSplit = { fg = "#cbcdd0" },
+    WinSeparator = { fg = "#cbcdd0" },
+    Folded = { fg = "#585048", bg = "#dbdde1" },
+    FoldColumn = { fg = "#585048" },
+    NonText = { fg = "#585048" },
+    SpecialKey = { fg = "#585048" },
+    Whitespace = { fg = "#a09d9b" },
+    MatchParen = { fg = "#ca8a04", bold = true },
+    Visual = { bg = "#decda7" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#e8eaee", bg = "#ca8a04" },
+    IncSearch = { fg = "#e8eaee", bg = "#906000" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#e8eaee", bg = "#ab7503" },
+    Pmenu = { fg = "#1a1c20", bg = "#dbdde1" },
+    PmenuSel = { fg = "#1a1c20", bg = "#e2d6bf" },
+    PmenuSbar = { bg = "#cbcdd0" },
+    PmenuThumb = { bg = "#3a352f" },
+    ErrorMsg = { fg = "#ab7503" },
+    WarningMsg = { fg = "#906000" },
+    ModeMsg = { fg = "#1a1c20", bold = true },
+    MoreMsg = { fg = "#e8b840" },
+    Question = { fg = "#e8b840" },
+    TabLine = { fg = "#3a352f", bg = "#dbdde1" },
+    TabLineFill = { bg = "#e8eaee" },
+    TabLineSel = { fg = "#1a1c20", bg = "#e8eaee", bold = true },
+    StatusLine = { fg = "#1a1c20", bg = "#dbdde1" },
+    StatusLineNC = { fg = "#3a352f", bg = "#dbdde1" },
+    DiffAdd = { bg = "#d9dadb" },
+    DiffChange = { bg = "#dad5ca" },
+    DiffDelete = { fg = "#ab7503", bg = "#ded8ca" },
+    DiffText = { bg = "#cdc0a6" },
+    SpellBad = { sp = "#ab7503", undercurl = true },
+    SpellCap = { sp = "#906000", undercurl = true },
+    SpellLocal = { sp = "#e8b840", undercurl = true },
+    SpellRare = { sp = "#ca8a04", undercurl = true },
+    Comment = { fg = "#585048" },
+    Constant = { fg = "#906000" },
+    String = { fg = "#888070" },
+    Character = { fg = "#888070" },
+    Number = { fg = "#906000" },
+    Boolean = { fg = "#906000" },
+    Float = { fg = "#906000" },
+    Identifier = { fg = "#1a1c20" },
+    Function = { fg = "#e8b840" },
+    Statement = { fg = "#ca8a04" },
+    Conditional = { fg = "#ca8a04" },
+    Repeat = { fg = "#ca8a04" },
+    Label = { fg = "#ca8a04" },
+    Operator = { fg = "#3a352f" },
+    Keyword = { fg = "#ca8a04" },
+    Exception = { fg = "#ca8a04" },
+    PreProc = { fg = "#ca8a04" },
+    Include = { fg = "#ca8a04" },
+    Define = { fg = "#ca8a04" },
+    Macro = { fg = "#ca8a04" },
+    PreCondit = { fg = "#ca8a04" },
+    Type = { fg = "#1a1c20" },
+    StorageClass = { fg = "#ca8a04" },
+    Structure = { fg = "#1a1c20" },
+    Typedef = { fg = "#1a1c20" },
+    Special = { fg = "#d4a136" },
+    SpecialChar = { fg = "#d4a136" },
+    Tag = { fg = "#888070" },
+    Delimiter = { fg = "#3a352f" },
+    SpecialComment = { fg = "#585048", italic = true },
+    Debug = { fg = "#906000" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#585048" },
+    Error = { fg = "#ab7503" },
+    Todo = { fg = "#e8eaee", bg = "#ca8a04", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#1a1c20" },
+      ["@variable.builtin"] = { fg = "#ca8a04" },
+      ["@variable.parameter"] = { fg = "#1a1c20", italic = true },
+      ["@variable.member"] = { fg = "#1a1c20" },
+      ["@constant"] = { fg = "#906000" },
+      ["@constant.builtin"] = { fg = "#906000" },
+      ["@module"] = { fg = "#1a1c20" },
+      ["@label"] = { fg = "#ca8a04" },
+      ["@type"] = { fg = "#1a1c20" },
+      ["@type.builtin"] = { fg = "#1a1c20" },
+      ["@attribute"] = { fg = "#181a1e" },
+      ["@property"] = { fg = "#1a1c20" },
+      ["@function"] = { fg = "#e8b840" },
+      ["@function.builtin"] = { fg = "#e8b840" },
+      ["@function.call"] = { fg = "#e8b840" },
+      ["@function.method"] = { fg = "#e8b840" },
+      ["@constructor"] = { fg = "#1a1c20" },
+      ["@operator"] = { fg = "#3a352f" },
+      ["@keyword"] = { fg = "#ca8a04" },
+      ["@keyword.conditional"] = { fg = "#ca8a04" },
+      ["@keyword.function"] = { fg = "#ca8a04" },
+      ["@keyword.operator"] = { fg = "#ca8a04" },
+      ["@keyword.return"] = { fg = "#ca8a04" },
+      ["@punctuation.bracket"] = { fg = "#3a352f" },
+      ["@punctuation.delimiter"] = { fg = "#3a352f" },
+      ["@punctuation.special"] = { fg = "#d4a136" },
+      ["@string"] = { fg = "#888070" },
+      ["@string.escape"] = { fg = "#d4a136" },
+      ["@string.regexp"] = { fg = "#d4a136" },
+      ["@character"] = { fg = "#888070" },
+      ["@boolean"] = { fg = "#906000" },
+      ["@number"] = { fg = "#906000" },
+      ["@comment"] = { fg = "#585048", italic = true },
+      ["@comment.todo"] = { fg = "#e8eaee", bg = "#ca8a04", bold = true },
+      ["@comment.error"] = { fg = "#ab7503", bold = true },
+      ["@comment.warning"] = { fg = "#906000", bold = true },
+      ["@comment.note"] = { fg = "#e8b840", bold = true },
+      ["@markup.heading"] = { fg = "#ca8a04", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#888070" },
+      ["@markup.link"] = { fg = "#e8b840", underline = true },
+      ["@tag"] = { fg = "#888070" },
+      ["@tag.attribute"] = { fg = "#181a1e" },
+      ["@tag.delimiter"] = { fg = "#3a352f" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#ab7503" },
+      DiagnosticWarn = { fg = "#906000" },
+      DiagnosticInfo = { fg = "#e8b840" },
+      DiagnosticHint = { fg = "#ca8a04" },
+      DiagnosticUnderlineError = { sp = "#ab7503", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#906000", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#e8b840", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#ca8a04", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#ab7503", bg = "#e1ded6" },
+      DiagnosticVirtualTextWarn = { fg = "#906000", bg = "#dfdcd6" },
+      DiagnosticVirtualTextInfo = { fg = "#e8b840", bg = "#e8e5dc" },
+      DiagnosticVirtualTextHint = { fg = "#ca8a04", bg = "#e5e0d6" },
+      LspReferenceText = { bg = "#d3d5d9" },
+      LspReferenceRead = { bg = "#d3d5d9" },
+      LspReferenceWrite = { bg = "#c9cbcf" },
+      LspSignatureActiveParameter = { fg = "#ca8a04", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#888070" },
+      GitSignsChange = { fg = "#906000" },
+      GitSignsDelete = { fg = "#ab7503" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#1a1c20", bg = "#e8eaee" },
+      TelescopeBorder = { fg = "#cbcdd0", bg = "#e8eaee" },
+      TelescopePromptTitle = { fg = "#e8eaee", bg = "#ca8a04", bold = true },
+      TelescopePreviewTitle = { fg = "#e8eaee", bg = "#888070", bold = true },
+      TelescopeResultsTitle = { fg = "#e8eaee", bg = "#e8b840", bold = true },
+      TelescopeSelection = { bg = "#e2d6bf" },
+      TelescopeMatching = { fg = "#ca8a04", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#ca8a04", bold = true },
+      CmpItemKindVariable = { fg = "#1a1c20" },
+      CmpItemKindFunction = { fg = "#e8b840" },
+      CmpItemKindKeyword = { fg = "#ca8a04" },
+      CmpItemKindClass = { fg = "#1a1c20" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#cbcdd0" },
+      IblScope = { fg = "#585048" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#e8eaee", bg = "#ca8a04", bold = true },
+      LazyButton = { fg = "#1a1c20", bg = "#cbcdd0" },
+      LazyButtonActive = { fg = "#e8eaee", bg = "#ca8a04" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#ab7503" },
+      NotifyWARNBorder = { fg = "#906000" },
+      NotifyINFOBorder = { fg = "#e8b840" },
+      NotifyDEBUGBorder = { fg = "#585048" },
+      NotifyTRACEBorder = { fg = "#ca8a04" },
+    },
+  },
+}
@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Grape
+-- Auto-generated by sync_themes.py from vscode/themes/grape.json - DO NOT EDIT
+
+return {
+  name = "Grape",
+  mode = "dark",
+  palette = {
+    base00 = "#120820",
+    base01 = "#1a0042",
+    base02 = "#271d37",
+    base03 = "#685878",
+    base04 = "#a895bb",
+    base05 = "#f0d6ff",
+    base06 = "#ffe6ff",
+    base07 = "#fff4ff",
+    base08 = "#6825a2",
+    base09 = "#c084fc",
+    base0A = "#7B2CBF",
+    base0B = "#e8d8f8",
+    base0C = "#9556cb",
+    base0D = "#7B2CBF",
+    base0E = "#a855f7",
+    base0F = "#3C096C",
+  },
+  terminal = {
+    "#10002B", "#6825a2", "#8841c5", "#633a89",
+    "#7B2CBF", "#5c218f", "#9556cb", "#F0D6FF",
+    "#3C096C", "#7B2CBF", "#9556cb", "#F0D6FF",
+    "#8e4bc8", "#6e27ab", "#a26bd2", "#f1daff",
+  },
+  groups = {
+    Normal = { fg = "#f0d6ff", bg = "#120820" },
+    NormalFloat = { fg = "#f0d6ff", bg = "#1a0042" },
+    NormalNC = { fg = "#f0d6ff", bg = "#120820" },
+    Cursor = { fg = "#120820", bg = "#7B2CBF" },
+    CursorLine = { bg = "#1d122b" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#180e26" },
+    LineNr = { fg = "#685878" },
+    CursorLineNr = { fg = "#f0d6ff", bold = true },
+    SignColumn = { fg = "#685878", bg = "#120820" },
+    VertSplit = { fg = "#271d37" },
+    WinSeparator = { fg = "#271d37" },
+    Folded = { fg = "#685878", bg = "#1a0042" },
+    FoldColumn = { fg = "#685878" },
+    NonText = { fg = "#685878" },
+    SpecialKey = { fg = "#685878" },
+    Whitespace = { fg = "#3d304c" },
+    MatchParen = { fg = "#7B2CBF", bold = true },
+    Visual = { bg = "#31124f" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#120820", bg = "#7B2CBF" },
+    IncSearch = { fg = "#120820", bg = "#c084fc" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#120820", bg = "#6825a2" },
+    Pmenu = { fg = "#f0d6ff", bg = "#1a0042" },
+    PmenuSel = { fg = "#f0d6ff", bg = "#270f3f" },
+    PmenuSbar = { bg = "#271d37" },
+    PmenuThumb = { bg = "#a895bb" },
+    ErrorMsg = { fg = "#6825a2" },
+    WarningMsg = { fg = "#c084fc" },
+    ModeMsg = { fg = "#f0d6ff", bold = true },
+    MoreMsg = { fg = "#7B2CBF" },
+    Question = { fg = "#7B2CBF" },
+    TabLine = { fg = "#a895bb", bg = "#1a0042" },
+    TabLineFill = { bg = "#120820" },
+    TabLineSel = { fg = "#f0d6ff", bg = "#120820", bold = true },
+    StatusLine = { fg = "#f0d6ff", bg = "#1a0042" },
+    StatusLineNC = { fg = "#a895bb", bg = "#1a0042" },
+    DiffAdd = { bg = "#322740" },
+    DiffChange = { bg = "#2c1a41" },
+    DiffDelete = { fg = "#6825a2", bg = "#1e0c33" },
+    DiffText = { bg = "#462d62" },
+    SpellBad = { sp = "#6825a2", undercurl = true },
+    SpellCap = { sp = "#c084fc", undercurl = true },
+    SpellLocal = { sp = "#7B2CBF", undercurl = true },
+    SpellRare = { sp = "#a855f7", undercurl = true },
+    Comment = { fg = "#685878" },
+    Constant = { fg = "#c084fc" },
+    String = { fg = "#e8d8f8" },
+    Character = { fg = "#e8d8f8" },
+    Number = { fg = "#c084fc" },
+    Boolean = { fg = "#c084fc" },
+    Float = { fg = "#c084fc" },
+    Identifier = { fg = "#d8c8e8" },
+    Function = { fg = "#7B2CBF" },
+    Statement = { fg = "#a855f7" },
+    Conditional = { fg = "#a855f7" },
+    Repeat = { fg = "#a855f7" },
+    Label = { fg = "#a855f7" },
+    Operator = { fg = "#a895bb" },
+    Keyword = { fg = "#a855f7" },
+    Exception = { fg = "#a855f7" },
+    PreProc = { fg = "#a855f7" },
+    Include = { fg = "#a855f7" },
+    Define = { fg = "#a855f7" },
+    Macro = { fg = "#a855f7" },
+    PreCondit = { fg = "#a855f7" },
+    Type = { fg = "#F0D6FF" },
+    StorageClass = { fg = "#a855f7" },
+    Structure = { fg = "#F0D6FF" },
+    Typedef = { fg = "#F0D6FF" },
+    Special = { fg = "#9556cb" },
+    SpecialChar = { fg = "#9556cb" },
+    Tag = { fg = "#7B2CBF" },
+    Delimiter = { fg = "#a895bb" },
+    SpecialComment = { fg = "#685878", italic = true },
+    Debug = { fg = "#c084fc" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#685878" },
+    Error = { fg = "#6825a2" },
+    Todo = { fg = "#120820", bg = "#7B2CBF", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#d8c8e8" },
+      ["@variable.builtin"] = { fg = "#a855f7" },
+      ["@variable.parameter"] = { fg = "#d8c8e8", italic = true },
+      ["@variable.member"] = { fg = "#d8c8e8" },
+      ["@constant"] = { fg = "#c084fc" },
+      ["@constant.builtin"] = { fg = "#c084fc" },
+      ["@module"] = { fg = "#f0d6ff" },
+      ["@label"] = { fg = "#a855f7" },
+      ["@type"] = { fg = "#F0D6FF" },
+      ["@type.builtin"] = { fg = "#F0D6FF" },
+      ["@attribute"] = { fg = "#f0d8ff" },
+      ["@property"] = { fg = "#d8c8e8" },
+      ["@function"] = { fg = "#7B2CBF" },
+      ["@function.builtin"] = { fg = "#7B2CBF" },
+      ["@function.call"] = { fg = "#7B2CBF" },
+      ["@function.method"] = { fg = "#7B2CBF" },
+      ["@constructor"] = { fg = "#F0D6FF" },
+      ["@operator"] = { fg = "#a895bb" },
+      ["@keyword"] = { fg = "#a855f7" },
+      ["@keyword.conditional"] = { fg = "#a855f7" },
+      ["@keyword.function"] = { fg = "#a855f7" },
+      ["@keyword.operator"] = { fg = "#a855f7" },
+      ["@keyword.return"] = { fg = "#a855f7" },
+      ["@punctuation.bracket"] = { fg = "#a895bb" },
+      ["@punctuation.delimiter"] = { fg = "#a895bb" },
+      ["@punctuation.special"] = { fg = "#9556cb" },
+      ["@string"] = { fg = "#e8d8f8" },
+      ["@string.escape"] = { fg = "#9556cb" },
+      ["@string.regexp"] = { fg = "#9556cb" },
+      ["@character"] = { fg = "#e8d8f8" },
+      ["@boolean"] = { fg = "#c084fc" },
+      ["@number"] = { fg = "#c084fc" },
+      ["@comment"] = { fg = "#685878", italic = true },
+      ["@comment.todo"] = { fg = "#120820", bg = "#7B2CBF", bold = true },
+      ["@comment.error"] = { fg = "#6825a2", bold = true },
+      ["@comment.warning"] = { fg = "#c084fc", bold = true },
+      ["@comment.note"] = { fg = "#7B2CBF", bold = true },
+      ["@markup.heading"] = { fg = "#a855f7", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#e8d8f8" },
+      ["@markup.link"] = { fg = "#7B2CBF", underline = true },
+      ["@tag"] = { fg = "#7B2CBF" },
+      ["@tag.attribute"] = { fg = "#f0d8ff" },
+      ["@tag.delimiter"] = { fg = "#a895bb" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#6825a2" },
+      DiagnosticWarn = { fg = "#c084fc" },
+      DiagnosticInfo = { fg = "#7B2CBF" },
+      DiagnosticHint = { fg = "#7B2CBF" },
+      DiagnosticUnderlineError = { sp = "#6825a2", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#c084fc", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#7B2CBF", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#7B2CBF", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#6825a2", bg = "#1a0a2d" },
+      DiagnosticVirtualTextWarn = { fg = "#c084fc", bg = "#231436" },
+      DiagnosticVirtualTextInfo = { fg = "#7B2CBF", bg = "#1c0b2f" },
+      DiagnosticVirtualTextHint = { fg = "#7B2CBF", bg = "#1c0b2f" },
+      LspReferenceText = { bg = "#281c36" },
+      LspReferenceRead = { bg = "#281c36" },
+      LspReferenceWrite = { bg = "#332641" },
+      LspSignatureActiveParameter = { fg = "#7B2CBF", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#e8d8f8" },
+      GitSignsChange = { fg = "#c084fc" },
+      GitSignsDelete = { fg = "#6825a2" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#f0d6ff", bg = "#120820" },
+      TelescopeBorder = { fg = "#271d37", bg = "#120820" },
+      TelescopePromptTitle = { fg = "#120820", bg = "#7B2CBF", bold = true },
+      TelescopePreviewTitle = { fg = "#120820", bg = "#e8d8f8", bold = true },
+      TelescopeResultsTitle = { fg = "#120820", bg = "#7B2CBF", bold = true },
+      TelescopeSelection = { bg = "#270f3f" },
+      TelescopeMatching = { fg = "#7B2CBF", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#7B2CBF", bold = true },
+      CmpItemKindVariable = { fg = "#d8c8e8" },
+      CmpItemKindFunction = { fg = "#7B2CBF" },
+      CmpItemKindKeyword = { fg = "#a855f7" },
+      CmpItemKindClass = { fg = "#F0D6FF" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#271d37" },
+      IblScope = { fg = "#685878" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#120820", bg = "#7B2CBF", bold = true },
+      LazyButton = { fg = "#f0d6ff", bg = "#271d37" },
+      LazyButtonActive = { fg = "#120820", bg = "#7B2CBF" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#6825a2" },
+      NotifyWARNBorder = { fg = "#c084fc" },
+      NotifyINFOBorder = { fg = "#7B2CBF" },
+      NotifyDEBUGBorder = { fg = "#685878" },
+      NotifyTRACEBorder = { fg = "#a855f7" },
+    },
+  },
+}
@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Gruvbox Material
+-- Auto-generated by sync_themes.py from vscode/themes/gruvbox_material.json - DO NOT EDIT
+
+return {
+  name = "Gruvbox Material",
+  mode = "dark",
+  palette = {
+    base00 = "#282828",
+    base01 = "#3c3836",
+    base02 = "#3f3f3f",
+    base03 = "#7c6f64",
+    base04 = "#a38163",
+    base05 = "#d3869b",
+    base06 = "#e495aa",
+    base07 = "#f5a5ba",
+    base08 = "#9c9e20",
+    base09 = "#d3869b",
+    base0A = "#b8bb26",
+    base0B = "#b8bb26",
+    base0C = "#c6c851",
+    base0D = "#fabd2f",
+    base0E = "#fb4934",
+    base0F = "#fabd2f",
+  },
+  terminal = {
+    "#282828", "#9c9e20", "#bfc13b", "#fbca58",
+    "#b8bb26", "#8a8c1c", "#c6c851", "#d3869b",
+    "#fabd2f", "#b8bb26", "#c6c851", "#d3869b",
+    "#c2c546", "#a5a822", "#cdcf67", "#d792a5",
+  },
+  groups = {
+    Normal = { fg = "#d3869b", bg = "#282828" },
+    NormalFloat = { fg = "#d3869b", bg = "#3c3836" },
+    NormalNC = { fg = "#d3869b", bg = "#282828" },
+    Cursor = { fg = "#282828", bg = "#b8bb26" },
+    CursorLine = { bg = "#302c2d" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#2d2a2b" },
+    LineNr = { fg = "#7c6f64" },
+    CursorLineNr = { fg = "#d3869b", bold = true },
+    SignColumn = { fg = "#7c6f64", bg = "#282828" },
+    VertSplit = { fg = "#3f3f3f" },
+    WinSeparator = { fg = "#3f3f3f" },
+    Folded = { fg = "#7c6f64", bg = "#3c3836" },
+    FoldColumn = { fg = "#7c6f64" },
+    NonText = { fg = "#7c6f64" },
+    SpecialKey = { fg = "#7c6f64" },
+    Whitespace = { fg = "#524b46" },
+    MatchParen = { fg = "#b8bb26", bold = true },
+    Visual = { bg = "#535427" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#282828", bg = "#b8bb26" },
+    IncSearch = { fg = "#282828", bg = "#d3869b" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#282828", bg = "#9c9e20" },
+    Pmenu = { fg = "#d3869b", bg = "#3c3836" },
+    PmenuSel = { fg = "#d3869b", bg = "#444527" },
+    PmenuSbar = { bg = "#3f3f3f" },
+    PmenuThumb = { bg = "#a38163" },
+    ErrorMsg = { fg = "#9c9e20" },
+    WarningMsg = { fg = "#d3869b" },
+    ModeMsg = { fg = "#d3869b", bold = true },
+    MoreMsg = { fg = "#fabd2f" },
+    Question = { fg = "#fabd2f" },
+    TabLine = { fg = "#a38163", bg = "#3c3836" },
+    TabLineFill = { bg = "#282828" },
+    TabLineSel = { fg = "#d3869b", bg = "#282828", bold = true },
+    StatusLine = { fg = "#d3869b", bg = "#3c3836" },
+    StatusLineNC = { fg = "#a38163", bg = "#3c3836" },
+    DiffAdd = { bg = "#3d3e27" },
+    DiffChange = { bg = "#413639" },
+    DiffDelete = { fg = "#9c9e20", bg = "#393926" },
+    DiffText = { bg = "#5b444a" },
+    SpellBad = { sp = "#9c9e20", undercurl = true },
+    SpellCap = { sp = "#d3869b", undercurl = true },
+    SpellLocal = { sp = "#fabd2f", undercurl = true },
+    SpellRare = { sp = "#fb4934", undercurl = true },
+    Comment = { fg = "#7c6f64" },
+    Constant = { fg = "#d3869b" },
+    String = { fg = "#b8bb26" },
+    Character = { fg = "#b8bb26" },
+    Number = { fg = "#d3869b" },
+    Boolean = { fg = "#d3869b" },
+    Float = { fg = "#d3869b" },
+    Identifier = { fg = "#83a598" },
+    Function = { fg = "#fabd2f" },
+    Statement = { fg = "#fb4934" },
+    Conditional = { fg = "#fb4934" },
+    Repeat = { fg = "#fb4934" },
+    Label = { fg = "#fb4934" },
+    Operator = { fg = "#a38163" },
+    Keyword = { fg = "#fb4934" },
+    Exception = { fg = "#fb4934" },
+    PreProc = { fg = "#fb4934" },
+    Include = { fg = "#fb4934" },
+    Define = { fg = "#fb4934" },
+    Macro = { fg = "#fb4934" },
+    PreCondit = { fg = "#fb4934" },
+    Type = { fg = "#fe8019" },
+    StorageClass = { fg = "#fb4934" },
+    Structure = { fg = "#fe8019" },
+    Typedef = { fg = "#fe8019" },
+    Special = { fg = "#c6c851" },
+    SpecialChar = { fg = "#c6c851" },
+    Tag = { fg = "#83a598" },
+    Delimiter = { fg = "#a38163" },
+    SpecialComment = { fg = "#7c6f64", italic = true },
+    Debug = { fg = "#d3869b" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#7c6f64" },
+    Error = { fg = "#9c9e20" },
+    Todo = { fg = "#282828", bg = "#b8bb26", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#83a598" },
+      ["@variable.builtin"] = { fg = "#fb4934" },
+      ["@variable.parameter"] = { fg = "#83a598", italic = true },
+      ["@variable.member"] = { fg = "#83a598" },
+      ["@constant"] = { fg = "#d3869b" },
+      ["@constant.builtin"] = { fg = "#d3869b" },
+      ["@module"] = { fg = "#d3869b" },
+      ["@label"] = { fg = "#fb4934" },
+      ["@type"] = { fg = "#fe8019" },
+      ["@type.builtin"] = { fg = "#fe8019" },
+      ["@attribute"] = { fg = "#fabd2f" },
+      ["@property"] = { fg = "#83a598" },
+      ["@function"] = { fg = "#fabd2f" },
+      ["@function.builtin"] = { fg = "#fabd2f" },
+      ["@function.call"] = { fg = "#fabd2f" },
+      ["@function.method"] = { fg = "#fabd2f" },
+      ["@constructor"] = { fg = "#fe8019" },
+      ["@operator"] = { fg = "#a38163" },
+      ["@keyword"] = { fg = "#fb4934" },
+      ["@keyword.conditional"] = { fg = "#fb4934" },
+      ["@keyword.function"] = { fg = "#fb4934" },
+      ["@keyword.operator"] = { fg = "#fb4934" },
+      ["@keyword.return"] = { fg = "#fb4934" },
+      ["@punctuation.bracket"] = { fg = "#a38163" },
+      ["@punctuation.delimiter"] = { fg = "#a38163" },
+      ["@punctuation.special"] = { fg = "#c6c851" },
+      ["@string"] = { fg = "#b8bb26" },
+      ["@string.escape"] = { fg = "#c6c851" },
+      ["@string.regexp"] = { fg = "#c6c851" },
+      ["@character"] = { fg = "#b8bb26" },
+      ["@boolean"] = { fg = "#d3869b" },
+      ["@number"] = { fg = "#d3869b" },
+      ["@comment"] = { fg = "#7c6f64", italic = true },
+      ["@comment.todo"] = { fg = "#282828", bg = "#b8bb26", bold = true },
+      ["@comment.error"] = { fg = "#9c9e20", bold = true },
+      ["@comment.warning"] = { fg = "#d3869b", bold = true },
+      ["@comment.note"] = { fg = "#fabd2f", bold = true },
+      ["@markup.heading"] = { fg = "#fb4934", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#b8bb26" },
+      ["@markup.link"] = { fg = "#fabd2f", underline = true },
+      ["@tag"] = { fg = "#83a598" },
+      ["@tag.attribute"] = { fg = "#fabd2f" },
+      ["@tag.delimiter"] = { fg = "#a38163" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#9c9e20" },
+      DiagnosticWarn = { fg = "#d3869b" },
+      DiagnosticInfo = { fg = "#fabd2f" },
+      DiagnosticHint = { fg = "#b8bb26" },
+      DiagnosticUnderlineError = { sp = "#9c9e20", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#d3869b", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#fabd2f", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#b8bb26", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#9c9e20", bg = "#333327" },
+      DiagnosticVirtualTextWarn = { fg = "#d3869b", bg = "#393133" },
+      DiagnosticVirtualTextInfo = { fg = "#fabd2f", bg = "#3d3628" },
+      DiagnosticVirtualTextHint = { fg = "#b8bb26", bg = "#363627" },
+      LspReferenceText = { bg = "#393133" },
+      LspReferenceRead = { bg = "#393133" },
+      LspReferenceWrite = { bg = "#413639" },
+      LspSignatureActiveParameter = { fg = "#b8bb26", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#b8bb26" },
+      GitSignsChange = { fg = "#d3869b" },
+      GitSignsDelete = { fg = "#9c9e20" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#d3869b", bg = "#282828" },
+      TelescopeBorder = { fg = "#3f3f3f", bg = "#282828" },
+      TelescopePromptTitle = { fg = "#282828", bg = "#b8bb26", bold = true },
+      TelescopePreviewTitle = { fg = "#282828", bg = "#b8bb26", bold = true },
+      TelescopeResultsTitle = { fg = "#282828", bg = "#fabd2f", bold = true },
+      TelescopeSelection = { bg = "#444527" },
+      TelescopeMatching = { fg = "#b8bb26", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#b8bb26", bold = true },
+      CmpItemKindVariable = { fg = "#83a598" },
+      CmpItemKindFunction = { fg = "#fabd2f" },
+      CmpItemKindKeyword = { fg = "#fb4934" },
+      CmpItemKindClass = { fg = "#fe8019" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#3f3f3f" },
+      IblScope = { fg = "#7c6f64" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#282828", bg = "#b8bb26", bold = true },
+      LazyButton = { fg = "#d3869b", bg = "#3f3f3f" },
+      LazyButtonActive = { fg = "#282828", bg = "#b8bb26" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#9c9e20" },
+      NotifyWARNBorder = { fg = "#d3869b" },
+      NotifyINFOBorder = { fg = "#fabd2f" },
+      NotifyDEBUGBorder = { fg = "#7c6f64" },
+      NotifyTRACEBorder = { fg = "#fb4934" },
+    },
+  },
+}
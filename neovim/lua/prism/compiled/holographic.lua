@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Holographic
+-- Auto-generated by sync_themes.py from vscode/themes/holographic.json - DO NOT EDIT
+
+return {
+  name = "Holographic",
+  mode = "dark",
+  palette = {
+    base00 = "#0a0a0f",
+    base01 = "#141419",
+    base02 = "#1e1e24",
+    base03 = "#7888a8",
+    base04 = "#648ce2",
+    base05 = "#b967ff",
+    base06 = "#c977ff",
+    base07 = "#d988ff",
+    base08 = "#00aed7",
+    base09 = "#05ffa1",
+    base0A = "#01cdfe",
+    base0B = "#ff71ce",
+    base0C = "#33d7fe",
+    base0D = "#ffffff",
+    base0E = "#01cdfe",
+    base0F = "#ff71ce",
+  },
+  terminal = {
+    "#0a0a0f", "#00aed7", "#1ad2fe", "#ff8dd7",
+    "#01cdfe", "#0099be", "#33d7fe", "#b967ff",
+    "#ff71ce", "#01cdfe", "#33d7fe", "#b967ff",
+    "#27d4fe", "#00b8e4", "#4ddcfe", "#c076ff",
+  },
+  groups = {
+    Normal = { fg = "#b967ff", bg = "#0a0a0f" },
+    NormalFloat = { fg = "#b967ff", bg = "#141419" },
+    NormalNC = { fg = "#b967ff", bg = "#0a0a0f" },
+    Cursor = { fg = "#0a0a0f", bg = "#01cdfe" },
+    CursorLine = { bg = "#120e1b" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#0f0c16" },
+    LineNr = { fg = "#7888a8" },
+    CursorLineNr = { fg = "#b967ff", bold = true },
+    SignColumn = { fg = "#7888a8", bg = "#0a0a0f" },
+    VertSplit = { fg = "#1e1e24" },
+    WinSeparator = { fg = "#1e1e24" },
+    Folded = { fg = "#7888a8", bg = "#141419" },
+    FoldColumn = { fg = "#7888a8" },
+    NonText = { fg = "#7888a8" },
+    SpecialKey = { fg = "#7888a8" },
+    Whitespace = { fg = "#41495b" },
+    MatchParen = { fg = "#01cdfe", bold = true },
+    Visual = { bg = "#074456" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#0a0a0f", bg = "#01cdfe" },
+    IncSearch = { fg = "#0a0a0f", bg = "#05ffa1" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#0a0a0f", bg = "#00aed7" },
+    Pmenu = { fg = "#b967ff", bg = "#141419" },
+    PmenuSel = { fg = "#b967ff", bg = "#08313e" },
+    PmenuSbar = { bg = "#1e1e24" },
+    PmenuThumb = { bg = "#648ce2" },
+    ErrorMsg = { fg = "#00aed7" },
+    WarningMsg = { fg = "#05ffa1" },
+    ModeMsg = { fg = "#b967ff", bold = true },
+    MoreMsg = { fg = "#ffffff" },
+    Question = { fg = "#ffffff" },
+    TabLine = { fg = "#648ce2", bg = "#141419" },
+    TabLineFill = { bg = "#0a0a0f" },
+    TabLineSel = { fg = "#b967ff", bg = "#0a0a0f", bold = true },
+    StatusLine = { fg = "#b967ff", bg = "#141419" },
+    StatusLineNC = { fg = "#648ce2", bg = "#141419" },
+    DiffAdd = { bg = "#2e192b" },
+    DiffChange = { bg = "#092e24" },
+    DiffDelete = { fg = "#00aed7", bg = "#08222d" },
+    DiffText = { bg = "#08533a" },
+    SpellBad = { sp = "#00aed7", undercurl = true },
+    SpellCap = { sp = "#05ffa1", undercurl = true },
+    SpellLocal = { sp = "#ffffff", undercurl = true },
+    SpellRare = { sp = "#01cdfe", undercurl = true },
+    Comment = { fg = "#7888a8" },
+    Constant = { fg = "#05ffa1" },
+    String = { fg = "#ff71ce" },
+    Character = { fg = "#ff71ce" },
+    Number = { fg = "#05ffa1" },
+    Boolean = { fg = "#05ffa1" },
+    Float = { fg = "#05ffa1" },
+    Identifier = { fg = "#e8e8e8" },
+    Function = { fg = "#ffffff" },
+    Statement = { fg = "#01cdfe" },
+    Conditional = { fg = "#01cdfe" },
+    Repeat = { fg = "#01cdfe" },
+    Label = { fg = "#01cdfe" },
+    Operator = { fg = "#648ce2" },
+    Keyword = { fg = "#01cdfe" },
+    Exception = { fg = "#01cdfe" },
+    PreProc = { fg = "#01cdfe" },
+    Include = { fg = "#01cdfe" },
+    Define = { fg = "#01cdfe" },
+    Macro = { fg = "#01cdfe" },
+    PreCondit = { fg = "#01cdfe" },
+    Type = { fg = "#b967ff" },
+    StorageClass = { fg = "#01cdfe" },
+    Structure = { fg = "#b967ff" },
+    Typedef = { fg = "#b967ff" },
+    Special = { fg = "#33d7fe" },
+    SpecialChar = { fg = "#33d7fe" },
+    Tag = { fg = "#ff71ce" },
+    Delimiter = { fg = "#648ce2" },
+    SpecialComment = { fg = "#7888a8", italic = true },
+    Debug = { fg = "#05ffa1" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#7888a8" },
+    Error = { fg = "#00aed7" },
+    Todo = { fg = "#0a0a0f", bg = "#01cdfe", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#e8e8e8" },
+      ["@variable.builtin"] = { fg = "#01cdfe" },
+      ["@variable.parameter"] = { fg = "#e8e8e8", italic = true },
+      ["@variable.member"] = { fg = "#e8e8e8" },
+      ["@constant"] = { fg = "#05ffa1" },
+      ["@constant.builtin"] = { fg = "#05ffa1" },
+      ["@module"] = { fg = "#b967ff" },
+      ["@label"] = { fg = "#01cdfe" },
+      ["@type"] = { fg = "#b967ff" },
+      ["@type.builtin"] = { fg = "#b967ff" },
+      ["@attribute"] = { fg = "#27d4fe" },
+      ["@property"] = { fg = "#e8e8e8" },
+      ["@function"] = { fg = "#ffffff" },
+      ["@function.builtin"] = { fg = "#ffffff" },
+      ["@function.call"] = { fg = "#ffffff" },
+      ["@function.method"] = { fg = "#ffffff" },
+      ["@constructor"] = { fg = "#b967ff" },
+      ["@operator"] = { fg = "#648ce2" },
+      ["@keyword"] = { fg = "#01cdfe" },
+      ["@keyword.conditional"] = { fg = "#01cdfe" },
+      ["@keyword.function"] = { fg = "#01cdfe" },
+      ["@keyword.operator"] = { fg = "#01cdfe" },
+      ["@keyword.return"] = { fg = "#01cdfe" },
+      ["@punctuation.bracket"] = { fg = "#648ce2" },
+      ["@punctuation.delimiter"] = { fg = "#648ce2" },
+      ["@punctuation.special"] = { fg = "#33d7fe" },
+      ["@string"] = { fg = "#ff71ce" },
+      ["@string.escape"] = { fg = "#33d7fe" },
+      ["@string.regexp"] = { fg = "#33d7fe" },
+      ["@character"] = { fg = "#ff71ce" },
+      ["@boolean"] = { fg = "#05ffa1" },
+      ["@number"] = { fg = "#05ffa1" },
+      ["@comment"] = { fg = "#7888a8", italic = true },
+      ["@comment.todo"] = { fg = "#0a0a0f", bg = "#01cdfe", bold = true },
+      ["@comment.error"] = { fg = "#00aed7", bold = true },
+      ["@comment.warning"] = { fg = "#05ffa1", bold = true },
+      ["@comment.note"] = { fg = "#ffffff", bold = true },
+      ["@markup.heading"] = { fg = "#01cdfe", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#ff71ce" },
+      ["@markup.link"] = { fg = "#ffffff", underline = true },
+      ["@tag"] = { fg = "#ff71ce" },
+      ["@tag.attribute"] = { fg = "#27d4fe" },
+      ["@tag.delimiter"] = { fg = "#648ce2" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#00aed7" },
+      DiagnosticWarn = { fg = "#05ffa1" },
+      DiagnosticInfo = { fg = "#ffffff" },
+      DiagnosticHint = { fg = "#01cdfe" },
+      DiagnosticUnderlineError = { sp = "#00aed7", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#05ffa1", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#ffffff", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#01cdfe", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#00aed7", bg = "#091a23" },
+      DiagnosticVirtualTextWarn = { fg = "#05ffa1", bg = "#09221d" },
+      DiagnosticVirtualTextInfo = { fg = "#ffffff", bg = "#222227" },
+      DiagnosticVirtualTextHint = { fg = "#01cdfe", bg = "#091d26" },
+      LspReferenceText = { bg = "#1b1327" },
+      LspReferenceRead = { bg = "#1b1327" },
+      LspReferenceWrite = { bg = "#241733" },
+      LspSignatureActiveParameter = { fg = "#01cdfe", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#ff71ce" },
+      GitSignsChange = { fg = "#05ffa1" },
+      GitSignsDelete = { fg = "#00aed7" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#b967ff", bg = "#0a0a0f" },
+      TelescopeBorder = { fg = "#1e1e24", bg = "#0a0a0f" },
+      TelescopePromptTitle = { fg = "#0a0a0f", bg = "#01cdfe", bold = true },
+      TelescopePreviewTitle = { fg = "#0a0a0f", bg = "#ff71ce", bold = true },
+      TelescopeResultsTitle = { fg = "#0a0a0f", bg = "#ffffff", bold = true },
+      TelescopeSelection = { bg = "#08313e" },
+      TelescopeMatching = { fg = "#01cdfe", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#01cdfe", bold = true },
+      CmpItemKindVariable = { fg = "#e8e8e8" },
+      CmpItemKindFunction = { fg = "#ffffff" },
+      CmpItemKindKeyword = { fg = "#01cdfe" },
+      CmpItemKindClass = { fg = "#b967ff" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#1e1e24" },
+      IblScope = { fg = "#7888a8" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#0a0a0f", bg = "#01cdfe", bold = true },
+      LazyButton = { fg = "#b967ff", bg = "#1e1e24" },
+      LazyButtonActive = { fg = "#0a0a0f", bg = "#01cdfe" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#00aed7" },
+      NotifyWARNBorder = { fg = "#05ffa1" },
+      NotifyINFOBorder = { fg = "#ffffff" },
+      NotifyDEBUGBorder = { fg = "#7888a8" },
+      NotifyTRACEBorder = { fg = "#01cdfe" },
+    },
+  },
+}
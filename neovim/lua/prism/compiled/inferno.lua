@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Inferno
+-- Auto-generated by sync_themes.py from vscode/themes/inferno.json - DO NOT EDIT
+
+return {
+  name = "Inferno",
+  mode = "dark",
+  palette = {
+    base00 = "#180808",
+    base01 = "#451012",
+    base02 = "#2e1c1c",
+    base03 = "#886848",
+    base04 = "#c79d72",
+    base05 = "#ffdb99",
+    base06 = "#ffeca9",
+    base07 = "#fffab7",
+    base08 = "#d54b0b",
+    base09 = "#ffc830",
+    base0A = "#FB590E",
+    base0B = "#ffdd44",
+    base0C = "#fb7a3e",
+    base0D = "#ff9040",
+    base0E = "#FB590E",
+    base0F = "#DE2817",
+  },
+  terminal = {
+    "#320B0C", "#d54b0b", "#fb6926", "#e45345",
+    "#FB590E", "#bc420a", "#fb7a3e", "#FFDB99",
+    "#DE2817", "#FB590E", "#fb7a3e", "#FFDB99",
+    "#fb7132", "#e1500c", "#fc8a56", "#ffdea3",
+  },
+  groups = {
+    Normal = { fg = "#ffdb99", bg = "#180808" },
+    NormalFloat = { fg = "#ffdb99", bg = "#451012" },
+    NormalNC = { fg = "#ffdb99", bg = "#180808" },
+    Cursor = { fg = "#180808", bg = "#FB590E" },
+    CursorLine = { bg = "#23120f" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#1e0e0c" },
+    LineNr = { fg = "#886848" },
+    CursorLineNr = { fg = "#ffdb99", bold = true },
+    SignColumn = { fg = "#886848", bg = "#180808" },
+    VertSplit = { fg = "#2e1c1c" },
+    WinSeparator = { fg = "#2e1c1c" },
+    Folded = { fg = "#886848", bg = "#451012" },
+    FoldColumn = { fg = "#886848" },
+    NonText = { fg = "#886848" },
+    SpecialKey = { fg = "#886848" },
+    Whitespace = { fg = "#503828" },
+    MatchParen = { fg = "#FB590E", bold = true },
+    Visual = { bg = "#5c2009" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#180808", bg = "#FB590E" },
+    IncSearch = { fg = "#180808", bg = "#ffc830" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#180808", bg = "#d54b0b" },
+    Pmenu = { fg = "#ffdb99", bg = "#451012" },
+    PmenuSel = { fg = "#ffdb99", bg = "#451809" },
+    PmenuSbar = { bg = "#2e1c1c" },
+    PmenuThumb = { bg = "#c79d72" },
+    ErrorMsg = { fg = "#d54b0b" },
+    WarningMsg = { fg = "#ffc830" },
+    ModeMsg = { fg = "#ffdb99", bold = true },
+    MoreMsg = { fg = "#ff9040" },
+    Question = { fg = "#ff9040" },
+    TabLine = { fg = "#c79d72", bg = "#451012" },
+    TabLineFill = { bg = "#180808" },
+    TabLineSel = { fg = "#ffdb99", bg = "#180808", bold = true },
+    StatusLine = { fg = "#ffdb99", bg = "#451012" },
+    StatusLineNC = { fg = "#c79d72", bg = "#451012" },
+    DiffAdd = { bg = "#3a2711" },
+    DiffChange = { bg = "#3a240e" },
+    DiffDelete = { fg = "#d54b0b", bg = "#341208" },
+    DiffText = { bg = "#5d4114" },
+    SpellBad = { sp = "#d54b0b", undercurl = true },
+    SpellCap = { sp = "#ffc830", undercurl = true },
+    SpellLocal = { sp = "#ff9040", undercurl = true },
+    SpellRare = { sp = "#FB590E", undercurl = true },
+    Comment = { fg = "#886848" },
+    Constant = { fg = "#ffc830" },
+    String = { fg = "#ffdd44" },
+    Character = { fg = "#ffdd44" },
+    Number = { fg = "#ffc830" },
+    Boolean = { fg = "#ffc830" },
+    Float = { fg = "#ffc830" },
+    Identifier = { fg = "#ffe080" },
+    Function = { fg = "#ff9040" },
+    Statement = { fg = "#FB590E" },
+    Conditional = { fg = "#FB590E" },
+    Repeat = { fg = "#FB590E" },
+    Label = { fg = "#FB590E" },
+    Operator = { fg = "#c79d72" },
+    Keyword = { fg = "#FB590E" },
+    Exception = { fg = "#FB590E" },
+    PreProc = { fg = "#FB590E" },
+    Include = { fg = "#FB590E" },
+    Define = { fg = "#FB590E" },
+    Macro = { fg = "#FB590E" },
+    PreCondit = { fg = "#FB590E" },
+    Type = { fg = "#c84400" },
+    StorageClass = { fg = "#FB590E" },
+    Structure = { fg = "#c84400" },
+    Typedef = { fg = "#c84400" },
+    Special = { fg = "#fb7a3e" },
+    SpecialChar = { fg = "#fb7a3e" },
+    Tag = { fg = "#ffdd44" },
+    Delimiter = { fg = "#c79d72" },
+    SpecialComment = { fg = "#886848", italic = true },
+    Debug = { fg = "#ffc830" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#886848" },
+    Error = { fg = "#d54b0b" },
+    Todo = { fg = "#180808", bg = "#FB590E", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#ffe080" },
+      ["@variable.builtin"] = { fg = "#FB590E" },
+      ["@variable.parameter"] = { fg = "#ffe080", italic = true },
+      ["@variable.member"] = { fg = "#ffe080" },
+      ["@constant"] = { fg = "#ffc830" },
+      ["@constant.builtin"] = { fg = "#ffc830" },
+      ["@module"] = { fg = "#ffdb99" },
+      ["@label"] = { fg = "#FB590E" },
+      ["@type"] = { fg = "#c84400" },
+      ["@type.builtin"] = { fg = "#c84400" },
+      ["@attribute"] = { fg = "#fb7132" },
+      ["@property"] = { fg = "#ffe080" },
+      ["@function"] = { fg = "#ff9040" },
+      ["@function.builtin"] = { fg = "#ff9040" },
+      ["@function.call"] = { fg = "#ff9040" },
+      ["@function.method"] = { fg = "#ff9040" },
+      ["@constructor"] = { fg = "#c84400" },
+      ["@operator"] = { fg = "#c79d72" },
+      ["@keyword"] = { fg = "#FB590E" },
+      ["@keyword.conditional"] = { fg = "#FB590E" },
+      ["@keyword.function"] = { fg = "#FB590E" },
+      ["@keyword.operator"] = { fg = "#FB590E" },
+      ["@keyword.return"] = { fg = "#FB590E" },
+      ["@punctuation.bracket"] = { fg = "#c79d72" },
+      ["@punctuation.delimiter"] = { fg = "#c79d72" },
+      ["@punctuation.special"] = { fg = "#fb7a3e" },
+      ["@string"] = { fg = "#ffdd44" },
+      ["@string.escape"] = { fg = "#fb7a3e" },
+      ["@string.regexp"] = { fg = "#fb7a3e" },
+      ["@character"] = { fg = "#ffdd44" },
+      ["@boolean"] = { fg = "#ffc830" },
+      ["@number"] = { fg = "#ffc830" },
+      ["@comment"] = { fg = "#886848", italic = true },
+      ["@comment.todo"] = { fg = "#180808", bg = "#FB590E", bold = true },
+      ["@comment.error"] = { fg = "#d54b0b", bold = true },
+      ["@comment.warning"] = { fg = "#ffc830", bold = true },
+      ["@comment.note"] = { fg = "#ff9040", bold = true },
+      ["@markup.heading"] = { fg = "#FB590E", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#ffdd44" },
+      ["@markup.link"] = { fg = "#ff9040", underline = true },
+      ["@tag"] = { fg = "#ffdd44" },
+      ["@tag.attribute"] = { fg = "#fb7132" },
+      ["@tag.delimiter"] = { fg = "#c79d72" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#d54b0b" },
+      DiagnosticWarn = { fg = "#ffc830" },
+      DiagnosticInfo = { fg = "#ff9040" },
+      DiagnosticHint = { fg = "#FB590E" },
+      DiagnosticUnderlineError = { sp = "#d54b0b", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#ffc830", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#ff9040", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#FB590E", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#d54b0b", bg = "#2a0e08" },
+      DiagnosticVirtualTextWarn = { fg = "#ffc830", bg = "#2f1b0c" },
+      DiagnosticVirtualTextInfo = { fg = "#ff9040", bg = "#2f150d" },
+      DiagnosticVirtualTextHint = { fg = "#FB590E", bg = "#2e1008" },
+      LspReferenceText = { bg = "#2f1d16" },
+      LspReferenceRead = { bg = "#2f1d16" },
+      LspReferenceWrite = { bg = "#3a271d" },
+      LspSignatureActiveParameter = { fg = "#FB590E", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#ffdd44" },
+      GitSignsChange = { fg = "#ffc830" },
+      GitSignsDelete = { fg = "#d54b0b" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#ffdb99", bg = "#180808" },
+      TelescopeBorder = { fg = "#2e1c1c", bg = "#180808" },
+      TelescopePromptTitle = { fg = "#180808", bg = "#FB590E", bold = true },
+      TelescopePreviewTitle = { fg = "#180808", bg = "#ffdd44", bold = true },
+      TelescopeResultsTitle = { fg = "#180808", bg = "#ff9040", bold = true },
+      TelescopeSelection = { bg = "#451809" },
+      TelescopeMatching = { fg = "#FB590E", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#FB590E", bold = true },
+      CmpItemKindVariable = { fg = "#ffe080" },
+      CmpItemKindFunction = { fg = "#ff9040" },
+      CmpItemKindKeyword = { fg = "#FB590E" },
+      CmpItemKindClass = { fg = "#c84400" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#2e1c1c" },
+      IblScope = { fg = "#886848" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#180808", bg = "#FB590E", bold = true },
+      LazyButton = { fg = "#ffdb99", bg = "#2e1c1c" },
+      LazyButtonActive = { fg = "#180808", bg = "#FB590E" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#d54b0b" },
+      NotifyWARNBorder = { fg = "#ffc830" },
+      NotifyINFOBorder = { fg = "#ff9040" },
+      NotifyDEBUGBorder = { fg = "#886848" },
+      NotifyTRACEBorder = { fg = "#FB590E" },
+    },
+  },
+}
@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Lavender Dusk
+-- Auto-generated by sync_themes.py from vscode/themes/lavender_dusk.json - DO NOT EDIT
+
+return {
+  name = "Lavender Dusk",
+  mode = "dark",
+  palette = {
+    base00 = "#10081a",
+    base01 = "#181020",
+    base02 = "#251c30",
+    base03 = "#705088",
+    base04 = "#a78ebb",
+    base05 = "#e0d0f0",
+    base06 = "#f1e0ff",
+    base07 = "#fff1ff",
+    base08 = "#9873d8",
+    base09 = "#c29fff",
+    base0A = "#b388ff",
+    base0B = "#c9abff",
+    base0C = "#c29fff",
+    base0D = "#c6a5ff",
+    base0E = "#b388ff",
+    base0F = "#705088",
+  },
+  terminal = {
+    "#10081a", "#9873d8", "#ba93ff", "#8c739f",
+    "#b388ff", "#8666bf", "#c29fff", "#e0d0f0",
+    "#705088", "#b388ff", "#c29fff", "#e0d0f0",
+    "#be99ff", "#a17ae5", "#c9abff", "#e3d4f1",
+  },
+  groups = {
+    Normal = { fg = "#e0d0f0", bg = "#10081a" },
+    NormalFloat = { fg = "#e0d0f0", bg = "#181020" },
+    NormalNC = { fg = "#e0d0f0", bg = "#10081a" },
+    Cursor = { fg = "#10081a", bg = "#b388ff" },
+    CursorLine = { bg = "#1a1224" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#160e20" },
+    LineNr = { fg = "#705088" },
+    CursorLineNr = { fg = "#e0d0f0", bold = true },
+    SignColumn = { fg = "#705088", bg = "#10081a" },
+    VertSplit = { fg = "#251c30" },
+    WinSeparator = { fg = "#251c30" },
+    Folded = { fg = "#705088", bg = "#181020" },
+    FoldColumn = { fg = "#705088" },
+    NonText = { fg = "#705088" },
+    SpecialKey = { fg = "#705088" },
+    Whitespace = { fg = "#402c51" },
+    MatchParen = { fg = "#b388ff", bold = true },
+    Visual = { bg = "#402e5e" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#10081a", bg = "#b388ff" },
+    IncSearch = { fg = "#10081a", bg = "#c29fff" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#10081a", bg = "#9873d8" },
+    Pmenu = { fg = "#e0d0f0", bg = "#181020" },
+    PmenuSel = { fg = "#e0d0f0", bg = "#302147" },
+    PmenuSbar = { bg = "#251c30" },
+    PmenuThumb = { bg = "#a78ebb" },
+    ErrorMsg = { fg = "#9873d8" },
+    WarningMsg = { fg = "#c29fff" },
+    ModeMsg = { fg = "#e0d0f0", bold = true },
+    MoreMsg = { fg = "#c6a5ff" },
+    Question = { fg = "#c6a5ff" },
+    TabLine = { fg = "#a78ebb", bg = "#181020" },
+    TabLineFill = { bg = "#10081a" },
+    TabLineSel = { fg = "#e0d0f0", bg = "#10081a", bold = true },
+    StatusLine = { fg = "#e0d0f0", bg = "#181020" },
+    StatusLineNC = { fg = "#a78ebb", bg = "#181020" },
+    DiffAdd = { bg = "#2b203c" },
+    DiffChange = { bg = "#2a1e3c" },
+    DiffDelete = { fg = "#9873d8", bg = "#241836" },
+    DiffText = { bg = "#45355e" },
+    SpellBad = { sp = "#9873d8", undercurl = true },
+    SpellCap = { sp = "#c29fff", undercurl = true },
+    SpellLocal = { sp = "#c6a5ff", undercurl = true },
+    SpellRare = { sp = "#b388ff", undercurl = true },
+    Comment = { fg = "#705088" },
+    Constant = { fg = "#c29fff" },
+    String = { fg = "#c9abff" },
+    Character = { fg = "#c9abff" },
+    Number = { fg = "#c29fff" },
+    Boolean = { fg = "#c29fff" },
+    Float = { fg = "#c29fff" },
+    Identifier = { fg = "#e0d0f0" },
+    Function = { fg = "#c6a5ff" },
+    Statement = { fg = "#b388ff" },
+    Conditional = { fg = "#b388ff" },
+    Repeat = { fg = "#b388ff" },
+    Label = { fg = "#b388ff" },
+    Operator = { fg = "#a78ebb" },
+    Keyword = { fg = "#b388ff" },
+    Exception = { fg = "#b388ff" },
+    PreProc = { fg = "#b388ff" },
+    Include = { fg = "#b388ff" },
+    Define = { fg = "#b388ff" },
+    Macro = { fg = "#b388ff" },
+    PreCondit = { fg = "#b388ff" },
+    Type = { fg = "#e0d0f0" },
+    StorageClass = { fg = "#b388ff" },
+    Structure = { fg = "#e0d0f0" },
+    Typedef = { fg = "#e0d0f0" },
+    Special = { fg = "#c29fff" },
+    SpecialChar = { fg = "#c29fff" },
+    Tag = { fg = "#c9abff" },
+    Delimiter = { fg = "#a78ebb" },
+    SpecialComment = { fg = "#705088", italic = true },
+    Debug = { fg = "#c29fff" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#705088" },
+    Error = { fg = "#9873d8" },
+    Todo = { fg = "#10081a", bg = "#b388ff", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#e0d0f0" },
+      ["@variable.builtin"] = { fg = "#b388ff" },
+      ["@variable.parameter"] = { fg = "#e0d0f0", italic = true },
+      ["@variable.member"] = { fg = "#e0d0f0" },
+      ["@constant"] = { fg = "#c29fff" },
+      ["@constant.builtin"] = { fg = "#c29fff" },
+      ["@module"] = { fg = "#e0d0f0" },
+      ["@label"] = { fg = "#b388ff" },
+      ["@type"] = { fg = "#e0d0f0" },
+      ["@type.builtin"] = { fg = "#e0d0f0" },
+      ["@attribute"] = { fg = "#e1d2f0" },
+      ["@property"] = { fg = "#e0d0f0" },
+      ["@function"] = { fg = "#c6a5ff" },
+      ["@function.builtin"] = { fg = "#c6a5ff" },
+      ["@function.call"] = { fg = "#c6a5ff" },
+      ["@function.method"] = { fg = "#c6a5ff" },
+      ["@constructor"] = { fg = "#e0d0f0" },
+      ["@operator"] = { fg = "#a78ebb" },
+      ["@keyword"] = { fg = "#b388ff" },
+      ["@keyword.conditional"] = { fg = "#b388ff" },
+      ["@keyword.function"] = { fg = "#b388ff" },
+      ["@keyword.operator"] = { fg = "#b388ff" },
+      ["@keyword.return"] = { fg = "#b388ff" },
+      ["@punctuation.bracket"] = { fg = "#a78ebb" },
+      ["@punctuation.delimiter"] = { fg = "#a78ebb" },
+      ["@punctuation.special"] = { fg = "#c29fff" },
+      ["@string"] = { fg = "#c9abff" },
+      ["@string.escape"] = { fg = "#c29fff" },
+      ["@string.regexp"] = { fg = "#c29fff" },
+      ["@character"] = { fg = "#c9abff" },
+      ["@boolean"] = { fg = "#c29fff" },
+      ["@number"] = { fg = "#c29fff" },
+      ["@comment"] = { fg = "#705088", italic = true },
+      ["@comment.todo"] = { fg = "#10081a", bg = "#b388ff", bold = true },
+      ["@comment.error"] = { fg = "#9873d8", bold = true },
+      ["@comment.warning"] = { fg = "#c29fff", bold = true },
+      ["@comment.note"] = { fg = "#c6a5ff", bold = true },
+      ["@markup.heading"] = { fg = "#b388ff", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#c9abff" },
+      ["@markup.link"] = { fg = "#c6a5ff", underline = true },
+      ["@tag"] = { fg = "#c9abff" },
+      ["@tag.attribute"] = { fg = "#e1d2f0" },
+      ["@tag.delimiter"] = { fg = "#a78ebb" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#9873d8" },
+      DiagnosticWarn = { fg = "#c29fff" },
+      DiagnosticInfo = { fg = "#c6a5ff" },
+      DiagnosticHint = { fg = "#b388ff" },
+      DiagnosticUnderlineError = { sp = "#9873d8", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#c29fff", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#c6a5ff", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#b388ff", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#9873d8", bg = "#1d122d" },
+      DiagnosticVirtualTextWarn = { fg = "#c29fff", bg = "#211730" },
+      DiagnosticVirtualTextInfo = { fg = "#c6a5ff", bg = "#221730" },
+      DiagnosticVirtualTextHint = { fg = "#b388ff", bg = "#201430" },
+      LspReferenceText = { bg = "#241c2f" },
+      LspReferenceRead = { bg = "#241c2f" },
+      LspReferenceWrite = { bg = "#2f263a" },
+      LspSignatureActiveParameter = { fg = "#b388ff", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#c9abff" },
+      GitSignsChange = { fg = "#c29fff" },
+      GitSignsDelete = { fg = "#9873d8" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#e0d0f0", bg = "#10081a" },
+      TelescopeBorder = { fg = "#251c30", bg = "#10081a" },
+      TelescopePromptTitle = { fg = "#10081a", bg = "#b388ff", bold = true },
+      TelescopePreviewTitle = { fg = "#10081a", bg = "#c9abff", bold = true },
+      TelescopeResultsTitle = { fg = "#10081a", bg = "#c6a5ff", bold = true },
+      TelescopeSelection = { bg = "#302147" },
+      TelescopeMatching = { fg = "#b388ff", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#b388ff", bold = true },
+      CmpItemKindVariable = { fg = "#e0d0f0" },
+      CmpItemKindFunction = { fg = "#c6a5ff" },
+      CmpItemKindKeyword = { fg = "#b388ff" },
+      CmpItemKindClass = { fg = "#e0d0f0" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#251c30" },
+      IblScope = { fg = "#705088" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#10081a", bg = "#b388ff", bold = true },
+      LazyButton = { fg = "#e0d0f0", bg = "#251c30" },
+      LazyButtonActive = { fg = "#10081a", bg = "#b388ff" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#9873d8" },
+      NotifyWARNBorder = { fg = "#c29fff" },
+      NotifyINFOBorder = { fg = "#c6a5ff" },
+      NotifyDEBUGBorder = { fg = "#705088" },
+      NotifyTRACEBorder = { fg = "#b388ff" },
+    },
+  },
+}
@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Memphis
+-- Auto-generated by sync_themes.py from vscode/themes/memphis.json - DO NOT EDIT
+
+return {
+  name = "Memphis",
+  mode = "dark",
+  palette = {
+    base00 = "#000000",
+    base01 = "#0a0d10",
+    base02 = "#020202",
+    base03 = "#1a1f24",
+    base04 = "#72787e",
+    base05 = "#d8e0e7",
+    base06 = "#e8f1f8",
+    base07 = "#f8ffff",
+    base08 = "#4793d8",
+    base09 = "#7ec2ff",
+    base0A = "#54aeff",
+    base0B = "#b6e3ff",
+    base0C = "#76beff",
+    base0D = "#80ccff",
+    base0E = "#54aeff",
+    base0F = "#3a424f",
+  },
+  terminal = {
+    "#000000", "#4793d8", "#65b6ff", "#616772",
+    "#54aeff", "#3f82bf", "#76beff", "#d8e0e7",
+    "#3a424f", "#54aeff", "#76beff", "#d8e0e7",
+    "#6dbaff", "#4b9ce5", "#87c6ff", "#dbe3e9",
+  },
+  groups = {
+    Normal = { fg = "#d8e0e7", bg = "#000000" },
+    NormalFloat = { fg = "#d8e0e7", bg = "#0a0d10" },
+    NormalNC = { fg = "#d8e0e7", bg = "#000000" },
+    Cursor = { fg = "#000000", bg = "#54aeff" },
+    CursorLine = { bg = "#0a0b0b" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#060606" },
+    LineNr = { fg = "#1a1f24" },
+    CursorLineNr = { fg = "#d8e0e7", bold = true },
+    SignColumn = { fg = "#1a1f24", bg = "#000000" },
+    VertSplit = { fg = "#020202" },
+    WinSeparator = { fg = "#020202" },
+    Folded = { fg = "#1a1f24", bg = "#0a0d10" },
+    FoldColumn = { fg = "#1a1f24" },
+    NonText = { fg = "#1a1f24" },
+    SpecialKey = { fg = "#1a1f24" },
+    Whitespace = { fg = "#0d0f12" },
+    MatchParen = { fg = "#54aeff", bold = true },
+    Visual = { bg = "#19344c" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#000000", bg = "#54aeff" },
+    IncSearch = { fg = "#000000", bg = "#7ec2ff" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#000000", bg = "#4793d8" },
+    Pmenu = { fg = "#d8e0e7", bg = "#0a0d10" },
+    PmenuSel = { fg = "#d8e0e7", bg = "#102233" },
+    PmenuSbar = { bg = "#020202" },
+    PmenuThumb = { bg = "#72787e" },
+    ErrorMsg = { fg = "#4793d8" },
+    WarningMsg = { fg = "#7ec2ff" },
+    ModeMsg = { fg = "#d8e0e7", bold = true },
+    MoreMsg = { fg = "#80ccff" },
+    Question = { fg = "#80ccff" },
+    TabLine = { fg = "#72787e", bg = "#0a0d10" },
+    TabLineFill = { bg = "#000000" },
+    TabLineSel = { fg = "#d8e0e7", bg = "#000000", bold = true },
+    StatusLine = { fg = "#d8e0e7", bg = "#0a0d10" },
+    StatusLineNC = { fg = "#72787e", bg = "#0a0d10" },
+    DiffAdd = { bg = "#1b2226" },
+    DiffChange = { bg = "#121d26" },
+    DiffDelete = { fg = "#4793d8", bg = "#0a1620" },
+    DiffText = { bg = "#253a4c" },
+    SpellBad = { sp = "#4793d8", undercurl = true },
+    SpellCap = { sp = "#7ec2ff", undercurl = true },
+    SpellLocal = { sp = "#80ccff", undercurl = true },
+    SpellRare = { sp = "#54aeff", undercurl = true },
+    Comment = { fg = "#1a1f24" },
+    Constant = { fg = "#7ec2ff" },
+    String = { fg = "#b6e3ff" },
+    Character = { fg = "#b6e3ff" },
+    Number = { fg = "#7ec2ff" },
+    Boolean = { fg = "#7ec2ff" },
+    Float = { fg = "#7ec2ff" },
+    Identifier = { fg = "#d8e0e7" },
+    Function = { fg = "#80ccff" },
+    Statement = { fg = "#54aeff" },
+    Conditional = { fg = "#54aeff" },
+    Repeat = { fg = "#54aeff" },
+    Label = { fg = "#54aeff" },
+    Operator = { fg = "#72787e" },
+    Keyword = { fg = "#54aeff" },
+    Exception = { fg = "#54aeff" },
+    PreProc = { fg = "#54aeff" },
+    Include = { fg = "#54aeff" },
+    Define = { fg = "#54aeff" },
+    Macro = { fg = "#54aeff" },
+    PreCondit = { fg = "#54aeff" },
+    Type = { fg = "#3888c8" },
+    StorageClass = { fg = "#54aeff" },
+    Structure = { fg = "#3888c8" },
+    Typedef = { fg = "#3888c8" },
+    Special = { fg = "#76beff" },
+    SpecialChar = { fg = "#76beff" },
+    Tag = { fg = "#7fc2ff" },
+    Delimiter = { fg = "#72787e" },
+    SpecialComment = { fg = "#1a1f24", italic = true },
+    Debug = { fg = "#7ec2ff" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#1a1f24" },
+    Error = { fg = "#4793d8" },
+    Todo = { fg = "#000000", bg = "#54aeff", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#d8e0e7" },
+      ["@variable.builtin"] = { fg = "#54aeff" },
+      ["@variable.parameter"] = { fg = "#d8e0e7", italic = true },
+      ["@variable.member"] = { fg = "#d8e0e7" },
+      ["@constant"] = { fg = "#7ec2ff" },
+      ["@constant.builtin"] = { fg = "#7ec2ff" },
+      ["@module"] = { fg = "#d8e0e7" },
+      ["@label"] = { fg = "#54aeff" },
+      ["@type"] = { fg = "#3888c8" },
+      ["@type.builtin"] = { fg = "#3888c8" },
+      ["@attribute"] = { fg = "#6dbaff" },
+      ["@property"] = { fg = "#d8e0e7" },
+      ["@function"] = { fg = "#80ccff" },
+      ["@function.builtin"] = { fg = "#80ccff" },
+      ["@function.call"] = { fg = "#80ccff" },
+      ["@function.method"] = { fg = "#80ccff" },
+      ["@constructor"] = { fg = "#3888c8" },
+      ["@operator"] = { fg = "#72787e" },
+      ["@keyword"] = { fg = "#54aeff" },
+      ["@keyword.conditional"] = { fg = "#54aeff" },
+      ["@keyword.function"] = { fg = "#54aeff" },
+      ["@keyword.operator"] = { fg = "#54aeff" },
+      ["@keyword.return"] = { fg = "#54aeff" },
+      ["@punctuation.bracket"] = { fg = "#72787e" },
+      ["@punctuation.delimiter"] = { fg = "#72787e" },
+      ["@punctuation.special"] = { fg = "#76beff" },
+      ["@string"] = { fg = "#b6e3ff" },
+      ["@string.escape"] = { fg = "#76beff" },
+      ["@string.regexp"] = { fg = "#76beff" },
+      ["@character"] = { fg = "#b6e3ff" },
+      ["@boolean"] = { fg = "#7ec2ff" },
+      ["@number"] = { fg = "#7ec2ff" },
+      ["@comment"] = { fg = "#1a1f24", italic = true },
+      ["@comment.todo"] = { fg = "#000000", bg = "#54aeff", bold = true },
+      ["@comment.error"] = { fg = "#4793d8", bold = true },
+      ["@comment.warning"] = { fg = "#7ec2ff", bold = true },
+      ["@comment.note"] = { fg = "#80ccff", bold = true },
+      ["@markup.heading"] = { fg = "#54aeff", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#b6e3ff" },
+      ["@markup.link"] = { fg = "#80ccff", underline = true },
+      ["@tag"] = { fg = "#7fc2ff" },
+      ["@tag.attribute"] = { fg = "#6dbaff" },
+      ["@tag.delimiter"] = { fg = "#72787e" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#4793d8" },
+      DiagnosticWarn = { fg = "#7ec2ff" },
+      DiagnosticInfo = { fg = "#80ccff" },
+      DiagnosticHint = { fg = "#54aeff" },
+      DiagnosticUnderlineError = { sp = "#4793d8", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#7ec2ff", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#80ccff", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#54aeff", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#4793d8", bg = "#070e15" },
+      DiagnosticVirtualTextWarn = { fg = "#7ec2ff", bg = "#0c1319" },
+      DiagnosticVirtualTextInfo = { fg = "#80ccff", bg = "#0c1419" },
+      DiagnosticVirtualTextHint = { fg = "#54aeff", bg = "#081119" },
+      LspReferenceText = { bg = "#151617" },
+      LspReferenceRead = { bg = "#151617" },
+      LspReferenceWrite = { bg = "#202122" },
+      LspSignatureActiveParameter = { fg = "#54aeff", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#b6e3ff" },
+      GitSignsChange = { fg = "#7ec2ff" },
+      GitSignsDelete = { fg = "#4793d8" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#d8e0e7", bg = "#000000" },
+      TelescopeBorder = { fg = "#020202", bg = "#000000" },
+      TelescopePromptTitle = { fg = "#000000", bg = "#54aeff", bold = true },
+      TelescopePreviewTitle = { fg = "#000000", bg = "#b6e3ff", bold = true },
+      TelescopeResultsTitle = { fg = "#000000", bg = "#80ccff", bold = true },
+      TelescopeSelection = { bg = "#102233" },
+      TelescopeMatching = { fg = "#54aeff", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#54aeff", bold = true },
+      CmpItemKindVariable = { fg = "#d8e0e7" },
+      CmpItemKindFunction = { fg = "#80ccff" },
+      CmpItemKindKeyword = { fg = "#54aeff" },
+      CmpItemKindClass = { fg = "#3888c8" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#020202" },
+      IblScope = { fg = "#1a1f24" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#000000", bg = "#54aeff", bold = true },
+      LazyButton = { fg = "#d8e0e7", bg = "#020202" },
+      LazyButtonActive = { fg = "#000000", bg = "#54aeff" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#4793d8" },
+      NotifyWARNBorder = { fg = "#7ec2ff" },
+      NotifyINFOBorder = { fg = "#80ccff" },
+      NotifyDEBUGBorder = { fg = "#1a1f24" },
+      NotifyTRACEBorder = { fg = "#54aeff" },
+    },
+  },
+}
@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Midnight Sapphire
+-- Auto-generated by sync_themes.py from vscode/themes/midnight_sapphire.json - DO NOT EDIT
+
+return {
+  name = "Midnight Sapphire",
+  mode = "dark",
+  palette = {
+    base00 = "#050810",
+    base01 = "#0a1018",
+    base02 = "#171c25",
+    base03 = "#606878",
+    base04 = "#9ea6b6",
+    base05 = "#e0e8f8",
+    base06 = "#f1f9ff",
+    base07 = "#f7ffff",
+    base08 = "#a3a3b0",
+    base09 = "#88b0e0",
+    base0A = "#c0c0d0",
+    base0B = "#c0d0e8",
+    base0C = "#ccccd9",
+    base0D = "#f0f4f8",
+    base0E = "#6090d0",
+    base0F = "#4a5568",
+  },
+  terminal = {
+    "#050810", "#a3a3b0", "#c6c6d4", "#6e7786",
+    "#c0c0d0", "#90909c", "#ccccd9", "#e0e8f8",
+    "#4a5568", "#c0c0d0", "#ccccd9", "#e0e8f8",
+    "#c9c9d7", "#acacbb", "#d2d2de", "#e3eaf8",
+  },
+  groups = {
+    Normal = { fg = "#e0e8f8", bg = "#050810" },
+    NormalFloat = { fg = "#e0e8f8", bg = "#0a1018" },
+    NormalNC = { fg = "#e0e8f8", bg = "#050810" },
+    Cursor = { fg = "#050810", bg = "#c0c0d0" },
+    CursorLine = { bg = "#0f131b" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#0b0e16" },
+    LineNr = { fg = "#606878" },
+    CursorLineNr = { fg = "#e0e8f8", bold = true },
+    SignColumn = { fg = "#606878", bg = "#050810" },
+    VertSplit = { fg = "#171c25" },
+    WinSeparator = { fg = "#171c25" },
+    Folded = { fg = "#606878", bg = "#0a1018" },
+    FoldColumn = { fg = "#606878" },
+    NonText = { fg = "#606878" },
+    SpecialKey = { fg = "#606878" },
+    Whitespace = { fg = "#323844" },
+    MatchParen = { fg = "#c0c0d0", bold = true },
+    Visual = { bg = "#3d3f49" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#050810", bg = "#c0c0d0" },
+    IncSearch = { fg = "#050810", bg = "#88b0e0" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#050810", bg = "#a3a3b0" },
+    Pmenu = { fg = "#e0e8f8", bg = "#0a1018" },
+    PmenuSel = { fg = "#e0e8f8", bg = "#2a2c36" },
+    PmenuSbar = { bg = "#171c25" },
+    PmenuThumb = { bg = "#9ea6b6" },
+    ErrorMsg = { fg = "#a3a3b0" },
+    WarningMsg = { fg = "#88b0e0" },
+    ModeMsg = { fg = "#e0e8f8", bold = true },
+    MoreMsg = { fg = "#f0f4f8" },
+    Question = { fg = "#f0f4f8" },
+    TabLine = { fg = "#9ea6b6", bg = "#0a1018" },
+    TabLineFill = { bg = "#050810" },
+    TabLineSel = { fg = "#e0e8f8", bg = "#050810", bold = true },
+    StatusLine = { fg = "#e0e8f8", bg = "#0a1018" },
+    StatusLineNC = { fg = "#9ea6b6", bg = "#0a1018" },
+    DiffAdd = { bg = "#212630" },
+    DiffChange = { bg = "#18212f" },
+    DiffDelete = { fg = "#a3a3b0", bg = "#1c1f28" },
+    DiffText = { bg = "#2c3a4e" },
+    SpellBad = { sp = "#a3a3b0", undercurl = true },
+    SpellCap = { sp = "#88b0e0", undercurl = true },
+    SpellLocal = { sp = "#f0f4f8", undercurl = true },
+    SpellRare = { sp = "#6090d0", undercurl = true },
+    Comment = { fg = "#606878" },
+    Constant = { fg = "#88b0e0" },
+    String = { fg = "#c0d0e8" },
+    Character = { fg = "#c0d0e8" },
+    Number = { fg = "#88b0e0" },
+    Boolean = { fg = "#88b0e0" },
+    Float = { fg = "#88b0e0" },
+    Identifier = { fg = "#d0d8e8" },
+    Function = { fg = "#f0f4f8" },
+    Statement = { fg = "#6090d0" },
+    Conditional = { fg = "#6090d0" },
+    Repeat = { fg = "#6090d0" },
+    Label = { fg = "#6090d0" },
+    Operator = { fg = "#9ea6b6" },
+    Keyword = { fg = "#6090d0" },
+    Exception = { fg = "#6090d0" },
+    PreProc = { fg = "#6090d0" },
+    Include = { fg = "#6090d0" },
+    Define = { fg = "#6090d0" },
+    Macro = { fg = "#6090d0" },
+    PreCondit = { fg = "#6090d0" },
+    Type = { fg = "#4070a0" },
+    StorageClass = { fg = "#6090d0" },
+    Structure = { fg = "#4070a0" },
+    Typedef = { fg = "#4070a0" },
+    Special = { fg = "#ccccd9" },
+    SpecialChar = { fg = "#ccccd9" },
+    Tag = { fg = "#c0c0d0" },
+    Delimiter = { fg = "#9ea6b6" },
+    SpecialComment = { fg = "#606878", italic = true },
+    Debug = { fg = "#88b0e0" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#606878" },
+    Error = { fg = "#a3a3b0" },
+    Todo = { fg = "#050810", bg = "#c0c0d0", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#d0d8e8" },
+      ["@variable.builtin"] = { fg = "#6090d0" },
+      ["@variable.parameter"] = { fg = "#d0d8e8", italic = true },
+      ["@variable.member"] = { fg = "#d0d8e8" },
+      ["@constant"] = { fg = "#88b0e0" },
+      ["@constant.builtin"] = { fg = "#88b0e0" },
+      ["@module"] = { fg = "#e0e8f8" },
+      ["@label"] = { fg = "#6090d0" },
+      ["@type"] = { fg = "#4070a0" },
+      ["@type.builtin"] = { fg = "#4070a0" },
+      ["@attribute"] = { fg = "#e1e9f8" },
+      ["@property"] = { fg = "#d0d8e8" },
+      ["@function"] = { fg = "#f0f4f8" },
+      ["@function.builtin"] = { fg = "#f0f4f8" },
+      ["@function.call"] = { fg = "#f0f4f8" },
+      ["@function.method"] = { fg = "#f0f4f8" },
+      ["@constructor"] = { fg = "#4070a0" },
+      ["@operator"] = { fg = "#9ea6b6" },
+      ["@keyword"] = { fg = "#6090d0" },
+      ["@keyword.conditional"] = { fg = "#6090d0" },
+      ["@keyword.function"] = { fg = "#6090d0" },
+      ["@keyword.operator"] = { fg = "#6090d0" },
+      ["@keyword.return"] = { fg = "#6090d0" },
+      ["@punctuation.bracket"] = { fg = "#9ea6b6" },
+      ["@punctuation.delimiter"] = { fg = "#9ea6b6" },
+      ["@punctuation.special"] = { fg = "#ccccd9" },
+      ["@string"] = { fg = "#c0d0e8" },
+      ["@string.escape"] = { fg = "#ccccd9" },
+      ["@string.regexp"] = { fg = "#ccccd9" },
+      ["@character"] = { fg = "#c0d0e8" },
+      ["@boolean"] = { fg = "#88b0e0" },
+      ["@number"] = { fg = "#88b0e0" },
+      ["@comment"] = { fg = "#606878", italic = true },
+      ["@comment.todo"] = { fg = "#050810", bg = "#c0c0d0", bold = true },
+      ["@comment.error"] = { fg = "#a3a3b0", bold = true },
+      ["@comment.warning"] = { fg = "#88b0e0", bold = true },
+      ["@comment.note"] = { fg = "#f0f4f8", bold = true },
+      ["@markup.heading"] = { fg = "#6090d0", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#c0d0e8" },
+      ["@markup.link"] = { fg = "#f0f4f8", underline = true },
+      ["@tag"] = { fg = "#c0c0d0" },
+      ["@tag.attribute"] = { fg = "#e1e9f8" },
+      ["@tag.delimiter"] = { fg = "#9ea6b6" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#a3a3b0" },
+      DiagnosticWarn = { fg = "#88b0e0" },
+      DiagnosticInfo = { fg = "#f0f4f8" },
+      DiagnosticHint = { fg = "#c0c0d0" },
+      DiagnosticUnderlineError = { sp = "#a3a3b0", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#88b0e0", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#f0f4f8", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#c0c0d0", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#a3a3b0", bg = "#141720" },
+      DiagnosticVirtualTextWarn = { fg = "#88b0e0", bg = "#121824" },
+      DiagnosticVirtualTextInfo = { fg = "#f0f4f8", bg = "#1c1f27" },
+      DiagnosticVirtualTextHint = { fg = "#c0c0d0", bg = "#171a23" },
+      LspReferenceText = { bg = "#1a1e27" },
+      LspReferenceRead = { bg = "#1a1e27" },
+      LspReferenceWrite = { bg = "#252932" },
+      LspSignatureActiveParameter = { fg = "#c0c0d0", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#c0d0e8" },
+      GitSignsChange = { fg = "#88b0e0" },
+      GitSignsDelete = { fg = "#a3a3b0" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#e0e8f8", bg = "#050810" },
+      TelescopeBorder = { fg = "#171c25", bg = "#050810" },
+      TelescopePromptTitle = { fg = "#050810", bg = "#c0c0d0", bold = true },
+      TelescopePreviewTitle = { fg = "#050810", bg = "#c0d0e8", bold = true },
+      TelescopeResultsTitle = { fg = "#050810", bg = "#f0f4f8", bold = true },
+      TelescopeSelection = { bg = "#2a2c36" },
+      TelescopeMatching = { fg = "#c0c0d0", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#c0c0d0", bold = true },
+      CmpItemKindVariable = { fg = "#d0d8e8" },
+      CmpItemKindFunction = { fg = "#f0f4f8" },
+      CmpItemKindKeyword = { fg = "#6090d0" },
+      CmpItemKindClass = { fg = "#4070a0" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#171c25" },
+      IblScope = { fg = "#606878" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#050810", bg = "#c0c0d0", bold = true },
+      LazyButton = { fg = "#e0e8f8", bg = "#171c25" },
+      LazyButtonActive = { fg = "#050810", bg = "#c0c0d0" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#a3a3b0" },
+      NotifyWARNBorder = { fg = "#88b0e0" },
+      NotifyINFOBorder = { fg = "#f0f4f8" },
+      NotifyDEBUGBorder = { fg = "#606878" },
+      NotifyTRACEBorder = { fg = "#6090d0" },
+    },
+  },
+}
@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Minimal
+-- Auto-generated by sync_themes.py from vscode/themes/minimal.json - DO NOT EDIT
+
+return {
+  name = "Minimal",
+  mode = "light",
+  palette = {
+    base00 = "#f5f5f5",
+    base01 = "#ebebeb",
+    base02 = "#d7d7d7",
+    base03 = "#b0a8a6",
+    base04 = "#5d5a59",
+    base05 = "#161616",
+    base06 = "#0b0b0b",
+    base07 = "#030303",
+    base08 = "#c1302f",
+    base09 = "#cd3332",
+    base0A = "#e43938",
+    base0B = "#c1302f",
+    base0C = "#e85655",
+    base0D = "#d83635",
+    base0E = "#e43938",
+    base0F = "#b0a8a6",
+  },
+  terminal = {
+    "#161616", "#c1302f", "#e64c4b", "#b0a8a6",
+    "#e43938", "#ab2a2a", "#e85655", "#f5f5f5",
+    "#b0a8a6", "#e43938", "#e85655", "#b7b0ae",
+    "#e64c4b", "#cd3332", "#ea6a69", "#f5f5f5",
+  },
+  groups = {
+    Normal = { fg = "#161616", bg = "#f5f5f5" },
+    NormalFloat = { fg = "#161616", bg = "#ebebeb" },
+    NormalNC = { fg = "#161616", bg = "#f5f5f5" },
+    Cursor = { fg = "#f5f5f5", bg = "#e43938" },
+    CursorLine = { bg = "#e9e9e9" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#eeeeee" },
+    LineNr = { fg = "#b0a8a6" },
+    CursorLineNr = { fg = "#161616", bold = true },
+    SignColumn = { fg = "#b0a8a6", bg = "#f5f5f5" },
+    VertSplit = { fg = "#d7d7d7" },
+    WinSeparator = { fg = "#d7d7d7" },
+    Folded = { fg = "#b0a8a6", bg = "#ebebeb" },
+    FoldColumn = { fg = "#b0a8a6" },
+    NonText = { fg = "#b0a8a6" },
+    SpecialKey = { fg = "#b0a8a6" },
+    Whitespace = { fg = "#d2cecd" },
+    MatchParen = { fg = "#e43938", bold = true },
+    Visual = { bg = "#efbcbc" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#f5f5f5", bg = "#e43938" },
+    IncSearch = { fg = "#f5f5f5", bg = "#cd3332" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#f5f5f5", bg = "#c1302f" },
+    Pmenu = { fg = "#161616", bg = "#ebebeb" },
+    PmenuSel = { fg = "#161616", bg = "#f1cfcf" },
+    PmenuSbar = { bg = "#d7d7d7" },
+    PmenuThumb = { bg = "#5d5a59" },
+    ErrorMsg = { fg = "#c1302f" },
+    WarningMsg = { fg = "#cd3332" },
+    ModeMsg = { fg = "#161616", bold = true },
+    MoreMsg = { fg = "#d83635" },
+    Question = { fg = "#d83635" },
+    TabLine = { fg = "#5d5a59", bg = "#ebebeb" },
+    TabLineFill = { bg = "#f5f5f5" },
+    TabLineSel = { fg = "#161616", bg = "#f5f5f5", bold = true },
+    StatusLine = { fg = "#161616", bg = "#ebebeb" },
+    StatusLineNC = { fg = "#5d5a59", bg = "#ebebeb" },
+    DiffAdd = { bg = "#edd7d7" },
+    DiffChange = { bg = "#efd7d7" },
+    DiffDelete = { fg = "#c1302f", bg = "#edd7d7" },
+    DiffText = { bg = "#e9baba" },
+    SpellBad = { sp = "#c1302f", undercurl = true },
+    SpellCap = { sp = "#cd3332", undercurl = true },
+    SpellLocal = { sp = "#d83635", undercurl = true },
+    SpellRare = { sp = "#e43938", undercurl = true },
+    Comment = { fg = "#b0a8a6" },
+    Constant = { fg = "#cd3332" },
+    String = { fg = "#c1302f" },
+    Character = { fg = "#c1302f" },
+    Number = { fg = "#cd3332" },
+    Boolean = { fg = "#cd3332" },
+    Float = { fg = "#cd3332" },
+    Identifier = { fg = "#161616" },
+    Function = { fg = "#d83635" },
+    Statement = { fg = "#e43938" },
+    Conditional = { fg = "#e43938" },
+    Repeat = { fg = "#e43938" },
+    Label = { fg = "#e43938" },
+    Operator = { fg = "#5d5a59" },
+    Keyword = { fg = "#e43938" },
+    Exception = { fg = "#e43938" },
+    PreProc = { fg = "#e43938" },
+    Include = { fg = "#e43938" },
+    Define = { fg = "#e43938" },
+    Macro = { fg = "#e43938" },
+    PreCondit = { fg = "#e43938" },
+    Type = { fg = "#161616" },
+    StorageClass = { fg = "#e43938" },
+    Structure = { fg = "#161616" },
+    Typedef = { fg = "#161616" },
+    Special = { fg = "#e85655" },
+    SpecialChar = { fg = "#e85655" },
+    Tag = { fg = "#c1302f" },
+    Delimiter = { fg = "#5d5a59" },
+    SpecialComment = { fg = "#b0a8a6", italic = true },
+    Debug = { fg = "#cd3332" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#b0a8a6" },
+    Error = { fg = "#c1302f" },
+    Todo = { fg = "#f5f5f5", bg = "#e43938", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#161616" },
+      ["@variable.builtin"] = { fg = "#e43938" },
+      ["@variable.parameter"] = { fg = "#161616", italic = true },
+      ["@variable.member"] = { fg = "#161616" },
+      ["@constant"] = { fg = "#cd3332" },
+      ["@constant.builtin"] = { fg = "#cd3332" },
+      ["@module"] = { fg = "#161616" },
+      ["@label"] = { fg = "#e43938" },
+      ["@type"] = { fg = "#161616" },
+      ["@type.builtin"] = { fg = "#161616" },
+      ["@attribute"] = { fg = "#131313" },
+      ["@property"] = { fg = "#161616" },
+      ["@function"] = { fg = "#d83635" },
+      ["@function.builtin"] = { fg = "#d83635" },
+      ["@function.call"] = { fg = "#d83635" },
+      ["@function.method"] = { fg = "#d83635" },
+      ["@constructor"] = { fg = "#161616" },
+      ["@operator"] = { fg = "#5d5a59" },
+      ["@keyword"] = { fg = "#e43938" },
+      ["@keyword.conditional"] = { fg = "#e43938" },
+      ["@keyword.function"] = { fg = "#e43938" },
+      ["@keyword.operator"] = { fg = "#e43938" },
+      ["@keyword.return"] = { fg = "#e43938" },
+      ["@punctuation.bracket"] = { fg = "#5d5a59" },
+      ["@punctuation.delimiter"] = { fg = "#5d5a59" },
+      ["@punctuation.special"] = { fg = "#e85655" },
+      ["@string"] = { fg = "#c1302f" },
+      ["@string.escape"] = { fg = "#e85655" },
+      ["@string.regexp"] = { fg = "#e85655" },
+      ["@character"] = { fg = "#c1302f" },
+      ["@boolean"] = { fg = "#cd3332" },
+      ["@number"] = { fg = "#cd3332" },
+      ["@comment"] = { fg = "#b0a8a6", italic = true },
+      ["@comment.todo"] = { fg = "#f5f5f5", bg = "#e43938", bold = true },
+      ["@comment.error"] = { fg = "#c1302f", bold = true },
+      ["@comment.warning"] = { fg = "#cd3332", bold = true },
+      ["@comment.note"] = { fg = "#d83635", bold = true },
+      ["@markup.heading"] = { fg = "#e43938", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#c1302f" },
+      ["@markup.link"] = { fg = "#d83635", underline = true },
+      ["@tag"] = { fg = "#c1302f" },
+      ["@tag.attribute"] = { fg = "#131313" },
+      ["@tag.delimiter"] = { fg = "#5d5a59" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#c1302f" },
+      DiagnosticWarn = { fg = "#cd3332" },
+      DiagnosticInfo = { fg = "#d83635" },
+      DiagnosticHint = { fg = "#e43938" },
+      DiagnosticUnderlineError = { sp = "#c1302f", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#cd3332", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#d83635", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#e43938", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#c1302f", bg = "#efe1e1" },
+      DiagnosticVirtualTextWarn = { fg = "#cd3332", bg = "#f1e1e1" },
+      DiagnosticVirtualTextInfo = { fg = "#d83635", bg = "#f2e1e1" },
+      DiagnosticVirtualTextHint = { fg = "#e43938", bg = "#f3e2e2" },
+      LspReferenceText = { bg = "#dedede" },
+      LspReferenceRead = { bg = "#dedede" },
+      LspReferenceWrite = { bg = "#d3d3d3" },
+      LspSignatureActiveParameter = { fg = "#e43938", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#c1302f" },
+      GitSignsChange = { fg = "#cd3332" },
+      GitSignsDelete = { fg = "#c1302f" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#161616", bg = "#f5f5f5" },
+      TelescopeBorder = { fg = "#d7d7d7", bg = "#f5f5f5" },
+      TelescopePromptTitle = { fg = "#f5f5f5", bg = "#e43938", bold = true },
+      TelescopePreviewTitle = { fg = "#f5f5f5", bg = "#c1302f", bold = true },
+      TelescopeResultsTitle = { fg = "#f5f5f5", bg = "#d83635", bold = true },
+      TelescopeSelection = { bg = "#f1cfcf" },
+      TelescopeMatching = { fg = "#e43938", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#e43938", bold = true },
+      CmpItemKindVariable = { fg = "#161616" },
+      CmpItemKindFunction = { fg = "#d83635" },
+      CmpItemKindKeyword = { fg = "#e43938" },
+      CmpItemKindClass = { fg = "#161616" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#d7d7d7" },
+      IblScope = { fg = "#b0a8a6" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#f5f5f5", bg = "#e43938", bold = true },
+      LazyButton = { fg = "#161616", bg = "#d7d7d7" },
+      LazyButtonActive = { fg = "#f5f5f5", bg = "#e43938" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#c1302f" },
+      NotifyWARNBorder = { fg = "#cd3332" },
+      NotifyINFOBorder = { fg = "#d83635" },
+      NotifyDEBUGBorder = { fg = "#b0a8a6" },
+      NotifyTRACEBorder = { fg = "#e43938" },
+    },
+  },
+}
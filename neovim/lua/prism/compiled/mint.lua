@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Mint
+-- Auto-generated by sync_themes.py from vscode/themes/mint.json - DO NOT EDIT
+
+return {
+  name = "Mint",
+  mode = "dark",
+  palette = {
+    base00 = "#0a1818",
+    base01 = "#0d2020",
+    base02 = "#1f2e2d",
+    base03 = "#48a078",
+    base04 = "#9bccb2",
+    base05 = "#e8f8f0",
+    base06 = "#f4fffc",
+    base07 = "#f4fffc",
+    base08 = "#62b28f",
+    base09 = "#98d8c0",
+    base0A = "#74D2A9",
+    base0B = "#b8f0d8",
+    base0C = "#88d8b5",
+    base0D = "#ffffff",
+    base0E = "#74D2A9",
+    base0F = "#A6F2B8",
+  },
+  terminal = {
+    "#0d1e1e", "#62b28f", "#81d6b1", "#A6F2B8",
+    "#74D2A9", "#579d7e", "#88d8b5", "#EDFDEE",
+    "#A6F2B8", "#74D2A9", "#88d8b5", "#aef3bf",
+    "#81d6b1", "#68bd98", "#96ddbe", "#edfdee",
+  },
+  groups = {
+    Normal = { fg = "#e8f8f0", bg = "#0a1818" },
+    NormalFloat = { fg = "#e8f8f0", bg = "#0d2020" },
+    NormalNC = { fg = "#e8f8f0", bg = "#0a1818" },
+    Cursor = { fg = "#0a1818", bg = "#74D2A9" },
+    CursorLine = { bg = "#152322" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#101e1e" },
+    LineNr = { fg = "#48a078" },
+    CursorLineNr = { fg = "#e8f8f0", bold = true },
+    SignColumn = { fg = "#48a078", bg = "#0a1818" },
+    VertSplit = { fg = "#1f2e2d" },
+    WinSeparator = { fg = "#1f2e2d" },
+    Folded = { fg = "#48a078", bg = "#0d2020" },
+    FoldColumn = { fg = "#48a078" },
+    NonText = { fg = "#48a078" },
+    SpecialKey = { fg = "#48a078" },
+    Whitespace = { fg = "#295c48" },
+    MatchParen = { fg = "#74D2A9", bold = true },
+    Visual = { bg = "#294f43" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#0a1818", bg = "#74D2A9" },
+    IncSearch = { fg = "#0a1818", bg = "#98d8c0" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#0a1818", bg = "#62b28f" },
+    Pmenu = { fg = "#e8f8f0", bg = "#0d2020" },
+    PmenuSel = { fg = "#e8f8f0", bg = "#1f3d35" },
+    PmenuSbar = { bg = "#1f2e2d" },
+    PmenuThumb = { bg = "#9bccb2" },
+    ErrorMsg = { fg = "#62b28f" },
+    WarningMsg = { fg = "#98d8c0" },
+    ModeMsg = { fg = "#e8f8f0", bold = true },
+    MoreMsg = { fg = "#ffffff" },
+    Question = { fg = "#ffffff" },
+    TabLine = { fg = "#9bccb2", bg = "#0d2020" },
+    TabLineFill = { bg = "#0a1818" },
+    TabLineSel = { fg = "#e8f8f0", bg = "#0a1818", bold = true },
+    StatusLine = { fg = "#e8f8f0", bg = "#0d2020" },
+    StatusLineNC = { fg = "#9bccb2", bg = "#0d2020" },
+    DiffAdd = { bg = "#243834" },
+    DiffChange = { bg = "#1f3431" },
+    DiffDelete = { fg = "#62b28f", bg = "#172f29" },
+    DiffText = { bg = "#34514a" },
+    SpellBad = { sp = "#62b28f", undercurl = true },
+    SpellCap = { sp = "#98d8c0", undercurl = true },
+    SpellLocal = { sp = "#ffffff", undercurl = true },
+    SpellRare = { sp = "#74D2A9", undercurl = true },
+    Comment = { fg = "#48a078" },
+    Constant = { fg = "#98d8c0" },
+    String = { fg = "#b8f0d8" },
+    Character = { fg = "#b8f0d8" },
+    Number = { fg = "#98d8c0" },
+    Boolean = { fg = "#98d8c0" },
+    Float = { fg = "#98d8c0" },
+    Identifier = { fg = "#e8f8f0" },
+    Function = { fg = "#ffffff" },
+    Statement = { fg = "#74D2A9" },
+    Conditional = { fg = "#74D2A9" },
+    Repeat = { fg = "#74D2A9" },
+    Label = { fg = "#74D2A9" },
+    Operator = { fg = "#9bccb2" },
+    Keyword = { fg = "#74D2A9" },
+    Exception = { fg = "#74D2A9" },
+    PreProc = { fg = "#74D2A9" },
+    Include = { fg = "#74D2A9" },
+    Define = { fg = "#74D2A9" },
+    Macro = { fg = "#74D2A9" },
+    PreCondit = { fg = "#74D2A9" },
+    Type = { fg = "#88b8a8" },
+    StorageClass = { fg = "#74D2A9" },
+    Structure = { fg = "#88b8a8" },
+    Typedef = { fg = "#88b8a8" },
+    Special = { fg = "#88d8b5" },
+    SpecialChar = { fg = "#88d8b5" },
+    Tag = { fg = "#b8f0d8" },
+    Delimiter = { fg = "#9bccb2" },
+    SpecialComment = { fg = "#48a078", italic = true },
+    Debug = { fg = "#98d8c0" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#48a078" },
+    Error = { fg = "#62b28f" },
+    Todo = { fg = "#0a1818", bg = "#74D2A9", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#e8f8f0" },
+      ["@variable.builtin"] = { fg = "#74D2A9" },
+      ["@variable.parameter"] = { fg = "#e8f8f0", italic = true },
+      ["@variable.member"] = { fg = "#e8f8f0" },
+      ["@constant"] = { fg = "#98d8c0" },
+      ["@constant.builtin"] = { fg = "#98d8c0" },
+      ["@module"] = { fg = "#e8f8f0" },
+      ["@label"] = { fg = "#74D2A9" },
+      ["@type"] = { fg = "#88b8a8" },
+      ["@type.builtin"] = { fg = "#88b8a8" },
+      ["@attribute"] = { fg = "#68bd98" },
+      ["@property"] = { fg = "#e8f8f0" },
+      ["@function"] = { fg = "#ffffff" },
+      ["@function.builtin"] = { fg = "#ffffff" },
+      ["@function.call"] = { fg = "#ffffff" },
+      ["@function.method"] = { fg = "#ffffff" },
+      ["@constructor"] = { fg = "#88b8a8" },
+      ["@operator"] = { fg = "#9bccb2" },
+      ["@keyword"] = { fg = "#74D2A9" },
+      ["@keyword.conditional"] = { fg = "#74D2A9" },
+      ["@keyword.function"] = { fg = "#74D2A9" },
+      ["@keyword.operator"] = { fg = "#74D2A9" },
+      ["@keyword.return"] = { fg = "#74D2A9" },
+      ["@punctuation.bracket"] = { fg = "#9bccb2" },
+      ["@punctuation.delimiter"] = { fg = "#9bccb2" },
+      ["@punctuation.special"] = { fg = "#88d8b5" },
+      ["@string"] = { fg = "#b8f0d8" },
+      ["@string.escape"] = { fg = "#88d8b5" },
+      ["@string.regexp"] = { fg = "#88d8b5" },
+      ["@character"] = { fg = "#b8f0d8" },
+      ["@boolean"] = { fg = "#98d8c0" },
+      ["@number"] = { fg = "#98d8c0" },
+      ["@comment"] = { fg = "#48a078", italic = true },
+      ["@comment.todo"] = { fg = "#0a1818", bg = "#74D2A9", bold = true },
+      ["@comment.error"] = { fg = "#62b28f", bold = true },
+      ["@comment.warning"] = { fg = "#98d8c0", bold = true },
+      ["@comment.note"] = { fg = "#ffffff", bold = true },
+      ["@markup.heading"] = { fg = "#74D2A9", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#b8f0d8" },
+      ["@markup.link"] = { fg = "#ffffff", underline = true },
+      ["@tag"] = { fg = "#b8f0d8" },
+      ["@tag.attribute"] = { fg = "#68bd98" },
+      ["@tag.delimiter"] = { fg = "#9bccb2" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#62b28f" },
+      DiagnosticWarn = { fg = "#98d8c0" },
+      DiagnosticInfo = { fg = "#ffffff" },
+      DiagnosticHint = { fg = "#74D2A9" },
+      DiagnosticUnderlineError = { sp = "#62b28f", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#98d8c0", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#ffffff", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#74D2A9", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#62b28f", bg = "#122723" },
+      DiagnosticVirtualTextWarn = { fg = "#98d8c0", bg = "#182b28" },
+      DiagnosticVirtualTextInfo = { fg = "#ffffff", bg = "#222f2f" },
+      DiagnosticVirtualTextHint = { fg = "#74D2A9", bg = "#142a26" },
+      LspReferenceText = { bg = "#202e2d" },
+      LspReferenceRead = { bg = "#202e2d" },
+      LspReferenceWrite = { bg = "#2b3938" },
+      LspSignatureActiveParameter = { fg = "#74D2A9", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#b8f0d8" },
+      GitSignsChange = { fg = "#98d8c0" },
+      GitSignsDelete = { fg = "#62b28f" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#e8f8f0", bg = "#0a1818" },
+      TelescopeBorder = { fg = "#1f2e2d", bg = "#0a1818" },
+      TelescopePromptTitle = { fg = "#0a1818", bg = "#74D2A9", bold = true },
+      TelescopePreviewTitle = { fg = "#0a1818", bg = "#b8f0d8", bold = true },
+      TelescopeResultsTitle = { fg = "#0a1818", bg = "#ffffff", bold = true },
+      TelescopeSelection = { bg = "#1f3d35" },
+      TelescopeMatching = { fg = "#74D2A9", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#74D2A9", bold = true },
+      CmpItemKindVariable = { fg = "#e8f8f0" },
+      CmpItemKindFunction = { fg = "#ffffff" },
+      CmpItemKindKeyword = { fg = "#74D2A9" },
+      CmpItemKindClass = { fg = "#88b8a8" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#1f2e2d" },
+      IblScope = { fg = "#48a078" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#0a1818", bg = "#74D2A9", bold = true },
+      LazyButton = { fg = "#e8f8f0", bg = "#1f2e2d" },
+      LazyButtonActive = { fg = "#0a1818", bg = "#74D2A9" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#62b28f" },
+      NotifyWARNBorder = { fg = "#98d8c0" },
+      NotifyINFOBorder = { fg = "#ffffff" },
+      NotifyDEBUGBorder = { fg = "#48a078" },
+      NotifyTRACEBorder = { fg = "#74D2A9" },
+    },
+  },
+}
@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Moonlight II
+-- Auto-generated by sync_themes.py from vscode/themes/moonlight_ii.json - DO NOT EDIT
+
+return {
+  name = "Moonlight II",
+  mode = "dark",
+  palette = {
+    base00 = "#1b1d2c",
+    base01 = "#212337",
+    base02 = "#313343",
+    base03 = "#636da6",
+    base04 = "#959ecd",
+    base05 = "#c8d3f5",
+    base06 = "#d8e3ff",
+    base07 = "#e9f4ff",
+    base08 = "#6e90d8",
+    base09 = "#ff966c",
+    base0A = "#82aaff",
+    base0B = "#c3e88d",
+    base0C = "#9bbbff",
+    base0D = "#82aaff",
+    base0E = "#c792ea",
+    base0F = "#636da6",
+  },
+  terminal = {
+    "#1b1d2c", "#6e90d8", "#8eb2ff", "#828ab7",
+    "#82aaff", "#617fbf", "#9bbbff", "#c8d3f5",
+    "#636da6", "#82aaff", "#9bbbff", "#c8d3f5",
+    "#94b6ff", "#7599e5", "#a7c3ff", "#cdd7f6",
+  },
+  groups = {
+    Normal = { fg = "#c8d3f5", bg = "#1b1d2c" },
+    NormalFloat = { fg = "#c8d3f5", bg = "#212337" },
+    NormalNC = { fg = "#c8d3f5", bg = "#1b1d2c" },
+    Cursor = { fg = "#1b1d2c", bg = "#82aaff" },
+    CursorLine = { bg = "#232636" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#202232" },
+    LineNr = { fg = "#636da6" },
+    CursorLineNr = { fg = "#c8d3f5", bold = true },
+    SignColumn = { fg = "#636da6", bg = "#1b1d2c" },
+    VertSplit = { fg = "#313343" },
+    WinSeparator = { fg = "#313343" },
+    Folded = { fg = "#636da6", bg = "#212337" },
+    FoldColumn = { fg = "#636da6" },
+    NonText = { fg = "#636da6" },
+    SpecialKey = { fg = "#636da6" },
+    Whitespace = { fg = "#3f4569" },
+    MatchParen = { fg = "#82aaff", bold = true },
+    Visual = { bg = "#39476b" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#1b1d2c", bg = "#82aaff" },
+    IncSearch = { fg = "#1b1d2c", bg = "#ff966c" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#1b1d2c", bg = "#6e90d8" },
+    Pmenu = { fg = "#c8d3f5", bg = "#212337" },
+    PmenuSel = { fg = "#c8d3f5", bg = "#2f3956" },
+    PmenuSbar = { bg = "#313343" },
+    PmenuThumb = { bg = "#959ecd" },
+    ErrorMsg = { fg = "#6e90d8" },
+    WarningMsg = { fg = "#ff966c" },
+    ModeMsg = { fg = "#c8d3f5", bold = true },
+    MoreMsg = { fg = "#82aaff" },
+    Question = { fg = "#82aaff" },
+    TabLine = { fg = "#959ecd", bg = "#212337" },
+    TabLineFill = { bg = "#1b1d2c" },
+    TabLineSel = { fg = "#c8d3f5", bg = "#1b1d2c", bold = true },
+    StatusLine = { fg = "#c8d3f5", bg = "#212337" },
+    StatusLineNC = { fg = "#959ecd", bg = "#212337" },
+    DiffAdd = { bg = "#343b3a" },
+    DiffChange = { bg = "#3d2f35" },
+    DiffDelete = { fg = "#6e90d8", bg = "#272e45" },
+    DiffText = { bg = "#5f413f" },
+    SpellBad = { sp = "#6e90d8", undercurl = true },
+    SpellCap = { sp = "#ff966c", undercurl = true },
+    SpellLocal = { sp = "#82aaff", undercurl = true },
+    SpellRare = { sp = "#c792ea", undercurl = true },
+    Comment = { fg = "#636da6" },
+    Constant = { fg = "#ff966c" },
+    String = { fg = "#c3e88d" },
+    Character = { fg = "#c3e88d" },
+    Number = { fg = "#ff966c" },
+    Boolean = { fg = "#ff966c" },
+    Float = { fg = "#ff966c" },
+    Identifier = { fg = "#c8d3f5" },
+    Function = { fg = "#82aaff" },
+    Statement = { fg = "#c792ea" },
+    Conditional = { fg = "#c792ea" },
+    Repeat = { fg = "#c792ea" },
+    Label = { fg = "#c792ea" },
+    Operator = { fg = "#959ecd" },
+    Keyword = { fg = "#c792ea" },
+    Exception = { fg = "#c792ea" },
+    PreProc = { fg = "#c792ea" },
+    Include = { fg = "#c792ea" },
+    Define = { fg = "#c792ea" },
+    Macro = { fg = "#c792ea" },
+    PreCondit = { fg = "#c792ea" },
+    Type = { fg = "#c8d3f5" },
+    StorageClass = { fg = "#c792ea" },
+    Structure = { fg = "#c8d3f5" },
+    Typedef = { fg = "#c8d3f5" },
+    Special = { fg = "#9bbbff" },
+    SpecialChar = { fg = "#9bbbff" },
+    Tag = { fg = "#82aaff" },
+    Delimiter = { fg = "#959ecd" },
+    SpecialComment = { fg = "#636da6", italic = true },
+    Debug = { fg = "#ff966c" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#636da6" },
+    Error = { fg = "#6e90d8" },
+    Todo = { fg = "#1b1d2c", bg = "#82aaff", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#c8d3f5" },
+      ["@variable.builtin"] = { fg = "#c792ea" },
+      ["@variable.parameter"] = { fg = "#c8d3f5", italic = true },
+      ["@variable.member"] = { fg = "#c8d3f5" },
+      ["@constant"] = { fg = "#ff966c" },
+      ["@constant.builtin"] = { fg = "#ff966c" },
+      ["@module"] = { fg = "#c8d3f5" },
+      ["@label"] = { fg = "#c792ea" },
+      ["@type"] = { fg = "#c8d3f5" },
+      ["@type.builtin"] = { fg = "#c8d3f5" },
+      ["@attribute"] = { fg = "#cad5f5" },
+      ["@property"] = { fg = "#c8d3f5" },
+      ["@function"] = { fg = "#82aaff" },
+      ["@function.builtin"] = { fg = "#82aaff" },
+      ["@function.call"] = { fg = "#82aaff" },
+      ["@function.method"] = { fg = "#82aaff" },
+      ["@constructor"] = { fg = "#c8d3f5" },
+      ["@operator"] = { fg = "#959ecd" },
+      ["@keyword"] = { fg = "#c792ea" },
+      ["@keyword.conditional"] = { fg = "#c792ea" },
+      ["@keyword.function"] = { fg = "#c792ea" },
+      ["@keyword.operator"] = { fg = "#c792ea" },
+      ["@keyword.return"] = { fg = "#c792ea" },
+      ["@punctuation.bracket"] = { fg = "#959ecd" },
+      ["@punctuation.delimiter"] = { fg = "#959ecd" },
+      ["@punctuation.special"] = { fg = "#9bbbff" },
+      ["@string"] = { fg = "#c3e88d" },
+      ["@string.escape"] = { fg = "#9bbbff" },
+      ["@string.regexp"] = { fg = "#9bbbff" },
+      ["@character"] = { fg = "#c3e88d" },
+      ["@boolean"] = { fg = "#ff966c" },
+      ["@number"] = { fg = "#ff966c" },
+      ["@comment"] = { fg = "#636da6", italic = true },
+      ["@comment.todo"] = { fg = "#1b1d2c", bg = "#82aaff", bold = true },
+      ["@comment.error"] = { fg = "#6e90d8", bold = true },
+      ["@comment.warning"] = { fg = "#ff966c", bold = true },
+      ["@comment.note"] = { fg = "#82aaff", bold = true },
+      ["@markup.heading"] = { fg = "#c792ea", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#c3e88d" },
+      ["@markup.link"] = { fg = "#82aaff", underline = true },
+      ["@tag"] = { fg = "#82aaff" },
+      ["@tag.attribute"] = { fg = "#cad5f5" },
+      ["@tag.delimiter"] = { fg = "#959ecd" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#6e90d8" },
+      DiagnosticWarn = { fg = "#ff966c" },
+      DiagnosticInfo = { fg = "#82aaff" },
+      DiagnosticHint = { fg = "#82aaff" },
+      DiagnosticUnderlineError = { sp = "#6e90d8", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#ff966c", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#82aaff", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#82aaff", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#6e90d8", bg = "#23283d" },
+      DiagnosticVirtualTextWarn = { fg = "#ff966c", bg = "#312932" },
+      DiagnosticVirtualTextInfo = { fg = "#82aaff", bg = "#252b41" },
+      DiagnosticVirtualTextHint = { fg = "#82aaff", bg = "#252b41" },
+      LspReferenceText = { bg = "#2c2f40" },
+      LspReferenceRead = { bg = "#2c2f40" },
+      LspReferenceWrite = { bg = "#34384a" },
+      LspSignatureActiveParameter = { fg = "#82aaff", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#c3e88d" },
+      GitSignsChange = { fg = "#ff966c" },
+      GitSignsDelete = { fg = "#6e90d8" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#c8d3f5", bg = "#1b1d2c" },
+      TelescopeBorder = { fg = "#313343", bg = "#1b1d2c" },
+      TelescopePromptTitle = { fg = "#1b1d2c", bg = "#82aaff", bold = true },
+      TelescopePreviewTitle = { fg = "#1b1d2c", bg = "#c3e88d", bold = true },
+      TelescopeResultsTitle = { fg = "#1b1d2c", bg = "#82aaff", bold = true },
+      TelescopeSelection = { bg = "#2f3956" },
+      TelescopeMatching = { fg = "#82aaff", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#82aaff", bold = true },
+      CmpItemKindVariable = { fg = "#c8d3f5" },
+      CmpItemKindFunction = { fg = "#82aaff" },
+      CmpItemKindKeyword = { fg = "#c792ea" },
+      CmpItemKindClass = { fg = "#c8d3f5" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#313343" },
+      IblScope = { fg = "#636da6" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#1b1d2c", bg = "#82aaff", bold = true },
+      LazyButton = { fg = "#c8d3f5", bg = "#313343" },
+      LazyButtonActive = { fg = "#1b1d2c", bg = "#82aaff" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#6e90d8" },
+      NotifyWARNBorder = { fg = "#ff966c" },
+      NotifyINFOBorder = { fg = "#82aaff" },
+      NotifyDEBUGBorder = { fg = "#636da6" },
+      NotifyTRACEBorder = { fg = "#c792ea" },
+    },
+  },
+}
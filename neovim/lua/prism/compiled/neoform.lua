@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Neoform
+-- Auto-generated by sync_themes.py from vscode/themes/neoform.json - DO NOT EDIT
+
+return {
+  name = "Neoform",
+  mode = "light",
+  palette = {
+    base00 = "#f5f7fa",
+    base01 = "#e8ecf2",
+    base02 = "#d7d9dc",
+    base03 = "#8896a8",
+    base04 = "#586576",
+    base05 = "#2d3848",
+    base06 = "#212b3b",
+    base07 = "#151f2e",
+    base08 = "#0759b9",
+    base09 = "#4090d0",
+    base0A = "#0969da",
+    base0B = "#0550a0",
+    base0C = "#2d7fdf",
+    base0D = "#218bff",
+    base0E = "#0969da",
+    base0F = "#8896a8",
+  },
+  terminal = {
+    "#2d3848", "#0759b9", "#2178dd", "#8896a8",
+    "#0969da", "#064ea3", "#2d7fdf", "#e8ecf2",
+    "#8896a8", "#0969da", "#2d7fdf", "#93a0b0",
+    "#2178dd", "#085ec4", "#468ee3", "#e9ecf2",
+  },
+  groups = {
+    Normal = { fg = "#2d3848", bg = "#f5f7fa" },
+    NormalFloat = { fg = "#2d3848", bg = "#e8ecf2" },
+    NormalNC = { fg = "#2d3848", bg = "#f5f7fa" },
+    Cursor = { fg = "#f5f7fa", bg = "#0969da" },
+    CursorLine = { bg = "#ebedf1" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#eff1f4" },
+    LineNr = { fg = "#8896a8" },
+    CursorLineNr = { fg = "#2d3848", bold = true },
+    SignColumn = { fg = "#8896a8", bg = "#f5f7fa" },
+    VertSplit = { fg = "#d7d9dc" },
+    WinSeparator = { fg = "#d7d9dc" },
+    Folded = { fg = "#8896a8", bg = "#e8ecf2" },
+    FoldColumn = { fg = "#8896a8" },
+    NonText = { fg = "#8896a8" },
+    SpecialKey = { fg = "#8896a8" },
+    Whitespace = { fg = "#bec6d1" },
+    MatchParen = { fg = "#0969da", bold = true },
+    Visual = { bg = "#aeccf0" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#f5f7fa", bg = "#0969da" },
+    IncSearch = { fg = "#f5f7fa", bg = "#4090d0" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#f5f7fa", bg = "#0759b9" },
+    Pmenu = { fg = "#2d3848", bg = "#e8ecf2" },
+    PmenuSel = { fg = "#2d3848", bg = "#c5daf3" },
+    PmenuSbar = { bg = "#d7d9dc" },
+    PmenuThumb = { bg = "#586576" },
+    ErrorMsg = { fg = "#0759b9" },
+    WarningMsg = { fg = "#4090d0" },
+    ModeMsg = { fg = "#2d3848", bold = true },
+    MoreMsg = { fg = "#218bff" },
+    Question = { fg = "#218bff" },
+    TabLine = { fg = "#586576", bg = "#e8ecf2" },
+    TabLineFill = { bg = "#f5f7fa" },
+    TabLineSel = { fg = "#2d3848", bg = "#f5f7fa", bold = true },
+    StatusLine = { fg = "#2d3848", bg = "#e8ecf2" },
+    StatusLineNC = { fg = "#586576", bg = "#e8ecf2" },
+    DiffAdd = { bg = "#d1ddec" },
+    DiffChange = { bg = "#d9e7f3" },
+    DiffDelete = { fg = "#0759b9", bg = "#d1dff0" },
+    DiffText = { bg = "#bed8ed" },
+    SpellBad = { sp = "#0759b9", undercurl = true },
+    SpellCap = { sp = "#4090d0", undercurl = true },
+    SpellLocal = { sp = "#218bff", undercurl = true },
+    SpellRare = { sp = "#0969da", undercurl = true },
+    Comment = { fg = "#8896a8" },
+    Constant = { fg = "#4090d0" },
+    String = { fg = "#0550a0" },
+    Character = { fg = "#0550a0" },
+    Number = { fg = "#4090d0" },
+    Boolean = { fg = "#4090d0" },
+    Float = { fg = "#4090d0" },
+    Identifier = { fg = "#2d3848" },
+    Function = { fg = "#218bff" },
+    Statement = { fg = "#0969da" },
+    Conditional = { fg = "#0969da" },
+    Repeat = { fg = "#0969da" },
+    Label = { fg = "#0969da" },
+    Operator = { fg = "#586576" },
+    Keyword = { fg = "#0969da" },
+    Exception = { fg = "#0969da" },
+    PreProc = { fg = "#0969da" },
+    Include = { fg = "#0969da" },
+    Define = { fg = "#0969da" },
+    Macro = { fg = "#0969da" },
+    PreCondit = { fg = "#0969da" },
+    Type = { fg = "#0754ae" },
+    StorageClass = { fg = "#0969da" },
+    Structure = { fg = "#0754ae" },
+    Typedef = { fg = "#0754ae" },
+    Special = { fg = "#2d7fdf" },
+    SpecialChar = { fg = "#2d7fdf" },
+    Tag = { fg = "#3890f6" },
+    Delimiter = { fg = "#586576" },
+    SpecialComment = { fg = "#8896a8", italic = true },
+    Debug = { fg = "#4090d0" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#8896a8" },
+    Error = { fg = "#0759b9" },
+    Todo = { fg = "#f5f7fa", bg = "#0969da", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#2d3848" },
+      ["@variable.builtin"] = { fg = "#0969da" },
+      ["@variable.parameter"] = { fg = "#2d3848", italic = true },
+      ["@variable.member"] = { fg = "#2d3848" },
+      ["@constant"] = { fg = "#4090d0" },
+      ["@constant.builtin"] = { fg = "#4090d0" },
+      ["@module"] = { fg = "#2d3848" },
+      ["@label"] = { fg = "#0969da" },
+      ["@type"] = { fg = "#0754ae" },
+      ["@type.builtin"] = { fg = "#0754ae" },
+      ["@attribute"] = { fg = "#085ec4" },
+      ["@property"] = { fg = "#2d3848" },
+      ["@function"] = { fg = "#218bff" },
+      ["@function.builtin"] = { fg = "#218bff" },
+      ["@function.call"] = { fg = "#218bff" },
+      ["@function.method"] = { fg = "#218bff" },
+      ["@constructor"] = { fg = "#0754ae" },
+      ["@operator"] = { fg = "#586576" },
+      ["@keyword"] = { fg = "#0969da" },
+      ["@keyword.conditional"] = { fg = "#0969da" },
+      ["@keyword.function"] = { fg = "#0969da" },
+      ["@keyword.operator"] = { fg = "#0969da" },
+      ["@keyword.return"] = { fg = "#0969da" },
+      ["@punctuation.bracket"] = { fg = "#586576" },
+      ["@punctuation.delimiter"] = { fg = "#586576" },
+      ["@punctuation.special"] = { fg = "#2d7fdf" },
+      ["@string"] = { fg = "#0550a0" },
+      ["@string.escape"] = { fg = "#2d7fdf" },
+      ["@string.regexp"] = { fg = "#2d7fdf" },
+      ["@character"] = { fg = "#0550a0" },
+      ["@boolean"] = { fg = "#4090d0" },
+      ["@number"] = { fg = "#4090d0" },
+      ["@comment"] = { fg = "#8896a8", italic = true },
+      ["@comment.todo"] = { fg = "#f5f7fa", bg = "#0969da", bold = true },
+      ["@comment.error"] = { fg = "#0759b9", bold = true },
+      ["@comment.warning"] = { fg = "#4090d0", bold = true },
+      ["@comment.note"] = { fg = "#218bff", bold = true },
+      ["@markup.heading"] = { fg = "#0969da", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#0550a0" },
+      ["@markup.link"] = { fg = "#218bff", underline = true },
+      ["@tag"] = { fg = "#3890f6" },
+      ["@tag.attribute"] = { fg = "#085ec4" },
+      ["@tag.delimiter"] = { fg = "#586576" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#0759b9" },
+      DiagnosticWarn = { fg = "#4090d0" },
+      DiagnosticInfo = { fg = "#218bff" },
+      DiagnosticHint = { fg = "#0969da" },
+      DiagnosticUnderlineError = { sp = "#0759b9", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#4090d0", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#218bff", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#0969da", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#0759b9", bg = "#dde7f3" },
+      DiagnosticVirtualTextWarn = { fg = "#4090d0", bg = "#e2ecf5" },
+      DiagnosticVirtualTextInfo = { fg = "#218bff", bg = "#dfecfa" },
+      DiagnosticVirtualTextHint = { fg = "#0969da", bg = "#dde8f6" },
+      LspReferenceText = { bg = "#e1e3e8" },
+      LspReferenceRead = { bg = "#e1e3e8" },
+      LspReferenceWrite = { bg = "#d7dadf" },
+      LspSignatureActiveParameter = { fg = "#0969da", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#0550a0" },
+      GitSignsChange = { fg = "#4090d0" },
+      GitSignsDelete = { fg = "#0759b9" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#2d3848", bg = "#f5f7fa" },
+      TelescopeBorder = { fg = "#d7d9dc", bg = "#f5f7fa" },
+      TelescopePromptTitle = { fg = "#f5f7fa", bg = "#0969da", bold = true },
+      TelescopePreviewTitle = { fg = "#f5f7fa", bg = "#0550a0", bold = true },
+      TelescopeResultsTitle = { fg = "#f5f7fa", bg = "#218bff", bold = true },
+      TelescopeSelection = { bg = "#c5daf3" },
+      TelescopeMatching = { fg = "#0969da", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#0969da", bold = true },
+      CmpItemKindVariable = { fg = "#2d3848" },
+      CmpItemKindFunction = { fg = "#218bff" },
+      CmpItemKindKeyword = { fg = "#0969da" },
+      CmpItemKindClass = { fg = "#0754ae" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#d7d9dc" },
+      IblScope = { fg = "#8896a8" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#f5f7fa", bg = "#0969da", bold = true },
+      LazyButton = { fg = "#2d3848", bg = "#d7d9dc" },
+      LazyButtonActive = { fg = "#f5f7fa", bg = "#0969da" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#0759b9" },
+      NotifyWARNBorder = { fg = "#4090d0" },
+      NotifyINFOBorder = { fg = "#218bff" },
+      NotifyDEBUGBorder = { fg = "#8896a8" },
+      NotifyTRACEBorder = { fg = "#0969da" },
+    },
+  },
+}
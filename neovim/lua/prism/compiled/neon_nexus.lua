@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Neon Nexus
+-- Auto-generated by sync_themes.py from vscode/themes/neon_nexus.json - DO NOT EDIT
+
+return {
+  name = "Neon Nexus",
+  mode = "dark",
+  palette = {
+    base00 = "#040804",
+    base01 = "#081008",
+    base02 = "#151c15",
+    base03 = "#308830",
+    base04 = "#83c27f",
+    base05 = "#d0ffd0",
+    base06 = "#dfffdf",
+    base07 = "#dfffdf",
+    base08 = "#00d873",
+    base09 = "#ffff00",
+    base0A = "#00ff88",
+    base0B = "#00ffff",
+    base0C = "#33ff9f",
+    base0D = "#00ff88",
+    base0E = "#ff00ff",
+    base0F = "#308830",
+  },
+  terminal = {
+    "#040804", "#00d873", "#19ff93", "#599f59",
+    "#00ff88", "#00bf66", "#33ff9f", "#d0ffd0",
+    "#308830", "#00ff88", "#33ff9f", "#d0ffd0",
+    "#26ff99", "#00e57a", "#4cffab", "#d4ffd4",
+  },
+  groups = {
+    Normal = { fg = "#d0ffd0", bg = "#040804" },
+    NormalFloat = { fg = "#d0ffd0", bg = "#081008" },
+    NormalNC = { fg = "#d0ffd0", bg = "#040804" },
+    Cursor = { fg = "#040804", bg = "#00ff88" },
+    CursorLine = { bg = "#0e140e" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#0a0f0a" },
+    LineNr = { fg = "#308830" },
+    CursorLineNr = { fg = "#d0ffd0", bold = true },
+    SignColumn = { fg = "#308830", bg = "#040804" },
+    VertSplit = { fg = "#151c15" },
+    WinSeparator = { fg = "#151c15" },
+    Folded = { fg = "#308830", bg = "#081008" },
+    FoldColumn = { fg = "#308830" },
+    NonText = { fg = "#308830" },
+    SpecialKey = { fg = "#308830" },
+    Whitespace = { fg = "#1a481a" },
+    MatchParen = { fg = "#00ff88", bold = true },
+    Visual = { bg = "#02522b" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#040804", bg = "#00ff88" },
+    IncSearch = { fg = "#040804", bg = "#ffff00" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#040804", bg = "#00d873" },
+    Pmenu = { fg = "#d0ffd0", bg = "#081008" },
+    PmenuSel = { fg = "#d0ffd0", bg = "#03391e" },
+    PmenuSbar = { bg = "#151c15" },
+    PmenuThumb = { bg = "#83c27f" },
+    ErrorMsg = { fg = "#00d873" },
+    WarningMsg = { fg = "#ffff00" },
+    ModeMsg = { fg = "#d0ffd0", bold = true },
+    MoreMsg = { fg = "#00ff88" },
+    Question = { fg = "#00ff88" },
+    TabLine = { fg = "#83c27f", bg = "#081008" },
+    TabLineFill = { bg = "#040804" },
+    TabLineSel = { fg = "#d0ffd0", bg = "#040804", bold = true },
+    StatusLine = { fg = "#d0ffd0", bg = "#081008" },
+    StatusLineNC = { fg = "#83c27f", bg = "#081008" },
+    DiffAdd = { bg = "#032d29" },
+    DiffChange = { bg = "#292d03" },
+    DiffDelete = { fg = "#00d873", bg = "#032714" },
+    DiffText = { bg = "#4f5202" },
+    SpellBad = { sp = "#00d873", undercurl = true },
+    SpellCap = { sp = "#ffff00", undercurl = true },
+    SpellLocal = { sp = "#00ff88", undercurl = true },
+    SpellRare = { sp = "#ff00ff", undercurl = true },
+    Comment = { fg = "#308830" },
+    Constant = { fg = "#ffff00" },
+    String = { fg = "#00ffff" },
+    Character = { fg = "#00ffff" },
+    Number = { fg = "#ffff00" },
+    Boolean = { fg = "#ffff00" },
+    Float = { fg = "#ffff00" },
+    Identifier = { fg = "#ff8800" },
+    Function = { fg = "#00ff88" },
+    Statement = { fg = "#ff00ff" },
+    Conditional = { fg = "#ff00ff" },
+    Repeat = { fg = "#ff00ff" },
+    Label = { fg = "#ff00ff" },
+    Operator = { fg = "#83c27f" },
+    Keyword = { fg = "#ff00ff" },
+    Exception = { fg = "#ff00ff" },
+    PreProc = { fg = "#ff00ff" },
+    Include = { fg = "#ff00ff" },
+    Define = { fg = "#ff00ff" },
+    Macro = { fg = "#ff00ff" },
+    PreCondit = { fg = "#ff00ff" },
+    Type = { fg = "#ff00aa" },
+    StorageClass = { fg = "#ff00ff" },
+    Structure = { fg = "#ff00aa" },
+    Typedef = { fg = "#ff00aa" },
+    Special = { fg = "#33ff9f" },
+    SpecialChar = { fg = "#33ff9f" },
+    Tag = { fg = "#00ff88" },
+    Delimiter = { fg = "#83c27f" },
+    SpecialComment = { fg = "#308830", italic = true },
+    Debug = { fg = "#ffff00" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#308830" },
+    Error = { fg = "#00d873" },
+    Todo = { fg = "#040804", bg = "#00ff88", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#ff8800" },
+      ["@variable.builtin"] = { fg = "#ff00ff" },
+      ["@variable.parameter"] = { fg = "#ff8800", italic = true },
+      ["@variable.member"] = { fg = "#ff8800" },
+      ["@constant"] = { fg = "#ffff00" },
+      ["@constant.builtin"] = { fg = "#ffff00" },
+      ["@module"] = { fg = "#d0ffd0" },
+      ["@label"] = { fg = "#ff00ff" },
+      ["@type"] = { fg = "#ff00aa" },
+      ["@type.builtin"] = { fg = "#ff00aa" },
+      ["@attribute"] = { fg = "#88ffff" },
+      ["@property"] = { fg = "#ff8800" },
+      ["@function"] = { fg = "#00ff88" },
+      ["@function.builtin"] = { fg = "#00ff88" },
+      ["@function.call"] = { fg = "#00ff88" },
+      ["@function.method"] = { fg = "#00ff88" },
+      ["@constructor"] = { fg = "#ff00aa" },
+      ["@operator"] = { fg = "#83c27f" },
+      ["@keyword"] = { fg = "#ff00ff" },
+      ["@keyword.conditional"] = { fg = "#ff00ff" },
+      ["@keyword.function"] = { fg = "#ff00ff" },
+      ["@keyword.operator"] = { fg = "#ff00ff" },
+      ["@keyword.return"] = { fg = "#ff00ff" },
+      ["@punctuation.bracket"] = { fg = "#83c27f" },
+      ["@punctuation.delimiter"] = { fg = "#83c27f" },
+      ["@punctuation.special"] = { fg = "#33ff9f" },
+      ["@string"] = { fg = "#00ffff" },
+      ["@string.escape"] = { fg = "#33ff9f" },
+      ["@string.regexp"] = { fg = "#33ff9f" },
+      ["@character"] = { fg = "#00ffff" },
+      ["@boolean"] = { fg = "#ffff00" },
+      ["@number"] = { fg = "#ffff00" },
+      ["@comment"] = { fg = "#308830", italic = true },
+      ["@comment.todo"] = { fg = "#040804", bg = "#00ff88", bold = true },
+      ["@comment.error"] = { fg = "#00d873", bold = true },
+      ["@comment.warning"] = { fg = "#ffff00", bold = true },
+      ["@comment.note"] = { fg = "#00ff88", bold = true },
+      ["@markup.heading"] = { fg = "#ff00ff", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#00ffff" },
+      ["@markup.link"] = { fg = "#00ff88", underline = true },
+      ["@tag"] = { fg = "#00ff88" },
+      ["@tag.attribute"] = { fg = "#88ffff" },
+      ["@tag.delimiter"] = { fg = "#83c27f" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#00d873" },
+      DiagnosticWarn = { fg = "#ffff00" },
+      DiagnosticInfo = { fg = "#00ff88" },
+      DiagnosticHint = { fg = "#00ff88" },
+      DiagnosticUnderlineError = { sp = "#00d873", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#ffff00", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#00ff88", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#00ff88", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#00d873", bg = "#031c0f" },
+      DiagnosticVirtualTextWarn = { fg = "#ffff00", bg = "#1d2003" },
+      DiagnosticVirtualTextInfo = { fg = "#00ff88", bg = "#032011" },
+      DiagnosticVirtualTextHint = { fg = "#00ff88", bg = "#032011" },
+      LspReferenceText = { bg = "#182018" },
+      LspReferenceRead = { bg = "#182018" },
+      LspReferenceWrite = { bg = "#222d22" },
+      LspSignatureActiveParameter = { fg = "#00ff88", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#00ffff" },
+      GitSignsChange = { fg = "#ffff00" },
+      GitSignsDelete = { fg = "#00d873" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#d0ffd0", bg = "#040804" },
+      TelescopeBorder = { fg = "#151c15", bg = "#040804" },
+      TelescopePromptTitle = { fg = "#040804", bg = "#00ff88", bold = true },
+      TelescopePreviewTitle = { fg = "#040804", bg = "#00ffff", bold = true },
+      TelescopeResultsTitle = { fg = "#040804", bg = "#00ff88", bold = true },
+      TelescopeSelection = { bg = "#03391e" },
+      TelescopeMatching = { fg = "#00ff88", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#00ff88", bold = true },
+      CmpItemKindVariable = { fg = "#ff8800" },
+      CmpItemKindFunction = { fg = "#00ff88" },
+      CmpItemKindKeyword = { fg = "#ff00ff" },
+      CmpItemKindClass = { fg = "#ff00aa" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#151c15" },
+      IblScope = { fg = "#308830" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#040804", bg = "#00ff88", bold = true },
+      LazyButton = { fg = "#d0ffd0", bg = "#151c15" },
+      LazyButtonActive = { fg = "#040804", bg = "#00ff88" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#00d873" },
+      NotifyWARNBorder = { fg = "#ffff00" },
+      NotifyINFOBorder = { fg = "#00ff88" },
+      NotifyDEBUGBorder = { fg = "#308830" },
+      NotifyTRACEBorder = { fg = "#ff00ff" },
+    },
+  },
+}
@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Nero Marquina
+-- Auto-generated by sync_themes.py from vscode/themes/nero_marquina.json - DO NOT EDIT
+
+return {
+  name = "Nero Marquina",
+  mode = "dark",
+  palette = {
+    base00 = "#08080a",
+    base01 = "#101014",
+    base02 = "#1c1c1e",
+    base03 = "#5a5a68",
+    base04 = "#9c9ca8",
+    base05 = "#e8e4dc",
+    base06 = "#f9f5ec",
+    base07 = "#fffff7",
+    base08 = "#b4942e",
+    base09 = "#dcbf5f",
+    base0A = "#d4af37",
+    base0B = "#e0c773",
+    base0C = "#dcbf5f",
+    base0D = "#dec369",
+    base0E = "#d4af37",
+    base0F = "#5a5a68",
+  },
+  terminal = {
+    "#08080a", "#b4942e", "#d8b74b", "#7b7b86",
+    "#d4af37", "#9f8329", "#dcbf5f", "#e8e4dc",
+    "#5a5a68", "#d4af37", "#dcbf5f", "#e8e4dc",
+    "#dabb55", "#be9d31", "#e0c773", "#eae6df",
+  },
+  groups = {
+    Normal = { fg = "#e8e4dc", bg = "#08080a" },
+    NormalFloat = { fg = "#e8e4dc", bg = "#101014" },
+    NormalNC = { fg = "#e8e4dc", bg = "#08080a" },
+    Cursor = { fg = "#08080a", bg = "#d4af37" },
+    CursorLine = { bg = "#131314" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#0e0e10" },
+    LineNr = { fg = "#5a5a68" },
+    CursorLineNr = { fg = "#e8e4dc", bold = true },
+    SignColumn = { fg = "#5a5a68", bg = "#08080a" },
+    VertSplit = { fg = "#1c1c1e" },
+    WinSeparator = { fg = "#1c1c1e" },
+    Folded = { fg = "#5a5a68", bg = "#101014" },
+    FoldColumn = { fg = "#5a5a68" },
+    NonText = { fg = "#5a5a68" },
+    SpecialKey = { fg = "#5a5a68" },
+    Whitespace = { fg = "#313139" },
+    MatchParen = { fg = "#d4af37", bold = true },
+    Visual = { bg = "#453a17" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#08080a", bg = "#d4af37" },
+    IncSearch = { fg = "#08080a", bg = "#dcbf5f" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#08080a", bg = "#b4942e" },
+    Pmenu = { fg = "#e8e4dc", bg = "#101014" },
+    PmenuSel = { fg = "#e8e4dc", bg = "#302913" },
+    PmenuSbar = { bg = "#1c1c1e" },
+    PmenuThumb = { bg = "#9c9ca8" },
+    ErrorMsg = { fg = "#b4942e" },
+    WarningMsg = { fg = "#dcbf5f" },
+    ModeMsg = { fg = "#e8e4dc", bold = true },
+    MoreMsg = { fg = "#dec369" },
+    Question = { fg = "#dec369" },
+    TabLine = { fg = "#9c9ca8", bg = "#101014" },
+    TabLineFill = { bg = "#08080a" },
+    TabLineSel = { fg = "#e8e4dc", bg = "#08080a", bold = true },
+    StatusLine = { fg = "#e8e4dc", bg = "#101014" },
+    StatusLineNC = { fg = "#9c9ca8", bg = "#101014" },
+    DiffAdd = { bg = "#282419" },
+    DiffChange = { bg = "#272316" },
+    DiffDelete = { fg = "#b4942e", bg = "#211d0f" },
+    DiffText = { bg = "#473e23" },
+    SpellBad = { sp = "#b4942e", undercurl = true },
+    SpellCap = { sp = "#dcbf5f", undercurl = true },
+    SpellLocal = { sp = "#dec369", undercurl = true },
+    SpellRare = { sp = "#d4af37", undercurl = true },
+    Comment = { fg = "#5a5a68" },
+    Constant = { fg = "#dcbf5f" },
+    String = { fg = "#e0c773" },
+    Character = { fg = "#e0c773" },
+    Number = { fg = "#dcbf5f" },
+    Boolean = { fg = "#dcbf5f" },
+    Float = { fg = "#dcbf5f" },
+    Identifier = { fg = "#e8e4dc" },
+    Function = { fg = "#dec369" },
+    Statement = { fg = "#d4af37" },
+    Conditional = { fg = "#d4af37" },
+    Repeat = { fg = "#d4af37" },
+    Label = { fg = "#d4af37" },
+    Operator = { fg = "#9c9ca8" },
+    Keyword = { fg = "#d4af37" },
+    Exception = { fg = "#d4af37" },
+    PreProc = { fg = "#d4af37" },
+    Include = { fg = "#d4af37" },
+    Define = { fg = "#d4af37" },
+    Macro = { fg = "#d4af37" },
+    PreCondit = { fg = "#d4af37" },
+    Type = { fg = "#e8e4dc" },
+    StorageClass = { fg = "#d4af37" },
+    Structure = { fg = "#e8e4dc" },
+    Typedef = { fg = "#e8e4dc" },
+    Special = { fg = "#dcbf5f" },
+    SpecialChar = { fg = "#dcbf5f" },
+    Tag = { fg = "#e0c773" },
+    Delimiter = { fg = "#9c9ca8" },
+    SpecialComment = { fg = "#5a5a68", italic = true },
+    Debug = { fg = "#dcbf5f" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#5a5a68" },
+    Error = { fg = "#b4942e" },
+    Todo = { fg = "#08080a", bg = "#d4af37", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#e8e4dc" },
+      ["@variable.builtin"] = { fg = "#d4af37" },
+      ["@variable.parameter"] = { fg = "#e8e4dc", italic = true },
+      ["@variable.member"] = { fg = "#e8e4dc" },
+      ["@constant"] = { fg = "#dcbf5f" },
+      ["@constant.builtin"] = { fg = "#dcbf5f" },
+      ["@module"] = { fg = "#e8e4dc" },
+      ["@label"] = { fg = "#d4af37" },
+      ["@type"] = { fg = "#e8e4dc" },
+      ["@type.builtin"] = { fg = "#e8e4dc" },
+      ["@attribute"] = { fg = "#e9e5dd" },
+      ["@property"] = { fg = "#e8e4dc" },
+      ["@function"] = { fg = "#dec369" },
+      ["@function.builtin"] = { fg = "#dec369" },
+      ["@function.call"] = { fg = "#dec369" },
+      ["@function.method"] = { fg = "#dec369" },
+      ["@constructor"] = { fg = "#e8e4dc" },
+      ["@operator"] = { fg = "#9c9ca8" },
+      ["@keyword"] = { fg = "#d4af37" },
+      ["@keyword.conditional"] = { fg = "#d4af37" },
+      ["@keyword.function"] = { fg = "#d4af37" },
+      ["@keyword.operator"] = { fg = "#d4af37" },
+      ["@keyword.return"] = { fg = "#d4af37" },
+      ["@punctuation.bracket"] = { fg = "#9c9ca8" },
+      ["@punctuation.delimiter"] = { fg = "#9c9ca8" },
+      ["@punctuation.special"] = { fg = "#dcbf5f" },
+      ["@string"] = { fg = "#e0c773" },
+      ["@string.escape"] = { fg = "#dcbf5f" },
+      ["@string.regexp"] = { fg = "#dcbf5f" },
+      ["@character"] = { fg = "#e0c773" },
+      ["@boolean"] = { fg = "#dcbf5f" },
+      ["@number"] = { fg = "#dcbf5f" },
+      ["@comment"] = { fg = "#5a5a68", italic = true },
+      ["@comment.todo"] = { fg = "#08080a", bg = "#d4af37", bold = true },
+      ["@comment.error"] = { fg = "#b4942e", bold = true },
+      ["@comment.warning"] = { fg = "#dcbf5f", bold = true },
+      ["@comment.note"] = { fg = "#dec369", bold = true },
+      ["@markup.heading"] = { fg = "#d4af37", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#e0c773" },
+      ["@markup.link"] = { fg = "#dec369", underline = true },
+      ["@tag"] = { fg = "#e0c773" },
+      ["@tag.attribute"] = { fg = "#e9e5dd" },
+      ["@tag.delimiter"] = { fg = "#9c9ca8" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#b4942e" },
+      DiagnosticWarn = { fg = "#dcbf5f" },
+      DiagnosticInfo = { fg = "#dec369" },
+      DiagnosticHint = { fg = "#d4af37" },
+      DiagnosticUnderlineError = { sp = "#b4942e", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#dcbf5f", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#dec369", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#d4af37", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#b4942e", bg = "#19160d" },
+      DiagnosticVirtualTextWarn = { fg = "#dcbf5f", bg = "#1d1a12" },
+      DiagnosticVirtualTextInfo = { fg = "#dec369", bg = "#1d1a13" },
+      DiagnosticVirtualTextHint = { fg = "#d4af37", bg = "#1c180e" },
+      LspReferenceText = { bg = "#1e1e1f" },
+      LspReferenceRead = { bg = "#1e1e1f" },
+      LspReferenceWrite = { bg = "#292829" },
+      LspSignatureActiveParameter = { fg = "#d4af37", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#e0c773" },
+      GitSignsChange = { fg = "#dcbf5f" },
+      GitSignsDelete = { fg = "#b4942e" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#e8e4dc", bg = "#08080a" },
+      TelescopeBorder = { fg = "#1c1c1e", bg = "#08080a" },
+      TelescopePromptTitle = { fg = "#08080a", bg = "#d4af37", bold = true },
+      TelescopePreviewTitle = { fg = "#08080a", bg = "#e0c773", bold = true },
+      TelescopeResultsTitle = { fg = "#08080a", bg = "#dec369", bold = true },
+      TelescopeSelection = { bg = "#302913" },
+      TelescopeMatching = { fg = "#d4af37", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#d4af37", bold = true },
+      CmpItemKindVariable = { fg = "#e8e4dc" },
+      CmpItemKindFunction = { fg = "#dec369" },
+      CmpItemKindKeyword = { fg = "#d4af37" },
+      CmpItemKindClass = { fg = "#e8e4dc" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#1c1c1e" },
+      IblScope = { fg = "#5a5a68" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#08080a", bg = "#d4af37", bold = true },
+      LazyButton = { fg = "#e8e4dc", bg = "#1c1c1e" },
+      LazyButtonActive = { fg = "#08080a", bg = "#d4af37" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#b4942e" },
+      NotifyWARNBorder = { fg = "#dcbf5f" },
+      NotifyINFOBorder = { fg = "#dec369" },
+      NotifyDEBUGBorder = { fg = "#5a5a68" },
+      NotifyTRACEBorder = { fg = "#d4af37" },
+    },
+  },
+}
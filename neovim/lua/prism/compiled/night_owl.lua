@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Night Owl
+-- Auto-generated by sync_themes.py from vscode/themes/night_owl.json - DO NOT EDIT
+
+return {
+  name = "Night Owl",
+  mode = "dark",
+  palette = {
+    base00 = "#011627",
+    base01 = "#051e32",
+    base02 = "#142c3e",
+    base03 = "#82aaff",
+    base04 = "#acc5f6",
+    base05 = "#d6deeb",
+    base06 = "#e6eefc",
+    base07 = "#f7ffff",
+    base08 = "#a97cc6",
+    base09 = "#ff5874",
+    base0A = "#c792ea",
+    base0B = "#ecc48d",
+    base0C = "#d2a7ee",
+    base0D = "#82aaff",
+    base0E = "#c792ea",
+    base0F = "#82aaff",
+  },
+  terminal = {
+    "#011627", "#a97cc6", "#cc9cec", "#9bbbff",
+    "#c792ea", "#956daf", "#d2a7ee", "#f78c6c",
+    "#82aaff", "#c792ea", "#d2a7ee", "#f78c6c",
+    "#cfa2ed", "#b383d2", "#d7b2f0", "#f7977a",
+  },
+  groups = {
+    Normal = { fg = "#d6deeb", bg = "#011627" },
+    NormalFloat = { fg = "#d6deeb", bg = "#051e32" },
+    NormalNC = { fg = "#d6deeb", bg = "#011627" },
+    Cursor = { fg = "#011627", bg = "#c792ea" },
+    CursorLine = { bg = "#0b2030" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#071c2c" },
+    LineNr = { fg = "#82aaff" },
+    CursorLineNr = { fg = "#d6deeb", bold = true },
+    SignColumn = { fg = "#82aaff", bg = "#011627" },
+    VertSplit = { fg = "#142c3e" },
+    WinSeparator = { fg = "#142c3e" },
+    Folded = { fg = "#82aaff", bg = "#051e32" },
+    FoldColumn = { fg = "#82aaff" },
+    NonText = { fg = "#82aaff" },
+    SpecialKey = { fg = "#82aaff" },
+    Whitespace = { fg = "#416093" },
+    MatchParen = { fg = "#c792ea", bold = true },
+    Visual = { bg = "#3c3b61" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#011627", bg = "#c792ea" },
+    IncSearch = { fg = "#011627", bg = "#ff5874" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#011627", bg = "#a97cc6" },
+    Pmenu = { fg = "#d6deeb", bg = "#051e32" },
+    PmenuSel = { fg = "#d6deeb", bg = "#282e4e" },
+    PmenuSbar = { bg = "#142c3e" },
+    PmenuThumb = { bg = "#acc5f6" },
+    ErrorMsg = { fg = "#a97cc6" },
+    WarningMsg = { fg = "#ff5874" },
+    ModeMsg = { fg = "#d6deeb", bold = true },
+    MoreMsg = { fg = "#82aaff" },
+    Question = { fg = "#82aaff" },
+    TabLine = { fg = "#acc5f6", bg = "#051e32" },
+    TabLineFill = { bg = "#011627" },
+    TabLineSel = { fg = "#d6deeb", bg = "#011627", bold = true },
+    StatusLine = { fg = "#d6deeb", bg = "#051e32" },
+    StatusLineNC = { fg = "#acc5f6", bg = "#051e32" },
+    DiffAdd = { bg = "#243036" },
+    DiffChange = { bg = "#271f32" },
+    DiffDelete = { fg = "#a97cc6", bg = "#1a253e" },
+    DiffText = { bg = "#4d293e" },
+    SpellBad = { sp = "#a97cc6", undercurl = true },
+    SpellCap = { sp = "#ff5874", undercurl = true },
+    SpellLocal = { sp = "#82aaff", undercurl = true },
+    SpellRare = { sp = "#c792ea", undercurl = true },
+    Comment = { fg = "#82aaff" },
+    Constant = { fg = "#ff5874" },
+    String = { fg = "#ecc48d" },
+    Character = { fg = "#ecc48d" },
+    Number = { fg = "#ff5874" },
+    Boolean = { fg = "#ff5874" },
+    Float = { fg = "#ff5874" },
+    Identifier = { fg = "#d6deeb" },
+    Function = { fg = "#82aaff" },
+    Statement = { fg = "#c792ea" },
+    Conditional = { fg = "#c792ea" },
+    Repeat = { fg = "#c792ea" },
+    Label = { fg = "#c792ea" },
+    Operator = { fg = "#acc5f6" },
+    Keyword = { fg = "#c792ea" },
+    Exception = { fg = "#c792ea" },
+    PreProc = { fg = "#c792ea" },
+    Include = { fg = "#c792ea" },
+    Define = { fg = "#c792ea" },
+    Macro = { fg = "#c792ea" },
+    PreCondit = { fg = "#c792ea" },
+    Type = { fg = "#ffcb8b" },
+    StorageClass = { fg = "#c792ea" },
+    Structure = { fg = "#ffcb8b" },
+    Typedef = { fg = "#ffcb8b" },
+    Special = { fg = "#d2a7ee" },
+    SpecialChar = { fg = "#d2a7ee" },
+    Tag = { fg = "#ecc48d" },
+    Delimiter = { fg = "#acc5f6" },
+    SpecialComment = { fg = "#82aaff", italic = true },
+    Debug = { fg = "#ff5874" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#82aaff" },
+    Error = { fg = "#a97cc6" },
+    Todo = { fg = "#011627", bg = "#c792ea", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#d6deeb" },
+      ["@variable.builtin"] = { fg = "#c792ea" },
+      ["@variable.parameter"] = { fg = "#d6deeb", italic = true },
+      ["@variable.member"] = { fg = "#d6deeb" },
+      ["@constant"] = { fg = "#ff5874" },
+      ["@constant.builtin"] = { fg = "#ff5874" },
+      ["@module"] = { fg = "#d6deeb" },
+      ["@label"] = { fg = "#c792ea" },
+      ["@type"] = { fg = "#ffcb8b" },
+      ["@type.builtin"] = { fg = "#ffcb8b" },
+      ["@attribute"] = { fg = "#cfa2ed" },
+      ["@property"] = { fg = "#d6deeb" },
+      ["@function"] = { fg = "#82aaff" },
+      ["@function.builtin"] = { fg = "#82aaff" },
+      ["@function.call"] = { fg = "#82aaff" },
+      ["@function.method"] = { fg = "#82aaff" },
+      ["@constructor"] = { fg = "#ffcb8b" },
+      ["@operator"] = { fg = "#acc5f6" },
+      ["@keyword"] = { fg = "#c792ea" },
+      ["@keyword.conditional"] = { fg = "#c792ea" },
+      ["@keyword.function"] = { fg = "#c792ea" },
+      ["@keyword.operator"] = { fg = "#c792ea" },
+      ["@keyword.return"] = { fg = "#c792ea" },
+      ["@punctuation.bracket"] = { fg = "#acc5f6" },
+      ["@punctuation.delimiter"] = { fg = "#acc5f6" },
+      ["@punctuation.special"] = { fg = "#d2a7ee" },
+      ["@string"] = { fg = "#ecc48d" },
+      ["@string.escape"] = { fg = "#d2a7ee" },
+      ["@string.regexp"] = { fg = "#d2a7ee" },
+      ["@character"] = { fg = "#ecc48d" },
+      ["@boolean"] = { fg = "#ff5874" },
+      ["@number"] = { fg = "#ff5874" },
+      ["@comment"] = { fg = "#82aaff", italic = true },
+      ["@comment.todo"] = { fg = "#011627", bg = "#c792ea", bold = true },
+      ["@comment.error"] = { fg = "#a97cc6", bold = true },
+      ["@comment.warning"] = { fg = "#ff5874", bold = true },
+      ["@comment.note"] = { fg = "#82aaff", bold = true },
+      ["@markup.heading"] = { fg = "#c792ea", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#ecc48d" },
+      ["@markup.link"] = { fg = "#82aaff", underline = true },
+      ["@tag"] = { fg = "#ecc48d" },
+      ["@tag.attribute"] = { fg = "#cfa2ed" },
+      ["@tag.delimiter"] = { fg = "#acc5f6" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#a97cc6" },
+      DiagnosticWarn = { fg = "#ff5874" },
+      DiagnosticInfo = { fg = "#82aaff" },
+      DiagnosticHint = { fg = "#c792ea" },
+      DiagnosticUnderlineError = { sp = "#a97cc6", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#ff5874", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#82aaff", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#c792ea", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#a97cc6", bg = "#112036" },
+      DiagnosticVirtualTextWarn = { fg = "#ff5874", bg = "#1a1c2e" },
+      DiagnosticVirtualTextInfo = { fg = "#82aaff", bg = "#0d243c" },
+      DiagnosticVirtualTextHint = { fg = "#c792ea", bg = "#14223a" },
+      LspReferenceText = { bg = "#162a3a" },
+      LspReferenceRead = { bg = "#162a3a" },
+      LspReferenceWrite = { bg = "#203444" },
+      LspSignatureActiveParameter = { fg = "#c792ea", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#ecc48d" },
+      GitSignsChange = { fg = "#ff5874" },
+      GitSignsDelete = { fg = "#a97cc6" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#d6deeb", bg = "#011627" },
+      TelescopeBorder = { fg = "#142c3e", bg = "#011627" },
+      TelescopePromptTitle = { fg = "#011627", bg = "#c792ea", bold = true },
+      TelescopePreviewTitle = { fg = "#011627", bg = "#ecc48d", bold = true },
+      TelescopeResultsTitle = { fg = "#011627", bg = "#82aaff", bold = true },
+      TelescopeSelection = { bg = "#282e4e" },
+      TelescopeMatching = { fg = "#c792ea", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#c792ea", bold = true },
+      CmpItemKindVariable = { fg = "#d6deeb" },
+      CmpItemKindFunction = { fg = "#82aaff" },
+      CmpItemKindKeyword = { fg = "#c792ea" },
+      CmpItemKindClass = { fg = "#ffcb8b" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#142c3e" },
+      IblScope = { fg = "#82aaff" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#011627", bg = "#c792ea", bold = true },
+      LazyButton = { fg = "#d6deeb", bg = "#142c3e" },
+      LazyButtonActive = { fg = "#011627", bg = "#c792ea" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#a97cc6" },
+      NotifyWARNBorder = { fg = "#ff5874" },
+      NotifyINFOBorder = { fg = "#82aaff" },
+      NotifyDEBUGBorder = { fg = "#82aaff" },
+      NotifyTRACEBorder = { fg = "#c792ea" },
+    },
+  },
+}
@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Nord Aurora
+-- Auto-generated by sync_themes.py from vscode/themes/nord_aurora.json - DO NOT EDIT
+
+return {
+  name = "Nord Aurora",
+  mode = "dark",
+  palette = {
+    base00 = "#0f1318",
+    base01 = "#151a20",
+    base02 = "#24282e",
+    base03 = "#6878a8",
+    base04 = "#677bb9",
+    base05 = "#bf616a",
+    base06 = "#d07079",
+    base07 = "#e17f87",
+    base08 = "#6d88a4",
+    base09 = "#bf616a",
+    base0A = "#81a1c1",
+    base0B = "#a3be8c",
+    base0C = "#9ab3cd",
+    base0D = "#ffffff",
+    base0E = "#81a1c1",
+    base0F = "#88c0d0",
+  },
+  terminal = {
+    "#0f1318", "#6d88a4", "#8daac7", "#9fccd9",
+    "#81a1c1", "#607890", "#9ab3cd", "#bf616a",
+    "#88c0d0", "#81a1c1", "#9ab3cd", "#bf616a",
+    "#93afca", "#7490ad", "#a6bdd3", "#c57078",
+  },
+  groups = {
+    Normal = { fg = "#bf616a", bg = "#0f1318" },
+    NormalFloat = { fg = "#bf616a", bg = "#151a20" },
+    NormalNC = { fg = "#bf616a", bg = "#0f1318" },
+    Cursor = { fg = "#0f1318", bg = "#81a1c1" },
+    CursorLine = { bg = "#17161c" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#14151a" },
+    LineNr = { fg = "#6878a8" },
+    CursorLineNr = { fg = "#bf616a", bold = true },
+    SignColumn = { fg = "#6878a8", bg = "#0f1318" },
+    VertSplit = { fg = "#24282e" },
+    WinSeparator = { fg = "#24282e" },
+    Folded = { fg = "#6878a8", bg = "#151a20" },
+    FoldColumn = { fg = "#6878a8" },
+    NonText = { fg = "#6878a8" },
+    SpecialKey = { fg = "#6878a8" },
+    Whitespace = { fg = "#3b4560" },
+    MatchParen = { fg = "#81a1c1", bold = true },
+    Visual = { bg = "#313d4a" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#0f1318", bg = "#81a1c1" },
+    IncSearch = { fg = "#0f1318", bg = "#bf616a" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#0f1318", bg = "#6d88a4" },
+    Pmenu = { fg = "#bf616a", bg = "#151a20" },
+    PmenuSel = { fg = "#bf616a", bg = "#252f39" },
+    PmenuSbar = { bg = "#24282e" },
+    PmenuThumb = { bg = "#677bb9" },
+    ErrorMsg = { fg = "#6d88a4" },
+    WarningMsg = { fg = "#bf616a" },
+    ModeMsg = { fg = "#bf616a", bold = true },
+    MoreMsg = { fg = "#ffffff" },
+    Question = { fg = "#ffffff" },
+    TabLine = { fg = "#677bb9", bg = "#151a20" },
+    TabLineFill = { bg = "#0f1318" },
+    TabLineSel = { fg = "#bf616a", bg = "#0f1318", bold = true },
+    StatusLine = { fg = "#bf616a", bg = "#151a20" },
+    StatusLineNC = { fg = "#677bb9", bg = "#151a20" },
+    DiffAdd = { bg = "#252c29" },
+    DiffChange = { bg = "#291e24" },
+    DiffDelete = { fg = "#6d88a4", bg = "#1d242d" },
+    DiffText = { bg = "#432a30" },
+    SpellBad = { sp = "#6d88a4", undercurl = true },
+    SpellCap = { sp = "#bf616a", undercurl = true },
+    SpellLocal = { sp = "#ffffff", undercurl = true },
+    SpellRare = { sp = "#81a1c1", undercurl = true },
+    Comment = { fg = "#6878a8" },
+    Constant = { fg = "#bf616a" },
+    String = { fg = "#a3be8c" },
+    Character = { fg = "#a3be8c" },
+    Number = { fg = "#bf616a" },
+    Boolean = { fg = "#bf616a" },
+    Float = { fg = "#bf616a" },
+    Identifier = { fg = "#e8e8f0" },
+    Function = { fg = "#ffffff" },
+    Statement = { fg = "#81a1c1" },
+    Conditional = { fg = "#81a1c1" },
+    Repeat = { fg = "#81a1c1" },
+    Label = { fg = "#81a1c1" },
+    Operator = { fg = "#677bb9" },
+    Keyword = { fg = "#81a1c1" },
+    Exception = { fg = "#81a1c1" },
+    PreProc = { fg = "#81a1c1" },
+    Include = { fg = "#81a1c1" },
+    Define = { fg = "#81a1c1" },
+    Macro = { fg = "#81a1c1" },
+    PreCondit = { fg = "#81a1c1" },
+    Type = { fg = "#bf616a" },
+    StorageClass = { fg = "#81a1c1" },
+    Structure = { fg = "#bf616a" },
+    Typedef = { fg = "#bf616a" },
+    Special = { fg = "#9ab3cd" },
+    SpecialChar = { fg = "#9ab3cd" },
+    Tag = { fg = "#a3be8c" },
+    Delimiter = { fg = "#677bb9" },
+    SpecialComment = { fg = "#6878a8", italic = true },
+    Debug = { fg = "#bf616a" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#6878a8" },
+    Error = { fg = "#6d88a4" },
+    Todo = { fg = "#0f1318", bg = "#81a1c1", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#e8e8f0" },
+      ["@variable.builtin"] = { fg = "#81a1c1" },
+      ["@variable.parameter"] = { fg = "#e8e8f0", italic = true },
+      ["@variable.member"] = { fg = "#e8e8f0" },
+      ["@constant"] = { fg = "#bf616a" },
+      ["@constant.builtin"] = { fg = "#bf616a" },
+      ["@module"] = { fg = "#bf616a" },
+      ["@label"] = { fg = "#81a1c1" },
+      ["@type"] = { fg = "#bf616a" },
+      ["@type.builtin"] = { fg = "#bf616a" },
+      ["@attribute"] = { fg = "#93afca" },
+      ["@property"] = { fg = "#e8e8f0" },
+      ["@function"] = { fg = "#ffffff" },
+      ["@function.builtin"] = { fg = "#ffffff" },
+      ["@function.call"] = { fg = "#ffffff" },
+      ["@function.method"] = { fg = "#ffffff" },
+      ["@constructor"] = { fg = "#bf616a" },
+      ["@operator"] = { fg = "#677bb9" },
+      ["@keyword"] = { fg = "#81a1c1" },
+      ["@keyword.conditional"] = { fg = "#81a1c1" },
+      ["@keyword.function"] = { fg = "#81a1c1" },
+      ["@keyword.operator"] = { fg = "#81a1c1" },
+      ["@keyword.return"] = { fg = "#81a1c1" },
+      ["@punctuation.bracket"] = { fg = "#677bb9" },
+      ["@punctuation.delimiter"] = { fg = "#677bb9" },
+      ["@punctuation.special"] = { fg = "#9ab3cd" },
+      ["@string"] = { fg = "#a3be8c" },
+      ["@string.escape"] = { fg = "#9ab3cd" },
+      ["@string.regexp"] = { fg = "#9ab3cd" },
+      ["@character"] = { fg = "#a3be8c" },
+      ["@boolean"] = { fg = "#bf616a" },
+      ["@number"] = { fg = "#bf616a" },
+      ["@comment"] = { fg = "#6878a8", italic = true },
+      ["@comment.todo"] = { fg = "#0f1318", bg = "#81a1c1", bold = true },
+      ["@comment.error"] = { fg = "#6d88a4", bold = true },
+      ["@comment.warning"] = { fg = "#bf616a", bold = true },
+      ["@comment.note"] = { fg = "#ffffff", bold = true },
+      ["@markup.heading"] = { fg = "#81a1c1", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#a3be8c" },
+      ["@markup.link"] = { fg = "#ffffff", underline = true },
+      ["@tag"] = { fg = "#a3be8c" },
+      ["@tag.attribute"] = { fg = "#93afca" },
+      ["@tag.delimiter"] = { fg = "#677bb9" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#6d88a4" },
+      DiagnosticWarn = { fg = "#bf616a" },
+      DiagnosticInfo = { fg = "#ffffff" },
+      DiagnosticHint = { fg = "#81a1c1" },
+      DiagnosticUnderlineError = { sp = "#6d88a4", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#bf616a", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#ffffff", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#81a1c1", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#6d88a4", bg = "#181e26" },
+      DiagnosticVirtualTextWarn = { fg = "#bf616a", bg = "#201a20" },
+      DiagnosticVirtualTextInfo = { fg = "#ffffff", bg = "#272a2f" },
+      DiagnosticVirtualTextHint = { fg = "#81a1c1", bg = "#1a2128" },
+      LspReferenceText = { bg = "#201a20" },
+      LspReferenceRead = { bg = "#201a20" },
+      LspReferenceWrite = { bg = "#291e24" },
+      LspSignatureActiveParameter = { fg = "#81a1c1", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#a3be8c" },
+      GitSignsChange = { fg = "#bf616a" },
+      GitSignsDelete = { fg = "#6d88a4" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#bf616a", bg = "#0f1318" },
+      TelescopeBorder = { fg = "#24282e", bg = "#0f1318" },
+      TelescopePromptTitle = { fg = "#0f1318", bg = "#81a1c1", bold = true },
+      TelescopePreviewTitle = { fg = "#0f1318", bg = "#a3be8c", bold = true },
+      TelescopeResultsTitle = { fg = "#0f1318", bg = "#ffffff", bold = true },
+      TelescopeSelection = { bg = "#252f39" },
+      TelescopeMatching = { fg = "#81a1c1", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#81a1c1", bold = true },
+      CmpItemKindVariable = { fg = "#e8e8f0" },
+      CmpItemKindFunction = { fg = "#ffffff" },
+      CmpItemKindKeyword = { fg = "#81a1c1" },
+      CmpItemKindClass = { fg = "#bf616a" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#24282e" },
+      IblScope = { fg = "#6878a8" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#0f1318", bg = "#81a1c1", bold = true },
+      LazyButton = { fg = "#bf616a", bg = "#24282e" },
+      LazyButtonActive = { fg = "#0f1318", bg = "#81a1c1" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#6d88a4" },
+      NotifyWARNBorder = { fg = "#bf616a" },
+      NotifyINFOBorder = { fg = "#ffffff" },
+      NotifyDEBUGBorder = { fg = "#6878a8" },
+      NotifyTRACEBorder = { fg = "#81a1c1" },
+    },
+  },
+}
@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Obsidian Rose Gold
+-- Auto-generated by sync_themes.py from vscode/themes/obsidian_rose_gold.json - DO NOT EDIT
+
+return {
+  name = "Obsidian Rose Gold",
+  mode = "dark",
+  palette = {
+    base00 = "#050404",
+    base01 = "#0c0a0a",
+    base02 = "#171515",
+    base03 = "#a89898",
+    base04 = "#cbbfbf",
+    base05 = "#f0e8e8",
+    base06 = "#fff9f9",
+    base07 = "#fffdfd",
+    base08 = "#c5999c",
+    base09 = "#d09098",
+    base0A = "#e8b4b8",
+    base0B = "#ffeedd",
+    base0C = "#ecc3c6",
+    base0D = "#ffffff",
+    base0E = "#e8b4b8",
+    base0F = "#5a5555",
+  },
+  terminal = {
+    "#050404", "#c5999c", "#eabbbf", "#7b7777",
+    "#e8b4b8", "#ae878a", "#ecc3c6", "#f0e8e8",
+    "#5a5555", "#e8b4b8", "#ecc3c6", "#f0e8e8",
+    "#ebbfc2", "#d0a2a5", "#eecacd", "#f1eaea",
+  },
+  groups = {
+    Normal = { fg = "#f0e8e8", bg = "#050404" },
+    NormalFloat = { fg = "#f0e8e8", bg = "#0c0a0a" },
+    NormalNC = { fg = "#f0e8e8", bg = "#050404" },
+    Cursor = { fg = "#050404", bg = "#e8b4b8" },
+    CursorLine = { bg = "#100f0f" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#0c0a0a" },
+    LineNr = { fg = "#a89898" },
+    CursorLineNr = { fg = "#f0e8e8", bold = true },
+    SignColumn = { fg = "#a89898", bg = "#050404" },
+    VertSplit = { fg = "#171515" },
+    WinSeparator = { fg = "#171515" },
+    Folded = { fg = "#a89898", bg = "#0c0a0a" },
+    FoldColumn = { fg = "#a89898" },
+    NonText = { fg = "#a89898" },
+    SpecialKey = { fg = "#a89898" },
+    Whitespace = { fg = "#564e4e" },
+    MatchParen = { fg = "#e8b4b8", bold = true },
+    Visual = { bg = "#493839" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#050404", bg = "#e8b4b8" },
+    IncSearch = { fg = "#050404", bg = "#d09098" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#050404", bg = "#c5999c" },
+    Pmenu = { fg = "#f0e8e8", bg = "#0c0a0a" },
+    PmenuSel = { fg = "#f0e8e8", bg = "#322728" },
+    PmenuSbar = { bg = "#171515" },
+    PmenuThumb = { bg = "#cbbfbf" },
+    ErrorMsg = { fg = "#c5999c" },
+    WarningMsg = { fg = "#d09098" },
+    ModeMsg = { fg = "#f0e8e8", bold = true },
+    MoreMsg = { fg = "#ffffff" },
+    Question = { fg = "#ffffff" },
+    TabLine = { fg = "#cbbfbf", bg = "#0c0a0a" },
+    TabLineFill = { bg = "#050404" },
+    TabLineSel = { fg = "#f0e8e8", bg = "#050404", bold = true },
+    StatusLine = { fg = "#f0e8e8", bg = "#0c0a0a" },
+    StatusLineNC = { fg = "#cbbfbf", bg = "#0c0a0a" },
+    DiffAdd = { bg = "#2a2724" },
+    DiffChange = { bg = "#23181a" },
+    DiffDelete = { fg = "#c5999c", bg = "#211a1a" },
+    DiffText = { bg = "#412d30" },
+    SpellBad = { sp = "#c5999c", undercurl = true },
+    SpellCap = { sp = "#d09098", undercurl = true },
+    SpellLocal = { sp = "#ffffff", undercurl = true },
+    SpellRare = { sp = "#e8b4b8", undercurl = true },
+    Comment = { fg = "#a89898" },
+    Constant = { fg = "#d09098" },
+    String = { fg = "#ffeedd" },
+    Character = { fg = "#ffeedd" },
+    Number = { fg = "#d09098" },
+    Boolean = { fg = "#d09098" },
+    Float = { fg = "#d09098" },
+    Identifier = { fg = "#f0e0e0" },
+    Function = { fg = "#ffffff" },
+    Statement = { fg = "#e8b4b8" },
+    Conditional = { fg = "#e8b4b8" },
+    Repeat = { fg = "#e8b4b8" },
+    Label = { fg = "#e8b4b8" },
+    Operator = { fg = "#cbbfbf" },
+    Keyword = { fg = "#e8b4b8" },
+    Exception = { fg = "#e8b4b8" },
+    PreProc = { fg = "#e8b4b8" },
+    Include = { fg = "#e8b4b8" },
+    Define = { fg = "#e8b4b8" },
+    Macro = { fg = "#e8b4b8" },
+    PreCondit = { fg = "#e8b4b8" },
+    Type = { fg = "#fe4c6d" },
+    StorageClass = { fg = "#e8b4b8" },
+    Structure = { fg = "#fe4c6d" },
+    Typedef = { fg = "#fe4c6d" },
+    Special = { fg = "#ecc3c6" },
+    SpecialChar = { fg = "#ecc3c6" },
+    Tag = { fg = "#ffeedd" },
+    Delimiter = { fg = "#cbbfbf" },
+    SpecialComment = { fg = "#a89898", italic = true },
+    Debug = { fg = "#d09098" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#a89898" },
+    Error = { fg = "#c5999c" },
+    Todo = { fg = "#050404", bg = "#e8b4b8", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#f0e0e0" },
+      ["@variable.builtin"] = { fg = "#e8b4b8" },
+      ["@variable.parameter"] = { fg = "#f0e0e0", italic = true },
+      ["@variable.member"] = { fg = "#f0e0e0" },
+      ["@constant"] = { fg = "#d09098" },
+      ["@constant.builtin"] = { fg = "#d09098" },
+      ["@module"] = { fg = "#f0e8e8" },
+      ["@label"] = { fg = "#e8b4b8" },
+      ["@type"] = { fg = "#fe4c6d" },
+      ["@type.builtin"] = { fg = "#fe4c6d" },
+      ["@attribute"] = { fg = "#ebbfc2" },
+      ["@property"] = { fg = "#f0e0e0" },
+      ["@function"] = { fg = "#ffffff" },
+      ["@function.builtin"] = { fg = "#ffffff" },
+      ["@function.call"] = { fg = "#ffffff" },
+      ["@function.method"] = { fg = "#ffffff" },
+      ["@constructor"] = { fg = "#fe4c6d" },
+      ["@operator"] = { fg = "#cbbfbf" },
+      ["@keyword"] = { fg = "#e8b4b8" },
+      ["@keyword.conditional"] = { fg = "#e8b4b8" },
+      ["@keyword.function"] = { fg = "#e8b4b8" },
+      ["@keyword.operator"] = { fg = "#e8b4b8" },
+      ["@keyword.return"] = { fg = "#e8b4b8" },
+      ["@punctuation.bracket"] = { fg = "#cbbfbf" },
+      ["@punctuation.delimiter"] = { fg = "#cbbfbf" },
+      ["@punctuation.special"] = { fg = "#ecc3c6" },
+      ["@string"] = { fg = "#ffeedd" },
+      ["@string.escape"] = { fg = "#ecc3c6" },
+      ["@string.regexp"] = { fg = "#ecc3c6" },
+      ["@character"] = { fg = "#ffeedd" },
+      ["@boolean"] = { fg = "#d09098" },
+      ["@number"] = { fg = "#d09098" },
+      ["@comment"] = { fg = "#a89898", italic = true },
+      ["@comment.todo"] = { fg = "#050404", bg = "#e8b4b8", bold = true },
+      ["@comment.error"] = { fg = "#c5999c", bold = true },
+      ["@comment.warning"] = { fg = "#d09098", bold = true },
+      ["@comment.note"] = { fg = "#ffffff", bold = true },
+      ["@markup.heading"] = { fg = "#e8b4b8", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#ffeedd" },
+      ["@markup.link"] = { fg = "#ffffff", underline = true },
+      ["@tag"] = { fg = "#ffeedd" },
+      ["@tag.attribute"] = { fg = "#ebbfc2" },
+      ["@tag.delimiter"] = { fg = "#cbbfbf" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#c5999c" },
+      DiagnosticWarn = { fg = "#d09098" },
+      DiagnosticInfo = { fg = "#ffffff" },
+      DiagnosticHint = { fg = "#e8b4b8" },
+      DiagnosticUnderlineError = { sp = "#c5999c", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#d09098", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#ffffff", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#e8b4b8", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#c5999c", bg = "#181213" },
+      DiagnosticVirtualTextWarn = { fg = "#d09098", bg = "#191212" },
+      DiagnosticVirtualTextInfo = { fg = "#ffffff", bg = "#1e1d1d" },
+      DiagnosticVirtualTextHint = { fg = "#e8b4b8", bg = "#1b1516" },
+      LspReferenceText = { bg = "#1c1a1a" },
+      LspReferenceRead = { bg = "#1c1a1a" },
+      LspReferenceWrite = { bg = "#282626" },
+      LspSignatureActiveParameter = { fg = "#e8b4b8", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#ffeedd" },
+      GitSignsChange = { fg = "#d09098" },
+      GitSignsDelete = { fg = "#c5999c" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#f0e8e8", bg = "#050404" },
+      TelescopeBorder = { fg = "#171515", bg = "#050404" },
+      TelescopePromptTitle = { fg = "#050404", bg = "#e8b4b8", bold = true },
+      TelescopePreviewTitle = { fg = "#050404", bg = "#ffeedd", bold = true },
+      TelescopeResultsTitle = { fg = "#050404", bg = "#ffffff", bold = true },
+      TelescopeSelection = { bg = "#322728" },
+      TelescopeMatching = { fg = "#e8b4b8", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#e8b4b8", bold = true },
+      CmpItemKindVariable = { fg = "#f0e0e0" },
+      CmpItemKindFunction = { fg = "#ffffff" },
+      CmpItemKindKeyword = { fg = "#e8b4b8" },
+      CmpItemKindClass = { fg = "#fe4c6d" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#171515" },
+      IblScope = { fg = "#a89898" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#050404", bg = "#e8b4b8", bold = true },
+      LazyButton = { fg = "#f0e8e8", bg = "#171515" },
+      LazyButtonActive = { fg = "#050404", bg = "#e8b4b8" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#c5999c" },
+      NotifyWARNBorder = { fg = "#d09098" },
+      NotifyINFOBorder = { fg = "#ffffff" },
+      NotifyDEBUGBorder = { fg = "#a89898" },
+      NotifyTRACEBorder = { fg = "#e8b4b8" },
+    },
+  },
+}
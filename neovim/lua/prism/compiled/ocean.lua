@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Ocean
+-- Auto-generated by sync_themes.py from vscode/themes/ocean.json - DO NOT EDIT
+
+return {
+  name = "Ocean",
+  mode = "dark",
+  palette = {
+    base00 = "#0a1820",
+    base01 = "#0f2e45",
+    base02 = "#1f2e36",
+    base03 = "#507878",
+    base04 = "#258c8d",
+    base05 = "#348fd5",
+    base06 = "#469fe6",
+    base07 = "#56aff7",
+    base08 = "#2c888b",
+    base09 = "#68c8d0",
+    base0A = "#34A0A4",
+    base0B = "#5090c0",
+    base0C = "#5cb3b6",
+    base0D = "#ffffff",
+    base0E = "#34A0A4",
+    base0F = "#0E566C",
+  },
+  terminal = {
+    "#0A2133", "#2c888b", "#48a9ad", "#3e7789",
+    "#34A0A4", "#27787b", "#5cb3b6", "#348FD5",
+    "#0E566C", "#34A0A4", "#5cb3b6", "#348FD5",
+    "#52aeb1", "#2e9093", "#70bcbf", "#489ad9",
+  },
+  groups = {
+    Normal = { fg = "#348fd5", bg = "#0a1820" },
+    NormalFloat = { fg = "#348fd5", bg = "#0f2e45" },
+    NormalNC = { fg = "#348fd5", bg = "#0a1820" },
+    Cursor = { fg = "#0a1820", bg = "#34A0A4" },
+    CursorLine = { bg = "#0c1d29" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#0b1b25" },
+    LineNr = { fg = "#507878" },
+    CursorLineNr = { fg = "#348fd5", bold = true },
+    SignColumn = { fg = "#507878", bg = "#0a1820" },
+    VertSplit = { fg = "#1f2e36" },
+    WinSeparator = { fg = "#1f2e36" },
+    Folded = { fg = "#507878", bg = "#0f2e45" },
+    FoldColumn = { fg = "#507878" },
+    NonText = { fg = "#507878" },
+    SpecialKey = { fg = "#507878" },
+    Whitespace = { fg = "#2d484c" },
+    MatchParen = { fg = "#34A0A4", bold = true },
+    Visual = { bg = "#164047" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#0a1820", bg = "#34A0A4" },
+    IncSearch = { fg = "#0a1820", bg = "#68c8d0" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#0a1820", bg = "#2c888b" },
+    Pmenu = { fg = "#348fd5", bg = "#0f2e45" },
+    PmenuSel = { fg = "#348fd5", bg = "#12333a" },
+    PmenuSbar = { bg = "#1f2e36" },
+    PmenuThumb = { bg = "#258c8d" },
+    ErrorMsg = { fg = "#2c888b" },
+    WarningMsg = { fg = "#68c8d0" },
+    ModeMsg = { fg = "#348fd5", bold = true },
+    MoreMsg = { fg = "#ffffff" },
+    Question = { fg = "#ffffff" },
+    TabLine = { fg = "#258c8d", bg = "#0f2e45" },
+    TabLineFill = { bg = "#0a1820" },
+    TabLineSel = { fg = "#348fd5", bg = "#0a1820", bold = true },
+    StatusLine = { fg = "#348fd5", bg = "#0f2e45" },
+    StatusLineNC = { fg = "#258c8d", bg = "#0f2e45" },
+    DiffAdd = { bg = "#142a38" },
+    DiffChange = { bg = "#18323a" },
+    DiffDelete = { fg = "#2c888b", bg = "#0f2830" },
+    DiffText = { bg = "#264c54" },
+    SpellBad = { sp = "#2c888b", undercurl = true },
+    SpellCap = { sp = "#68c8d0", undercurl = true },
+    SpellLocal = { sp = "#ffffff", undercurl = true },
+    SpellRare = { sp = "#34A0A4", undercurl = true },
+    Comment = { fg = "#507878" },
+    Constant = { fg = "#68c8d0" },
+    String = { fg = "#5090c0" },
+    Character = { fg = "#5090c0" },
+    Number = { fg = "#68c8d0" },
+    Boolean = { fg = "#68c8d0" },
+    Float = { fg = "#68c8d0" },
+    Identifier = { fg = "#e0f0f0" },
+    Function = { fg = "#ffffff" },
+    Statement = { fg = "#34A0A4" },
+    Conditional = { fg = "#34A0A4" },
+    Repeat = { fg = "#34A0A4" },
+    Label = { fg = "#34A0A4" },
+    Operator = { fg = "#258c8d" },
+    Keyword = { fg = "#34A0A4" },
+    Exception = { fg = "#34A0A4" },
+    PreProc = { fg = "#34A0A4" },
+    Include = { fg = "#34A0A4" },
+    Define = { fg = "#34A0A4" },
+    Macro = { fg = "#34A0A4" },
+    PreCondit = { fg = "#34A0A4" },
+    Type = { fg = "#88a8a8" },
+    StorageClass = { fg = "#34A0A4" },
+    Structure = { fg = "#88a8a8" },
+    Typedef = { fg = "#88a8a8" },
+    Special = { fg = "#5cb3b6" },
+    SpecialChar = { fg = "#5cb3b6" },
+    Tag = { fg = "#5090c0" },
+    Delimiter = { fg = "#258c8d" },
+    SpecialComment = { fg = "#507878", italic = true },
+    Debug = { fg = "#68c8d0" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#507878" },
+    Error = { fg = "#2c888b" },
+    Todo = { fg = "#0a1820", bg = "#34A0A4", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#e0f0f0" },
+      ["@variable.builtin"] = { fg = "#34A0A4" },
+      ["@variable.parameter"] = { fg = "#e0f0f0", italic = true },
+      ["@variable.member"] = { fg = "#e0f0f0" },
+      ["@constant"] = { fg = "#68c8d0" },
+      ["@constant.builtin"] = { fg = "#68c8d0" },
+      ["@module"] = { fg = "#348fd5" },
+      ["@label"] = { fg = "#34A0A4" },
+      ["@type"] = { fg = "#88a8a8" },
+      ["@type.builtin"] = { fg = "#88a8a8" },
+      ["@attribute"] = { fg = "#52aeb1" },
+      ["@property"] = { fg = "#e0f0f0" },
+      ["@function"] = { fg = "#ffffff" },
+      ["@function.builtin"] = { fg = "#ffffff" },
+      ["@function.call"] = { fg = "#ffffff" },
+      ["@function.method"] = { fg = "#ffffff" },
+      ["@constructor"] = { fg = "#88a8a8" },
+      ["@operator"] = { fg = "#258c8d" },
+      ["@keyword"] = { fg = "#34A0A4" },
+      ["@keyword.conditional"] = { fg = "#34A0A4" },
+      ["@keyword.function"] = { fg = "#34A0A4" },
+      ["@keyword.operator"] = { fg = "#34A0A4" },
+      ["@keyword.return"] = { fg = "#34A0A4" },
+      ["@punctuation.bracket"] = { fg = "#258c8d" },
+      ["@punctuation.delimiter"] = { fg = "#258c8d" },
+      ["@punctuation.special"] = { fg = "#5cb3b6" },
+      ["@string"] = { fg = "#5090c0" },
+      ["@string.escape"] = { fg = "#5cb3b6" },
+      ["@string.regexp"] = { fg = "#5cb3b6" },
+      ["@character"] = { fg = "#5090c0" },
+      ["@boolean"] = { fg = "#68c8d0" },
+      ["@number"] = { fg = "#68c8d0" },
+      ["@comment"] = { fg = "#507878", italic = true },
+      ["@comment.todo"] = { fg = "#0a1820", bg = "#34A0A4", bold = true },
+      ["@comment.error"] = { fg = "#2c888b", bold = true },
+      ["@comment.warning"] = { fg = "#68c8d0", bold = true },
+      ["@comment.note"] = { fg = "#ffffff", bold = true },
+      ["@markup.heading"] = { fg = "#34A0A4", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#5090c0" },
+      ["@markup.link"] = { fg = "#ffffff", underline = true },
+      ["@tag"] = { fg = "#5090c0" },
+      ["@tag.attribute"] = { fg = "#52aeb1" },
+      ["@tag.delimiter"] = { fg = "#258c8d" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#2c888b" },
+      DiagnosticWarn = { fg = "#68c8d0" },
+      DiagnosticInfo = { fg = "#ffffff" },
+      DiagnosticHint = { fg = "#34A0A4" },
+      DiagnosticUnderlineError = { sp = "#2c888b", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#68c8d0", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#ffffff", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#34A0A4", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#2c888b", bg = "#0d232a" },
+      DiagnosticVirtualTextWarn = { fg = "#68c8d0", bg = "#132931" },
+      DiagnosticVirtualTextInfo = { fg = "#ffffff", bg = "#222f36" },
+      DiagnosticVirtualTextHint = { fg = "#34A0A4", bg = "#0e252d" },
+      LspReferenceText = { bg = "#0e2332" },
+      LspReferenceRead = { bg = "#0e2332" },
+      LspReferenceWrite = { bg = "#10293b" },
+      LspSignatureActiveParameter = { fg = "#34A0A4", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#5090c0" },
+      GitSignsChange = { fg = "#68c8d0" },
+      GitSignsDelete = { fg = "#2c888b" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#348fd5", bg = "#0a1820" },
+      TelescopeBorder = { fg = "#1f2e36", bg = "#0a1820" },
+      TelescopePromptTitle = { fg = "#0a1820", bg = "#34A0A4", bold = true },
+      TelescopePreviewTitle = { fg = "#0a1820", bg = "#5090c0", bold = true },
+      TelescopeResultsTitle = { fg = "#0a1820", bg = "#ffffff", bold = true },
+      TelescopeSelection = { bg = "#12333a" },
+      TelescopeMatching = { fg = "#34A0A4", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#34A0A4", bold = true },
+      CmpItemKindVariable = { fg = "#e0f0f0" },
+      CmpItemKindFunction = { fg = "#ffffff" },
+      CmpItemKindKeyword = { fg = "#34A0A4" },
+      CmpItemKindClass = { fg = "#88a8a8" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#1f2e36" },
+      IblScope = { fg = "#507878" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#0a1820", bg = "#34A0A4", bold = true },
+      LazyButton = { fg = "#348fd5", bg = "#1f2e36" },
+      LazyButtonActive = { fg = "#0a1820", bg = "#34A0A4" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#2c888b" },
+      NotifyWARNBorder = { fg = "#68c8d0" },
+      NotifyINFOBorder = { fg = "#ffffff" },
+      NotifyDEBUGBorder = { fg = "#507878" },
+      NotifyTRACEBorder = { fg = "#34A0A4" },
+    },
+  },
+}
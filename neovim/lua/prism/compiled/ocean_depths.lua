@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Ocean Depths
+-- Auto-generated by sync_themes.py from vscode/themes/ocean_depths.json - DO NOT EDIT
+
+return {
+  name = "Ocean Depths",
+  mode = "dark",
+  palette = {
+    base00 = "#0a1018",
+    base01 = "#101820",
+    base02 = "#1e252e",
+    base03 = "#506070",
+    base04 = "#8d9eae",
+    base05 = "#d0e0f0",
+    base06 = "#e0f1ff",
+    base07 = "#f1ffff",
+    base08 = "#52c5bf",
+    base09 = "#80ece7",
+    base0A = "#61e8e1",
+    base0B = "#90eeea",
+    base0C = "#80ece7",
+    base0D = "#88ede8",
+    base0E = "#61e8e1",
+    base0F = "#506070",
+  },
+  terminal = {
+    "#0a1018", "#52c5bf", "#70eae4", "#737f8c",
+    "#61e8e1", "#48aea8", "#80ece7", "#d0e0f0",
+    "#506070", "#61e8e1", "#80ece7", "#d0e0f0",
+    "#78ebe5", "#57d0ca", "#90eeea", "#d4e3f1",
+  },
+  groups = {
+    Normal = { fg = "#d0e0f0", bg = "#0a1018" },
+    NormalFloat = { fg = "#d0e0f0", bg = "#101820" },
+    NormalNC = { fg = "#d0e0f0", bg = "#0a1018" },
+    Cursor = { fg = "#0a1018", bg = "#61e8e1" },
+    CursorLine = { bg = "#131a22" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#0f161e" },
+    LineNr = { fg = "#506070" },
+    CursorLineNr = { fg = "#d0e0f0", bold = true },
+    SignColumn = { fg = "#506070", bg = "#0a1018" },
+    VertSplit = { fg = "#1e252e" },
+    WinSeparator = { fg = "#1e252e" },
+    Folded = { fg = "#506070", bg = "#101820" },
+    FoldColumn = { fg = "#506070" },
+    NonText = { fg = "#506070" },
+    SpecialKey = { fg = "#506070" },
+    Whitespace = { fg = "#2d3844" },
+    MatchParen = { fg = "#61e8e1", bold = true },
+    Visual = { bg = "#245054" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#0a1018", bg = "#61e8e1" },
+    IncSearch = { fg = "#0a1018", bg = "#80ece7" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#0a1018", bg = "#52c5bf" },
+    Pmenu = { fg = "#d0e0f0", bg = "#101820" },
+    PmenuSel = { fg = "#d0e0f0", bg = "#1b3b40" },
+    PmenuSbar = { bg = "#1e252e" },
+    PmenuThumb = { bg = "#8d9eae" },
+    ErrorMsg = { fg = "#52c5bf" },
+    WarningMsg = { fg = "#80ece7" },
+    ModeMsg = { fg = "#d0e0f0", bold = true },
+    MoreMsg = { fg = "#88ede8" },
+    Question = { fg = "#88ede8" },
+    TabLine = { fg = "#8d9eae", bg = "#101820" },
+    TabLineFill = { bg = "#0a1018" },
+    TabLineSel = { fg = "#d0e0f0", bg = "#0a1018", bold = true },
+    StatusLine = { fg = "#d0e0f0", bg = "#101820" },
+    StatusLineNC = { fg = "#8d9eae", bg = "#101820" },
+    DiffAdd = { bg = "#1e3137" },
+    DiffChange = { bg = "#1b3137" },
+    DiffDelete = { fg = "#52c5bf", bg = "#142b31" },
+    DiffText = { bg = "#2d5256" },
+    SpellBad = { sp = "#52c5bf", undercurl = true },
+    SpellCap = { sp = "#80ece7", undercurl = true },
+    SpellLocal = { sp = "#88ede8", undercurl = true },
+    SpellRare = { sp = "#61e8e1", undercurl = true },
+    Comment = { fg = "#506070" },
+    Constant = { fg = "#80ece7" },
+    String = { fg = "#90eeea" },
+    Character = { fg = "#90eeea" },
+    Number = { fg = "#80ece7" },
+    Boolean = { fg = "#80ece7" },
+    Float = { fg = "#80ece7" },
+    Identifier = { fg = "#d0e0f0" },
+    Function = { fg = "#88ede8" },
+    Statement = { fg = "#61e8e1" },
+    Conditional = { fg = "#61e8e1" },
+    Repeat = { fg = "#61e8e1" },
+    Label = { fg = "#61e8e1" },
+    Operator = { fg = "#8d9eae" },
+    Keyword = { fg = "#61e8e1" },
+    Exception = { fg = "#61e8e1" },
+    PreProc = { fg = "#61e8e1" },
+    Include = { fg = "#61e8e1" },
+    Define = { fg = "#61e8e1" },
+    Macro = { fg = "#61e8e1" },
+    PreCondit = { fg = "#61e8e1" },
+    Type = { fg = "#d0e0f0" },
+    StorageClass = { fg = "#61e8e1" },
+    Structure = { fg = "#d0e0f0" },
+    Typedef = { fg = "#d0e0f0" },
+    Special = { fg = "#80ece7" },
+    SpecialChar = { fg = "#80ece7" },
+    Tag = { fg = "#90eeea" },
+    Delimiter = { fg = "#8d9eae" },
+    SpecialComment = { fg = "#506070", italic = true },
+    Debug = { fg = "#80ece7" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#506070" },
+    Error = { fg = "#52c5bf" },
+    Todo = { fg = "#0a1018", bg = "#61e8e1", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#d0e0f0" },
+      ["@variable.builtin"] = { fg = "#61e8e1" },
+      ["@variable.parameter"] = { fg = "#d0e0f0", italic = true },
+      ["@variable.member"] = { fg = "#d0e0f0" },
+      ["@constant"] = { fg = "#80ece7" },
+      ["@constant.builtin"] = { fg = "#80ece7" },
+      ["@module"] = { fg = "#d0e0f0" },
+      ["@label"] = { fg = "#61e8e1" },
+      ["@type"] = { fg = "#d0e0f0" },
+      ["@type.builtin"] = { fg = "#d0e0f0" },
+      ["@attribute"] = { fg = "#d2e1f0" },
+      ["@property"] = { fg = "#d0e0f0" },
+      ["@function"] = { fg = "#88ede8" },
+      ["@function.builtin"] = { fg = "#88ede8" },
+      ["@function.call"] = { fg = "#88ede8" },
+      ["@function.method"] = { fg = "#88ede8" },
+      ["@constructor"] = { fg = "#d0e0f0" },
+      ["@operator"] = { fg = "#8d9eae" },
+      ["@keyword"] = { fg = "#61e8e1" },
+      ["@keyword.conditional"] = { fg = "#61e8e1" },
+      ["@keyword.function"] = { fg = "#61e8e1" },
+      ["@keyword.operator"] = { fg = "#61e8e1" },
+      ["@keyword.return"] = { fg = "#61e8e1" },
+      ["@punctuation.bracket"] = { fg = "#8d9eae" },
+      ["@punctuation.delimiter"] = { fg = "#8d9eae" },
+      ["@punctuation.special"] = { fg = "#80ece7" },
+      ["@string"] = { fg = "#90eeea" },
+      ["@string.escape"] = { fg = "#80ece7" },
+      ["@string.regexp"] = { fg = "#80ece7" },
+      ["@character"] = { fg = "#90eeea" },
+      ["@boolean"] = { fg = "#80ece7" },
+      ["@number"] = { fg = "#80ece7" },
+      ["@comment"] = { fg = "#506070", italic = true },
+      ["@comment.todo"] = { fg = "#0a1018", bg = "#61e8e1", bold = true },
+      ["@comment.error"] = { fg = "#52c5bf", bold = true },
+      ["@comment.warning"] = { fg = "#80ece7", bold = true },
+      ["@comment.note"] = { fg = "#88ede8", bold = true },
+      ["@markup.heading"] = { fg = "#61e8e1", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#90eeea" },
+      ["@markup.link"] = { fg = "#88ede8", underline = true },
+      ["@tag"] = { fg = "#90eeea" },
+      ["@tag.attribute"] = { fg = "#d2e1f0" },
+      ["@tag.delimiter"] = { fg = "#8d9eae" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#52c5bf" },
+      DiagnosticWarn = { fg = "#80ece7" },
+      DiagnosticInfo = { fg = "#88ede8" },
+      DiagnosticHint = { fg = "#61e8e1" },
+      DiagnosticUnderlineError = { sp = "#52c5bf", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#80ece7", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#88ede8", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#61e8e1", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#52c5bf", bg = "#112228" },
+      DiagnosticVirtualTextWarn = { fg = "#80ece7", bg = "#15262c" },
+      DiagnosticVirtualTextInfo = { fg = "#88ede8", bg = "#16262c" },
+      DiagnosticVirtualTextHint = { fg = "#61e8e1", bg = "#12252c" },
+      LspReferenceText = { bg = "#1d242d" },
+      LspReferenceRead = { bg = "#1d242d" },
+      LspReferenceWrite = { bg = "#272f38" },
+      LspSignatureActiveParameter = { fg = "#61e8e1", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#90eeea" },
+      GitSignsChange = { fg = "#80ece7" },
+      GitSignsDelete = { fg = "#52c5bf" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#d0e0f0", bg = "#0a1018" },
+      TelescopeBorder = { fg = "#1e252e", bg = "#0a1018" },
+      TelescopePromptTitle = { fg = "#0a1018", bg = "#61e8e1", bold = true },
+      TelescopePreviewTitle = { fg = "#0a1018", bg = "#90eeea", bold = true },
+      TelescopeResultsTitle = { fg = "#0a1018", bg = "#88ede8", bold = true },
+      TelescopeSelection = { bg = "#1b3b40" },
+      TelescopeMatching = { fg = "#61e8e1", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#61e8e1", bold = true },
+      CmpItemKindVariable = { fg = "#d0e0f0" },
+      CmpItemKindFunction = { fg = "#88ede8" },
+      CmpItemKindKeyword = { fg = "#61e8e1" },
+      CmpItemKindClass = { fg = "#d0e0f0" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#1e252e" },
+      IblScope = { fg = "#506070" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#0a1018", bg = "#61e8e1", bold = true },
+      LazyButton = { fg = "#d0e0f0", bg = "#1e252e" },
+      LazyButtonActive = { fg = "#0a1018", bg = "#61e8e1" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#52c5bf" },
+      NotifyWARNBorder = { fg = "#80ece7" },
+      NotifyINFOBorder = { fg = "#88ede8" },
+      NotifyDEBUGBorder = { fg = "#506070" },
+      NotifyTRACEBorder = { fg = "#61e8e1" },
+    },
+  },
+}
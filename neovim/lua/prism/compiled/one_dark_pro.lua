@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: One Dark Pro
+-- Auto-generated by sync_themes.py from vscode/themes/one_dark_pro.json - DO NOT EDIT
+
+return {
+  name = "One Dark Pro",
+  mode = "dark",
+  palette = {
+    base00 = "#1e2127",
+    base01 = "#31353f",
+    base02 = "#34373e",
+    base03 = "#5c6370",
+    base04 = "#617eb7",
+    base05 = "#c678dd",
+    base06 = "#d688ee",
+    base07 = "#e797ff",
+    base08 = "#81a566",
+    base09 = "#d19a66",
+    base0A = "#98c379",
+    base0B = "#98c379",
+    base0C = "#accf93",
+    base0D = "#61afef",
+    base0E = "#c678dd",
+    base0F = "#e06c75",
+  },
+  terminal = {
+    "#282c34", "#81a566", "#a2c986", "#e68990",
+    "#98c379", "#72925a", "#accf93", "#c678dd",
+    "#e06c75", "#98c379", "#accf93", "#c678dd",
+    "#a7cc8d", "#88af6c", "#b6d5a1", "#cb85e0",
+  },
+  groups = {
+    Normal = { fg = "#c678dd", bg = "#1e2127" },
+    NormalFloat = { fg = "#c678dd", bg = "#31353f" },
+    NormalNC = { fg = "#c678dd", bg = "#1e2127" },
+    Cursor = { fg = "#1e2127", bg = "#98c379" },
+    CursorLine = { bg = "#262530" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#23232c" },
+    LineNr = { fg = "#5c6370" },
+    CursorLineNr = { fg = "#c678dd", bold = true },
+    SignColumn = { fg = "#5c6370", bg = "#1e2127" },
+    VertSplit = { fg = "#34373e" },
+    WinSeparator = { fg = "#34373e" },
+    Folded = { fg = "#5c6370", bg = "#31353f" },
+    FoldColumn = { fg = "#5c6370" },
+    NonText = { fg = "#5c6370" },
+    SpecialKey = { fg = "#5c6370" },
+    Whitespace = { fg = "#3d424b" },
+    MatchParen = { fg = "#98c379", bold = true },
+    Visual = { bg = "#42513f" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#1e2127", bg = "#98c379" },
+    IncSearch = { fg = "#1e2127", bg = "#d19a66" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#1e2127", bg = "#81a566" },
+    Pmenu = { fg = "#c678dd", bg = "#31353f" },
+    PmenuSel = { fg = "#c678dd", bg = "#364137" },
+    PmenuSbar = { bg = "#34373e" },
+    PmenuThumb = { bg = "#617eb7" },
+    ErrorMsg = { fg = "#81a566" },
+    WarningMsg = { fg = "#d19a66" },
+    ModeMsg = { fg = "#c678dd", bold = true },
+    MoreMsg = { fg = "#61afef" },
+    Question = { fg = "#61afef" },
+    TabLine = { fg = "#617eb7", bg = "#31353f" },
+    TabLineFill = { bg = "#1e2127" },
+    TabLineSel = { fg = "#c678dd", bg = "#1e2127", bold = true },
+    StatusLine = { fg = "#c678dd", bg = "#31353f" },
+    StatusLineNC = { fg = "#617eb7", bg = "#31353f" },
+    DiffAdd = { bg = "#303933" },
+    DiffChange = { bg = "#383330" },
+    DiffDelete = { fg = "#81a566", bg = "#2c3430" },
+    DiffText = { bg = "#534539" },
+    SpellBad = { sp = "#81a566", undercurl = true },
+    SpellCap = { sp = "#d19a66", undercurl = true },
+    SpellLocal = { sp = "#61afef", undercurl = true },
+    SpellRare = { sp = "#c678dd", undercurl = true },
+    Comment = { fg = "#5c6370" },
+    Constant = { fg = "#d19a66" },
+    String = { fg = "#98c379" },
+    Character = { fg = "#98c379" },
+    Number = { fg = "#d19a66" },
+    Boolean = { fg = "#d19a66" },
+    Float = { fg = "#d19a66" },
+    Identifier = { fg = "#e06c75" },
+    Function = { fg = "#61afef" },
+    Statement = { fg = "#c678dd" },
+    Conditional = { fg = "#c678dd" },
+    Repeat = { fg = "#c678dd" },
+    Label = { fg = "#c678dd" },
+    Operator = { fg = "#617eb7" },
+    Keyword = { fg = "#c678dd" },
+    Exception = { fg = "#c678dd" },
+    PreProc = { fg = "#c678dd" },
+    Include = { fg = "#c678dd" },
+    Define = { fg = "#c678dd" },
+    Macro = { fg = "#c678dd" },
+    PreCondit = { fg = "#c678dd" },
+    Type = { fg = "#e5c07b" },
+    StorageClass = { fg = "#c678dd" },
+    Structure = { fg = "#e5c07b" },
+    Typedef = { fg = "#e5c07b" },
+    Special = { fg = "#accf93" },
+    SpecialChar = { fg = "#accf93" },
+    Tag = { fg = "#e06c75" },
+    Delimiter = { fg = "#617eb7" },
+    SpecialComment = { fg = "#5c6370", italic = true },
+    Debug = { fg = "#d19a66" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#5c6370" },
+    Error = { fg = "#81a566" },
+    Todo = { fg = "#1e2127", bg = "#98c379", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#e06c75" },
+      ["@variable.builtin"] = { fg = "#c678dd" },
+      ["@variable.parameter"] = { fg = "#e06c75", italic = true },
+      ["@variable.member"] = { fg = "#e06c75" },
+      ["@constant"] = { fg = "#d19a66" },
+      ["@constant.builtin"] = { fg = "#d19a66" },
+      ["@module"] = { fg = "#c678dd" },
+      ["@label"] = { fg = "#c678dd" },
+      ["@type"] = { fg = "#e5c07b" },
+      ["@type.builtin"] = { fg = "#e5c07b" },
+      ["@attribute"] = { fg = "#d19a66" },
+      ["@property"] = { fg = "#e06c75" },
+      ["@function"] = { fg = "#61afef" },
+      ["@function.builtin"] = { fg = "#61afef" },
+      ["@function.call"] = { fg = "#61afef" },
+      ["@function.method"] = { fg = "#61afef" },
+      ["@constructor"] = { fg = "#e5c07b" },
+      ["@operator"] = { fg = "#617eb7" },
+      ["@keyword"] = { fg = "#c678dd" },
+      ["@keyword.conditional"] = { fg = "#c678dd" },
+      ["@keyword.function"] = { fg = "#c678dd" },
+      ["@keyword.operator"] = { fg = "#c678dd" },
+      ["@keyword.return"] = { fg = "#c678dd" },
+      ["@punctuation.bracket"] = { fg = "#617eb7" },
+      ["@punctuation.delimiter"] = { fg = "#617eb7" },
+      ["@punctuation.special"] = { fg = "#accf93" },
+      ["@string"] = { fg = "#98c379" },
+      ["@string.escape"] = { fg = "#accf93" },
+      ["@string.regexp"] = { fg = "#accf93" },
+      ["@character"] = { fg = "#98c379" },
+      ["@boolean"] = { fg = "#d19a66" },
+      ["@number"] = { fg = "#d19a66" },
+      ["@comment"] = { fg = "#5c6370", italic = true },
+      ["@comment.todo"] = { fg = "#1e2127", bg = "#98c379", bold = true },
+      ["@comment.error"] = { fg = "#81a566", bold = true },
+      ["@comment.warning"] = { fg = "#d19a66", bold = true },
+      ["@comment.note"] = { fg = "#61afef", bold = true },
+      ["@markup.heading"] = { fg = "#c678dd", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#98c379" },
+      ["@markup.link"] = { fg = "#61afef", underline = true },
+      ["@tag"] = { fg = "#e06c75" },
+      ["@tag.attribute"] = { fg = "#d19a66" },
+      ["@tag.delimiter"] = { fg = "#617eb7" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#81a566" },
+      DiagnosticWarn = { fg = "#d19a66" },
+      DiagnosticInfo = { fg = "#61afef" },
+      DiagnosticHint = { fg = "#98c379" },
+      DiagnosticUnderlineError = { sp = "#81a566", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#d19a66", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#61afef", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#98c379", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#81a566", bg = "#272e2d" },
+      DiagnosticVirtualTextWarn = { fg = "#d19a66", bg = "#2f2d2d" },
+      DiagnosticVirtualTextInfo = { fg = "#61afef", bg = "#242f3b" },
+      DiagnosticVirtualTextHint = { fg = "#98c379", bg = "#2a312f" },
+      LspReferenceText = { bg = "#2e2939" },
+      LspReferenceRead = { bg = "#2e2939" },
+      LspReferenceWrite = { bg = "#372e42" },
+      LspSignatureActiveParameter = { fg = "#98c379", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#98c379" },
+      GitSignsChange = { fg = "#d19a66" },
+      GitSignsDelete = { fg = "#81a566" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#c678dd", bg = "#1e2127" },
+      TelescopeBorder = { fg = "#34373e", bg = "#1e2127" },
+      TelescopePromptTitle = { fg = "#1e2127", bg = "#98c379", bold = true },
+      TelescopePreviewTitle = { fg = "#1e2127", bg = "#98c379", bold = true },
+      TelescopeResultsTitle = { fg = "#1e2127", bg = "#61afef", bold = true },
+      TelescopeSelection = { bg = "#364137" },
+      TelescopeMatching = { fg = "#98c379", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#98c379", bold = true },
+      CmpItemKindVariable = { fg = "#e06c75" },
+      CmpItemKindFunction = { fg = "#61afef" },
+      CmpItemKindKeyword = { fg = "#c678dd" },
+      CmpItemKindClass = { fg = "#e5c07b" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#34373e" },
+      IblScope = { fg = "#5c6370" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#1e2127", bg = "#98c379", bold = true },
+      LazyButton = { fg = "#c678dd", bg = "#34373e" },
+      LazyButtonActive = { fg = "#1e2127", bg = "#98c379" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#81a566" },
+      NotifyWARNBorder = { fg = "#d19a66" },
+      NotifyINFOBorder = { fg = "#61afef" },
+      NotifyDEBUGBorder = { fg = "#5c6370" },
+      NotifyTRACEBorder = { fg = "#c678dd" },
+    },
+  },
+}
@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Palenight
+-- Auto-generated by sync_themes.py from vscode/themes/palenight.json - DO NOT EDIT
+
+return {
+  name = "Palenight",
+  mode = "dark",
+  palette = {
+    base00 = "#1b1e2b",
+    base01 = "#21243a",
+    base02 = "#313442",
+    base03 = "#676e95",
+    base04 = "#868db1",
+    base05 = "#a6accd",
+    base06 = "#b6bcdd",
+    base07 = "#c6ccee",
+    base08 = "#a97cc6",
+    base09 = "#f78c6c",
+    base0A = "#c792ea",
+    base0B = "#c3e88d",
+    base0C = "#d2a7ee",
+    base0D = "#82aaff",
+    base0E = "#c792ea",
+    base0F = "#676e95",
+  },
+  terminal = {
+    "#1b1e2b", "#a97cc6", "#cc9cec", "#858baa",
+    "#c792ea", "#956daf", "#d2a7ee", "#a6accd",
+    "#676e95", "#c792ea", "#d2a7ee", "#a6accd",
+    "#cfa2ed", "#b383d2", "#d7b2f0", "#aeb4d2",
+  },
+  groups = {
+    Normal = { fg = "#a6accd", bg = "#1b1e2b" },
+    NormalFloat = { fg = "#a6accd", bg = "#21243a" },
+    NormalNC = { fg = "#a6accd", bg = "#1b1e2b" },
+    Cursor = { fg = "#1b1e2b", bg = "#c792ea" },
+    CursorLine = { bg = "#212533" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#1f222f" },
+    LineNr = { fg = "#676e95" },
+    CursorLineNr = { fg = "#a6accd", bold = true },
+    SignColumn = { fg = "#676e95", bg = "#1b1e2b" },
+    VertSplit = { fg = "#313442" },
+    WinSeparator = { fg = "#313442" },
+    Folded = { fg = "#676e95", bg = "#21243a" },
+    FoldColumn = { fg = "#676e95" },
+    NonText = { fg = "#676e95" },
+    SpecialKey = { fg = "#676e95" },
+    Whitespace = { fg = "#414660" },
+    MatchParen = { fg = "#c792ea", bold = true },
+    Visual = { bg = "#4e4064" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#1b1e2b", bg = "#c792ea" },
+    IncSearch = { fg = "#1b1e2b", bg = "#f78c6c" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#1b1e2b", bg = "#a97cc6" },
+    Pmenu = { fg = "#a6accd", bg = "#21243a" },
+    PmenuSel = { fg = "#a6accd", bg = "#3d3551" },
+    PmenuSbar = { bg = "#313442" },
+    PmenuThumb = { bg = "#868db1" },
+    ErrorMsg = { fg = "#a97cc6" },
+    WarningMsg = { fg = "#f78c6c" },
+    ModeMsg = { fg = "#a6accd", bold = true },
+    MoreMsg = { fg = "#82aaff" },
+    Question = { fg = "#82aaff" },
+    TabLine = { fg = "#868db1", bg = "#21243a" },
+    TabLineFill = { bg = "#1b1e2b" },
+    TabLineSel = { fg = "#a6accd", bg = "#1b1e2b", bold = true },
+    StatusLine = { fg = "#a6accd", bg = "#21243a" },
+    StatusLineNC = { fg = "#868db1", bg = "#21243a" },
+    DiffAdd = { bg = "#343c39" },
+    DiffChange = { bg = "#3c2e34" },
+    DiffDelete = { fg = "#a97cc6", bg = "#302c42" },
+    DiffText = { bg = "#5d3f3e" },
+    SpellBad = { sp = "#a97cc6", undercurl = true },
+    SpellCap = { sp = "#f78c6c", undercurl = true },
+    SpellLocal = { sp = "#82aaff", undercurl = true },
+    SpellRare = { sp = "#c792ea", undercurl = true },
+    Comment = { fg = "#676e95" },
+    Constant = { fg = "#f78c6c" },
+    String = { fg = "#c3e88d" },
+    Character = { fg = "#c3e88d" },
+    Number = { fg = "#f78c6c" },
+    Boolean = { fg = "#f78c6c" },
+    Float = { fg = "#f78c6c" },
+    Identifier = { fg = "#f0e8ff" },
+    Function = { fg = "#82aaff" },
+    Statement = { fg = "#c792ea" },
+    Conditional = { fg = "#c792ea" },
+    Repeat = { fg = "#c792ea" },
+    Label = { fg = "#c792ea" },
+    Operator = { fg = "#868db1" },
+    Keyword = { fg = "#c792ea" },
+    Exception = { fg = "#c792ea" },
+    PreProc = { fg = "#c792ea" },
+    Include = { fg = "#c792ea" },
+    Define = { fg = "#c792ea" },
+    Macro = { fg = "#c792ea" },
+    PreCondit = { fg = "#c792ea" },
+    Type = { fg = "#ffcb6b" },
+    StorageClass = { fg = "#c792ea" },
+    Structure = { fg = "#ffcb6b" },
+    Typedef = { fg = "#ffcb6b" },
+    Special = { fg = "#d2a7ee" },
+    SpecialChar = { fg = "#d2a7ee" },
+    Tag = { fg = "#c3e88d" },
+    Delimiter = { fg = "#868db1" },
+    SpecialComment = { fg = "#676e95", italic = true },
+    Debug = { fg = "#f78c6c" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#676e95" },
+    Error = { fg = "#a97cc6" },
+    Todo = { fg = "#1b1e2b", bg = "#c792ea", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#f0e8ff" },
+      ["@variable.builtin"] = { fg = "#c792ea" },
+      ["@variable.parameter"] = { fg = "#f0e8ff", italic = true },
+      ["@variable.member"] = { fg = "#f0e8ff" },
+      ["@constant"] = { fg = "#f78c6c" },
+      ["@constant.builtin"] = { fg = "#f78c6c" },
+      ["@module"] = { fg = "#a6accd" },
+      ["@label"] = { fg = "#c792ea" },
+      ["@type"] = { fg = "#ffcb6b" },
+      ["@type.builtin"] = { fg = "#ffcb6b" },
+      ["@attribute"] = { fg = "#cfa2ed" },
+      ["@property"] = { fg = "#f0e8ff" },
+      ["@function"] = { fg = "#82aaff" },
+      ["@function.builtin"] = { fg = "#82aaff" },
+      ["@function.call"] = { fg = "#82aaff" },
+      ["@function.method"] = { fg = "#82aaff" },
+      ["@constructor"] = { fg = "#ffcb6b" },
+      ["@operator"] = { fg = "#868db1" },
+      ["@keyword"] = { fg = "#c792ea" },
+      ["@keyword.conditional"] = { fg = "#c792ea" },
+      ["@keyword.function"] = { fg = "#c792ea" },
+      ["@keyword.operator"] = { fg = "#c792ea" },
+      ["@keyword.return"] = { fg = "#c792ea" },
+      ["@punctuation.bracket"] = { fg = "#868db1" },
+      ["@punctuation.delimiter"] = { fg = "#868db1" },
+      ["@punctuation.special"] = { fg = "#d2a7ee" },
+      ["@string"] = { fg = "#c3e88d" },
+      ["@string.escape"] = { fg = "#d2a7ee" },
+      ["@string.regexp"] = { fg = "#d2a7ee" },
+      ["@character"] = { fg = "#c3e88d" },
+      ["@boolean"] = { fg = "#f78c6c" },
+      ["@number"] = { fg = "#f78c6c" },
+      ["@comment"] = { fg = "#676e95", italic = true },
+      ["@comment.todo"] = { fg = "#1b1e2b", bg = "#c792ea", bold = true },
+      ["@comment.error"] = { fg = "#a97cc6", bold = true },
+      ["@comment.warning"] = { fg = "#f78c6c", bold = true },
+      ["@comment.note"] = { fg = "#82aaff", bold = true },
+      ["@markup.heading"] = { fg = "#c792ea", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#c3e88d" },
+      ["@markup.link"] = { fg = "#82aaff", underline = true },
+      ["@tag"] = { fg = "#c3e88d" },
+      ["@tag.attribute"] = { fg = "#cfa2ed" },
+      ["@tag.delimiter"] = { fg = "#868db1" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#a97cc6" },
+      DiagnosticWarn = { fg = "#f78c6c" },
+      DiagnosticInfo = { fg = "#82aaff" },
+      DiagnosticHint = { fg = "#c792ea" },
+      DiagnosticUnderlineError = { sp = "#a97cc6", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#f78c6c", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#82aaff", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#c792ea", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#a97cc6", bg = "#29273a" },
+      DiagnosticVirtualTextWarn = { fg = "#f78c6c", bg = "#312931" },
+      DiagnosticVirtualTextInfo = { fg = "#82aaff", bg = "#252c40" },
+      DiagnosticVirtualTextHint = { fg = "#c792ea", bg = "#2c293e" },
+      LspReferenceText = { bg = "#282c3b" },
+      LspReferenceRead = { bg = "#282c3b" },
+      LspReferenceWrite = { bg = "#2f3343" },
+      LspSignatureActiveParameter = { fg = "#c792ea", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#c3e88d" },
+      GitSignsChange = { fg = "#f78c6c" },
+      GitSignsDelete = { fg = "#a97cc6" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#a6accd", bg = "#1b1e2b" },
+      TelescopeBorder = { fg = "#313442", bg = "#1b1e2b" },
+      TelescopePromptTitle = { fg = "#1b1e2b", bg = "#c792ea", bold = true },
+      TelescopePreviewTitle = { fg = "#1b1e2b", bg = "#c3e88d", bold = true },
+      TelescopeResultsTitle = { fg = "#1b1e2b", bg = "#82aaff", bold = true },
+      TelescopeSelection = { bg = "#3d3551" },
+      TelescopeMatching = { fg = "#c792ea", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#c792ea", bold = true },
+      CmpItemKindVariable = { fg = "#f0e8ff" },
+      CmpItemKindFunction = { fg = "#82aaff" },
+      CmpItemKindKeyword = { fg = "#c792ea" },
+      CmpItemKindClass = { fg = "#ffcb6b" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#313442" },
+      IblScope = { fg = "#676e95" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#1b1e2b", bg = "#c792ea", bold = true },
+      LazyButton = { fg = "#a6accd", bg = "#313442" },
+      LazyButtonActive = { fg = "#1b1e2b", bg = "#c792ea" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#a97cc6" },
+      NotifyWARNBorder = { fg = "#f78c6c" },
+      NotifyINFOBorder = { fg = "#82aaff" },
+      NotifyDEBUGBorder = { fg = "#676e95" },
+      NotifyTRACEBorder = { fg = "#c792ea" },
+    },
+  },
+}
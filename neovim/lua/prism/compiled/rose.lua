@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Rose
+-- Auto-generated by sync_themes.py from vscode/themes/rose.json - DO NOT EDIT
+
+return {
+  name = "Rose",
+  mode = "dark",
+  palette = {
+    base00 = "#140006",
+    base01 = "#200009",
+    base02 = "#2b0e19",
+    base03 = "#FF7096",
+    base04 = "#ffabbd",
+    base05 = "#fae0e4",
+    base06 = "#fff1f5",
+    base07 = "#fff8fc",
+    base08 = "#d88292",
+    base09 = "#ffadbc",
+    base0A = "#FF99AC",
+    base0B = "#ffb7c4",
+    base0C = "#ffadbc",
+    base0D = "#ffb2c0",
+    base0E = "#FF99AC",
+    base0F = "#FF7096",
+  },
+  terminal = {
+    "#140006", "#d88292", "#ffa3b4", "#ff8cab",
+    "#FF99AC", "#bf7281", "#ffadbc", "#FAE0E4",
+    "#FF7096", "#FF99AC", "#ffadbc", "#FAE0E4",
+    "#ffa8b8", "#e5899a", "#ffb7c4", "#fae3e6",
+  },
+  groups = {
+    Normal = { fg = "#fae0e4", bg = "#140006" },
+    NormalFloat = { fg = "#fae0e4", bg = "#200009" },
+    NormalNC = { fg = "#fae0e4", bg = "#140006" },
+    Cursor = { fg = "#140006", bg = "#FF99AC" },
+    CursorLine = { bg = "#1f0b11" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#1a060c" },
+    LineNr = { fg = "#FF7096" },
+    CursorLineNr = { fg = "#fae0e4", bold = true },
+    SignColumn = { fg = "#FF7096", bg = "#140006" },
+    VertSplit = { fg = "#2b0e19" },
+    WinSeparator = { fg = "#2b0e19" },
+    Folded = { fg = "#FF7096", bg = "#200009" },
+    FoldColumn = { fg = "#FF7096" },
+    NonText = { fg = "#FF7096" },
+    SpecialKey = { fg = "#FF7096" },
+    Whitespace = { fg = "#89384e" },
+    MatchParen = { fg = "#FF99AC", bold = true },
+    Visual = { bg = "#5a2d37" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#140006", bg = "#FF99AC" },
+    IncSearch = { fg = "#140006", bg = "#ffadbc" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#140006", bg = "#d88292" },
+    Pmenu = { fg = "#fae0e4", bg = "#200009" },
+    PmenuSel = { fg = "#fae0e4", bg = "#431e27" },
+    PmenuSbar = { bg = "#2b0e19" },
+    PmenuThumb = { bg = "#ffabbd" },
+    ErrorMsg = { fg = "#d88292" },
+    WarningMsg = { fg = "#ffadbc" },
+    ModeMsg = { fg = "#fae0e4", bold = true },
+    MoreMsg = { fg = "#ffb2c0" },
+    Question = { fg = "#ffb2c0" },
+    TabLine = { fg = "#ffabbd", bg = "#200009" },
+    TabLineFill = { bg = "#140006" },
+    TabLineSel = { fg = "#fae0e4", bg = "#140006", bold = true },
+    StatusLine = { fg = "#fae0e4", bg = "#200009" },
+    StatusLineNC = { fg = "#ffabbd", bg = "#200009" },
+    DiffAdd = { bg = "#371b22" },
+    DiffChange = { bg = "#371921" },
+    DiffDelete = { fg = "#d88292", bg = "#31131b" },
+    DiffText = { bg = "#5a333c" },
+    SpellBad = { sp = "#d88292", undercurl = true },
+    SpellCap = { sp = "#ffadbc", undercurl = true },
+    SpellLocal = { sp = "#ffb2c0", undercurl = true },
+    SpellRare = { sp = "#FF99AC", undercurl = true },
+    Comment = { fg = "#FF7096" },
+    Constant = { fg = "#ffadbc" },
+    String = { fg = "#ffb7c4" },
+    Character = { fg = "#ffb7c4" },
+    Number = { fg = "#ffadbc" },
+    Boolean = { fg = "#ffadbc" },
+    Float = { fg = "#ffadbc" },
+    Identifier = { fg = "#FAE0E4" },
+    Function = { fg = "#ffb2c0" },
+    Statement = { fg = "#FF99AC" },
+    Conditional = { fg = "#FF99AC" },
+    Repeat = { fg = "#FF99AC" },
+    Label = { fg = "#FF99AC" },
+    Operator = { fg = "#ffabbd" },
+    Keyword = { fg = "#FF99AC" },
+    Exception = { fg = "#FF99AC" },
+    PreProc = { fg = "#FF99AC" },
+    Include = { fg = "#FF99AC" },
+    Define = { fg = "#FF99AC" },
+    Macro = { fg = "#FF99AC" },
+    PreCondit = { fg = "#FF99AC" },
+    Type = { fg = "#FAE0E4" },
+    StorageClass = { fg = "#FF99AC" },
+    Structure = { fg = "#FAE0E4" },
+    Typedef = { fg = "#FAE0E4" },
+    Special = { fg = "#ffadbc" },
+    SpecialChar = { fg = "#ffadbc" },
+    Tag = { fg = "#ffb7c4" },
+    Delimiter = { fg = "#ffabbd" },
+    SpecialComment = { fg = "#FF7096", italic = true },
+    Debug = { fg = "#ffadbc" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#FF7096" },
+    Error = { fg = "#d88292" },
+    Todo = { fg = "#140006", bg = "#FF99AC", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#FAE0E4" },
+      ["@variable.builtin"] = { fg = "#FF99AC" },
+      ["@variable.parameter"] = { fg = "#FAE0E4", italic = true },
+      ["@variable.member"] = { fg = "#FAE0E4" },
+      ["@constant"] = { fg = "#ffadbc" },
+      ["@constant.builtin"] = { fg = "#ffadbc" },
+      ["@module"] = { fg = "#fae0e4" },
+      ["@label"] = { fg = "#FF99AC" },
+      ["@type"] = { fg = "#FAE0E4" },
+      ["@type.builtin"] = { fg = "#FAE0E4" },
+      ["@attribute"] = { fg = "#fae1e5" },
+      ["@property"] = { fg = "#FAE0E4" },
+      ["@function"] = { fg = "#ffb2c0" },
+      ["@function.builtin"] = { fg = "#ffb2c0" },
+      ["@function.call"] = { fg = "#ffb2c0" },
+      ["@function.method"] = { fg = "#ffb2c0" },
+      ["@constructor"] = { fg = "#FAE0E4" },
+      ["@operator"] = { fg = "#ffabbd" },
+      ["@keyword"] = { fg = "#FF99AC" },
+      ["@keyword.conditional"] = { fg = "#FF99AC" },
+      ["@keyword.function"] = { fg = "#FF99AC" },
+      ["@keyword.operator"] = { fg = "#FF99AC" },
+      ["@keyword.return"] = { fg = "#FF99AC" },
+      ["@punctuation.bracket"] = { fg = "#ffabbd" },
+      ["@punctuation.delimiter"] = { fg = "#ffabbd" },
+      ["@punctuation.special"] = { fg = "#ffadbc" },
+      ["@string"] = { fg = "#ffb7c4" },
+      ["@string.escape"] = { fg = "#ffadbc" },
+      ["@string.regexp"] = { fg = "#ffadbc" },
+      ["@character"] = { fg = "#ffb7c4" },
+      ["@boolean"] = { fg = "#ffadbc" },
+      ["@number"] = { fg = "#ffadbc" },
+      ["@comment"] = { fg = "#FF7096", italic = true },
+      ["@comment.todo"] = { fg = "#140006", bg = "#FF99AC", bold = true },
+      ["@comment.error"] = { fg = "#d88292", bold = true },
+      ["@comment.warning"] = { fg = "#ffadbc", bold = true },
+      ["@comment.note"] = { fg = "#ffb2c0", bold = true },
+      ["@markup.heading"] = { fg = "#FF99AC", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#ffb7c4" },
+      ["@markup.link"] = { fg = "#ffb2c0", underline = true },
+      ["@tag"] = { fg = "#ffb7c4" },
+      ["@tag.attribute"] = { fg = "#fae1e5" },
+      ["@tag.delimiter"] = { fg = "#ffabbd" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#d88292" },
+      DiagnosticWarn = { fg = "#ffadbc" },
+      DiagnosticInfo = { fg = "#ffb2c0" },
+      DiagnosticHint = { fg = "#FF99AC" },
+      DiagnosticUnderlineError = { sp = "#d88292", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#ffadbc", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#ffb2c0", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#FF99AC", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#d88292", bg = "#270d14" },
+      DiagnosticVirtualTextWarn = { fg = "#ffadbc", bg = "#2b1118" },
+      DiagnosticVirtualTextInfo = { fg = "#ffb2c0", bg = "#2b1118" },
+      DiagnosticVirtualTextHint = { fg = "#FF99AC", bg = "#2b0f16" },
+      LspReferenceText = { bg = "#2b161c" },
+      LspReferenceRead = { bg = "#2b161c" },
+      LspReferenceWrite = { bg = "#362127" },
+      LspSignatureActiveParameter = { fg = "#FF99AC", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#ffb7c4" },
+      GitSignsChange = { fg = "#ffadbc" },
+      GitSignsDelete = { fg = "#d88292" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#fae0e4", bg = "#140006" },
+      TelescopeBorder = { fg = "#2b0e19", bg = "#140006" },
+      TelescopePromptTitle = { fg = "#140006", bg = "#FF99AC", bold = true },
+      TelescopePreviewTitle = { fg = "#140006", bg = "#ffb7c4", bold = true },
+      TelescopeResultsTitle = { fg = "#140006", bg = "#ffb2c0", bold = true },
+      TelescopeSelection = { bg = "#431e27" },
+      TelescopeMatching = { fg = "#FF99AC", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#FF99AC", bold = true },
+      CmpItemKindVariable = { fg = "#FAE0E4" },
+      CmpItemKindFunction = { fg = "#ffb2c0" },
+      CmpItemKindKeyword = { fg = "#FF99AC" },
+      CmpItemKindClass = { fg = "#FAE0E4" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#2b0e19" },
+      IblScope = { fg = "#FF7096" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#140006", bg = "#FF99AC", bold = true },
+      LazyButton = { fg = "#fae0e4", bg = "#2b0e19" },
+      LazyButtonActive = { fg = "#140006", bg = "#FF99AC" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#d88292" },
+      NotifyWARNBorder = { fg = "#ffadbc" },
+      NotifyINFOBorder = { fg = "#ffb2c0" },
+      NotifyDEBUGBorder = { fg = "#FF7096" },
+      NotifyTRACEBorder = { fg = "#FF99AC" },
+    },
+  },
+}
@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Rose Gold
+-- Auto-generated by sync_themes.py from vscode/themes/rose_gold.json - DO NOT EDIT
+
+return {
+  name = "Rose Gold",
+  mode = "dark",
+  palette = {
+    base00 = "#8a2d4f",
+    base01 = "#8f3052",
+    base02 = "#a84868",
+    base03 = "#a89090",
+    base04 = "#d4b1b1",
+    base05 = "#f7dcbc",
+    base06 = "#ffedcc",
+    base07 = "#fffada",
+    base08 = "#d88d91",
+    base09 = "#f0c0a0",
+    base0A = "#ffa6ab",
+    base0B = "#ffeedd",
+    base0C = "#ffb7bb",
+    base0D = "#ffffff",
+    base0E = "#ffa6ab",
+    base0F = "#da627a",
+  },
+  terminal = {
+    "#a5385f", "#d88d91", "#ffaeb3", "#e18194",
+    "#ffa6ab", "#bf7c80", "#ffb7bb", "#f7dcbc",
+    "#da627a", "#ffa6ab", "#ffb7bb", "#f7dcbc",
+    "#ffb3b7", "#e59599", "#ffc0c4", "#f7dfc2",
+  },
+  groups = {
+    Normal = { fg = "#f7dcbc", bg = "#8a2d4f" },
+    NormalFloat = { fg = "#f7dcbc", bg = "#8f3052" },
+    NormalNC = { fg = "#f7dcbc", bg = "#8a2d4f" },
+    Cursor = { fg = "#8a2d4f", bg = "#ffa6ab" },
+    CursorLine = { bg = "#8f3554" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#8d3252" },
+    LineNr = { fg = "#a89090" },
+    CursorLineNr = { fg = "#f7dcbc", bold = true },
+    SignColumn = { fg = "#a89090", bg = "#8a2d4f" },
+    VertSplit = { fg = "#a84868" },
+    WinSeparator = { fg = "#a84868" },
+    Folded = { fg = "#a89090", bg = "#8f3052" },
+    FoldColumn = { fg = "#a89090" },
+    NonText = { fg = "#a89090" },
+    SpecialKey = { fg = "#a89090" },
+    Whitespace = { fg = "#995e6f" },
+    MatchParen = { fg = "#ffa6ab", bold = true },
+    Visual = { bg = "#ad516a" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#8a2d4f", bg = "#ffa6ab" },
+    IncSearch = { fg = "#8a2d4f", bg = "#f0c0a0" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#8a2d4f", bg = "#d88d91" },
+    Pmenu = { fg = "#f7dcbc", bg = "#8f3052" },
+    PmenuSel = { fg = "#f7dcbc", bg = "#a14561" },
+    PmenuSbar = { bg = "#a84868" },
+    PmenuThumb = { bg = "#d4b1b1" },
+    ErrorMsg = { fg = "#d88d91" },
+    WarningMsg = { fg = "#f0c0a0" },
+    ModeMsg = { fg = "#f7dcbc", bold = true },
+    MoreMsg = { fg = "#ffffff" },
+    Question = { fg = "#ffffff" },
+    TabLine = { fg = "#d4b1b1", bg = "#8f3052" },
+    TabLineFill = { bg = "#8a2d4f" },
+    TabLineSel = { fg = "#f7dcbc", bg = "#8a2d4f", bold = true },
+    StatusLine = { fg = "#f7dcbc", bg = "#8f3052" },
+    StatusLineNC = { fg = "#d4b1b1", bg = "#8f3052" },
+    DiffAdd = { bg = "#9b4964" },
+    DiffChange = { bg = "#99435b" },
+    DiffDelete = { fg = "#d88d91", bg = "#953b58" },
+    DiffText = { bg = "#a85967" },
+    SpellBad = { sp = "#d88d91", undercurl = true },
+    SpellCap = { sp = "#f0c0a0", undercurl = true },
+    SpellLocal = { sp = "#ffffff", undercurl = true },
+    SpellRare = { sp = "#ffa6ab", undercurl = true },
+    Comment = { fg = "#a89090" },
+    Constant = { fg = "#f0c0a0" },
+    String = { fg = "#ffeedd" },
+    Character = { fg = "#ffeedd" },
+    Number = { fg = "#f0c0a0" },
+    Boolean = { fg = "#f0c0a0" },
+    Float = { fg = "#f0c0a0" },
+    Identifier = { fg = "#fff8f0" },
+    Function = { fg = "#ffffff" },
+    Statement = { fg = "#ffa6ab" },
+    Conditional = { fg = "#ffa6ab" },
+    Repeat = { fg = "#ffa6ab" },
+    Label = { fg = "#ffa6ab" },
+    Operator = { fg = "#d4b1b1" },
+    Keyword = { fg = "#ffa6ab" },
+    Exception = { fg = "#ffa6ab" },
+    PreProc = { fg = "#ffa6ab" },
+    Include = { fg = "#ffa6ab" },
+    Define = { fg = "#ffa6ab" },
+    Macro = { fg = "#ffa6ab" },
+    PreCondit = { fg = "#ffa6ab" },
+    Type = { fg = "#d08088" },
+    StorageClass = { fg = "#ffa6ab" },
+    Structure = { fg = "#d08088" },
+    Typedef = { fg = "#d08088" },
+    Special = { fg = "#ffb7bb" },
+    SpecialChar = { fg = "#ffb7bb" },
+    Tag = { fg = "#ffeedd" },
+    Delimiter = { fg = "#d4b1b1" },
+    SpecialComment = { fg = "#a89090", italic = true },
+    Debug = { fg = "#f0c0a0" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#a89090" },
+    Error = { fg = "#d88d91" },
+    Todo = { fg = "#8a2d4f", bg = "#ffa6ab", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#fff8f0" },
+      ["@variable.builtin"] = { fg = "#ffa6ab" },
+      ["@variable.parameter"] = { fg = "#fff8f0", italic = true },
+      ["@variable.member"] = { fg = "#fff8f0" },
+      ["@constant"] = { fg = "#f0c0a0" },
+      ["@constant.builtin"] = { fg = "#f0c0a0" },
+      ["@module"] = { fg = "#f7dcbc" },
+      ["@label"] = { fg = "#ffa6ab" },
+      ["@type"] = { fg = "#d08088" },
+      ["@type.builtin"] = { fg = "#d08088" },
+      ["@attribute"] = { fg = "#ffb3b7" },
+      ["@property"] = { fg = "#fff8f0" },
+      ["@function"] = { fg = "#ffffff" },
+      ["@function.builtin"] = { fg = "#ffffff" },
+      ["@function.call"] = { fg = "#ffffff" },
+      ["@function.method"] = { fg = "#ffffff" },
+      ["@constructor"] = { fg = "#d08088" },
+      ["@operator"] = { fg = "#d4b1b1" },
+      ["@keyword"] = { fg = "#ffa6ab" },
+      ["@keyword.conditional"] = { fg = "#ffa6ab" },
+      ["@keyword.function"] = { fg = "#ffa6ab" },
+      ["@keyword.operator"] = { fg = "#ffa6ab" },
+      ["@keyword.return"] = { fg = "#ffa6ab" },
+      ["@punctuation.bracket"] = { fg = "#d4b1b1" },
+      ["@punctuation.delimiter"] = { fg = "#d4b1b1" },
+      ["@punctuation.special"] = { fg = "#ffb7bb" },
+      ["@string"] = { fg = "#ffeedd" },
+      ["@string.escape"] = { fg = "#ffb7bb" },
+      ["@string.regexp"] = { fg = "#ffb7bb" },
+      ["@character"] = { fg = "#ffeedd" },
+      ["@boolean"] = { fg = "#f0c0a0" },
+      ["@number"] = { fg = "#f0c0a0" },
+      ["@comment"] = { fg = "#a89090", italic = true },
+      ["@comment.todo"] = { fg = "#8a2d4f", bg = "#ffa6ab", bold = true },
+      ["@comment.error"] = { fg = "#d88d91", bold = true },
+      ["@comment.warning"] = { fg = "#f0c0a0", bold = true },
+      ["@comment.note"] = { fg = "#ffffff", bold = true },
+      ["@markup.heading"] = { fg = "#ffa6ab", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#ffeedd" },
+      ["@markup.link"] = { fg = "#ffffff", underline = true },
+      ["@tag"] = { fg = "#ffeedd" },
+      ["@tag.attribute"] = { fg = "#ffb3b7" },
+      ["@tag.delimiter"] = { fg = "#d4b1b1" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#d88d91" },
+      DiagnosticWarn = { fg = "#f0c0a0" },
+      DiagnosticInfo = { fg = "#ffffff" },
+      DiagnosticHint = { fg = "#ffa6ab" },
+      DiagnosticUnderlineError = { sp = "#d88d91", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#f0c0a0", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#ffffff", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#ffa6ab", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#d88d91", bg = "#913655" },
+      DiagnosticVirtualTextWarn = { fg = "#f0c0a0", bg = "#943b57" },
+      DiagnosticVirtualTextInfo = { fg = "#ffffff", bg = "#954260" },
+      DiagnosticVirtualTextHint = { fg = "#ffa6ab", bg = "#953958" },
+      LspReferenceText = { bg = "#943e59" },
+      LspReferenceRead = { bg = "#943e59" },
+      LspReferenceWrite = { bg = "#9a475f" },
+      LspSignatureActiveParameter = { fg = "#ffa6ab", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#ffeedd" },
+      GitSignsChange = { fg = "#f0c0a0" },
+      GitSignsDelete = { fg = "#d88d91" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#f7dcbc", bg = "#8a2d4f" },
+      TelescopeBorder = { fg = "#a84868", bg = "#8a2d4f" },
+      TelescopePromptTitle = { fg = "#8a2d4f", bg = "#ffa6ab", bold = true },
+      TelescopePreviewTitle = { fg = "#8a2d4f", bg = "#ffeedd", bold = true },
+      TelescopeResultsTitle = { fg = "#8a2d4f", bg = "#ffffff", bold = true },
+      TelescopeSelection = { bg = "#a14561" },
+      TelescopeMatching = { fg = "#ffa6ab", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#ffa6ab", bold = true },
+      CmpItemKindVariable = { fg = "#fff8f0" },
+      CmpItemKindFunction = { fg = "#ffffff" },
+      CmpItemKindKeyword = { fg = "#ffa6ab" },
+      CmpItemKindClass = { fg = "#d08088" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#a84868" },
+      IblScope = { fg = "#a89090" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#8a2d4f", bg = "#ffa6ab", bold = true },
+      LazyButton = { fg = "#f7dcbc", bg = "#a84868" },
+      LazyButtonActive = { fg = "#8a2d4f", bg = "#ffa6ab" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#d88d91" },
+      NotifyWARNBorder = { fg = "#f0c0a0" },
+      NotifyINFOBorder = { fg = "#ffffff" },
+      NotifyDEBUGBorder = { fg = "#a89090" },
+      NotifyTRACEBorder = { fg = "#ffa6ab" },
+    },
+  },
+}
@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Slate & Gold
+-- Auto-generated by sync_themes.py from vscode/themes/slate_and_gold.json - DO NOT EDIT
+
+return {
+  name = "Slate & Gold",
+  mode = "dark",
+  palette = {
+    base00 = "#12141a",
+    base01 = "#181a20",
+    base02 = "#272930",
+    base03 = "#606878",
+    base04 = "#99a0ae",
+    base05 = "#d8dce8",
+    base06 = "#e8ecf9",
+    base07 = "#f9fdff",
+    base08 = "#d8b600",
+    base09 = "#ffdf33",
+    base0A = "#ffd700",
+    base0B = "#ffe34c",
+    base0C = "#ffdf33",
+    base0D = "#ffe13f",
+    base0E = "#ffd700",
+    base0F = "#606878",
+  },
+  terminal = {
+    "#12141a", "#d8b600", "#ffdb19", "#7f8693",
+    "#ffd700", "#bfa100", "#ffdf33", "#d8dce8",
+    "#606878", "#ffd700", "#ffdf33", "#d8dce8",
+    "#ffdd26", "#e5c100", "#ffe34c", "#dbdfea",
+  },
+  groups = {
+    Normal = { fg = "#d8dce8", bg = "#12141a" },
+    NormalFloat = { fg = "#d8dce8", bg = "#181a20" },
+    NormalNC = { fg = "#d8dce8", bg = "#12141a" },
+    Cursor = { fg = "#12141a", bg = "#ffd700" },
+    CursorLine = { bg = "#1b1e24" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#171a20" },
+    LineNr = { fg = "#606878" },
+    CursorLineNr = { fg = "#d8dce8", bold = true },
+    SignColumn = { fg = "#606878", bg = "#12141a" },
+    VertSplit = { fg = "#272930" },
+    WinSeparator = { fg = "#272930" },
+    Folded = { fg = "#606878", bg = "#181a20" },
+    FoldColumn = { fg = "#606878" },
+    NonText = { fg = "#606878" },
+    SpecialKey = { fg = "#606878" },
+    Whitespace = { fg = "#393e49" },
+    MatchParen = { fg = "#ffd700", bold = true },
+    Visual = { bg = "#594e12" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#12141a", bg = "#ffd700" },
+    IncSearch = { fg = "#12141a", bg = "#ffdf33" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#12141a", bg = "#d8b600" },
+    Pmenu = { fg = "#d8dce8", bg = "#181a20" },
+    PmenuSel = { fg = "#d8dce8", bg = "#413b14" },
+    PmenuSbar = { bg = "#272930" },
+    PmenuThumb = { bg = "#99a0ae" },
+    ErrorMsg = { fg = "#d8b600" },
+    WarningMsg = { fg = "#ffdf33" },
+    ModeMsg = { fg = "#d8dce8", bold = true },
+    MoreMsg = { fg = "#ffe13f" },
+    Question = { fg = "#ffe13f" },
+    TabLine = { fg = "#99a0ae", bg = "#181a20" },
+    TabLineFill = { bg = "#12141a" },
+    TabLineSel = { fg = "#d8dce8", bg = "#12141a", bold = true },
+    StatusLine = { fg = "#d8dce8", bg = "#181a20" },
+    StatusLineNC = { fg = "#99a0ae", bg = "#181a20" },
+    DiffAdd = { bg = "#353321" },
+    DiffChange = { bg = "#35321d" },
+    DiffDelete = { fg = "#d8b600", bg = "#2f2c16" },
+    DiffText = { bg = "#595021" },
+    SpellBad = { sp = "#d8b600", undercurl = true },
+    SpellCap = { sp = "#ffdf33", undercurl = true },
+    SpellLocal = { sp = "#ffe13f", undercurl = true },
+    SpellRare = { sp = "#ffd700", undercurl = true },
+    Comment = { fg = "#606878" },
+    Constant = { fg = "#ffdf33" },
+    String = { fg = "#ffe34c" },
+    Character = { fg = "#ffe34c" },
+    Number = { fg = "#ffdf33" },
+    Boolean = { fg = "#ffdf33" },
+    Float = { fg = "#ffdf33" },
+    Identifier = { fg = "#d8dce8" },
+    Function = { fg = "#ffe13f" },
+    Statement = { fg = "#ffd700" },
+    Conditional = { fg = "#ffd700" },
+    Repeat = { fg = "#ffd700" },
+    Label = { fg = "#ffd700" },
+    Operator = { fg = "#99a0ae" },
+    Keyword = { fg = "#ffd700" },
+    Exception = { fg = "#ffd700" },
+    PreProc = { fg = "#ffd700" },
+    Include = { fg = "#ffd700" },
+    Define = { fg = "#ffd700" },
+    Macro = { fg = "#ffd700" },
+    PreCondit = { fg = "#ffd700" },
+    Type = { fg = "#d8dce8" },
+    StorageClass = { fg = "#ffd700" },
+    Structure = { fg = "#d8dce8" },
+    Typedef = { fg = "#d8dce8" },
+    Special = { fg = "#ffdf33" },
+    SpecialChar = { fg = "#ffdf33" },
+    Tag = { fg = "#ffe34c" },
+    Delimiter = { fg = "#99a0ae" },
+    SpecialComment = { fg = "#606878", italic = true },
+    Debug = { fg = "#ffdf33" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#606878" },
+    Error = { fg = "#d8b600" },
+    Todo = { fg = "#12141a", bg = "#ffd700", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#d8dce8" },
+      ["@variable.builtin"] = { fg = "#ffd700" },
+      ["@variable.parameter"] = { fg = "#d8dce8", italic = true },
+      ["@variable.member"] = { fg = "#d8dce8" },
+      ["@constant"] = { fg = "#ffdf33" },
+      ["@constant.builtin"] = { fg = "#ffdf33" },
+      ["@module"] = { fg = "#d8dce8" },
+      ["@label"] = { fg = "#ffd700" },
+      ["@type"] = { fg = "#d8dce8" },
+      ["@type.builtin"] = { fg = "#d8dce8" },
+      ["@attribute"] = { fg = "#d9dde9" },
+      ["@property"] = { fg = "#d8dce8" },
+      ["@function"] = { fg = "#ffe13f" },
+      ["@function.builtin"] = { fg = "#ffe13f" },
+      ["@function.call"] = { fg = "#ffe13f" },
+      ["@function.method"] = { fg = "#ffe13f" },
+      ["@constructor"] = { fg = "#d8dce8" },
+      ["@operator"] = { fg = "#99a0ae" },
+      ["@keyword"] = { fg = "#ffd700" },
+      ["@keyword.conditional"] = { fg = "#ffd700" },
+      ["@keyword.function"] = { fg = "#ffd700" },
+      ["@keyword.operator"] = { fg = "#ffd700" },
+      ["@keyword.return"] = { fg = "#ffd700" },
+      ["@punctuation.bracket"] = { fg = "#99a0ae" },
+      ["@punctuation.delimiter"] = { fg = "#99a0ae" },
+      ["@punctuation.special"] = { fg = "#ffdf33" },
+      ["@string"] = { fg = "#ffe34c" },
+      ["@string.escape"] = { fg = "#ffdf33" },
+      ["@string.regexp"] = { fg = "#ffdf33" },
+      ["@character"] = { fg = "#ffe34c" },
+      ["@boolean"] = { fg = "#ffdf33" },
+      ["@number"] = { fg = "#ffdf33" },
+      ["@comment"] = { fg = "#606878", italic = true },
+      ["@comment.todo"] = { fg = "#12141a", bg = "#ffd700", bold = true },
+      ["@comment.error"] = { fg = "#d8b600", bold = true },
+      ["@comment.warning"] = { fg = "#ffdf33", bold = true },
+      ["@comment.note"] = { fg = "#ffe13f", bold = true },
+      ["@markup.heading"] = { fg = "#ffd700", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#ffe34c" },
+      ["@markup.link"] = { fg = "#ffe13f", underline = true },
+      ["@tag"] = { fg = "#ffe34c" },
+      ["@tag.attribute"] = { fg = "#d9dde9" },
+      ["@tag.delimiter"] = { fg = "#99a0ae" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#d8b600" },
+      DiagnosticWarn = { fg = "#ffdf33" },
+      DiagnosticInfo = { fg = "#ffe13f" },
+      DiagnosticHint = { fg = "#ffd700" },
+      DiagnosticUnderlineError = { sp = "#d8b600", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#ffdf33", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#ffe13f", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#ffd700", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#d8b600", bg = "#252417" },
+      DiagnosticVirtualTextWarn = { fg = "#ffdf33", bg = "#29281c" },
+      DiagnosticVirtualTextInfo = { fg = "#ffe13f", bg = "#29281d" },
+      DiagnosticVirtualTextHint = { fg = "#ffd700", bg = "#292717" },
+      LspReferenceText = { bg = "#25282e" },
+      LspReferenceRead = { bg = "#25282e" },
+      LspReferenceWrite = { bg = "#2f3238" },
+      LspSignatureActiveParameter = { fg = "#ffd700", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#ffe34c" },
+      GitSignsChange = { fg = "#ffdf33" },
+      GitSignsDelete = { fg = "#d8b600" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#d8dce8", bg = "#12141a" },
+      TelescopeBorder = { fg = "#272930", bg = "#12141a" },
+      TelescopePromptTitle = { fg = "#12141a", bg = "#ffd700", bold = true },
+      TelescopePreviewTitle = { fg = "#12141a", bg = "#ffe34c", bold = true },
+      TelescopeResultsTitle = { fg = "#12141a", bg = "#ffe13f", bold = true },
+      TelescopeSelection = { bg = "#413b14" },
+      TelescopeMatching = { fg = "#ffd700", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#ffd700", bold = true },
+      CmpItemKindVariable = { fg = "#d8dce8" },
+      CmpItemKindFunction = { fg = "#ffe13f" },
+      CmpItemKindKeyword = { fg = "#ffd700" },
+      CmpItemKindClass = { fg = "#d8dce8" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#272930" },
+      IblScope = { fg = "#606878" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#12141a", bg = "#ffd700", bold = true },
+      LazyButton = { fg = "#d8dce8", bg = "#272930" },
+      LazyButtonActive = { fg = "#12141a", bg = "#ffd700" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#d8b600" },
+      NotifyWARNBorder = { fg = "#ffdf33" },
+      NotifyINFOBorder = { fg = "#ffe13f" },
+      NotifyDEBUGBorder = { fg = "#606878" },
+      NotifyTRACEBorder = { fg = "#ffd700" },
+    },
+  },
+}
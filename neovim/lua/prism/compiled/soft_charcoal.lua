@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Soft Charcoal
+-- Auto-generated by sync_themes.py from vscode/themes/soft_charcoal.json - DO NOT EDIT
+
+return {
+  name = "Soft Charcoal",
+  mode = "dark",
+  palette = {
+    base00 = "#2a2a32",
+    base01 = "#34343c",
+    base02 = "#41414a",
+    base03 = "#70707a",
+    base04 = "#aaaab3",
+    base05 = "#e8e8f0",
+    base06 = "#f9f9ff",
+    base07 = "#fefeff",
+    base08 = "#d5a21e",
+    base09 = "#fbcb4f",
+    base0A = "#fbbf24",
+    base0B = "#fcd265",
+    base0C = "#fbcb4f",
+    base0D = "#fccf5a",
+    base0E = "#fbbf24",
+    base0F = "#70707a",
+  },
+  terminal = {
+    "#2a2a32", "#d5a21e", "#fbc539", "#8c8c94",
+    "#fbbf24", "#bc8f1b", "#fbcb4f", "#e8e8f0",
+    "#70707a", "#fbbf24", "#fbcb4f", "#e8e8f0",
+    "#fbc844", "#e1ab20", "#fcd265", "#eaeaf1",
+  },
+  groups = {
+    Normal = { fg = "#e8e8f0", bg = "#2a2a32" },
+    NormalFloat = { fg = "#e8e8f0", bg = "#34343c" },
+    NormalNC = { fg = "#e8e8f0", bg = "#2a2a32" },
+    Cursor = { fg = "#2a2a32", bg = "#fbbf24" },
+    CursorLine = { bg = "#33333b" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#2f2f37" },
+    LineNr = { fg = "#70707a" },
+    CursorLineNr = { fg = "#e8e8f0", bold = true },
+    SignColumn = { fg = "#70707a", bg = "#2a2a32" },
+    VertSplit = { fg = "#41414a" },
+    WinSeparator = { fg = "#41414a" },
+    Folded = { fg = "#70707a", bg = "#34343c" },
+    FoldColumn = { fg = "#70707a" },
+    NonText = { fg = "#70707a" },
+    SpecialKey = { fg = "#70707a" },
+    Whitespace = { fg = "#4d4d56" },
+    MatchParen = { fg = "#fbbf24", bold = true },
+    Visual = { bg = "#68562d" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#2a2a32", bg = "#fbbf24" },
+    IncSearch = { fg = "#2a2a32", bg = "#fbcb4f" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#2a2a32", bg = "#d5a21e" },
+    Pmenu = { fg = "#e8e8f0", bg = "#34343c" },
+    PmenuSel = { fg = "#e8e8f0", bg = "#53472f" },
+    PmenuSbar = { bg = "#41414a" },
+    PmenuThumb = { bg = "#aaaab3" },
+    ErrorMsg = { fg = "#d5a21e" },
+    WarningMsg = { fg = "#fbcb4f" },
+    ModeMsg = { fg = "#e8e8f0", bold = true },
+    MoreMsg = { fg = "#fccf5a" },
+    Question = { fg = "#fccf5a" },
+    TabLine = { fg = "#aaaab3", bg = "#34343c" },
+    TabLineFill = { bg = "#2a2a32" },
+    TabLineSel = { fg = "#e8e8f0", bg = "#2a2a32", bold = true },
+    StatusLine = { fg = "#e8e8f0", bg = "#34343c" },
+    StatusLineNC = { fg = "#aaaab3", bg = "#34343c" },
+    DiffAdd = { bg = "#494339" },
+    DiffChange = { bg = "#494236" },
+    DiffDelete = { fg = "#d5a21e", bg = "#433c2f" },
+    DiffText = { bg = "#685a3a" },
+    SpellBad = { sp = "#d5a21e", undercurl = true },
+    SpellCap = { sp = "#fbcb4f", undercurl = true },
+    SpellLocal = { sp = "#fccf5a", undercurl = true },
+    SpellRare = { sp = "#fbbf24", undercurl = true },
+    Comment = { fg = "#70707a" },
+    Constant = { fg = "#fbcb4f" },
+    String = { fg = "#fcd265" },
+    Character = { fg = "#fcd265" },
+    Number = { fg = "#fbcb4f" },
+    Boolean = { fg = "#fbcb4f" },
+    Float = { fg = "#fbcb4f" },
+    Identifier = { fg = "#e8e8f0" },
+    Function = { fg = "#fccf5a" },
+    Statement = { fg = "#fbbf24" },
+    Conditional = { fg = "#fbbf24" },
+    Repeat = { fg = "#fbbf24" },
+    Label = { fg = "#fbbf24" },
+    Operator = { fg = "#aaaab3" },
+    Keyword = { fg = "#fbbf24" },
+    Exception = { fg = "#fbbf24" },
+    PreProc = { fg = "#fbbf24" },
+    Include = { fg = "#fbbf24" },
+    Define = { fg = "#fbbf24" },
+    Macro = { fg = "#fbbf24" },
+    PreCondit = { fg = "#fbbf24" },
+    Type = { fg = "#e8e8f0" },
+    StorageClass = { fg = "#fbbf24" },
+    Structure = { fg = "#e8e8f0" },
+    Typedef = { fg = "#e8e8f0" },
+    Special = { fg = "#fbcb4f" },
+    SpecialChar = { fg = "#fbcb4f" },
+    Tag = { fg = "#fcd265" },
+    Delimiter = { fg = "#aaaab3" },
+    SpecialComment = { fg = "#70707a", italic = true },
+    Debug = { fg = "#fbcb4f" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#70707a" },
+    Error = { fg = "#d5a21e" },
+    Todo = { fg = "#2a2a32", bg = "#fbbf24", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#e8e8f0" },
+      ["@variable.builtin"] = { fg = "#fbbf24" },
+      ["@variable.parameter"] = { fg = "#e8e8f0", italic = true },
+      ["@variable.member"] = { fg = "#e8e8f0" },
+      ["@constant"] = { fg = "#fbcb4f" },
+      ["@constant.builtin"] = { fg = "#fbcb4f" },
+      ["@module"] = { fg = "#e8e8f0" },
+      ["@label"] = { fg = "#fbbf24" },
+      ["@type"] = { fg = "#e8e8f0" },
+      ["@type.builtin"] = { fg = "#e8e8f0" },
+      ["@attribute"] = { fg = "#e9e9f0" },
+      ["@property"] = { fg = "#e8e8f0" },
+      ["@function"] = { fg = "#fccf5a" },
+      ["@function.builtin"] = { fg = "#fccf5a" },
+      ["@function.call"] = { fg = "#fccf5a" },
+      ["@function.method"] = { fg = "#fccf5a" },
+      ["@constructor"] = { fg = "#e8e8f0" },
+      ["@operator"] = { fg = "#aaaab3" },
+      ["@keyword"] = { fg = "#fbbf24" },
+      ["@keyword.conditional"] = { fg = "#fbbf24" },
+      ["@keyword.function"] = { fg = "#fbbf24" },
+      ["@keyword.operator"] = { fg = "#fbbf24" },
+      ["@keyword.return"] = { fg = "#fbbf24" },
+      ["@punctuation.bracket"] = { fg = "#aaaab3" },
+      ["@punctuation.delimiter"] = { fg = "#aaaab3" },
+      ["@punctuation.special"] = { fg = "#fbcb4f" },
+      ["@string"] = { fg = "#fcd265" },
+      ["@string.escape"] = { fg = "#fbcb4f" },
+      ["@string.regexp"] = { fg = "#fbcb4f" },
+      ["@character"] = { fg = "#fcd265" },
+      ["@boolean"] = { fg = "#fbcb4f" },
+      ["@number"] = { fg = "#fbcb4f" },
+      ["@comment"] = { fg = "#70707a", italic = true },
+      ["@comment.todo"] = { fg = "#2a2a32", bg = "#fbbf24", bold = true },
+      ["@comment.error"] = { fg = "#d5a21e", bold = true },
+      ["@comment.warning"] = { fg = "#fbcb4f", bold = true },
+      ["@comment.note"] = { fg = "#fccf5a", bold = true },
+      ["@markup.heading"] = { fg = "#fbbf24", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#fcd265" },
+      ["@markup.link"] = { fg = "#fccf5a", underline = true },
+      ["@tag"] = { fg = "#fcd265" },
+      ["@tag.attribute"] = { fg = "#e9e9f0" },
+      ["@tag.delimiter"] = { fg = "#aaaab3" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#d5a21e" },
+      DiagnosticWarn = { fg = "#fbcb4f" },
+      DiagnosticInfo = { fg = "#fccf5a" },
+      DiagnosticHint = { fg = "#fbbf24" },
+      DiagnosticUnderlineError = { sp = "#d5a21e", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#fbcb4f", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#fccf5a", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#fbbf24", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#d5a21e", bg = "#3b3630" },
+      DiagnosticVirtualTextWarn = { fg = "#fbcb4f", bg = "#3e3a34" },
+      DiagnosticVirtualTextInfo = { fg = "#fccf5a", bg = "#3f3a36" },
+      DiagnosticVirtualTextHint = { fg = "#fbbf24", bg = "#3e3830" },
+      LspReferenceText = { bg = "#3d3d45" },
+      LspReferenceRead = { bg = "#3d3d45" },
+      LspReferenceWrite = { bg = "#46464e" },
+      LspSignatureActiveParameter = { fg = "#fbbf24", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#fcd265" },
+      GitSignsChange = { fg = "#fbcb4f" },
+      GitSignsDelete = { fg = "#d5a21e" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#e8e8f0", bg = "#2a2a32" },
+      TelescopeBorder = { fg = "#41414a", bg = "#2a2a32" },
+      TelescopePromptTitle = { fg = "#2a2a32", bg = "#fbbf24", bold = true },
+      TelescopePreviewTitle = { fg = "#2a2a32", bg = "#fcd265", bold = true },
+      TelescopeResultsTitle = { fg = "#2a2a32", bg = "#fccf5a", bold = true },
+      TelescopeSelection = { bg = "#53472f" },
+      TelescopeMatching = { fg = "#fbbf24", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#fbbf24", bold = true },
+      CmpItemKindVariable = { fg = "#e8e8f0" },
+      CmpItemKindFunction = { fg = "#fccf5a" },
+      CmpItemKindKeyword = { fg = "#fbbf24" },
+      CmpItemKindClass = { fg = "#e8e8f0" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#41414a" },
+      IblScope = { fg = "#70707a" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#2a2a32", bg = "#fbbf24", bold = true },
+      LazyButton = { fg = "#e8e8f0", bg = "#41414a" },
+      LazyButtonActive = { fg = "#2a2a32", bg = "#fbbf24" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#d5a21e" },
+      NotifyWARNBorder = { fg = "#fbcb4f" },
+      NotifyINFOBorder = { fg = "#fccf5a" },
+      NotifyDEBUGBorder = { fg = "#70707a" },
+      NotifyTRACEBorder = { fg = "#fbbf24" },
+    },
+  },
+}
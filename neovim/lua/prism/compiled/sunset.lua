@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Sunset
+-- Auto-generated by sync_themes.py from vscode/themes/sunset.json - DO NOT EDIT
+
+return {
+  name = "Sunset",
+  mode = "dark",
+  palette = {
+    base00 = "#1a0820",
+    base01 = "#4a00bf",
+    base02 = "#301d37",
+    base03 = "#987080",
+    base04 = "#d984a8",
+    base05 = "#ffbd00",
+    base06 = "#ffcd2f",
+    base07 = "#ffde48",
+    base08 = "#d80047",
+    base09 = "#c8a8b0",
+    base0A = "#FF0054",
+    base0B = "#ffb080",
+    base0C = "#ff3376",
+    base0D = "#ff6090",
+    base0E = "#FF0054",
+    base0F = "#9E0059",
+  },
+  terminal = {
+    "#390099", "#d80047", "#ff1965", "#b1337a",
+    "#FF0054", "#bf003f", "#ff3376", "#FFBD00",
+    "#9E0059", "#FF0054", "#ff3376", "#FFBD00",
+    "#ff266d", "#e5004b", "#ff4c87", "#ffc319",
+  },
+  groups = {
+    Normal = { fg = "#ffbd00", bg = "#1a0820" },
+    NormalFloat = { fg = "#ffbd00", bg = "#4a00bf" },
+    NormalNC = { fg = "#ffbd00", bg = "#1a0820" },
+    Cursor = { fg = "#1a0820", bg = "#FF0054" },
+    CursorLine = { bg = "#25111e" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#200d1f" },
+    LineNr = { fg = "#987080" },
+    CursorLineNr = { fg = "#ffbd00", bold = true },
+    SignColumn = { fg = "#987080", bg = "#1a0820" },
+    VertSplit = { fg = "#301d37" },
+    WinSeparator = { fg = "#301d37" },
+    Folded = { fg = "#987080", bg = "#4a00bf" },
+    FoldColumn = { fg = "#987080" },
+    NonText = { fg = "#987080" },
+    SpecialKey = { fg = "#987080" },
+    Whitespace = { fg = "#593c50" },
+    MatchParen = { fg = "#FF0054", bold = true },
+    Visual = { bg = "#5e052f" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#1a0820", bg = "#FF0054" },
+    IncSearch = { fg = "#1a0820", bg = "#c8a8b0" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#1a0820", bg = "#d80047" },
+    Pmenu = { fg = "#ffbd00", bg = "#4a00bf" },
+    PmenuSel = { fg = "#ffbd00", bg = "#47062a" },
+    PmenuSbar = { bg = "#301d37" },
+    PmenuThumb = { bg = "#d984a8" },
+    ErrorMsg = { fg = "#d80047" },
+    WarningMsg = { fg = "#c8a8b0" },
+    ModeMsg = { fg = "#ffbd00", bold = true },
+    MoreMsg = { fg = "#ff6090" },
+    Question = { fg = "#ff6090" },
+    TabLine = { fg = "#d984a8", bg = "#4a00bf" },
+    TabLineFill = { bg = "#1a0820" },
+    TabLineSel = { fg = "#ffbd00", bg = "#1a0820", bold = true },
+    StatusLine = { fg = "#ffbd00", bg = "#4a00bf" },
+    StatusLineNC = { fg = "#d984a8", bg = "#4a00bf" },
+    DiffAdd = { bg = "#3c212e" },
+    DiffChange = { bg = "#342035" },
+    DiffDelete = { fg = "#d80047", bg = "#360625" },
+    DiffText = { bg = "#4e384b" },
+    SpellBad = { sp = "#d80047", undercurl = true },
+    SpellCap = { sp = "#c8a8b0", undercurl = true },
+    SpellLocal = { sp = "#ff6090", undercurl = true },
+    SpellRare = { sp = "#FF0054", undercurl = true },
+    Comment = { fg = "#987080" },
+    Constant = { fg = "#c8a8b0" },
+    String = { fg = "#ffb080" },
+    Character = { fg = "#ffb080" },
+    Number = { fg = "#c8a8b0" },
+    Boolean = { fg = "#c8a8b0" },
+    Float = { fg = "#c8a8b0" },
+    Identifier = { fg = "#e0c0c8" },
+    Function = { fg = "#ff6090" },
+    Statement = { fg = "#FF0054" },
+    Conditional = { fg = "#FF0054" },
+    Repeat = { fg = "#FF0054" },
+    Label = { fg = "#FF0054" },
+    Operator = { fg = "#d984a8" },
+    Keyword = { fg = "#FF0054" },
+    Exception = { fg = "#FF0054" },
+    PreProc = { fg = "#FF0054" },
+    Include = { fg = "#FF0054" },
+    Define = { fg = "#FF0054" },
+    Macro = { fg = "#FF0054" },
+    PreCondit = { fg = "#FF0054" },
+    Type = { fg = "#FFBD00" },
+    StorageClass = { fg = "#FF0054" },
+    Structure = { fg = "#FFBD00" },
+    Typedef = { fg = "#FFBD00" },
+    Special = { fg = "#ff3376" },
+    SpecialChar = { fg = "#ff3376" },
+    Tag = { fg = "#ffb080" },
+    Delimiter = { fg = "#d984a8" },
+    SpecialComment = { fg = "#987080", italic = true },
+    Debug = { fg = "#c8a8b0" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#987080" },
+    Error = { fg = "#d80047" },
+    Todo = { fg = "#1a0820", bg = "#FF0054", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#e0c0c8" },
+      ["@variable.builtin"] = { fg = "#FF0054" },
+      ["@variable.parameter"] = { fg = "#e0c0c8", italic = true },
+      ["@variable.member"] = { fg = "#e0c0c8" },
+      ["@constant"] = { fg = "#c8a8b0" },
+      ["@constant.builtin"] = { fg = "#c8a8b0" },
+      ["@module"] = { fg = "#ffbd00" },
+      ["@label"] = { fg = "#FF0054" },
+      ["@type"] = { fg = "#FFBD00" },
+      ["@type.builtin"] = { fg = "#FFBD00" },
+      ["@attribute"] = { fg = "#ff266d" },
+      ["@property"] = { fg = "#e0c0c8" },
+      ["@function"] = { fg = "#ff6090" },
+      ["@function.builtin"] = { fg = "#ff6090" },
+      ["@function.call"] = { fg = "#ff6090" },
+      ["@function.method"] = { fg = "#ff6090" },
+      ["@constructor"] = { fg = "#FFBD00" },
+      ["@operator"] = { fg = "#d984a8" },
+      ["@keyword"] = { fg = "#FF0054" },
+      ["@keyword.conditional"] = { fg = "#FF0054" },
+      ["@keyword.function"] = { fg = "#FF0054" },
+      ["@keyword.operator"] = { fg = "#FF0054" },
+      ["@keyword.return"] = { fg = "#FF0054" },
+      ["@punctuation.bracket"] = { fg = "#d984a8" },
+      ["@punctuation.delimiter"] = { fg = "#d984a8" },
+      ["@punctuation.special"] = { fg = "#ff3376" },
+      ["@string"] = { fg = "#ffb080" },
+      ["@string.escape"] = { fg = "#ff3376" },
+      ["@string.regexp"] = { fg = "#ff3376" },
+      ["@character"] = { fg = "#ffb080" },
+      ["@boolean"] = { fg = "#c8a8b0" },
+      ["@number"] = { fg = "#c8a8b0" },
+      ["@comment"] = { fg = "#987080", italic = true },
+      ["@comment.todo"] = { fg = "#1a0820", bg = "#FF0054", bold = true },
+      ["@comment.error"] = { fg = "#d80047", bold = true },
+      ["@comment.warning"] = { fg = "#c8a8b0", bold = true },
+      ["@comment.note"] = { fg = "#ff6090", bold = true },
+      ["@markup.heading"] = { fg = "#FF0054", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#ffb080" },
+      ["@markup.link"] = { fg = "#ff6090", underline = true },
+      ["@tag"] = { fg = "#ffb080" },
+      ["@tag.attribute"] = { fg = "#ff266d" },
+      ["@tag.delimiter"] = { fg = "#d984a8" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#d80047" },
+      DiagnosticWarn = { fg = "#c8a8b0" },
+      DiagnosticInfo = { fg = "#ff6090" },
+      DiagnosticHint = { fg = "#FF0054" },
+      DiagnosticUnderlineError = { sp = "#d80047", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#c8a8b0", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#ff6090", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#FF0054", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#d80047", bg = "#2d0723" },
+      DiagnosticVirtualTextWarn = { fg = "#c8a8b0", bg = "#2b182e" },
+      DiagnosticVirtualTextInfo = { fg = "#ff6090", bg = "#30102b" },
+      DiagnosticVirtualTextHint = { fg = "#FF0054", bg = "#300725" },
+      LspReferenceText = { bg = "#301a1c" },
+      LspReferenceRead = { bg = "#301a1c" },
+      LspReferenceWrite = { bg = "#3c231b" },
+      LspSignatureActiveParameter = { fg = "#FF0054", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#ffb080" },
+      GitSignsChange = { fg = "#c8a8b0" },
+      GitSignsDelete = { fg = "#d80047" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#ffbd00", bg = "#1a0820" },
+      TelescopeBorder = { fg = "#301d37", bg = "#1a0820" },
+      TelescopePromptTitle = { fg = "#1a0820", bg = "#FF0054", bold = true },
+      TelescopePreviewTitle = { fg = "#1a0820", bg = "#ffb080", bold = true },
+      TelescopeResultsTitle = { fg = "#1a0820", bg = "#ff6090", bold = true },
+      TelescopeSelection = { bg = "#47062a" },
+      TelescopeMatching = { fg = "#FF0054", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#FF0054", bold = true },
+      CmpItemKindVariable = { fg = "#e0c0c8" },
+      CmpItemKindFunction = { fg = "#ff6090" },
+      CmpItemKindKeyword = { fg = "#FF0054" },
+      CmpItemKindClass = { fg = "#FFBD00" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#301d37" },
+      IblScope = { fg = "#987080" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#1a0820", bg = "#FF0054", bold = true },
+      LazyButton = { fg = "#ffbd00", bg = "#301d37" },
+      LazyButtonActive = { fg = "#1a0820", bg = "#FF0054" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#d80047" },
+      NotifyWARNBorder = { fg = "#c8a8b0" },
+      NotifyINFOBorder = { fg = "#ff6090" },
+      NotifyDEBUGBorder = { fg = "#987080" },
+      NotifyTRACEBorder = { fg = "#FF0054" },
+    },
+  },
+}
@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Synthwave
+-- Auto-generated by sync_themes.py from vscode/themes/synthwave.json - DO NOT EDIT
+
+return {
+  name = "Synthwave",
+  mode = "dark",
+  palette = {
+    base00 = "#0a0014",
+    base01 = "#4a0fd0",
+    base02 = "#1e0e2a",
+    base03 = "#8060a0",
+    base04 = "#ae97c8",
+    base05 = "#e0d0f0",
+    base06 = "#f1e0ff",
+    base07 = "#fff1ff",
+    base08 = "#60079b",
+    base09 = "#f1fa8c",
+    base0A = "#7209B7",
+    base0B = "#00ffff",
+    base0C = "#8e3ac5",
+    base0D = "#ff79c6",
+    base0E = "#ff00ff",
+    base0F = "#560BAD",
+  },
+  terminal = {
+    "#3A0CA3", "#60079b", "#8021be", "#773bbd",
+    "#7209B7", "#550689", "#8e3ac5", "#F72585",
+    "#560BAD", "#7209B7", "#8e3ac5", "#F72585",
+    "#872dc1", "#6608a4", "#9c52cc", "#f73a91",
+  },
+  groups = {
+    Normal = { fg = "#e0d0f0", bg = "#0a0014" },
+    NormalFloat = { fg = "#e0d0f0", bg = "#4a0fd0" },
+    NormalNC = { fg = "#e0d0f0", bg = "#0a0014" },
+    Cursor = { fg = "#0a0014", bg = "#7209B7" },
+    CursorLine = { bg = "#140a1f" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#10061a" },
+    LineNr = { fg = "#8060a0" },
+    CursorLineNr = { fg = "#e0d0f0", bold = true },
+    SignColumn = { fg = "#8060a0", bg = "#0a0014" },
+    VertSplit = { fg = "#1e0e2a" },
+    WinSeparator = { fg = "#1e0e2a" },
+    Folded = { fg = "#8060a0", bg = "#4a0fd0" },
+    FoldColumn = { fg = "#8060a0" },
+    NonText = { fg = "#8060a0" },
+    SpecialKey = { fg = "#8060a0" },
+    Whitespace = { fg = "#45305a" },
+    MatchParen = { fg = "#7209B7", bold = true },
+    Visual = { bg = "#290244" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#0a0014", bg = "#7209B7" },
+    IncSearch = { fg = "#0a0014", bg = "#f1fa8c" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#0a0014", bg = "#60079b" },
+    Pmenu = { fg = "#e0d0f0", bg = "#4a0fd0" },
+    PmenuSel = { fg = "#e0d0f0", bg = "#1e0134" },
+    PmenuSbar = { bg = "#1e0e2a" },
+    PmenuThumb = { bg = "#ae97c8" },
+    ErrorMsg = { fg = "#60079b" },
+    WarningMsg = { fg = "#f1fa8c" },
+    ModeMsg = { fg = "#e0d0f0", bold = true },
+    MoreMsg = { fg = "#ff79c6" },
+    Question = { fg = "#ff79c6" },
+    TabLine = { fg = "#ae97c8", bg = "#4a0fd0" },
+    TabLineFill = { bg = "#0a0014" },
+    TabLineSel = { fg = "#e0d0f0", bg = "#0a0014", bold = true },
+    StatusLine = { fg = "#e0d0f0", bg = "#4a0fd0" },
+    StatusLineNC = { fg = "#ae97c8", bg = "#4a0fd0" },
+    DiffAdd = { bg = "#082637" },
+    DiffChange = { bg = "#2c2526" },
+    DiffDelete = { fg = "#60079b", bg = "#160128" },
+    DiffText = { bg = "#4f4b38" },
+    SpellBad = { sp = "#60079b", undercurl = true },
+    SpellCap = { sp = "#f1fa8c", undercurl = true },
+    SpellLocal = { sp = "#ff79c6", undercurl = true },
+    SpellRare = { sp = "#ff00ff", undercurl = true },
+    Comment = { fg = "#8060a0" },
+    Constant = { fg = "#f1fa8c" },
+    String = { fg = "#00ffff" },
+    Character = { fg = "#00ffff" },
+    Number = { fg = "#f1fa8c" },
+    Boolean = { fg = "#f1fa8c" },
+    Float = { fg = "#f1fa8c" },
+    Identifier = { fg = "#e0d0f0" },
+    Function = { fg = "#ff79c6" },
+    Statement = { fg = "#ff00ff" },
+    Conditional = { fg = "#ff00ff" },
+    Repeat = { fg = "#ff00ff" },
+    Label = { fg = "#ff00ff" },
+    Operator = { fg = "#ae97c8" },
+    Keyword = { fg = "#ff00ff" },
+    Exception = { fg = "#ff00ff" },
+    PreProc = { fg = "#ff00ff" },
+    Include = { fg = "#ff00ff" },
+    Define = { fg = "#ff00ff" },
+    Macro = { fg = "#ff00ff" },
+    PreCondit = { fg = "#ff00ff" },
+    Type = { fg = "#F72585" },
+    StorageClass = { fg = "#ff00ff" },
+    Structure = { fg = "#F72585" },
+    Typedef = { fg = "#F72585" },
+    Special = { fg = "#8e3ac5" },
+    SpecialChar = { fg = "#8e3ac5" },
+    Tag = { fg = "#7209B7" },
+    Delimiter = { fg = "#ae97c8" },
+    SpecialComment = { fg = "#8060a0", italic = true },
+    Debug = { fg = "#f1fa8c" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#8060a0" },
+    Error = { fg = "#60079b" },
+    Todo = { fg = "#0a0014", bg = "#7209B7", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#e0d0f0" },
+      ["@variable.builtin"] = { fg = "#ff00ff" },
+      ["@variable.parameter"] = { fg = "#e0d0f0", italic = true },
+      ["@variable.member"] = { fg = "#e0d0f0" },
+      ["@constant"] = { fg = "#f1fa8c" },
+      ["@constant.builtin"] = { fg = "#f1fa8c" },
+      ["@module"] = { fg = "#e0d0f0" },
+      ["@label"] = { fg = "#ff00ff" },
+      ["@type"] = { fg = "#F72585" },
+      ["@type.builtin"] = { fg = "#F72585" },
+      ["@attribute"] = { fg = "#f97e72" },
+      ["@property"] = { fg = "#e0d0f0" },
+      ["@function"] = { fg = "#ff79c6" },
+      ["@function.builtin"] = { fg = "#ff79c6" },
+      ["@function.call"] = { fg = "#ff79c6" },
+      ["@function.method"] = { fg = "#ff79c6" },
+      ["@constructor"] = { fg = "#F72585" },
+      ["@operator"] = { fg = "#ae97c8" },
+      ["@keyword"] = { fg = "#ff00ff" },
+      ["@keyword.conditional"] = { fg = "#ff00ff" },
+      ["@keyword.function"] = { fg = "#ff00ff" },
+      ["@keyword.operator"] = { fg = "#ff00ff" },
+      ["@keyword.return"] = { fg = "#ff00ff" },
+      ["@punctuation.bracket"] = { fg = "#ae97c8" },
+      ["@punctuation.delimiter"] = { fg = "#ae97c8" },
+      ["@punctuation.special"] = { fg = "#8e3ac5" },
+      ["@string"] = { fg = "#00ffff" },
+      ["@string.escape"] = { fg = "#8e3ac5" },
+      ["@string.regexp"] = { fg = "#8e3ac5" },
+      ["@character"] = { fg = "#00ffff" },
+      ["@boolean"] = { fg = "#f1fa8c" },
+      ["@number"] = { fg = "#f1fa8c" },
+      ["@comment"] = { fg = "#8060a0", italic = true },
+      ["@comment.todo"] = { fg = "#0a0014", bg = "#7209B7", bold = true },
+      ["@comment.error"] = { fg = "#60079b", bold = true },
+      ["@comment.warning"] = { fg = "#f1fa8c", bold = true },
+      ["@comment.note"] = { fg = "#ff79c6", bold = true },
+      ["@markup.heading"] = { fg = "#ff00ff", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#00ffff" },
+      ["@markup.link"] = { fg = "#ff79c6", underline = true },
+      ["@tag"] = { fg = "#7209B7" },
+      ["@tag.attribute"] = { fg = "#f97e72" },
+      ["@tag.delimiter"] = { fg = "#ae97c8" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#60079b" },
+      DiagnosticWarn = { fg = "#f1fa8c" },
+      DiagnosticInfo = { fg = "#ff79c6" },
+      DiagnosticHint = { fg = "#7209B7" },
+      DiagnosticUnderlineError = { sp = "#60079b", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#f1fa8c", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#ff79c6", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#7209B7", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#60079b", bg = "#120021" },
+      DiagnosticVirtualTextWarn = { fg = "#f1fa8c", bg = "#211920" },
+      DiagnosticVirtualTextInfo = { fg = "#ff79c6", bg = "#220c25" },
+      DiagnosticVirtualTextHint = { fg = "#7209B7", bg = "#140024" },
+      LspReferenceText = { bg = "#1f142a" },
+      LspReferenceRead = { bg = "#1f142a" },
+      LspReferenceWrite = { bg = "#2a1f35" },
+      LspSignatureActiveParameter = { fg = "#7209B7", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#00ffff" },
+      GitSignsChange = { fg = "#f1fa8c" },
+      GitSignsDelete = { fg = "#60079b" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#e0d0f0", bg = "#0a0014" },
+      TelescopeBorder = { fg = "#1e0e2a", bg = "#0a0014" },
+      TelescopePromptTitle = { fg = "#0a0014", bg = "#7209B7", bold = true },
+      TelescopePreviewTitle = { fg = "#0a0014", bg = "#00ffff", bold = true },
+      TelescopeResultsTitle = { fg = "#0a0014", bg = "#ff79c6", bold = true },
+      TelescopeSelection = { bg = "#1e0134" },
+      TelescopeMatching = { fg = "#7209B7", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#7209B7", bold = true },
+      CmpItemKindVariable = { fg = "#e0d0f0" },
+      CmpItemKindFunction = { fg = "#ff79c6" },
+      CmpItemKindKeyword = { fg = "#ff00ff" },
+      CmpItemKindClass = { fg = "#F72585" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#1e0e2a" },
+      IblScope = { fg = "#8060a0" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#0a0014", bg = "#7209B7", bold = true },
+      LazyButton = { fg = "#e0d0f0", bg = "#1e0e2a" },
+      LazyButtonActive = { fg = "#0a0014", bg = "#7209B7" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#60079b" },
+      NotifyWARNBorder = { fg = "#f1fa8c" },
+      NotifyINFOBorder = { fg = "#ff79c6" },
+      NotifyDEBUGBorder = { fg = "#8060a0" },
+      NotifyTRACEBorder = { fg = "#ff00ff" },
+    },
+  },
+}
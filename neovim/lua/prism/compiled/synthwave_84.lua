@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Synthwave 84
+-- Auto-generated by sync_themes.py from vscode/themes/synthwave_84.json - DO NOT EDIT
+
+return {
+  name = "Synthwave 84",
+  mode = "dark",
+  palette = {
+    base00 = "#262335",
+    base01 = "#302a42",
+    base02 = "#3d3a4d",
+    base03 = "#614d73",
+    base04 = "#956db7",
+    base05 = "#ff8b39",
+    base06 = "#ff9b4b",
+    base07 = "#ffab5d",
+    base08 = "#2dd3d1",
+    base09 = "#f4eee4",
+    base0A = "#36f9f6",
+    base0B = "#f97e72",
+    base0C = "#5efaf7",
+    base0D = "#36f9f6",
+    base0E = "#ff7edb",
+    base0F = "#ff7edb",
+  },
+  terminal = {
+    "#262335", "#2dd3d1", "#4af9f6", "#ff97e2",
+    "#36f9f6", "#28bab8", "#5efaf7", "#ff8b39",
+    "#ff7edb", "#36f9f6", "#5efaf7", "#ff8b39",
+    "#54f9f7", "#30e0dd", "#72faf8", "#ff964c",
+  },
+  groups = {
+    Normal = { fg = "#ff8b39", bg = "#262335" },
+    NormalFloat = { fg = "#ff8b39", bg = "#302a42" },
+    NormalNC = { fg = "#ff8b39", bg = "#262335" },
+    Cursor = { fg = "#262335", bg = "#36f9f6" },
+    CursorLine = { bg = "#302835" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#2c2635" },
+    LineNr = { fg = "#614d73" },
+    CursorLineNr = { fg = "#ff8b39", bold = true },
+    SignColumn = { fg = "#614d73", bg = "#262335" },
+    VertSplit = { fg = "#3d3a4d" },
+    WinSeparator = { fg = "#3d3a4d" },
+    Folded = { fg = "#614d73", bg = "#302a42" },
+    FoldColumn = { fg = "#614d73" },
+    NonText = { fg = "#614d73" },
+    SpecialKey = { fg = "#614d73" },
+    Whitespace = { fg = "#433854" },
+    MatchParen = { fg = "#36f9f6", bold = true },
+    Visual = { bg = "#2a636e" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#262335", bg = "#36f9f6" },
+    IncSearch = { fg = "#262335", bg = "#f4eee4" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#262335", bg = "#2dd3d1" },
+    Pmenu = { fg = "#ff8b39", bg = "#302a42" },
+    PmenuSel = { fg = "#ff8b39", bg = "#294d5b" },
+    PmenuSbar = { bg = "#3d3a4d" },
+    PmenuThumb = { bg = "#956db7" },
+    ErrorMsg = { fg = "#2dd3d1" },
+    WarningMsg = { fg = "#f4eee4" },
+    ModeMsg = { fg = "#ff8b39", bold = true },
+    MoreMsg = { fg = "#36f9f6" },
+    Question = { fg = "#36f9f6" },
+    TabLine = { fg = "#956db7", bg = "#302a42" },
+    TabLineFill = { bg = "#262335" },
+    TabLineSel = { fg = "#ff8b39", bg = "#262335", bold = true },
+    StatusLine = { fg = "#ff8b39", bg = "#302a42" },
+    StatusLineNC = { fg = "#956db7", bg = "#302a42" },
+    DiffAdd = { bg = "#45303e" },
+    DiffChange = { bg = "#44414f" },
+    DiffDelete = { fg = "#2dd3d1", bg = "#273d4c" },
+    DiffText = { bg = "#635f69" },
+    SpellBad = { sp = "#2dd3d1", undercurl = true },
+    SpellCap = { sp = "#f4eee4", undercurl = true },
+    SpellLocal = { sp = "#36f9f6", undercurl = true },
+    SpellRare = { sp = "#ff7edb", undercurl = true },
+    Comment = { fg = "#614d73" },
+    Constant = { fg = "#f4eee4" },
+    String = { fg = "#f97e72" },
+    Character = { fg = "#f97e72" },
+    Number = { fg = "#f4eee4" },
+    Boolean = { fg = "#f4eee4" },
+    Float = { fg = "#f4eee4" },
+    Identifier = { fg = "#e9c062" },
+    Function = { fg = "#36f9f6" },
+    Statement = { fg = "#ff7edb" },
+    Conditional = { fg = "#ff7edb" },
+    Repeat = { fg = "#ff7edb" },
+    Label = { fg = "#ff7edb" },
+    Operator = { fg = "#956db7" },
+    Keyword = { fg = "#ff7edb" },
+    Exception = { fg = "#ff7edb" },
+    PreProc = { fg = "#ff7edb" },
+    Include = { fg = "#ff7edb" },
+    Define = { fg = "#ff7edb" },
+    Macro = { fg = "#ff7edb" },
+    PreCondit = { fg = "#ff7edb" },
+    Type = { fg = "#ff8b39" },
+    StorageClass = { fg = "#ff7edb" },
+    Structure = { fg = "#ff8b39" },
+    Typedef = { fg = "#ff8b39" },
+    Special = { fg = "#5efaf7" },
+    SpecialChar = { fg = "#5efaf7" },
+    Tag = { fg = "#36f9f6" },
+    Delimiter = { fg = "#956db7" },
+    SpecialComment = { fg = "#614d73", italic = true },
+    Debug = { fg = "#f4eee4" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#614d73" },
+    Error = { fg = "#2dd3d1" },
+    Todo = { fg = "#262335", bg = "#36f9f6", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#e9c062" },
+      ["@variable.builtin"] = { fg = "#ff7edb" },
+      ["@variable.parameter"] = { fg = "#e9c062", italic = true },
+      ["@variable.member"] = { fg = "#e9c062" },
+      ["@constant"] = { fg = "#f4eee4" },
+      ["@constant.builtin"] = { fg = "#f4eee4" },
+      ["@module"] = { fg = "#ff8b39" },
+      ["@label"] = { fg = "#ff7edb" },
+      ["@type"] = { fg = "#ff8b39" },
+      ["@type.builtin"] = { fg = "#ff8b39" },
+      ["@attribute"] = { fg = "#ff9042" },
+      ["@property"] = { fg = "#e9c062" },
+      ["@function"] = { fg = "#36f9f6" },
+      ["@function.builtin"] = { fg = "#36f9f6" },
+      ["@function.call"] = { fg = "#36f9f6" },
+      ["@function.method"] = { fg = "#36f9f6" },
+      ["@constructor"] = { fg = "#ff8b39" },
+      ["@operator"] = { fg = "#956db7" },
+      ["@keyword"] = { fg = "#ff7edb" },
+      ["@keyword.conditional"] = { fg = "#ff7edb" },
+      ["@keyword.function"] = { fg = "#ff7edb" },
+      ["@keyword.operator"] = { fg = "#ff7edb" },
+      ["@keyword.return"] = { fg = "#ff7edb" },
+      ["@punctuation.bracket"] = { fg = "#956db7" },
+      ["@punctuation.delimiter"] = { fg = "#956db7" },
+      ["@punctuation.special"] = { fg = "#5efaf7" },
+      ["@string"] = { fg = "#f97e72" },
+      ["@string.escape"] = { fg = "#5efaf7" },
+      ["@string.regexp"] = { fg = "#5efaf7" },
+      ["@character"] = { fg = "#f97e72" },
+      ["@boolean"] = { fg = "#f4eee4" },
+      ["@number"] = { fg = "#f4eee4" },
+      ["@comment"] = { fg = "#614d73", italic = true },
+      ["@comment.todo"] = { fg = "#262335", bg = "#36f9f6", bold = true },
+      ["@comment.error"] = { fg = "#2dd3d1", bold = true },
+      ["@comment.warning"] = { fg = "#f4eee4", bold = true },
+      ["@comment.note"] = { fg = "#36f9f6", bold = true },
+      ["@markup.heading"] = { fg = "#ff7edb", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#f97e72" },
+      ["@markup.link"] = { fg = "#36f9f6", underline = true },
+      ["@tag"] = { fg = "#36f9f6" },
+      ["@tag.attribute"] = { fg = "#ff9042" },
+      ["@tag.delimiter"] = { fg = "#956db7" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#2dd3d1" },
+      DiagnosticWarn = { fg = "#f4eee4" },
+      DiagnosticInfo = { fg = "#36f9f6" },
+      DiagnosticHint = { fg = "#36f9f6" },
+      DiagnosticUnderlineError = { sp = "#2dd3d1", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#f4eee4", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#36f9f6", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#36f9f6", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#2dd3d1", bg = "#263444" },
+      DiagnosticVirtualTextWarn = { fg = "#f4eee4", bg = "#3a3746" },
+      DiagnosticVirtualTextInfo = { fg = "#36f9f6", bg = "#273848" },
+      DiagnosticVirtualTextHint = { fg = "#36f9f6", bg = "#273848" },
+      LspReferenceText = { bg = "#3b2d35" },
+      LspReferenceRead = { bg = "#3b2d35" },
+      LspReferenceWrite = { bg = "#463235" },
+      LspSignatureActiveParameter = { fg = "#36f9f6", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#f97e72" },
+      GitSignsChange = { fg = "#f4eee4" },
+      GitSignsDelete = { fg = "#2dd3d1" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#ff8b39", bg = "#262335" },
+      TelescopeBorder = { fg = "#3d3a4d", bg = "#262335" },
+      TelescopePromptTitle = { fg = "#262335", bg = "#36f9f6", bold = true },
+      TelescopePreviewTitle = { fg = "#262335", bg = "#f97e72", bold = true },
+      TelescopeResultsTitle = { fg = "#262335", bg = "#36f9f6", bold = true },
+      TelescopeSelection = { bg = "#294d5b" },
+      TelescopeMatching = { fg = "#36f9f6", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#36f9f6", bold = true },
+      CmpItemKindVariable = { fg = "#e9c062" },
+      CmpItemKindFunction = { fg = "#36f9f6" },
+      CmpItemKindKeyword = { fg = "#ff7edb" },
+      CmpItemKindClass = { fg = "#ff8b39" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#3d3a4d" },
+      IblScope = { fg = "#614d73" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#262335", bg = "#36f9f6", bold = true },
+      LazyButton = { fg = "#ff8b39", bg = "#3d3a4d" },
+      LazyButtonActive = { fg = "#262335", bg = "#36f9f6" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#2dd3d1" },
+      NotifyWARNBorder = { fg = "#f4eee4" },
+      NotifyINFOBorder = { fg = "#36f9f6" },
+      NotifyDEBUGBorder = { fg = "#614d73" },
+      NotifyTRACEBorder = { fg = "#ff7edb" },
+    },
+  },
+}
@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Tessier
+-- Auto-generated by sync_themes.py from vscode/themes/tessier.json - DO NOT EDIT
+
+return {
+  name = "Tessier",
+  mode = "light",
+  palette = {
+    base00 = "#ffffff",
+    base01 = "#f0f3f6",
+    base02 = "#e1e1e1",
+    base03 = "#6b7a8a",
+    base04 = "#404b56",
+    base05 = "#1a2028",
+    base06 = "#0f141c",
+    base07 = "#050a11",
+    base08 = "#054aaa",
+    base09 = "#3080d0",
+    base0A = "#0758c9",
+    base0B = "#054090",
+    base0C = "#2c71d1",
+    base0D = "#1a70e0",
+    base0E = "#0758c9",
+    base0F = "#6b7a8a",
+  },
+  terminal = {
+    "#1a2028", "#054aaa", "#1f68ce", "#6b7a8a",
+    "#0758c9", "#054296", "#2c71d1", "#ffffff",
+    "#6b7a8a", "#0758c9", "#2c71d1", "#798795",
+    "#1f68ce", "#064fb4", "#4581d6", "#ffffff",
+  },
+  groups = {
+    Normal = { fg = "#1a2028", bg = "#ffffff" },
+    NormalFloat = { fg = "#1a2028", bg = "#f0f3f6" },
+    NormalNC = { fg = "#1a2028", bg = "#ffffff" },
+    Cursor = { fg = "#ffffff", bg = "#0758c9" },
+    CursorLine = { bg = "#f3f3f4" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#f8f8f8" },
+    LineNr = { fg = "#6b7a8a" },
+    CursorLineNr = { fg = "#1a2028", bold = true },
+    SignColumn = { fg = "#6b7a8a", bg = "#ffffff" },
+    VertSplit = { fg = "#e1e1e1" },
+    WinSeparator = { fg = "#e1e1e1" },
+    Folded = { fg = "#6b7a8a", bg = "#f0f3f6" },
+    FoldColumn = { fg = "#6b7a8a" },
+    NonText = { fg = "#6b7a8a" },
+    SpecialKey = { fg = "#6b7a8a" },
+    Whitespace = { fg = "#b5bcc4" },
+    MatchParen = { fg = "#0758c9", bold = true },
+    Visual = { bg = "#b4ccee" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#ffffff", bg = "#0758c9" },
+    IncSearch = { fg = "#ffffff", bg = "#3080d0" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#ffffff", bg = "#054aaa" },
+    Pmenu = { fg = "#1a2028", bg = "#f0f3f6" },
+    PmenuSel = { fg = "#1a2028", bg = "#cdddf4" },
+    PmenuSbar = { bg = "#e1e1e1" },
+    PmenuThumb = { bg = "#404b56" },
+    ErrorMsg = { fg = "#054aaa" },
+    WarningMsg = { fg = "#3080d0" },
+    ModeMsg = { fg = "#1a2028", bold = true },
+    MoreMsg = { fg = "#1a70e0" },
+    Question = { fg = "#1a70e0" },
+    TabLine = { fg = "#404b56", bg = "#f0f3f6" },
+    TabLineFill = { bg = "#ffffff" },
+    TabLineSel = { fg = "#1a2028", bg = "#ffffff", bold = true },
+    StatusLine = { fg = "#1a2028", bg = "#f0f3f6" },
+    StatusLineNC = { fg = "#404b56", bg = "#f0f3f6" },
+    DiffAdd = { bg = "#d9e2ee" },
+    DiffChange = { bg = "#dfebf7" },
+    DiffDelete = { fg = "#054aaa", bg = "#d9e3f2" },
+    DiffText = { bg = "#c0d8f0" },
+    SpellBad = { sp = "#054aaa", undercurl = true },
+    SpellCap = { sp = "#3080d0", undercurl = true },
+    SpellLocal = { sp = "#1a70e0", undercurl = true },
+    SpellRare = { sp = "#0758c9", undercurl = true },
+    Comment = { fg = "#6b7a8a" },
+    Constant = { fg = "#3080d0" },
+    String = { fg = "#054090" },
+    Character = { fg = "#054090" },
+    Number = { fg = "#3080d0" },
+    Boolean = { fg = "#3080d0" },
+    Float = { fg = "#3080d0" },
+    Identifier = { fg = "#1a2028" },
+    Function = { fg = "#1a70e0" },
+    Statement = { fg = "#0758c9" },
+    Conditional = { fg = "#0758c9" },
+    Repeat = { fg = "#0758c9" },
+    Label = { fg = "#0758c9" },
+    Operator = { fg = "#404b56" },
+    Keyword = { fg = "#0758c9" },
+    Exception = { fg = "#0758c9" },
+    PreProc = { fg = "#0758c9" },
+    Include = { fg = "#0758c9" },
+    Define = { fg = "#0758c9" },
+    Macro = { fg = "#0758c9" },
+    PreCondit = { fg = "#0758c9" },
+    Type = { fg = "#0550b0" },
+    StorageClass = { fg = "#0758c9" },
+    Structure = { fg = "#0550b0" },
+    Typedef = { fg = "#0550b0" },
+    Special = { fg = "#2c71d1" },
+    SpecialChar = { fg = "#2c71d1" },
+    Tag = { fg = "#257cf7" },
+    Delimiter = { fg = "#404b56" },
+    SpecialComment = { fg = "#6b7a8a", italic = true },
+    Debug = { fg = "#3080d0" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#6b7a8a" },
+    Error = { fg = "#054aaa" },
+    Todo = { fg = "#ffffff", bg = "#0758c9", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#1a2028" },
+      ["@variable.builtin"] = { fg = "#0758c9" },
+      ["@variable.parameter"] = { fg = "#1a2028", italic = true },
+      ["@variable.member"] = { fg = "#1a2028" },
+      ["@constant"] = { fg = "#3080d0" },
+      ["@constant.builtin"] = { fg = "#3080d0" },
+      ["@module"] = { fg = "#1a2028" },
+      ["@label"] = { fg = "#0758c9" },
+      ["@type"] = { fg = "#0550b0" },
+      ["@type.builtin"] = { fg = "#0550b0" },
+      ["@attribute"] = { fg = "#064fb4" },
+      ["@property"] = { fg = "#1a2028" },
+      ["@function"] = { fg = "#1a70e0" },
+      ["@function.builtin"] = { fg = "#1a70e0" },
+      ["@function.call"] = { fg = "#1a70e0" },
+      ["@function.method"] = { fg = "#1a70e0" },
+      ["@constructor"] = { fg = "#0550b0" },
+      ["@operator"] = { fg = "#404b56" },
+      ["@keyword"] = { fg = "#0758c9" },
+      ["@keyword.conditional"] = { fg = "#0758c9" },
+      ["@keyword.function"] = { fg = "#0758c9" },
+      ["@keyword.operator"] = { fg = "#0758c9" },
+      ["@keyword.return"] = { fg = "#0758c9" },
+      ["@punctuation.bracket"] = { fg = "#404b56" },
+      ["@punctuation.delimiter"] = { fg = "#404b56" },
+      ["@punctuation.special"] = { fg = "#2c71d1" },
+      ["@string"] = { fg = "#054090" },
+      ["@string.escape"] = { fg = "#2c71d1" },
+      ["@string.regexp"] = { fg = "#2c71d1" },
+      ["@character"] = { fg = "#054090" },
+      ["@boolean"] = { fg = "#3080d0" },
+      ["@number"] = { fg = "#3080d0" },
+      ["@comment"] = { fg = "#6b7a8a", italic = true },
+      ["@comment.todo"] = { fg = "#ffffff", bg = "#0758c9", bold = true },
+      ["@comment.error"] = { fg = "#054aaa", bold = true },
+      ["@comment.warning"] = { fg = "#3080d0", bold = true },
+      ["@comment.note"] = { fg = "#1a70e0", bold = true },
+      ["@markup.heading"] = { fg = "#0758c9", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#054090" },
+      ["@markup.link"] = { fg = "#1a70e0", underline = true },
+      ["@tag"] = { fg = "#257cf7" },
+      ["@tag.attribute"] = { fg = "#064fb4" },
+      ["@tag.delimiter"] = { fg = "#404b56" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#054aaa" },
+      DiagnosticWarn = { fg = "#3080d0" },
+      DiagnosticInfo = { fg = "#1a70e0" },
+      DiagnosticHint = { fg = "#0758c9" },
+      DiagnosticUnderlineError = { sp = "#054aaa", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#3080d0", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#1a70e0", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#0758c9", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#054aaa", bg = "#e6ecf6" },
+      DiagnosticVirtualTextWarn = { fg = "#3080d0", bg = "#eaf2fa" },
+      DiagnosticVirtualTextInfo = { fg = "#1a70e0", bg = "#e8f0fb" },
+      DiagnosticVirtualTextHint = { fg = "#0758c9", bg = "#e6eef9" },
+      LspReferenceText = { bg = "#e8e8e9" },
+      LspReferenceRead = { bg = "#e8e8e9" },
+      LspReferenceWrite = { bg = "#dcddde" },
+      LspSignatureActiveParameter = { fg = "#0758c9", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#054090" },
+      GitSignsChange = { fg = "#3080d0" },
+      GitSignsDelete = { fg = "#054aaa" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#1a2028", bg = "#ffffff" },
+      TelescopeBorder = { fg = "#e1e1e1", bg = "#ffffff" },
+      TelescopePromptTitle = { fg = "#ffffff", bg = "#0758c9", bold = true },
+      TelescopePreviewTitle = { fg = "#ffffff", bg = "#054090", bold = true },
+      TelescopeResultsTitle = { fg = "#ffffff", bg = "#1a70e0", bold = true },
+      TelescopeSelection = { bg = "#cdddf4" },
+      TelescopeMatching = { fg = "#0758c9", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#0758c9", bold = true },
+      CmpItemKindVariable = { fg = "#1a2028" },
+      CmpItemKindFunction = { fg = "#1a70e0" },
+      CmpItemKindKeyword = { fg = "#0758c9" },
+      CmpItemKindClass = { fg = "#0550b0" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#e1e1e1" },
+      IblScope = { fg = "#6b7a8a" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#ffffff", bg = "#0758c9", bold = true },
+      LazyButton = { fg = "#1a2028", bg = "#e1e1e1" },
+      LazyButtonActive = { fg = "#ffffff", bg = "#0758c9" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#054aaa" },
+      NotifyWARNBorder = { fg = "#3080d0" },
+      NotifyINFOBorder = { fg = "#1a70e0" },
+      NotifyDEBUGBorder = { fg = "#6b7a8a" },
+      NotifyTRACEBorder = { fg = "#0758c9" },
+    },
+  },
+}
@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Tide Pool
+-- Auto-generated by sync_themes.py from vscode/themes/tide_pool.json - DO NOT EDIT
+
+return {
+  name = "Tide Pool",
+  mode = "dark",
+  palette = {
+    base00 = "#06090c",
+    base01 = "#0c1218",
+    base02 = "#191d20",
+    base03 = "#485560",
+    base04 = "#919eaa",
+    base05 = "#e0f0f8",
+    base06 = "#f1ffff",
+    base07 = "#f2ffff",
+    base08 = "#36beb0",
+    base09 = "#66e6d9",
+    base0A = "#40e0d0",
+    base0B = "#79e9de",
+    base0C = "#66e6d9",
+    base0D = "#6fe7db",
+    base0E = "#40e0d0",
+    base0F = "#485560",
+  },
+  terminal = {
+    "#06090c", "#36beb0", "#53e3d4", "#6c777f",
+    "#40e0d0", "#30a89c", "#66e6d9", "#e0f0f8",
+    "#485560", "#40e0d0", "#66e6d9", "#e0f0f8",
+    "#5ce4d7", "#39c9bb", "#79e9de", "#e3f1f8",
+  },
+  groups = {
+    Normal = { fg = "#e0f0f8", bg = "#06090c" },
+    NormalFloat = { fg = "#e0f0f8", bg = "#0c1218" },
+    NormalNC = { fg = "#e0f0f8", bg = "#06090c" },
+    Cursor = { fg = "#06090c", bg = "#40e0d0" },
+    CursorLine = { bg = "#101417" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#0c0f13" },
+    LineNr = { fg = "#485560" },
+    CursorLineNr = { fg = "#e0f0f8", bold = true },
+    SignColumn = { fg = "#485560", bg = "#06090c" },
+    VertSplit = { fg = "#191d20" },
+    WinSeparator = { fg = "#191d20" },
+    Folded = { fg = "#485560", bg = "#0c1218" },
+    FoldColumn = { fg = "#485560" },
+    NonText = { fg = "#485560" },
+    SpecialKey = { fg = "#485560" },
+    Whitespace = { fg = "#272f36" },
+    MatchParen = { fg = "#40e0d0", bold = true },
+    Visual = { bg = "#174946" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#06090c", bg = "#40e0d0" },
+    IncSearch = { fg = "#06090c", bg = "#66e6d9" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#06090c", bg = "#36beb0" },
+    Pmenu = { fg = "#e0f0f8", bg = "#0c1218" },
+    PmenuSel = { fg = "#e0f0f8", bg = "#113433" },
+    PmenuSbar = { bg = "#191d20" },
+    PmenuThumb = { bg = "#919eaa" },
+    ErrorMsg = { fg = "#36beb0" },
+    WarningMsg = { fg = "#66e6d9" },
+    ModeMsg = { fg = "#e0f0f8", bold = true },
+    MoreMsg = { fg = "#6fe7db" },
+    Question = { fg = "#6fe7db" },
+    TabLine = { fg = "#919eaa", bg = "#0c1218" },
+    TabLineFill = { bg = "#06090c" },
+    TabLineSel = { fg = "#e0f0f8", bg = "#06090c", bold = true },
+    StatusLine = { fg = "#e0f0f8", bg = "#0c1218" },
+    StatusLineNC = { fg = "#919eaa", bg = "#0c1218" },
+    DiffAdd = { bg = "#172a2b" },
+    DiffChange = { bg = "#142a2a" },
+    DiffDelete = { fg = "#36beb0", bg = "#0d2424" },
+    DiffText = { bg = "#224b49" },
+    SpellBad = { sp = "#36beb0", undercurl = true },
+    SpellCap = { sp = "#66e6d9", undercurl = true },
+    SpellLocal = { sp = "#6fe7db", undercurl = true },
+    SpellRare = { sp = "#40e0d0", undercurl = true },
+    Comment = { fg = "#485560" },
+    Constant = { fg = "#66e6d9" },
+    String = { fg = "#79e9de" },
+    Character = { fg = "#79e9de" },
+    Number = { fg = "#66e6d9" },
+    Boolean = { fg = "#66e6d9" },
+    Float = { fg = "#66e6d9" },
+    Identifier = { fg = "#e0f0f8" },
+    Function = { fg = "#6fe7db" },
+    Statement = { fg = "#40e0d0" },
+    Conditional = { fg = "#40e0d0" },
+    Repeat = { fg = "#40e0d0" },
+    Label = { fg = "#40e0d0" },
+    Operator = { fg = "#919eaa" },
+    Keyword = { fg = "#40e0d0" },
+    Exception = { fg = "#40e0d0" },
+    PreProc = { fg = "#40e0d0" },
+    Include = { fg = "#40e0d0" },
+    Define = { fg = "#40e0d0" },
+    Macro = { fg = "#40e0d0" },
+    PreCondit = { fg = "#40e0d0" },
+    Type = { fg = "#e0f0f8" },
+    StorageClass = { fg = "#40e0d0" },
+    Structure = { fg = "#e0f0f8" },
+    Typedef = { fg = "#e0f0f8" },
+    Special = { fg = "#66e6d9" },
+    SpecialChar = { fg = "#66e6d9" },
+    Tag = { fg = "#79e9de" },
+    Delimiter = { fg = "#919eaa" },
+    SpecialComment = { fg = "#485560", italic = true },
+    Debug = { fg = "#66e6d9" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#485560" },
+    Error = { fg = "#36beb0" },
+    Todo = { fg = "#06090c", bg = "#40e0d0", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#e0f0f8" },
+      ["@variable.builtin"] = { fg = "#40e0d0" },
+      ["@variable.parameter"] = { fg = "#e0f0f8", italic = true },
+      ["@variable.member"] = { fg = "#e0f0f8" },
+      ["@constant"] = { fg = "#66e6d9" },
+      ["@constant.builtin"] = { fg = "#66e6d9" },
+      ["@module"] = { fg = "#e0f0f8" },
+      ["@label"] = { fg = "#40e0d0" },
+      ["@type"] = { fg = "#e0f0f8" },
+      ["@type.builtin"] = { fg = "#e0f0f8" },
+      ["@attribute"] = { fg = "#e1f0f8" },
+      ["@property"] = { fg = "#e0f0f8" },
+      ["@function"] = { fg = "#6fe7db" },
+      ["@function.builtin"] = { fg = "#6fe7db" },
+      ["@function.call"] = { fg = "#6fe7db" },
+      ["@function.method"] = { fg = "#6fe7db" },
+      ["@constructor"] = { fg = "#e0f0f8" },
+      ["@operator"] = { fg = "#919eaa" },
+      ["@keyword"] = { fg = "#40e0d0" },
+      ["@keyword.conditional"] = { fg = "#40e0d0" },
+      ["@keyword.function"] = { fg = "#40e0d0" },
+      ["@keyword.operator"] = { fg = "#40e0d0" },
+      ["@keyword.return"] = { fg = "#40e0d0" },
+      ["@punctuation.bracket"] = { fg = "#919eaa" },
+      ["@punctuation.delimiter"] = { fg = "#919eaa" },
+      ["@punctuation.special"] = { fg = "#66e6d9" },
+      ["@string"] = { fg = "#79e9de" },
+      ["@string.escape"] = { fg = "#66e6d9" },
+      ["@string.regexp"] = { fg = "#66e6d9" },
+      ["@character"] = { fg = "#79e9de" },
+      ["@boolean"] = { fg = "#66e6d9" },
+      ["@number"] = { fg = "#66e6d9" },
+      ["@comment"] = { fg = "#485560", italic = true },
+      ["@comment.todo"] = { fg = "#06090c", bg = "#40e0d0", bold = true },
+      ["@comment.error"] = { fg = "#36beb0", bold = true },
+      ["@comment.warning"] = { fg = "#66e6d9", bold = true },
+      ["@comment.note"] = { fg = "#6fe7db", bold = true },
+      ["@markup.heading"] = { fg = "#40e0d0", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#79e9de" },
+      ["@markup.link"] = { fg = "#6fe7db", underline = true },
+      ["@tag"] = { fg = "#79e9de" },
+      ["@tag.attribute"] = { fg = "#e1f0f8" },
+      ["@tag.delimiter"] = { fg = "#919eaa" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#36beb0" },
+      DiagnosticWarn = { fg = "#66e6d9" },
+      DiagnosticInfo = { fg = "#6fe7db" },
+      DiagnosticHint = { fg = "#40e0d0" },
+      DiagnosticUnderlineError = { sp = "#36beb0", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#66e6d9", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#6fe7db", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#40e0d0", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#36beb0", bg = "#0a1b1c" },
+      DiagnosticVirtualTextWarn = { fg = "#66e6d9", bg = "#0f1f20" },
+      DiagnosticVirtualTextInfo = { fg = "#6fe7db", bg = "#101f20" },
+      DiagnosticVirtualTextHint = { fg = "#40e0d0", bg = "#0b1e1f" },
+      LspReferenceText = { bg = "#1b2023" },
+      LspReferenceRead = { bg = "#1b2023" },
+      LspReferenceWrite = { bg = "#262b2f" },
+      LspSignatureActiveParameter = { fg = "#40e0d0", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#79e9de" },
+      GitSignsChange = { fg = "#66e6d9" },
+      GitSignsDelete = { fg = "#36beb0" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#e0f0f8", bg = "#06090c" },
+      TelescopeBorder = { fg = "#191d20", bg = "#06090c" },
+      TelescopePromptTitle = { fg = "#06090c", bg = "#40e0d0", bold = true },
+      TelescopePreviewTitle = { fg = "#06090c", bg = "#79e9de", bold = true },
+      TelescopeResultsTitle = { fg = "#06090c", bg = "#6fe7db", bold = true },
+      TelescopeSelection = { bg = "#113433" },
+      TelescopeMatching = { fg = "#40e0d0", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#40e0d0", bold = true },
+      CmpItemKindVariable = { fg = "#e0f0f8" },
+      CmpItemKindFunction = { fg = "#6fe7db" },
+      CmpItemKindKeyword = { fg = "#40e0d0" },
+      CmpItemKindClass = { fg = "#e0f0f8" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#191d20" },
+      IblScope = { fg = "#485560" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#06090c", bg = "#40e0d0", bold = true },
+      LazyButton = { fg = "#e0f0f8", bg = "#191d20" },
+      LazyButtonActive = { fg = "#06090c", bg = "#40e0d0" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#36beb0" },
+      NotifyWARNBorder = { fg = "#66e6d9" },
+      NotifyINFOBorder = { fg = "#6fe7db" },
+      NotifyDEBUGBorder = { fg = "#485560" },
+      NotifyTRACEBorder = { fg = "#40e0d0" },
+    },
+  },
+}
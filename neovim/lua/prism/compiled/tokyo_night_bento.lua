@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Tokyo Night Bento
+-- Auto-generated by sync_themes.py from vscode/themes/tokyo_night_bento.json - DO NOT EDIT
+
+return {
+  name = "Tokyo Night Bento",
+  mode = "dark",
+  palette = {
+    base00 = "#0f0f18",
+    base01 = "#16161f",
+    base02 = "#23242e",
+    base03 = "#6878a0",
+    base04 = "#a5afc8",
+    base05 = "#e8e8f0",
+    base06 = "#f9f9ff",
+    base07 = "#fefeff",
+    base08 = "#9e82d1",
+    base09 = "#ff9e64",
+    base0A = "#bb9af7",
+    base0B = "#9ece6a",
+    base0C = "#c8aef8",
+    base0D = "#8b53f1",
+    base0E = "#bb9af7",
+    base0F = "#5a5a6a",
+  },
+  terminal = {
+    "#0f0f18", "#9e82d1", "#c1a4f7", "#7b7b87",
+    "#bb9af7", "#8c73b9", "#c8aef8", "#e8e8f0",
+    "#5a5a6a", "#bb9af7", "#c8aef8", "#e8e8f0",
+    "#c5a9f8", "#a88ade", "#cfb8f9", "#eaeaf1",
+  },
+  groups = {
+    Normal = { fg = "#e8e8f0", bg = "#0f0f18" },
+    NormalFloat = { fg = "#e8e8f0", bg = "#16161f" },
+    NormalNC = { fg = "#e8e8f0", bg = "#0f0f18" },
+    Cursor = { fg = "#0f0f18", bg = "#bb9af7" },
+    CursorLine = { bg = "#191922" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#15151e" },
+    LineNr = { fg = "#6878a0" },
+    CursorLineNr = { fg = "#e8e8f0", bold = true },
+    SignColumn = { fg = "#6878a0", bg = "#0f0f18" },
+    VertSplit = { fg = "#23242e" },
+    WinSeparator = { fg = "#23242e" },
+    Folded = { fg = "#6878a0", bg = "#16161f" },
+    FoldColumn = { fg = "#6878a0" },
+    NonText = { fg = "#6878a0" },
+    SpecialKey = { fg = "#6878a0" },
+    Whitespace = { fg = "#3b435c" },
+    MatchParen = { fg = "#bb9af7", bold = true },
+    Visual = { bg = "#42385a" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#0f0f18", bg = "#bb9af7" },
+    IncSearch = { fg = "#0f0f18", bg = "#ff9e64" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#0f0f18", bg = "#9e82d1" },
+    Pmenu = { fg = "#e8e8f0", bg = "#16161f" },
+    PmenuSel = { fg = "#e8e8f0", bg = "#312a44" },
+    PmenuSbar = { bg = "#23242e" },
+    PmenuThumb = { bg = "#a5afc8" },
+    ErrorMsg = { fg = "#9e82d1" },
+    WarningMsg = { fg = "#ff9e64" },
+    ModeMsg = { fg = "#e8e8f0", bold = true },
+    MoreMsg = { fg = "#8b53f1" },
+    Question = { fg = "#8b53f1" },
+    TabLine = { fg = "#a5afc8", bg = "#16161f" },
+    TabLineFill = { bg = "#0f0f18" },
+    TabLineSel = { fg = "#e8e8f0", bg = "#0f0f18", bold = true },
+    StatusLine = { fg = "#e8e8f0", bg = "#16161f" },
+    StatusLineNC = { fg = "#a5afc8", bg = "#16161f" },
+    DiffAdd = { bg = "#242b24" },
+    DiffChange = { bg = "#332423" },
+    DiffDelete = { fg = "#9e82d1", bg = "#242033" },
+    DiffText = { bg = "#57392e" },
+    SpellBad = { sp = "#9e82d1", undercurl = true },
+    SpellCap = { sp = "#ff9e64", undercurl = true },
+    SpellLocal = { sp = "#8b53f1", undercurl = true },
+    SpellRare = { sp = "#bb9af7", undercurl = true },
+    Comment = { fg = "#6878a0" },
+    Constant = { fg = "#ff9e64" },
+    String = { fg = "#9ece6a" },
+    Character = { fg = "#9ece6a" },
+    Number = { fg = "#ff9e64" },
+    Boolean = { fg = "#ff9e64" },
+    Float = { fg = "#ff9e64" },
+    Identifier = { fg = "#7aa2f7" },
+    Function = { fg = "#8b53f1" },
+    Statement = { fg = "#bb9af7" },
+    Conditional = { fg = "#bb9af7" },
+    Repeat = { fg = "#bb9af7" },
+    Label = { fg = "#bb9af7" },
+    Operator = { fg = "#a5afc8" },
+    Keyword = { fg = "#bb9af7" },
+    Exception = { fg = "#bb9af7" },
+    PreProc = { fg = "#bb9af7" },
+    Include = { fg = "#bb9af7" },
+    Define = { fg = "#bb9af7" },
+    Macro = { fg = "#bb9af7" },
+    PreCondit = { fg = "#bb9af7" },
+    Type = { fg = "#2ac3de" },
+    StorageClass = { fg = "#bb9af7" },
+    Structure = { fg = "#2ac3de" },
+    Typedef = { fg = "#2ac3de" },
+    Special = { fg = "#c8aef8" },
+    SpecialChar = { fg = "#c8aef8" },
+    Tag = { fg = "#9ece6a" },
+    Delimiter = { fg = "#a5afc8" },
+    SpecialComment = { fg = "#6878a0", italic = true },
+    Debug = { fg = "#ff9e64" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#6878a0" },
+    Error = { fg = "#9e82d1" },
+    Todo = { fg = "#0f0f18", bg = "#bb9af7", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#7aa2f7" },
+      ["@variable.builtin"] = { fg = "#bb9af7" },
+      ["@variable.parameter"] = { fg = "#7aa2f7", italic = true },
+      ["@variable.member"] = { fg = "#7aa2f7" },
+      ["@constant"] = { fg = "#ff9e64" },
+      ["@constant.builtin"] = { fg = "#ff9e64" },
+      ["@module"] = { fg = "#e8e8f0" },
+      ["@label"] = { fg = "#bb9af7" },
+      ["@type"] = { fg = "#2ac3de" },
+      ["@type.builtin"] = { fg = "#2ac3de" },
+      ["@attribute"] = { fg = "#c5a9f8" },
+      ["@property"] = { fg = "#7aa2f7" },
+      ["@function"] = { fg = "#8b53f1" },
+      ["@function.builtin"] = { fg = "#8b53f1" },
+      ["@function.call"] = { fg = "#8b53f1" },
+      ["@function.method"] = { fg = "#8b53f1" },
+      ["@constructor"] = { fg = "#2ac3de" },
+      ["@operator"] = { fg = "#a5afc8" },
+      ["@keyword"] = { fg = "#bb9af7" },
+      ["@keyword.conditional"] = { fg = "#bb9af7" },
+      ["@keyword.function"] = { fg = "#bb9af7" },
+      ["@keyword.operator"] = { fg = "#bb9af7" },
+      ["@keyword.return"] = { fg = "#bb9af7" },
+      ["@punctuation.bracket"] = { fg = "#a5afc8" },
+      ["@punctuation.delimiter"] = { fg = "#a5afc8" },
+      ["@punctuation.special"] = { fg = "#c8aef8" },
+      ["@string"] = { fg = "#9ece6a" },
+      ["@string.escape"] = { fg = "#c8aef8" },
+      ["@string.regexp"] = { fg = "#c8aef8" },
+      ["@character"] = { fg = "#9ece6a" },
+      ["@boolean"] = { fg = "#ff9e64" },
+      ["@number"] = { fg = "#ff9e64" },
+      ["@comment"] = { fg = "#6878a0", italic = true },
+      ["@comment.todo"] = { fg = "#0f0f18", bg = "#bb9af7", bold = true },
+      ["@comment.error"] = { fg = "#9e82d1", bold = true },
+      ["@comment.warning"] = { fg = "#ff9e64", bold = true },
+      ["@comment.note"] = { fg = "#8b53f1", bold = true },
+      ["@markup.heading"] = { fg = "#bb9af7", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#9ece6a" },
+      ["@markup.link"] = { fg = "#8b53f1", underline = true },
+      ["@tag"] = { fg = "#9ece6a" },
+      ["@tag.attribute"] = { fg = "#c5a9f8" },
+      ["@tag.delimiter"] = { fg = "#a5afc8" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#9e82d1" },
+      DiagnosticWarn = { fg = "#ff9e64" },
+      DiagnosticInfo = { fg = "#8b53f1" },
+      DiagnosticHint = { fg = "#bb9af7" },
+      DiagnosticUnderlineError = { sp = "#9e82d1", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#ff9e64", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#8b53f1", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#bb9af7", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#9e82d1", bg = "#1d1a2a" },
+      DiagnosticVirtualTextWarn = { fg = "#ff9e64", bg = "#271d1f" },
+      DiagnosticVirtualTextInfo = { fg = "#8b53f1", bg = "#1b152d" },
+      DiagnosticVirtualTextHint = { fg = "#bb9af7", bg = "#201c2e" },
+      LspReferenceText = { bg = "#24242d" },
+      LspReferenceRead = { bg = "#24242d" },
+      LspReferenceWrite = { bg = "#2f2f38" },
+      LspSignatureActiveParameter = { fg = "#bb9af7", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#9ece6a" },
+      GitSignsChange = { fg = "#ff9e64" },
+      GitSignsDelete = { fg = "#9e82d1" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#e8e8f0", bg = "#0f0f18" },
+      TelescopeBorder = { fg = "#23242e", bg = "#0f0f18" },
+      TelescopePromptTitle = { fg = "#0f0f18", bg = "#bb9af7", bold = true },
+      TelescopePreviewTitle = { fg = "#0f0f18", bg = "#9ece6a", bold = true },
+      TelescopeResultsTitle = { fg = "#0f0f18", bg = "#8b53f1", bold = true },
+      TelescopeSelection = { bg = "#312a44" },
+      TelescopeMatching = { fg = "#bb9af7", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#bb9af7", bold = true },
+      CmpItemKindVariable = { fg = "#7aa2f7" },
+      CmpItemKindFunction = { fg = "#8b53f1" },
+      CmpItemKindKeyword = { fg = "#bb9af7" },
+      CmpItemKindClass = { fg = "#2ac3de" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#23242e" },
+      IblScope = { fg = "#6878a0" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#0f0f18", bg = "#bb9af7", bold = true },
+      LazyButton = { fg = "#e8e8f0", bg = "#23242e" },
+      LazyButtonActive = { fg = "#0f0f18", bg = "#bb9af7" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#9e82d1" },
+      NotifyWARNBorder = { fg = "#ff9e64" },
+      NotifyINFOBorder = { fg = "#8b53f1" },
+      NotifyDEBUGBorder = { fg = "#6878a0" },
+      NotifyTRACEBorder = { fg = "#bb9af7" },
+    },
+  },
+}
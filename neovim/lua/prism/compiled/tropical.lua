@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Tropical
+-- Auto-generated by sync_themes.py from vscode/themes/tropical.json - DO NOT EDIT
+
+return {
+  name = "Tropical",
+  mode = "dark",
+  palette = {
+    base00 = "#0a1810",
+    base01 = "#0f8a63",
+    base02 = "#1f2e25",
+    base03 = "#708870",
+    base04 = "#cadbca",
+    base05 = "#f0f8f0",
+    base06 = "#fafffa",
+    base07 = "#fafffa",
+    base08 = "#c11f55",
+    base09 = "#ff8090",
+    base0A = "#E42565",
+    base0B = "#ffd0d8",
+    base0C = "#e95083",
+    base0D = "#ffffff",
+    base0E = "#E42565",
+    base0F = "#C2095A",
+  },
+  terminal = {
+    "#0B6E4F", "#c11f55", "#e63a74", "#ce3a7b",
+    "#E42565", "#ab1b4b", "#e95083", "#D9E76C",
+    "#C2095A", "#E42565", "#e95083", "#D9E76C",
+    "#e8457c", "#cd215a", "#ec6693", "#dce97a",
+  },
+  groups = {
+    Normal = { fg = "#f0f8f0", bg = "#0a1810" },
+    NormalFloat = { fg = "#f0f8f0", bg = "#0f8a63" },
+    NormalNC = { fg = "#f0f8f0", bg = "#0a1810" },
+    Cursor = { fg = "#0a1810", bg = "#E42565" },
+    CursorLine = { bg = "#15231b" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#101e16" },
+    LineNr = { fg = "#708870" },
+    CursorLineNr = { fg = "#f0f8f0", bold = true },
+    SignColumn = { fg = "#708870", bg = "#0a1810" },
+    VertSplit = { fg = "#1f2e25" },
+    WinSeparator = { fg = "#1f2e25" },
+    Folded = { fg = "#708870", bg = "#0f8a63" },
+    FoldColumn = { fg = "#708870" },
+    NonText = { fg = "#708870" },
+    SpecialKey = { fg = "#708870" },
+    Whitespace = { fg = "#3d5040" },
+    MatchParen = { fg = "#E42565", bold = true },
+    Visual = { bg = "#4b1b29" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#0a1810", bg = "#E42565" },
+    IncSearch = { fg = "#0a1810", bg = "#ff8090" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#0a1810", bg = "#c11f55" },
+    Pmenu = { fg = "#f0f8f0", bg = "#0f8a63" },
+    PmenuSel = { fg = "#f0f8f0", bg = "#351a21" },
+    PmenuSbar = { bg = "#1f2e25" },
+    PmenuThumb = { bg = "#cadbca" },
+    ErrorMsg = { fg = "#c11f55" },
+    WarningMsg = { fg = "#ff8090" },
+    ModeMsg = { fg = "#f0f8f0", bold = true },
+    MoreMsg = { fg = "#ffffff" },
+    Question = { fg = "#ffffff" },
+    TabLine = { fg = "#cadbca", bg = "#0f8a63" },
+    TabLineFill = { bg = "#0a1810" },
+    TabLineSel = { fg = "#f0f8f0", bg = "#0a1810", bold = true },
+    StatusLine = { fg = "#f0f8f0", bg = "#0f8a63" },
+    StatusLineNC = { fg = "#cadbca", bg = "#0f8a63" },
+    DiffAdd = { bg = "#2e332e" },
+    DiffChange = { bg = "#2e2723" },
+    DiffDelete = { fg = "#c11f55", bg = "#25191a" },
+    DiffText = { bg = "#533736" },
+    SpellBad = { sp = "#c11f55", undercurl = true },
+    SpellCap = { sp = "#ff8090", undercurl = true },
+    SpellLocal = { sp = "#ffffff", undercurl = true },
+    SpellRare = { sp = "#E42565", undercurl = true },
+    Comment = { fg = "#708870" },
+    Constant = { fg = "#ff8090" },
+    String = { fg = "#ffd0d8" },
+    Character = { fg = "#ffd0d8" },
+    Number = { fg = "#ff8090" },
+    Boolean = { fg = "#ff8090" },
+    Float = { fg = "#ff8090" },
+    Identifier = { fg = "#f0f8f0" },
+    Function = { fg = "#ffffff" },
+    Statement = { fg = "#E42565" },
+    Conditional = { fg = "#E42565" },
+    Repeat = { fg = "#E42565" },
+    Label = { fg = "#E42565" },
+    Operator = { fg = "#cadbca" },
+    Keyword = { fg = "#E42565" },
+    Exception = { fg = "#E42565" },
+    PreProc = { fg = "#E42565" },
+    Include = { fg = "#E42565" },
+    Define = { fg = "#E42565" },
+    Macro = { fg = "#E42565" },
+    PreCondit = { fg = "#E42565" },
+    Type = { fg = "#f0b880" },
+    StorageClass = { fg = "#E42565" },
+    Structure = { fg = "#f0b880" },
+    Typedef = { fg = "#f0b880" },
+    Special = { fg = "#e95083" },
+    SpecialChar = { fg = "#e95083" },
+    Tag = { fg = "#ffd0d8" },
+    Delimiter = { fg = "#cadbca" },
+    SpecialComment = { fg = "#708870", italic = true },
+    Debug = { fg = "#ff8090" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#708870" },
+    Error = { fg = "#c11f55" },
+    Todo = { fg = "#0a1810", bg = "#E42565", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#f0f8f0" },
+      ["@variable.builtin"] = { fg = "#E42565" },
+      ["@variable.parameter"] = { fg = "#f0f8f0", italic = true },
+      ["@variable.member"] = { fg = "#f0f8f0" },
+      ["@constant"] = { fg = "#ff8090" },
+      ["@constant.builtin"] = { fg = "#ff8090" },
+      ["@module"] = { fg = "#f0f8f0" },
+      ["@label"] = { fg = "#E42565" },
+      ["@type"] = { fg = "#f0b880" },
+      ["@type.builtin"] = { fg = "#f0b880" },
+      ["@attribute"] = { fg = "#e8457c" },
+      ["@property"] = { fg = "#f0f8f0" },
+      ["@function"] = { fg = "#ffffff" },
+      ["@function.builtin"] = { fg = "#ffffff" },
+      ["@function.call"] = { fg = "#ffffff" },
+      ["@function.method"] = { fg = "#ffffff" },
+      ["@constructor"] = { fg = "#f0b880" },
+      ["@operator"] = { fg = "#cadbca" },
+      ["@keyword"] = { fg = "#E42565" },
+      ["@keyword.conditional"] = { fg = "#E42565" },
+      ["@keyword.function"] = { fg = "#E42565" },
+      ["@keyword.operator"] = { fg = "#E42565" },
+      ["@keyword.return"] = { fg = "#E42565" },
+      ["@punctuation.bracket"] = { fg = "#cadbca" },
+      ["@punctuation.delimiter"] = { fg = "#cadbca" },
+      ["@punctuation.special"] = { fg = "#e95083" },
+      ["@string"] = { fg = "#ffd0d8" },
+      ["@string.escape"] = { fg = "#e95083" },
+      ["@string.regexp"] = { fg = "#e95083" },
+      ["@character"] = { fg = "#ffd0d8" },
+      ["@boolean"] = { fg = "#ff8090" },
+      ["@number"] = { fg = "#ff8090" },
+      ["@comment"] = { fg = "#708870", italic = true },
+      ["@comment.todo"] = { fg = "#0a1810", bg = "#E42565", bold = true },
+      ["@comment.error"] = { fg = "#c11f55", bold = true },
+      ["@comment.warning"] = { fg = "#ff8090", bold = true },
+      ["@comment.note"] = { fg = "#ffffff", bold = true },
+      ["@markup.heading"] = { fg = "#E42565", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#ffd0d8" },
+      ["@markup.link"] = { fg = "#ffffff", underline = true },
+      ["@tag"] = { fg = "#ffd0d8" },
+      ["@tag.attribute"] = { fg = "#e8457c" },
+      ["@tag.delimiter"] = { fg = "#cadbca" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#c11f55" },
+      DiagnosticWarn = { fg = "#ff8090" },
+      DiagnosticInfo = { fg = "#ffffff" },
+      DiagnosticHint = { fg = "#E42565" },
+      DiagnosticUnderlineError = { sp = "#c11f55", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#ff8090", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#ffffff", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#E42565", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#c11f55", bg = "#1c1816" },
+      DiagnosticVirtualTextWarn = { fg = "#ff8090", bg = "#22221c" },
+      DiagnosticVirtualTextInfo = { fg = "#ffffff", bg = "#222f27" },
+      DiagnosticVirtualTextHint = { fg = "#E42565", bg = "#1f1918" },
+      LspReferenceText = { bg = "#212e26" },
+      LspReferenceRead = { bg = "#212e26" },
+      LspReferenceWrite = { bg = "#2c3931" },
+      LspSignatureActiveParameter = { fg = "#E42565", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#ffd0d8" },
+      GitSignsChange = { fg = "#ff8090" },
+      GitSignsDelete = { fg = "#c11f55" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#f0f8f0", bg = "#0a1810" },
+      TelescopeBorder = { fg = "#1f2e25", bg = "#0a1810" },
+      TelescopePromptTitle = { fg = "#0a1810", bg = "#E42565", bold = true },
+      TelescopePreviewTitle = { fg = "#0a1810", bg = "#ffd0d8", bold = true },
+      TelescopeResultsTitle = { fg = "#0a1810", bg = "#ffffff", bold = true },
+      TelescopeSelection = { bg = "#351a21" },
+      TelescopeMatching = { fg = "#E42565", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#E42565", bold = true },
+      CmpItemKindVariable = { fg = "#f0f8f0" },
+      CmpItemKindFunction = { fg = "#ffffff" },
+      CmpItemKindKeyword = { fg = "#E42565" },
+      CmpItemKindClass = { fg = "#f0b880" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#1f2e25" },
+      IblScope = { fg = "#708870" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#0a1810", bg = "#E42565", bold = true },
+      LazyButton = { fg = "#f0f8f0", bg = "#1f2e25" },
+      LazyButtonActive = { fg = "#0a1810", bg = "#E42565" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#c11f55" },
+      NotifyWARNBorder = { fg = "#ff8090" },
+      NotifyINFOBorder = { fg = "#ffffff" },
+      NotifyDEBUGBorder = { fg = "#708870" },
+      NotifyTRACEBorder = { fg = "#E42565" },
+    },
+  },
+}
@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Tuned
+-- Auto-generated by sync_themes.py from vscode/themes/tuned.json - DO NOT EDIT
+
+return {
+  name = "Tuned",
+  mode = "dark",
+  palette = {
+    base00 = "#191c20",
+    base01 = "#1f232a",
+    base02 = "#2f3236",
+    base03 = "#3a424f",
+    base04 = "#7d8593",
+    base05 = "#c5d0dd",
+    base06 = "#d5e0ed",
+    base07 = "#e6f1fe",
+    base08 = "#4793d8",
+    base09 = "#7ec2ff",
+    base0A = "#54aeff",
+    base0B = "#b6e3ff",
+    base0C = "#76beff",
+    base0D = "#80ccff",
+    base0E = "#54aeff",
+    base0F = "#3a424f",
+  },
+  terminal = {
+    "#191c20", "#4793d8", "#65b6ff", "#616772",
+    "#54aeff", "#3f82bf", "#76beff", "#c5d0dd",
+    "#3a424f", "#54aeff", "#76beff", "#c5d0dd",
+    "#6dbaff", "#4b9ce5", "#87c6ff", "#cad4e0",
+  },
+  groups = {
+    Normal = { fg = "#c5d0dd", bg = "#191c20" },
+    NormalFloat = { fg = "#c5d0dd", bg = "#1f232a" },
+    NormalNC = { fg = "#c5d0dd", bg = "#191c20" },
+    Cursor = { fg = "#191c20", bg = "#54aeff" },
+    CursorLine = { bg = "#212529" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#1e2125" },
+    LineNr = { fg = "#3a424f" },
+    CursorLineNr = { fg = "#c5d0dd", bold = true },
+    SignColumn = { fg = "#3a424f", bg = "#191c20" },
+    VertSplit = { fg = "#2f3236" },
+    WinSeparator = { fg = "#2f3236" },
+    Folded = { fg = "#3a424f", bg = "#1f232a" },
+    FoldColumn = { fg = "#3a424f" },
+    NonText = { fg = "#3a424f" },
+    SpecialKey = { fg = "#3a424f" },
+    Whitespace = { fg = "#292f37" },
+    MatchParen = { fg = "#54aeff", bold = true },
+    Visual = { bg = "#2a4762" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#191c20", bg = "#54aeff" },
+    IncSearch = { fg = "#191c20", bg = "#7ec2ff" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#191c20", bg = "#4793d8" },
+    Pmenu = { fg = "#c5d0dd", bg = "#1f232a" },
+    PmenuSel = { fg = "#c5d0dd", bg = "#24394c" },
+    PmenuSbar = { bg = "#2f3236" },
+    PmenuThumb = { bg = "#7d8593" },
+    ErrorMsg = { fg = "#4793d8" },
+    WarningMsg = { fg = "#7ec2ff" },
+    ModeMsg = { fg = "#c5d0dd", bold = true },
+    MoreMsg = { fg = "#80ccff" },
+    Question = { fg = "#80ccff" },
+    TabLine = { fg = "#7d8593", bg = "#1f232a" },
+    TabLineFill = { bg = "#191c20" },
+    TabLineSel = { fg = "#c5d0dd", bg = "#191c20", bold = true },
+    StatusLine = { fg = "#c5d0dd", bg = "#1f232a" },
+    StatusLineNC = { fg = "#7d8593", bg = "#1f232a" },
+    DiffAdd = { bg = "#303941" },
+    DiffChange = { bg = "#283441" },
+    DiffDelete = { fg = "#4793d8", bg = "#1f2d3b" },
+    DiffText = { bg = "#374d62" },
+    SpellBad = { sp = "#4793d8", undercurl = true },
+    SpellCap = { sp = "#7ec2ff", undercurl = true },
+    SpellLocal = { sp = "#80ccff", undercurl = true },
+    SpellRare = { sp = "#54aeff", undercurl = true },
+    Comment = { fg = "#3a424f" },
+    Constant = { fg = "#7ec2ff" },
+    String = { fg = "#b6e3ff" },
+    Character = { fg = "#b6e3ff" },
+    Number = { fg = "#7ec2ff" },
+    Boolean = { fg = "#7ec2ff" },
+    Float = { fg = "#7ec2ff" },
+    Identifier = { fg = "#c5d0dd" },
+    Function = { fg = "#80ccff" },
+    Statement = { fg = "#54aeff" },
+    Conditional = { fg = "#54aeff" },
+    Repeat = { fg = "#54aeff" },
+    Label = { fg = "#54aeff" },
+    Operator = { fg = "#7d8593" },
+    Keyword = { fg = "#54aeff" },
+    Exception = { fg = "#54aeff" },
+    PreProc = { fg = "#54aeff" },
+    Include = { fg = "#54aeff" },
+    Define = { fg = "#54aeff" },
+    Macro = { fg = "#54aeff" },
+    PreCondit = { fg = "#54aeff" },
+    Type = { fg = "#3888c8" },
+    StorageClass = { fg = "#54aeff" },
+    Structure = { fg = "#3888c8" },
+    Typedef = { fg = "#3888c8" },
+    Special = { fg = "#76beff" },
+    SpecialChar = { fg = "#76beff" },
+    Tag = { fg = "#7fc2ff" },
+    Delimiter = { fg = "#7d8593" },
+    SpecialComment = { fg = "#3a424f", italic = true },
+    Debug = { fg = "#7ec2ff" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#3a424f" },
+    Error = { fg = "#4793d8" },
+    Todo = { fg = "#191c20", bg = "#54aeff", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#c5d0dd" },
+      ["@variable.builtin"] = { fg = "#54aeff" },
+      ["@variable.parameter"] = { fg = "#c5d0dd", italic = true },
+      ["@variable.member"] = { fg = "#c5d0dd" },
+      ["@constant"] = { fg = "#7ec2ff" },
+      ["@constant.builtin"] = { fg = "#7ec2ff" },
+      ["@module"] = { fg = "#c5d0dd" },
+      ["@label"] = { fg = "#54aeff" },
+      ["@type"] = { fg = "#3888c8" },
+      ["@type.builtin"] = { fg = "#3888c8" },
+      ["@attribute"] = { fg = "#80ccff" },
+      ["@property"] = { fg = "#c5d0dd" },
+      ["@function"] = { fg = "#80ccff" },
+      ["@function.builtin"] = { fg = "#80ccff" },
+      ["@function.call"] = { fg = "#80ccff" },
+      ["@function.method"] = { fg = "#80ccff" },
+      ["@constructor"] = { fg = "#3888c8" },
+      ["@operator"] = { fg = "#7d8593" },
+      ["@keyword"] = { fg = "#54aeff" },
+      ["@keyword.conditional"] = { fg = "#54aeff" },
+      ["@keyword.function"] = { fg = "#54aeff" },
+      ["@keyword.operator"] = { fg = "#54aeff" },
+      ["@keyword.return"] = { fg = "#54aeff" },
+      ["@punctuation.bracket"] = { fg = "#7d8593" },
+      ["@punctuation.delimiter"] = { fg = "#7d8593" },
+      ["@punctuation.special"] = { fg = "#76beff" },
+      ["@string"] = { fg = "#b6e3ff" },
+      ["@string.escape"] = { fg = "#76beff" },
+      ["@string.regexp"] = { fg = "#76beff" },
+      ["@character"] = { fg = "#b6e3ff" },
+      ["@boolean"] = { fg = "#7ec2ff" },
+      ["@number"] = { fg = "#7ec2ff" },
+      ["@comment"] = { fg = "#3a424f", italic = true },
+      ["@comment.todo"] = { fg = "#191c20", bg = "#54aeff", bold = true },
+      ["@comment.error"] = { fg = "#4793d8", bold = true },
+      ["@comment.warning"] = { fg = "#7ec2ff", bold = true },
+      ["@comment.note"] = { fg = "#80ccff", bold = true },
+      ["@markup.heading"] = { fg = "#54aeff", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#b6e3ff" },
+      ["@markup.link"] = { fg = "#80ccff", underline = true },
+      ["@tag"] = { fg = "#7fc2ff" },
+      ["@tag.attribute"] = { fg = "#80ccff" },
+      ["@tag.delimiter"] = { fg = "#7d8593" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#4793d8" },
+      DiagnosticWarn = { fg = "#7ec2ff" },
+      DiagnosticInfo = { fg = "#80ccff" },
+      DiagnosticHint = { fg = "#54aeff" },
+      DiagnosticUnderlineError = { sp = "#4793d8", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#7ec2ff", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#80ccff", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#54aeff", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#4793d8", bg = "#1d2732" },
+      DiagnosticVirtualTextWarn = { fg = "#7ec2ff", bg = "#232c36" },
+      DiagnosticVirtualTextInfo = { fg = "#80ccff", bg = "#232d36" },
+      DiagnosticVirtualTextHint = { fg = "#54aeff", bg = "#1e2a36" },
+      LspReferenceText = { bg = "#2a2e32" },
+      LspReferenceRead = { bg = "#2a2e32" },
+      LspReferenceWrite = { bg = "#32373c" },
+      LspSignatureActiveParameter = { fg = "#54aeff", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#b6e3ff" },
+      GitSignsChange = { fg = "#7ec2ff" },
+      GitSignsDelete = { fg = "#4793d8" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#c5d0dd", bg = "#191c20" },
+      TelescopeBorder = { fg = "#2f3236", bg = "#191c20" },
+      TelescopePromptTitle = { fg = "#191c20", bg = "#54aeff", bold = true },
+      TelescopePreviewTitle = { fg = "#191c20", bg = "#b6e3ff", bold = true },
+      TelescopeResultsTitle = { fg = "#191c20", bg = "#80ccff", bold = true },
+      TelescopeSelection = { bg = "#24394c" },
+      TelescopeMatching = { fg = "#54aeff", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#54aeff", bold = true },
+      CmpItemKindVariable = { fg = "#c5d0dd" },
+      CmpItemKindFunction = { fg = "#80ccff" },
+      CmpItemKindKeyword = { fg = "#54aeff" },
+      CmpItemKindClass = { fg = "#3888c8" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#2f3236" },
+      IblScope = { fg = "#3a424f" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#191c20", bg = "#54aeff", bold = true },
+      LazyButton = { fg = "#c5d0dd", bg = "#2f3236" },
+      LazyButtonActive = { fg = "#191c20", bg = "#54aeff" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#4793d8" },
+      NotifyWARNBorder = { fg = "#7ec2ff" },
+      NotifyINFOBorder = { fg = "#80ccff" },
+      NotifyDEBUGBorder = { fg = "#3a424f" },
+      NotifyTRACEBorder = { fg = "#54aeff" },
+    },
+  },
+}
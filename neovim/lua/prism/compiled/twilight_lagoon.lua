@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Twilight Lagoon
+-- Auto-generated by sync_themes.py from vscode/themes/twilight_lagoon.json - DO NOT EDIT
+
+return {
+  name = "Twilight Lagoon",
+  mode = "dark",
+  palette = {
+    base00 = "#191724",
+    base01 = "#21202e",
+    base02 = "#2e2d3b",
+    base03 = "#6e6a86",
+    base04 = "#918ab9",
+    base05 = "#c4a7e7",
+    base06 = "#d4b7f8",
+    base07 = "#e4c7ff",
+    base08 = "#296279",
+    base09 = "#eb6f92",
+    base0A = "#31748f",
+    base0B = "#f6c177",
+    base0C = "#5a8fa5",
+    base0D = "#e0e0e0",
+    base0E = "#31748f",
+    base0F = "#ebbcba",
+  },
+  terminal = {
+    "#191724", "#296279", "#45819a", "#efc9c7",
+    "#31748f", "#24576b", "#5a8fa5", "#c4a7e7",
+    "#ebbcba", "#31748f", "#5a8fa5", "#c4a7e7",
+    "#4f889f", "#2c6880", "#6e9db0", "#c9afe9",
+  },
+  groups = {
+    Normal = { fg = "#c4a7e7", bg = "#191724" },
+    NormalFloat = { fg = "#c4a7e7", bg = "#21202e" },
+    NormalNC = { fg = "#c4a7e7", bg = "#191724" },
+    Cursor = { fg = "#191724", bg = "#31748f" },
+    CursorLine = { bg = "#211e2d" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#1e1b29" },
+    LineNr = { fg = "#6e6a86" },
+    CursorLineNr = { fg = "#c4a7e7", bold = true },
+    SignColumn = { fg = "#6e6a86", bg = "#191724" },
+    VertSplit = { fg = "#2e2d3b" },
+    WinSeparator = { fg = "#2e2d3b" },
+    Folded = { fg = "#6e6a86", bg = "#21202e" },
+    FoldColumn = { fg = "#6e6a86" },
+    NonText = { fg = "#6e6a86" },
+    SpecialKey = { fg = "#6e6a86" },
+    Whitespace = { fg = "#434055" },
+    MatchParen = { fg = "#31748f", bold = true },
+    Visual = { bg = "#203244" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#191724", bg = "#31748f" },
+    IncSearch = { fg = "#191724", bg = "#eb6f92" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#191724", bg = "#296279" },
+    Pmenu = { fg = "#c4a7e7", bg = "#21202e" },
+    PmenuSel = { fg = "#c4a7e7", bg = "#1d2939" },
+    PmenuSbar = { bg = "#2e2d3b" },
+    PmenuThumb = { bg = "#918ab9" },
+    ErrorMsg = { fg = "#296279" },
+    WarningMsg = { fg = "#eb6f92" },
+    ModeMsg = { fg = "#c4a7e7", bold = true },
+    MoreMsg = { fg = "#e0e0e0" },
+    Question = { fg = "#e0e0e0" },
+    TabLine = { fg = "#918ab9", bg = "#21202e" },
+    TabLineFill = { bg = "#191724" },
+    TabLineSel = { fg = "#c4a7e7", bg = "#191724", bold = true },
+    StatusLine = { fg = "#c4a7e7", bg = "#21202e" },
+    StatusLineNC = { fg = "#918ab9", bg = "#21202e" },
+    DiffAdd = { bg = "#3a3030" },
+    DiffChange = { bg = "#382434" },
+    DiffDelete = { fg = "#296279", bg = "#1b2230" },
+    DiffText = { bg = "#583145" },
+    SpellBad = { sp = "#296279", undercurl = true },
+    SpellCap = { sp = "#eb6f92", undercurl = true },
+    SpellLocal = { sp = "#e0e0e0", undercurl = true },
+    SpellRare = { sp = "#31748f", undercurl = true },
+    Comment = { fg = "#6e6a86" },
+    Constant = { fg = "#eb6f92" },
+    String = { fg = "#f6c177" },
+    Character = { fg = "#f6c177" },
+    Number = { fg = "#eb6f92" },
+    Boolean = { fg = "#eb6f92" },
+    Float = { fg = "#eb6f92" },
+    Identifier = { fg = "#e0def4" },
+    Function = { fg = "#e0e0e0" },
+    Statement = { fg = "#31748f" },
+    Conditional = { fg = "#31748f" },
+    Repeat = { fg = "#31748f" },
+    Label = { fg = "#31748f" },
+    Operator = { fg = "#918ab9" },
+    Keyword = { fg = "#31748f" },
+    Exception = { fg = "#31748f" },
+    PreProc = { fg = "#31748f" },
+    Include = { fg = "#31748f" },
+    Define = { fg = "#31748f" },
+    Macro = { fg = "#31748f" },
+    PreCondit = { fg = "#31748f" },
+    Type = { fg = "#c4a7e7" },
+    StorageClass = { fg = "#31748f" },
+    Structure = { fg = "#c4a7e7" },
+    Typedef = { fg = "#c4a7e7" },
+    Special = { fg = "#5a8fa5" },
+    SpecialChar = { fg = "#5a8fa5" },
+    Tag = { fg = "#f6c177" },
+    Delimiter = { fg = "#918ab9" },
+    SpecialComment = { fg = "#6e6a86", italic = true },
+    Debug = { fg = "#eb6f92" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#6e6a86" },
+    Error = { fg = "#296279" },
+    Todo = { fg = "#191724", bg = "#31748f", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#e0def4" },
+      ["@variable.builtin"] = { fg = "#31748f" },
+      ["@variable.parameter"] = { fg = "#e0def4", italic = true },
+      ["@variable.member"] = { fg = "#e0def4" },
+      ["@constant"] = { fg = "#eb6f92" },
+      ["@constant.builtin"] = { fg = "#eb6f92" },
+      ["@module"] = { fg = "#c4a7e7" },
+      ["@label"] = { fg = "#31748f" },
+      ["@type"] = { fg = "#c4a7e7" },
+      ["@type.builtin"] = { fg = "#c4a7e7" },
+      ["@attribute"] = { fg = "#4f889f" },
+      ["@property"] = { fg = "#e0def4" },
+      ["@function"] = { fg = "#e0e0e0" },
+      ["@function.builtin"] = { fg = "#e0e0e0" },
+      ["@function.call"] = { fg = "#e0e0e0" },
+      ["@function.method"] = { fg = "#e0e0e0" },
+      ["@constructor"] = { fg = "#c4a7e7" },
+      ["@operator"] = { fg = "#918ab9" },
+      ["@keyword"] = { fg = "#31748f" },
+      ["@keyword.conditional"] = { fg = "#31748f" },
+      ["@keyword.function"] = { fg = "#31748f" },
+      ["@keyword.operator"] = { fg = "#31748f" },
+      ["@keyword.return"] = { fg = "#31748f" },
+      ["@punctuation.bracket"] = { fg = "#918ab9" },
+      ["@punctuation.delimiter"] = { fg = "#918ab9" },
+      ["@punctuation.special"] = { fg = "#5a8fa5" },
+      ["@string"] = { fg = "#f6c177" },
+      ["@string.escape"] = { fg = "#5a8fa5" },
+      ["@string.regexp"] = { fg = "#5a8fa5" },
+      ["@character"] = { fg = "#f6c177" },
+      ["@boolean"] = { fg = "#eb6f92" },
+      ["@number"] = { fg = "#eb6f92" },
+      ["@comment"] = { fg = "#6e6a86", italic = true },
+      ["@comment.todo"] = { fg = "#191724", bg = "#31748f", bold = true },
+      ["@comment.error"] = { fg = "#296279", bold = true },
+      ["@comment.warning"] = { fg = "#eb6f92", bold = true },
+      ["@comment.note"] = { fg = "#e0e0e0", bold = true },
+      ["@markup.heading"] = { fg = "#31748f", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#f6c177" },
+      ["@markup.link"] = { fg = "#e0e0e0", underline = true },
+      ["@tag"] = { fg = "#f6c177" },
+      ["@tag.attribute"] = { fg = "#4f889f" },
+      ["@tag.delimiter"] = { fg = "#918ab9" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#296279" },
+      DiagnosticWarn = { fg = "#eb6f92" },
+      DiagnosticInfo = { fg = "#e0e0e0" },
+      DiagnosticHint = { fg = "#31748f" },
+      DiagnosticUnderlineError = { sp = "#296279", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#eb6f92", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#e0e0e0", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#31748f", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#296279", bg = "#1a1e2c" },
+      DiagnosticVirtualTextWarn = { fg = "#eb6f92", bg = "#2e1f2f" },
+      DiagnosticVirtualTextInfo = { fg = "#e0e0e0", bg = "#2c2b36" },
+      DiagnosticVirtualTextHint = { fg = "#31748f", bg = "#1b202e" },
+      LspReferenceText = { bg = "#2a2537" },
+      LspReferenceRead = { bg = "#2a2537" },
+      LspReferenceWrite = { bg = "#322c41" },
+      LspSignatureActiveParameter = { fg = "#31748f", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#f6c177" },
+      GitSignsChange = { fg = "#eb6f92" },
+      GitSignsDelete = { fg = "#296279" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#c4a7e7", bg = "#191724" },
+      TelescopeBorder = { fg = "#2e2d3b", bg = "#191724" },
+      TelescopePromptTitle = { fg = "#191724", bg = "#31748f", bold = true },
+      TelescopePreviewTitle = { fg = "#191724", bg = "#f6c177", bold = true },
+      TelescopeResultsTitle = { fg = "#191724", bg = "#e0e0e0", bold = true },
+      TelescopeSelection = { bg = "#1d2939" },
+      TelescopeMatching = { fg = "#31748f", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#31748f", bold = true },
+      CmpItemKindVariable = { fg = "#e0def4" },
+      CmpItemKindFunction = { fg = "#e0e0e0" },
+      CmpItemKindKeyword = { fg = "#31748f" },
+      CmpItemKindClass = { fg = "#c4a7e7" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#2e2d3b" },
+      IblScope = { fg = "#6e6a86" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#191724", bg = "#31748f", bold = true },
+      LazyButton = { fg = "#c4a7e7", bg = "#2e2d3b" },
+      LazyButtonActive = { fg = "#191724", bg = "#31748f" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#296279" },
+      NotifyWARNBorder = { fg = "#eb6f92" },
+      NotifyINFOBorder = { fg = "#e0e0e0" },
+      NotifyDEBUGBorder = { fg = "#6e6a86" },
+      NotifyTRACEBorder = { fg = "#31748f" },
+    },
+  },
+}
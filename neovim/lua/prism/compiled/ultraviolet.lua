@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Ultraviolet
+-- Auto-generated by sync_themes.py from vscode/themes/ultraviolet.json - DO NOT EDIT
+
+return {
+  name = "Ultraviolet",
+  mode = "dark",
+  palette = {
+    base00 = "#1a0a2e",
+    base01 = "#25103f",
+    base02 = "#2f2046",
+    base03 = "#bd93f9",
+    base04 = "#d6a0ff",
+    base05 = "#50fa7b",
+    base06 = "#65ff8b",
+    base07 = "#79ff9c",
+    base08 = "#d866a8",
+    base09 = "#ff93d1",
+    base0A = "#ff79c6",
+    base0B = "#ffa1d7",
+    base0C = "#ff93d1",
+    base0D = "#ff9ad4",
+    base0E = "#ff79c6",
+    base0F = "#bd93f9",
+  },
+  terminal = {
+    "#1a0a2e", "#d866a8", "#ff86cb", "#caa8fa",
+    "#ff79c6", "#bf5a94", "#ff93d1", "#50fa7b",
+    "#bd93f9", "#ff79c6", "#ff93d1", "#50fa7b",
+    "#ff8dce", "#e56cb2", "#ffa1d7", "#61fa88",
+  },
+  groups = {
+    Normal = { fg = "#50fa7b", bg = "#1a0a2e" },
+    NormalFloat = { fg = "#50fa7b", bg = "#25103f" },
+    NormalNC = { fg = "#50fa7b", bg = "#1a0a2e" },
+    Cursor = { fg = "#1a0a2e", bg = "#ff79c6" },
+    CursorLine = { bg = "#1c1631" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#1b1130" },
+    LineNr = { fg = "#bd93f9" },
+    CursorLineNr = { fg = "#50fa7b", bold = true },
+    SignColumn = { fg = "#bd93f9", bg = "#1a0a2e" },
+    VertSplit = { fg = "#2f2046" },
+    WinSeparator = { fg = "#2f2046" },
+    Folded = { fg = "#bd93f9", bg = "#25103f" },
+    FoldColumn = { fg = "#bd93f9" },
+    NonText = { fg = "#bd93f9" },
+    SpecialKey = { fg = "#bd93f9" },
+    Whitespace = { fg = "#6b4e93" },
+    MatchParen = { fg = "#ff79c6", bold = true },
+    Visual = { bg = "#5e2b5b" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#1a0a2e", bg = "#ff79c6" },
+    IncSearch = { fg = "#1a0a2e", bg = "#ff93d1" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#1a0a2e", bg = "#d866a8" },
+    Pmenu = { fg = "#50fa7b", bg = "#25103f" },
+    PmenuSel = { fg = "#50fa7b", bg = "#47204c" },
+    PmenuSbar = { bg = "#2f2046" },
+    PmenuThumb = { bg = "#d6a0ff" },
+    ErrorMsg = { fg = "#d866a8" },
+    WarningMsg = { fg = "#ff93d1" },
+    ModeMsg = { fg = "#50fa7b", bold = true },
+    MoreMsg = { fg = "#ff9ad4" },
+    Question = { fg = "#ff9ad4" },
+    TabLine = { fg = "#d6a0ff", bg = "#25103f" },
+    TabLineFill = { bg = "#1a0a2e" },
+    TabLineSel = { fg = "#50fa7b", bg = "#1a0a2e", bold = true },
+    StatusLine = { fg = "#50fa7b", bg = "#25103f" },
+    StatusLineNC = { fg = "#d6a0ff", bg = "#25103f" },
+    DiffAdd = { bg = "#3c2047" },
+    DiffChange = { bg = "#3c1e46" },
+    DiffDelete = { fg = "#d866a8", bg = "#361740" },
+    DiffText = { bg = "#5e335e" },
+    SpellBad = { sp = "#d866a8", undercurl = true },
+    SpellCap = { sp = "#ff93d1", undercurl = true },
+    SpellLocal = { sp = "#ff9ad4", undercurl = true },
+    SpellRare = { sp = "#ff79c6", undercurl = true },
+    Comment = { fg = "#bd93f9" },
+    Constant = { fg = "#ff93d1" },
+    String = { fg = "#ffa1d7" },
+    Character = { fg = "#ffa1d7" },
+    Number = { fg = "#ff93d1" },
+    Boolean = { fg = "#ff93d1" },
+    Float = { fg = "#ff93d1" },
+    Identifier = { fg = "#50fa7b" },
+    Function = { fg = "#ff9ad4" },
+    Statement = { fg = "#ff79c6" },
+    Conditional = { fg = "#ff79c6" },
+    Repeat = { fg = "#ff79c6" },
+    Label = { fg = "#ff79c6" },
+    Operator = { fg = "#d6a0ff" },
+    Keyword = { fg = "#ff79c6" },
+    Exception = { fg = "#ff79c6" },
+    PreProc = { fg = "#ff79c6" },
+    Include = { fg = "#ff79c6" },
+    Define = { fg = "#ff79c6" },
+    Macro = { fg = "#ff79c6" },
+    PreCondit = { fg = "#ff79c6" },
+    Type = { fg = "#50fa7b" },
+    StorageClass = { fg = "#ff79c6" },
+    Structure = { fg = "#50fa7b" },
+    Typedef = { fg = "#50fa7b" },
+    Special = { fg = "#ff93d1" },
+    SpecialChar = { fg = "#ff93d1" },
+    Tag = { fg = "#ffa1d7" },
+    Delimiter = { fg = "#d6a0ff" },
+    SpecialComment = { fg = "#bd93f9", italic = true },
+    Debug = { fg = "#ff93d1" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#bd93f9" },
+    Error = { fg = "#d866a8" },
+    Todo = { fg = "#1a0a2e", bg = "#ff79c6", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#50fa7b" },
+      ["@variable.builtin"] = { fg = "#ff79c6" },
+      ["@variable.parameter"] = { fg = "#50fa7b", italic = true },
+      ["@variable.member"] = { fg = "#50fa7b" },
+      ["@constant"] = { fg = "#ff93d1" },
+      ["@constant.builtin"] = { fg = "#ff93d1" },
+      ["@module"] = { fg = "#50fa7b" },
+      ["@label"] = { fg = "#ff79c6" },
+      ["@type"] = { fg = "#50fa7b" },
+      ["@type.builtin"] = { fg = "#50fa7b" },
+      ["@attribute"] = { fg = "#58fa81" },
+      ["@property"] = { fg = "#50fa7b" },
+      ["@function"] = { fg = "#ff9ad4" },
+      ["@function.builtin"] = { fg = "#ff9ad4" },
+      ["@function.call"] = { fg = "#ff9ad4" },
+      ["@function.method"] = { fg = "#ff9ad4" },
+      ["@constructor"] = { fg = "#50fa7b" },
+      ["@operator"] = { fg = "#d6a0ff" },
+      ["@keyword"] = { fg = "#ff79c6" },
+      ["@keyword.conditional"] = { fg = "#ff79c6" },
+      ["@keyword.function"] = { fg = "#ff79c6" },
+      ["@keyword.operator"] = { fg = "#ff79c6" },
+      ["@keyword.return"] = { fg = "#ff79c6" },
+      ["@punctuation.bracket"] = { fg = "#d6a0ff" },
+      ["@punctuation.delimiter"] = { fg = "#d6a0ff" },
+      ["@punctuation.special"] = { fg = "#ff93d1" },
+      ["@string"] = { fg = "#ffa1d7" },
+      ["@string.escape"] = { fg = "#ff93d1" },
+      ["@string.regexp"] = { fg = "#ff93d1" },
+      ["@character"] = { fg = "#ffa1d7" },
+      ["@boolean"] = { fg = "#ff93d1" },
+      ["@number"] = { fg = "#ff93d1" },
+      ["@comment"] = { fg = "#bd93f9", italic = true },
+      ["@comment.todo"] = { fg = "#1a0a2e", bg = "#ff79c6", bold = true },
+      ["@comment.error"] = { fg = "#d866a8", bold = true },
+      ["@comment.warning"] = { fg = "#ff93d1", bold = true },
+      ["@comment.note"] = { fg = "#ff9ad4", bold = true },
+      ["@markup.heading"] = { fg = "#ff79c6", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#ffa1d7" },
+      ["@markup.link"] = { fg = "#ff9ad4", underline = true },
+      ["@tag"] = { fg = "#ffa1d7" },
+      ["@tag.attribute"] = { fg = "#58fa81" },
+      ["@tag.delimiter"] = { fg = "#d6a0ff" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#d866a8" },
+      DiagnosticWarn = { fg = "#ff93d1" },
+      DiagnosticInfo = { fg = "#ff9ad4" },
+      DiagnosticHint = { fg = "#ff79c6" },
+      DiagnosticUnderlineError = { sp = "#d866a8", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#ff93d1", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#ff9ad4", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#ff79c6", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#d866a8", bg = "#2d133a" },
+      DiagnosticVirtualTextWarn = { fg = "#ff93d1", bg = "#30173e" },
+      DiagnosticVirtualTextInfo = { fg = "#ff9ad4", bg = "#30183e" },
+      DiagnosticVirtualTextHint = { fg = "#ff79c6", bg = "#30153d" },
+      LspReferenceText = { bg = "#1f2235" },
+      LspReferenceRead = { bg = "#1f2235" },
+      LspReferenceWrite = { bg = "#222e39" },
+      LspSignatureActiveParameter = { fg = "#ff79c6", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#ffa1d7" },
+      GitSignsChange = { fg = "#ff93d1" },
+      GitSignsDelete = { fg = "#d866a8" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#50fa7b", bg = "#1a0a2e" },
+      TelescopeBorder = { fg = "#2f2046", bg = "#1a0a2e" },
+      TelescopePromptTitle = { fg = "#1a0a2e", bg = "#ff79c6", bold = true },
+      TelescopePreviewTitle = { fg = "#1a0a2e", bg = "#ffa1d7", bold = true },
+      TelescopeResultsTitle = { fg = "#1a0a2e", bg = "#ff9ad4", bold = true },
+      TelescopeSelection = { bg = "#47204c" },
+      TelescopeMatching = { fg = "#ff79c6", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#ff79c6", bold = true },
+      CmpItemKindVariable = { fg = "#50fa7b" },
+      CmpItemKindFunction = { fg = "#ff9ad4" },
+      CmpItemKindKeyword = { fg = "#ff79c6" },
+      CmpItemKindClass = { fg = "#50fa7b" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#2f2046" },
+      IblScope = { fg = "#bd93f9" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#1a0a2e", bg = "#ff79c6", bold = true },
+      LazyButton = { fg = "#50fa7b", bg = "#2f2046" },
+      LazyButtonActive = { fg = "#1a0a2e", bg = "#ff79c6" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#d866a8" },
+      NotifyWARNBorder = { fg = "#ff93d1" },
+      NotifyINFOBorder = { fg = "#ff9ad4" },
+      NotifyDEBUGBorder = { fg = "#bd93f9" },
+      NotifyTRACEBorder = { fg = "#ff79c6" },
+    },
+  },
+}
@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Vaporwave
+-- Auto-generated by sync_themes.py from vscode/themes/vaporwave.json - DO NOT EDIT
+
+return {
+  name = "Vaporwave",
+  mode = "dark",
+  palette = {
+    base00 = "#1a0828",
+    base01 = "#5f2169",
+    base02 = "#301e40",
+    base03 = "#a090b0",
+    base04 = "#c1a0e0",
+    base05 = "#00e5e8",
+    base06 = "#36f6f9",
+    base07 = "#51ffff",
+    base08 = "#d833a9",
+    base09 = "#f0e0ff",
+    base0A = "#FF3CC7",
+    base0B = "#01cdfe",
+    base0C = "#ff63d2",
+    base0D = "#ffffff",
+    base0E = "#FF3CC7",
+    base0F = "#85FFFB",
+  },
+  terminal = {
+    "#4C1A57", "#d833a9", "#ff4fcc", "#9dfffb",
+    "#FF3CC7", "#bf2d95", "#ff63d2", "#00E5E8",
+    "#85FFFB", "#FF3CC7", "#ff63d2", "#00E5E8",
+    "#ff59cf", "#e536b3", "#ff76d7", "#19e7ea",
+  },
+  groups = {
+    Normal = { fg = "#00e5e8", bg = "#1a0828" },
+    NormalFloat = { fg = "#00e5e8", bg = "#5f2169" },
+    NormalNC = { fg = "#00e5e8", bg = "#1a0828" },
+    Cursor = { fg = "#1a0828", bg = "#FF3CC7" },
+    CursorLine = { bg = "#181331" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#190e2d" },
+    LineNr = { fg = "#a090b0" },
+    CursorLineNr = { fg = "#00e5e8", bold = true },
+    SignColumn = { fg = "#a090b0", bg = "#1a0828" },
+    VertSplit = { fg = "#301e40" },
+    WinSeparator = { fg = "#301e40" },
+    Folded = { fg = "#a090b0", bg = "#5f2169" },
+    FoldColumn = { fg = "#a090b0" },
+    NonText = { fg = "#a090b0" },
+    SpecialKey = { fg = "#a090b0" },
+    Whitespace = { fg = "#5d4c6c" },
+    MatchParen = { fg = "#FF3CC7", bold = true },
+    Visual = { bg = "#5e1757" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#1a0828", bg = "#FF3CC7" },
+    IncSearch = { fg = "#1a0828", bg = "#f0e0ff" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#1a0828", bg = "#d833a9" },
+    Pmenu = { fg = "#00e5e8", bg = "#5f2169" },
+    PmenuSel = { fg = "#00e5e8", bg = "#471247" },
+    PmenuSbar = { bg = "#301e40" },
+    PmenuThumb = { bg = "#c1a0e0" },
+    ErrorMsg = { fg = "#d833a9" },
+    WarningMsg = { fg = "#f0e0ff" },
+    ModeMsg = { fg = "#00e5e8", bold = true },
+    MoreMsg = { fg = "#ffffff" },
+    Question = { fg = "#ffffff" },
+    TabLine = { fg = "#c1a0e0", bg = "#5f2169" },
+    TabLineFill = { bg = "#1a0828" },
+    TabLineSel = { fg = "#00e5e8", bg = "#1a0828", bold = true },
+    StatusLine = { fg = "#00e5e8", bg = "#5f2169" },
+    StatusLineNC = { fg = "#c1a0e0", bg = "#5f2169" },
+    DiffAdd = { bg = "#162548" },
+    DiffChange = { bg = "#3a2848" },
+    DiffDelete = { fg = "#d833a9", bg = "#360e3b" },
+    DiffText = { bg = "#5a4868" },
+    SpellBad = { sp = "#d833a9", undercurl = true },
+    SpellCap = { sp = "#f0e0ff", undercurl = true },
+    SpellLocal = { sp = "#ffffff", undercurl = true },
+    SpellRare = { sp = "#FF3CC7", undercurl = true },
+    Comment = { fg = "#a090b0" },
+    Constant = { fg = "#f0e0ff" },
+    String = { fg = "#01cdfe" },
+    Character = { fg = "#01cdfe" },
+    Number = { fg = "#f0e0ff" },
+    Boolean = { fg = "#f0e0ff" },
+    Float = { fg = "#f0e0ff" },
+    Identifier = { fg = "#e8e8f8" },
+    Function = { fg = "#ffffff" },
+    Statement = { fg = "#FF3CC7" },
+    Conditional = { fg = "#FF3CC7" },
+    Repeat = { fg = "#FF3CC7" },
+    Label = { fg = "#FF3CC7" },
+    Operator = { fg = "#c1a0e0" },
+    Keyword = { fg = "#FF3CC7" },
+    Exception = { fg = "#FF3CC7" },
+    PreProc = { fg = "#FF3CC7" },
+    Include = { fg = "#FF3CC7" },
+    Define = { fg = "#FF3CC7" },
+    Macro = { fg = "#FF3CC7" },
+    PreCondit = { fg = "#FF3CC7" },
+    Type = { fg = "#00E5E8" },
+    StorageClass = { fg = "#FF3CC7" },
+    Structure = { fg = "#00E5E8" },
+    Typedef = { fg = "#00E5E8" },
+    Special = { fg = "#ff63d2" },
+    SpecialChar = { fg = "#ff63d2" },
+    Tag = { fg = "#01cdfe" },
+    Delimiter = { fg = "#c1a0e0" },
+    SpecialComment = { fg = "#a090b0", italic = true },
+    Debug = { fg = "#f0e0ff" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#a090b0" },
+    Error = { fg = "#d833a9" },
+    Todo = { fg = "#1a0828", bg = "#FF3CC7", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#e8e8f8" },
+      ["@variable.builtin"] = { fg = "#FF3CC7" },
+      ["@variable.parameter"] = { fg = "#e8e8f8", italic = true },
+      ["@variable.member"] = { fg = "#e8e8f8" },
+      ["@constant"] = { fg = "#f0e0ff" },
+      ["@constant.builtin"] = { fg = "#f0e0ff" },
+      ["@module"] = { fg = "#00e5e8" },
+      ["@label"] = { fg = "#FF3CC7" },
+      ["@type"] = { fg = "#00E5E8" },
+      ["@type.builtin"] = { fg = "#00E5E8" },
+      ["@attribute"] = { fg = "#ff59cf" },
+      ["@property"] = { fg = "#e8e8f8" },
+      ["@function"] = { fg = "#ffffff" },
+      ["@function.builtin"] = { fg = "#ffffff" },
+      ["@function.call"] = { fg = "#ffffff" },
+      ["@function.method"] = { fg = "#ffffff" },
+      ["@constructor"] = { fg = "#00E5E8" },
+      ["@operator"] = { fg = "#c1a0e0" },
+      ["@keyword"] = { fg = "#FF3CC7" },
+      ["@keyword.conditional"] = { fg = "#FF3CC7" },
+      ["@keyword.function"] = { fg = "#FF3CC7" },
+      ["@keyword.operator"] = { fg = "#FF3CC7" },
+      ["@keyword.return"] = { fg = "#FF3CC7" },
+      ["@punctuation.bracket"] = { fg = "#c1a0e0" },
+      ["@punctuation.delimiter"] = { fg = "#c1a0e0" },
+      ["@punctuation.special"] = { fg = "#ff63d2" },
+      ["@string"] = { fg = "#01cdfe" },
+      ["@string.escape"] = { fg = "#ff63d2" },
+      ["@string.regexp"] = { fg = "#ff63d2" },
+      ["@character"] = { fg = "#01cdfe" },
+      ["@boolean"] = { fg = "#f0e0ff" },
+      ["@number"] = { fg = "#f0e0ff" },
+      ["@comment"] = { fg = "#a090b0", italic = true },
+      ["@comment.todo"] = { fg = "#1a0828", bg = "#FF3CC7", bold = true },
+      ["@comment.error"] = { fg = "#d833a9", bold = true },
+      ["@comment.warning"] = { fg = "#f0e0ff", bold = true },
+      ["@comment.note"] = { fg = "#ffffff", bold = true },
+      ["@markup.heading"] = { fg = "#FF3CC7", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#01cdfe" },
+      ["@markup.link"] = { fg = "#ffffff", underline = true },
+      ["@tag"] = { fg = "#01cdfe" },
+      ["@tag.attribute"] = { fg = "#ff59cf" },
+      ["@tag.delimiter"] = { fg = "#c1a0e0" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#d833a9" },
+      DiagnosticWarn = { fg = "#f0e0ff" },
+      DiagnosticInfo = { fg = "#ffffff" },
+      DiagnosticHint = { fg = "#FF3CC7" },
+      DiagnosticUnderlineError = { sp = "#d833a9", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#f0e0ff", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#ffffff", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#FF3CC7", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#d833a9", bg = "#2d0c34" },
+      DiagnosticVirtualTextWarn = { fg = "#f0e0ff", bg = "#2f1d3d" },
+      DiagnosticVirtualTextInfo = { fg = "#ffffff", bg = "#30203d" },
+      DiagnosticVirtualTextHint = { fg = "#FF3CC7", bg = "#300d37" },
+      LspReferenceText = { bg = "#171e3b" },
+      LspReferenceRead = { bg = "#171e3b" },
+      LspReferenceWrite = { bg = "#162944" },
+      LspSignatureActiveParameter = { fg = "#FF3CC7", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#01cdfe" },
+      GitSignsChange = { fg = "#f0e0ff" },
+      GitSignsDelete = { fg = "#d833a9" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#00e5e8", bg = "#1a0828" },
+      TelescopeBorder = { fg = "#301e40", bg = "#1a0828" },
+      TelescopePromptTitle = { fg = "#1a0828", bg = "#FF3CC7", bold = true },
+      TelescopePreviewTitle = { fg = "#1a0828", bg = "#01cdfe", bold = true },
+      TelescopeResultsTitle = { fg = "#1a0828", bg = "#ffffff", bold = true },
+      TelescopeSelection = { bg = "#471247" },
+      TelescopeMatching = { fg = "#FF3CC7", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#FF3CC7", bold = true },
+      CmpItemKindVariable = { fg = "#e8e8f8" },
+      CmpItemKindFunction = { fg = "#ffffff" },
+      CmpItemKindKeyword = { fg = "#FF3CC7" },
+      CmpItemKindClass = { fg = "#00E5E8" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#301e40" },
+      IblScope = { fg = "#a090b0" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#1a0828", bg = "#FF3CC7", bold = true },
+      LazyButton = { fg = "#00e5e8", bg = "#301e40" },
+      LazyButtonActive = { fg = "#1a0828", bg = "#FF3CC7" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#d833a9" },
+      NotifyWARNBorder = { fg = "#f0e0ff" },
+      NotifyINFOBorder = { fg = "#ffffff" },
+      NotifyDEBUGBorder = { fg = "#a090b0" },
+      NotifyTRACEBorder = { fg = "#FF3CC7" },
+    },
+  },
+}
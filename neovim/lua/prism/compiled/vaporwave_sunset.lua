@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Vaporwave Sunset
+-- Auto-generated by sync_themes.py from vscode/themes/vaporwave_sunset.json - DO NOT EDIT
+
+return {
+  name = "Vaporwave Sunset",
+  mode = "dark",
+  palette = {
+    base00 = "#100818",
+    base01 = "#181020",
+    base02 = "#251c2e",
+    base03 = "#8060a0",
+    base04 = "#b69fd0",
+    base05 = "#f0e0ff",
+    base06 = "#fff1ff",
+    base07 = "#fff8ff",
+    base08 = "#00d8d8",
+    base09 = "#ffa0c0",
+    base0A = "#00ffff",
+    base0B = "#ffb8d8",
+    base0C = "#33ffff",
+    base0D = "#00ffff",
+    base0E = "#ff71ce",
+    base0F = "#8060a0",
+  },
+  terminal = {
+    "#100818", "#00d8d8", "#19ffff", "#997fb3",
+    "#00ffff", "#00bfbf", "#33ffff", "#f0e0ff",
+    "#8060a0", "#00ffff", "#33ffff", "#f0e0ff",
+    "#26ffff", "#00e5e5", "#4cffff", "#f1e3ff",
+  },
+  groups = {
+    Normal = { fg = "#f0e0ff", bg = "#100818" },
+    NormalFloat = { fg = "#f0e0ff", bg = "#181020" },
+    NormalNC = { fg = "#f0e0ff", bg = "#100818" },
+    Cursor = { fg = "#100818", bg = "#00ffff" },
+    CursorLine = { bg = "#1b1223" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#160e1e" },
+    LineNr = { fg = "#8060a0" },
+    CursorLineNr = { fg = "#f0e0ff", bold = true },
+    SignColumn = { fg = "#8060a0", bg = "#100818" },
+    VertSplit = { fg = "#251c2e" },
+    WinSeparator = { fg = "#251c2e" },
+    Folded = { fg = "#8060a0", bg = "#181020" },
+    FoldColumn = { fg = "#8060a0" },
+    NonText = { fg = "#8060a0" },
+    SpecialKey = { fg = "#8060a0" },
+    Whitespace = { fg = "#48345c" },
+    MatchParen = { fg = "#00ffff", bold = true },
+    Visual = { bg = "#0b525d" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#100818", bg = "#00ffff" },
+    IncSearch = { fg = "#100818", bg = "#ffa0c0" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#100818", bg = "#00d8d8" },
+    Pmenu = { fg = "#f0e0ff", bg = "#181020" },
+    PmenuSel = { fg = "#f0e0ff", bg = "#0c3946" },
+    PmenuSbar = { bg = "#251c2e" },
+    PmenuThumb = { bg = "#b69fd0" },
+    ErrorMsg = { fg = "#00d8d8" },
+    WarningMsg = { fg = "#ffa0c0" },
+    ModeMsg = { fg = "#f0e0ff", bold = true },
+    MoreMsg = { fg = "#00ffff" },
+    Question = { fg = "#00ffff" },
+    TabLine = { fg = "#b69fd0", bg = "#181020" },
+    TabLineFill = { bg = "#100818" },
+    TabLineSel = { fg = "#f0e0ff", bg = "#100818", bold = true },
+    StatusLine = { fg = "#f0e0ff", bg = "#181020" },
+    StatusLineNC = { fg = "#b69fd0", bg = "#181020" },
+    DiffAdd = { bg = "#332234" },
+    DiffChange = { bg = "#331e31" },
+    DiffDelete = { fg = "#00d8d8", bg = "#0d2734" },
+    DiffText = { bg = "#57354a" },
+    SpellBad = { sp = "#00d8d8", undercurl = true },
+    SpellCap = { sp = "#ffa0c0", undercurl = true },
+    SpellLocal = { sp = "#00ffff", undercurl = true },
+    SpellRare = { sp = "#ff71ce", undercurl = true },
+    Comment = { fg = "#8060a0" },
+    Constant = { fg = "#ffa0c0" },
+    String = { fg = "#ffb8d8" },
+    Character = { fg = "#ffb8d8" },
+    Number = { fg = "#ffa0c0" },
+    Boolean = { fg = "#ffa0c0" },
+    Float = { fg = "#ffa0c0" },
+    Identifier = { fg = "#ff90b0" },
+    Function = { fg = "#00ffff" },
+    Statement = { fg = "#ff71ce" },
+    Conditional = { fg = "#ff71ce" },
+    Repeat = { fg = "#ff71ce" },
+    Label = { fg = "#ff71ce" },
+    Operator = { fg = "#b69fd0" },
+    Keyword = { fg = "#ff71ce" },
+    Exception = { fg = "#ff71ce" },
+    PreProc = { fg = "#ff71ce" },
+    Include = { fg = "#ff71ce" },
+    Define = { fg = "#ff71ce" },
+    Macro = { fg = "#ff71ce" },
+    PreCondit = { fg = "#ff71ce" },
+    Type = { fg = "#f0e0ff" },
+    StorageClass = { fg = "#ff71ce" },
+    Structure = { fg = "#f0e0ff" },
+    Typedef = { fg = "#f0e0ff" },
+    Special = { fg = "#33ffff" },
+    SpecialChar = { fg = "#33ffff" },
+    Tag = { fg = "#00ffff" },
+    Delimiter = { fg = "#b69fd0" },
+    SpecialComment = { fg = "#8060a0", italic = true },
+    Debug = { fg = "#ffa0c0" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#8060a0" },
+    Error = { fg = "#00d8d8" },
+    Todo = { fg = "#100818", bg = "#00ffff", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#ff90b0" },
+      ["@variable.builtin"] = { fg = "#ff71ce" },
+      ["@variable.parameter"] = { fg = "#ff90b0", italic = true },
+      ["@variable.member"] = { fg = "#ff90b0" },
+      ["@constant"] = { fg = "#ffa0c0" },
+      ["@constant.builtin"] = { fg = "#ffa0c0" },
+      ["@module"] = { fg = "#f0e0ff" },
+      ["@label"] = { fg = "#ff71ce" },
+      ["@type"] = { fg = "#f0e0ff" },
+      ["@type.builtin"] = { fg = "#f0e0ff" },
+      ["@attribute"] = { fg = "#f0e1ff" },
+      ["@property"] = { fg = "#ff90b0" },
+      ["@function"] = { fg = "#00ffff" },
+      ["@function.builtin"] = { fg = "#00ffff" },
+      ["@function.call"] = { fg = "#00ffff" },
+      ["@function.method"] = { fg = "#00ffff" },
+      ["@constructor"] = { fg = "#f0e0ff" },
+      ["@operator"] = { fg = "#b69fd0" },
+      ["@keyword"] = { fg = "#ff71ce" },
+      ["@keyword.conditional"] = { fg = "#ff71ce" },
+      ["@keyword.function"] = { fg = "#ff71ce" },
+      ["@keyword.operator"] = { fg = "#ff71ce" },
+      ["@keyword.return"] = { fg = "#ff71ce" },
+      ["@punctuation.bracket"] = { fg = "#b69fd0" },
+      ["@punctuation.delimiter"] = { fg = "#b69fd0" },
+      ["@punctuation.special"] = { fg = "#33ffff" },
+      ["@string"] = { fg = "#ffb8d8" },
+      ["@string.escape"] = { fg = "#33ffff" },
+      ["@string.regexp"] = { fg = "#33ffff" },
+      ["@character"] = { fg = "#ffb8d8" },
+      ["@boolean"] = { fg = "#ffa0c0" },
+      ["@number"] = { fg = "#ffa0c0" },
+      ["@comment"] = { fg = "#8060a0", italic = true },
+      ["@comment.todo"] = { fg = "#100818", bg = "#00ffff", bold = true },
+      ["@comment.error"] = { fg = "#00d8d8", bold = true },
+      ["@comment.warning"] = { fg = "#ffa0c0", bold = true },
+      ["@comment.note"] = { fg = "#00ffff", bold = true },
+      ["@markup.heading"] = { fg = "#ff71ce", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#ffb8d8" },
+      ["@markup.link"] = { fg = "#00ffff", underline = true },
+      ["@tag"] = { fg = "#00ffff" },
+      ["@tag.attribute"] = { fg = "#f0e1ff" },
+      ["@tag.delimiter"] = { fg = "#b69fd0" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#00d8d8" },
+      DiagnosticWarn = { fg = "#ffa0c0" },
+      DiagnosticInfo = { fg = "#00ffff" },
+      DiagnosticHint = { fg = "#00ffff" },
+      DiagnosticUnderlineError = { sp = "#00d8d8", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#ffa0c0", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#00ffff", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#00ffff", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#00d8d8", bg = "#0e1c2b" },
+      DiagnosticVirtualTextWarn = { fg = "#ffa0c0", bg = "#271728" },
+      DiagnosticVirtualTextInfo = { fg = "#00ffff", bg = "#0e202f" },
+      DiagnosticVirtualTextHint = { fg = "#00ffff", bg = "#0e202f" },
+      LspReferenceText = { bg = "#261d2f" },
+      LspReferenceRead = { bg = "#261d2f" },
+      LspReferenceWrite = { bg = "#31283a" },
+      LspSignatureActiveParameter = { fg = "#00ffff", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#ffb8d8" },
+      GitSignsChange = { fg = "#ffa0c0" },
+      GitSignsDelete = { fg = "#00d8d8" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#f0e0ff", bg = "#100818" },
+      TelescopeBorder = { fg = "#251c2e", bg = "#100818" },
+      TelescopePromptTitle = { fg = "#100818", bg = "#00ffff", bold = true },
+      TelescopePreviewTitle = { fg = "#100818", bg = "#ffb8d8", bold = true },
+      TelescopeResultsTitle = { fg = "#100818", bg = "#00ffff", bold = true },
+      TelescopeSelection = { bg = "#0c3946" },
+      TelescopeMatching = { fg = "#00ffff", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#00ffff", bold = true },
+      CmpItemKindVariable = { fg = "#ff90b0" },
+      CmpItemKindFunction = { fg = "#00ffff" },
+      CmpItemKindKeyword = { fg = "#ff71ce" },
+      CmpItemKindClass = { fg = "#f0e0ff" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#251c2e" },
+      IblScope = { fg = "#8060a0" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#100818", bg = "#00ffff", bold = true },
+      LazyButton = { fg = "#f0e0ff", bg = "#251c2e" },
+      LazyButtonActive = { fg = "#100818", bg = "#00ffff" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#00d8d8" },
+      NotifyWARNBorder = { fg = "#ffa0c0" },
+      NotifyINFOBorder = { fg = "#00ffff" },
+      NotifyDEBUGBorder = { fg = "#8060a0" },
+      NotifyTRACEBorder = { fg = "#ff71ce" },
+    },
+  },
+}
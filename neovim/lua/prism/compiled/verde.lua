@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Verde
+-- Auto-generated by sync_themes.py from vscode/themes/verde.json - DO NOT EDIT
+
+return {
+  name = "Verde",
+  mode = "dark",
+  palette = {
+    base00 = "#0a0a0a",
+    base01 = "#101010",
+    base02 = "#1e1e1e",
+    base03 = "#6a6560",
+    base04 = "#aca59e",
+    base05 = "#f0ece0",
+    base06 = "#fffdf1",
+    base07 = "#fffff3",
+    base08 = "#339c66",
+    base09 = "#63c693",
+    base0A = "#3cb878",
+    base0B = "#76cda0",
+    base0C = "#63c693",
+    base0D = "#6cc999",
+    base0E = "#3cb878",
+    base0F = "#6a6560",
+  },
+  terminal = {
+    "#0a0a0a", "#339c66", "#4fbf85", "#87837f",
+    "#3cb878", "#2d8a5a", "#63c693", "#f0ece0",
+    "#6a6560", "#3cb878", "#63c693", "#f0ece0",
+    "#59c28c", "#36a56c", "#76cda0", "#f1ede3",
+  },
+  groups = {
+    Normal = { fg = "#f0ece0", bg = "#0a0a0a" },
+    NormalFloat = { fg = "#f0ece0", bg = "#101010" },
+    NormalNC = { fg = "#f0ece0", bg = "#0a0a0a" },
+    Cursor = { fg = "#0a0a0a", bg = "#3cb878" },
+    CursorLine = { bg = "#151514" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#101010" },
+    LineNr = { fg = "#6a6560" },
+    CursorLineNr = { fg = "#f0ece0", bold = true },
+    SignColumn = { fg = "#6a6560", bg = "#0a0a0a" },
+    VertSplit = { fg = "#1e1e1e" },
+    WinSeparator = { fg = "#1e1e1e" },
+    Folded = { fg = "#6a6560", bg = "#101010" },
+    FoldColumn = { fg = "#6a6560" },
+    NonText = { fg = "#6a6560" },
+    SpecialKey = { fg = "#6a6560" },
+    Whitespace = { fg = "#3a3735" },
+    MatchParen = { fg = "#3cb878", bold = true },
+    Visual = { bg = "#193e2b" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#0a0a0a", bg = "#3cb878" },
+    IncSearch = { fg = "#0a0a0a", bg = "#63c693" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#0a0a0a", bg = "#339c66" },
+    Pmenu = { fg = "#f0ece0", bg = "#101010" },
+    PmenuSel = { fg = "#f0ece0", bg = "#142c20" },
+    PmenuSbar = { bg = "#1e1e1e" },
+    PmenuThumb = { bg = "#aca59e" },
+    ErrorMsg = { fg = "#339c66" },
+    WarningMsg = { fg = "#63c693" },
+    ModeMsg = { fg = "#f0ece0", bold = true },
+    MoreMsg = { fg = "#6cc999" },
+    Question = { fg = "#6cc999" },
+    TabLine = { fg = "#aca59e", bg = "#101010" },
+    TabLineFill = { bg = "#0a0a0a" },
+    TabLineSel = { fg = "#f0ece0", bg = "#0a0a0a", bold = true },
+    StatusLine = { fg = "#f0ece0", bg = "#101010" },
+    StatusLineNC = { fg = "#aca59e", bg = "#101010" },
+    DiffAdd = { bg = "#1a2720" },
+    DiffChange = { bg = "#17261e" },
+    DiffDelete = { fg = "#339c66", bg = "#101f17" },
+    DiffText = { bg = "#244233" },
+    SpellBad = { sp = "#339c66", undercurl = true },
+    SpellCap = { sp = "#63c693", undercurl = true },
+    SpellLocal = { sp = "#6cc999", undercurl = true },
+    SpellRare = { sp = "#3cb878", undercurl = true },
+    Comment = { fg = "#6a6560" },
+    Constant = { fg = "#63c693" },
+    String = { fg = "#76cda0" },
+    Character = { fg = "#76cda0" },
+    Number = { fg = "#63c693" },
+    Boolean = { fg = "#63c693" },
+    Float = { fg = "#63c693" },
+    Identifier = { fg = "#f0ece0" },
+    Function = { fg = "#6cc999" },
+    Statement = { fg = "#3cb878" },
+    Conditional = { fg = "#3cb878" },
+    Repeat = { fg = "#3cb878" },
+    Label = { fg = "#3cb878" },
+    Operator = { fg = "#aca59e" },
+    Keyword = { fg = "#3cb878" },
+    Exception = { fg = "#3cb878" },
+    PreProc = { fg = "#3cb878" },
+    Include = { fg = "#3cb878" },
+    Define = { fg = "#3cb878" },
+    Macro = { fg = "#3cb878" },
+    PreCondit = { fg = "#3cb878" },
+    Type = { fg = "#f0ece0" },
+    StorageClass = { fg = "#3cb878" },
+    Structure = { fg = "#f0ece0" },
+    Typedef = { fg = "#f0ece0" },
+    Special = { fg = "#63c693" },
+    SpecialChar = { fg = "#63c693" },
+    Tag = { fg = "#76cda0" },
+    Delimiter = { fg = "#aca59e" },
+    SpecialComment = { fg = "#6a6560", italic = true },
+    Debug = { fg = "#63c693" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#6a6560" },
+    Error = { fg = "#339c66" },
+    Todo = { fg = "#0a0a0a", bg = "#3cb878", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#f0ece0" },
+      ["@variable.builtin"] = { fg = "#3cb878" },
+      ["@variable.parameter"] = { fg = "#f0ece0", italic = true },
+      ["@variable.member"] = { fg = "#f0ece0" },
+      ["@constant"] = { fg = "#63c693" },
+      ["@constant.builtin"] = { fg = "#63c693" },
+      ["@module"] = { fg = "#f0ece0" },
+      ["@label"] = { fg = "#3cb878" },
+      ["@type"] = { fg = "#f0ece0" },
+      ["@type.builtin"] = { fg = "#f0ece0" },
+      ["@attribute"] = { fg = "#f0ece1" },
+      ["@property"] = { fg = "#f0ece0" },
+      ["@function"] = { fg = "#6cc999" },
+      ["@function.builtin"] = { fg = "#6cc999" },
+      ["@function.call"] = { fg = "#6cc999" },
+      ["@function.method"] = { fg = "#6cc999" },
+      ["@constructor"] = { fg = "#f0ece0" },
+      ["@operator"] = { fg = "#aca59e" },
+      ["@keyword"] = { fg = "#3cb878" },
+      ["@keyword.conditional"] = { fg = "#3cb878" },
+      ["@keyword.function"] = { fg = "#3cb878" },
+      ["@keyword.operator"] = { fg = "#3cb878" },
+      ["@keyword.return"] = { fg = "#3cb878" },
+      ["@punctuation.bracket"] = { fg = "#aca59e" },
+      ["@punctuation.delimiter"] = { fg = "#aca59e" },
+      ["@punctuation.special"] = { fg = "#63c693" },
+      ["@string"] = { fg = "#76cda0" },
+      ["@string.escape"] = { fg = "#63c693" },
+      ["@string.regexp"] = { fg = "#63c693" },
+      ["@character"] = { fg = "#76cda0" },
+      ["@boolean"] = { fg = "#63c693" },
+      ["@number"] = { fg = "#63c693" },
+      ["@comment"] = { fg = "#6a6560", italic = true },
+      ["@comment.todo"] = { fg = "#0a0a0a", bg = "#3cb878", bold = true },
+      ["@comment.error"] = { fg = "#339c66", bold = true },
+      ["@comment.warning"] = { fg = "#63c693", bold = true },
+      ["@comment.note"] = { fg = "#6cc999", bold = true },
+      ["@markup.heading"] = { fg = "#3cb878", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#76cda0" },
+      ["@markup.link"] = { fg = "#6cc999", underline = true },
+      ["@tag"] = { fg = "#76cda0" },
+      ["@tag.attribute"] = { fg = "#f0ece1" },
+      ["@tag.delimiter"] = { fg = "#aca59e" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#339c66" },
+      DiagnosticWarn = { fg = "#63c693" },
+      DiagnosticInfo = { fg = "#6cc999" },
+      DiagnosticHint = { fg = "#3cb878" },
+      DiagnosticUnderlineError = { sp = "#339c66", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#63c693", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#6cc999", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#3cb878", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#339c66", bg = "#0e1813" },
+      DiagnosticVirtualTextWarn = { fg = "#63c693", bg = "#121c17" },
+      DiagnosticVirtualTextInfo = { fg = "#6cc999", bg = "#131d18" },
+      DiagnosticVirtualTextHint = { fg = "#3cb878", bg = "#0f1b15" },
+      LspReferenceText = { bg = "#21201f" },
+      LspReferenceRead = { bg = "#21201f" },
+      LspReferenceWrite = { bg = "#2c2b2a" },
+      LspSignatureActiveParameter = { fg = "#3cb878", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#76cda0" },
+      GitSignsChange = { fg = "#63c693" },
+      GitSignsDelete = { fg = "#339c66" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#f0ece0", bg = "#0a0a0a" },
+      TelescopeBorder = { fg = "#1e1e1e", bg = "#0a0a0a" },
+      TelescopePromptTitle = { fg = "#0a0a0a", bg = "#3cb878", bold = true },
+      TelescopePreviewTitle = { fg = "#0a0a0a", bg = "#76cda0", bold = true },
+      TelescopeResultsTitle = { fg = "#0a0a0a", bg = "#6cc999", bold = true },
+      TelescopeSelection = { bg = "#142c20" },
+      TelescopeMatching = { fg = "#3cb878", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#3cb878", bold = true },
+      CmpItemKindVariable = { fg = "#f0ece0" },
+      CmpItemKindFunction = { fg = "#6cc999" },
+      CmpItemKindKeyword = { fg = "#3cb878" },
+      CmpItemKindClass = { fg = "#f0ece0" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#1e1e1e" },
+      IblScope = { fg = "#6a6560" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#0a0a0a", bg = "#3cb878", bold = true },
+      LazyButton = { fg = "#f0ece0", bg = "#1e1e1e" },
+      LazyButtonActive = { fg = "#0a0a0a", bg = "#3cb878" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#339c66" },
+      NotifyWARNBorder = { fg = "#63c693" },
+      NotifyINFOBorder = { fg = "#6cc999" },
+      NotifyDEBUGBorder = { fg = "#6a6560" },
+      NotifyTRACEBorder = { fg = "#3cb878" },
+    },
+  },
+}
@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Verde Light
+-- Auto-generated by sync_themes.py from vscode/themes/verde_light.json - DO NOT EDIT
+
+return {
+  name = "Verde Light",
+  mode = "light",
+  palette = {
+    base00 = "#fafaf8",
+    base01 = "#f0f0ee",
+    base02 = "#dcdcda",
+    base03 = "#6a6a68",
+    base04 = "#40403e",
+    base05 = "#1a1a18",
+    base06 = "#0f0f0d",
+    base07 = "#050504",
+    base08 = "#238151",
+    base09 = "#258856",
+    base0A = "#2a9860",
+    base0B = "#238151",
+    base0C = "#54ac7f",
+    base0D = "#27905b",
+    base0E = "#2a9860",
+    base0F = "#6a6a68",
+  },
+  terminal = {
+    "#1a1a18", "#238151", "#3fa26f", "#6a6a68",
+    "#2a9860", "#1f7248", "#54ac7f", "#fafaf8",
+    "#6a6a68", "#2a9860", "#54ac7f", "#787877",
+    "#49a777", "#258856", "#69b68f", "#fafaf8",
+  },
+  groups = {
+    Normal = { fg = "#1a1a18", bg = "#fafaf8" },
+    NormalFloat = { fg = "#1a1a18", bg = "#f0f0ee" },
+    NormalNC = { fg = "#1a1a18", bg = "#fafaf8" },
+    Cursor = { fg = "#fafaf8", bg = "#2a9860" },
+    CursorLine = { bg = "#eeeeec" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#f3f3f1" },
+    LineNr = { fg = "#6a6a68" },
+    CursorLineNr = { fg = "#1a1a18", bold = true },
+    SignColumn = { fg = "#6a6a68", bg = "#fafaf8" },
+    VertSplit = { fg = "#dcdcda" },
+    WinSeparator = { fg = "#dcdcda" },
+    Folded = { fg = "#6a6a68", bg = "#f0f0ee" },
+    FoldColumn = { fg = "#6a6a68" },
+    NonText = { fg = "#6a6a68" },
+    SpecialKey = { fg = "#6a6a68" },
+    Whitespace = { fg = "#b2b2b0" },
+    MatchParen = { fg = "#2a9860", bold = true },
+    Visual = { bg = "#bbdcca" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#fafaf8", bg = "#2a9860" },
+    IncSearch = { fg = "#fafaf8", bg = "#258856" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#fafaf8", bg = "#238151" },
+    Pmenu = { fg = "#1a1a18", bg = "#f0f0ee" },
+    PmenuSel = { fg = "#1a1a18", bg = "#d0e6d9" },
+    PmenuSbar = { bg = "#dcdcda" },
+    PmenuThumb = { bg = "#40403e" },
+    ErrorMsg = { fg = "#238151" },
+    WarningMsg = { fg = "#258856" },
+    ModeMsg = { fg = "#1a1a18", bold = true },
+    MoreMsg = { fg = "#27905b" },
+    Question = { fg = "#27905b" },
+    TabLine = { fg = "#40403e", bg = "#f0f0ee" },
+    TabLineFill = { bg = "#fafaf8" },
+    TabLineSel = { fg = "#1a1a18", bg = "#fafaf8", bold = true },
+    StatusLine = { fg = "#1a1a18", bg = "#f0f0ee" },
+    StatusLineNC = { fg = "#40403e", bg = "#f0f0ee" },
+    DiffAdd = { bg = "#d9e7de" },
+    DiffChange = { bg = "#dae8df" },
+    DiffDelete = { fg = "#238151", bg = "#d9e7de" },
+    DiffText = { bg = "#bad7c7" },
+    SpellBad = { sp = "#238151", undercurl = true },
+    SpellCap = { sp = "#258856", undercurl = true },
+    SpellLocal = { sp = "#27905b", undercurl = true },
+    SpellRare = { sp = "#2a9860", undercurl = true },
+    Comment = { fg = "#6a6a68" },
+    Constant = { fg = "#258856" },
+    String = { fg = "#238151" },
+    Character = { fg = "#238151" },
+    Number = { fg = "#258856" },
+    Boolean = { fg = "#258856" },
+    Float = { fg = "#258856" },
+    Identifier = { fg = "#1a1a18" },
+    Function = { fg = "#27905b" },
+    Statement = { fg = "#2a9860" },
+    Conditional = { fg = "#2a9860" },
+    Repeat = { fg = "#2a9860" },
+    Label = { fg = "#2a9860" },
+    Operator = { fg = "#40403e" },
+    Keyword = { fg = "#2a9860" },
+    Exception = { fg = "#2a9860" },
+    PreProc = { fg = "#2a9860" },
+    Include = { fg = "#2a9860" },
+    Define = { fg = "#2a9860" },
+    Macro = { fg = "#2a9860" },
+    PreCondit = { fg = "#2a9860" },
+    Type = { fg = "#1a1a18" },
+    StorageClass = { fg = "#2a9860" },
+    Structure = { fg = "#1a1a18" },
+    Typedef = { fg = "#1a1a18" },
+    Special = { fg = "#54ac7f" },
+    SpecialChar = { fg = "#54ac7f" },
+    Tag = { fg = "#238151" },
+    Delimiter = { fg = "#40403e" },
+    SpecialComment = { fg = "#6a6a68", italic = true },
+    Debug = { fg = "#258856" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#6a6a68" },
+    Error = { fg = "#238151" },
+    Todo = { fg = "#fafaf8", bg = "#2a9860", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#1a1a18" },
+      ["@variable.builtin"] = { fg = "#2a9860" },
+      ["@variable.parameter"] = { fg = "#1a1a18", italic = true },
+      ["@variable.member"] = { fg = "#1a1a18" },
+      ["@constant"] = { fg = "#258856" },
+      ["@constant.builtin"] = { fg = "#258856" },
+      ["@module"] = { fg = "#1a1a18" },
+      ["@label"] = { fg = "#2a9860" },
+      ["@type"] = { fg = "#1a1a18" },
+      ["@type.builtin"] = { fg = "#1a1a18" },
+      ["@attribute"] = { fg = "#181816" },
+      ["@property"] = { fg = "#1a1a18" },
+      ["@function"] = { fg = "#27905b" },
+      ["@function.builtin"] = { fg = "#27905b" },
+      ["@function.call"] = { fg = "#27905b" },
+      ["@function.method"] = { fg = "#27905b" },
+      ["@constructor"] = { fg = "#1a1a18" },
+      ["@operator"] = { fg = "#40403e" },
+      ["@keyword"] = { fg = "#2a9860" },
+      ["@keyword.conditional"] = { fg = "#2a9860" },
+      ["@keyword.function"] = { fg = "#2a9860" },
+      ["@keyword.operator"] = { fg = "#2a9860" },
+      ["@keyword.return"] = { fg = "#2a9860" },
+      ["@punctuation.bracket"] = { fg = "#40403e" },
+      ["@punctuation.delimiter"] = { fg = "#40403e" },
+      ["@punctuation.special"] = { fg = "#54ac7f" },
+      ["@string"] = { fg = "#238151" },
+      ["@string.escape"] = { fg = "#54ac7f" },
+      ["@string.regexp"] = { fg = "#54ac7f" },
+      ["@character"] = { fg = "#238151" },
+      ["@boolean"] = { fg = "#258856" },
+      ["@number"] = { fg = "#258856" },
+      ["@comment"] = { fg = "#6a6a68", italic = true },
+      ["@comment.todo"] = { fg = "#fafaf8", bg = "#2a9860", bold = true },
+      ["@comment.error"] = { fg = "#238151", bold = true },
+      ["@comment.warning"] = { fg = "#258856", bold = true },
+      ["@comment.note"] = { fg = "#27905b", bold = true },
+      ["@markup.heading"] = { fg = "#2a9860", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#238151" },
+      ["@markup.link"] = { fg = "#27905b", underline = true },
+      ["@tag"] = { fg = "#238151" },
+      ["@tag.attribute"] = { fg = "#181816" },
+      ["@tag.delimiter"] = { fg = "#40403e" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#238151" },
+      DiagnosticWarn = { fg = "#258856" },
+      DiagnosticInfo = { fg = "#27905b" },
+      DiagnosticHint = { fg = "#2a9860" },
+      DiagnosticUnderlineError = { sp = "#238151", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#258856", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#27905b", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#2a9860", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#238151", bg = "#e4ede7" },
+      DiagnosticVirtualTextWarn = { fg = "#258856", bg = "#e4eee7" },
+      DiagnosticVirtualTextInfo = { fg = "#27905b", bg = "#e4efe8" },
+      DiagnosticVirtualTextHint = { fg = "#2a9860", bg = "#e5f0e8" },
+      LspReferenceText = { bg = "#e3e3e1" },
+      LspReferenceRead = { bg = "#e3e3e1" },
+      LspReferenceWrite = { bg = "#d8d8d6" },
+      LspSignatureActiveParameter = { fg = "#2a9860", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#238151" },
+      GitSignsChange = { fg = "#258856" },
+      GitSignsDelete = { fg = "#238151" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#1a1a18", bg = "#fafaf8" },
+      TelescopeBorder = { fg = "#dcdcda", bg = "#fafaf8" },
+      TelescopePromptTitle = { fg = "#fafaf8", bg = "#2a9860", bold = true },
+      TelescopePreviewTitle = { fg = "#fafaf8", bg = "#238151", bold = true },
+      TelescopeResultsTitle = { fg = "#fafaf8", bg = "#27905b", bold = true },
+      TelescopeSelection = { bg = "#d0e6d9" },
+      TelescopeMatching = { fg = "#2a9860", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#2a9860", bold = true },
+      CmpItemKindVariable = { fg = "#1a1a18" },
+      CmpItemKindFunction = { fg = "#27905b" },
+      CmpItemKindKeyword = { fg = "#2a9860" },
+      CmpItemKindClass = { fg = "#1a1a18" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#dcdcda" },
+      IblScope = { fg = "#6a6a68" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#fafaf8", bg = "#2a9860", bold = true },
+      LazyButton = { fg = "#1a1a18", bg = "#dcdcda" },
+      LazyButtonActive = { fg = "#fafaf8", bg = "#2a9860" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#238151" },
+      NotifyWARNBorder = { fg = "#258856" },
+      NotifyINFOBorder = { fg = "#27905b" },
+      NotifyDEBUGBorder = { fg = "#6a6a68" },
+      NotifyTRACEBorder = { fg = "#2a9860" },
+    },
+  },
+}
@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Vesper
+-- Auto-generated by sync_themes.py from vscode/themes/vesper.json - DO NOT EDIT
+
+return {
+  name = "Vesper",
+  mode = "light",
+  palette = {
+    base00 = "#f8f8f7",
+    base01 = "#ebebea",
+    base02 = "#dadad9",
+    base03 = "#C39B83",
+    base04 = "#705e53",
+    base05 = "#272727",
+    base06 = "#1b1b1b",
+    base07 = "#101010",
+    base08 = "#575356",
+    base09 = "#5c585b",
+    base0A = "#676266",
+    base0B = "#575356",
+    base0C = "#7d797c",
+    base0D = "#615d60",
+    base0E = "#676266",
+    base0F = "#C39B83",
+  },
+  terminal = {
+    "#272727", "#575356", "#767175", "#C39B83",
+    "#676266", "#4d494c", "#7d797c", "#F8F8F7",
+    "#C39B83", "#676266", "#7d797c", "#c9a58f",
+    "#767175", "#5c585b", "#8d898c", "#f8f8f7",
+  },
+  groups = {
+    Normal = { fg = "#272727", bg = "#f8f8f7" },
+    NormalFloat = { fg = "#272727", bg = "#ebebea" },
+    NormalNC = { fg = "#272727", bg = "#f8f8f7" },
+    Cursor = { fg = "#f8f8f7", bg = "#676266" },
+    CursorLine = { bg = "#ededec" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#f1f1f0" },
+    LineNr = { fg = "#C39B83" },
+    CursorLineNr = { fg = "#272727", bold = true },
+    SignColumn = { fg = "#C39B83", bg = "#f8f8f7" },
+    VertSplit = { fg = "#dadad9" },
+    WinSeparator = { fg = "#dadad9" },
+    Folded = { fg = "#C39B83", bg = "#ebebea" },
+    FoldColumn = { fg = "#C39B83" },
+    NonText = { fg = "#C39B83" },
+    SpecialKey = { fg = "#C39B83" },
+    Whitespace = { fg = "#ddc9bd" },
+    MatchParen = { fg = "#676266", bold = true },
+    Visual = { bg = "#cccbcb" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#f8f8f7", bg = "#676266" },
+    IncSearch = { fg = "#f8f8f7", bg = "#5c585b" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#f8f8f7", bg = "#575356" },
+    Pmenu = { fg = "#272727", bg = "#ebebea" },
+    PmenuSel = { fg = "#272727", bg = "#dbdada" },
+    PmenuSbar = { bg = "#dadad9" },
+    PmenuThumb = { bg = "#705e53" },
+    ErrorMsg = { fg = "#575356" },
+    WarningMsg = { fg = "#5c585b" },
+    ModeMsg = { fg = "#272727", bold = true },
+    MoreMsg = { fg = "#615d60" },
+    Question = { fg = "#615d60" },
+    TabLine = { fg = "#705e53", bg = "#ebebea" },
+    TabLineFill = { bg = "#f8f8f7" },
+    TabLineSel = { fg = "#272727", bg = "#f8f8f7", bold = true },
+    StatusLine = { fg = "#272727", bg = "#ebebea" },
+    StatusLineNC = { fg = "#705e53", bg = "#ebebea" },
+    DiffAdd = { bg = "#dfdfde" },
+    DiffChange = { bg = "#e0dfdf" },
+    DiffDelete = { fg = "#575356", bg = "#dfdfde" },
+    DiffText = { bg = "#c9c8c8" },
+    SpellBad = { sp = "#575356", undercurl = true },
+    SpellCap = { sp = "#5c585b", undercurl = true },
+    SpellLocal = { sp = "#615d60", undercurl = true },
+    SpellRare = { sp = "#676266", undercurl = true },
+    Comment = { fg = "#C39B83" },
+    Constant = { fg = "#5c585b" },
+    String = { fg = "#575356" },
+    Character = { fg = "#575356" },
+    Number = { fg = "#5c585b" },
+    Boolean = { fg = "#5c585b" },
+    Float = { fg = "#5c585b" },
+    Identifier = { fg = "#272727" },
+    Function = { fg = "#615d60" },
+    Statement = { fg = "#676266" },
+    Conditional = { fg = "#676266" },
+    Repeat = { fg = "#676266" },
+    Label = { fg = "#676266" },
+    Operator = { fg = "#705e53" },
+    Keyword = { fg = "#676266" },
+    Exception = { fg = "#676266" },
+    PreProc = { fg = "#676266" },
+    Include = { fg = "#676266" },
+    Define = { fg = "#676266" },
+    Macro = { fg = "#676266" },
+    PreCondit = { fg = "#676266" },
+    Type = { fg = "#272727" },
+    StorageClass = { fg = "#676266" },
+    Structure = { fg = "#272727" },
+    Typedef = { fg = "#272727" },
+    Special = { fg = "#7d797c" },
+    SpecialChar = { fg = "#7d797c" },
+    Tag = { fg = "#575356" },
+    Delimiter = { fg = "#705e53" },
+    SpecialComment = { fg = "#C39B83", italic = true },
+    Debug = { fg = "#5c585b" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#C39B83" },
+    Error = { fg = "#575356" },
+    Todo = { fg = "#f8f8f7", bg = "#676266", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#272727" },
+      ["@variable.builtin"] = { fg = "#676266" },
+      ["@variable.parameter"] = { fg = "#272727", italic = true },
+      ["@variable.member"] = { fg = "#272727" },
+      ["@constant"] = { fg = "#5c585b" },
+      ["@constant.builtin"] = { fg = "#5c585b" },
+      ["@module"] = { fg = "#272727" },
+      ["@label"] = { fg = "#676266" },
+      ["@type"] = { fg = "#272727" },
+      ["@type.builtin"] = { fg = "#272727" },
+      ["@attribute"] = { fg = "#232323" },
+      ["@property"] = { fg = "#272727" },
+      ["@function"] = { fg = "#615d60" },
+      ["@function.builtin"] = { fg = "#615d60" },
+      ["@function.call"] = { fg = "#615d60" },
+      ["@function.method"] = { fg = "#615d60" },
+      ["@constructor"] = { fg = "#272727" },
+      ["@operator"] = { fg = "#705e53" },
+      ["@keyword"] = { fg = "#676266" },
+      ["@keyword.conditional"] = { fg = "#676266" },
+      ["@keyword.function"] = { fg = "#676266" },
+      ["@keyword.operator"] = { fg = "#676266" },
+      ["@keyword.return"] = { fg = "#676266" },
+      ["@punctuation.bracket"] = { fg = "#705e53" },
+      ["@punctuation.delimiter"] = { fg = "#705e53" },
+      ["@punctuation.special"] = { fg = "#7d797c" },
+      ["@string"] = { fg = "#575356" },
+      ["@string.escape"] = { fg = "#7d797c" },
+      ["@string.regexp"] = { fg = "#7d797c" },
+      ["@character"] = { fg = "#575356" },
+      ["@boolean"] = { fg = "#5c585b" },
+      ["@number"] = { fg = "#5c585b" },
+      ["@comment"] = { fg = "#C39B83", italic = true },
+      ["@comment.todo"] = { fg = "#f8f8f7", bg = "#676266", bold = true },
+      ["@comment.error"] = { fg = "#575356", bold = true },
+      ["@comment.warning"] = { fg = "#5c585b", bold = true },
+      ["@comment.note"] = { fg = "#615d60", bold = true },
+      ["@markup.heading"] = { fg = "#676266", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#575356" },
+      ["@markup.link"] = { fg = "#615d60", underline = true },
+      ["@tag"] = { fg = "#575356" },
+      ["@tag.attribute"] = { fg = "#232323" },
+      ["@tag.delimiter"] = { fg = "#705e53" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#575356" },
+      DiagnosticWarn = { fg = "#5c585b" },
+      DiagnosticInfo = { fg = "#615d60" },
+      DiagnosticHint = { fg = "#676266" },
+      DiagnosticUnderlineError = { sp = "#575356", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#5c585b", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#615d60", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#676266", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#575356", bg = "#e7e7e6" },
+      DiagnosticVirtualTextWarn = { fg = "#5c585b", bg = "#e8e8e7" },
+      DiagnosticVirtualTextInfo = { fg = "#615d60", bg = "#e8e8e7" },
+      DiagnosticVirtualTextHint = { fg = "#676266", bg = "#e9e9e8" },
+      LspReferenceText = { bg = "#e3e3e2" },
+      LspReferenceRead = { bg = "#e3e3e2" },
+      LspReferenceWrite = { bg = "#d8d8d7" },
+      LspSignatureActiveParameter = { fg = "#676266", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#575356" },
+      GitSignsChange = { fg = "#5c585b" },
+      GitSignsDelete = { fg = "#575356" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#272727", bg = "#f8f8f7" },
+      TelescopeBorder = { fg = "#dadad9", bg = "#f8f8f7" },
+      TelescopePromptTitle = { fg = "#f8f8f7", bg = "#676266", bold = true },
+      TelescopePreviewTitle = { fg = "#f8f8f7", bg = "#575356", bold = true },
+      TelescopeResultsTitle = { fg = "#f8f8f7", bg = "#615d60", bold = true },
+      TelescopeSelection = { bg = "#dbdada" },
+      TelescopeMatching = { fg = "#676266", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#676266", bold = true },
+      CmpItemKindVariable = { fg = "#272727" },
+      CmpItemKindFunction = { fg = "#615d60" },
+      CmpItemKindKeyword = { fg = "#676266" },
+      CmpItemKindClass = { fg = "#272727" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#dadad9" },
+      IblScope = { fg = "#C39B83" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#f8f8f7", bg = "#676266", bold = true },
+      LazyButton = { fg = "#272727", bg = "#dadad9" },
+      LazyButtonActive = { fg = "#f8f8f7", bg = "#676266" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#575356" },
+      NotifyWARNBorder = { fg = "#5c585b" },
+      NotifyINFOBorder = { fg = "#615d60" },
+      NotifyDEBUGBorder = { fg = "#C39B83" },
+      NotifyTRACEBorder = { fg = "#676266" },
+    },
+  },
+}
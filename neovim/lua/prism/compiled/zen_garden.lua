@@ -0,0 +1,218 @@
+-- PRISM compiled highlights: Zen Garden
+-- Auto-generated by sync_themes.py from vscode/themes/zen_garden.json - DO NOT EDIT
+
+return {
+  name = "Zen Garden",
+  mode = "dark",
+  palette = {
+    base00 = "#101210",
+    base01 = "#181a18",
+    base02 = "#252725",
+    base03 = "#606560",
+    base04 = "#a1a8a1",
+    base05 = "#e8f0e8",
+    base06 = "#f9fff9",
+    base07 = "#fafffa",
+    base08 = "#aa9c66",
+    base09 = "#d3c693",
+    base0A = "#c8b878",
+    base0B = "#d8cda0",
+    base0C = "#d3c693",
+    base0D = "#d5c999",
+    base0E = "#c8b878",
+    base0F = "#606560",
+  },
+  terminal = {
+    "#101210", "#aa9c66", "#cdbf85", "#7f837f",
+    "#c8b878", "#968a5a", "#d3c693", "#e8f0e8",
+    "#606560", "#c8b878", "#d3c693", "#e8f0e8",
+    "#d0c28c", "#b4a56c", "#d8cda0", "#eaf1ea",
+  },
+  groups = {
+    Normal = { fg = "#e8f0e8", bg = "#101210" },
+    NormalFloat = { fg = "#e8f0e8", bg = "#181a18" },
+    NormalNC = { fg = "#e8f0e8", bg = "#101210" },
+    Cursor = { fg = "#101210", bg = "#c8b878" },
+    CursorLine = { bg = "#1a1d1a" },
+    CursorColumn = { link = "CursorLine" },
+    ColorColumn = { bg = "#161816" },
+    LineNr = { fg = "#606560" },
+    CursorLineNr = { fg = "#e8f0e8", bold = true },
+    SignColumn = { fg = "#606560", bg = "#101210" },
+    VertSplit = { fg = "#252725" },
+    WinSeparator = { fg = "#252725" },
+    Folded = { fg = "#606560", bg = "#181a18" },
+    FoldColumn = { fg = "#606560" },
+    NonText = { fg = "#606560" },
+    SpecialKey = { fg = "#606560" },
+    Whitespace = { fg = "#383b38" },
+    MatchParen = { fg = "#c8b878", bold = true },
+    Visual = { bg = "#47432f" },
+    VisualNOS = { link = "Visual" },
+    Search = { fg = "#101210", bg = "#c8b878" },
+    IncSearch = { fg = "#101210", bg = "#d3c693" },
+    CurSearch = { link = "IncSearch" },
+    Substitute = { fg = "#101210", bg = "#aa9c66" },
+    Pmenu = { fg = "#e8f0e8", bg = "#181a18" },
+    PmenuSel = { fg = "#e8f0e8", bg = "#343324" },
+    PmenuSbar = { bg = "#252725" },
+    PmenuThumb = { bg = "#a1a8a1" },
+    ErrorMsg = { fg = "#aa9c66" },
+    WarningMsg = { fg = "#d3c693" },
+    ModeMsg = { fg = "#e8f0e8", bold = true },
+    MoreMsg = { fg = "#d5c999" },
+    Question = { fg = "#d5c999" },
+    TabLine = { fg = "#a1a8a1", bg = "#181a18" },
+    TabLineFill = { bg = "#101210" },
+    TabLineSel = { fg = "#e8f0e8", bg = "#101210", bold = true },
+    StatusLine = { fg = "#e8f0e8", bg = "#181a18" },
+    StatusLineNC = { fg = "#a1a8a1", bg = "#181a18" },
+    DiffAdd = { bg = "#2e2e25" },
+    DiffChange = { bg = "#2d2d23" },
+    DiffDelete = { fg = "#aa9c66", bg = "#27261c" },
+    DiffText = { bg = "#4a4837" },
+    SpellBad = { sp = "#aa9c66", undercurl = true },
+    SpellCap = { sp = "#d3c693", undercurl = true },
+    SpellLocal = { sp = "#d5c999", undercurl = true },
+    SpellRare = { sp = "#c8b878", undercurl = true },
+    Comment = { fg = "#606560" },
+    Constant = { fg = "#d3c693" },
+    String = { fg = "#d8cda0" },
+    Character = { fg = "#d8cda0" },
+    Number = { fg = "#d3c693" },
+    Boolean = { fg = "#d3c693" },
+    Float = { fg = "#d3c693" },
+    Identifier = { fg = "#e8f0e8" },
+    Function = { fg = "#d5c999" },
+    Statement = { fg = "#c8b878" },
+    Conditional = { fg = "#c8b878" },
+    Repeat = { fg = "#c8b878" },
+    Label = { fg = "#c8b878" },
+    Operator = { fg = "#a1a8a1" },
+    Keyword = { fg = "#c8b878" },
+    Exception = { fg = "#c8b878" },
+    PreProc = { fg = "#c8b878" },
+    Include = { fg = "#c8b878" },
+    Define = { fg = "#c8b878" },
+    Macro = { fg = "#c8b878" },
+    PreCondit = { fg = "#c8b878" },
+    Type = { fg = "#e8f0e8" },
+    StorageClass = { fg = "#c8b878" },
+    Structure = { fg = "#e8f0e8" },
+    Typedef = { fg = "#e8f0e8" },
+    Special = { fg = "#d3c693" },
+    SpecialChar = { fg = "#d3c693" },
+    Tag = { fg = "#d8cda0" },
+    Delimiter = { fg = "#a1a8a1" },
+    SpecialComment = { fg = "#606560", italic = true },
+    Debug = { fg = "#d3c693" },
+    Underlined = { underline = true },
+    Ignore = { fg = "#606560" },
+    Error = { fg = "#aa9c66" },
+    Todo = { fg = "#101210", bg = "#c8b878", bold = true },
+  },
+  integrations = {
+    treesitter = {
+      ["@variable"] = { fg = "#e8f0e8" },
+      ["@variable.builtin"] = { fg = "#c8b878" },
+      ["@variable.parameter"] = { fg = "#e8f0e8", italic = true },
+      ["@variable.member"] = { fg = "#e8f0e8" },
+      ["@constant"] = { fg = "#d3c693" },
+      ["@constant.builtin"] = { fg = "#d3c693" },
+      ["@module"] = { fg = "#e8f0e8" },
+      ["@label"] = { fg = "#c8b878" },
+      ["@type"] = { fg = "#e8f0e8" },
+      ["@type.builtin"] = { fg = "#e8f0e8" },
+      ["@attribute"] = { fg = "#e9f0e9" },
+      ["@property"] = { fg = "#e8f0e8" },
+      ["@function"] = { fg = "#d5c999" },
+      ["@function.builtin"] = { fg = "#d5c999" },
+      ["@function.call"] = { fg = "#d5c999" },
+      ["@function.method"] = { fg = "#d5c999" },
+      ["@constructor"] = { fg = "#e8f0e8" },
+      ["@operator"] = { fg = "#a1a8a1" },
+      ["@keyword"] = { fg = "#c8b878" },
+      ["@keyword.conditional"] = { fg = "#c8b878" },
+      ["@keyword.function"] = { fg = "#c8b878" },
+      ["@keyword.operator"] = { fg = "#c8b878" },
+      ["@keyword.return"] = { fg = "#c8b878" },
+      ["@punctuation.bracket"] = { fg = "#a1a8a1" },
+      ["@punctuation.delimiter"] = { fg = "#a1a8a1" },
+      ["@punctuation.special"] = { fg = "#d3c693" },
+      ["@string"] = { fg = "#d8cda0" },
+      ["@string.escape"] = { fg = "#d3c693" },
+      ["@string.regexp"] = { fg = "#d3c693" },
+      ["@character"] = { fg = "#d8cda0" },
+      ["@boolean"] = { fg = "#d3c693" },
+      ["@number"] = { fg = "#d3c693" },
+      ["@comment"] = { fg = "#606560", italic = true },
+      ["@comment.todo"] = { fg = "#101210", bg = "#c8b878", bold = true },
+      ["@comment.error"] = { fg = "#aa9c66", bold = true },
+      ["@comment.warning"] = { fg = "#d3c693", bold = true },
+      ["@comment.note"] = { fg = "#d5c999", bold = true },
+      ["@markup.heading"] = { fg = "#c8b878", bold = true },
+      ["@markup.italic"] = { italic = true },
+      ["@markup.strong"] = { bold = true },
+      ["@markup.raw"] = { fg = "#d8cda0" },
+      ["@markup.link"] = { fg = "#d5c999", underline = true },
+      ["@tag"] = { fg = "#d8cda0" },
+      ["@tag.attribute"] = { fg = "#e9f0e9" },
+      ["@tag.delimiter"] = { fg = "#a1a8a1" },
+    },
+    native_lsp = {
+      DiagnosticError = { fg = "#aa9c66" },
+      DiagnosticWarn = { fg = "#d3c693" },
+      DiagnosticInfo = { fg = "#d5c999" },
+      DiagnosticHint = { fg = "#c8b878" },
+      DiagnosticUnderlineError = { sp = "#aa9c66", undercurl = true },
+      DiagnosticUnderlineWarn = { sp = "#d3c693", undercurl = true },
+      DiagnosticUnderlineInfo = { sp = "#d5c999", undercurl = true },
+      DiagnosticUnderlineHint = { sp = "#c8b878", undercurl = true },
+      DiagnosticVirtualTextError = { fg = "#aa9c66", bg = "#1f1f18" },
+      DiagnosticVirtualTextWarn = { fg = "#d3c693", bg = "#23241d" },
+      DiagnosticVirtualTextInfo = { fg = "#d5c999", bg = "#23241d" },
+      DiagnosticVirtualTextHint = { fg = "#c8b878", bg = "#22221a" },
+      LspReferenceText = { bg = "#252825" },
+      LspReferenceRead = { bg = "#252825" },
+      LspReferenceWrite = { bg = "#303330" },
+      LspSignatureActiveParameter = { fg = "#c8b878", bold = true },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#d8cda0" },
+      GitSignsChange = { fg = "#d3c693" },
+      GitSignsDelete = { fg = "#aa9c66" },
+    },
+    telescope = {
+      TelescopeNormal = { fg = "#e8f0e8", bg = "#101210" },
+      TelescopeBorder = { fg = "#252725", bg = "#101210" },
+      TelescopePromptTitle = { fg = "#101210", bg = "#c8b878", bold = true },
+      TelescopePreviewTitle = { fg = "#101210", bg = "#d8cda0", bold = true },
+      TelescopeResultsTitle = { fg = "#101210", bg = "#d5c999", bold = true },
+      TelescopeSelection = { bg = "#343324" },
+      TelescopeMatching = { fg = "#c8b878", bold = true },
+    },
+    cmp = {
+      CmpItemAbbrMatch = { fg = "#c8b878", bold = true },
+      CmpItemKindVariable = { fg = "#e8f0e8" },
+      CmpItemKindFunction = { fg = "#d5c999" },
+      CmpItemKindKeyword = { fg = "#c8b878" },
+      CmpItemKindClass = { fg = "#e8f0e8" },
+    },
+    indent_blankline = {
+      IblIndent = { fg = "#252725" },
+      IblScope = { fg = "#606560" },
+    },
+    lazy = {
+      LazyH1 = { fg = "#101210", bg = "#c8b878", bold = true },
+      LazyButton = { fg = "#e8f0e8", bg = "#252725" },
+      LazyButtonActive = { fg = "#101210", bg = "#c8b878" },
+    },
+    notify = {
+      NotifyERRORBorder = { fg = "#aa9c66" },
+      NotifyWARNBorder = { fg = "#d3c693" },
+      NotifyINFOBorder = { fg = "#d5c999" },
+      NotifyDEBUGBorder = { fg = "#606560" },
+      NotifyTRACEBorder = { fg = "#c8b878" },
+    },
+  },
+}
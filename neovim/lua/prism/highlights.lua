@@ -22,6 +22,51 @@ local function blend(fg, bg, alpha)
   return string.format("#%02x%02x%02x", r, g, b)
 end
 
+-- Groups whose style comes from config.styles (compiled tables store them unstyled)
+local STYLED = {
+  Comment = "comments",
+  Identifier = "variables",
+  Function = "functions",
+  Keyword = "keywords",
+}
+
+-- Groups whose background is dropped with config.transparent
+local TRANSPARENT = { "Normal", "NormalNC", "SignColumn" }
+
+-- Apply a table precompiled by sync_themes.py (prism.compiled.<name>).
+-- All color math is done at build time; this only calls nvim_set_hl.
+function M.apply_compiled(compiled, config)
+  local set_hl = vim.api.nvim_set_hl
+  local styles = config.styles or {}
+  local int = config.integrations or {}
+  local groups = compiled.groups
+
+  for group, spec in pairs(groups) do
+    set_hl(0, group, spec)
+  end
+
+  for name, section in pairs(compiled.integrations) do
+    if int[name] then
+      for group, spec in pairs(section) do
+        set_hl(0, group, spec)
+      end
+    end
+  end
+
+  for group, key in pairs(STYLED) do
+    local style = styles[key] or (key == "comments" and { italic = true }) or {}
+    if next(style) then
+      set_hl(0, group, vim.tbl_extend("force", groups[group], style))
+    end
+  end
+
+  if config.transparent then
+    for _, group in ipairs(TRANSPARENT) do
+      set_hl(0, group, vim.tbl_extend("force", groups[group], { bg = "NONE" }))
+    end
+  end
+end
+
 function M.apply(preset, config)
   local p = preset.palette
   local s = preset.syntax
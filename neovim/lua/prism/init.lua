@@ -34,25 +34,27 @@ M.config = {
   },
 }
 
--- Load presets
+-- Preset index: names only; presets[name] requires prism.presets.<name> on demand
 M.presets = require("prism.presets")
 
 -- Get list of available themes
 function M.list()
-  local names = {}
-  for name, _ in pairs(M.presets) do
-    table.insert(names, name)
-  end
-  table.sort(names)
-  return names
+  return vim.list_extend({}, M.presets.names)
+end
+
+-- Load the table precompiled by sync_themes.py, if one exists
+local function load_compiled(preset_name)
+  local ok, compiled = pcall(require, "prism.compiled." .. preset_name)
+  return ok and compiled or nil
 end
 
 -- Apply a theme
 function M.load(preset_name)
   preset_name = preset_name or M.config.preset
-  local preset = M.presets[preset_name]
+  local compiled = load_compiled(preset_name)
+  local preset = not compiled and M.presets[preset_name] or nil
   
-  if not preset then
+  if not compiled and not preset then
     vim.notify("Prism: Unknown preset '" .. preset_name .. "'", vim.log.levels.ERROR)
     vim.notify("Available: " .. table.concat(M.list(), ", "), vim.log.levels.INFO)
     return
@@ -63,15 +65,25 @@ function M.load(preset_name)
     vim.cmd("hi clear")
   end
   
+  local mode = (compiled or preset).mode
   vim.o.termguicolors = true
-  vim.o.background = preset.mode == "light" and "light" or "dark"
+  vim.o.background = mode == "light" and "light" or "dark"
   vim.g.colors_name = "prism-" .. preset_name
   
+  if compiled then
+    -- Fast path: palette and groups were derived at build time
+    require("prism.highlights").apply_compiled(compiled, M.config)
+    if M.config.terminal_colors then
+      require("prism.terminal").apply_compiled(compiled.terminal)
+    end
+    return
+  end
+  
   -- Apply highlights
   require("prism.highlights").apply(preset, M.config)
   
   -- Apply terminal colors
-  if M.config.terminal_colors then
+  if M.config.terminal_colors and preset.terminal then
     require("prism.terminal").apply(preset)
   end
 end
@@ -101,7 +113,7 @@ function M.setup(opts)
     pattern = "prism*",
     callback = function(ev)
       local name = ev.match:gsub("^prism%-?", "")
-      if name ~= "" and M.presets[name] then
+      if name ~= "" and (M.presets[name] or load_compiled(name)) then
         M.load(name)
       elseif M.config.preset then
         M.load(M.config.preset)
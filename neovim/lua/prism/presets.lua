@@ -1,713 +0,0 @@
--- PRISM Theme Presets for Neovim
--- Auto-generated from vscode/themes - 64 themes
-
-local M = {}
-
-M.presets = {
-  ["acid_rain"] = {
-    name = "Acid Rain",
-    bg = "#0d1117",
-    fg = "#bc8cff",
-    accent = "#58a6ff",
-    comment = "#6e7681",
-    keyword = "#ff7eb6",
-    string = "#7ee787",
-    func = "#58a6ff",
-    type = "#ffc0d8",
-  },
-  ["amethyst_dusk"] = {
-    name = "Amethyst Dusk",
-    bg = "#282a36",
-    fg = "#f1fa8c",
-    accent = "#bd93f9",
-    comment = "#6272a4",
-    keyword = "#ff79c6",
-    string = "#f1fa8c",
-    func = "#50fa7b",
-    type = "#8be9fd",
-  },
-  ["arctic"] = {
-    name = "Arctic",
-    bg = "#0A090C",
-    fg = "#F0EDEE",
-    accent = "#2C666E",
-    comment = "#4a6670",
-    keyword = "#2C666E",
-    string = "#6b9399",
-    func = "#608c92",
-    type = "#F0EDEE",
-  },
-  ["aurora_glass"] = {
-    name = "Aurora Glass",
-    bg = "#0a0815",
-    fg = "#e8f0f8",
-    accent = "#a78bfa",
-    comment = "#5a5570",
-    keyword = "#a78bfa",
-    string = "#c1adfb",
-    func = "#bda8fb",
-    type = "#e8f0f8",
-  },
-  ["ayu_mirage"] = {
-    name = "Ayu Mirage",
-    bg = "#1f2430",
-    fg = "#cccac2",
-    accent = "#ffcc66",
-    comment = "#5c6773",
-    keyword = "#ffa759",
-    string = "#d5ff80",
-    func = "#ffd580",
-    type = "#73d0ff",
-  },
-  ["biopic"] = {
-    name = "Biopic",
-    bg = "#faf8f5",
-    fg = "#33302a",
-    accent = "#0969da",
-    comment = "#8a8378",
-    keyword = "#0969da",
-    string = "#1f6feb",
-    func = "#0550a0",
-    type = "#033d73",
-  },
-  ["blood_moon"] = {
-    name = "Blood Moon",
-    bg = "#090909",
-    fg = "#f5f5f5",
-    accent = "#d71b1f",
-    comment = "#6b5a5a",
-    keyword = "#d71b1f",
-    string = "#ff9e9e",
-    func = "#ffcccc",
-    type = "#ff7070",
-  },
-  ["catppuccin_mocha"] = {
-    name = "Catppuccin Mocha",
-    bg = "#1e1e2e",
-    fg = "#fab387",
-    accent = "#f38ba8",
-    comment = "#6c6c7e",
-    keyword = "#cba6f7",
-    string = "#a6e3a1",
-    func = "#89b4fa",
-    type = "#f9e2af",
-  },
-  ["champagne_noir"] = {
-    name = "Champagne Noir",
-    bg = "#0a0a08",
-    fg = "#f0ece0",
-    accent = "#f7e7ce",
-    comment = "#6b6560",
-    keyword = "#ffffff",
-    string = "#d4c4a8",
-    func = "#e8d8b8",
-    type = "#a8a090",
-  },
-  ["coastal"] = {
-    name = "Coastal",
-    bg = "#001219",
-    fg = "#E9D8A6",
-    accent = "#0A9396",
-    comment = "#8aa8a8",
-    keyword = "#0A9396",
-    string = "#E9D8A6",
-    func = "#EE9B00",
-    type = "#E9D8A6",
-  },
-  ["cobalt2"] = {
-    name = "Cobalt2",
-    bg = "#193549",
-    fg = "#80ffbb",
-    accent = "#ff9d00",
-    comment = "#6888b8",
-    keyword = "#ff9d00",
-    string = "#3ad900",
-    func = "#ffc600",
-    type = "#80ffbb",
-  },
-  ["constellation_map"] = {
-    name = "Constellation Map",
-    bg = "#050608",
-    fg = "#e8f0ff",
-    accent = "#ffd700",
-    comment = "#485060",
-    keyword = "#ffd700",
-    string = "#88c0d0",
-    func = "#88c0d0",
-    type = "#b48ead",
-  },
-  ["cyber_noir"] = {
-    name = "Cyber Noir",
-    bg = "#0a0a0f",
-    fg = "#a0a8c0",
-    accent = "#00fff0",
-    comment = "#506868",
-    keyword = "#00fff0",
-    string = "#ff6b9d",
-    func = "#b0fffc",
-    type = "#ffd700",
-  },
-  ["diamond_dust"] = {
-    name = "Diamond Dust",
-    bg = "#08090d",
-    fg = "#e8f0ff",
-    accent = "#38bdf8",
-    comment = "#505560",
-    keyword = "#38bdf8",
-    string = "#a5f3fc",
-    func = "#7dd3fc",
-    type = "#e0b0ff",
-  },
-  ["ember_hearth"] = {
-    name = "Ember Hearth",
-    bg = "#1a1210",
-    fg = "#f8f0e0",
-    accent = "#ffd93d",
-    comment = "#886858",
-    keyword = "#ff8060",
-    string = "#ffd93d",
-    func = "#ffc878",
-    type = "#ffd0b0",
-  },
-  ["emerald_velvet"] = {
-    name = "Emerald Velvet",
-    bg = "#0a0f0a",
-    fg = "#d8e0d0",
-    accent = "#d4af37",
-    comment = "#606050",
-    keyword = "#d4af37",
-    string = "#8bc88b",
-    func = "#c8d888",
-    type = "#c8d888",
-  },
-  ["faded_glory"] = {
-    name = "Faded Glory",
-    bg = "#FDF0D5",
-    fg = "#003049",
-    accent = "#C1121F",
-    comment = "#669BBC",
-    keyword = "#C1121F",
-    string = "#669BBC",
-    func = "#003049",
-    type = "#C1121F",
-  },
-  ["fleek_gold"] = {
-    name = "Fleek Gold",
-    bg = "#161616",
-    fg = "#fefefe",
-    accent = "#cbba9f",
-    comment = "#9a886c",
-    keyword = "#cbba9f",
-    string = "#e8d4b0",
-    func = "#f0e0c8",
-    type = "#cbba9f",
-  },
-  ["fleek_gradient"] = {
-    name = "Fleek Gradient",
-    bg = "#0b0b0b",
-    fg = "#ffffff",
-    accent = "#ffe629",
-    comment = "#0090ff",
-    keyword = "#ff6600",
-    string = "#7ee787",
-    func = "#30a46c",
-    type = "#ffe629",
-  },
-  ["forest"] = {
-    name = "Forest",
-    bg = "#050a08",
-    fg = "#c8e8d0",
-    accent = "#62A527",
-    comment = "#1E483C",
-    keyword = "#62A527",
-    string = "#ACD322",
-    func = "#c8e8b0",
-    type = "#62A527",
-  },
-  ["forest_canopy"] = {
-    name = "Forest Canopy",
-    bg = "#0a100a",
-    fg = "#d0e8d0",
-    accent = "#90d870",
-    comment = "#508050",
-    keyword = "#90d870",
-    string = "#b1e39a",
-    func = "#abe193",
-    type = "#d0e8d0",
-  },
-  ["ghost"] = {
-    name = "Ghost",
-    bg = "#e8ecf0",
-    fg = "#384452",
-    accent = "#4080c4",
-    comment = "#7a8a9c",
-    keyword = "#2060a0",
-    string = "#4080c4",
-    func = "#305888",
-    type = "#2060a0",
-  },
-  ["github"] = {
-    name = "Github",
-    bg = "#22272e",
-    fg = "#d8e0e7",
-    accent = "#54aeff",
-    comment = "#545d68",
-    keyword = "#54aeff",
-    string = "#87c6ff",
-    func = "#7ec2ff",
-    type = "#d8e0e7",
-  },
-  ["golden_haze"] = {
-    name = "Golden Haze",
-    bg = "#e8eaee",
-    fg = "#1a1c20",
-    accent = "#ca8a04",
-    comment = "#585048",
-    keyword = "#ca8a04",
-    string = "#888070",
-    func = "#e8b840",
-    type = "#1a1c20",
-  },
-  ["grape"] = {
-    name = "Grape",
-    bg = "#120820",
-    fg = "#F0D6FF",
-    accent = "#7B2CBF",
-    comment = "#685878",
-    keyword = "#a855f7",
-    string = "#e8d8f8",
-    func = "#7B2CBF",
-    type = "#F0D6FF",
-  },
-  ["gruvbox_material"] = {
-    name = "Gruvbox Material",
-    bg = "#282828",
-    fg = "#d3869b",
-    accent = "#b8bb26",
-    comment = "#7c6f64",
-    keyword = "#fb4934",
-    string = "#b8bb26",
-    func = "#fabd2f",
-    type = "#fe8019",
-  },
-  ["holographic"] = {
-    name = "Holographic",
-    bg = "#0a0a0f",
-    fg = "#b967ff",
-    accent = "#01cdfe",
-    comment = "#7888a8",
-    keyword = "#01cdfe",
-    string = "#ff71ce",
-    func = "#ffffff",
-    type = "#b967ff",
-  },
-  ["inferno"] = {
-    name = "Inferno",
-    bg = "#180808",
-    fg = "#FFDB99",
-    accent = "#FB590E",
-    comment = "#886848",
-    keyword = "#FB590E",
-    string = "#ffdd44",
-    func = "#ff9040",
-    type = "#c84400",
-  },
-  ["lavender_dusk"] = {
-    name = "Lavender Dusk",
-    bg = "#10081a",
-    fg = "#e0d0f0",
-    accent = "#b388ff",
-    comment = "#705088",
-    keyword = "#b388ff",
-    string = "#c9abff",
-    func = "#c6a5ff",
-    type = "#e0d0f0",
-  },
-  ["memphis"] = {
-    name = "Memphis",
-    bg = "#000000",
-    fg = "#d8e0e7",
-    accent = "#54aeff",
-    comment = "#1a1f24",
-    keyword = "#54aeff",
-    string = "#b6e3ff",
-    func = "#80ccff",
-    type = "#3888c8",
-  },
-  ["midnight_sapphire"] = {
-    name = "Midnight Sapphire",
-    bg = "#050810",
-    fg = "#e0e8f8",
-    accent = "#c0c0d0",
-    comment = "#606878",
-    keyword = "#6090d0",
-    string = "#c0d0e8",
-    func = "#f0f4f8",
-    type = "#4070a0",
-  },
-  ["minimal"] = {
-    name = "Minimal",
-    bg = "#f5f5f5",
-    fg = "#161616",
-    accent = "#e43938",
-    comment = "#b0a8a6",
-    keyword = "#e43938",
-    string = "#c1302f",
-    func = "#d83635",
-    type = "#161616",
-  },
-  ["mint"] = {
-    name = "Mint",
-    bg = "#0a1818",
-    fg = "#e8f8f0",
-    accent = "#74D2A9",
-    comment = "#48a078",
-    keyword = "#74D2A9",
-    string = "#b8f0d8",
-    func = "#ffffff",
-    type = "#88b8a8",
-  },
-  ["moonlight_ii"] = {
-    name = "Moonlight II",
-    bg = "#1b1d2c",
-    fg = "#c8d3f5",
-    accent = "#82aaff",
-    comment = "#636da6",
-    keyword = "#c792ea",
-    string = "#c3e88d",
-    func = "#82aaff",
-    type = "#c8d3f5",
-  },
-  ["neoform"] = {
-    name = "Neoform",
-    bg = "#f5f7fa",
-    fg = "#2d3848",
-    accent = "#0969da",
-    comment = "#8896a8",
-    keyword = "#0969da",
-    string = "#0550a0",
-    func = "#218bff",
-    type = "#0754ae",
-  },
-  ["neon_nexus"] = {
-    name = "Neon Nexus",
-    bg = "#040804",
-    fg = "#d0ffd0",
-    accent = "#00ff88",
-    comment = "#308830",
-    keyword = "#ff00ff",
-    string = "#00ffff",
-    func = "#00ff88",
-    type = "#ff00aa",
-  },
-  ["nero_marquina"] = {
-    name = "Nero Marquina",
-    bg = "#08080a",
-    fg = "#e8e4dc",
-    accent = "#d4af37",
-    comment = "#5a5a68",
-    keyword = "#d4af37",
-    string = "#e0c773",
-    func = "#dec369",
-    type = "#e8e4dc",
-  },
-  ["night_owl"] = {
-    name = "Night Owl",
-    bg = "#011627",
-    fg = "#d6deeb",
-    accent = "#c792ea",
-    comment = "#82aaff",
-    keyword = "#c792ea",
-    string = "#ecc48d",
-    func = "#82aaff",
-    type = "#ffcb8b",
-  },
-  ["nord_aurora"] = {
-    name = "Nord Aurora",
-    bg = "#2e3440",
-    fg = "#bf616a",
-    accent = "#81a1c1",
-    comment = "#6878a8",
-    keyword = "#81a1c1",
-    string = "#a3be8c",
-    func = "#ffffff",
-    type = "#bf616a",
-  },
-  ["obsidian_rose_gold"] = {
-    name = "Obsidian Rose Gold",
-    bg = "#050404",
-    fg = "#f0e8e8",
-    accent = "#e8b4b8",
-    comment = "#a89898",
-    keyword = "#e8b4b8",
-    string = "#ffeedd",
-    func = "#ffffff",
-    type = "#fe4c6d",
-  },
-  ["ocean"] = {
-    name = "Ocean",
-    bg = "#0a1820",
-    fg = "#348FD5",
-    accent = "#34A0A4",
-    comment = "#507878",
-    keyword = "#34A0A4",
-    string = "#5090c0",
-    func = "#ffffff",
-    type = "#88a8a8",
-  },
-  ["ocean_depths"] = {
-    name = "Ocean Depths",
-    bg = "#0a1018",
-    fg = "#d0e0f0",
-    accent = "#61e8e1",
-    comment = "#506070",
-    keyword = "#61e8e1",
-    string = "#90eeea",
-    func = "#88ede8",
-    type = "#d0e0f0",
-  },
-  ["one_dark_pro"] = {
-    name = "One Dark Pro",
-    bg = "#1e2127",
-    fg = "#c678dd",
-    accent = "#98c379",
-    comment = "#5c6370",
-    keyword = "#c678dd",
-    string = "#98c379",
-    func = "#61afef",
-    type = "#e5c07b",
-  },
-  ["palenight"] = {
-    name = "Palenight",
-    bg = "#1b1e2b",
-    fg = "#a6accd",
-    accent = "#c792ea",
-    comment = "#676e95",
-    keyword = "#c792ea",
-    string = "#c3e88d",
-    func = "#82aaff",
-    type = "#ffcb6b",
-  },
-  ["rose"] = {
-    name = "Rose",
-    bg = "#140006",
-    fg = "#FAE0E4",
-    accent = "#FF99AC",
-    comment = "#FF7096",
-    keyword = "#FF99AC",
-    string = "#ffb7c4",
-    func = "#ffb2c0",
-    type = "#FAE0E4",
-  },
-  ["rose_gold"] = {
-    name = "Rose Gold",
-    bg = "#8a2d4f",
-    fg = "#f7dcbc",
-    accent = "#ffa6ab",
-    comment = "#a89090",
-    keyword = "#ffa6ab",
-    string = "#ffeedd",
-    func = "#ffffff",
-    type = "#d08088",
-  },
-  ["slate_and_gold"] = {
-    name = "Slate & Gold",
-    bg = "#12141a",
-    fg = "#d8dce8",
-    accent = "#ffd700",
-    comment = "#606878",
-    keyword = "#ffd700",
-    string = "#ffe34c",
-    func = "#ffe13f",
-    type = "#d8dce8",
-  },
-  ["soft_charcoal"] = {
-    name = "Soft Charcoal",
-    bg = "#2a2a32",
-    fg = "#e8e8f0",
-    accent = "#fbbf24",
-    comment = "#70707a",
-    keyword = "#fbbf24",
-    string = "#fcd265",
-    func = "#fccf5a",
-    type = "#e8e8f0",
-  },
-  ["sunset"] = {
-    name = "Sunset",
-    bg = "#1a0820",
-    fg = "#FFBD00",
-    accent = "#FF0054",
-    comment = "#987080",
-    keyword = "#FF0054",
-    string = "#ffb080",
-    func = "#ff6090",
-    type = "#FFBD00",
-  },
-  ["synthwave"] = {
-    name = "Synthwave",
-    bg = "#0a0014",
-    fg = "#e0d0f0",
-    accent = "#7209B7",
-    comment = "#8060a0",
-    keyword = "#ff00ff",
-    string = "#00ffff",
-    func = "#ff79c6",
-    type = "#F72585",
-  },
-  ["synthwave_84"] = {
-    name = "Synthwave 84",
-    bg = "#262335",
-    fg = "#ff8b39",
-    accent = "#36f9f6",
-    comment = "#614d73",
-    keyword = "#ff7edb",
-    string = "#f97e72",
-    func = "#36f9f6",
-    type = "#ff8b39",
-  },
-  ["tessier"] = {
-    name = "Tessier",
-    bg = "#ffffff",
-    fg = "#1a2028",
-    accent = "#0758c9",
-    comment = "#6b7a8a",
-    keyword = "#0758c9",
-    string = "#054090",
-    func = "#1a70e0",
-    type = "#0550b0",
-  },
-  ["tide_pool"] = {
-    name = "Tide Pool",
-    bg = "#06090c",
-    fg = "#e0f0f8",
-    accent = "#40e0d0",
-    comment = "#485560",
-    keyword = "#40e0d0",
-    string = "#79e9de",
-    func = "#6fe7db",
-    type = "#e0f0f8",
-  },
-  ["tokyo_night_bento"] = {
-    name = "Tokyo Night Bento",
-    bg = "#0f0f18",
-    fg = "#e8e8f0",
-    accent = "#bb9af7",
-    comment = "#6878a0",
-    keyword = "#bb9af7",
-    string = "#9ece6a",
-    func = "#8b53f1",
-    type = "#2ac3de",
-  },
-  ["tropical"] = {
-    name = "Tropical",
-    bg = "#0a1810",
-    fg = "#f0f8f0",
-    accent = "#E42565",
-    comment = "#708870",
-    keyword = "#E42565",
-    string = "#ffd0d8",
-    func = "#ffffff",
-    type = "#f0b880",
-  },
-  ["tuned"] = {
-    name = "Tuned",
-    bg = "#191c20",
-    fg = "#c5d0dd",
-    accent = "#54aeff",
-    comment = "#3a424f",
-    keyword = "#54aeff",
-    string = "#b6e3ff",
-    func = "#80ccff",
-    type = "#3888c8",
-  },
-  ["twilight_lagoon"] = {
-    name = "Twilight Lagoon",
-    bg = "#191724",
-    fg = "#c4a7e7",
-    accent = "#31748f",
-    comment = "#6e6a86",
-    keyword = "#31748f",
-    string = "#f6c177",
-    func = "#e0e0e0",
-    type = "#c4a7e7",
-  },
-  ["ultraviolet"] = {
-    name = "Ultraviolet",
-    bg = "#1a0a2e",
-    fg = "#50fa7b",
-    accent = "#ff79c6",
-    comment = "#bd93f9",
-    keyword = "#ff79c6",
-    string = "#ffa1d7",
-    func = "#ff9ad4",
-    type = "#50fa7b",
-  },
-  ["vaporwave"] = {
-    name = "Vaporwave",
-    bg = "#1a0828",
-    fg = "#00E5E8",
-    accent = "#FF3CC7",
-    comment = "#a090b0",
-    keyword = "#FF3CC7",
-    string = "#01cdfe",
-    func = "#ffffff",
-    type = "#00E5E8",
-  },
-  ["vaporwave_sunset"] = {
-    name = "Vaporwave Sunset",
-    bg = "#100818",
-    fg = "#f0e0ff",
-    accent = "#00ffff",
-    comment = "#8060a0",
-    keyword = "#ff71ce",
-    string = "#ffb8d8",
-    func = "#00ffff",
-    type = "#f0e0ff",
-  },
-  ["verde"] = {
-    name = "Verde",
-    bg = "#0a0a0a",
-    fg = "#f0ece0",
-    accent = "#3cb878",
-    comment = "#6a6560",
-    keyword = "#3cb878",
-    string = "#76cda0",
-    func = "#6cc999",
-    type = "#f0ece0",
-  },
-  ["verde_light"] = {
-    name = "Verde Light",
-    bg = "#fafaf8",
-    fg = "#1a1a18",
-    accent = "#2a9860",
-    comment = "#6a6a68",
-    keyword = "#2a9860",
-    string = "#238151",
-    func = "#27905b",
-    type = "#1a1a18",
-  },
-  ["vesper"] = {
-    name = "Vesper",
-    bg = "#F8F8F7",
-    fg = "#272727",
-    accent = "#676266",
-    comment = "#C39B83",
-    keyword = "#676266",
-    string = "#575356",
-    func = "#615d60",
-    type = "#272727",
-  },
-  ["zen_garden"] = {
-    name = "Zen Garden",
-    bg = "#101210",
-    fg = "#e8f0e8",
-    accent = "#c8b878",
-    comment = "#606560",
-    keyword = "#c8b878",
-    string = "#d8cda0",
-    func = "#d5c999",
-    type = "#e8f0e8",
-  },
-}
-
-return M
@@ -0,0 +1,14 @@
+-- PRISM preset: acid_rain
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Acid Rain",
+  bg = "#0d1117",
+  fg = "#bc8cff",
+  accent = "#58a6ff",
+  comment = "#6e7681",
+  keyword = "#ff7eb6",
+  string = "#7ee787",
+  func = "#58a6ff",
+  type = "#ffc0d8",
+}
@@ -0,0 +1,14 @@
+-- PRISM preset: amethyst_dusk
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Amethyst Dusk",
+  bg = "#282a36",
+  fg = "#f1fa8c",
+  accent = "#bd93f9",
+  comment = "#6272a4",
+  keyword = "#ff79c6",
+  string = "#f1fa8c",
+  func = "#50fa7b",
+  type = "#8be9fd",
+}
@@ -0,0 +1,14 @@
+-- PRISM preset: arctic
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Arctic",
+  bg = "#0A090C",
+  fg = "#F0EDEE",
+  accent = "#2C666E",
+  comment = "#4a6670",
+  keyword = "#2C666E",
+  string = "#6b9399",
+  func = "#608c92",
+  type = "#F0EDEE",
+}
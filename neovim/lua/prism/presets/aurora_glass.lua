@@ -0,0 +1,14 @@
+-- PRISM preset: aurora_glass
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Aurora Glass",
+  bg = "#0a0815",
+  fg = "#e8f0f8",
+  accent = "#a78bfa",
+  comment = "#5a5570",
+  keyword = "#a78bfa",
+  string = "#c1adfb",
+  func = "#bda8fb",
+  type = "#e8f0f8",
+}
@@ -0,0 +1,14 @@
+-- PRISM preset: ayu_mirage
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Ayu Mirage",
+  bg = "#1f2430",
+  fg = "#cccac2",
+  accent = "#ffcc66",
+  comment = "#5c6773",
+  keyword = "#ffa759",
+  string = "#d5ff80",
+  func = "#ffd580",
+  type = "#73d0ff",
+}
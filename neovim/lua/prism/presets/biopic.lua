@@ -0,0 +1,14 @@
+-- PRISM preset: biopic
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Biopic",
+  bg = "#faf8f5",
+  fg = "#33302a",
+  accent = "#0969da",
+  comment = "#8a8378",
+  keyword = "#0969da",
+  string = "#1f6feb",
+  func = "#0550a0",
+  type = "#033d73",
+}
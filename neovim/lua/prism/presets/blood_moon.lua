@@ -0,0 +1,14 @@
+-- PRISM preset: blood_moon
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Blood Moon",
+  bg = "#090909",
+  fg = "#f5f5f5",
+  accent = "#d71b1f",
+  comment = "#6b5a5a",
+  keyword = "#d71b1f",
+  string = "#ff9e9e",
+  func = "#ffcccc",
+  type = "#ff7070",
+}
@@ -0,0 +1,14 @@
+-- PRISM preset: catppuccin_mocha
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Catppuccin Mocha",
+  bg = "#1e1e2e",
+  fg = "#fab387",
+  accent = "#f38ba8",
+  comment = "#6c6c7e",
+  keyword = "#cba6f7",
+  string = "#a6e3a1",
+  func = "#89b4fa",
+  type = "#f9e2af",
+}
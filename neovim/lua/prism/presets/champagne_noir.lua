@@ -0,0 +1,14 @@
+-- PRISM preset: champagne_noir
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Champagne Noir",
+  bg = "#0a0a08",
+  fg = "#f0ece0",
+  accent = "#f7e7ce",
+  comment = "#6b6560",
+  keyword = "#ffffff",
+  string = "#d4c4a8",
+  func = "#e8d8b8",
+  type = "#a8a090",
+}
@@ -0,0 +1,14 @@
+-- PRISM preset: coastal
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Coastal",
+  bg = "#001219",
+  fg = "#E9D8A6",
+  accent = "#0A9396",
+  comment = "#8aa8a8",
+  keyword = "#0A9396",
+  string = "#E9D8A6",
+  func = "#EE9B00",
+  type = "#E9D8A6",
+}
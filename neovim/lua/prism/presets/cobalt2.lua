@@ -0,0 +1,14 @@
+-- PRISM preset: cobalt2
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Cobalt2",
+  bg = "#193549",
+  fg = "#80ffbb",
+  accent = "#ff9d00",
+  comment = "#6888b8",
+  keyword = "#ff9d00",
+  string = "#3ad900",
+  func = "#ffc600",
+  type = "#80ffbb",
+}
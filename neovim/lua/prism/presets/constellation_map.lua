@@ -0,0 +1,14 @@
+-- PRISM preset: constellation_map
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Constellation Map",
+  bg = "#050608",
+  fg = "#e8f0ff",
+  accent = "#ffd700",
+  comment = "#485060",
+  keyword = "#ffd700",
+  string = "#88c0d0",
+  func = "#88c0d0",
+  type = "#b48ead",
+}
@@ -0,0 +1,14 @@
+-- PRISM preset: cyber_noir
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Cyber Noir",
+  bg = "#0a0a0f",
+  fg = "#a0a8c0",
+  accent = "#00fff0",
+  comment = "#506868",
+  keyword = "#00fff0",
+  string = "#ff6b9d",
+  func = "#b0fffc",
+  type = "#ffd700",
+}
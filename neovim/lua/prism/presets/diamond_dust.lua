@@ -0,0 +1,14 @@
+-- PRISM preset: diamond_dust
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Diamond Dust",
+  bg = "#08090d",
+  fg = "#e8f0ff",
+  accent = "#38bdf8",
+  comment = "#505560",
+  keyword = "#38bdf8",
+  string = "#a5f3fc",
+  func = "#7dd3fc",
+  type = "#e0b0ff",
+}
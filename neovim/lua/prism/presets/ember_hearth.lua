@@ -0,0 +1,14 @@
+-- PRISM preset: ember_hearth
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Ember Hearth",
+  bg = "#1a1210",
+  fg = "#f8f0e0",
+  accent = "#ffd93d",
+  comment = "#886858",
+  keyword = "#ff8060",
+  string = "#ffd93d",
+  func = "#ffc878",
+  type = "#ffd0b0",
+}
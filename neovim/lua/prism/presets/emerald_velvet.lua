@@ -0,0 +1,14 @@
+-- PRISM preset: emerald_velvet
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Emerald Velvet",
+  bg = "#0a0f0a",
+  fg = "#d8e0d0",
+  accent = "#d4af37",
+  comment = "#606050",
+  keyword = "#d4af37",
+  string = "#8bc88b",
+  func = "#c8d888",
+  type = "#c8d888",
+}
@@ -0,0 +1,14 @@
+-- PRISM preset: faded_glory
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Faded Glory",
+  bg = "#FDF0D5",
+  fg = "#003049",
+  accent = "#C1121F",
+  comment = "#669BBC",
+  keyword = "#C1121F",
+  string = "#669BBC",
+  func = "#003049",
+  type = "#C1121F",
+}
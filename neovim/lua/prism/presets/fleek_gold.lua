@@ -0,0 +1,14 @@
+-- PRISM preset: fleek_gold
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Fleek Gold",
+  bg = "#161616",
+  fg = "#fefefe",
+  accent = "#cbba9f",
+  comment = "#9a886c",
+  keyword = "#cbba9f",
+  string = "#e8d4b0",
+  func = "#f0e0c8",
+  type = "#cbba9f",
+}
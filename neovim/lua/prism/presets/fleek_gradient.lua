@@ -0,0 +1,14 @@
+-- PRISM preset: fleek_gradient
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Fleek Gradient",
+  bg = "#0b0b0b",
+  fg = "#ffffff",
+  accent = "#ffe629",
+  comment = "#0090ff",
+  keyword = "#ff6600",
+  string = "#7ee787",
+  func = "#30a46c",
+  type = "#ffe629",
+}
@@ -0,0 +1,14 @@
+-- PRISM preset: forest
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Forest",
+  bg = "#050a08",
+  fg = "#c8e8d0",
+  accent = "#62A527",
+  comment = "#1E483C",
+  keyword = "#62A527",
+  string = "#ACD322",
+  func = "#c8e8b0",
+  type = "#62A527",
+}
@@ -0,0 +1,14 @@
+-- PRISM preset: forest_canopy
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Forest Canopy",
+  bg = "#0a100a",
+  fg = "#d0e8d0",
+  accent = "#90d870",
+  comment = "#508050",
+  keyword = "#90d870",
+  string = "#b1e39a",
+  func = "#abe193",
+  type = "#d0e8d0",
+}
@@ -0,0 +1,14 @@
+-- PRISM preset: ghost
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Ghost",
+  bg = "#e8ecf0",
+  fg = "#384452",
+  accent = "#4080c4",
+  comment = "#7a8a9c",
+  keyword = "#2060a0",
+  string = "#4080c4",
+  func = "#305888",
+  type = "#2060a0",
+}
@@ -0,0 +1,14 @@
+-- PRISM preset: github
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Github",
+  bg = "#22272e",
+  fg = "#d8e0e7",
+  accent = "#54aeff",
+  comment = "#545d68",
+  keyword = "#54aeff",
+  string = "#87c6ff",
+  func = "#7ec2ff",
+  type = "#d8e0e7",
+}
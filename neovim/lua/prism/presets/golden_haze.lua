@@ -0,0 +1,14 @@
+-- PRISM preset: golden_haze
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Golden Haze",
+  bg = "#e8eaee",
+  fg = "#1a1c20",
+  accent = "#ca8a04",
+  comment = "#585048",
+  keyword = "#ca8a04",
+  string = "#888070",
+  func = "#e8b840",
+  type = "#1a1c20",
+}
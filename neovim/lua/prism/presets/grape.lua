@@ -0,0 +1,14 @@
+-- PRISM preset: grape
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Grape",
+  bg = "#120820",
+  fg = "#F0D6FF",
+  accent = "#7B2CBF",
+  comment = "#685878",
+  keyword = "#a855f7",
+  string = "#e8d8f8",
+  func = "#7B2CBF",
+  type = "#F0D6FF",
+}
@@ -0,0 +1,14 @@
+-- PRISM preset: gruvbox_material
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Gruvbox Material",
+  bg = "#282828",
+  fg = "#d3869b",
+  accent = "#b8bb26",
+  comment = "#7c6f64",
+  keyword = "#fb4934",
+  string = "#b8bb26",
+  func = "#fabd2f",
+  type = "#fe8019",
+}
@@ -0,0 +1,14 @@
+-- PRISM preset: holographic
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Holographic",
+  bg = "#0a0a0f",
+  fg = "#b967ff",
+  accent = "#01cdfe",
+  comment = "#7888a8",
+  keyword = "#01cdfe",
+  string = "#ff71ce",
+  func = "#ffffff",
+  type = "#b967ff",
+}
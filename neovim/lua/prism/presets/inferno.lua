@@ -0,0 +1,14 @@
+-- PRISM preset: inferno
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Inferno",
+  bg = "#180808",
+  fg = "#FFDB99",
+  accent = "#FB590E",
+  comment = "#886848",
+  keyword = "#FB590E",
+  string = "#ffdd44",
+  func = "#ff9040",
+  type = "#c84400",
+}
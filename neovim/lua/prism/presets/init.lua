@@ -0,0 +1,129 @@
+-- PRISM Theme Presets for Neovim
+-- Auto-generated from vscode/themes - DO NOT EDIT
+--
+-- Index only: each preset lives in prism.presets.<name> and is required on
+-- first access (presets[name]), so loading the plugin parses one preset.
+
+local M = {}
+
+-- Every preset name, sorted (used by :PrismList and :Prism completion)
+M.names = {
+  "acid_rain",
+  "amethyst_dusk",
+  "arctic",
+  "aurora_glass",
+  "ayu_mirage",
+  "biopic",
+  "blood_moon",
+  "catppuccin_mocha",
+  "champagne_noir",
+  "coastal",
+  "cobalt2",
+  "constellation_map",
+  "cyber_noir",
+  "diamond_dust",
+  "ember_hearth",
+  "emerald_velvet",
+  "faded_glory",
+  "fleek_gold",
+  "fleek_gradient",
+  "forest",
+  "forest_canopy",
+  "ghost",
+  "github",
+  "golden_haze",
+  "grape",
+  "gruvbox_material",
+  "holographic",
+  "inferno",
+  "lavender_dusk",
+  "memphis",
+  "midnight_sapphire",
+  "minimal",
+  "mint",
+  "moonlight_ii",
+  "neoform",
+  "neon_nexus",
+  "nero_marquina",
+  "night_owl",
+  "nord_aurora",
+  "obsidian_rose_gold",
+  "ocean",
+  "ocean_depths",
+  "one_dark_pro",
+  "palenight",
+  "rose",
+  "rose_gold",
+  "slate_and_gold",
+  "soft_charcoal",
+  "sunset",
+  "synthwave",
+  "synthwave_84",
+  "tessier",
+  "tide_pool",
+  "tokyo_night_bento",
+  "tropical",
+  "tuned",
+  "twilight_lagoon",
+  "ultraviolet",
+  "vaporwave",
+  "vaporwave_sunset",
+  "verde",
+  "verde_light",
+  "vesper",
+  "zen_garden",
+}
+
+--- Build the full preset structure from a Base16 palette
+function M.make_preset(name, mode, palette)
+  return {
+    name = name,
+    mode = mode,
+    palette = palette,
+    syntax = {
+      comment = palette.base03,
+      string = palette.base0B,
+      number = palette.base09,
+      keyword = palette.base0E,
+      func = palette.base0D,
+      type = palette.base0A,
+      variable = palette.base05,
+      property = palette.base05,
+      operator = palette.base04,
+      punctuation = palette.base04,
+      tag = palette.base08,
+      attribute = palette.base09,
+    },
+    ui = {
+      bg = palette.base00,
+      fg = palette.base05,
+      accent = palette.base0A,
+      error = palette.base08,
+      warning = palette.base09,
+      success = palette.base0B,
+      info = palette.base0D,
+    },
+  }
+end
+
+--- Generate a custom preset dynamically
+--- @param name string Preset name
+--- @param config table Configuration for colors.generate_palette
+--- @return table Preset structure
+function M.generate(name, config)
+  local colors = require("prism.colors")
+  return M.make_preset(name, config.theme or "dark", colors.generate_palette(config))
+end
+
+return setmetatable(M, {
+  __index = function(t, name)
+    if type(name) ~= "string" then
+      return nil
+    end
+    local ok, preset = pcall(require, "prism.presets." .. name)
+    if ok then
+      rawset(t, name, preset)
+      return preset
+    end
+  end,
+})
@@ -0,0 +1,14 @@
+-- PRISM preset: lavender_dusk
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Lavender Dusk",
+  bg = "#10081a",
+  fg = "#e0d0f0",
+  accent = "#b388ff",
+  comment = "#705088",
+  keyword = "#b388ff",
+  string = "#c9abff",
+  func = "#c6a5ff",
+  type = "#e0d0f0",
+}
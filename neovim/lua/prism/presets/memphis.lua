@@ -0,0 +1,14 @@
+-- PRISM preset: memphis
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Memphis",
+  bg = "#000000",
+  fg = "#d8e0e7",
+  accent = "#54aeff",
+  comment = "#1a1f24",
+  keyword = "#54aeff",
+  string = "#b6e3ff",
+  func = "#80ccff",
+  type = "#3888c8",
+}
@@ -0,0 +1,14 @@
+-- PRISM preset: midnight_sapphire
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Midnight Sapphire",
+  bg = "#050810",
+  fg = "#e0e8f8",
+  accent = "#c0c0d0",
+  comment = "#606878",
+  keyword = "#6090d0",
+  string = "#c0d0e8",
+  func = "#f0f4f8",
+  type = "#4070a0",
+}
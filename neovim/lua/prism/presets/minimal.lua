@@ -0,0 +1,14 @@
+-- PRISM preset: minimal
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Minimal",
+  bg = "#f5f5f5",
+  fg = "#161616",
+  accent = "#e43938",
+  comment = "#b0a8a6",
+  keyword = "#e43938",
+  string = "#c1302f",
+  func = "#d83635",
+  type = "#161616",
+}
@@ -0,0 +1,14 @@
+-- PRISM preset: mint
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Mint",
+  bg = "#0a1818",
+  fg = "#e8f8f0",
+  accent = "#74D2A9",
+  comment = "#48a078",
+  keyword = "#74D2A9",
+  string = "#b8f0d8",
+  func = "#ffffff",
+  type = "#88b8a8",
+}
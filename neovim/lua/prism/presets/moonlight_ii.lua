@@ -0,0 +1,14 @@
+-- PRISM preset: moonlight_ii
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Moonlight II",
+  bg = "#1b1d2c",
+  fg = "#c8d3f5",
+  accent = "#82aaff",
+  comment = "#636da6",
+  keyword = "#c792ea",
+  string = "#c3e88d",
+  func = "#82aaff",
+  type = "#c8d3f5",
+}
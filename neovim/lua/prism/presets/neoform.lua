@@ -0,0 +1,14 @@
+-- PRISM preset: neoform
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Neoform",
+  bg = "#f5f7fa",
+  fg = "#2d3848",
+  accent = "#0969da",
+  comment = "#8896a8",
+  keyword = "#0969da",
+  string = "#0550a0",
+  func = "#218bff",
+  type = "#0754ae",
+}
@@ -0,0 +1,14 @@
+-- PRISM preset: neon_nexus
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Neon Nexus",
+  bg = "#040804",
+  fg = "#d0ffd0",
+  accent = "#00ff88",
+  comment = "#308830",
+  keyword = "#ff00ff",
+  string = "#00ffff",
+  func = "#00ff88",
+  type = "#ff00aa",
+}
@@ -0,0 +1,14 @@
+-- PRISM preset: nero_marquina
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Nero Marquina",
+  bg = "#08080a",
+  fg = "#e8e4dc",
+  accent = "#d4af37",
+  comment = "#5a5a68",
+  keyword = "#d4af37",
+  string = "#e0c773",
+  func = "#dec369",
+  type = "#e8e4dc",
+}
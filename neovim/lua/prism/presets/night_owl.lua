@@ -0,0 +1,14 @@
+-- PRISM preset: night_owl
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Night Owl",
+  bg = "#011627",
+  fg = "#d6deeb",
+  accent = "#c792ea",
+  comment = "#82aaff",
+  keyword = "#c792ea",
+  string = "#ecc48d",
+  func = "#82aaff",
+  type = "#ffcb8b",
+}
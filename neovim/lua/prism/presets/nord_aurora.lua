@@ -0,0 +1,14 @@
+-- PRISM preset: nord_aurora
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Nord Aurora",
+  bg = "#0f1318",
+  fg = "#bf616a",
+  accent = "#81a1c1",
+  comment = "#6878a8",
+  keyword = "#81a1c1",
+  string = "#a3be8c",
+  func = "#ffffff",
+  type = "#bf616a",
+}
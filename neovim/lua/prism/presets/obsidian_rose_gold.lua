@@ -0,0 +1,14 @@
+-- PRISM preset: obsidian_rose_gold
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Obsidian Rose Gold",
+  bg = "#050404",
+  fg = "#f0e8e8",
+  accent = "#e8b4b8",
+  comment = "#a89898",
+  keyword = "#e8b4b8",
+  string = "#ffeedd",
+  func = "#ffffff",
+  type = "#fe4c6d",
+}
@@ -0,0 +1,14 @@
+-- PRISM preset: ocean
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Ocean",
+  bg = "#0a1820",
+  fg = "#348FD5",
+  accent = "#34A0A4",
+  comment = "#507878",
+  keyword = "#34A0A4",
+  string = "#5090c0",
+  func = "#ffffff",
+  type = "#88a8a8",
+}
@@ -0,0 +1,14 @@
+-- PRISM preset: ocean_depths
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Ocean Depths",
+  bg = "#0a1018",
+  fg = "#d0e0f0",
+  accent = "#61e8e1",
+  comment = "#506070",
+  keyword = "#61e8e1",
+  string = "#90eeea",
+  func = "#88ede8",
+  type = "#d0e0f0",
+}
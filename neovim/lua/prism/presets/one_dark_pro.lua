@@ -0,0 +1,14 @@
+-- PRISM preset: one_dark_pro
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "One Dark Pro",
+  bg = "#1e2127",
+  fg = "#c678dd",
+  accent = "#98c379",
+  comment = "#5c6370",
+  keyword = "#c678dd",
+  string = "#98c379",
+  func = "#61afef",
+  type = "#e5c07b",
+}
@@ -0,0 +1,14 @@
+-- PRISM preset: palenight
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Palenight",
+  bg = "#1b1e2b",
+  fg = "#a6accd",
+  accent = "#c792ea",
+  comment = "#676e95",
+  keyword = "#c792ea",
+  string = "#c3e88d",
+  func = "#82aaff",
+  type = "#ffcb6b",
+}
@@ -0,0 +1,14 @@
+-- PRISM preset: rose
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Rose",
+  bg = "#140006",
+  fg = "#FAE0E4",
+  accent = "#FF99AC",
+  comment = "#FF7096",
+  keyword = "#FF99AC",
+  string = "#ffb7c4",
+  func = "#ffb2c0",
+  type = "#FAE0E4",
+}
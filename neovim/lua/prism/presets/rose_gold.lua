@@ -0,0 +1,14 @@
+-- PRISM preset: rose_gold
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Rose Gold",
+  bg = "#8a2d4f",
+  fg = "#f7dcbc",
+  accent = "#ffa6ab",
+  comment = "#a89090",
+  keyword = "#ffa6ab",
+  string = "#ffeedd",
+  func = "#ffffff",
+  type = "#d08088",
+}
@@ -0,0 +1,14 @@
+-- PRISM preset: slate_and_gold
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Slate & Gold",
+  bg = "#12141a",
+  fg = "#d8dce8",
+  accent = "#ffd700",
+  comment = "#606878",
+  keyword = "#ffd700",
+  string = "#ffe34c",
+  func = "#ffe13f",
+  type = "#d8dce8",
+}
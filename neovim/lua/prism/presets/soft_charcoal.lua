@@ -0,0 +1,14 @@
+-- PRISM preset: soft_charcoal
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Soft Charcoal",
+  bg = "#2a2a32",
+  fg = "#e8e8f0",
+  accent = "#fbbf24",
+  comment = "#70707a",
+  keyword = "#fbbf24",
+  string = "#fcd265",
+  func = "#fccf5a",
+  type = "#e8e8f0",
+}
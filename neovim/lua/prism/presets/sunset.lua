@@ -0,0 +1,14 @@
+-- PRISM preset: sunset
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Sunset",
+  bg = "#1a0820",
+  fg = "#FFBD00",
+  accent = "#FF0054",
+  comment = "#987080",
+  keyword = "#FF0054",
+  string = "#ffb080",
+  func = "#ff6090",
+  type = "#FFBD00",
+}
@@ -0,0 +1,14 @@
+-- PRISM preset: synthwave
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Synthwave",
+  bg = "#0a0014",
+  fg = "#e0d0f0",
+  accent = "#7209B7",
+  comment = "#8060a0",
+  keyword = "#ff00ff",
+  string = "#00ffff",
+  func = "#ff79c6",
+  type = "#F72585",
+}
@@ -0,0 +1,14 @@
+-- PRISM preset: synthwave_84
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Synthwave 84",
+  bg = "#262335",
+  fg = "#ff8b39",
+  accent = "#36f9f6",
+  comment = "#614d73",
+  keyword = "#ff7edb",
+  string = "#f97e72",
+  func = "#36f9f6",
+  type = "#ff8b39",
+}
@@ -0,0 +1,14 @@
+-- PRISM preset: tessier
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Tessier",
+  bg = "#ffffff",
+  fg = "#1a2028",
+  accent = "#0758c9",
+  comment = "#6b7a8a",
+  keyword = "#0758c9",
+  string = "#054090",
+  func = "#1a70e0",
+  type = "#0550b0",
+}
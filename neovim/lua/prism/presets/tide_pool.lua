@@ -0,0 +1,14 @@
+-- PRISM preset: tide_pool
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Tide Pool",
+  bg = "#06090c",
+  fg = "#e0f0f8",
+  accent = "#40e0d0",
+  comment = "#485560",
+  keyword = "#40e0d0",
+  string = "#79e9de",
+  func = "#6fe7db",
+  type = "#e0f0f8",
+}
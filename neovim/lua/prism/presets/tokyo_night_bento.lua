@@ -0,0 +1,14 @@
+-- PRISM preset: tokyo_night_bento
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Tokyo Night Bento",
+  bg = "#0f0f18",
+  fg = "#e8e8f0",
+  accent = "#bb9af7",
+  comment = "#6878a0",
+  keyword = "#bb9af7",
+  string = "#9ece6a",
+  func = "#8b53f1",
+  type = "#2ac3de",
+}
@@ -0,0 +1,14 @@
+-- PRISM preset: tropical
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Tropical",
+  bg = "#0a1810",
+  fg = "#f0f8f0",
+  accent = "#E42565",
+  comment = "#708870",
+  keyword = "#E42565",
+  string = "#ffd0d8",
+  func = "#ffffff",
+  type = "#f0b880",
+}
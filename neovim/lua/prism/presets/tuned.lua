@@ -0,0 +1,14 @@
+-- PRISM preset: tuned
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Tuned",
+  bg = "#191c20",
+  fg = "#c5d0dd",
+  accent = "#54aeff",
+  comment = "#3a424f",
+  keyword = "#54aeff",
+  string = "#b6e3ff",
+  func = "#80ccff",
+  type = "#3888c8",
+}
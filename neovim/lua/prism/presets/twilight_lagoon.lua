@@ -0,0 +1,14 @@
+-- PRISM preset: twilight_lagoon
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Twilight Lagoon",
+  bg = "#191724",
+  fg = "#c4a7e7",
+  accent = "#31748f",
+  comment = "#6e6a86",
+  keyword = "#31748f",
+  string = "#f6c177",
+  func = "#e0e0e0",
+  type = "#c4a7e7",
+}
@@ -0,0 +1,14 @@
+-- PRISM preset: ultraviolet
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Ultraviolet",
+  bg = "#1a0a2e",
+  fg = "#50fa7b",
+  accent = "#ff79c6",
+  comment = "#bd93f9",
+  keyword = "#ff79c6",
+  string = "#ffa1d7",
+  func = "#ff9ad4",
+  type = "#50fa7b",
+}
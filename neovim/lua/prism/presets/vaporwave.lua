@@ -0,0 +1,14 @@
+-- PRISM preset: vaporwave
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Vaporwave",
+  bg = "#1a0828",
+  fg = "#00E5E8",
+  accent = "#FF3CC7",
+  comment = "#a090b0",
+  keyword = "#FF3CC7",
+  string = "#01cdfe",
+  func = "#ffffff",
+  type = "#00E5E8",
+}
@@ -0,0 +1,14 @@
+-- PRISM preset: vaporwave_sunset
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Vaporwave Sunset",
+  bg = "#100818",
+  fg = "#f0e0ff",
+  accent = "#00ffff",
+  comment = "#8060a0",
+  keyword = "#ff71ce",
+  string = "#ffb8d8",
+  func = "#00ffff",
+  type = "#f0e0ff",
+}
@@ -0,0 +1,14 @@
+-- PRISM preset: verde
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Verde",
+  bg = "#0a0a0a",
+  fg = "#f0ece0",
+  accent = "#3cb878",
+  comment = "#6a6560",
+  keyword = "#3cb878",
+  string = "#76cda0",
+  func = "#6cc999",
+  type = "#f0ece0",
+}
@@ -0,0 +1,14 @@
+-- PRISM preset: verde_light
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Verde Light",
+  bg = "#fafaf8",
+  fg = "#1a1a18",
+  accent = "#2a9860",
+  comment = "#6a6a68",
+  keyword = "#2a9860",
+  string = "#238151",
+  func = "#27905b",
+  type = "#1a1a18",
+}
@@ -0,0 +1,14 @@
+-- PRISM preset: vesper
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Vesper",
+  bg = "#F8F8F7",
+  fg = "#272727",
+  accent = "#676266",
+  comment = "#C39B83",
+  keyword = "#676266",
+  string = "#575356",
+  func = "#615d60",
+  type = "#272727",
+}
@@ -0,0 +1,14 @@
+-- PRISM preset: zen_garden
+-- Auto-generated from vscode/themes - DO NOT EDIT
+
+return {
+  name = "Zen Garden",
+  bg = "#101210",
+  fg = "#e8f0e8",
+  accent = "#c8b878",
+  comment = "#606560",
+  keyword = "#c8b878",
+  string = "#d8cda0",
+  func = "#d5c999",
+  type = "#e8f0e8",
+}
@@ -125,10 +125,10 @@ function M.preset_picker(opts)
   
   -- Convert presets table to list
   local preset_list = {}
-  for id, preset in pairs(presets) do
+  for _, id in ipairs(presets.names) do
     table.insert(preset_list, {
       id = id,
-      preset = preset,
+      preset = presets[id],
     })
   end
   
@@ -23,4 +23,11 @@ function M.apply(preset)
   vim.g.terminal_color_15 = t.bright_white
 end
 
+-- Compiled presets store the 16 colors as a list (terminal_color_0 .. 15)
+function M.apply_compiled(colors)
+  for i, color in ipairs(colors) do
+    vim.g["terminal_color_" .. (i - 1)] = color
+  end
+end
+
 return M
@@ -0,0 +1,413 @@
+#!/usr/bin/env python3
+"""
+Benchmark every stage of the theme generation pipeline.
+
+Stages are timed separately (JSON load, color extraction, color-math kernels,
+contrast audit, each format writer, gallery render, file I/O) over the 64
+real themes in vscode/themes/ and a synthetic corpus derived from them.
+Output follows pytest-benchmark's table layout; --save/--compare keep JSON
+baselines in .benchmarks/ so hot-path regressions show up between commits.
+
+Usage:
+    python scripts/benchmark_pipeline.py
+    python scripts/benchmark_pipeline.py --synthetic 1000 --only writer
+    python scripts/benchmark_pipeline.py --save main
+    python scripts/benchmark_pipeline.py --compare main --fail-threshold 15
+
+--fail-threshold compares medians, not means, and runs every stage at least
+GATE_ROUNDS times, so a few slow rounds (GC, page cache writeback, a busy
+neighbor) do not fail the gate. The "vs base" column shows the same change.
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+THEMES_DIR = REPO_ROOT / "vscode" / "themes"
+STORAGE_DIR = REPO_ROOT / ".benchmarks"
+
+sys.path.insert(0, str(REPO_ROOT / "core" / "tools"))
+sys.path.insert(0, str(REPO_ROOT))
+
+import generate_gallery  # noqa: E402
+import sync_themes  # noqa: E402
+from contrast_cache import ContrastCache, pack_hex  # noqa: E402
+from contrast_checker import hex_to_rgb, relative_luminance  # noqa: E402
+from format_writers import formats, get_writer  # noqa: E402
+from theme_bundle import open_sink  # noqa: E402
+from verified_generator import hex_to_srgb, oklch_to_srgb, srgb_to_hex, srgb_to_oklch  # noqa: E402
+
+HEX_RE = re.compile(r"#([0-9a-fA-F]{6})")
+
+# Colors audited against the background in the contrast stage
+AUDIT_KEYS = ("fg", "comment", "keyword", "string", "function", "type", "variable", "constant",
+              "ansiRed", "ansiGreen", "ansiYellow", "ansiBlue", "ansiMagenta", "ansiCyan")
+
+GALLERY_PAGE = 64  # themes per generated gallery page
+GATE_ROUNDS = 15   # minimum rounds per stage when --fail-threshold gates on the median
+
+# ═══════════════════════════════════════════════════════════════════
+# Corpora
+# ═══════════════════════════════════════════════════════════════════
+
+class Corpus:
+    """Raw JSON text plus lazily derived stage inputs for a list of themes."""
+
+    def __init__(self, label: str, slugs: List[str], texts: List[str]):
+        self.label = label
+        self.slugs = slugs
+        self.texts = texts
+        self._data = None
+        self._colors = None
+
+    def __len__(self):
+        return len(self.texts)
+
+    @property
+    def data(self) -> List[dict]:
+        if self._data is None:
+            self._data = [json.loads(t) for t in self.texts]
+        return self._data
+
+    @property
+    def colors(self) -> List[dict]:
+        if self._colors is None:
+            self._colors = [sync_themes.extract_colors(d) for d in self.data]
+        return self._colors
+
+def load_real() -> Corpus:
+    files = sorted(THEMES_DIR.glob("*.json"))
+    return Corpus(f"real-{len(files)}", [f.stem for f in files],
+                  [f.read_text(encoding="utf-8") for f in files])
+
+def synthesize(base: Corpus, count: int) -> Corpus:
+    """Recolor the real themes with a per-theme XOR mask (alpha suffixes kept)."""
+    slugs, texts = [], []
+    for i in range(count):
+        j = i % len(base)
+        mask = (i * 2654435761) & 0xFFFFFF
+        recolor = lambda m, mask=mask: f"#{int(m.group(1), 16) ^ mask:06x}"
+        slugs.append(f"{base.slugs[j]}_{i}")
+        texts.append(HEX_RE.sub(recolor, base.texts[j]))
+    return Corpus(f"synthetic-{count}", slugs, texts)
+
+# ═══════════════════════════════════════════════════════════════════
+# Stages
+# ═══════════════════════════════════════════════════════════════════
+
+def stage_json_load(corpus: Corpus) -> Callable:
+    texts = corpus.texts
+    return lambda: [json.loads(t) for t in texts]
+
+def stage_extract_sync(corpus: Corpus) -> Callable:
+    data = corpus.data
+    return lambda: [sync_themes.extract_colors(d) for d in data]
+
+def stage_extract_gallery(corpus: Corpus) -> Callable:
+    data = corpus.data
+    return lambda: [generate_gallery.extract_colors(d) for d in data]
+
+def _theme_hexes(corpus: Corpus) -> List[List[str]]:
+    return [[v for v in c.values() if isinstance(v, str) and HEX_RE.fullmatch(v)] for c in corpus.colors]
+
+def stage_oklch_roundtrip(corpus: Corpus) -> Callable:
+    hexes = _theme_hexes(corpus)
+    def run():
+        for colors in hexes:
+            for h in colors:
+                srgb_to_hex(oklch_to_srgb(srgb_to_oklch(hex_to_srgb(h))))
+    return run
+
+def stage_luminance(corpus: Corpus) -> Callable:
+    hexes = _theme_hexes(corpus)
+    def run():
+        for colors in hexes:
+            for h in colors:
+                relative_luminance(*hex_to_rgb(h))
+    return run
+
+def _audit_pairs(corpus: Corpus) -> List[List[tuple]]:
+    pairs = []
+    for c in corpus.colors:
+        bg = pack_hex(c["bg"])
+        pairs.append([(pack_hex(c[k]), bg) for k in AUDIT_KEYS if c.get(k)])
+    return pairs
+
+def stage_contrast_cold(corpus: Corpus) -> Callable:
+    pairs = _audit_pairs(corpus)
+    def run():
+        cache = ContrastCache()
+        for theme_pairs in pairs:
+            for fg, bg in theme_pairs:
+                cache.contrast_packed(fg, bg)
+    return run
+
+def stage_contrast_warm(corpus: Corpus) -> Callable:
+    pairs = _audit_pairs(corpus)
+    cache = ContrastCache()
+    def run():
+        for theme_pairs in pairs:
+            for fg, bg in theme_pairs:
+                cache.contrast_packed(fg, bg)
+    run()
+    return run
+
+def stage_writer(fmt: str) -> Callable[[Corpus], Callable]:
+    def setup(corpus: Corpus) -> Callable:
+        writer = get_writer("sync", fmt)
+        values = [{**c, "slug": s} for c, s in zip(corpus.colors, corpus.slugs)]
+        return lambda: [writer.render(v) for v in values]
+    return setup
+
+def stage_gallery(corpus: Corpus) -> Callable:
+    themes = [{"name": d.get("name", s), "type": d.get("type", "dark"),
+               "colors": generate_gallery.extract_colors(d)}
+              for d, s in zip(corpus.data, corpus.slugs)]
+    pages = [themes[i:i + GALLERY_PAGE] for i in range(0, len(themes), GALLERY_PAGE)]
+    return lambda: [generate_gallery.generate_html(page) for page in pages]
+
+def _rendered_outputs(corpus: Corpus, limit: int) -> List[tuple]:
+    outputs = []
+    for c, s, text in list(zip(corpus.colors, corpus.slugs, corpus.texts))[:limit]:
+        values = {**c, "slug": s}
+        outputs.append((f"themes/{s}.json", text))
+        for fmt in formats("sync"):
+            outputs.append((f"{fmt}/{s}", get_writer("sync", fmt).render(values)))
+    return outputs
+
+def stage_file_io(bundle_suffix: Optional[str], io_limit: int, scratch: Path) -> Callable[[Corpus], Callable]:
+    def setup(corpus: Corpus) -> Callable:
+        outputs = _rendered_outputs(corpus, io_limit)
+        root = scratch / "out"
+        def run():
+            bundle = root / f"bundle{bundle_suffix}" if bundle_suffix else None
+            with open_sink(root, bundle) as sink:
+                for relpath, content in outputs:
+                    sink.write(relpath, content)
+        def reset():  # untimed: every round writes into an empty directory
+            shutil.rmtree(root, ignore_errors=True)
+            root.mkdir()
+        run.reset = reset
+        return run
+    return setup
+
+def build_stages(io_limit: int, scratch: Path) -> List[tuple]:
+    """(name, setup(corpus) -> timed callable)"""
+    stages = [
+        ("json_load", stage_json_load),
+        ("extract[sync]", stage_extract_sync),
+        ("extract[gallery]", stage_extract_gallery),
+        ("color_math[oklch_roundtrip]", stage_oklch_roundtrip),
+        ("color_math[luminance]", stage_luminance),
+        ("contrast_audit[cold]", stage_contrast_cold),
+        ("contrast_audit[warm]", stage_contrast_warm),
+    ]
+    stages += [(f"writer[{fmt}]", stage_writer(fmt)) for fmt in formats("sync")]
+    stages += [
+        ("gallery_render", stage_gallery),
+        ("file_io[tree]", stage_file_io(None, io_limit, scratch)),
+        ("file_io[tar.gz]", stage_file_io(".tar.gz", io_limit, scratch)),
+    ]
+    return stages
+
+# ═══════════════════════════════════════════════════════════════════
+# Timing & Reporting
+# ═══════════════════════════════════════════════════════════════════
+
+def measure(fn: Callable, min_rounds: int, max_time: float) -> List[float]:
+    """Run fn at least min_rounds times and until max_time seconds have elapsed.
+
+    fn.reset, when present, runs before every round outside the timed region.
+    """
+    reset = getattr(fn, "reset", None)
+    timings = []
+    budget_end = time.perf_counter() + max_time
+    while len(timings) < min_rounds or time.perf_counter() < budget_end:
+        if reset:
+            reset()
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+def summarize(group: str, name: str, items: int, timings: List[float]) -> dict:
+    mean = statistics.fmean(timings)
+    return {
+        "group": group,
+        "name": name,
+        "items": items,
+        "stats": {
+            "min": min(timings),
+            "max": max(timings),
+            "mean": mean,
+            "stddev": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+            "median": statistics.median(timings),
+            "ops": 1 / mean if mean else 0.0,
+            "rounds": len(timings),
+        },
+    }
+
+def pick_unit(seconds: float):
+    for unit, scale in (("s", 1.0), ("ms", 1e3), ("us", 1e6)):
+        if seconds * scale >= 1:
+            return unit, scale
+    return "ns", 1e9
+
+def print_group(group: str, results: List[dict], baseline: Dict[tuple, dict]):
+    unit, scale = pick_unit(min(r["stats"]["min"] for r in results))
+    title = f"Name (time in {unit})"
+    width = max([len(title)] + [len(r["name"]) for r in results]) + 2
+    header = (f"{title:<{width}}{'Min':>14}{'Max':>14}{'Mean':>14}"
+              f"{'StdDev':>14}{'Median':>14}{'OPS':>14}{'Rounds':>8}{'us/theme':>11}")
+    if baseline:
+        header += f"{'vs base':>10}"
+    print(f"\n{'-' * 18} benchmark '{group}': {len(results)} tests {'-' * 18}")
+    print(header)
+    print("-" * len(header))
+    for r in sorted(results, key=lambda r: r["stats"]["mean"]):
+        s = r["stats"]
+        line = (f"{r['name']:<{width}}{s['min'] * scale:>14.4f}{s['max'] * scale:>14.4f}"
+                f"{s['mean'] * scale:>14.4f}{s['stddev'] * scale:>14.4f}{s['median'] * scale:>14.4f}"
+                f"{s['ops']:>14.4f}{s['rounds']:>8}{s['mean'] * 1e6 / r['items']:>11.2f}")
+        base = baseline.get((group, r["name"]))
+        if base:
+            line += f"{change_pct(r, base):>+9.1f}%"
+        elif baseline:
+            line += f"{'new':>10}"
+        print(line)
+    print("-" * len(header))
+
+def change_pct(result: dict, base: dict) -> float:
+    """Median time change against the baseline, in percent (what --fail-threshold gates on)."""
+    return (result["stats"]["median"] / base["stats"]["median"] - 1) * 100
+
+def commit_info() -> dict:
+    def git(*cmd):
+        try:
+            return subprocess.run(["git", *cmd], cwd=REPO_ROOT, capture_output=True,
+                                  text=True, check=True).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return ""
+    return {"id": git("rev-parse", "HEAD"), "branch": git("rev-parse", "--abbrev-ref", "HEAD"),
+            "dirty": bool(git("status", "--porcelain", "--untracked-files=no"))}
+
+def baseline_path(name: str) -> Path:
+    path = Path(name)
+    return path if path.suffix == ".json" else STORAGE_DIR / f"{name}.json"
+
+def save_baseline(name: str, results: List[dict]) -> Path:
+    path = baseline_path(name)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    document = {
+        "machine_info": {
+            "python_version": platform.python_version(),
+            "python_implementation": platform.python_implementation(),
+            "system": platform.system(),
+            "machine": platform.machine(),
+            "cpu_count": os.cpu_count(),
+        },
+        "commit_info": commit_info(),
+        "datetime": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "benchmarks": results,
+    }
+    path.write_text(json.dumps(document, indent=2) + "\n", encoding="utf-8")
+    return path
+
+def load_baseline(name: str) -> Dict[tuple, dict]:
+    document = json.loads(baseline_path(name).read_text(encoding="utf-8"))
+    return {(b["group"], b["name"]): b for b in document["benchmarks"]}
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the Prism generation pipeline stage by stage")
+    parser.add_argument("--synthetic", type=int, default=10000, metavar="N",
+                        help="Synthetic themes to generate (default: 10000, 0 to skip)")
+    parser.add_argument("--only", metavar="TEXT", help="Only stages whose name contains TEXT")
+    parser.add_argument("--min-rounds", type=int, default=3, help="Minimum rounds per stage (default: 3)")
+    parser.add_argument("--max-time", type=float, default=1.0, help="Seconds to keep sampling a stage (default: 1.0)")
+    parser.add_argument("--io-themes", type=int, default=500,
+                        help="Themes written per file_io round (default: 500)")
+    parser.add_argument("--save", metavar="NAME", help="Save results to .benchmarks/NAME.json")
+    parser.add_argument("--compare", metavar="NAME", help="Compare against .benchmarks/NAME.json")
+    parser.add_argument("--fail-threshold", type=float, metavar="PCT",
+                        help=f"With --compare, exit 1 if any median regresses by more than PCT percent "
+                             f"(runs at least {GATE_ROUNDS} rounds per stage)")
+    args = parser.parse_args()
+
+    if not THEMES_DIR.exists():
+        print("vscode/themes/ not found", file=sys.stderr)
+        return 1
+
+    baseline = {}
+    if args.compare:
+        try:
+            baseline = load_baseline(args.compare)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Cannot read baseline {args.compare}: {e}", file=sys.stderr)
+            return 1
+
+    real = load_real()
+    corpora = [real]
+    if args.synthetic > 0:
+        start = time.perf_counter()
+        corpora.append(synthesize(real, args.synthetic))
+        print(f"Generated {args.synthetic} synthetic themes in {time.perf_counter() - start:.2f}s", file=sys.stderr)
+
+    gate = bool(baseline) and args.fail_threshold is not None
+    min_rounds = max(args.min_rounds, GATE_ROUNDS) if gate else args.min_rounds
+    results = []
+    with tempfile.TemporaryDirectory(prefix="prism-bench-") as scratch:
+        stages = [(n, s) for n, s in build_stages(args.io_themes, Path(scratch)) if not args.only or args.only in n]
+        if not stages:
+            print(f"No stage matches {args.only!r}", file=sys.stderr)
+            return 1
+        for corpus in corpora:
+            group_results = []
+            for name, setup in stages:
+                items = min(len(corpus), args.io_themes) if name.startswith("file_io") else len(corpus)
+                timings = measure(setup(corpus), min_rounds, args.max_time)
+                group_results.append(summarize(corpus.label, name, items, timings))
+            print_group(corpus.label, group_results, baseline)
+            results += group_results
+
+    print("\nLegend:\n  OPS: Operations Per Second, one operation = one pass over the corpus."
+          "\n  us/theme: mean time divided by the number of themes processed.")
+    if baseline:
+        print("  vs base: median time change against the baseline.")
+
+    if args.save:
+        print(f"Saved: {save_baseline(args.save, results)}")
+
+    if gate:
+        regressions, few = [], []
+        for r in results:
+            base = baseline.get((r["group"], r["name"]))
+            if base:
+                if base["stats"]["rounds"] < GATE_ROUNDS:
+                    few.append(r["name"])
+                change = change_pct(r, base)
+                if change > args.fail_threshold:
+                    regressions.append((r["group"], r["name"], change))
+        if few:
+            print(f"Note: the baseline has fewer than {GATE_ROUNDS} rounds for {len(few)} stage(s); "
+                  f"save it with --min-rounds {GATE_ROUNDS} for a steadier gate", file=sys.stderr)
+        for group, name, change in regressions:
+            print(f"REGRESSION {group} {name}: {change:+.1f}% (threshold {args.fail_threshold:.1f}%)",
+                  file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,16 +1,33 @@
 #!/usr/bin/env python3
 """
 Prism Theme Gallery - Shows ALL semantic tokens: Code + Markdown/Prose
+
+Usage:
+    python scripts/generate_gallery.py
+    python scripts/generate_gallery.py --trace build/gallery.trace.json
+    python scripts/generate_gallery.py --metrics build/metrics.jsonl
+    python scripts/generate_gallery.py --no-store        # parse the JSON even when the theme store is current
 """
 
+import argparse
+import contextlib
+import html
 import json
+import sys
 from pathlib import Path
 
 THEMES_DIR = Path(__file__).parent.parent / "vscode" / "themes"
 OUTPUT_FILE = Path(__file__).parent.parent / "gallery.html"
 
+sys.path.insert(0, str(Path(__file__).parent.parent / "core" / "tools"))
+
+import prism_metrics  # noqa: E402
+import prism_trace  # noqa: E402
+from prism_trace import span  # noqa: E402
+from theme_store import DEFAULT_STORE, current_store  # noqa: E402
+
 def load_theme(filepath):
-    with open(filepath, 'r', encoding='utf-8') as f:
+    with span("load"), open(filepath, 'r', encoding='utf-8') as f:
         return json.load(f)
 
 def get_token_color(theme, scope, default=None):
@@ -76,6 +93,57 @@ def extract_colors(theme):
         'link': get_token_color(theme, ["markup.underline.link", "string.other.link"], keyword),
     }
 
+# The code card, as (role, text) runs per line; role None is uncolored text.
+# generate_html and scripts/render_previews.py both draw from this.
+CODE_PREVIEW = (
+    (("comment", "// {name} - Code Preview"),),
+    (("keyword", "import"), (None, " "), ("punctuation", "{"), (None, " "), ("type", "Component"), ("punctuation", ","),
+     (None, " "), ("type", "useState"), (None, " "), ("punctuation", "}"), (None, " "), ("keyword", "from"), (None, " "),
+     ("string", "'react'"), ("punctuation", ";")),
+    (),
+    (("decorator", "@observable"),),
+    (("keyword", "class"), (None, " "), ("type", "UserService"), (None, " "), ("punctuation", "{")),
+    ((None, "  "), ("variable", "count"), (None, " "), ("punctuation", "="), (None, " "), ("constant", "42"), ("punctuation", ";")),
+    ((None, "  "), ("variable", "active"), (None, " "), ("punctuation", "="), (None, " "), ("constant", "true"), ("punctuation", ";")),
+    (),
+    ((None, "  "), ("keyword", "async"), (None, " "), ("function", "fetchData"), ("punctuation", "("), ("parameter", "id"),
+     ("punctuation", ":"), (None, " "), ("type", "number"), ("punctuation", ")"), (None, " "), ("punctuation", "{")),
+    ((None, "    "), ("keyword", "const"), (None, " "), ("variable", "url"), (None, " "), ("punctuation", "="), (None, " "),
+     ("string", "`/api/${"), ("variable", "id"), ("string", "}`"), ("punctuation", ";")),
+    ((None, "    "), ("keyword", "return"), (None, " "), ("keyword", "await"), (None, " "), ("function", "fetch"),
+     ("punctuation", "("), ("variable", "url"), ("punctuation", ")"), ("punctuation", ";")),
+    ((None, "  "), ("punctuation", "}")),
+    (),
+    ((None, "  "), ("function", "render"), ("punctuation", "()"), (None, " "), ("punctuation", "{")),
+    ((None, "    "), ("keyword", "return"), (None, " "), ("punctuation", "(")),
+    ((None, "      "), ("tag", "<div"), (None, " "), ("attribute", "className"), ("punctuation", '="'), ("string", "container"),
+     ("punctuation", '"'), ("tag", ">")),
+    ((None, "        "), ("tag", "<Button"), (None, " "), ("attribute", "onClick"), ("punctuation", "={"), ("keyword", "this"),
+     ("punctuation", "."), ("function", "fetchData"), ("punctuation", "}"), ("tag", ">")),
+    ((None, "          "), ("variable", "Click"), (None, " "), ("punctuation", "{"), ("keyword", "this"), ("punctuation", "."),
+     ("variable", "count"), ("punctuation", "}")),
+    ((None, "        "), ("tag", "</Button>")),
+    ((None, "      "), ("tag", "</div>")),
+    ((None, "    "), ("punctuation", ");")),
+    ((None, "  "), ("punctuation", "}")),
+    (("punctuation", "}"),),
+)
+ITALIC_ROLES = ("comment",)
+
+def code_preview_html(c, name):
+    lines = []
+    for runs in CODE_PREVIEW:
+        spans = []
+        for role, text in runs:
+            text = html.escape(text, quote=False).replace("{name}", name)  # names go in raw, as in the card header
+            if role is None:
+                spans.append(text)
+            else:
+                style = f"color:{c[role]}" + (";font-style:italic" if role in ITALIC_ROLES else "")
+                spans.append(f'<span style="{style}">{text}</span>')
+        lines.append(f'              <div class="line">{"".join(spans)}</div>')
+    return "\n".join(lines)
+
 def generate_html(themes):
     dark_count = len([t for t in themes if t['type'] == 'dark'])
     light_count = len([t for t in themes if t['type'] == 'light'])
@@ -195,29 +263,7 @@ def generate_html(themes):
           <div>
             <div class="code-section-label" style="background:{c['sidebarBg']}; color:{c['statusBar']}">Code Syntax</div>
             <div class="code-preview" style="background:{c['background']}">
-              <div class="line"><span style="color:{c['comment']};font-style:italic">// {t['name']} - Code Preview</span></div>
-              <div class="line"><span style="color:{c['keyword']}">import</span> <span style="color:{c['punctuation']}">{{</span> <span style="color:{c['type']}">Component</span><span style="color:{c['punctuation']}">,</span> <span style="color:{c['type']}">useState</span> <span style="color:{c['punctuation']}">}}</span> <span style="color:{c['keyword']}">from</span> <span style="color:{c['string']}">'react'</span><span style="color:{c['punctuation']}">;</span></div>
-              <div class="line"></div>
-              <div class="line"><span style="color:{c['decorator']}">@observable</span></div>
-              <div class="line"><span style="color:{c['keyword']}">class</span> <span style="color:{c['type']}">UserService</span> <span style="color:{c['punctuation']}">{{</span></div>
-              <div class="line">  <span style="color:{c['variable']}">count</span> <span style="color:{c['punctuation']}">=</span> <span style="color:{c['constant']}">42</span><span style="color:{c['punctuation']}">;</span></div>
-              <div class="line">  <span style="color:{c['variable']}">active</span> <span style="color:{c['punctuation']}">=</span> <span style="color:{c['constant']}">true</span><span style="color:{c['punctuation']}">;</span></div>
-              <div class="line"></div>
-              <div class="line">  <span style="color:{c['keyword']}">async</span> <span style="color:{c['function']}">fetchData</span><span style="color:{c['punctuation']}">(</span><span style="color:{c['parameter']}">id</span><span style="color:{c['punctuation']}">:</span> <span style="color:{c['type']}">number</span><span style="color:{c['punctuation']}">)</span> <span style="color:{c['punctuation']}">{{</span></div>
-              <div class="line">    <span style="color:{c['keyword']}">const</span> <span style="color:{c['variable']}">url</span> <span style="color:{c['punctuation']}">=</span> <span style="color:{c['string']}">`/api/${{</span><span style="color:{c['variable']}">id</span><span style="color:{c['string']}">}}`</span><span style="color:{c['punctuation']}">;</span></div>
-              <div class="line">    <span style="color:{c['keyword']}">return</span> <span style="color:{c['keyword']}">await</span> <span style="color:{c['function']}">fetch</span><span style="color:{c['punctuation']}">(</span><span style="color:{c['variable']}">url</span><span style="color:{c['punctuation']}">)</span><span style="color:{c['punctuation']}">;</span></div>
-              <div class="line">  <span style="color:{c['punctuation']}">}}</span></div>
-              <div class="line"></div>
-              <div class="line">  <span style="color:{c['function']}">render</span><span style="color:{c['punctuation']}">()</span> <span style="color:{c['punctuation']}">{{</span></div>
-              <div class="line">    <span style="color:{c['keyword']}">return</span> <span style="color:{c['punctuation']}">(</span></div>
-              <div class="line">      <span style="color:{c['tag']}">&lt;div</span> <span style="color:{c['attribute']}">className</span><span style="color:{c['punctuation']}">="</span><span style="color:{c['string']}">container</span><span style="color:{c['punctuation']}">"</span><span style="color:{c['tag']}">&gt;</span></div>
-              <div class="line">        <span style="color:{c['tag']}">&lt;Button</span> <span style="color:{c['attribute']}">onClick</span><span style="color:{c['punctuation']}">={{</span><span style="color:{c['keyword']}">this</span><span style="color:{c['punctuation']}">.</span><span style="color:{c['function']}">fetchData</span><span style="color:{c['punctuation']}">}}</span><span style="color:{c['tag']}">&gt;</span></div>
-              <div class="line">          <span style="color:{c['variable']}">Click</span> <span style="color:{c['punctuation']}">{{</span><span style="color:{c['keyword']}">this</span><span style="color:{c['punctuation']}">.</span><span style="color:{c['variable']}">count</span><span style="color:{c['punctuation']}">}}</span></div>
-              <div class="line">        <span style="color:{c['tag']}">&lt;/Button&gt;</span></div>
-              <div class="line">      <span style="color:{c['tag']}">&lt;/div&gt;</span></div>
-              <div class="line">    <span style="color:{c['punctuation']}">);</span></div>
-              <div class="line">  <span style="color:{c['punctuation']}">}}</span></div>
-              <div class="line"><span style="color:{c['punctuation']}">}}</span></div>
+{code_preview_html(c, t['name'])}
             </div>
           </div>
           <div>
@@ -331,23 +377,47 @@ def generate_html(themes):
 </html>'''
     return html
 
-def main():
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate gallery.html from vscode/themes")
+    parser.add_argument("--no-store", action="store_true",
+                        help=f"Parse the JSON even when {DEFAULT_STORE.name} is current")
+    prism_trace.add_arguments(parser)
+    prism_metrics.add_arguments(parser)
+    args = parser.parse_args(argv)
+    prism_trace.start(args, "generate_gallery")
+    prism_metrics.start(args, "generate_gallery")
+    
     themes = []
-    for f in sorted(THEMES_DIR.glob("*.json")):
-        try:
-            theme = load_theme(f)
-            themes.append({
-                'name': theme.get('name', f.stem.replace('_', ' ').title()),
-                'type': theme.get('type', 'dark'),
-                'colors': extract_colors(theme)
-            })
-            print(f"Loaded: {f.name}")
-        except Exception as e:
-            print(f"Error: {f.name}: {e}")
+    store = None if args.no_store else current_store(THEMES_DIR)
+    if store:
+        print(f"Reading themes from {store.path}")
+    with store or contextlib.nullcontext():
+        for f in sorted(THEMES_DIR.glob("*.json")):
+            try:
+                if store:
+                    with span("load"):
+                        theme = store.theme(f.stem)
+                else:
+                    theme = load_theme(f)
+                with span("extract"):
+                    colors = extract_colors(theme)
+                themes.append({
+                    'name': theme.get('name', f.stem.replace('_', ' ').title()),
+                    'type': theme.get('type', 'dark'),
+                    'colors': colors
+                })
+                print(f"Loaded: {f.name}")
+            except Exception as e:
+                prism_metrics.count("themes_failed")
+                print(f"Error: {f.name}: {e}")
     
-    html = generate_html(themes)
-    with open(OUTPUT_FILE, 'w', encoding='utf-8') as out:
+    with span("render", "html"):
+        html = generate_html(themes)
+    with span("write"), open(OUTPUT_FILE, 'w', encoding='utf-8') as out:
         out.write(html)
+    prism_metrics.count("themes", len(themes))
+    prism_metrics.count("files_written")
+    prism_metrics.count("bytes_written", len(html.encode("utf-8")))
     print(f"\nGenerated gallery.html with {len(themes)} themes")
     print(f"Shows: Code syntax + Markdown/Prose (H1-H6, body, bold, italic, links, lists, quotes)")
 
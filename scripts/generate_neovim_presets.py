@@ -2,15 +2,28 @@
 """
 Generate Neovim presets from VSCode themes.
 
-Extracts colors from VSCode JSON themes and generates lua/prism/presets.lua
+Extracts colors from VSCode JSON themes and generates lua/prism/presets/
+(a name index plus one lazily required module per theme).
+
+Usage:
+    python scripts/generate_neovim_presets.py
+    python scripts/generate_neovim_presets.py --metrics build/metrics.jsonl
 """
 
+import argparse
 import json
 import os
+import sys
 from pathlib import Path
 
-VSCODE_THEMES_DIR = Path(__file__).parent.parent / "vscode" / "themes"
-NEOVIM_PRESETS_FILE = Path(__file__).parent.parent / "neovim" / "lua" / "prism" / "presets.lua"
+REPO_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(REPO_ROOT / "core" / "tools"))
+
+import prism_metrics  # noqa: E402
+from nvim_presets import PRESETS_DIR, preset_modules, verify_modules  # noqa: E402
+
+VSCODE_THEMES_DIR = REPO_ROOT / "vscode" / "themes"
+NEOVIM_PRESETS_DIR = REPO_ROOT / PRESETS_DIR
 
 def extract_base16_from_vscode(theme_path: Path) -> dict:
     """Extract base16-style colors from a VSCode theme."""
@@ -84,10 +97,19 @@ def theme_name_to_lua_key(name: str) -> str:
     """Convert theme filename to Lua table key."""
     return name.replace(".json", "").replace("-", "_").replace(" ", "_")
 
+def palette_lua(palette: dict) -> str:
+    """Base16 palette as a Lua table constructor, four slots per line."""
+    slots = [f'base0{d}' for d in "0123456789ABCDEF"]
+    rows = [
+        "  " + " ".join(f'{slot} = "{palette[slot]}",' for slot in slots[i:i + 4])
+        for i in range(0, 16, 4)
+    ]
+    return "{\n" + "\n".join(rows) + "\n}"
+
 def generate_presets_lua():
-    """Generate the presets.lua file from all VSCode themes."""
+    """Generate the Neovim preset modules (index + one file per theme) from all VSCode themes."""
     
-    themes = {}
+    bodies = {}
     
     for theme_file in sorted(VSCODE_THEMES_DIR.glob("*.json")):
         try:
@@ -99,97 +121,37 @@ def generate_presets_lua():
                 theme_data = json.load(f)
             mode = "light" if theme_data.get("type") == "light" else "dark"
             
-            themes[key] = {
-                "mode": mode,
-                "palette": palette
-            }
+            bodies[key] = f'require("prism.presets").make_preset("{key}", "{mode}", {palette_lua(palette)})'
         except Exception as e:
+            prism_metrics.count("themes_failed")
             print(f"Error processing {theme_file}: {e}")
     
-    # Generate Lua code
-    lua_code = '''-- PRISM Theme Presets for Neovim
--- Auto-generated from VSCode themes - DO NOT EDIT MANUALLY
--- Run: python scripts/generate_neovim_presets.py
---
--- 64 themes with OKLCH color science and WCAG verification
-
-local M = {}
-
--- ============================================================================
--- HELPER: Build preset structure from palette
--- ============================================================================
-
-local function make_preset(name, mode, palette)
-  return {
-    name = name,
-    mode = mode,
-    palette = palette,
-    syntax = {
-      comment = palette.base03,
-      string = palette.base0B,
-      number = palette.base09,
-      keyword = palette.base0E,
-      func = palette.base0D,
-      type = palette.base0A,
-      variable = palette.base05,
-      property = palette.base05,
-      operator = palette.base04,
-      punctuation = palette.base04,
-      tag = palette.base08,
-      attribute = palette.base09,
-    },
-    ui = {
-      bg = palette.base00,
-      fg = palette.base05,
-      accent = palette.base0A,
-      error = palette.base08,
-      warning = palette.base09,
-      success = palette.base0B,
-      info = palette.base0D,
-    },
-  }
-end
-
--- ============================================================================
--- THEME PRESETS (64 themes)
--- ============================================================================
-
-'''
+    header = "-- Auto-generated from VSCode themes - DO NOT EDIT MANUALLY\n-- Run: python scripts/generate_neovim_presets.py"
+    files = preset_modules(bodies, header)
+    problems = verify_modules(files, on_disk=NEOVIM_PRESETS_DIR)
+    if problems:
+        for problem in problems:
+            print(f"  ✗ {problem}")
+        return 1
     
-    for key, data in sorted(themes.items()):
-        palette = data["palette"]
-        mode = data["mode"]
-        
-        lua_code += f'M.{key} = make_preset("{key}", "{mode}", {{\n'
-        lua_code += f'  base00 = "{palette["base00"]}", base01 = "{palette["base01"]}", base02 = "{palette["base02"]}", base03 = "{palette["base03"]}",\n'
-        lua_code += f'  base04 = "{palette["base04"]}", base05 = "{palette["base05"]}", base06 = "{palette["base06"]}", base07 = "{palette["base07"]}",\n'
-        lua_code += f'  base08 = "{palette["base08"]}", base09 = "{palette["base09"]}", base0A = "{palette["base0A"]}", base0B = "{palette["base0B"]}",\n'
-        lua_code += f'  base0C = "{palette["base0C"]}", base0D = "{palette["base0D"]}", base0E = "{palette["base0E"]}", base0F = "{palette["base0F"]}",\n'
-        lua_code += '})\n\n'
+    # Write the files
+    NEOVIM_PRESETS_DIR.mkdir(parents=True, exist_ok=True)
+    for filename, text in files.items():
+        with open(NEOVIM_PRESETS_DIR / filename, 'w') as f:
+            f.write(text)
+    prism_metrics.count("themes", len(bodies))
+    prism_metrics.count("files_written", len(files))
+    prism_metrics.count("bytes_written", sum(len(text.encode()) for text in files.values()))
     
-    lua_code += '''-- ============================================================================
--- DYNAMIC GENERATION (lazy load colors.lua only when needed)
--- ============================================================================
+    print(f"Generated {len(bodies)} theme presets to {NEOVIM_PRESETS_DIR}")
+    return 0
 
---- Generate a custom preset dynamically
---- @param name string Preset name
---- @param config table Configuration for colors.generate_palette
---- @return table Preset structure
-function M.generate(name, config)
-  local colors = require("prism.colors")
-  local palette = colors.generate_palette(config)
-  return make_preset(name, config.theme or "dark", palette)
-end
-
-return M
-'''
-    
-    # Write the file
-    NEOVIM_PRESETS_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(NEOVIM_PRESETS_FILE, 'w') as f:
-        f.write(lua_code)
-    
-    print(f"Generated {len(themes)} theme presets to {NEOVIM_PRESETS_FILE}")
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate the Neovim presets from the VSCode themes")
+    prism_metrics.add_arguments(parser)
+    args = parser.parse_args(argv)
+    prism_metrics.start(args, "generate_neovim_presets")
+    return generate_presets_lua()
 
 if __name__ == "__main__":
-    generate_presets_lua()
+    exit(main())
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Prism Preview Renderer - a PNG code preview per theme, no browser required
+
+Draws the gallery's code card (generate_gallery.CODE_PREVIEW, colored by
+extract_colors) for every theme in vscode/themes: a title bar, line numbers,
+the current-line highlight and cursor, a selection, the highlighted code and
+a strip of the syntax role swatches.
+
+Text comes from preview_raster's built-in bitmap font and is composited with
+NumPy, so the whole set renders headless in a couple of seconds; the
+Puppeteer screenshot (render_gallery_png.js) is still the way to capture
+gallery.html itself. The glyph atlas is built once before the worker
+processes fork, so every worker shares it.
+
+Usage:
+    python scripts/render_previews.py                     # build/previews/<slug>.png
+    python scripts/render_previews.py --only nord_aurora --scale 3
+    python scripts/render_previews.py --bundle dist/prism-previews.zip
+    python scripts/render_previews.py --jobs 1 --trace build/previews.trace.json
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+PRISM_ROOT = Path(__file__).parent.parent
+THEMES_DIR = PRISM_ROOT / "vscode" / "themes"
+DEFAULT_OUTPUT = PRISM_ROOT / "build" / "previews"
+
+sys.path.insert(0, str(PRISM_ROOT / "core" / "tools"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+import prism_metrics  # noqa: E402
+import prism_trace  # noqa: E402
+from generate_gallery import CODE_PREVIEW, ITALIC_ROLES, extract_colors, load_theme  # noqa: E402
+from preview_raster import Canvas, atlas, cell_size  # noqa: E402
+from prism_trace import span  # noqa: E402
+from theme_bundle import bundle_kind, open_sink  # noqa: E402
+
+# ═══════════════════════════════════════════════════════════════════
+# Layout (in character cells, so every --scale keeps the proportions)
+# ═══════════════════════════════════════════════════════════════════
+
+GUTTER_COLS = 4          # line numbers, right-aligned
+PAD_COLS = 2             # between the gutter and the code, and at the right edge
+CURRENT_LINE = 5         # 0-based line with the highlight and cursor
+SELECTION = (4, "type")  # the first run of this role on this line is selected
+SWATCH_ROLES = ("keyword", "string", "function", "type", "constant", "variable",
+                "parameter", "tag", "attribute", "decorator", "punctuation", "comment")
+
+def render(name: str, c: dict, scale: int = 2) -> bytes:
+    """One theme's preview as PNG bytes."""
+    advance, glyph_h = cell_size(scale)
+    line_h = glyph_h + 3 * scale
+    title_h = line_h + 2 * scale
+    swatch_h = 4 * scale
+    lines = [[(role, text.replace("{name}", name)) for role, text in runs] for runs in CODE_PREVIEW]
+    code_x = (GUTTER_COLS + PAD_COLS) * advance
+    width = code_x + (max(sum(len(text) for _, text in runs) for runs in lines) + PAD_COLS) * advance
+    code_y = title_h + line_h // 2
+    height = code_y + len(lines) * line_h + line_h // 2 + swatch_h
+    inset = (line_h - glyph_h) // 2
+
+    canvas = Canvas(width, height, c["background"], scale)
+    canvas.fill(0, 0, width, title_h, c["sidebarBg"])
+    canvas.text(PAD_COLS * advance, (title_h - glyph_h) // 2, name, c["statusBar"])
+
+    for i, runs in enumerate(lines):
+        y = code_y + i * line_h
+        if i == CURRENT_LINE:
+            canvas.fill(0, y, width, line_h, c["lineHighlight"])
+        number = str(i + 1).rjust(GUTTER_COLS)
+        canvas.text(0, y + inset, number, c["foreground"] if i == CURRENT_LINE else c["lineNumber"])
+        x = code_x
+        selected = SELECTION[0] == i
+        for role, text in runs:
+            if selected and role == SELECTION[1]:
+                canvas.fill(x, y, len(text) * advance, line_h, c["selection"])
+                selected = False
+            x = canvas.text(x, y + inset, text, c[role] if role else c["foreground"], role in ITALIC_ROLES)
+        if i == CURRENT_LINE:
+            canvas.fill(x, y + scale, max(1, scale), line_h - 2 * scale, c["cursor"])
+
+    swatch_w = width / len(SWATCH_ROLES)
+    for k, role in enumerate(SWATCH_ROLES):
+        x0 = round(k * swatch_w)
+        canvas.fill(x0, height - swatch_h, round((k + 1) * swatch_w) - x0, swatch_h, c[role])
+    return canvas.png()
+
+def render_job(job):
+    slug, name, colors, scale = job
+    return slug, render(name, colors, scale)
+
+def run_jobs(jobs, workers: int):
+    """Yield (slug, png) in job order, in worker processes unless there is little to do."""
+    if workers <= 1 or len(jobs) < 4:
+        for job in jobs:
+            with span("render", job[0]):
+                yield render_job(job)
+        return
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+        yield from pool.map(render_job, jobs, chunksize=max(1, len(jobs) // (workers * 4)))
+
+# ═══════════════════════════════════════════════════════════════════
+# CLI
+# ═══════════════════════════════════════════════════════════════════
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render a PNG code preview for every theme")
+    parser.add_argument("--output", "-o", type=Path, default=DEFAULT_OUTPUT, help=f"Output directory (default: {DEFAULT_OUTPUT})")
+    parser.add_argument("--bundle", metavar="PATH", help="Write every preview into one .tar[.gz|.xz|.bz2] or .zip")
+    parser.add_argument("--only", nargs="+", metavar="SLUG", help="Only these themes")
+    parser.add_argument("--scale", type=int, default=2, help="Pixels per font pixel (default: 2)")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1, help="Worker processes")
+    prism_trace.add_arguments(parser)
+    prism_metrics.add_arguments(parser)
+    args = parser.parse_args(argv)
+    if args.bundle:
+        try:
+            bundle_kind(args.bundle)
+        except ValueError as e:
+            parser.error(str(e))
+    if args.scale < 1:
+        parser.error("--scale must be at least 1")
+    prism_trace.start(args, "render_previews")
+    prism_metrics.start(args, "render_previews")
+
+    start = time.perf_counter()
+    files = {f.stem: f for f in sorted(THEMES_DIR.glob("*.json"))}
+    if args.only:
+        unknown = sorted(set(args.only) - files.keys())
+        if unknown:
+            parser.error(f"unknown theme(s): {', '.join(unknown)}")
+        files = {slug: files[slug] for slug in args.only}
+
+    jobs = []
+    with span("extract"):
+        for slug, path in files.items():
+            theme = load_theme(path)
+            jobs.append((slug, theme.get("name", slug.replace("_", " ").title()), extract_colors(theme), args.scale))
+    atlas(args.scale)  # built here so forked workers inherit it
+
+    with open_sink(args.output, args.bundle) as sink:
+        for slug, png in run_jobs(jobs, args.jobs):
+            with span("write", slug):
+                sink.write(f"{slug}.png", png)
+    prism_metrics.count("themes", len(jobs))
+    prism_metrics.count_sink(sink)
+
+    elapsed = time.perf_counter() - start
+    print(f"{len(jobs)} previews, {sink.bytes / 1024:.0f} KB -> {args.bundle or args.output} in {elapsed:.2f}s")
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Test golden-angle hue distribution against the Lean4 and Lua definitions.
+Checks core/tools/golden_angle.py (scalar and batched) against golden vectors
+from core/lean4/PrismColor/GoldenAngle.lean (nthGoldenHue, evaluated exactly)
+and neovim/lua/prism/colors.lua (nth_golden_hue, float64 as LuaJIT runs it).
+
+Usage:
+    python3 scripts/test_golden_angle.py
+"""
+
+import math
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "core" / "tools"))
+
+import numpy as np  # noqa: E402
+
+from color_array import oklch_to_hex  # noqa: E402
+from golden_angle import (  # noqa: E402
+    GOLDEN_ANGLE_DEG, GOLDEN_ANGLE_RAD, PHI, generate_golden_hues, golden_hues, golden_palette,
+    min_hue_gap, nth_golden_hue,
+)
+from verified_generator import OKLCH, oklch_to_srgb, srgb_to_hex  # noqa: E402
+
+# Constants as written in GoldenAngle.lean (GOLDEN_ANGLE_DEG) and colors.lua (comments)
+LEAN_GOLDEN_ANGLE_DEG = 137.5077640500378
+LUA_GOLDEN_ANGLE_RAD = 2.399963229728653
+
+# nthGoldenHue(base, n) = normalize(base + n * 360 / phi^2), evaluated with
+# 50-digit Decimal arithmetic and rounded to 10 places
+LEAN_EXPECTED = {
+    0: [0.0, 137.5077640500, 275.0155281001, 52.5232921501,
+        190.0310562002, 327.5388202502, 105.0465843002, 242.5543483503],
+    211: [211.0, 348.5077640500, 126.0155281001, 263.5232921501,
+          41.0310562002, 178.5388202502, 316.0465843002, 93.5543483503],
+    30: [30.0, 167.5077640500, 305.0155281001, 82.5232921501,
+         220.0310562002, 357.5388202502, 135.0465843002, 272.5543483503],
+    359.5: [359.5, 137.0077640500, 274.5155281001, 52.0232921501,
+            189.5310562002, 327.0388202502, 104.5465843002, 242.0543483503],
+}
+LEAN_FAR = [(211, 100, 281.7764050038), (0, 1000, 347.7640500379), (211, 12345, 344.3471977173)]
+
+def lua_nth_golden_hue(base_hue: float, n: int) -> float:
+    """colors.lua M.nth_golden_hue, transliterated (LuaJIT: a % b = a - floor(a/b)*b)."""
+    tau = 2 * math.pi
+    base_rad = base_hue * (math.pi / 180)
+    result_rad = base_rad + n * ((2 * math.pi) / (PHI * PHI))
+    normalized_rad = result_rad - math.floor(result_rad / tau) * tau
+    if normalized_rad < 0:
+        normalized_rad = normalized_rad + tau
+    return normalized_rad * (180 / math.pi)
+
+def circular_error(a, b):
+    d = np.abs(np.asarray(a) - np.asarray(b)) % 360.0
+    return np.minimum(d, 360.0 - d)
+
+def run_tests():
+    """Run golden-angle tests."""
+    print("PRISM Golden Angle Test")
+    print("=" * 50)
+
+    all_passed = True
+
+    def check(label, ok):
+        nonlocal all_passed
+        all_passed = all_passed and ok
+        print(f"  {label} {'✓' if ok else '✗'}")
+
+    # Test 1: constants
+    print("\n[Test 1] Constants")
+    check(f"GOLDEN_ANGLE_DEG={GOLDEN_ANGLE_DEG!r} Lean={LEAN_GOLDEN_ANGLE_DEG!r}",
+          abs(GOLDEN_ANGLE_DEG - LEAN_GOLDEN_ANGLE_DEG) < 1e-12)
+    check(f"GOLDEN_ANGLE_RAD={GOLDEN_ANGLE_RAD!r} Lua={LUA_GOLDEN_ANGLE_RAD!r}",
+          abs(GOLDEN_ANGLE_RAD - LUA_GOLDEN_ANGLE_RAD) < 1e-14)
+
+    # Test 2: golden vectors from the Lean definition
+    print("\n[Test 2] Lean nthGoldenHue golden vectors (|err| < 1e-9 deg)")
+    for base, expected in LEAN_EXPECTED.items():
+        scalar = generate_golden_hues(base, len(expected))
+        batched = golden_hues([base], len(expected))[0]
+        err = max(circular_error(scalar, expected).max(), circular_error(batched, expected).max())
+        check(f"base={base:<6} n=0..7 max err {err:.2e}", err < 1e-9)
+    for base, n, expected in LEAN_FAR:
+        err = float(circular_error(nth_golden_hue(base, n), expected))
+        check(f"base={base:<6} n={n:<5} {nth_golden_hue(base, n):.10f} expected {expected:.10f}", err < 1e-8)
+
+    # Test 3: batched engine vs the Lua function over a sweep
+    print("\n[Test 3] Batched vs colors.lua nth_golden_hue (360 bases x 64 hues)")
+    bases = np.arange(0, 360, 1.0)
+    batched = golden_hues(bases, 64)
+    lua = np.array([[lua_nth_golden_hue(b, n) for n in range(64)] for b in bases])
+    err = circular_error(batched, lua).max()
+    check(f"max err {err:.2e} deg", err < 1e-9)
+
+    # Test 4: batched OKLCH -> hex matches verified_generator's scalar conversion
+    print("\n[Test 4] golden_palette hex vs verified_generator (dark and light accents)")
+    for L, C in [(0.72, 0.15), (0.45, 0.12)]:
+        palettes = golden_palette(bases, 8, L, C)
+        batched_hex = oklch_to_hex(palettes)
+        scalar_hex = [srgb_to_hex(oklch_to_srgb(OKLCH(L, C, float(h)))) for h in palettes[..., 2].ravel()]
+        mismatches = sum(a != b for a, b in zip(batched_hex, scalar_hex))
+        check(f"L={L} C={C}: {len(scalar_hex)} colours, {mismatches} mismatches", mismatches == 0)
+
+    # Test 5: spread (three-distance theorem: min gap >= 360 / (n * phi^2))
+    print("\n[Test 5] Minimum hue gap for n = 2..256")
+    ok = all(min_hue_gap(golden_hues([0.0], n))[0] >= 360.0 / (n * PHI * PHI) for n in range(2, 257))
+    check("min gap >= 360/(n*phi^2)", ok)
+    for n in (8, 16):
+        print(f"  n={n:<3} min gap {min_hue_gap(golden_hues([211.0], n))[0]:.2f}°")
+
+    print("\n" + "=" * 50)
+    if all_passed:
+        print("All tests passed! golden_angle matches the Lean4 and Lua definitions.")
+        return 0
+    else:
+        print("Some tests failed. Check the implementation.")
+        return 1
+
+if __name__ == "__main__":
+    exit(run_tests())
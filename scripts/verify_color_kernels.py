@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Exhaustive 24-bit sweep of the Python color kernels.
+
+Every sRGB color (#000000-#ffffff, 16.7M) goes through the vectorized kernels
+in core/tools/color_array.py, one chunk of 2**chunk_bits colors at a time:
+
+    roundtrip      hex -> OKLCH -> hex returns the same 8-bit code
+    gamut          in_gamut() holds for every sRGB color (gamut_map leaves it alone)
+    luminance      0 <= Y <= 1, Y(#000000) = 0, Y(#ffffff) = 1
+    monotonic      Y strictly increases with each channel
+    contrast       1 <= CR <= 21 and CR(a, b) == CR(b, a), pairing every color
+                   with a scrambled partner and with black and white
+
+Every --scalar-stride'th color is also run through the scalar kernels
+(verified_generator, contrast_cache) and compared with the vectorized result:
+
+    scalar-hex        verified_generator's hex -> OKLCH -> hex equals the input
+                      and color_array.srgb_to_hex of the vectorized round trip
+    scalar-oklch      L, C and (where C > HUE_MIN_CHROMA) H agree within tolerance
+    scalar-luminance  verified_generator and contrast_cache luminance agree
+    scalar-contrast   verified_generator.contrast_ratio agrees with the batch
+
+The sweep runs on every core and reports the worst errors, so the margin a
+kernel change eats into is visible even when every check passes. Exits 1 on
+any failure.
+
+Usage:
+    python scripts/verify_color_kernels.py
+    python scripts/verify_color_kernels.py --scalar-stride 1     # scalar kernels on all 16.7M too
+    python scripts/verify_color_kernels.py --jobs 4 --chunk-bits 18
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "core" / "tools"))
+
+from color_array import (  # noqa: E402
+    contrast_ratio, in_gamut, oklch_to_srgb, relative_luminance, srgb_to_hex, srgb_to_oklch,
+)
+from contrast_cache import luminance_packed  # noqa: E402
+import verified_generator as scalar  # noqa: E402
+
+COLORS = 1 << 24
+PARTNER = 0x9E3779  # odd, so c * PARTNER mod 2**24 pairs every color with a distinct partner
+HUE_MIN_CHROMA = 1e-4  # below this the hue of a near-gray is noise in both kernels
+TOLERANCE = {"oklch": 1e-12, "hue": 1e-9, "luminance": 1e-14, "contrast": 1e-12}
+EXAMPLES = 5  # failing colors kept per check and chunk
+
+CHECKS = ("roundtrip", "gamut", "luminance", "monotonic", "contrast",
+          "scalar-hex", "scalar-oklch", "scalar-luminance", "scalar-contrast")
+
+# ═══════════════════════════════════════════════════════════════════
+# Chunks
+# ═══════════════════════════════════════════════════════════════════
+
+@dataclass
+class ChunkResult:
+    colors: int = 0
+    scalar: int = 0
+    failures: Dict[str, int] = field(default_factory=lambda: dict.fromkeys(CHECKS, 0))
+    examples: Dict[str, List[int]] = field(default_factory=lambda: {check: [] for check in CHECKS})
+    worst: Dict[str, float] = field(default_factory=dict)
+
+    def fail(self, check: str, bad: np.ndarray, packed: np.ndarray):
+        """Record the colors in packed where the bool mask bad is set."""
+        hits = np.flatnonzero(bad)
+        self.failures[check] += len(hits)
+        self.examples[check].extend(packed[hits[:EXAMPLES]].tolist())
+
+    def note(self, name: str, value: float):
+        self.worst[name] = max(self.worst.get(name, 0.0), float(value))
+
+    def merge(self, other: "ChunkResult"):
+        self.colors += other.colors
+        self.scalar += other.scalar
+        for check in CHECKS:
+            self.failures[check] += other.failures[check]
+            self.examples[check].extend(other.examples[check][:EXAMPLES])
+        for name, value in other.worst.items():
+            self.note(name, value)
+
+def unpack(packed: np.ndarray) -> np.ndarray:
+    """Packed 0xrrggbb -> (N, 3) sRGB in [0, 1], the arithmetic of color_array.hex_to_srgb."""
+    return ((packed[:, None] >> np.array([16, 8, 0])) & 0xFF) / 255.0
+
+def pack(codes: np.ndarray) -> np.ndarray:
+    return (codes[:, 0] << 16) | (codes[:, 1] << 8) | codes[:, 2]
+
+def hue_gap(h1: np.ndarray, h2: np.ndarray) -> np.ndarray:
+    d = np.abs(h1 - h2) % 360.0
+    return np.minimum(d, 360.0 - d)
+
+def sweep_chunk(job: Tuple[int, int, int]) -> ChunkResult:
+    """Run every check on colors [start, stop)."""
+    start, stop, scalar_stride = job
+    result = ChunkResult(colors=stop - start)
+    packed = np.arange(start, stop, dtype=np.int64)
+    rgb = unpack(packed)
+
+    # Round trip through OKLCH; the float error before rounding is the margin to a wrong code
+    lch = srgb_to_oklch(rgb)
+    back = oklch_to_srgb(lch)
+    scaled = back * 255.0
+    result.note("roundtrip channel error (1/255)", np.abs(scaled - rgb * 255.0).max())
+    codes = np.rint(scaled).astype(np.int64)
+    result.fail("roundtrip", pack(codes) != packed, packed)
+    result.fail("gamut", ~in_gamut(lch), packed)
+
+    # Luminance bounds, and monotonicity along each channel (red compares with the row before the chunk)
+    Y = relative_luminance(rgb)
+    result.fail("luminance", (Y < 0.0) | (Y > 1.0), packed)
+    if start == 0:
+        result.fail("luminance", Y[:1] != 0.0, packed[:1])
+    if stop == COLORS:
+        result.note("|Y(#ffffff) - 1|", abs(Y[-1] - 1.0))
+        result.fail("luminance", np.abs(Y[-1:] - 1.0) > TOLERANCE["luminance"], packed[-1:])
+    down = np.zeros(len(packed), dtype=bool)
+    for shift in (0, 8, 16):
+        step = 1 << shift
+        channel = (packed >> shift) & 0xFF
+        prev = packed - step
+        has_prev = channel > 0
+        inside = has_prev & (prev >= start)
+        idx = np.flatnonzero(inside)
+        down[idx] |= Y[idx] <= Y[idx - step]
+        outside = np.flatnonzero(has_prev & ~inside)
+        if len(outside):
+            down[outside] |= Y[outside] <= relative_luminance(unpack(prev[outside]))
+    result.fail("monotonic", down, packed)
+
+    # Contrast: bounds and exact symmetry against a scrambled partner, black and white
+    partner = unpack((packed * PARTNER) & (COLORS - 1))
+    for other in (partner, np.zeros(3), np.ones(3)):
+        other = np.broadcast_to(other, rgb.shape)
+        forward, backward = contrast_ratio(rgb, other), contrast_ratio(other, rgb)
+        result.fail("contrast", (forward != backward) | (forward < 1.0) | (forward > 21.0 + 1e-12), packed)
+
+    # Scalar kernels on every scalar_stride'th color
+    first = -start % scalar_stride
+    picks = np.arange(first, stop - start, scalar_stride)
+    result.scalar = len(picks)
+    if not len(picks):
+        return result
+    s_hex_ok, s_lch, s_Y, s_Yc, s_cr = [], [], [], [], []
+    vector_hex = srgb_to_hex(back[picks])
+    for value in packed[picks].tolist():
+        hex_color = f"#{value:06x}"
+        color = scalar.hex_to_srgb(hex_color)
+        oklch = scalar.srgb_to_oklch(color)
+        s_hex_ok.append(scalar.srgb_to_hex(scalar.oklch_to_srgb(oklch)) == hex_color)
+        s_lch.append((oklch.L, oklch.C, oklch.H))
+        s_Y.append(scalar.relative_luminance(color))
+        s_Yc.append(luminance_packed(value))
+        mate = scalar.hex_to_srgb(f"#{(value * PARTNER) & (COLORS - 1):06x}")
+        s_cr.append(scalar.contrast_ratio(color, mate))
+    sub = packed[picks]
+    s_lch = np.array(s_lch)
+    vector_ok = np.array([h == f"#{value:06x}" for h, value in zip(vector_hex, sub.tolist())])
+    result.fail("scalar-hex", ~(np.array(s_hex_ok) & vector_ok), sub)
+
+    dL = np.abs(s_lch[:, 0] - lch[picks, 0])
+    dC = np.abs(s_lch[:, 1] - lch[picks, 1])
+    chromatic = lch[picks, 1] > HUE_MIN_CHROMA
+    dH = np.where(chromatic, hue_gap(s_lch[:, 2], lch[picks, 2]), 0.0)
+    result.note("scalar vs vector |dL|", dL.max())
+    result.note("scalar vs vector |dC|", dC.max())
+    result.note("scalar vs vector |dH| (deg)", dH.max())
+    result.fail("scalar-oklch", (dL > TOLERANCE["oklch"]) | (dC > TOLERANCE["oklch"]) | (dH > TOLERANCE["hue"]), sub)
+
+    dY = np.maximum(np.abs(np.array(s_Y) - Y[picks]), np.abs(np.array(s_Yc) - Y[picks]))
+    result.note("scalar vs vector |dY|", dY.max())
+    result.fail("scalar-luminance", dY > TOLERANCE["luminance"], sub)
+
+    cr = contrast_ratio(rgb[picks], partner[picks])
+    dCR = np.abs(np.array(s_cr) - cr) / cr
+    result.note("scalar vs vector contrast rel. error", dCR.max())
+    result.fail("scalar-contrast", dCR > TOLERANCE["contrast"], sub)
+    return result
+
+def run_sweep(chunk_bits: int, scalar_stride: int, jobs: int):
+    """Yield one ChunkResult per chunk, in order."""
+    size = 1 << chunk_bits
+    work = [(start, min(start + size, COLORS), scalar_stride) for start in range(0, COLORS, size)]
+    if jobs <= 1:
+        yield from map(sweep_chunk, work)
+        return
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        yield from pool.map(sweep_chunk, work)
+
+# ═══════════════════════════════════════════════════════════════════
+# CLI
+# ═══════════════════════════════════════════════════════════════════
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Exhaustive 24-bit sweep of the color kernels")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1, help="Worker processes")
+    parser.add_argument("--chunk-bits", type=int, default=16, help="Colors per chunk as a power of two (default: 16)")
+    parser.add_argument("--scalar-stride", type=int, default=31,
+                        help="Compare the scalar kernels on every Nth color (default: 31; 1 = all)")
+    args = parser.parse_args()
+    if not 8 <= args.chunk_bits <= 24:
+        parser.error("--chunk-bits must be between 8 and 24")
+    if args.scalar_stride < 1:
+        parser.error("--scalar-stride must be at least 1")
+
+    print("PRISM color kernel sweep")
+    print("=" * 50)
+    began = time.perf_counter()
+    total = ChunkResult()
+    chunks = 1 << (24 - args.chunk_bits)
+    for n, result in enumerate(run_sweep(args.chunk_bits, args.scalar_stride, args.jobs), 1):
+        total.merge(result)
+        if n % max(1, chunks // 16) == 0 or n == chunks:
+            print(f"  {total.colors / COLORS:6.1%}  {total.colors:>10,} colors  {time.perf_counter() - began:6.1f}s",
+                  flush=True)
+    elapsed = time.perf_counter() - began
+
+    print(f"\n{total.colors:,} colors, {total.scalar:,} through the scalar kernels, "
+          f"{args.jobs} job(s), {elapsed:.1f}s")
+    print("\nChecks:")
+    for check in CHECKS:
+        count = total.failures[check]
+        mark = "✓" if count == 0 else "✗"
+        examples = ", ".join(f"#{value:06x}" for value in total.examples[check][:EXAMPLES])
+        print(f"  {mark} {check:<17} {count:>10,} failing" + (f"  e.g. {examples}" if examples else ""))
+    print("\nWorst errors:")
+    for name, value in total.worst.items():
+        print(f"  {name:<38} {value:.3e}")
+
+    failed = sum(total.failures.values())
+    print(f"\n{'All checks passed' if failed == 0 else f'{failed:,} failures'}")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,12 +2,38 @@
 """
 Sync all 64 Prism themes from vscode/themes/ (source of truth) to all platforms.
 Generates: Cursor, OpenCode, Core, Emacs, Neovim, Alacritty, Kitty, WezTerm, Windows Terminal, iTerm2, etc.
+tmux, Starship and Helix also get xterm-256 and 16-color fallbacks (<slug>_256, <slug>_16).
+
+Usage:
+    python sync_themes.py                                  # write into the repo tree
+    python sync_themes.py --bundle dist/prism-themes.tar.gz
+    python sync_themes.py --watch                          # full sync, then regenerate edited themes
+    python sync_themes.py --no-links                       # plain copies instead of shared blobs
+    python sync_themes.py --no-store                       # parse the JSON even when build/themes.prismstore is current
+    python sync_themes.py --trace build/sync.trace.json    # per-stage spans for Perfetto
+    python sync_themes.py --metrics build/metrics.jsonl    # counters + stage histograms as JSON Lines
+    python core/tools/theme_bundle.py extract dist/prism-themes.tar.gz -C .
 """
 
+import argparse
+import contextlib
 import json
+import sys
+import time
 from pathlib import Path
 
 PRISM_ROOT = Path(__file__).parent
+sys.path.insert(0, str(PRISM_ROOT / "core" / "tools"))
+
+from format_writers import get_writer, render  # noqa: E402
+from nvim_highlights import compile_preset, to_lua  # noqa: E402
+from nvim_presets import INDEX_FILE, PRESETS_DIR, preset_modules, verify_modules  # noqa: E402
+import prism_metrics  # noqa: E402
+import prism_trace  # noqa: E402
+from prism_trace import span  # noqa: E402
+from theme_bundle import bundle_kind, open_sink  # noqa: E402
+from theme_store import DEFAULT_STORE, current_store  # noqa: E402
+from theme_watch import debounce, open_watcher  # noqa: E402
 
 def get_token_color(theme_data, scope):
     """Extract a specific token color from the theme."""
@@ -69,534 +95,160 @@ def extract_colors(vscode_theme):
         "ansiBrightWhite": c.get("terminal.ansiBrightWhite", ""),
     }
 
+def _render(fmt, slug, colors):
+    return render("sync", fmt, {**colors, "slug": slug})
+
 def generate_emacs(slug, colors):
     """Generate Emacs theme with full syntax highlighting."""
-    name = colors["name"]
-    bg = colors["bg"]
-    fg = colors["fg"]
-    hl = colors["hl"]
-    comment = colors["comment"]
-    keyword = colors["keyword"] or colors["accent"]
-    string = colors["string"] or keyword
-    function = colors["function"] or fg
-    type_color = colors["type"] or fg
-    variable = colors["variable"] or fg
-    constant = colors["constant"] or keyword
-    
-    return f''';;; {slug}-theme.el --- Prism {name} theme -*- lexical-binding: t; -*-
-;;; Commentary:
-;; Prism {name} color theme - Auto-generated from vscode/themes
-;;; Code:
-
-(deftheme {slug}
-  "Prism {name} - A {colors["type"]} theme.")
-
-(let ((class '((class color) (min-colors 89)))
-      (bg "{bg}")
-      (fg "{fg}")
-      (hl "{hl}")
-      (comment "{comment}")
-      (keyword "{keyword}")
-      (string "{string}")
-      (func "{function}")
-      (type "{type_color}")
-      (variable "{variable}")
-      (constant "{constant}"))
-
-  (custom-theme-set-faces
-   '{slug}
-   `(default ((,class (:background ,bg :foreground ,fg))))
-   `(cursor ((,class (:background ,keyword))))
-   `(region ((,class (:background ,hl))))
-   `(highlight ((,class (:background ,hl))))
-   `(hl-line ((,class (:background ,hl))))
-   `(fringe ((,class (:background ,bg))))
-   `(line-number ((,class (:foreground ,comment))))
-   `(line-number-current-line ((,class (:foreground ,fg))))
-   `(font-lock-comment-face ((,class (:foreground ,comment :slant italic))))
-   `(font-lock-keyword-face ((,class (:foreground ,keyword))))
-   `(font-lock-string-face ((,class (:foreground ,string))))
-   `(font-lock-function-name-face ((,class (:foreground ,func))))
-   `(font-lock-variable-name-face ((,class (:foreground ,variable))))
-   `(font-lock-type-face ((,class (:foreground ,type))))
-   `(font-lock-constant-face ((,class (:foreground ,constant))))
-   `(font-lock-builtin-face ((,class (:foreground ,keyword))))
-   `(font-lock-preprocessor-face ((,class (:foreground ,keyword))))
-   `(mode-line ((,class (:background ,hl :foreground ,fg))))
-   `(mode-line-inactive ((,class (:background ,bg :foreground ,comment))))
-   ;; Markdown/Org headings
-   `(markdown-header-face-1 ((,class (:foreground ,keyword :weight bold))))
-   `(markdown-header-face-2 ((,class (:foreground ,string :weight bold))))
-   `(markdown-header-face-3 ((,class (:foreground ,func :weight bold))))
-   `(markdown-bold-face ((,class (:foreground ,keyword :weight bold))))
-   `(markdown-italic-face ((,class (:foreground ,string :slant italic))))
-   `(org-level-1 ((,class (:foreground ,keyword :weight bold))))
-   `(org-level-2 ((,class (:foreground ,string :weight bold))))
-   `(org-level-3 ((,class (:foreground ,func :weight bold))))))
-
-;;;###autoload
-(when load-file-name
-  (add-to-list 'custom-theme-load-path
-               (file-name-as-directory (file-name-directory load-file-name))))
-
-(provide-theme '{slug})
-;;; {slug}-theme.el ends here
-'''
+    return _render("emacs", slug, colors)
 
 def generate_alacritty(slug, colors):
     """Generate Alacritty theme."""
-    name = colors["name"]
-    return f'''# Prism {name} - Alacritty
-[colors.primary]
-background = "{colors["bg"]}"
-foreground = "{colors["fg"]}"
-
-[colors.cursor]
-cursor = "{colors["accent"]}"
-text = "{colors["bg"]}"
-
-[colors.selection]
-background = "{colors["hl"]}"
-text = "{colors["fg"]}"
-
-[colors.normal]
-black = "{colors["ansiBlack"]}"
-red = "{colors["ansiRed"]}"
-green = "{colors["ansiGreen"]}"
-yellow = "{colors["ansiYellow"]}"
-blue = "{colors["ansiBlue"]}"
-magenta = "{colors["ansiMagenta"]}"
-cyan = "{colors["ansiCyan"]}"
-white = "{colors["ansiWhite"]}"
-
-[colors.bright]
-black = "{colors["ansiBrightBlack"]}"
-red = "{colors["ansiBrightRed"]}"
-green = "{colors["ansiBrightGreen"]}"
-yellow = "{colors["ansiBrightYellow"]}"
-blue = "{colors["ansiBrightBlue"]}"
-magenta = "{colors["ansiBrightMagenta"]}"
-cyan = "{colors["ansiBrightCyan"]}"
-white = "{colors["ansiBrightWhite"]}"
-'''
+    return _render("alacritty", slug, colors)
 
 def generate_kitty(slug, colors):
     """Generate Kitty theme."""
-    name = colors["name"]
-    return f'''# Prism {name} - Kitty
-foreground {colors["fg"]}
-background {colors["bg"]}
-cursor {colors["accent"]}
-selection_background {colors["hl"]}
-selection_foreground {colors["fg"]}
-
-color0 {colors["ansiBlack"]}
-color1 {colors["ansiRed"]}
-color2 {colors["ansiGreen"]}
-color3 {colors["ansiYellow"]}
-color4 {colors["ansiBlue"]}
-color5 {colors["ansiMagenta"]}
-color6 {colors["ansiCyan"]}
-color7 {colors["ansiWhite"]}
-
-color8 {colors["ansiBrightBlack"]}
-color9 {colors["ansiBrightRed"]}
-color10 {colors["ansiBrightGreen"]}
-color11 {colors["ansiBrightYellow"]}
-color12 {colors["ansiBrightBlue"]}
-color13 {colors["ansiBrightMagenta"]}
-color14 {colors["ansiBrightCyan"]}
-color15 {colors["ansiBrightWhite"]}
-'''
+    return _render("kitty", slug, colors)
 
 def generate_wezterm(slug, colors):
     """Generate WezTerm theme."""
-    name = colors["name"]
-    return f'''-- Prism {name} - WezTerm
-return {{
-  foreground = "{colors["fg"]}",
-  background = "{colors["bg"]}",
-  cursor_bg = "{colors["accent"]}",
-  cursor_fg = "{colors["bg"]}",
-  selection_bg = "{colors["hl"]}",
-  selection_fg = "{colors["fg"]}",
-  ansi = {{
-    "{colors["ansiBlack"]}",
-    "{colors["ansiRed"]}",
-    "{colors["ansiGreen"]}",
-    "{colors["ansiYellow"]}",
-    "{colors["ansiBlue"]}",
-    "{colors["ansiMagenta"]}",
-    "{colors["ansiCyan"]}",
-    "{colors["ansiWhite"]}",
-  }},
-  brights = {{
-    "{colors["ansiBrightBlack"]}",
-    "{colors["ansiBrightRed"]}",
-    "{colors["ansiBrightGreen"]}",
-    "{colors["ansiBrightYellow"]}",
-    "{colors["ansiBrightBlue"]}",
-    "{colors["ansiBrightMagenta"]}",
-    "{colors["ansiBrightCyan"]}",
-    "{colors["ansiBrightWhite"]}",
-  }},
-}}
-'''
+    return _render("wezterm", slug, colors)
 
 def generate_windows_terminal(slug, colors):
-    """Generate Windows Terminal theme."""
-    return {
-        "name": f"Prism {colors['name']}",
-        "background": colors["bg"],
-        "foreground": colors["fg"],
-        "cursorColor": colors["accent"],
-        "selectionBackground": colors["hl"],
-        "black": colors["ansiBlack"],
-        "red": colors["ansiRed"],
-        "green": colors["ansiGreen"],
-        "yellow": colors["ansiYellow"],
-        "blue": colors["ansiBlue"],
-        "purple": colors["ansiMagenta"],
-        "cyan": colors["ansiCyan"],
-        "white": colors["ansiWhite"],
-        "brightBlack": colors["ansiBrightBlack"],
-        "brightRed": colors["ansiBrightRed"],
-        "brightGreen": colors["ansiBrightGreen"],
-        "brightYellow": colors["ansiBrightYellow"],
-        "brightBlue": colors["ansiBrightBlue"],
-        "brightPurple": colors["ansiBrightMagenta"],
-        "brightCyan": colors["ansiBrightCyan"],
-        "brightWhite": colors["ansiBrightWhite"],
-    }
+    """Generate Windows Terminal theme (JSON text)."""
+    return _render("windows-terminal", slug, colors)
 
 def generate_iterm2(slug, colors):
     """Generate iTerm2 color scheme."""
-    def hex_to_rgb(h):
-        h = h.lstrip('#')
-        return tuple(int(h[i:i+2], 16) / 255.0 for i in (0, 2, 4))
-    
-    def color_entry(name, hex_color):
-        r, g, b = hex_to_rgb(hex_color)
-        return f'''    <key>{name}</key>
-    <dict>
-        <key>Color Space</key>
-        <string>sRGB</string>
-        <key>Red Component</key>
-        <real>{r}</real>
-        <key>Green Component</key>
-        <real>{g}</real>
-        <key>Blue Component</key>
-        <real>{b}</real>
-    </dict>'''
-    
-    entries = [
-        color_entry("Background Color", colors["bg"]),
-        color_entry("Foreground Color", colors["fg"]),
-        color_entry("Cursor Color", colors["accent"]),
-        color_entry("Selection Color", colors["hl"]),
-        color_entry("Ansi 0 Color", colors["ansiBlack"]),
-        color_entry("Ansi 1 Color", colors["ansiRed"]),
-        color_entry("Ansi 2 Color", colors["ansiGreen"]),
-        color_entry("Ansi 3 Color", colors["ansiYellow"]),
-        color_entry("Ansi 4 Color", colors["ansiBlue"]),
-        color_entry("Ansi 5 Color", colors["ansiMagenta"]),
-        color_entry("Ansi 6 Color", colors["ansiCyan"]),
-        color_entry("Ansi 7 Color", colors["ansiWhite"]),
-        color_entry("Ansi 8 Color", colors["ansiBrightBlack"]),
-        color_entry("Ansi 9 Color", colors["ansiBrightRed"]),
-        color_entry("Ansi 10 Color", colors["ansiBrightGreen"]),
-        color_entry("Ansi 11 Color", colors["ansiBrightYellow"]),
-        color_entry("Ansi 12 Color", colors["ansiBrightBlue"]),
-        color_entry("Ansi 13 Color", colors["ansiBrightMagenta"]),
-        color_entry("Ansi 14 Color", colors["ansiBrightCyan"]),
-        color_entry("Ansi 15 Color", colors["ansiBrightWhite"]),
-    ]
-    
-    return f'''<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
-<plist version="1.0">
-<dict>
-{chr(10).join(entries)}
-</dict>
-</plist>
-'''
+    return _render("iterm2", slug, colors)
 
 def generate_helix(slug, colors):
     """Generate Helix theme."""
-    name = colors["name"]
-    return f'''# Prism {name} - Helix
-# Place in ~/.config/helix/themes/{slug}.toml
-
-"ui.background" = {{ bg = "{colors["bg"]}" }}
-"ui.text" = "{colors["fg"]}"
-"ui.text.focus" = "{colors["keyword"]}"
-"ui.cursor" = {{ bg = "{colors["keyword"]}", fg = "{colors["bg"]}" }}
-"ui.cursor.match" = {{ bg = "{colors["hl"]}" }}
-"ui.selection" = {{ bg = "{colors["hl"]}" }}
-"ui.linenr" = "{colors["comment"]}"
-"ui.linenr.selected" = "{colors["fg"]}"
-"ui.cursorline.primary" = {{ bg = "{colors["hl"]}" }}
-"ui.statusline" = {{ fg = "{colors["fg"]}", bg = "{colors["bg"]}" }}
-"ui.statusline.inactive" = {{ fg = "{colors["comment"]}", bg = "{colors["bg"]}" }}
-"ui.popup" = {{ bg = "{colors["bg"]}" }}
-"ui.menu" = {{ bg = "{colors["bg"]}" }}
-"ui.menu.selected" = {{ bg = "{colors["hl"]}" }}
-"ui.help" = {{ fg = "{colors["fg"]}", bg = "{colors["bg"]}" }}
-
-"comment" = {{ fg = "{colors["comment"]}", modifiers = ["italic"] }}
-"keyword" = {{ fg = "{colors["keyword"]}", modifiers = ["bold"] }}
-"keyword.control" = "{colors["keyword"]}"
-"keyword.function" = "{colors["keyword"]}"
-"keyword.return" = "{colors["keyword"]}"
-"keyword.exception" = "{colors["keyword"]}"
-"keyword.operator" = "{colors["keyword"]}"
-
-"string" = "{colors["string"]}"
-"string.special" = "{colors["string"]}"
-
-"function" = "{colors["function"]}"
-"function.builtin" = "{colors["function"]}"
-"function.method" = "{colors["function"]}"
-"function.macro" = "{colors["function"]}"
-
-"constant" = "{colors["constant"]}"
-"constant.numeric" = "{colors["constant"]}"
-"constant.character" = "{colors["string"]}"
-"constant.builtin" = "{colors["constant"]}"
-
-"type" = "{colors["type"]}"
-"type.builtin" = "{colors["type"]}"
-
-"variable" = "{colors["variable"]}"
-"variable.builtin" = "{colors["keyword"]}"
-"variable.parameter" = "{colors["variable"]}"
-
-"attribute" = "{colors["attribute"]}"
-"namespace" = "{colors["type"]}"
-
-"operator" = "{colors["keyword"]}"
-"punctuation" = "{colors["fg"]}"
-"punctuation.delimiter" = "{colors["fg"]}"
-"punctuation.bracket" = "{colors["fg"]}"
-
-"label" = "{colors["keyword"]}"
-"tag" = "{colors["tag"]}"
-
-"markup.heading" = {{ fg = "{colors["keyword"]}", modifiers = ["bold"] }}
-"markup.bold" = {{ modifiers = ["bold"] }}
-"markup.italic" = {{ modifiers = ["italic"] }}
-"markup.link.url" = "{colors["keyword"]}"
-"markup.link.text" = "{colors["string"]}"
-"markup.raw" = "{colors["string"]}"
-
-"diff.plus" = "{colors["ansiGreen"]}"
-"diff.minus" = "{colors["ansiRed"]}"
-"diff.delta" = "{colors["ansiYellow"]}"
-
-[palette]
-background = "{colors["bg"]}"
-foreground = "{colors["fg"]}"
-accent = "{colors["accent"]}"
-'''
+    return _render("helix", slug, colors)
 
 def generate_zed(slug, colors):
     """Generate Zed theme."""
-    name = colors["name"]
-    theme_type = colors["type"]
-    return json.dumps({
-        "$schema": "https://zed.dev/schema/themes/v0.1.0.json",
-        "name": f"Prism {name}",
-        "author": "Prism Theme System",
-        "themes": [{
-            "name": f"Prism {name}",
-            "appearance": theme_type,
-            "style": {
-                "background": colors["bg"],
-                "editor.background": colors["bg"],
-                "editor.foreground": colors["fg"],
-                "editor.gutter.background": colors["bg"],
-                "editor.line_highlight.background": colors["hl"],
-                "editor.active_line_number": colors["fg"],
-                "editor.wrap_guide": colors["comment"],
-                "terminal.background": colors["bg"],
-                "terminal.foreground": colors["fg"],
-                "terminal.ansi.black": colors["ansiBlack"],
-                "terminal.ansi.red": colors["ansiRed"],
-                "terminal.ansi.green": colors["ansiGreen"],
-                "terminal.ansi.yellow": colors["ansiYellow"],
-                "terminal.ansi.blue": colors["ansiBlue"],
-                "terminal.ansi.magenta": colors["ansiMagenta"],
-                "terminal.ansi.cyan": colors["ansiCyan"],
-                "terminal.ansi.white": colors["ansiWhite"],
-                "syntax": {
-                    "comment": {"color": colors["comment"], "font_style": "italic"},
-                    "keyword": {"color": colors["keyword"], "font_weight": 600},
-                    "string": {"color": colors["string"]},
-                    "function": {"color": colors["function"]},
-                    "number": {"color": colors["constant"]},
-                    "type": {"color": colors["type"]},
-                    "variable": {"color": colors["variable"]},
-                    "constant": {"color": colors["constant"]},
-                    "attribute": {"color": colors["attribute"]},
-                    "property": {"color": colors["variable"]},
-                    "punctuation": {"color": colors["fg"]},
-                    "operator": {"color": colors["keyword"]},
-                }
-            }
-        }]
-    }, indent=2)
+    return _render("zed", slug, colors)
 
 def generate_tmux(slug, colors):
     """Generate tmux theme."""
-    name = colors["name"]
-    return f'''# Prism {name} - tmux
-# Add to ~/.tmux.conf or source this file
-
-# Status bar
-set -g status-style "bg={colors["bg"]},fg={colors["fg"]}"
-set -g status-left-style "bg={colors["bg"]},fg={colors["keyword"]}"
-set -g status-right-style "bg={colors["bg"]},fg={colors["comment"]}"
-
-# Window status
-set -g window-status-style "bg={colors["bg"]},fg={colors["comment"]}"
-set -g window-status-current-style "bg={colors["hl"]},fg={colors["keyword"]}"
-
-# Pane borders
-set -g pane-border-style "fg={colors["comment"]}"
-set -g pane-active-border-style "fg={colors["keyword"]}"
-
-# Message styling
-set -g message-style "bg={colors["hl"]},fg={colors["fg"]}"
-set -g message-command-style "bg={colors["hl"]},fg={colors["fg"]}"
-
-# Mode styling
-set -g mode-style "bg={colors["hl"]},fg={colors["fg"]}"
-'''
+    return _render("tmux", slug, colors)
 
 def generate_starship(slug, colors):
     """Generate Starship prompt theme."""
-    name = colors["name"]
-    return f'''# Prism {name} - Starship prompt colors
-# Add to ~/.config/starship.toml
-
-[palettes.prism_{slug}]
-background = "{colors["bg"]}"
-foreground = "{colors["fg"]}"
-accent = "{colors["keyword"]}"
-muted = "{colors["comment"]}"
-success = "{colors["ansiGreen"]}"
-warning = "{colors["ansiYellow"]}"
-error = "{colors["ansiRed"]}"
-info = "{colors["ansiBlue"]}"
-
-# Example usage:
-# palette = "prism_{slug}"
-# 
-# [character]
-# success_symbol = "[❯](accent)"
-# error_symbol = "[❯](error)"
-'''
-
-def main():
-    vscode_dir = PRISM_ROOT / "vscode" / "themes"
-    cursor_dir = PRISM_ROOT / "cursor" / "themes"
-    opencode_dir = PRISM_ROOT / "opencode" / "themes"
-    core_dir = PRISM_ROOT / "core" / "themes"
-    emacs_dir = PRISM_ROOT / "emacs" / "themes"
-    alacritty_dir = PRISM_ROOT / "terminal" / "alacritty"
-    kitty_dir = PRISM_ROOT / "terminal" / "kitty"
-    wezterm_dir = PRISM_ROOT / "terminal" / "wezterm"
-    wt_dir = PRISM_ROOT / "terminal" / "windows-terminal"
-    iterm_dir = PRISM_ROOT / "terminal" / "iterm2"
-    helix_dir = PRISM_ROOT / "terminal" / "helix"
-    zed_dir = PRISM_ROOT / "terminal" / "zed"
-    tmux_dir = PRISM_ROOT / "terminal" / "tmux"
-    starship_dir = PRISM_ROOT / "terminal" / "starship"
-    neovim_presets_dir = PRISM_ROOT / "neovim" / "presets"
-    
-    # Ensure dirs exist
-    for d in [cursor_dir, opencode_dir, emacs_dir, alacritty_dir, kitty_dir, 
-              wezterm_dir, wt_dir, iterm_dir, helix_dir, zed_dir, tmux_dir,
-              starship_dir, neovim_presets_dir]:
-        d.mkdir(parents=True, exist_ok=True)
-    
-    neovim_presets = {}
-    themes = sorted(vscode_dir.glob("*.json"))
-    print(f"Found {len(themes)} VSCode themes (source of truth)")
-    
-    for theme_file in themes:
-        slug = theme_file.stem
-        
-        with open(theme_file, encoding="utf-8") as f:
-            vscode_data = json.load(f)
+    return _render("starship", slug, colors)
+
+# Lua field -> neovim_presets key, in emitted order
+NVIM_PRESET_FIELDS = (
+    ("name", "name"), ("bg", "bg"), ("fg", "fg"), ("accent", "accent"), ("comment", "comment"),
+    ("keyword", "keyword"), ("string", "string"), ("func", "function"), ("type", "type"),
+)
+
+def neovim_preset_lua(preset):
+    """Lua table constructor for one Neovim preset module."""
+    fields = "".join(f'  {key} = "{preset[field]}",\n' for key, field in NVIM_PRESET_FIELDS)
+    return "{\n" + fields + "}"
+
+VSCODE_DIR = PRISM_ROOT / "vscode" / "themes"
+
+# Output locations, relative to the repo root (and to the bundle root)
+CURSOR_DIR = Path("cursor") / "themes"
+OPENCODE_DIR = Path("opencode") / "themes"
+CORE_DIR = Path("core") / "themes"
+NEOVIM_PRESETS_JSON = Path("neovim") / "presets" / "all_themes.json"
+NVIM_COMPILED_DIR = Path("neovim") / "lua" / "prism" / "compiled"
+BLOB_DIR = PRISM_ROOT / "build" / "blobs"  # content-addressed store behind the verbatim JSON copies
+
+# (format, directory, filename) for every format_writers output
+OUTPUTS = [
+    ("emacs", Path("emacs") / "themes", "{slug}-theme.el"),
+    ("alacritty", Path("terminal") / "alacritty", "{slug}.toml"),
+    ("kitty", Path("terminal") / "kitty", "{slug}.conf"),
+    ("wezterm", Path("terminal") / "wezterm", "{slug}.lua"),
+    ("windows-terminal", Path("terminal") / "windows-terminal", "{slug}.json"),
+    ("iterm2", Path("terminal") / "iterm2", "{slug}.itermcolors"),
+    ("helix", Path("terminal") / "helix", "{slug}.toml"),
+    ("zed", Path("terminal") / "zed", "{slug}.json"),
+    ("tmux", Path("terminal") / "tmux", "{slug}.conf"),
+    ("starship", Path("terminal") / "starship", "{slug}.toml"),
+]
+
+# Formats that also get palette-quantized variants, written next to the truecolor file as <slug>_<depth>
+FALLBACK_FORMATS = ("tmux", "starship", "helix")
+FALLBACK_DEPTHS = (256, 16)
+# Fallback colors that must not share a palette entry with what they are drawn
+# over (key -> partners); surfaces first, so the text over them sees their final entry
+FALLBACK_DISTINCT = {
+    "hl": ("bg",),
+    "fg": ("bg", "hl"),
+    "keyword": ("bg", "hl"),
+    **{key: ("bg",) for key in ("comment", "accent", "string", "function", "type", "variable", "constant",
+                               "tag", "attribute", "ansiRed", "ansiGreen", "ansiYellow", "ansiBlue")},
+}
+
+class ThemeSync:
+    """Per-theme sync state: compiled writers plus every parsed theme.
+
+    A full run calls sync_theme() for each file and then write_neovim_index().
+    --watch keeps the instance alive, so an edit only re-parses and re-renders
+    the changed themes.
+    """
+
+    def __init__(self, blob_dir=BLOB_DIR):
+        self.blob_dir = blob_dir
+        self.writers = {fmt: get_writer("sync", fmt) for fmt, _, _ in OUTPUTS}
+        self.neovim_presets = {}
+        try:
+            import xterm_quantize  # needs NumPy; only the _256/_16 fallbacks use it
+        except ImportError:
+            print(f"NumPy not installed: skipping the {'/'.join(map(str, FALLBACK_DEPTHS))}-color fallbacks")
+            xterm_quantize = None
+        self.quantize = xterm_quantize
+
+    def theme_outputs(self, slug):
+        """Every file derived from one theme (except the shared Neovim index)."""
+        paths = [CURSOR_DIR / f"{slug}.json", OPENCODE_DIR / f"{slug}.json", CORE_DIR / f"prism-{slug}.json"]
+        paths += [out_dir / filename.format(slug=slug) for _, out_dir, filename in OUTPUTS]
+        paths += [out_dir / filename.format(slug=f"{slug}_{depth}")
+                  for fmt, out_dir, filename in OUTPUTS if fmt in FALLBACK_FORMATS for depth in FALLBACK_DEPTHS]
+        paths += [PRESETS_DIR / f"{slug}.lua", NVIM_COMPILED_DIR / f"{slug}.lua"]
+        return paths
+
+    def sync_theme(self, sink, slug, vscode_data):
+        with span("extract"):
+            colors = extract_colors(vscode_data)
         
-        colors = extract_colors(vscode_data)
-        print(f"  {slug}: syncing...")
+        # 1-3. Cursor, OpenCode (exact copies) and Core (with prism- prefix): serialized once, linked to one blob
+        with span("render", "json"):
+            theme_json = json.dumps(vscode_data, indent=2)
+        with span("write", "json"):
+            sink.write_many([CURSOR_DIR / f"{slug}.json", OPENCODE_DIR / f"{slug}.json", CORE_DIR / f"prism-{slug}.json"],
+                            theme_json)
         
-        # 1. Cursor (exact copy)
-        with open(cursor_dir / f"{slug}.json", "w", encoding="utf-8") as f:
-            json.dump(vscode_data, f, indent=2)
+        # 4-13. Editor and terminal formats, rendered through format_writers
+        values = {**colors, "slug": slug}
+        fallbacks = {}
+        if self.quantize:
+            with span("color", "xterm"):
+                fallbacks = {depth: self.quantize.palette_indices(colors, depth, FALLBACK_DISTINCT)
+                             for depth in FALLBACK_DEPTHS}
+        for fmt, out_dir, filename in OUTPUTS:
+            with span("render", fmt):
+                text = self.writers[fmt].render(values)
+            with span("write"):
+                sink.write(out_dir / filename.format(slug=slug), text)
+            if fmt not in FALLBACK_FORMATS:
+                continue
+            for depth in fallbacks:
+                variant = f"{slug}_{depth}"
+                with span("render", f"{fmt}-{depth}"):
+                    fallback = {**values, "slug": variant, "name": f"{colors['name']} ({depth} colors)"}
+                    text = self.writers[fmt].render(self.quantize.quantize_values(fallback, fallbacks[depth], fmt))
+                with span("write"):
+                    sink.write(out_dir / filename.format(slug=variant), text)
         
-        # 2. OpenCode (exact copy)
-        with open(opencode_dir / f"{slug}.json", "w", encoding="utf-8") as f:
-            json.dump(vscode_data, f, indent=2)
-        
-        # 3. Core (with prism- prefix)
-        with open(core_dir / f"prism-{slug}.json", "w", encoding="utf-8") as f:
-            json.dump(vscode_data, f, indent=2)
-        
-        # 4. Emacs
-        emacs_content = generate_emacs(slug, colors)
-        with open(emacs_dir / f"{slug}-theme.el", "w", encoding="utf-8") as f:
-            f.write(emacs_content)
-        
-        # 5. Alacritty
-        alacritty_content = generate_alacritty(slug, colors)
-        with open(alacritty_dir / f"{slug}.toml", "w", encoding="utf-8") as f:
-            f.write(alacritty_content)
-        
-        # 6. Kitty
-        kitty_content = generate_kitty(slug, colors)
-        with open(kitty_dir / f"{slug}.conf", "w", encoding="utf-8") as f:
-            f.write(kitty_content)
-        
-        # 7. WezTerm
-        wezterm_content = generate_wezterm(slug, colors)
-        with open(wezterm_dir / f"{slug}.lua", "w", encoding="utf-8") as f:
-            f.write(wezterm_content)
-        
-        # 8. Windows Terminal
-        wt_theme = generate_windows_terminal(slug, colors)
-        with open(wt_dir / f"{slug}.json", "w", encoding="utf-8") as f:
-            json.dump(wt_theme, f, indent=2)
-        
-        # 9. iTerm2
-        iterm_content = generate_iterm2(slug, colors)
-        with open(iterm_dir / f"{slug}.itermcolors", "wb") as f:
-            f.write(iterm_content)
-        
-        # 10. Helix
-        helix_content = generate_helix(slug, colors)
-        with open(helix_dir / f"{slug}.toml", "w", encoding="utf-8") as f:
-            f.write(helix_content)
-        
-        # 11. Zed
-        zed_content = generate_zed(slug, colors)
-        with open(zed_dir / f"{slug}.json", "w", encoding="utf-8") as f:
-            f.write(zed_content)
-        
-        # 12. tmux
-        tmux_content = generate_tmux(slug, colors)
-        with open(tmux_dir / f"{slug}.conf", "w", encoding="utf-8") as f:
-            f.write(tmux_content)
-        
-        # 13. Starship
-        starship_content = generate_starship(slug, colors)
-        with open(starship_dir / f"{slug}.toml", "w", encoding="utf-8") as f:
-            f.write(starship_content)
-        
-        # 14. Neovim preset
-        neovim_presets[slug] = {
+        # 14. Neovim preset (module written with the index)
+        self.neovim_presets[slug] = {
             "name": colors["name"],
             "bg": colors["bg"],
             "fg": colors["fg"],
@@ -607,61 +259,172 @@ def main():
             "function": colors["function"],
             "type": colors["type"],
         }
+        
+        # 15. Precompiled Neovim highlight table (palette math done here, not in Lua)
+        with span("color", "nvim"):
+            compiled = compile_preset(slug, colors, vscode_data.get("type", "dark"))
+        with span("render", "nvim"):
+            text = to_lua(compiled)
+        with span("write"):
+            sink.write(NVIM_COMPILED_DIR / f"{slug}.lua", text)
+
+    def remove_theme(self, slug):
+        """Forget a deleted theme and remove its outputs from the tree."""
+        self.neovim_presets.pop(slug, None)
+        for rel in self.theme_outputs(slug):
+            (PRISM_ROOT / rel).unlink(missing_ok=True)
+
+    def write_neovim_index(self, sink, slugs=None, on_disk=None):
+        """Verify and write the Neovim preset index, its modules (only slugs, if given) and all_themes.json."""
+        bodies = {slug: neovim_preset_lua(p) for slug, p in self.neovim_presets.items()}
+        files = preset_modules(bodies, "-- Auto-generated from vscode/themes - DO NOT EDIT")
+        problems = verify_modules(files, on_disk=on_disk)
+        if problems:
+            return problems
+        for filename, text in files.items():
+            if slugs is None or filename == INDEX_FILE or filename[:-4] in slugs:
+                sink.write(PRESETS_DIR / filename, text)
+        sink.write(NEOVIM_PRESETS_JSON, json.dumps(self.neovim_presets, indent=2))
+        return []
+
+def load_theme(theme_file):
+    with span("load"), open(theme_file, encoding="utf-8") as f:
+        return json.load(f)
+
+def watch(state, debounce_ms, poll):
+    """Regenerate the outputs of changed themes until interrupted."""
+    with open_watcher(VSCODE_DIR, "*.json", poll=poll) as watcher:
+        print(f"\nWatching {VSCODE_DIR} ({watcher.kind}, {debounce_ms} ms debounce); Ctrl+C to stop")
+        try:
+            while True:
+                changed = debounce(watcher, quiet=debounce_ms / 1000)
+                start = time.perf_counter()
+                sink = open_sink(PRISM_ROOT, blob_dir=state.blob_dir)
+                synced, removed = [], []
+                for name in sorted(changed):
+                    slug = name[:-len(".json")]
+                    theme_file = VSCODE_DIR / name
+                    if not theme_file.exists():
+                        state.remove_theme(slug)
+                        removed.append(slug)
+                        continue
+                    try:
+                        state.sync_theme(sink, slug, load_theme(theme_file))
+                        synced.append(slug)
+                    except (OSError, ValueError, KeyError) as e:
+                        # Half-written or invalid JSON: keep the last good outputs
+                        print(f"  ✗ {slug}: {e}", file=sys.stderr)
+                if not synced and not removed:
+                    continue
+                problems = state.write_neovim_index(sink, slugs=set(synced), on_disk=PRISM_ROOT / PRESETS_DIR)
+                for problem in problems + sink.verify_copies():
+                    print(f"  ✗ {problem}", file=sys.stderr)
+                prism_metrics.count("themes", len(synced))
+                prism_metrics.count("themes_removed", len(removed))
+                prism_metrics.count_sink(sink)
+                elapsed = (time.perf_counter() - start) * 1000
+                stamp = time.strftime("%H:%M:%S")
+                parts = [f"synced {', '.join(synced)}"] if synced else []
+                parts += [f"removed {', '.join(removed)}"] if removed else []
+                print(f"[{stamp}] {'; '.join(parts)} ({sink.files} files, {elapsed:.1f} ms)")
+        except KeyboardInterrupt:
+            print("\nStopped watching")
+    return 0
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sync Prism themes from vscode/themes to every platform")
+    parser.add_argument("--bundle", metavar="PATH",
+                        help="Write every artifact into one .tar[.gz|.xz|.bz2] or .zip instead of the tree")
+    parser.add_argument("--watch", action="store_true",
+                        help="After the full sync, regenerate outputs of edited themes as they change")
+    parser.add_argument("--poll", action="store_true", help="With --watch: poll instead of using inotify")
+    parser.add_argument("--debounce", type=int, default=50, metavar="MS",
+                        help="With --watch: quiet period that ends a burst of saves (default: 50)")
+    parser.add_argument("--no-links", action="store_true",
+                        help="Write the Cursor/OpenCode/Core JSON as plain copies instead of links to one blob")
+    parser.add_argument("--no-store", action="store_true",
+                        help=f"Parse the JSON even when {DEFAULT_STORE.name} is current")
+    prism_trace.add_arguments(parser)
+    prism_metrics.add_arguments(parser)
+    args = parser.parse_args(argv)
+    if args.bundle:
+        try:
+            bundle_kind(args.bundle)
+        except ValueError as e:
+            parser.error(str(e))
+        if args.watch:
+            parser.error("--watch writes into the tree and cannot be combined with --bundle")
     
-    # Write Neovim presets.lua
-    nvim_presets_path = PRISM_ROOT / "neovim" / "lua" / "prism" / "presets.lua"
-    nvim_presets_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    nvim_lines = [
-        "-- PRISM Theme Presets for Neovim",
-        f"-- Auto-generated from vscode/themes - {len(neovim_presets)} themes",
-        "",
-        "local M = {}",
-        "",
-        "M.presets = {"
-    ]
-    for slug, p in sorted(neovim_presets.items()):
-        nvim_lines.append(f'  ["{slug}"] = {{')
-        nvim_lines.append(f'    name = "{p["name"]}",')
-        nvim_lines.append(f'    bg = "{p["bg"]}",')
-        nvim_lines.append(f'    fg = "{p["fg"]}",')
-        nvim_lines.append(f'    accent = "{p["accent"]}",')
-        nvim_lines.append(f'    comment = "{p["comment"]}",')
-        nvim_lines.append(f'    keyword = "{p["keyword"]}",')
-        nvim_lines.append(f'    string = "{p["string"]}",')
-        nvim_lines.append(f'    func = "{p["function"]}",')
-        nvim_lines.append(f'    type = "{p["type"]}",')
-        nvim_lines.append('  },')
-    nvim_lines.append("}")
-    nvim_lines.append("")
-    nvim_lines.append("return M")
-    nvim_lines.append("")
+    prism_trace.start(args, "sync_themes")
+    prism_metrics.start(args, "sync_themes")
+    state = ThemeSync(blob_dir=None if args.no_links else BLOB_DIR)
+    themes = sorted(VSCODE_DIR.glob("*.json"))
+    store = None if args.no_store else current_store(VSCODE_DIR)
+    print(f"Found {len(themes)} VSCode themes (source of truth)" + (f", read from {store.path}" if store else ""))
+    prism_metrics.count("themes", len(themes))
     
-    with open(nvim_presets_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(nvim_lines))
+    with open_sink(PRISM_ROOT, args.bundle, blob_dir=state.blob_dir) as sink, store or contextlib.nullcontext():
+        for theme_file in themes:
+            slug = theme_file.stem
+            print(f"  {slug}: syncing...")
+            if store:
+                with span("load"):
+                    theme = store.theme(slug)
+            else:
+                theme = load_theme(theme_file)
+            state.sync_theme(sink, slug, theme)
+        
+        # Neovim presets: a name index plus one lazily required module per preset
+        with span("write", "neovim-index"):
+            problems = state.write_neovim_index(sink, on_disk=None if args.bundle else PRISM_ROOT / PRESETS_DIR)
+        if problems:
+            for problem in problems:
+                print(f"  ✗ Neovim presets: {problem}", file=sys.stderr)
+            return 1
     
-    # Also write JSON presets for neovim
-    with open(neovim_presets_dir / "all_themes.json", "w", encoding="utf-8") as f:
-        json.dump(neovim_presets, f, indent=2)
+    # Verification pass: every Cursor/OpenCode/Core copy must match its content hash
+    prism_metrics.count_sink(sink)
+    with span("verify"):
+        mismatched = sink.verify_copies()
+    prism_metrics.count("copies_mismatched", len(mismatched))
+    if mismatched:
+        for problem in mismatched:
+            print(f"  ✗ {problem}", file=sys.stderr)
+        return 1
+    if not args.bundle and state.blob_dir:
+        prism_metrics.count("blobs_pruned", sink.prune_blobs())
     
+    where = (lambda rel: f"{args.bundle}:{rel.as_posix()}") if args.bundle else (lambda rel: PRISM_ROOT / rel)
+    out_dirs = {fmt: out_dir for fmt, out_dir, _ in OUTPUTS}
     print(f"\n{'='*60}")
     print(f"SYNC COMPLETE - {len(themes)} themes")
     print(f"{'='*60}")
-    print(f"  VSCode:           {vscode_dir} (source)")
-    print(f"  Cursor:           {cursor_dir}")
-    print(f"  OpenCode:         {opencode_dir}")
-    print(f"  Core:             {core_dir}/prism-*.json")
-    print(f"  Emacs:            {emacs_dir}")
-    print(f"  Neovim:           {nvim_presets_path}")
-    print(f"  Alacritty:        {alacritty_dir}")
-    print(f"  Kitty:            {kitty_dir}")
-    print(f"  WezTerm:          {wezterm_dir}")
-    print(f"  Windows Terminal: {wt_dir}")
-    print(f"  iTerm2:           {iterm_dir}")
-    print(f"  Helix:            {helix_dir}")
-    print(f"  Zed:              {zed_dir}")
-    print(f"  tmux:             {tmux_dir}")
-    print(f"  Starship:         {starship_dir}")
+    print(f"  VSCode:           {VSCODE_DIR} (source)")
+    print(f"  Cursor:           {where(CURSOR_DIR)}")
+    print(f"  OpenCode:         {where(OPENCODE_DIR)}")
+    print(f"  Core:             {where(CORE_DIR)}/prism-*.json")
+    print(f"  Emacs:            {where(out_dirs['emacs'])}")
+    print(f"  Neovim:           {where(PRESETS_DIR)} (index + {len(state.neovim_presets)} modules)")
+    print(f"  Neovim compiled:  {where(NVIM_COMPILED_DIR)}")
+    print(f"  Alacritty:        {where(out_dirs['alacritty'])}")
+    print(f"  Kitty:            {where(out_dirs['kitty'])}")
+    print(f"  WezTerm:          {where(out_dirs['wezterm'])}")
+    print(f"  Windows Terminal: {where(out_dirs['windows-terminal'])}")
+    print(f"  iTerm2:           {where(out_dirs['iterm2'])}")
+    print(f"  Helix:            {where(out_dirs['helix'])}")
+    print(f"  Zed:              {where(out_dirs['zed'])}")
+    print(f"  tmux:             {where(out_dirs['tmux'])}")
+    print(f"  Starship:         {where(out_dirs['starship'])}")
+    if not args.bundle:
+        links = ", ".join(f"{count} {kind}" for kind, count in sorted(sink.links.items())) or "plain copies"
+        print(f"  JSON copies:      {3 * len(themes)} verified ({links})")
+    if args.bundle:
+        print(f"  Bundle:           {sink.files} files, {sink.bytes:,} bytes -> {sink.target}")
+        return 0
+    
+    if args.watch:
+        return watch(state, args.debounce, args.poll)
+    return 0
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())